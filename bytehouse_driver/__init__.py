@@ -26,9 +26,12 @@ SOFTWARE.
 
 from .client import Client
 from .dbapi import connect
+from .pool import ClientPool
+from .resultcache import ResultCache
+from .singleflight import QueryCoalescer
 
 
 VERSION = (1, 0, 3)
 __version__ = '.'.join(str(x) for x in VERSION)
 
-__all__ = ['Client', 'connect']
+__all__ = ['Client', 'ClientPool', 'QueryCoalescer', 'ResultCache', 'connect']
@@ -0,0 +1,813 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import re
+import types
+from time import time
+
+from .. import errors
+from ..client import Client
+from ..result import QueryInfo
+from ..resultcache import ResultCollector, copy_result
+from ..util.helpers import chunks
+from ..warehouse import is_warehouse_up, resume_delays, warehouse_cache
+from .connection import AsyncConnection
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncClient(Client):
+    """
+    Client for communication with the ByteHouse server from asyncio code.
+    Single connection is established per each connected instance of the
+    client. Queries issued concurrently on the same client are executed one
+    by one. Streaming methods such as :meth:`execute_iter` hold connection
+    until their result is read to the end or the iterator is closed with
+    ``aclose()``. Other queries raise
+    :class:`~bytehouse_driver.errors.PartiallyConsumedQueryError` meanwhile.
+
+    Parameters are the same as for :py:class:`~bytehouse_driver.Client`
+    except for ``query_coalescer``: waiting for a query of another client
+    would block the event loop.
+
+    For example::
+
+        async with AsyncClient(host, user=user, password=password) as client:
+            rows = await client.execute('SELECT 1')
+
+            async for row in client.execute_iter('SELECT * FROM table'):
+                print(row)
+    """
+
+    connection_cls = AsyncConnection
+
+    def __init__(self, *args, **kwargs):
+        if kwargs.get('query_coalescer') is not None:
+            raise ValueError(
+                'Query coalescing is not supported by asynchronous client'
+            )
+
+        self._query_lock = None
+        super(AsyncClient, self).__init__(*args, **kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.disconnect()
+
+    @property
+    def query_lock(self):
+        # Lock is created lazily to bind it to the running event loop.
+        if self._query_lock is None:
+            self._query_lock = asyncio.Lock()
+        return self._query_lock
+
+    async def ensure_warehouse(self):
+        """
+        Applies virtual warehouse to the current connection.
+        See :meth:`~bytehouse_driver.Client.ensure_warehouse`.
+        """
+        connection = self.connection
+        if connection.warehouse is not None:
+            return
+
+        key = (connection.host, connection.port, connection.user,
+               self.warehouse)
+        vw = warehouse_cache.get(key)
+
+        if vw is None:
+            vw = await self.select_warehouse()
+            if await self.is_warehouse_up(vw) or \
+                    await self.resume_warehouse(vw):
+                warehouse_cache.set(key, vw)
+
+        elif self.warehouse is not None:
+            await self.select_warehouse()
+
+        connection.warehouse = vw
+
+    async def execute_service_query(self, query):
+        rv = await self.process_ordinary_query(query)
+        self.connection.is_query_executing = True
+        return rv
+
+    async def select_warehouse(self):
+        vw = self.warehouse
+        if vw is None:
+            default_settings = await self.execute_service_query(
+                "SHOW DEFAULT SETTINGS"
+            )
+            vw = default_settings[0][4]
+            if vw is None or len(vw) < 1:
+                raise Exception("No default virtual warehouse selected")
+        else:
+            try:
+                await self.execute_service_query(
+                    "SET WAREHOUSE {}".format(vw)
+                )
+            except Exception as e:
+                logger.warning("Failed to set warehouse %s", vw)
+                raise e
+
+        return vw
+
+    async def resume_warehouse(self, vw):
+        logger.info("Resuming warehouse %s", vw)
+        try:
+            await self.execute_service_query(
+                "RESUME WAREHOUSE {}".format(vw)
+            )
+        except errors.ServerException as e:
+            logger.warning(
+                "Error from server while resuming warehouse %s: %s", vw, e
+            )
+
+        for delay in resume_delays():
+            await asyncio.sleep(delay)
+            if await self.is_warehouse_up(vw):
+                return True
+
+        logger.info("Cannot turn on warehouse %s", vw)
+        return False
+
+    async def is_warehouse_up(self, warehouse_name):
+        logger.info("Checking warehouse status %s", warehouse_name)
+        warehouses = await self.execute_service_query("SHOW WAREHOUSES")
+        return is_warehouse_up(warehouses, warehouse_name)
+
+    async def establish_connection(self, settings):
+        connection = getattr(self, 'connection', None)
+        if connection is not None and connection.is_query_executing:
+            # Result of streaming query is not read to the end. Waiting for
+            # it would hang forever if its iterator is abandoned.
+            raise errors.PartiallyConsumedQueryError()
+
+        num_connections = len(self.connections)
+        if connection is not None:
+            num_connections += 1
+
+        for i in range(num_connections):
+            try:
+                self.connection = self.get_connection()
+                self.make_query_settings(settings)
+                await self.connection.force_connect()
+                self.last_query = QueryInfo()
+                await self.ensure_warehouse()
+
+            except (errors.SocketTimeoutError, errors.NetworkError):
+                if i < num_connections - 1:
+                    continue
+                self.disconnect()
+                raise
+
+            except (Exception, KeyboardInterrupt, asyncio.CancelledError):
+                self.disconnect()
+                raise
+
+            return
+
+    async def start_query(self, query, settings, **kwargs):
+        """
+        Sends query of streaming method. Query lock is released before
+        result is read. Until result is read to the end or its iterator is
+        closed with ``aclose()``, other queries on the client raise
+        :class:`~bytehouse_driver.errors.PartiallyConsumedQueryError`.
+
+        :param settings: query settings.
+        :param kwargs: arguments of :meth:`send_query`.
+        """
+        async with self.query_lock:
+            await self.establish_connection(settings)
+
+            try:
+                await self.send_query(query, **kwargs)
+
+            except (Exception, KeyboardInterrupt, asyncio.CancelledError):
+                self.disconnect()
+                raise
+
+    async def receive_packet(self):
+        packet = await self.connection.receive_packet()
+        return self.handle_packet(packet)
+
+    async def packet_generator(self):
+        while True:
+            packet = await self.receive_packet()
+            if not packet:
+                break
+
+            if packet is True:
+                continue
+
+            yield packet
+
+    async def receive_result(self, with_column_types=False, columnar=False):
+        result = self.query_result_cls(
+            iter(()), with_column_types=with_column_types, columnar=columnar
+        )
+
+        async for packet in self.packet_generator():
+            result.store(packet)
+
+        return result.get_result()
+
+    async def receive_sample_block(self):
+        while True:
+            packet = await self.connection.receive_packet()
+            if self.handle_sample_block_packet(packet):
+                return packet.block
+
+    async def receive_end_of_query(self):
+        while True:
+            packet = await self.connection.receive_packet()
+            if self.handle_end_of_query_packet(packet):
+                break
+
+    async def send_data(self, sample_block, data, types_check=False,
+                        columnar=False):
+        blocks = self.iter_data_blocks(
+            sample_block, data, types_check=types_check, columnar=columnar
+        )
+        return await self.send_blocks(blocks)
+
+    async def send_blocks(self, blocks):
+        inserted_rows = 0
+
+        for block in blocks:
+            self.connection.send_data(block)
+            # Do not let outgoing blocks pile up in the transport.
+            await self.connection.drain()
+            inserted_rows += block.num_rows
+
+        return inserted_rows
+
+    async def send_query(self, query, params=None, query_id=None,
+                         external_tables=None, types_check=False):
+        query, external_tables = self.prepare_query(
+            query, params, external_tables
+        )
+        self.connection.send_query(query, query_id=query_id)
+        self.connection.send_external_tables(external_tables,
+                                             types_check=types_check)
+        await self.connection.drain()
+
+    async def execute(self, query, params=None, with_column_types=False,
+                      external_tables=None, query_id=None, settings=None,
+                      types_check=False, columnar=False):
+        """
+        Executes query. See :meth:`~bytehouse_driver.Client.execute`.
+        """
+        start_time = time()
+
+        query_key = None
+        if self.result_cache is not None:
+            query_key = self.make_query_key(
+                query, params=params, settings=settings,
+                external_tables=external_tables,
+                with_column_types=with_column_types, columnar=columnar
+            )
+
+        if query_key is not None:
+            rv = self.result_cache.get(query_key)
+            if rv is not None:
+                self.last_query = QueryInfo()
+                self.last_query.store_elapsed(time() - start_time)
+                return copy_result(rv)
+
+        async with self.query_lock:
+
+            return await self._execute(
+                query, params=params, with_column_types=with_column_types,
+                external_tables=external_tables, query_id=query_id,
+                settings=settings, types_check=types_check, columnar=columnar,
+                start_time=start_time, query_key=query_key
+            )
+
+    async def _execute(self, query, params=None, with_column_types=False,
+                       external_tables=None, query_id=None, settings=None,
+                       types_check=False, columnar=False, start_time=None,
+                       query_key=None):
+        if start_time is None:
+            start_time = time()
+
+        await self.establish_connection(settings)
+
+        try:
+            # INSERT queries can use list/tuple/generator of list/tuples/dicts.
+            # For SELECT parameters can be passed in only in dict right now.
+            is_insert = isinstance(params, (list, tuple, types.GeneratorType))
+
+            if is_insert:
+                rv = await self.process_insert_query(
+                    query, params, external_tables=external_tables,
+                    query_id=query_id, types_check=types_check,
+                    columnar=columnar
+                )
+            else:
+                rv = await self.process_ordinary_query(
+                    query, params=params, with_column_types=with_column_types,
+                    external_tables=external_tables,
+                    query_id=query_id, types_check=types_check,
+                    columnar=columnar
+                )
+
+            self.track_current_database(query)
+
+        except (Exception, KeyboardInterrupt, asyncio.CancelledError):
+            self.disconnect()
+            raise
+
+        self.last_query.store_elapsed(time() - start_time)
+
+        if query_key is not None:
+            self.result_cache.set(query_key, copy_result(rv))
+        return rv
+
+    async def execute_iter(
+            self, query, params=None, with_column_types=False,
+            external_tables=None, query_id=None, settings=None,
+            types_check=False, chunk_size=1):
+        """
+        Executes SELECT query with results streaming.
+        See :meth:`~bytehouse_driver.Client.execute_iter`.
+
+        :return: asynchronous generator of rows or chunks of rows.
+        """
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self.make_query_key(
+                query, params=params, settings=settings,
+                external_tables=external_tables,
+                with_column_types=with_column_types, iter=True
+            )
+
+        if cache_key is not None:
+            rows = self.result_cache.get(cache_key)
+            if rows is not None:
+                self.last_query = QueryInfo()
+                rows = chunks(rows, chunk_size) if chunk_size > 1 else rows
+                for item in rows:
+                    yield item
+                return
+
+        collector = None
+        if cache_key is not None:
+            collector = ResultCollector(self.result_cache.max_bytes)
+
+        await self.start_query(
+            query, settings, params=params, query_id=query_id,
+            external_tables=external_tables, types_check=types_check
+        )
+
+        finished = False
+        try:
+            chunk = []
+            first_block = True
+            async for packet in self.packet_generator():
+                block = getattr(packet, 'block', None)
+                if block is None:
+                    continue
+
+                rows = block.get_rows()
+                if first_block and with_column_types:
+                    first_block = False
+                    rows = [block.columns_with_types] + list(rows)
+
+                for row in rows:
+                    if collector is not None:
+                        collector.append(row)
+
+                    if chunk_size > 1:
+                        chunk.append(row)
+                        if len(chunk) == chunk_size:
+                            yield chunk
+                            chunk = []
+                    else:
+                        yield row
+
+            finished = True
+            self.track_current_database(query)
+
+            if chunk:
+                yield chunk
+
+            if collector is not None and collector.rows is not None:
+                self.result_cache.set(cache_key, collector.rows)
+
+        finally:
+            # Unread packets left in the stream when iteration is
+            # interrupted.
+            if not finished:
+                self.disconnect()
+
+    async def execute_iter_blocks(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None, types_check=False):
+        """
+        Executes SELECT query with results streaming by blocks.
+        See :meth:`~bytehouse_driver.Client.execute_iter_blocks`.
+
+        :return: asynchronous generator of blocks.
+        """
+        await self.start_query(
+            query, settings, params=params, query_id=query_id,
+            external_tables=external_tables, types_check=types_check
+        )
+
+        finished = False
+        try:
+            async for packet in self.packet_generator():
+                block = getattr(packet, 'block', None)
+                if block is not None and block.num_rows:
+                    yield block
+
+            finished = True
+            self.track_current_database(query)
+
+        finally:
+            # Unread packets left in the stream when iteration is
+            # interrupted.
+            if not finished:
+                self.disconnect()
+
+    def execute_with_progress(
+            self, query, params=None, with_column_types=False,
+            external_tables=None, query_id=None, settings=None,
+            types_check=False, columnar=False):
+        """
+        Executes SELECT query with progress information.
+        See :meth:`~bytehouse_driver.Client.execute_with_progress`.
+
+        For example::
+
+            progress = client.execute_with_progress('SELECT ...')
+            async for num_rows, total_rows in progress:
+                print(num_rows, total_rows)
+
+            rows = await progress.get_result()
+
+        :return: :class:`AsyncProgressQueryResult`.
+        """
+        result = self.progress_query_result_cls(
+            iter(()), with_column_types=with_column_types, columnar=columnar
+        )
+        progress = self.iter_progress(
+            result, query, params=params, external_tables=external_tables,
+            query_id=query_id, settings=settings, types_check=types_check
+        )
+        return AsyncProgressQueryResult(progress, result)
+
+    async def iter_progress(self, result, query, params=None,
+                            external_tables=None, query_id=None,
+                            settings=None, types_check=False):
+        """
+        Stores query result packets into ``result`` and yields progress
+        totals.
+        """
+        start_time = time()
+        await self.start_query(
+            query, settings, params=params, query_id=query_id,
+            external_tables=external_tables, types_check=types_check
+        )
+
+        finished = False
+        try:
+            totals = result.progress_totals
+            async for packet in self.packet_generator():
+                progress = getattr(packet, 'progress', None)
+                if progress:
+                    totals.increment(progress)
+                    yield totals.rows, totals.total_rows
+                else:
+                    result.store(packet)
+
+            finished = True
+            self.track_current_database(query)
+
+        finally:
+            # Unread packets left in the stream when iteration is
+            # interrupted.
+            if not finished:
+                self.disconnect()
+
+        self.last_query.store_elapsed(time() - start_time)
+
+    async def query_dataframe(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None):
+        """
+        Queries DataFrame with specified SELECT query.
+        See :meth:`~bytehouse_driver.Client.query_dataframe`.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise RuntimeError('Extras for NumPy must be installed')
+
+        data, columns = await self.execute(
+            query, columnar=True, with_column_types=True, params=params,
+            external_tables=external_tables, query_id=query_id,
+            settings=settings
+        )
+
+        columns = [re.sub(r'\W', '_', name) for name, type_ in columns]
+        return pd.DataFrame(
+            {col: d for d, col in zip(data, columns)}, columns=columns
+        )
+
+    async def query_dataframe_iter(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None, chunk_size=None):
+        """
+        Queries DataFrames with specified SELECT query with results
+        streaming. See :meth:`~bytehouse_driver.Client.query_dataframe_iter`.
+
+        :return: asynchronous generator of pandas DataFrames.
+        """
+        try:
+            from ..numpy.result import DataFrameIterQueryResult
+        except ImportError:
+            raise RuntimeError('Extras for NumPy must be installed')
+
+        await self.start_query(
+            query, settings, params=params, query_id=query_id,
+            external_tables=external_tables
+        )
+
+        finished = False
+        try:
+            result = DataFrameIterQueryResult(None, chunk_size=chunk_size)
+            async for packet in self.packet_generator():
+                for frame in result.store(packet):
+                    yield frame
+
+            finished = True
+            self.track_current_database(query)
+
+            for frame in result.finish():
+                yield frame
+
+        finally:
+            # Unread packets left in the stream when iteration is
+            # interrupted.
+            if not finished:
+                self.disconnect()
+
+    async def query_arrow(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None):
+        """
+        Queries Arrow table with specified SELECT query.
+        See :meth:`~bytehouse_driver.Client.query_arrow`.
+        """
+        try:
+            from ..arrow.result import ArrowQueryResult
+        except ImportError:
+            raise RuntimeError('Extras for Arrow must be installed')
+
+        async with self.query_lock:
+            start_time = time()
+            await self.establish_connection(
+                dict(settings or {}, use_arrow=True)
+            )
+
+            try:
+                await self.send_query(
+                    query, params=params, query_id=query_id,
+                    external_tables=external_tables
+                )
+
+                result = ArrowQueryResult(None)
+                async for packet in self.packet_generator():
+                    result.store(packet)
+                rv = result.get_table()
+
+                self.track_current_database(query)
+
+            except (Exception, KeyboardInterrupt, asyncio.CancelledError):
+                self.disconnect()
+                raise
+
+            self.last_query.store_elapsed(time() - start_time)
+            return rv
+
+    async def query_arrow_iter(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None):
+        """
+        Queries Arrow record batches with specified SELECT query.
+        See :meth:`~bytehouse_driver.Client.query_arrow_iter`.
+
+        :return: asynchronous generator of pyarrow RecordBatch.
+        """
+        try:
+            from ..arrow.result import ArrowQueryResult
+        except ImportError:
+            raise RuntimeError('Extras for Arrow must be installed')
+
+        await self.start_query(
+            query, dict(settings or {}, use_arrow=True), params=params,
+            query_id=query_id, external_tables=external_tables
+        )
+
+        finished = False
+        try:
+            result = ArrowQueryResult(None)
+            async for packet in self.packet_generator():
+                result.store(packet)
+                if result.batches:
+                    yield result.batches.pop()
+
+            finished = True
+            self.track_current_database(query)
+
+        finally:
+            # Unread packets left in the stream when iteration is
+            # interrupted.
+            if not finished:
+                self.disconnect()
+
+    async def insert_dataframe(
+            self, query, dataframe, external_tables=None, query_id=None,
+            settings=None):
+        """
+        Inserts pandas DataFrame with specified query.
+        See :meth:`~bytehouse_driver.Client.insert_dataframe`.
+        """
+        try:
+            import pandas as pd  # noqa: F401
+        except ImportError:
+            raise RuntimeError('Extras for NumPy must be installed')
+
+        async with self.query_lock:
+
+            start_time = time()
+            await self.establish_connection(settings)
+
+            try:
+                await self.send_query(
+                    query, query_id=query_id, external_tables=external_tables
+                )
+
+                sample_block = await self.receive_sample_block()
+                rv = None
+                if sample_block:
+                    columns = [x[0] for x in sample_block.columns_with_types]
+                    # raise if any columns are missing from the dataframe
+                    diff = set(columns) - set(dataframe.columns)
+                    if len(diff):
+                        msg = "DataFrame missing required columns: {}"
+                        raise ValueError(msg.format(list(diff)))
+
+                    data = [dataframe[column].values for column in columns]
+                    rv = await self.send_data(sample_block, data,
+                                              columnar=True)
+                    await self.receive_end_of_query()
+
+                self.track_current_database(query)
+
+            except (Exception, KeyboardInterrupt, asyncio.CancelledError):
+                self.disconnect()
+                raise
+
+            self.last_query.store_elapsed(time() - start_time)
+            return rv
+
+    async def insert_arrow(
+            self, query, data, external_tables=None, query_id=None,
+            settings=None):
+        """
+        Inserts Arrow data with specified query.
+        See :meth:`~bytehouse_driver.Client.insert_arrow`.
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise RuntimeError('Extras for Arrow must be installed')
+
+        async with self.query_lock:
+
+            start_time = time()
+            await self.establish_connection(
+                dict(settings or {}, use_arrow=True)
+            )
+
+            try:
+                await self.send_query(
+                    query, query_id=query_id, external_tables=external_tables
+                )
+
+                sample_block = await self.receive_sample_block()
+                rv = None
+                if sample_block:
+                    blocks = self.iter_arrow_blocks(sample_block, data)
+                    rv = await self.send_blocks(blocks)
+                    await self.receive_end_of_query()
+
+                self.track_current_database(query)
+
+            except (Exception, KeyboardInterrupt, asyncio.CancelledError):
+                self.disconnect()
+                raise
+
+            self.last_query.store_elapsed(time() - start_time)
+            return rv
+
+    async def insert_polars(
+            self, query, dataframe, external_tables=None, query_id=None,
+            settings=None):
+        """
+        Inserts Polars DataFrame with specified query.
+        See :meth:`~bytehouse_driver.Client.insert_polars`.
+        """
+        return await self.insert_arrow(
+            query, dataframe.to_arrow(), external_tables=external_tables,
+            query_id=query_id, settings=settings
+        )
+
+    async def process_ordinary_query(
+            self, query, params=None, with_column_types=False,
+            external_tables=None, query_id=None,
+            types_check=False, columnar=False):
+
+        await self.send_query(
+            query, params=params, query_id=query_id,
+            external_tables=external_tables, types_check=types_check
+        )
+        return await self.receive_result(with_column_types=with_column_types,
+                                         columnar=columnar)
+
+    async def process_insert_query(self, query_without_data, data,
+                                   external_tables=None, query_id=None,
+                                   types_check=False, columnar=False):
+        await self.send_query(
+            query_without_data, query_id=query_id,
+            external_tables=external_tables, types_check=types_check
+        )
+
+        sample_block = await self.receive_sample_block()
+        if sample_block:
+            rv = await self.send_data(sample_block, data,
+                                      types_check=types_check,
+                                      columnar=columnar)
+            await self.receive_end_of_query()
+            return rv
+
+    async def cancel(self, with_column_types=False):
+        self.connection.send_cancel()
+        await self.connection.drain()
+        # Client must still read until END_OF_STREAM packet.
+        return await self.receive_result(with_column_types=with_column_types)
+
+
+class AsyncProgressQueryResult(object):
+    """
+    Provides asynchronous iteration over query progress. Result is
+    available once all progress is read.
+    """
+
+    def __init__(self, progress, result):
+        self.progress = progress
+        self.result = result
+        super(AsyncProgressQueryResult, self).__init__()
+
+    def __aiter__(self):
+        return self.progress
+
+    async def get_result(self):
+        """
+        Reads remaining progress packets.
+
+        :return: stored query result.
+        """
+        async for _ in self.progress:
+            pass
+
+        return self.result.get_result()
@@ -0,0 +1,313 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import logging
+
+from .. import defines
+from .. import errors
+from ..bufferedreader import BufferedSocketReader
+from ..bufferedwriter import BufferedSocketWriter
+from ..connection import Connection
+from ..protocol import ClientPacketTypes, ServerPacketTypes
+from ..streams.native import BlockInputStream
+from ..varint import write_varint, read_varint
+
+logger = logging.getLogger(__name__)
+
+
+class NeedMoreData(Exception):
+    """
+    Packet can't be decoded from already received bytes.
+    """
+
+
+class StreamSocket(object):
+    """
+    Socket-like wrapper over asyncio streams.
+
+    Bytes of packet being decoded are kept until the packet is decoded
+    completely. It allows to restart decoding from the packet beginning
+    when more bytes are received.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+        self.data = bytearray()
+        self.position = 0
+
+        super(StreamSocket, self).__init__()
+
+    def recv_into(self, buf):
+        size = min(len(buf), len(self.data) - self.position)
+        if not size:
+            raise NeedMoreData()
+
+        end = self.position + size
+        with memoryview(self.data) as data, memoryview(buf) as target:
+            target[:size] = data[self.position:end]
+
+        self.position = end
+        return size
+
+    def sendall(self, data):
+        self.writer.write(data)
+
+    def discard(self, size):
+        del self.data[:size]
+        self.position -= size
+
+    def close(self):
+        self.writer.close()
+
+
+class AsyncConnection(Connection):
+    """
+    Connection that uses asyncio streams for network I/O.
+
+    Packets are encoded and decoded with the same synchronous code as
+    :class:`~bytehouse_driver.connection.Connection` does. Outgoing data is
+    passed to the stream writer and drained. Incoming packets are decoded
+    from received bytes and decoding is restarted after receiving more bytes
+    if packet is incomplete.
+    """
+
+    # Wait for next chunk of already sent data before restarting packet
+    # decoding. It prevents decoding large packets again and again on every
+    # small chunk.
+    idle_timeout = 0.001
+
+    def __init__(self, *args, **kwargs):
+        self.stream = None
+        super(AsyncConnection, self).__init__(*args, **kwargs)
+
+    async def force_connect(self):
+        self.check_query_execution()
+
+        if not self.connected:
+            await self.connect()
+
+        elif not await self.ping():
+            logger.warning('Connection was closed, reconnecting.')
+            await self.connect()
+
+    async def _open_stream(self, host, port):
+        kwargs = {}
+        if self.secure_socket:
+            ssl_options = self._get_ssl_options()
+            kwargs['ssl'] = self._create_ssl_context(ssl_options)
+            kwargs['server_hostname'] = self.server_hostname or host
+
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                host, port, limit=defines.BUFFER_SIZE, **kwargs
+            ),
+            self.connect_timeout
+        )
+        return StreamSocket(reader, writer)
+
+    async def _init_connection(self, host, port):
+        self.stream = self.socket = await self._open_stream(host, port)
+        self.connected = True
+        self.host, self.port = host, port
+
+        self.fin = BufferedSocketReader(self.stream, defines.BUFFER_SIZE)
+        self.fout = BufferedSocketWriter(self.stream, defines.BUFFER_SIZE)
+
+        self.send_hello()
+        await self.drain()
+        await self.unpack(self.receive_hello)
+
+        self.block_in = self.get_block_in_stream()
+        self.block_in_raw = BlockInputStream(self.fin, self.context)
+        self.block_out = self.get_block_out_stream()
+
+    async def connect(self):
+        if self.connected:
+            self.disconnect()
+
+        logger.debug(
+            'Connecting. Database: %s. User: %s', self.database, self.user
+        )
+
+        err = None
+        for i in range(len(self.hosts)):
+            host, port = self.hosts[0]
+            logger.debug('Connecting to %s:%s', host, port)
+
+            try:
+                return await self._init_connection(host, port)
+
+            except asyncio.TimeoutError:
+                self.disconnect()
+                logger.warning(
+                    'Failed to connect to %s:%s', host, port, exc_info=True
+                )
+                err = errors.SocketTimeoutError('({}:{})'.format(host, port))
+
+            except OSError as e:
+                self.disconnect()
+                logger.warning(
+                    'Failed to connect to %s:%s', host, port, exc_info=True
+                )
+                err_str = self._format_connection_error(e, host, port)
+                err = errors.NetworkError(err_str)
+
+            self.hosts.rotate(-1)
+
+        if err is not None:
+            raise err
+
+    def reset_state(self):
+        self.stream = None
+        super(AsyncConnection, self).reset_state()
+
+    def disconnect(self):
+        """
+        Closes connection between server and client.
+        Frees resources: e.g. closes socket.
+        """
+        if self.stream is not None:
+            self.stream.close()
+
+        self.reset_state()
+
+    async def drain(self):
+        await self.stream.writer.drain()
+
+    async def receive(self, min_size):
+        """
+        Receives at least one chunk of data and keeps receiving while data
+        is coming until at least ``min_size`` bytes are received.
+        """
+        stream = self.stream
+        timeout = self.send_receive_timeout
+        received = 0
+
+        while True:
+            try:
+                chunk = await asyncio.wait_for(
+                    stream.reader.read(defines.BUFFER_SIZE), timeout
+                )
+            except asyncio.TimeoutError:
+                if received:
+                    break
+                raise errors.SocketTimeoutError(
+                    '({})'.format(self.get_description())
+                )
+
+            if not chunk:
+                raise EOFError('Unexpected EOF while reading bytes')
+
+            stream.data += chunk
+            received += len(chunk)
+
+            if received >= min_size:
+                break
+
+            timeout = self.idle_timeout
+
+    def _get_readers(self):
+        readers = [self.fin]
+        # Compressed frames are read completely for every packet.
+        # Decompressed data can be dropped on decoding restart.
+        if self.compression and self.block_in is not None:
+            readers.append(self.block_in.fin)
+
+        return readers
+
+    def _tell(self):
+        return (
+            self.stream.position -
+            (self.fin.current_buffer_size - self.fin.position)
+        )
+
+    def _seek(self, position):
+        self.stream.position = position
+        for reader in self._get_readers():
+            reader.position = reader.current_buffer_size = 0
+
+    async def unpack(self, decode):
+        """
+        Calls synchronous ``decode`` until packet is received completely.
+
+        :param decode: callable that reads one packet.
+        :return: ``decode`` result.
+        """
+        start = self._tell()
+
+        while True:
+            try:
+                rv = decode()
+
+            except NeedMoreData:
+                self._seek(start)
+                await self.receive(len(self.stream.data) - start)
+                continue
+
+            self.stream.discard(self._tell())
+            return rv
+
+    async def ping(self):
+        try:
+            write_varint(ClientPacketTypes.PING, self.fout)
+            self.fout.flush()
+            await self.drain()
+
+            packet_type = await asyncio.wait_for(
+                self.unpack(self._receive_pong), self.sync_request_timeout
+            )
+            if packet_type != ServerPacketTypes.PONG:
+                msg = self.unexpected_packet_message('Pong', packet_type)
+                raise errors.UnexpectedPacketFromServerError(msg)
+
+        except errors.Error:
+            raise
+
+        except (OSError, EOFError, asyncio.TimeoutError) as e:
+            # It's just a warning now.
+            # Current connection will be closed, new will be established.
+            logger.warning(
+                'Error on %s ping: %s', self.get_description(), e
+            )
+            return False
+
+        return True
+
+    def _receive_pong(self):
+        packet_type = read_varint(self.fin)
+        while packet_type == ServerPacketTypes.PROGRESS:
+            self.receive_progress()
+            packet_type = read_varint(self.fin)
+
+        return packet_type
+
+    async def receive_packet(self):
+        return await self.unpack(
+            super(AsyncConnection, self).receive_packet
+        )
@@ -0,0 +1,64 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pyarrow as pa
+
+from ..block import ColumnOrientedBlock
+from ..columns.arrow.service import get_arrow_column, write_arrow_column
+
+
+class ArrowColumnOrientedBlock(ColumnOrientedBlock):
+    """
+    Block with columns stored as Arrow arrays.
+    """
+    column_writer = staticmethod(write_arrow_column)
+
+    def __init__(self, *args, **kwargs):
+        self.context = kwargs.pop('context')
+        super(ArrowColumnOrientedBlock, self).__init__(*args, **kwargs)
+
+    @property
+    def schema(self):
+        return pa.schema([
+            pa.field(name, get_arrow_column(self.context, type_).arrow_type)
+            for name, type_ in self.columns_with_types
+        ])
+
+    def transposed(self):
+        return list(zip(*[column.to_pylist() for column in self.data]))
+
+    def to_record_batch(self, schema=None):
+        schema = schema or self.schema
+
+        # Columns holding over 2 GiB are read into large types with int64
+        # offsets, their fields follow the actual array type.
+        if any(f.type != c.type for f, c in zip(schema, self.data)):
+            schema = pa.schema([
+                f if f.type == c.type else f.with_type(c.type)
+                for f, c in zip(schema, self.data)
+            ], metadata=schema.metadata)
+
+        return pa.RecordBatch.from_arrays(self.data, schema=schema)
@@ -0,0 +1,55 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pyarrow as pa
+
+
+def column_chunks(data, columns, n):
+    """
+    Yields lists of Arrow arrays of ``columns`` with at most ``n`` rows from
+    Arrow table, record batch or iterable of them. Arrays share buffers with
+    ``data``.
+    """
+    if isinstance(data, (pa.Table, pa.RecordBatch)):
+        data = [data]
+
+    for part in data:
+        # raise if any columns are missing from the data
+        diff = set(columns) - set(part.schema.names)
+        if diff:
+            msg = 'Arrow data missing required columns: {}'
+            raise ValueError(msg.format(sorted(diff)))
+
+        if isinstance(part, pa.Table):
+            batches = part.to_batches(max_chunksize=n)
+        else:
+            batches = [part]
+
+        for batch in batches:
+            indexes = [batch.schema.get_field_index(x) for x in columns]
+            for offset in range(0, batch.num_rows, n):
+                chunk = batch.slice(offset, n)
+                yield [chunk.column(i) for i in indexes]
@@ -0,0 +1,123 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pyarrow as pa
+
+from ..columns.arrow.base import get_large_type
+from ..protocol import ServerPacketTypes
+
+
+class ArrowQueryResult(object):
+    """
+    Stores query result as Arrow table. Every block with rows becomes one
+    record batch of the table.
+    """
+
+    def __init__(self, packet_generator):
+        self.packet_generator = packet_generator
+
+        self.schema = None
+        self.batches = []
+
+        super(ArrowQueryResult, self).__init__()
+
+    def store(self, packet):
+        # Totals and extremes are not part of the table.
+        if packet.type != ServerPacketTypes.DATA:
+            return
+
+        block = packet.block
+
+        if self.schema is None:
+            self.schema = block.schema
+
+        # Header block contains no rows. Only schema is taken from it.
+        if block.num_rows:
+            self.batches.append(block.to_record_batch(self.schema))
+
+    def get_result(self):
+        """
+        :return: stored query result as :class:`pyarrow.Table`.
+        """
+
+        for packet in self.packet_generator:
+            self.store(packet)
+
+        return self.get_table()
+
+    def get_table(self):
+        """
+        :return: :class:`pyarrow.Table` from already stored batches.
+        """
+        if self.schema is None:
+            return pa.table({})
+
+        schema = self.get_common_schema()
+        if all(batch.schema == schema for batch in self.batches):
+            return pa.Table.from_batches(self.batches, schema=schema)
+
+        return pa.concat_tables([
+            pa.Table.from_batches([batch]).cast(schema)
+            for batch in self.batches
+        ])
+
+    def get_common_schema(self):
+        """
+        :return: schema all stored batches can be cast to. Columns read into
+                 large types in some batches get large types.
+        """
+        fields = []
+        for i, field in enumerate(self.schema):
+            if any(batch.schema.field(i).type != field.type
+                   for batch in self.batches):
+                field = field.with_type(get_large_type(field.type))
+            fields.append(field)
+
+        return pa.schema(fields, metadata=self.schema.metadata)
+
+
+class ArrowIterQueryResult(ArrowQueryResult):
+    """
+    Provides iteration over returned data by record batches. Columns holding
+    over 2 GiB in a block have large types in that batch.
+    """
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            packet = next(self.packet_generator)
+            if packet.type != ServerPacketTypes.DATA:
+                continue
+
+            block = packet.block
+
+            if self.schema is None:
+                self.schema = block.schema
+
+            if block.num_rows:
+                return block.to_record_batch(self.schema)
@@ -25,6 +25,7 @@ SOFTWARE.
 """
 
 from .reader import read_varint, read_binary_uint8, read_binary_int32
+from .transpose import dicts_to_columns, rows_to_columns
 from .varint import write_varint
 from .writer import write_binary_uint8, write_binary_int32
 from .columns import nestedcolumn
@@ -141,6 +142,10 @@ class RowOrientedBlock(BaseBlock):
     supported_row_types = dict_row_types + tuple_row_types
 
     def normalize(self, data):
+        # Columns are transposed from rows once, on the first request.
+        self.columns = None
+        self.dict_rows = False
+
         if not data:
             return []
 
@@ -151,7 +156,10 @@ class RowOrientedBlock(BaseBlock):
             self._check_row_type(first_row)
 
         if isinstance(first_row, dict):
-            self._mutate_dicts_to_rows(data)
+            self.dict_rows = True
+            if self.types_check:
+                for row in data:
+                    self._check_dict_row_type(row)
         else:
             self._check_rows(data)
 
@@ -169,24 +177,51 @@ class RowOrientedBlock(BaseBlock):
         return len(self.data)
 
     def get_columns(self):
-        return self.transposed()
+        return self.transpose_columns()
 
     def get_rows(self):
+        if self.dict_rows:
+            return [list(x) for x in zip(*self.transpose_columns())]
         return self.data
 
     def get_column_by_index(self, index):
-        return [row[index] for row in self.data]
+        columns = self.columns
+        if columns is None or columns[index] is None:
+            columns = self.columns = self.transpose_columns()
+
+        # Columns are modified in place while being written. Block hands
+        # each of them out once and transposes again on repeated request.
+        column = columns[index]
+        columns[index] = None
+        return column
+
+    def transpose_columns(self):
+        """
+        Transposes all rows into a list per column in a single pass.
+        """
+        if not self.dict_rows:
+            return rows_to_columns(self.data, self.num_columns)
+
+        names = [name for name, _ in self.columns_with_types]
+        columns = dicts_to_columns(self.data, names)
+
+        for i, (name, type_) in enumerate(self.columns_with_types):
+            if type_.startswith('Nested'):
+                cwt = nestedcolumn.get_columns_with_types(type_)
+                check_row_type = False
+                if self.types_check:
+                    check_row_type = self._check_dict_row_type
 
-    def _mutate_dicts_to_rows(self, data):
-        check_row_type = False
-        if self.types_check:
-            check_row_type = self._check_dict_row_type
+                # Rows are converted in copies: data stays intact for
+                # repeated transposition.
+                columns[i] = [
+                    self._pure_mutate_dicts_to_rows(
+                        list(x), cwt, check_row_type
+                    )
+                    for x in columns[i]
+                ]
 
-        return self._pure_mutate_dicts_to_rows(
-            data,
-            self.columns_with_types,
-            check_row_type,
-        )
+        return columns
 
     def _pure_mutate_dicts_to_rows(
         self,
@@ -211,7 +246,7 @@ class RowOrientedBlock(BaseBlock):
                     new_data.append(row[name])
                 else:
                     new_data.append(self._pure_mutate_dicts_to_rows(
-                        row[name], cwt, check_row_type
+                        list(row[name]), cwt, check_row_type
                     ))
             data[i] = new_data
         # return for recursion
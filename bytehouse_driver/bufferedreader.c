@@ -757,6 +757,7 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include <string.h>
 #include <stdio.h>
 #include "pythread.h"
+#include <stdint.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -968,9 +969,9 @@ static const char *__pyx_filename;
 static const char *__pyx_f[] = {
   "bytehouse_driver/bufferedreader.pyx",
   "stringsource",
-  "venv-new/lib/python3.8/site-packages/Cython/Includes/cpython/type.pxd",
-  "venv-new/lib/python3.8/site-packages/Cython/Includes/cpython/bool.pxd",
-  "venv-new/lib/python3.8/site-packages/Cython/Includes/cpython/complex.pxd",
+  "type.pxd",
+  "bool.pxd",
+  "complex.pxd",
 };
 
 /*--- Type declarations ---*/
@@ -978,7 +979,7 @@ struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader;
 struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedSocketReader;
 struct __pyx_obj_16bytehouse_driver_14bufferedreader_CompressedBufferedReader;
 
-/* "bytehouse_driver/bufferedreader.pyx":10
+/* "bytehouse_driver/bufferedreader.pyx":13
  * 
  * 
  * cdef class BufferedReader(object):             # <<<<<<<<<<<<<<
@@ -987,13 +988,15 @@ struct __pyx_obj_16bytehouse_driver_14bufferedreader_CompressedBufferedReader;
  */
 struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader {
   PyObject_HEAD
+  struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_vtab;
   unsigned PY_LONG_LONG position;
   unsigned PY_LONG_LONG current_buffer_size;
   PyObject *buffer;
+  int refills_in_place;
 };
 
 
-/* "bytehouse_driver/bufferedreader.pyx":229
+/* "bytehouse_driver/bufferedreader.pyx":365
  * 
  * 
  * cdef class BufferedSocketReader(BufferedReader):             # <<<<<<<<<<<<<<
@@ -1006,7 +1009,7 @@ struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedSocketReader {
 };
 
 
-/* "bytehouse_driver/bufferedreader.pyx":243
+/* "bytehouse_driver/bufferedreader.pyx":379
  * 
  * 
  * cdef class CompressedBufferedReader(BufferedReader):             # <<<<<<<<<<<<<<
@@ -1019,6 +1022,48 @@ struct __pyx_obj_16bytehouse_driver_14bufferedreader_CompressedBufferedReader {
 };
 
 
+
+/* "bytehouse_driver/bufferedreader.pyx":13
+ * 
+ * 
+ * cdef class BufferedReader(object):             # <<<<<<<<<<<<<<
+ *     cdef public unsigned long long position, current_buffer_size
+ *     cdef public bytearray buffer
+ */
+
+struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedReader {
+  int (*_read_into)(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *, char *, unsigned PY_LONG_LONG);
+};
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_vtabptr_16bytehouse_driver_14bufferedreader_BufferedReader;
+
+
+/* "bytehouse_driver/bufferedreader.pyx":365
+ * 
+ * 
+ * cdef class BufferedSocketReader(BufferedReader):             # <<<<<<<<<<<<<<
+ *     cdef object sock
+ * 
+ */
+
+struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedSocketReader {
+  struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedReader __pyx_base;
+};
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedSocketReader *__pyx_vtabptr_16bytehouse_driver_14bufferedreader_BufferedSocketReader;
+
+
+/* "bytehouse_driver/bufferedreader.pyx":379
+ * 
+ * 
+ * cdef class CompressedBufferedReader(BufferedReader):             # <<<<<<<<<<<<<<
+ *     cdef object read_block
+ * 
+ */
+
+struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_CompressedBufferedReader {
+  struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedReader __pyx_base;
+};
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_CompressedBufferedReader *__pyx_vtabptr_16bytehouse_driver_14bufferedreader_CompressedBufferedReader;
+
 /* --- Runtime support code (head) --- */
 /* Refnanny.proto */
 #ifndef CYTHON_REFNANNY
@@ -1204,6 +1249,65 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 /* RaiseException.proto */
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* SliceObject.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
+        PyObject* obj, Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
+        int has_cstart, int has_cstop, int wraparound);
+
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
 /* GetItemIntByteArray.proto */
 #define __Pyx_GetItemInt_ByteArray(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
     (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
@@ -1270,59 +1374,20 @@ static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject
 static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
 #endif
 
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
 /* GetAttr.proto */
 static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
 
 /* GetAttr3.proto */
 static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
 
-/* PyDictVersioning.proto */
-#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
-#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
-#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
-    (version_var) = __PYX_GET_DICT_VERSION(dict);\
-    (cache_var) = (value);
-#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
-    static PY_UINT64_T __pyx_dict_version = 0;\
-    static PyObject *__pyx_dict_cached_value = NULL;\
-    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
-        (VAR) = __pyx_dict_cached_value;\
-    } else {\
-        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
-        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
-    }\
-}
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
-#else
-#define __PYX_GET_DICT_VERSION(dict)  (0)
-#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
-#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
-#endif
-
-/* GetModuleGlobalName.proto */
-#if CYTHON_USE_DICT_VERSIONS
-#define __Pyx_GetModuleGlobalName(var, name)  do {\
-    static PY_UINT64_T __pyx_dict_version = 0;\
-    static PyObject *__pyx_dict_cached_value = NULL;\
-    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
-        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
-        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-} while(0)
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
-    PY_UINT64_T __pyx_dict_version;\
-    PyObject *__pyx_dict_cached_value;\
-    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-} while(0)
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
-#else
-#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
-#endif
-
 /* PySequenceContains.proto */
 static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
     int result = PySequence_Contains(seq, item);
@@ -1380,6 +1445,9 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 #define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
 #endif
 
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
+
 /* PyObjectGetAttrStrNoError.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
 
@@ -1465,6 +1533,7 @@ static int __Pyx_check_binary_version(void);
 /* InitStrings.proto */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
+static int __pyx_f_16bytehouse_driver_14bufferedreader_14BufferedReader__read_into(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, char *__pyx_v_dst, unsigned PY_LONG_LONG __pyx_v_unread); /* proto*/
 
 /* Module declarations from 'cpython.version' */
 
@@ -1551,6 +1620,8 @@ static PyTypeObject *__pyx_ptype_7cpython_7complex_complex = 0;
 
 /* Module declarations from 'cpython.bytearray' */
 
+/* Module declarations from 'libc.stdint' */
+
 /* Module declarations from 'bytehouse_driver.bufferedreader' */
 static PyTypeObject *__pyx_ptype_16bytehouse_driver_14bufferedreader_BufferedReader = 0;
 static PyTypeObject *__pyx_ptype_16bytehouse_driver_14bufferedreader_BufferedSocketReader = 0;
@@ -1565,11 +1636,13 @@ int __pyx_module_is_main_bytehouse_driver__bufferedreader = 0;
 /* Implementation of 'bytehouse_driver.bufferedreader' */
 static PyObject *__pyx_builtin_super;
 static PyObject *__pyx_builtin_NotImplementedError;
+static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_object;
 static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin_MemoryError;
 static PyObject *__pyx_builtin_UnicodeDecodeError;
 static PyObject *__pyx_builtin_EOFError;
+static const char __pyx_k_dst[] = "dst";
 static const char __pyx_k_new[] = "__new__";
 static const char __pyx_k_dict[] = "__dict__";
 static const char __pyx_k_init[] = "__init__";
@@ -1585,8 +1658,10 @@ static const char __pyx_k_encode[] = "encode";
 static const char __pyx_k_import[] = "__import__";
 static const char __pyx_k_length[] = "length";
 static const char __pyx_k_object[] = "object";
+static const char __pyx_k_offset[] = "offset";
 static const char __pyx_k_pickle[] = "pickle";
 static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_unread[] = "unread";
 static const char __pyx_k_update[] = "update";
 static const char __pyx_k_bufsize[] = "bufsize";
 static const char __pyx_k_n_items[] = "n_items";
@@ -1598,7 +1673,10 @@ static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_pyx_state[] = "__pyx_state";
 static const char __pyx_k_recv_into[] = "recv_into";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_memoryview[] = "memoryview";
 static const char __pyx_k_pyx_result[] = "__pyx_result";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_read_block[] = "read_block";
 static const char __pyx_k_MemoryError[] = "MemoryError";
 static const char __pyx_k_PickleError[] = "PickleError";
@@ -1618,14 +1696,16 @@ static const char __pyx_k_pyx_unpickle_BufferedReader[] = "__pyx_unpickle_Buffer
 static const char __pyx_k_read_fixed_strings_as_bytes[] = "read_fixed_strings_as_bytes";
 static const char __pyx_k_pyx_unpickle_BufferedSocketRea[] = "__pyx_unpickle_BufferedSocketReader";
 static const char __pyx_k_pyx_unpickle_CompressedBuffere[] = "__pyx_unpickle_CompressedBufferedReader";
+static const char __pyx_k_Destination_buffer_is_too_small[] = "Destination buffer is too small";
 static const char __pyx_k_bytehouse_driver_bufferedreader[] = "bytehouse_driver.bufferedreader";
-static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0x2a8a945, 0x5e0d780, 0x07c78bc) = (buffer, current_buffer_size, position))";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0x0d82568, 0xe0b4e91, 0xfe80cf8) = (buffer, current_buffer_size, position, refills_in_place))";
 static const char __pyx_k_Unexpected_EOF_while_reading_byt[] = "Unexpected EOF while reading bytes";
-static const char __pyx_k_Incompatible_checksums_0x_x_vs_0_2[] = "Incompatible checksums (0x%x vs (0xef9caf0, 0x44eb6c8, 0xb4ff772) = (buffer, current_buffer_size, position, sock))";
-static const char __pyx_k_Incompatible_checksums_0x_x_vs_0_3[] = "Incompatible checksums (0x%x vs (0x183c0eb, 0x69923fe, 0xfd1be99) = (buffer, current_buffer_size, position, read_block))";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0_2[] = "Incompatible checksums (0x%x vs (0x8ae7070, 0x772103b, 0x272045f) = (buffer, current_buffer_size, position, refills_in_place, sock))";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0_3[] = "Incompatible checksums (0x%x vs (0x830c404, 0x310915d, 0x217309e) = (buffer, current_buffer_size, position, read_block, refills_in_place))";
 static PyObject *__pyx_n_s_BufferedReader;
 static PyObject *__pyx_n_s_BufferedSocketReader;
 static PyObject *__pyx_n_s_CompressedBufferedReader;
+static PyObject *__pyx_kp_u_Destination_buffer_is_too_small;
 static PyObject *__pyx_n_s_EOFError;
 static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
 static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_2;
@@ -1635,10 +1715,12 @@ static PyObject *__pyx_n_s_NotImplementedError;
 static PyObject *__pyx_n_s_PickleError;
 static PyObject *__pyx_kp_u_Unexpected_EOF_while_reading_byt;
 static PyObject *__pyx_n_s_UnicodeDecodeError;
+static PyObject *__pyx_n_s_ValueError;
 static PyObject *__pyx_n_s_bufsize;
 static PyObject *__pyx_n_s_bytehouse_driver_bufferedreader;
 static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_n_s_dict;
+static PyObject *__pyx_n_s_dst;
 static PyObject *__pyx_n_s_encode;
 static PyObject *__pyx_n_s_encoding;
 static PyObject *__pyx_n_s_getstate;
@@ -1646,10 +1728,12 @@ static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_s_init;
 static PyObject *__pyx_n_s_length;
 static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_memoryview;
 static PyObject *__pyx_n_s_n_items;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_new;
 static PyObject *__pyx_n_s_object;
+static PyObject *__pyx_n_s_offset;
 static PyObject *__pyx_n_s_pickle;
 static PyObject *__pyx_n_s_pyx_PickleError;
 static PyObject *__pyx_n_s_pyx_checksum;
@@ -1659,6 +1743,7 @@ static PyObject *__pyx_n_s_pyx_type;
 static PyObject *__pyx_n_s_pyx_unpickle_BufferedReader;
 static PyObject *__pyx_n_s_pyx_unpickle_BufferedSocketRea;
 static PyObject *__pyx_n_s_pyx_unpickle_CompressedBuffere;
+static PyObject *__pyx_n_s_pyx_vtable;
 static PyObject *__pyx_n_s_range;
 static PyObject *__pyx_n_s_read;
 static PyObject *__pyx_n_s_read_block;
@@ -1674,15 +1759,19 @@ static PyObject *__pyx_n_s_sock;
 static PyObject *__pyx_kp_s_stringsource;
 static PyObject *__pyx_n_s_super;
 static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_unread;
 static PyObject *__pyx_n_s_update;
 static PyObject *__pyx_kp_u_utf_8;
 static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader___init__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v_bufsize); /* proto */
 static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_2read_into_buffer(CYTHON_UNUSED struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_4read(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_unread); /* proto */
-static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6read_one(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8read_strings(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items, PyObject *__pyx_v_encoding); /* proto */
-static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_10read_fixed_strings_as_bytes(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length); /* proto */
-static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_12read_fixed_strings(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length, PyObject *__pyx_v_encoding); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6read_view(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_unread); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8read_into(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v_dst, unsigned PY_LONG_LONG __pyx_v_offset, unsigned PY_LONG_LONG __pyx_v_unread); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_10read_one(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_12read_strings(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items, PyObject *__pyx_v_encoding); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_14read_string_buffers(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_16read_fixed_strings_as_bytes(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_18read_fixed_strings(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length, PyObject *__pyx_v_encoding); /* proto */
 static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8position___get__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
 static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8position_2__set__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_19current_buffer_size___get__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
@@ -1690,8 +1779,10 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_19curre
 static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer___get__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
 static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer_2__set__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer_4__del__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_14__reduce_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_16__setstate_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_16refills_in_place___get__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
+static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_16refills_in_place_2__set__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_20__reduce_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_22__setstate_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
 static int __pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketReader___init__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedSocketReader *__pyx_v_self, PyObject *__pyx_v_sock, PyObject *__pyx_v_bufsize); /* proto */
 static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketReader_2read_into_buffer(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedSocketReader *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketReader_4__reduce_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedSocketReader *__pyx_v_self); /* proto */
@@ -1706,29 +1797,30 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_4__pyx_unpickle_Co
 static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedreader_BufferedReader(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedreader_BufferedSocketReader(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedreader_CompressedBufferedReader(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_int_8157372;
-static PyObject *__pyx_int_25411819;
-static PyObject *__pyx_int_44607813;
-static PyObject *__pyx_int_72267464;
-static PyObject *__pyx_int_98621312;
-static PyObject *__pyx_int_110699518;
-static PyObject *__pyx_int_189790066;
-static PyObject *__pyx_int_251251440;
-static PyObject *__pyx_int_265404057;
+static PyObject *__pyx_int_14165352;
+static PyObject *__pyx_int_35074206;
+static PyObject *__pyx_int_41026655;
+static PyObject *__pyx_int_51417437;
+static PyObject *__pyx_int_124915771;
+static PyObject *__pyx_int_137413636;
+static PyObject *__pyx_int_145649776;
+static PyObject *__pyx_int_235622033;
+static PyObject *__pyx_int_266865912;
 static PyObject *__pyx_tuple_;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__3;
 static PyObject *__pyx_tuple__4;
 static PyObject *__pyx_tuple__5;
-static PyObject *__pyx_tuple__7;
-static PyObject *__pyx_tuple__9;
-static PyObject *__pyx_codeobj__6;
-static PyObject *__pyx_codeobj__8;
-static PyObject *__pyx_codeobj__10;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__10;
+static PyObject *__pyx_codeobj__7;
+static PyObject *__pyx_codeobj__9;
+static PyObject *__pyx_codeobj__11;
 /* Late includes */
 
-/* "bytehouse_driver/bufferedreader.pyx":14
- *     cdef public bytearray buffer
+/* "bytehouse_driver/bufferedreader.pyx":19
+ *     cdef public bint refills_in_place
  * 
  *     def __init__(self, bufsize):             # <<<<<<<<<<<<<<
  *         self.buffer = bytearray(bufsize)
@@ -1764,7 +1856,7 @@ static int __pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_1__init
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 14, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 19, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
       goto __pyx_L5_argtuple_error;
@@ -1775,7 +1867,7 @@ static int __pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_1__init
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 14, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 19, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1799,14 +1891,14 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader___init_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "bytehouse_driver/bufferedreader.pyx":15
+  /* "bytehouse_driver/bufferedreader.pyx":20
  * 
  *     def __init__(self, bufsize):
  *         self.buffer = bytearray(bufsize)             # <<<<<<<<<<<<<<
  * 
  *         self.position = 0
  */
-  __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_v_bufsize); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 15, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_v_bufsize); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 20, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF(__pyx_v_self->buffer);
@@ -1814,32 +1906,41 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader___init_
   __pyx_v_self->buffer = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":17
+  /* "bytehouse_driver/bufferedreader.pyx":22
  *         self.buffer = bytearray(bufsize)
  * 
  *         self.position = 0             # <<<<<<<<<<<<<<
  *         self.current_buffer_size = 0
- * 
+ *         self.refills_in_place = True
  */
   __pyx_v_self->position = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":18
+  /* "bytehouse_driver/bufferedreader.pyx":23
  * 
  *         self.position = 0
  *         self.current_buffer_size = 0             # <<<<<<<<<<<<<<
+ *         self.refills_in_place = True
  * 
- *         super(BufferedReader, self).__init__()
  */
   __pyx_v_self->current_buffer_size = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":20
+  /* "bytehouse_driver/bufferedreader.pyx":24
+ *         self.position = 0
  *         self.current_buffer_size = 0
+ *         self.refills_in_place = True             # <<<<<<<<<<<<<<
+ * 
+ *         super(BufferedReader, self).__init__()
+ */
+  __pyx_v_self->refills_in_place = 1;
+
+  /* "bytehouse_driver/bufferedreader.pyx":26
+ *         self.refills_in_place = True
  * 
  *         super(BufferedReader, self).__init__()             # <<<<<<<<<<<<<<
  * 
  *     def read_into_buffer(self):
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 20, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 26, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedreader_BufferedReader));
   __Pyx_GIVEREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedreader_BufferedReader));
@@ -1847,10 +1948,10 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader___init_
   __Pyx_INCREF(((PyObject *)__pyx_v_self));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
   PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 20, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 26, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 20, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 26, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -1865,13 +1966,13 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader___init_
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 20, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 26, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":14
- *     cdef public bytearray buffer
+  /* "bytehouse_driver/bufferedreader.pyx":19
+ *     cdef public bint refills_in_place
  * 
  *     def __init__(self, bufsize):             # <<<<<<<<<<<<<<
  *         self.buffer = bytearray(bufsize)
@@ -1892,7 +1993,7 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader___init_
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedreader.pyx":22
+/* "bytehouse_driver/bufferedreader.pyx":28
  *         super(BufferedReader, self).__init__()
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
@@ -1921,7 +2022,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_2
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("read_into_buffer", 0);
 
-  /* "bytehouse_driver/bufferedreader.pyx":23
+  /* "bytehouse_driver/bufferedreader.pyx":29
  * 
  *     def read_into_buffer(self):
  *         raise NotImplementedError             # <<<<<<<<<<<<<<
@@ -1929,9 +2030,9 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_2
  *     def read(self, unsigned long long unread):
  */
   __Pyx_Raise(__pyx_builtin_NotImplementedError, 0, 0, 0);
-  __PYX_ERR(0, 23, __pyx_L1_error)
+  __PYX_ERR(0, 29, __pyx_L1_error)
 
-  /* "bytehouse_driver/bufferedreader.pyx":22
+  /* "bytehouse_driver/bufferedreader.pyx":28
  *         super(BufferedReader, self).__init__()
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
@@ -1948,7 +2049,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_2
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedreader.pyx":25
+/* "bytehouse_driver/bufferedreader.pyx":31
  *         raise NotImplementedError
  * 
  *     def read(self, unsigned long long unread):             # <<<<<<<<<<<<<<
@@ -1967,7 +2068,7 @@ static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_5
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("read (wrapper)", 0);
   assert(__pyx_arg_unread); {
-    __pyx_v_unread = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_arg_unread); if (unlikely((__pyx_v_unread == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 25, __pyx_L3_error)
+    __pyx_v_unread = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_arg_unread); if (unlikely((__pyx_v_unread == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 31, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -1984,269 +2085,317 @@ static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_5
 
 static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_4read(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_unread) {
   unsigned PY_LONG_LONG __pyx_v_next_position;
-  unsigned PY_LONG_LONG __pyx_v_t;
   char *__pyx_v_buffer_ptr;
-  unsigned PY_LONG_LONG __pyx_v_read_bytes;
+  unsigned PY_LONG_LONG __pyx_v_t;
   PyObject *__pyx_v_rv = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
-  unsigned PY_LONG_LONG __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  unsigned PY_LONG_LONG __pyx_t_6;
-  unsigned PY_LONG_LONG __pyx_t_7;
+  PyObject *__pyx_t_2 = NULL;
+  unsigned PY_LONG_LONG __pyx_t_3;
+  char *__pyx_t_4;
+  int __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("read", 0);
 
-  /* "bytehouse_driver/bufferedreader.pyx":28
+  /* "bytehouse_driver/bufferedreader.pyx":34
  *         # When the buffer is large enough bytes read are almost
  *         # always hit the buffer.
  *         cdef unsigned long long next_position = unread + self.position             # <<<<<<<<<<<<<<
- *         if next_position < self.current_buffer_size:
- *             t = self.position
+ *         cdef char* buffer_ptr
+ *         if next_position <= self.current_buffer_size:
  */
   __pyx_v_next_position = (__pyx_v_unread + __pyx_v_self->position);
 
-  /* "bytehouse_driver/bufferedreader.pyx":29
- *         # always hit the buffer.
+  /* "bytehouse_driver/bufferedreader.pyx":36
  *         cdef unsigned long long next_position = unread + self.position
- *         if next_position < self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *         cdef char* buffer_ptr
+ *         if next_position <= self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *             buffer_ptr = PyByteArray_AsString(self.buffer)
  *             t = self.position
- *             self.position = next_position
  */
-  __pyx_t_1 = ((__pyx_v_next_position < __pyx_v_self->current_buffer_size) != 0);
+  __pyx_t_1 = ((__pyx_v_next_position <= __pyx_v_self->current_buffer_size) != 0);
   if (__pyx_t_1) {
 
-    /* "bytehouse_driver/bufferedreader.pyx":30
- *         cdef unsigned long long next_position = unread + self.position
- *         if next_position < self.current_buffer_size:
+    /* "bytehouse_driver/bufferedreader.pyx":37
+ *         cdef char* buffer_ptr
+ *         if next_position <= self.current_buffer_size:
+ *             buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *             t = self.position
+ *             self.position = next_position
+ */
+    __pyx_t_2 = __pyx_v_self->buffer;
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "bytehouse_driver/bufferedreader.pyx":38
+ *         if next_position <= self.current_buffer_size:
+ *             buffer_ptr = PyByteArray_AsString(self.buffer)
  *             t = self.position             # <<<<<<<<<<<<<<
  *             self.position = next_position
- *             return bytes(self.buffer[t:self.position])
+ *             return PyBytes_FromStringAndSize(&buffer_ptr[t], unread)
  */
-    __pyx_t_2 = __pyx_v_self->position;
-    __pyx_v_t = __pyx_t_2;
+    __pyx_t_3 = __pyx_v_self->position;
+    __pyx_v_t = __pyx_t_3;
 
-    /* "bytehouse_driver/bufferedreader.pyx":31
- *         if next_position < self.current_buffer_size:
+    /* "bytehouse_driver/bufferedreader.pyx":39
+ *             buffer_ptr = PyByteArray_AsString(self.buffer)
  *             t = self.position
  *             self.position = next_position             # <<<<<<<<<<<<<<
- *             return bytes(self.buffer[t:self.position])
+ *             return PyBytes_FromStringAndSize(&buffer_ptr[t], unread)
  * 
  */
     __pyx_v_self->position = __pyx_v_next_position;
 
-    /* "bytehouse_driver/bufferedreader.pyx":32
+    /* "bytehouse_driver/bufferedreader.pyx":40
  *             t = self.position
  *             self.position = next_position
- *             return bytes(self.buffer[t:self.position])             # <<<<<<<<<<<<<<
+ *             return PyBytes_FromStringAndSize(&buffer_ptr[t], unread)             # <<<<<<<<<<<<<<
  * 
- *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
+ *         # Result is allocated once and filled chunk by chunk to keep
  */
     __Pyx_XDECREF(__pyx_r);
-    if (unlikely(__pyx_v_self->buffer == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 32, __pyx_L1_error)
-    }
-    __pyx_t_3 = PySequence_GetSlice(__pyx_v_self->buffer, __pyx_v_t, __pyx_v_self->position); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 32, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyBytes_Type)), __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 32, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_r = __pyx_t_4;
-    __pyx_t_4 = 0;
+    __pyx_t_2 = PyBytes_FromStringAndSize((&(__pyx_v_buffer_ptr[__pyx_v_t])), __pyx_v_unread); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 40, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "bytehouse_driver/bufferedreader.pyx":29
- *         # always hit the buffer.
+    /* "bytehouse_driver/bufferedreader.pyx":36
  *         cdef unsigned long long next_position = unread + self.position
- *         if next_position < self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *         cdef char* buffer_ptr
+ *         if next_position <= self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *             buffer_ptr = PyByteArray_AsString(self.buffer)
  *             t = self.position
- *             self.position = next_position
  */
   }
 
-  /* "bytehouse_driver/bufferedreader.pyx":34
- *             return bytes(self.buffer[t:self.position])
- * 
- *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
- *         cdef unsigned long long read_bytes
- *         rv = bytes()
+  /* "bytehouse_driver/bufferedreader.pyx":44
+ *         # Result is allocated once and filled chunk by chunk to keep
+ *         # reads spanning several buffers linear.
+ *         rv = PyBytes_FromStringAndSize(NULL, unread)             # <<<<<<<<<<<<<<
+ *         self._read_into(PyBytes_AsString(rv), unread)
+ *         return rv
  */
-  __pyx_t_4 = __pyx_v_self->buffer;
-  __Pyx_INCREF(__pyx_t_4);
-  __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_2 = PyBytes_FromStringAndSize(NULL, __pyx_v_unread); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 44, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_rv = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":36
- *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
- *         cdef unsigned long long read_bytes
- *         rv = bytes()             # <<<<<<<<<<<<<<
+  /* "bytehouse_driver/bufferedreader.pyx":45
+ *         # reads spanning several buffers linear.
+ *         rv = PyBytes_FromStringAndSize(NULL, unread)
+ *         self._read_into(PyBytes_AsString(rv), unread)             # <<<<<<<<<<<<<<
+ *         return rv
  * 
- *         while unread > 0:
  */
-  __pyx_t_4 = __Pyx_PyObject_CallNoArg(((PyObject *)(&PyBytes_Type))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 36, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_v_rv = ((PyObject*)__pyx_t_4);
-  __pyx_t_4 = 0;
+  __pyx_t_4 = PyBytes_AsString(__pyx_v_rv); if (unlikely(__pyx_t_4 == ((char *)NULL))) __PYX_ERR(0, 45, __pyx_L1_error)
+  __pyx_t_5 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self->__pyx_vtab)->_read_into(__pyx_v_self, __pyx_t_4, __pyx_v_unread); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 45, __pyx_L1_error)
 
-  /* "bytehouse_driver/bufferedreader.pyx":38
- *         rv = bytes()
+  /* "bytehouse_driver/bufferedreader.pyx":46
+ *         rv = PyBytes_FromStringAndSize(NULL, unread)
+ *         self._read_into(PyBytes_AsString(rv), unread)
+ *         return rv             # <<<<<<<<<<<<<<
  * 
- *         while unread > 0:             # <<<<<<<<<<<<<<
- *             if self.position == self.current_buffer_size:
- *                 self.read_into_buffer()
+ *     def read_view(self, unsigned long long unread):
  */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_unread > 0) != 0);
-    if (!__pyx_t_1) break;
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_rv);
+  __pyx_r = __pyx_v_rv;
+  goto __pyx_L0;
 
-    /* "bytehouse_driver/bufferedreader.pyx":39
+  /* "bytehouse_driver/bufferedreader.pyx":31
+ *         raise NotImplementedError
  * 
- *         while unread > 0:
- *             if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
- *                 self.read_into_buffer()
- *                 buffer_ptr = PyByteArray_AsString(self.buffer)
+ *     def read(self, unsigned long long unread):             # <<<<<<<<<<<<<<
+ *         # When the buffer is large enough bytes read are almost
+ *         # always hit the buffer.
  */
-    __pyx_t_1 = ((__pyx_v_self->position == __pyx_v_self->current_buffer_size) != 0);
-    if (__pyx_t_1) {
 
-      /* "bytehouse_driver/bufferedreader.pyx":40
- *         while unread > 0:
- *             if self.position == self.current_buffer_size:
- *                 self.read_into_buffer()             # <<<<<<<<<<<<<<
- *                 buffer_ptr = PyByteArray_AsString(self.buffer)
- *                 self.position = 0
- */
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 40, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = NULL;
-      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_5)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_5);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
-        }
-      }
-      __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 40, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_rv);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-      /* "bytehouse_driver/bufferedreader.pyx":41
- *             if self.position == self.current_buffer_size:
- *                 self.read_into_buffer()
- *                 buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
- *                 self.position = 0
+/* "bytehouse_driver/bufferedreader.pyx":48
+ *         return rv
  * 
+ *     def read_view(self, unsigned long long unread):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads ``unread`` bytes without copying them when possible.
  */
-      __pyx_t_4 = __pyx_v_self->buffer;
-      __Pyx_INCREF(__pyx_t_4);
-      __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-      /* "bytehouse_driver/bufferedreader.pyx":42
- *                 self.read_into_buffer()
- *                 buffer_ptr = PyByteArray_AsString(self.buffer)
- *                 self.position = 0             # <<<<<<<<<<<<<<
- * 
- *             read_bytes = min(unread, self.current_buffer_size - self.position)
+/* Python wrapper */
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_7read_view(PyObject *__pyx_v_self, PyObject *__pyx_arg_unread); /*proto*/
+static char __pyx_doc_16bytehouse_driver_14bufferedreader_14BufferedReader_6read_view[] = "\n        Reads ``unread`` bytes without copying them when possible.\n\n        If all bytes are already in the buffer returned memoryview points\n        into it and is valid only until the next read from this reader.\n        Otherwise bytes are assembled into a new buffer owned by the view.\n        ";
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_7read_view(PyObject *__pyx_v_self, PyObject *__pyx_arg_unread) {
+  unsigned PY_LONG_LONG __pyx_v_unread;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("read_view (wrapper)", 0);
+  assert(__pyx_arg_unread); {
+    __pyx_v_unread = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_arg_unread); if (unlikely((__pyx_v_unread == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 48, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_view", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6read_view(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), ((unsigned PY_LONG_LONG)__pyx_v_unread));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6read_view(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_unread) {
+  unsigned PY_LONG_LONG __pyx_v_next_position;
+  unsigned PY_LONG_LONG __pyx_v_t;
+  PyObject *__pyx_v_rv = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  unsigned PY_LONG_LONG __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_view", 0);
+
+  /* "bytehouse_driver/bufferedreader.pyx":56
+ *         Otherwise bytes are assembled into a new buffer owned by the view.
+ *         """
+ *         cdef unsigned long long next_position = unread + self.position             # <<<<<<<<<<<<<<
+ *         if next_position <= self.current_buffer_size:
+ *             t = self.position
  */
-      __pyx_v_self->position = 0;
+  __pyx_v_next_position = (__pyx_v_unread + __pyx_v_self->position);
 
-      /* "bytehouse_driver/bufferedreader.pyx":39
- * 
- *         while unread > 0:
- *             if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
- *                 self.read_into_buffer()
- *                 buffer_ptr = PyByteArray_AsString(self.buffer)
+  /* "bytehouse_driver/bufferedreader.pyx":57
+ *         """
+ *         cdef unsigned long long next_position = unread + self.position
+ *         if next_position <= self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *             t = self.position
+ *             self.position = next_position
  */
-    }
+  __pyx_t_1 = ((__pyx_v_next_position <= __pyx_v_self->current_buffer_size) != 0);
+  if (__pyx_t_1) {
 
-    /* "bytehouse_driver/bufferedreader.pyx":44
- *                 self.position = 0
+    /* "bytehouse_driver/bufferedreader.pyx":58
+ *         cdef unsigned long long next_position = unread + self.position
+ *         if next_position <= self.current_buffer_size:
+ *             t = self.position             # <<<<<<<<<<<<<<
+ *             self.position = next_position
+ *             return memoryview(self.buffer)[t:next_position]
+ */
+    __pyx_t_2 = __pyx_v_self->position;
+    __pyx_v_t = __pyx_t_2;
+
+    /* "bytehouse_driver/bufferedreader.pyx":59
+ *         if next_position <= self.current_buffer_size:
+ *             t = self.position
+ *             self.position = next_position             # <<<<<<<<<<<<<<
+ *             return memoryview(self.buffer)[t:next_position]
  * 
- *             read_bytes = min(unread, self.current_buffer_size - self.position)             # <<<<<<<<<<<<<<
- *             rv += PyBytes_FromStringAndSize(
- *                 &buffer_ptr[self.position], read_bytes
  */
-    __pyx_t_2 = (__pyx_v_self->current_buffer_size - __pyx_v_self->position);
-    __pyx_t_6 = __pyx_v_unread;
-    if (((__pyx_t_2 < __pyx_t_6) != 0)) {
-      __pyx_t_7 = __pyx_t_2;
-    } else {
-      __pyx_t_7 = __pyx_t_6;
-    }
-    __pyx_v_read_bytes = __pyx_t_7;
+    __pyx_v_self->position = __pyx_v_next_position;
 
-    /* "bytehouse_driver/bufferedreader.pyx":45
+    /* "bytehouse_driver/bufferedreader.pyx":60
+ *             t = self.position
+ *             self.position = next_position
+ *             return memoryview(self.buffer)[t:next_position]             # <<<<<<<<<<<<<<
  * 
- *             read_bytes = min(unread, self.current_buffer_size - self.position)
- *             rv += PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
- *                 &buffer_ptr[self.position], read_bytes
- *             )
+ *         rv = PyByteArray_FromStringAndSize(NULL, unread)
  */
-    __pyx_t_4 = PyBytes_FromStringAndSize((&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_read_bytes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 45, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_self->buffer); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_v_rv, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 45, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_PyObject_GetSlice(__pyx_t_4, __pyx_v_t, __pyx_v_next_position, NULL, NULL, NULL, 1, 1, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF_SET(__pyx_v_rv, ((PyObject*)__pyx_t_3));
+    __pyx_r = __pyx_t_3;
     __pyx_t_3 = 0;
+    goto __pyx_L0;
 
-    /* "bytehouse_driver/bufferedreader.pyx":48
- *                 &buffer_ptr[self.position], read_bytes
- *             )
- *             self.position += read_bytes             # <<<<<<<<<<<<<<
- *             unread -= read_bytes
- * 
+    /* "bytehouse_driver/bufferedreader.pyx":57
+ *         """
+ *         cdef unsigned long long next_position = unread + self.position
+ *         if next_position <= self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *             t = self.position
+ *             self.position = next_position
  */
-    __pyx_v_self->position = (__pyx_v_self->position + __pyx_v_read_bytes);
+  }
 
-    /* "bytehouse_driver/bufferedreader.pyx":49
- *             )
- *             self.position += read_bytes
- *             unread -= read_bytes             # <<<<<<<<<<<<<<
+  /* "bytehouse_driver/bufferedreader.pyx":62
+ *             return memoryview(self.buffer)[t:next_position]
  * 
- *         return rv
+ *         rv = PyByteArray_FromStringAndSize(NULL, unread)             # <<<<<<<<<<<<<<
+ *         self._read_into(PyByteArray_AsString(rv), unread)
+ *         return memoryview(rv)
  */
-    __pyx_v_unread = (__pyx_v_unread - __pyx_v_read_bytes);
-  }
+  __pyx_t_3 = PyByteArray_FromStringAndSize(NULL, __pyx_v_unread); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_rv = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":51
- *             unread -= read_bytes
+  /* "bytehouse_driver/bufferedreader.pyx":63
  * 
- *         return rv             # <<<<<<<<<<<<<<
+ *         rv = PyByteArray_FromStringAndSize(NULL, unread)
+ *         self._read_into(PyByteArray_AsString(rv), unread)             # <<<<<<<<<<<<<<
+ *         return memoryview(rv)
  * 
- *     def read_one(self):
+ */
+  __pyx_t_5 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self->__pyx_vtab)->_read_into(__pyx_v_self, PyByteArray_AsString(__pyx_v_rv), __pyx_v_unread); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 63, __pyx_L1_error)
+
+  /* "bytehouse_driver/bufferedreader.pyx":64
+ *         rv = PyByteArray_FromStringAndSize(NULL, unread)
+ *         self._read_into(PyByteArray_AsString(rv), unread)
+ *         return memoryview(rv)             # <<<<<<<<<<<<<<
+ * 
+ *     def read_into(self, bytearray dst, unsigned long long offset,
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_rv);
-  __pyx_r = __pyx_v_rv;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_rv); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
   goto __pyx_L0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":25
- *         raise NotImplementedError
+  /* "bytehouse_driver/bufferedreader.pyx":48
+ *         return rv
  * 
- *     def read(self, unsigned long long unread):             # <<<<<<<<<<<<<<
- *         # When the buffer is large enough bytes read are almost
- *         # always hit the buffer.
+ *     def read_view(self, unsigned long long unread):             # <<<<<<<<<<<<<<
+ *         """
+ *         Reads ``unread`` bytes without copying them when possible.
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_view", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_rv);
@@ -2255,424 +2404,1828 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_4
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedreader.pyx":53
- *         return rv
+/* "bytehouse_driver/bufferedreader.pyx":66
+ *         return memoryview(rv)
  * 
- *     def read_one(self):             # <<<<<<<<<<<<<<
- *         if self.position == self.current_buffer_size:
- *             self.read_into_buffer()
+ *     def read_into(self, bytearray dst, unsigned long long offset,             # <<<<<<<<<<<<<<
+ *                   unsigned long long unread):
+ *         """
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_7read_one(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_7read_one(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_9read_into(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_16bytehouse_driver_14bufferedreader_14BufferedReader_8read_into[] = "\n        Reads ``unread`` bytes into ``dst`` starting at ``offset``.\n        ";
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_9read_into(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_dst = 0;
+  unsigned PY_LONG_LONG __pyx_v_offset;
+  unsigned PY_LONG_LONG __pyx_v_unread;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("read_one (wrapper)", 0);
-  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6read_one(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("read_into (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_dst,&__pyx_n_s_offset,&__pyx_n_s_unread,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_dst)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("read_into", 1, 3, 3, 1); __PYX_ERR(0, 66, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_unread)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("read_into", 1, 3, 3, 2); __PYX_ERR(0, 66, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "read_into") < 0)) __PYX_ERR(0, 66, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_dst = ((PyObject*)values[0]);
+    __pyx_v_offset = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[1]); if (unlikely((__pyx_v_offset == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 66, __pyx_L3_error)
+    __pyx_v_unread = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[2]); if (unlikely((__pyx_v_unread == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 67, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("read_into", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 66, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_into", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_dst), (&PyByteArray_Type), 1, "dst", 1))) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8read_into(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_dst, __pyx_v_offset, __pyx_v_unread);
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6read_one(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self) {
-  unsigned char __pyx_v_rv;
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8read_into(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v_dst, unsigned PY_LONG_LONG __pyx_v_offset, unsigned PY_LONG_LONG __pyx_v_unread) {
+  char *__pyx_v_dst_ptr;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
+  int __pyx_t_4;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("read_one", 0);
+  __Pyx_RefNannySetupContext("read_into", 0);
 
-  /* "bytehouse_driver/bufferedreader.pyx":54
+  /* "bytehouse_driver/bufferedreader.pyx":71
+ *         Reads ``unread`` bytes into ``dst`` starting at ``offset``.
+ *         """
+ *         if offset + unread > <unsigned long long> len(dst):             # <<<<<<<<<<<<<<
+ *             raise ValueError('Destination buffer is too small')
  * 
- *     def read_one(self):
- *         if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
- *             self.read_into_buffer()
- *             self.position = 0
  */
-  __pyx_t_1 = ((__pyx_v_self->position == __pyx_v_self->current_buffer_size) != 0);
-  if (__pyx_t_1) {
+  if (unlikely(__pyx_v_dst == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 71, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyByteArray_GET_SIZE(__pyx_v_dst); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 71, __pyx_L1_error)
+  __pyx_t_2 = (((__pyx_v_offset + __pyx_v_unread) > ((unsigned PY_LONG_LONG)__pyx_t_1)) != 0);
+  if (unlikely(__pyx_t_2)) {
 
-    /* "bytehouse_driver/bufferedreader.pyx":55
- *     def read_one(self):
- *         if self.position == self.current_buffer_size:
- *             self.read_into_buffer()             # <<<<<<<<<<<<<<
- *             self.position = 0
+    /* "bytehouse_driver/bufferedreader.pyx":72
+ *         """
+ *         if offset + unread > <unsigned long long> len(dst):
+ *             raise ValueError('Destination buffer is too small')             # <<<<<<<<<<<<<<
  * 
+ *         cdef char* dst_ptr = PyByteArray_AsString(dst)
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 55, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 72, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-      }
-    }
-    __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 55, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "bytehouse_driver/bufferedreader.pyx":56
- *         if self.position == self.current_buffer_size:
- *             self.read_into_buffer()
- *             self.position = 0             # <<<<<<<<<<<<<<
- * 
- *         rv = self.buffer[self.position]
- */
-    __pyx_v_self->position = 0;
+    __PYX_ERR(0, 72, __pyx_L1_error)
 
-    /* "bytehouse_driver/bufferedreader.pyx":54
+    /* "bytehouse_driver/bufferedreader.pyx":71
+ *         Reads ``unread`` bytes into ``dst`` starting at ``offset``.
+ *         """
+ *         if offset + unread > <unsigned long long> len(dst):             # <<<<<<<<<<<<<<
+ *             raise ValueError('Destination buffer is too small')
  * 
- *     def read_one(self):
- *         if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
- *             self.read_into_buffer()
- *             self.position = 0
  */
   }
 
-  /* "bytehouse_driver/bufferedreader.pyx":58
- *             self.position = 0
- * 
- *         rv = self.buffer[self.position]             # <<<<<<<<<<<<<<
- *         self.position += 1
- *         return rv
- */
-  __pyx_t_5 = __Pyx_GetItemInt_ByteArray(__pyx_v_self->buffer, __pyx_v_self->position, unsigned PY_LONG_LONG, 0, __Pyx_PyInt_From_unsigned_PY_LONG_LONG, 0, 0, 1); if (unlikely(__pyx_t_5 == -1)) __PYX_ERR(0, 58, __pyx_L1_error)
-  __pyx_v_rv = __pyx_t_5;
-
-  /* "bytehouse_driver/bufferedreader.pyx":59
+  /* "bytehouse_driver/bufferedreader.pyx":74
+ *             raise ValueError('Destination buffer is too small')
  * 
- *         rv = self.buffer[self.position]
- *         self.position += 1             # <<<<<<<<<<<<<<
- *         return rv
+ *         cdef char* dst_ptr = PyByteArray_AsString(dst)             # <<<<<<<<<<<<<<
+ *         self._read_into(&dst_ptr[offset], unread)
  * 
  */
-  __pyx_v_self->position = (__pyx_v_self->position + 1);
+  __pyx_v_dst_ptr = PyByteArray_AsString(__pyx_v_dst);
 
-  /* "bytehouse_driver/bufferedreader.pyx":60
- *         rv = self.buffer[self.position]
- *         self.position += 1
- *         return rv             # <<<<<<<<<<<<<<
+  /* "bytehouse_driver/bufferedreader.pyx":75
  * 
- *     def read_strings(self, unsigned long long n_items, encoding=None):
+ *         cdef char* dst_ptr = PyByteArray_AsString(dst)
+ *         self._read_into(&dst_ptr[offset], unread)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _read_into(self, char* dst,
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyInt_From_unsigned_char(__pyx_v_rv); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 60, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
+  __pyx_t_4 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self->__pyx_vtab)->_read_into(__pyx_v_self, (&(__pyx_v_dst_ptr[__pyx_v_offset])), __pyx_v_unread); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 75, __pyx_L1_error)
 
-  /* "bytehouse_driver/bufferedreader.pyx":53
- *         return rv
+  /* "bytehouse_driver/bufferedreader.pyx":66
+ *         return memoryview(rv)
  * 
- *     def read_one(self):             # <<<<<<<<<<<<<<
- *         if self.position == self.current_buffer_size:
- *             self.read_into_buffer()
+ *     def read_into(self, bytearray dst, unsigned long long offset,             # <<<<<<<<<<<<<<
+ *                   unsigned long long unread):
+ *         """
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_into", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bytehouse_driver/bufferedreader.pyx":77
+ *         self._read_into(&dst_ptr[offset], unread)
+ * 
+ *     cdef int _read_into(self, char* dst,             # <<<<<<<<<<<<<<
+ *                         unsigned long long unread) except -1:
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
+ */
+
+static int __pyx_f_16bytehouse_driver_14bufferedreader_14BufferedReader__read_into(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, char *__pyx_v_dst, unsigned PY_LONG_LONG __pyx_v_unread) {
+  char *__pyx_v_buffer_ptr;
+  unsigned PY_LONG_LONG __pyx_v_read_bytes;
+  unsigned PY_LONG_LONG __pyx_v_written;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  unsigned PY_LONG_LONG __pyx_t_5;
+  unsigned PY_LONG_LONG __pyx_t_6;
+  unsigned PY_LONG_LONG __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_read_into", 0);
+
+  /* "bytehouse_driver/bufferedreader.pyx":79
+ *     cdef int _read_into(self, char* dst,
+ *                         unsigned long long unread) except -1:
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long read_bytes, written = 0
+ * 
+ */
+  __pyx_t_1 = __pyx_v_self->buffer;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "bytehouse_driver/bufferedreader.pyx":80
+ *                         unsigned long long unread) except -1:
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
+ *         cdef unsigned long long read_bytes, written = 0             # <<<<<<<<<<<<<<
+ * 
+ *         while unread > 0:
+ */
+  __pyx_v_written = 0;
+
+  /* "bytehouse_driver/bufferedreader.pyx":82
+ *         cdef unsigned long long read_bytes, written = 0
+ * 
+ *         while unread > 0:             # <<<<<<<<<<<<<<
+ *             if self.position == self.current_buffer_size:
+ *                 self.read_into_buffer()
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_unread > 0) != 0);
+    if (!__pyx_t_2) break;
+
+    /* "bytehouse_driver/bufferedreader.pyx":83
+ * 
+ *         while unread > 0:
+ *             if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                 self.read_into_buffer()
+ *                 # `read_into_buffer` can override buffer
+ */
+    __pyx_t_2 = ((__pyx_v_self->position == __pyx_v_self->current_buffer_size) != 0);
+    if (__pyx_t_2) {
+
+      /* "bytehouse_driver/bufferedreader.pyx":84
+ *         while unread > 0:
+ *             if self.position == self.current_buffer_size:
+ *                 self.read_into_buffer()             # <<<<<<<<<<<<<<
+ *                 # `read_into_buffer` can override buffer
+ *                 buffer_ptr = PyByteArray_AsString(self.buffer)
+ */
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 84, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_4)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_4);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
+        }
+      }
+      __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "bytehouse_driver/bufferedreader.pyx":86
+ *                 self.read_into_buffer()
+ *                 # `read_into_buffer` can override buffer
+ *                 buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *                 self.position = 0
+ * 
+ */
+      __pyx_t_1 = __pyx_v_self->buffer;
+      __Pyx_INCREF(__pyx_t_1);
+      __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "bytehouse_driver/bufferedreader.pyx":87
+ *                 # `read_into_buffer` can override buffer
+ *                 buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                 self.position = 0             # <<<<<<<<<<<<<<
+ * 
+ *             read_bytes = min(unread, self.current_buffer_size - self.position)
+ */
+      __pyx_v_self->position = 0;
+
+      /* "bytehouse_driver/bufferedreader.pyx":83
+ * 
+ *         while unread > 0:
+ *             if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                 self.read_into_buffer()
+ *                 # `read_into_buffer` can override buffer
+ */
+    }
+
+    /* "bytehouse_driver/bufferedreader.pyx":89
+ *                 self.position = 0
+ * 
+ *             read_bytes = min(unread, self.current_buffer_size - self.position)             # <<<<<<<<<<<<<<
+ *             memcpy(&dst[written], &buffer_ptr[self.position], read_bytes)
+ *             self.position += read_bytes
+ */
+    __pyx_t_5 = (__pyx_v_self->current_buffer_size - __pyx_v_self->position);
+    __pyx_t_6 = __pyx_v_unread;
+    if (((__pyx_t_5 < __pyx_t_6) != 0)) {
+      __pyx_t_7 = __pyx_t_5;
+    } else {
+      __pyx_t_7 = __pyx_t_6;
+    }
+    __pyx_v_read_bytes = __pyx_t_7;
+
+    /* "bytehouse_driver/bufferedreader.pyx":90
+ * 
+ *             read_bytes = min(unread, self.current_buffer_size - self.position)
+ *             memcpy(&dst[written], &buffer_ptr[self.position], read_bytes)             # <<<<<<<<<<<<<<
+ *             self.position += read_bytes
+ *             written += read_bytes
+ */
+    (void)(memcpy((&(__pyx_v_dst[__pyx_v_written])), (&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_read_bytes));
+
+    /* "bytehouse_driver/bufferedreader.pyx":91
+ *             read_bytes = min(unread, self.current_buffer_size - self.position)
+ *             memcpy(&dst[written], &buffer_ptr[self.position], read_bytes)
+ *             self.position += read_bytes             # <<<<<<<<<<<<<<
+ *             written += read_bytes
+ *             unread -= read_bytes
+ */
+    __pyx_v_self->position = (__pyx_v_self->position + __pyx_v_read_bytes);
+
+    /* "bytehouse_driver/bufferedreader.pyx":92
+ *             memcpy(&dst[written], &buffer_ptr[self.position], read_bytes)
+ *             self.position += read_bytes
+ *             written += read_bytes             # <<<<<<<<<<<<<<
+ *             unread -= read_bytes
+ * 
+ */
+    __pyx_v_written = (__pyx_v_written + __pyx_v_read_bytes);
+
+    /* "bytehouse_driver/bufferedreader.pyx":93
+ *             self.position += read_bytes
+ *             written += read_bytes
+ *             unread -= read_bytes             # <<<<<<<<<<<<<<
+ * 
+ *         return 0
+ */
+    __pyx_v_unread = (__pyx_v_unread - __pyx_v_read_bytes);
+  }
+
+  /* "bytehouse_driver/bufferedreader.pyx":95
+ *             unread -= read_bytes
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     def read_one(self):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "bytehouse_driver/bufferedreader.pyx":77
+ *         self._read_into(&dst_ptr[offset], unread)
+ * 
+ *     cdef int _read_into(self, char* dst,             # <<<<<<<<<<<<<<
+ *                         unsigned long long unread) except -1:
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader._read_into", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bytehouse_driver/bufferedreader.pyx":97
+ *         return 0
+ * 
+ *     def read_one(self):             # <<<<<<<<<<<<<<
+ *         if self.position == self.current_buffer_size:
+ *             self.read_into_buffer()
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_11read_one(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_11read_one(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("read_one (wrapper)", 0);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_10read_one(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_10read_one(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self) {
+  unsigned char __pyx_v_rv;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_one", 0);
+
+  /* "bytehouse_driver/bufferedreader.pyx":98
+ * 
+ *     def read_one(self):
+ *         if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *             self.read_into_buffer()
+ *             self.position = 0
+ */
+  __pyx_t_1 = ((__pyx_v_self->position == __pyx_v_self->current_buffer_size) != 0);
+  if (__pyx_t_1) {
+
+    /* "bytehouse_driver/bufferedreader.pyx":99
+ *     def read_one(self):
+ *         if self.position == self.current_buffer_size:
+ *             self.read_into_buffer()             # <<<<<<<<<<<<<<
+ *             self.position = 0
+ * 
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 99, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "bytehouse_driver/bufferedreader.pyx":100
+ *         if self.position == self.current_buffer_size:
+ *             self.read_into_buffer()
+ *             self.position = 0             # <<<<<<<<<<<<<<
+ * 
+ *         rv = self.buffer[self.position]
+ */
+    __pyx_v_self->position = 0;
+
+    /* "bytehouse_driver/bufferedreader.pyx":98
+ * 
+ *     def read_one(self):
+ *         if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *             self.read_into_buffer()
+ *             self.position = 0
+ */
+  }
+
+  /* "bytehouse_driver/bufferedreader.pyx":102
+ *             self.position = 0
+ * 
+ *         rv = self.buffer[self.position]             # <<<<<<<<<<<<<<
+ *         self.position += 1
+ *         return rv
+ */
+  __pyx_t_5 = __Pyx_GetItemInt_ByteArray(__pyx_v_self->buffer, __pyx_v_self->position, unsigned PY_LONG_LONG, 0, __Pyx_PyInt_From_unsigned_PY_LONG_LONG, 0, 0, 1); if (unlikely(__pyx_t_5 == -1)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __pyx_v_rv = __pyx_t_5;
+
+  /* "bytehouse_driver/bufferedreader.pyx":103
+ * 
+ *         rv = self.buffer[self.position]
+ *         self.position += 1             # <<<<<<<<<<<<<<
+ *         return rv
+ * 
+ */
+  __pyx_v_self->position = (__pyx_v_self->position + 1);
+
+  /* "bytehouse_driver/bufferedreader.pyx":104
+ *         rv = self.buffer[self.position]
+ *         self.position += 1
+ *         return rv             # <<<<<<<<<<<<<<
+ * 
+ *     def read_strings(self, unsigned long long n_items, encoding=None):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __Pyx_PyInt_From_unsigned_char(__pyx_v_rv); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "bytehouse_driver/bufferedreader.pyx":97
+ *         return 0
+ * 
+ *     def read_one(self):             # <<<<<<<<<<<<<<
+ *         if self.position == self.current_buffer_size:
+ *             self.read_into_buffer()
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_one", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bytehouse_driver/bufferedreader.pyx":106
+ *         return rv
+ * 
+ *     def read_strings(self, unsigned long long n_items, encoding=None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Python has great overhead between function calls.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_13read_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_16bytehouse_driver_14bufferedreader_14BufferedReader_12read_strings[] = "\n        Python has great overhead between function calls.\n        We inline strings reading logic here to avoid this overhead.\n        ";
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_13read_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  unsigned PY_LONG_LONG __pyx_v_n_items;
+  PyObject *__pyx_v_encoding = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("read_strings (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_n_items,&__pyx_n_s_encoding,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_n_items)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_encoding);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "read_strings") < 0)) __PYX_ERR(0, 106, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_n_items = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_n_items == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 106, __pyx_L3_error)
+    __pyx_v_encoding = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("read_strings", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 106, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_12read_strings(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items, __pyx_v_encoding);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_12read_strings(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items, PyObject *__pyx_v_encoding) {
+  PyObject *__pyx_v_items = NULL;
+  unsigned PY_LONG_LONG __pyx_v_i;
+  char *__pyx_v_buffer_ptr;
+  unsigned PY_LONG_LONG __pyx_v_right;
+  unsigned PY_LONG_LONG __pyx_v_size;
+  unsigned PY_LONG_LONG __pyx_v_shift;
+  unsigned PY_LONG_LONG __pyx_v_bytes_read;
+  unsigned PY_LONG_LONG __pyx_v_b;
+  char *__pyx_v_c_string;
+  unsigned PY_LONG_LONG __pyx_v_c_string_size;
+  char *__pyx_v_c_encoding;
+  PyObject *__pyx_v_rv = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  char *__pyx_t_5;
+  unsigned PY_LONG_LONG __pyx_t_6;
+  unsigned PY_LONG_LONG __pyx_t_7;
+  unsigned PY_LONG_LONG __pyx_t_8;
+  unsigned PY_LONG_LONG __pyx_t_9;
+  unsigned PY_LONG_LONG __pyx_t_10;
+  unsigned PY_LONG_LONG __pyx_t_11;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  int __pyx_t_15;
+  PyObject *__pyx_t_16 = NULL;
+  int __pyx_t_17;
+  char const *__pyx_t_18;
+  PyObject *__pyx_t_19 = NULL;
+  PyObject *__pyx_t_20 = NULL;
+  PyObject *__pyx_t_21 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_strings", 0);
+  __Pyx_INCREF(__pyx_v_encoding);
+
+  /* "bytehouse_driver/bufferedreader.pyx":111
+ *         We inline strings reading logic here to avoid this overhead.
+ *         """
+ *         items = PyTuple_New(n_items)             # <<<<<<<<<<<<<<
+ * 
+ *         cdef unsigned long long i
+ */
+  __pyx_t_1 = PyTuple_New(__pyx_v_n_items); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_items = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "bytehouse_driver/bufferedreader.pyx":115
+ *         cdef unsigned long long i
+ *         # Buffer vars
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long right
+ *         # String length vars
+ */
+  __pyx_t_1 = __pyx_v_self->buffer;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "bytehouse_driver/bufferedreader.pyx":122
+ * 
+ *         # String for decode vars.
+ *         cdef char *c_string = NULL             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long c_string_size = 1024
+ *         cdef char *c_encoding = NULL
+ */
+  __pyx_v_c_string = NULL;
+
+  /* "bytehouse_driver/bufferedreader.pyx":123
+ *         # String for decode vars.
+ *         cdef char *c_string = NULL
+ *         cdef unsigned long long c_string_size = 1024             # <<<<<<<<<<<<<<
+ *         cdef char *c_encoding = NULL
+ *         if encoding:
+ */
+  __pyx_v_c_string_size = 0x400;
+
+  /* "bytehouse_driver/bufferedreader.pyx":124
+ *         cdef char *c_string = NULL
+ *         cdef unsigned long long c_string_size = 1024
+ *         cdef char *c_encoding = NULL             # <<<<<<<<<<<<<<
+ *         if encoding:
+ *             encoding = encoding.encode('utf-8')
+ */
+  __pyx_v_c_encoding = NULL;
+
+  /* "bytehouse_driver/bufferedreader.pyx":125
+ *         cdef unsigned long long c_string_size = 1024
+ *         cdef char *c_encoding = NULL
+ *         if encoding:             # <<<<<<<<<<<<<<
+ *             encoding = encoding.encode('utf-8')
+ *             c_encoding = encoding
+ */
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_encoding); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 125, __pyx_L1_error)
+  if (__pyx_t_2) {
+
+    /* "bytehouse_driver/bufferedreader.pyx":126
+ *         cdef char *c_encoding = NULL
+ *         if encoding:
+ *             encoding = encoding.encode('utf-8')             # <<<<<<<<<<<<<<
+ *             c_encoding = encoding
+ * 
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 126, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_u_utf_8) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_u_utf_8);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 126, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF_SET(__pyx_v_encoding, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "bytehouse_driver/bufferedreader.pyx":127
+ *         if encoding:
+ *             encoding = encoding.encode('utf-8')
+ *             c_encoding = encoding             # <<<<<<<<<<<<<<
+ * 
+ *         cdef object rv = object()
+ */
+    __pyx_t_5 = __Pyx_PyObject_AsWritableString(__pyx_v_encoding); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 127, __pyx_L1_error)
+    __pyx_v_c_encoding = __pyx_t_5;
+
+    /* "bytehouse_driver/bufferedreader.pyx":125
+ *         cdef unsigned long long c_string_size = 1024
+ *         cdef char *c_encoding = NULL
+ *         if encoding:             # <<<<<<<<<<<<<<
+ *             encoding = encoding.encode('utf-8')
+ *             c_encoding = encoding
+ */
+  }
+
+  /* "bytehouse_driver/bufferedreader.pyx":129
+ *             c_encoding = encoding
+ * 
+ *         cdef object rv = object()             # <<<<<<<<<<<<<<
+ *         # String for decode vars.
+ *         if c_encoding:
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_builtin_object); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_rv = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "bytehouse_driver/bufferedreader.pyx":131
+ *         cdef object rv = object()
+ *         # String for decode vars.
+ *         if c_encoding:             # <<<<<<<<<<<<<<
+ *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_c_encoding != 0);
+  if (__pyx_t_2) {
+
+    /* "bytehouse_driver/bufferedreader.pyx":132
+ *         # String for decode vars.
+ *         if c_encoding:
+ *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)             # <<<<<<<<<<<<<<
+ * 
+ *         try:
+ */
+    __pyx_v_c_string = ((char *)PyMem_Realloc(NULL, __pyx_v_c_string_size));
+
+    /* "bytehouse_driver/bufferedreader.pyx":131
+ *         cdef object rv = object()
+ *         # String for decode vars.
+ *         if c_encoding:             # <<<<<<<<<<<<<<
+ *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)
+ * 
+ */
+  }
+
+  /* "bytehouse_driver/bufferedreader.pyx":134
+ *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)
+ * 
+ *         try:             # <<<<<<<<<<<<<<
+ *             for i in range(n_items):
+ *                 shift = size = 0
+ */
+  /*try:*/ {
+
+    /* "bytehouse_driver/bufferedreader.pyx":135
+ * 
+ *         try:
+ *             for i in range(n_items):             # <<<<<<<<<<<<<<
+ *                 shift = size = 0
+ * 
+ */
+    __pyx_t_6 = __pyx_v_n_items;
+    __pyx_t_7 = __pyx_t_6;
+    for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+      __pyx_v_i = __pyx_t_8;
+
+      /* "bytehouse_driver/bufferedreader.pyx":136
+ *         try:
+ *             for i in range(n_items):
+ *                 shift = size = 0             # <<<<<<<<<<<<<<
+ * 
+ *                 # Read string size
+ */
+      __pyx_v_shift = 0;
+      __pyx_v_size = 0;
+
+      /* "bytehouse_driver/bufferedreader.pyx":139
+ * 
+ *                 # Read string size
+ *                 while True:             # <<<<<<<<<<<<<<
+ *                     if self.position == self.current_buffer_size:
+ *                         self.read_into_buffer()
+ */
+      while (1) {
+
+        /* "bytehouse_driver/bufferedreader.pyx":140
+ *                 # Read string size
+ *                 while True:
+ *                     if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                         self.read_into_buffer()
+ *                         # `read_into_buffer` can override buffer
+ */
+        __pyx_t_2 = ((__pyx_v_self->position == __pyx_v_self->current_buffer_size) != 0);
+        if (__pyx_t_2) {
+
+          /* "bytehouse_driver/bufferedreader.pyx":141
+ *                 while True:
+ *                     if self.position == self.current_buffer_size:
+ *                         self.read_into_buffer()             # <<<<<<<<<<<<<<
+ *                         # `read_into_buffer` can override buffer
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ */
+          __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 141, __pyx_L6_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __pyx_t_4 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+            __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+            if (likely(__pyx_t_4)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+              __Pyx_INCREF(__pyx_t_4);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_3, function);
+            }
+          }
+          __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L6_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+          /* "bytehouse_driver/bufferedreader.pyx":143
+ *                         self.read_into_buffer()
+ *                         # `read_into_buffer` can override buffer
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *                         self.position = 0
+ * 
+ */
+          __pyx_t_1 = __pyx_v_self->buffer;
+          __Pyx_INCREF(__pyx_t_1);
+          __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+          /* "bytehouse_driver/bufferedreader.pyx":144
+ *                         # `read_into_buffer` can override buffer
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                         self.position = 0             # <<<<<<<<<<<<<<
+ * 
+ *                     b = buffer_ptr[self.position]
+ */
+          __pyx_v_self->position = 0;
+
+          /* "bytehouse_driver/bufferedreader.pyx":140
+ *                 # Read string size
+ *                 while True:
+ *                     if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                         self.read_into_buffer()
+ *                         # `read_into_buffer` can override buffer
+ */
+        }
+
+        /* "bytehouse_driver/bufferedreader.pyx":146
+ *                         self.position = 0
+ * 
+ *                     b = buffer_ptr[self.position]             # <<<<<<<<<<<<<<
+ *                     self.position += 1
+ * 
+ */
+        __pyx_v_b = (__pyx_v_buffer_ptr[__pyx_v_self->position]);
+
+        /* "bytehouse_driver/bufferedreader.pyx":147
+ * 
+ *                     b = buffer_ptr[self.position]
+ *                     self.position += 1             # <<<<<<<<<<<<<<
+ * 
+ *                     size |= (b & 0x7f) << shift
+ */
+        __pyx_v_self->position = (__pyx_v_self->position + 1);
+
+        /* "bytehouse_driver/bufferedreader.pyx":149
+ *                     self.position += 1
+ * 
+ *                     size |= (b & 0x7f) << shift             # <<<<<<<<<<<<<<
+ *                     if b < 0x80:
+ *                         break
+ */
+        __pyx_v_size = (__pyx_v_size | ((__pyx_v_b & 0x7f) << __pyx_v_shift));
+
+        /* "bytehouse_driver/bufferedreader.pyx":150
+ * 
+ *                     size |= (b & 0x7f) << shift
+ *                     if b < 0x80:             # <<<<<<<<<<<<<<
+ *                         break
+ * 
+ */
+        __pyx_t_2 = ((__pyx_v_b < 0x80) != 0);
+        if (__pyx_t_2) {
+
+          /* "bytehouse_driver/bufferedreader.pyx":151
+ *                     size |= (b & 0x7f) << shift
+ *                     if b < 0x80:
+ *                         break             # <<<<<<<<<<<<<<
+ * 
+ *                     shift += 7
+ */
+          goto __pyx_L11_break;
+
+          /* "bytehouse_driver/bufferedreader.pyx":150
+ * 
+ *                     size |= (b & 0x7f) << shift
+ *                     if b < 0x80:             # <<<<<<<<<<<<<<
+ *                         break
+ * 
+ */
+        }
+
+        /* "bytehouse_driver/bufferedreader.pyx":153
+ *                         break
+ * 
+ *                     shift += 7             # <<<<<<<<<<<<<<
+ * 
+ *                 right = self.position + size
+ */
+        __pyx_v_shift = (__pyx_v_shift + 7);
+      }
+      __pyx_L11_break:;
+
+      /* "bytehouse_driver/bufferedreader.pyx":155
+ *                     shift += 7
+ * 
+ *                 right = self.position + size             # <<<<<<<<<<<<<<
+ * 
+ *                 if c_encoding:
+ */
+      __pyx_v_right = (__pyx_v_self->position + __pyx_v_size);
+
+      /* "bytehouse_driver/bufferedreader.pyx":157
+ *                 right = self.position + size
+ * 
+ *                 if c_encoding:             # <<<<<<<<<<<<<<
+ *                     if size + 1 > c_string_size:
+ *                         c_string_size = size + 1
+ */
+      __pyx_t_2 = (__pyx_v_c_encoding != 0);
+      if (__pyx_t_2) {
+
+        /* "bytehouse_driver/bufferedreader.pyx":158
+ * 
+ *                 if c_encoding:
+ *                     if size + 1 > c_string_size:             # <<<<<<<<<<<<<<
+ *                         c_string_size = size + 1
+ *                         c_string = <char *> PyMem_Realloc(
+ */
+        __pyx_t_2 = (((__pyx_v_size + 1) > __pyx_v_c_string_size) != 0);
+        if (__pyx_t_2) {
+
+          /* "bytehouse_driver/bufferedreader.pyx":159
+ *                 if c_encoding:
+ *                     if size + 1 > c_string_size:
+ *                         c_string_size = size + 1             # <<<<<<<<<<<<<<
+ *                         c_string = <char *> PyMem_Realloc(
+ *                             c_string, c_string_size
+ */
+          __pyx_v_c_string_size = (__pyx_v_size + 1);
+
+          /* "bytehouse_driver/bufferedreader.pyx":160
+ *                     if size + 1 > c_string_size:
+ *                         c_string_size = size + 1
+ *                         c_string = <char *> PyMem_Realloc(             # <<<<<<<<<<<<<<
+ *                             c_string, c_string_size
+ *                         )
+ */
+          __pyx_v_c_string = ((char *)PyMem_Realloc(__pyx_v_c_string, __pyx_v_c_string_size));
+
+          /* "bytehouse_driver/bufferedreader.pyx":163
+ *                             c_string, c_string_size
+ *                         )
+ *                         if c_string is NULL:             # <<<<<<<<<<<<<<
+ *                             raise MemoryError()
+ *                     c_string[size] = 0
+ */
+          __pyx_t_2 = ((__pyx_v_c_string == NULL) != 0);
+          if (unlikely(__pyx_t_2)) {
+
+            /* "bytehouse_driver/bufferedreader.pyx":164
+ *                         )
+ *                         if c_string is NULL:
+ *                             raise MemoryError()             # <<<<<<<<<<<<<<
+ *                     c_string[size] = 0
+ *                     bytes_read = 0
+ */
+            PyErr_NoMemory(); __PYX_ERR(0, 164, __pyx_L6_error)
+
+            /* "bytehouse_driver/bufferedreader.pyx":163
+ *                             c_string, c_string_size
+ *                         )
+ *                         if c_string is NULL:             # <<<<<<<<<<<<<<
+ *                             raise MemoryError()
+ *                     c_string[size] = 0
+ */
+          }
+
+          /* "bytehouse_driver/bufferedreader.pyx":158
+ * 
+ *                 if c_encoding:
+ *                     if size + 1 > c_string_size:             # <<<<<<<<<<<<<<
+ *                         c_string_size = size + 1
+ *                         c_string = <char *> PyMem_Realloc(
+ */
+        }
+
+        /* "bytehouse_driver/bufferedreader.pyx":165
+ *                         if c_string is NULL:
+ *                             raise MemoryError()
+ *                     c_string[size] = 0             # <<<<<<<<<<<<<<
+ *                     bytes_read = 0
+ * 
+ */
+        (__pyx_v_c_string[__pyx_v_size]) = 0;
+
+        /* "bytehouse_driver/bufferedreader.pyx":166
+ *                             raise MemoryError()
+ *                     c_string[size] = 0
+ *                     bytes_read = 0             # <<<<<<<<<<<<<<
+ * 
+ *                 # Decoding pure c strings in Cython is faster than in pure
+ */
+        __pyx_v_bytes_read = 0;
+
+        /* "bytehouse_driver/bufferedreader.pyx":157
+ *                 right = self.position + size
+ * 
+ *                 if c_encoding:             # <<<<<<<<<<<<<<
+ *                     if size + 1 > c_string_size:
+ *                         c_string_size = size + 1
+ */
+      }
+
+      /* "bytehouse_driver/bufferedreader.pyx":171
+ *                 # Python. We need to copy it into buffer for adding null
+ *                 # symbol at the end. In ByteHouse block there is no null
+ *                 if right > self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                     if c_encoding:
+ *                         memcpy(&c_string[bytes_read],
+ */
+      __pyx_t_2 = ((__pyx_v_right > __pyx_v_self->current_buffer_size) != 0);
+      if (__pyx_t_2) {
+
+        /* "bytehouse_driver/bufferedreader.pyx":172
+ *                 # symbol at the end. In ByteHouse block there is no null
+ *                 if right > self.current_buffer_size:
+ *                     if c_encoding:             # <<<<<<<<<<<<<<
+ *                         memcpy(&c_string[bytes_read],
+ *                                &buffer_ptr[self.position],
+ */
+        __pyx_t_2 = (__pyx_v_c_encoding != 0);
+        if (__pyx_t_2) {
+
+          /* "bytehouse_driver/bufferedreader.pyx":173
+ *                 if right > self.current_buffer_size:
+ *                     if c_encoding:
+ *                         memcpy(&c_string[bytes_read],             # <<<<<<<<<<<<<<
+ *                                &buffer_ptr[self.position],
+ *                                self.current_buffer_size - self.position)
+ */
+          (void)(memcpy((&(__pyx_v_c_string[__pyx_v_bytes_read])), (&(__pyx_v_buffer_ptr[__pyx_v_self->position])), (__pyx_v_self->current_buffer_size - __pyx_v_self->position)));
+
+          /* "bytehouse_driver/bufferedreader.pyx":172
+ *                 # symbol at the end. In ByteHouse block there is no null
+ *                 if right > self.current_buffer_size:
+ *                     if c_encoding:             # <<<<<<<<<<<<<<
+ *                         memcpy(&c_string[bytes_read],
+ *                                &buffer_ptr[self.position],
+ */
+          goto __pyx_L18;
+        }
+
+        /* "bytehouse_driver/bufferedreader.pyx":177
+ *                                self.current_buffer_size - self.position)
+ *                     else:
+ *                         rv = PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *                             &buffer_ptr[self.position],
+ *                             self.current_buffer_size - self.position
+ */
+        /*else*/ {
+
+          /* "bytehouse_driver/bufferedreader.pyx":179
+ *                         rv = PyBytes_FromStringAndSize(
+ *                             &buffer_ptr[self.position],
+ *                             self.current_buffer_size - self.position             # <<<<<<<<<<<<<<
+ *                         )
+ * 
+ */
+          __pyx_t_1 = PyBytes_FromStringAndSize((&(__pyx_v_buffer_ptr[__pyx_v_self->position])), (__pyx_v_self->current_buffer_size - __pyx_v_self->position)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 177, __pyx_L6_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_1);
+          __pyx_t_1 = 0;
+        }
+        __pyx_L18:;
+
+        /* "bytehouse_driver/bufferedreader.pyx":182
+ *                         )
+ * 
+ *                     bytes_read = self.current_buffer_size - self.position             # <<<<<<<<<<<<<<
+ *                     # Read the rest of the string.
+ *                     while bytes_read != size:
+ */
+        __pyx_v_bytes_read = (__pyx_v_self->current_buffer_size - __pyx_v_self->position);
+
+        /* "bytehouse_driver/bufferedreader.pyx":184
+ *                     bytes_read = self.current_buffer_size - self.position
+ *                     # Read the rest of the string.
+ *                     while bytes_read != size:             # <<<<<<<<<<<<<<
+ *                         self.position = size - bytes_read
+ * 
+ */
+        while (1) {
+          __pyx_t_2 = ((__pyx_v_bytes_read != __pyx_v_size) != 0);
+          if (!__pyx_t_2) break;
+
+          /* "bytehouse_driver/bufferedreader.pyx":185
+ *                     # Read the rest of the string.
+ *                     while bytes_read != size:
+ *                         self.position = size - bytes_read             # <<<<<<<<<<<<<<
+ * 
+ *                         self.read_into_buffer()
+ */
+          __pyx_v_self->position = (__pyx_v_size - __pyx_v_bytes_read);
+
+          /* "bytehouse_driver/bufferedreader.pyx":187
+ *                         self.position = size - bytes_read
+ * 
+ *                         self.read_into_buffer()             # <<<<<<<<<<<<<<
+ *                         # `read_into_buffer` can override buffer
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ */
+          __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 187, __pyx_L6_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __pyx_t_4 = NULL;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+            __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+            if (likely(__pyx_t_4)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+              __Pyx_INCREF(__pyx_t_4);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_3, function);
+            }
+          }
+          __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L6_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+          /* "bytehouse_driver/bufferedreader.pyx":189
+ *                         self.read_into_buffer()
+ *                         # `read_into_buffer` can override buffer
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *                         # There can be not enough data in buffer.
+ *                         self.position = min(
+ */
+          __pyx_t_1 = __pyx_v_self->buffer;
+          __Pyx_INCREF(__pyx_t_1);
+          __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+          /* "bytehouse_driver/bufferedreader.pyx":192
+ *                         # There can be not enough data in buffer.
+ *                         self.position = min(
+ *                             self.position, self.current_buffer_size             # <<<<<<<<<<<<<<
+ *                         )
+ *                         if c_encoding:
+ */
+          __pyx_t_9 = __pyx_v_self->current_buffer_size;
+          __pyx_t_10 = __pyx_v_self->position;
+          if (((__pyx_t_9 < __pyx_t_10) != 0)) {
+            __pyx_t_11 = __pyx_t_9;
+          } else {
+            __pyx_t_11 = __pyx_t_10;
+          }
+
+          /* "bytehouse_driver/bufferedreader.pyx":191
+ *                         buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                         # There can be not enough data in buffer.
+ *                         self.position = min(             # <<<<<<<<<<<<<<
+ *                             self.position, self.current_buffer_size
+ *                         )
+ */
+          __pyx_v_self->position = __pyx_t_11;
+
+          /* "bytehouse_driver/bufferedreader.pyx":194
+ *                             self.position, self.current_buffer_size
+ *                         )
+ *                         if c_encoding:             # <<<<<<<<<<<<<<
+ *                             memcpy(
+ *                                 &c_string[bytes_read], buffer_ptr,
+ */
+          __pyx_t_2 = (__pyx_v_c_encoding != 0);
+          if (__pyx_t_2) {
+
+            /* "bytehouse_driver/bufferedreader.pyx":195
+ *                         )
+ *                         if c_encoding:
+ *                             memcpy(             # <<<<<<<<<<<<<<
+ *                                 &c_string[bytes_read], buffer_ptr,
+ *                                 self.position
+ */
+            (void)(memcpy((&(__pyx_v_c_string[__pyx_v_bytes_read])), __pyx_v_buffer_ptr, __pyx_v_self->position));
+
+            /* "bytehouse_driver/bufferedreader.pyx":194
+ *                             self.position, self.current_buffer_size
+ *                         )
+ *                         if c_encoding:             # <<<<<<<<<<<<<<
+ *                             memcpy(
+ *                                 &c_string[bytes_read], buffer_ptr,
+ */
+            goto __pyx_L21;
+          }
+
+          /* "bytehouse_driver/bufferedreader.pyx":200
+ *                             )
+ *                         else:
+ *                             rv += PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *                                 buffer_ptr, self.position
+ *                             )
+ */
+          /*else*/ {
+
+            /* "bytehouse_driver/bufferedreader.pyx":201
+ *                         else:
+ *                             rv += PyBytes_FromStringAndSize(
+ *                                 buffer_ptr, self.position             # <<<<<<<<<<<<<<
+ *                             )
+ *                         bytes_read += self.position
+ */
+            __pyx_t_1 = PyBytes_FromStringAndSize(__pyx_v_buffer_ptr, __pyx_v_self->position); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 200, __pyx_L6_error)
+            __Pyx_GOTREF(__pyx_t_1);
+
+            /* "bytehouse_driver/bufferedreader.pyx":200
+ *                             )
+ *                         else:
+ *                             rv += PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *                                 buffer_ptr, self.position
+ *                             )
+ */
+            __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_v_rv, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L6_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+            __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_3);
+            __pyx_t_3 = 0;
+          }
+          __pyx_L21:;
+
+          /* "bytehouse_driver/bufferedreader.pyx":203
+ *                                 buffer_ptr, self.position
+ *                             )
+ *                         bytes_read += self.position             # <<<<<<<<<<<<<<
+ * 
+ *                 else:
+ */
+          __pyx_v_bytes_read = (__pyx_v_bytes_read + __pyx_v_self->position);
+        }
+
+        /* "bytehouse_driver/bufferedreader.pyx":171
+ *                 # Python. We need to copy it into buffer for adding null
+ *                 # symbol at the end. In ByteHouse block there is no null
+ *                 if right > self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                     if c_encoding:
+ *                         memcpy(&c_string[bytes_read],
+ */
+        goto __pyx_L17;
+      }
+
+      /* "bytehouse_driver/bufferedreader.pyx":206
+ * 
+ *                 else:
+ *                     if c_encoding:             # <<<<<<<<<<<<<<
+ *                         memcpy(c_string, &buffer_ptr[self.position], size)
+ *                     else:
+ */
+      /*else*/ {
+        __pyx_t_2 = (__pyx_v_c_encoding != 0);
+        if (__pyx_t_2) {
+
+          /* "bytehouse_driver/bufferedreader.pyx":207
+ *                 else:
+ *                     if c_encoding:
+ *                         memcpy(c_string, &buffer_ptr[self.position], size)             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         rv = PyBytes_FromStringAndSize(
+ */
+          (void)(memcpy(__pyx_v_c_string, (&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_size));
+
+          /* "bytehouse_driver/bufferedreader.pyx":206
+ * 
+ *                 else:
+ *                     if c_encoding:             # <<<<<<<<<<<<<<
+ *                         memcpy(c_string, &buffer_ptr[self.position], size)
+ *                     else:
+ */
+          goto __pyx_L22;
+        }
+
+        /* "bytehouse_driver/bufferedreader.pyx":209
+ *                         memcpy(c_string, &buffer_ptr[self.position], size)
+ *                     else:
+ *                         rv = PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *                             &buffer_ptr[self.position], size
+ *                         )
+ */
+        /*else*/ {
+
+          /* "bytehouse_driver/bufferedreader.pyx":210
+ *                     else:
+ *                         rv = PyBytes_FromStringAndSize(
+ *                             &buffer_ptr[self.position], size             # <<<<<<<<<<<<<<
+ *                         )
+ *                     self.position = right
+ */
+          __pyx_t_3 = PyBytes_FromStringAndSize((&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 209, __pyx_L6_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_3);
+          __pyx_t_3 = 0;
+        }
+        __pyx_L22:;
+
+        /* "bytehouse_driver/bufferedreader.pyx":212
+ *                             &buffer_ptr[self.position], size
+ *                         )
+ *                     self.position = right             # <<<<<<<<<<<<<<
+ * 
+ *                 if c_encoding:
+ */
+        __pyx_v_self->position = __pyx_v_right;
+      }
+      __pyx_L17:;
+
+      /* "bytehouse_driver/bufferedreader.pyx":214
+ *                     self.position = right
+ * 
+ *                 if c_encoding:             # <<<<<<<<<<<<<<
+ *                     try:
+ *                         rv = c_string[:size].decode(c_encoding)
+ */
+      __pyx_t_2 = (__pyx_v_c_encoding != 0);
+      if (__pyx_t_2) {
+
+        /* "bytehouse_driver/bufferedreader.pyx":215
+ * 
+ *                 if c_encoding:
+ *                     try:             # <<<<<<<<<<<<<<
+ *                         rv = c_string[:size].decode(c_encoding)
+ *                     except UnicodeDecodeError:
+ */
+        {
+          __Pyx_PyThreadState_declare
+          __Pyx_PyThreadState_assign
+          __Pyx_ExceptionSave(&__pyx_t_12, &__pyx_t_13, &__pyx_t_14);
+          __Pyx_XGOTREF(__pyx_t_12);
+          __Pyx_XGOTREF(__pyx_t_13);
+          __Pyx_XGOTREF(__pyx_t_14);
+          /*try:*/ {
+
+            /* "bytehouse_driver/bufferedreader.pyx":216
+ *                 if c_encoding:
+ *                     try:
+ *                         rv = c_string[:size].decode(c_encoding)             # <<<<<<<<<<<<<<
+ *                     except UnicodeDecodeError:
+ *                         rv = PyBytes_FromStringAndSize(c_string, size)
+ */
+            __pyx_t_3 = __Pyx_decode_c_string(__pyx_v_c_string, 0, __pyx_v_size, __pyx_v_c_encoding, NULL, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 216, __pyx_L24_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_3);
+            __pyx_t_3 = 0;
+
+            /* "bytehouse_driver/bufferedreader.pyx":215
+ * 
+ *                 if c_encoding:
+ *                     try:             # <<<<<<<<<<<<<<
+ *                         rv = c_string[:size].decode(c_encoding)
+ *                     except UnicodeDecodeError:
+ */
+          }
+          __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+          __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+          __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+          goto __pyx_L31_try_end;
+          __pyx_L24_error:;
+          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+          /* "bytehouse_driver/bufferedreader.pyx":217
+ *                     try:
+ *                         rv = c_string[:size].decode(c_encoding)
+ *                     except UnicodeDecodeError:             # <<<<<<<<<<<<<<
+ *                         rv = PyBytes_FromStringAndSize(c_string, size)
+ * 
+ */
+          __pyx_t_15 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_UnicodeDecodeError);
+          if (__pyx_t_15) {
+            __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+            if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_1, &__pyx_t_4) < 0) __PYX_ERR(0, 217, __pyx_L26_except_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_GOTREF(__pyx_t_1);
+            __Pyx_GOTREF(__pyx_t_4);
+
+            /* "bytehouse_driver/bufferedreader.pyx":218
+ *                         rv = c_string[:size].decode(c_encoding)
+ *                     except UnicodeDecodeError:
+ *                         rv = PyBytes_FromStringAndSize(c_string, size)             # <<<<<<<<<<<<<<
+ * 
+ *                 Py_INCREF(rv)
+ */
+            __pyx_t_16 = PyBytes_FromStringAndSize(__pyx_v_c_string, __pyx_v_size); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 218, __pyx_L26_except_error)
+            __Pyx_GOTREF(__pyx_t_16);
+            __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_16);
+            __pyx_t_16 = 0;
+            __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+            __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+            __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+            goto __pyx_L25_exception_handled;
+          }
+          goto __pyx_L26_except_error;
+          __pyx_L26_except_error:;
+
+          /* "bytehouse_driver/bufferedreader.pyx":215
+ * 
+ *                 if c_encoding:
+ *                     try:             # <<<<<<<<<<<<<<
+ *                         rv = c_string[:size].decode(c_encoding)
+ *                     except UnicodeDecodeError:
+ */
+          __Pyx_XGIVEREF(__pyx_t_12);
+          __Pyx_XGIVEREF(__pyx_t_13);
+          __Pyx_XGIVEREF(__pyx_t_14);
+          __Pyx_ExceptionReset(__pyx_t_12, __pyx_t_13, __pyx_t_14);
+          goto __pyx_L6_error;
+          __pyx_L25_exception_handled:;
+          __Pyx_XGIVEREF(__pyx_t_12);
+          __Pyx_XGIVEREF(__pyx_t_13);
+          __Pyx_XGIVEREF(__pyx_t_14);
+          __Pyx_ExceptionReset(__pyx_t_12, __pyx_t_13, __pyx_t_14);
+          __pyx_L31_try_end:;
+        }
+
+        /* "bytehouse_driver/bufferedreader.pyx":214
+ *                     self.position = right
+ * 
+ *                 if c_encoding:             # <<<<<<<<<<<<<<
+ *                     try:
+ *                         rv = c_string[:size].decode(c_encoding)
+ */
+      }
+
+      /* "bytehouse_driver/bufferedreader.pyx":220
+ *                         rv = PyBytes_FromStringAndSize(c_string, size)
+ * 
+ *                 Py_INCREF(rv)             # <<<<<<<<<<<<<<
+ *                 PyTuple_SET_ITEM(items, i, rv)
+ * 
+ */
+      Py_INCREF(__pyx_v_rv);
+
+      /* "bytehouse_driver/bufferedreader.pyx":221
+ * 
+ *                 Py_INCREF(rv)
+ *                 PyTuple_SET_ITEM(items, i, rv)             # <<<<<<<<<<<<<<
+ * 
+ *         finally:
+ */
+      PyTuple_SET_ITEM(__pyx_v_items, __pyx_v_i, __pyx_v_rv);
+    }
+  }
+
+  /* "bytehouse_driver/bufferedreader.pyx":225
+ *         finally:
+ *             # Reading can be interrupted by buffer refill error.
+ *             if c_string:             # <<<<<<<<<<<<<<
+ *                 PyMem_Free(c_string)
+ * 
+ */
+  /*finally:*/ {
+    /*normal exit:*/{
+      __pyx_t_2 = (__pyx_v_c_string != 0);
+      if (__pyx_t_2) {
+
+        /* "bytehouse_driver/bufferedreader.pyx":226
+ *             # Reading can be interrupted by buffer refill error.
+ *             if c_string:
+ *                 PyMem_Free(c_string)             # <<<<<<<<<<<<<<
+ * 
+ *         return items
+ */
+        PyMem_Free(__pyx_v_c_string);
+
+        /* "bytehouse_driver/bufferedreader.pyx":225
+ *         finally:
+ *             # Reading can be interrupted by buffer refill error.
+ *             if c_string:             # <<<<<<<<<<<<<<
+ *                 PyMem_Free(c_string)
+ * 
+ */
+      }
+      goto __pyx_L7;
+    }
+    __pyx_L6_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_14 = 0; __pyx_t_13 = 0; __pyx_t_12 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0; __pyx_t_21 = 0;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_16); __pyx_t_16 = 0;
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_19, &__pyx_t_20, &__pyx_t_21);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_14, &__pyx_t_13, &__pyx_t_12) < 0)) __Pyx_ErrFetch(&__pyx_t_14, &__pyx_t_13, &__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_14);
+      __Pyx_XGOTREF(__pyx_t_13);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_19);
+      __Pyx_XGOTREF(__pyx_t_20);
+      __Pyx_XGOTREF(__pyx_t_21);
+      __pyx_t_15 = __pyx_lineno; __pyx_t_17 = __pyx_clineno; __pyx_t_18 = __pyx_filename;
+      {
+        __pyx_t_2 = (__pyx_v_c_string != 0);
+        if (__pyx_t_2) {
+
+          /* "bytehouse_driver/bufferedreader.pyx":226
+ *             # Reading can be interrupted by buffer refill error.
+ *             if c_string:
+ *                 PyMem_Free(c_string)             # <<<<<<<<<<<<<<
+ * 
+ *         return items
+ */
+          PyMem_Free(__pyx_v_c_string);
+
+          /* "bytehouse_driver/bufferedreader.pyx":225
+ *         finally:
+ *             # Reading can be interrupted by buffer refill error.
+ *             if c_string:             # <<<<<<<<<<<<<<
+ *                 PyMem_Free(c_string)
+ * 
+ */
+        }
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_19);
+        __Pyx_XGIVEREF(__pyx_t_20);
+        __Pyx_XGIVEREF(__pyx_t_21);
+        __Pyx_ExceptionReset(__pyx_t_19, __pyx_t_20, __pyx_t_21);
+      }
+      __Pyx_XGIVEREF(__pyx_t_14);
+      __Pyx_XGIVEREF(__pyx_t_13);
+      __Pyx_XGIVEREF(__pyx_t_12);
+      __Pyx_ErrRestore(__pyx_t_14, __pyx_t_13, __pyx_t_12);
+      __pyx_t_14 = 0; __pyx_t_13 = 0; __pyx_t_12 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0; __pyx_t_21 = 0;
+      __pyx_lineno = __pyx_t_15; __pyx_clineno = __pyx_t_17; __pyx_filename = __pyx_t_18;
+      goto __pyx_L1_error;
+    }
+    __pyx_L7:;
+  }
+
+  /* "bytehouse_driver/bufferedreader.pyx":228
+ *                 PyMem_Free(c_string)
+ * 
+ *         return items             # <<<<<<<<<<<<<<
+ * 
+ *     def read_string_buffers(self, unsigned long long n_items):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_items);
+  __pyx_r = __pyx_v_items;
+  goto __pyx_L0;
+
+  /* "bytehouse_driver/bufferedreader.pyx":106
+ *         return rv
+ * 
+ *     def read_strings(self, unsigned long long n_items, encoding=None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Python has great overhead between function calls.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_one", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_items);
+  __Pyx_XDECREF(__pyx_v_rv);
+  __Pyx_XDECREF(__pyx_v_encoding);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedreader.pyx":62
- *         return rv
+/* "bytehouse_driver/bufferedreader.pyx":230
+ *         return items
  * 
- *     def read_strings(self, unsigned long long n_items, encoding=None):             # <<<<<<<<<<<<<<
+ *     def read_string_buffers(self, unsigned long long n_items):             # <<<<<<<<<<<<<<
  *         """
- *         Python has great overhead between function calls.
+ *         Reads strings into Arrow-compatible buffers without creating string
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_9read_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_16bytehouse_driver_14bufferedreader_14BufferedReader_8read_strings[] = "\n        Python has great overhead between function calls.\n        We inline strings reading logic here to avoid this overhead.\n        ";
-static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_9read_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_15read_string_buffers(PyObject *__pyx_v_self, PyObject *__pyx_arg_n_items); /*proto*/
+static char __pyx_doc_16bytehouse_driver_14bufferedreader_14BufferedReader_14read_string_buffers[] = "\n        Reads strings into Arrow-compatible buffers without creating string\n        objects.\n\n        :return: tuple of offsets and data bytearrays and flag whether\n                 offsets are int64. Offsets are ``n_items + 1`` int32 values\n                 or int64 values if data exceeds 2 GiB.\n        ";
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_15read_string_buffers(PyObject *__pyx_v_self, PyObject *__pyx_arg_n_items) {
   unsigned PY_LONG_LONG __pyx_v_n_items;
-  PyObject *__pyx_v_encoding = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("read_strings (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_n_items,&__pyx_n_s_encoding,0};
-    PyObject* values[2] = {0,0};
-    values[1] = ((PyObject *)Py_None);
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_n_items)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_encoding);
-          if (value) { values[1] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "read_strings") < 0)) __PYX_ERR(0, 62, __pyx_L3_error)
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    __pyx_v_n_items = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_n_items == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 62, __pyx_L3_error)
-    __pyx_v_encoding = values[1];
+  __Pyx_RefNannySetupContext("read_string_buffers (wrapper)", 0);
+  assert(__pyx_arg_n_items); {
+    __pyx_v_n_items = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_arg_n_items); if (unlikely((__pyx_v_n_items == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 230, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("read_strings", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 62, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_string_buffers", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8read_strings(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items, __pyx_v_encoding);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_14read_string_buffers(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), ((unsigned PY_LONG_LONG)__pyx_v_n_items));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8read_strings(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items, PyObject *__pyx_v_encoding) {
-  PyObject *__pyx_v_items = NULL;
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_14read_string_buffers(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_n_items) {
+  PyObject *__pyx_v_offsets = NULL;
+  int32_t *__pyx_v_offsets_ptr;
+  PyObject *__pyx_v_large_offsets = NULL;
+  int64_t *__pyx_v_large_offsets_ptr;
+  unsigned PY_LONG_LONG __pyx_v_capacity;
+  PyObject *__pyx_v_data = NULL;
+  char *__pyx_v_data_ptr;
   unsigned PY_LONG_LONG __pyx_v_i;
+  unsigned PY_LONG_LONG __pyx_v_j;
   char *__pyx_v_buffer_ptr;
-  unsigned PY_LONG_LONG __pyx_v_right;
   unsigned PY_LONG_LONG __pyx_v_size;
   unsigned PY_LONG_LONG __pyx_v_shift;
-  unsigned PY_LONG_LONG __pyx_v_bytes_read;
   unsigned PY_LONG_LONG __pyx_v_b;
-  char *__pyx_v_c_string;
-  unsigned PY_LONG_LONG __pyx_v_c_string_size;
-  char *__pyx_v_c_encoding;
-  PyObject *__pyx_v_rv = 0;
+  unsigned PY_LONG_LONG __pyx_v_copied;
+  unsigned PY_LONG_LONG __pyx_v_read_bytes;
+  unsigned PY_LONG_LONG __pyx_v_total;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  char *__pyx_t_5;
-  unsigned PY_LONG_LONG __pyx_t_6;
-  unsigned PY_LONG_LONG __pyx_t_7;
-  unsigned PY_LONG_LONG __pyx_t_8;
+  unsigned PY_LONG_LONG __pyx_t_2;
+  unsigned PY_LONG_LONG __pyx_t_3;
+  unsigned PY_LONG_LONG __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
   unsigned PY_LONG_LONG __pyx_t_9;
   unsigned PY_LONG_LONG __pyx_t_10;
   unsigned PY_LONG_LONG __pyx_t_11;
-  PyObject *__pyx_t_12 = NULL;
-  PyObject *__pyx_t_13 = NULL;
-  PyObject *__pyx_t_14 = NULL;
-  int __pyx_t_15;
-  PyObject *__pyx_t_16 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("read_strings", 0);
-  __Pyx_INCREF(__pyx_v_encoding);
+  __Pyx_RefNannySetupContext("read_string_buffers", 0);
 
-  /* "bytehouse_driver/bufferedreader.pyx":67
- *         We inline strings reading logic here to avoid this overhead.
+  /* "bytehouse_driver/bufferedreader.pyx":239
+ *                  or int64 values if data exceeds 2 GiB.
  *         """
- *         items = PyTuple_New(n_items)             # <<<<<<<<<<<<<<
- * 
- *         cdef unsigned long long i
+ *         offsets = PyByteArray_FromStringAndSize(NULL, (n_items + 1) * 4)             # <<<<<<<<<<<<<<
+ *         cdef int32_t* offsets_ptr = <int32_t*> PyByteArray_AsString(offsets)
+ *         large_offsets = None
  */
-  __pyx_t_1 = PyTuple_New(__pyx_v_n_items); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_t_1 = PyByteArray_FromStringAndSize(NULL, ((__pyx_v_n_items + 1) * 4)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 239, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_items = ((PyObject*)__pyx_t_1);
+  __pyx_v_offsets = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":71
- *         cdef unsigned long long i
- *         # Buffer vars
- *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
- *         cdef unsigned long long right
- *         # String length vars
- */
-  __pyx_t_1 = __pyx_v_self->buffer;
-  __Pyx_INCREF(__pyx_t_1);
-  __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "bytehouse_driver/bufferedreader.pyx":78
- * 
- *         # String for decode vars.
- *         cdef char *c_string = NULL             # <<<<<<<<<<<<<<
- *         cdef unsigned long long c_string_size = 1024
- *         cdef char *c_encoding = NULL
- */
-  __pyx_v_c_string = NULL;
-
-  /* "bytehouse_driver/bufferedreader.pyx":79
- *         # String for decode vars.
- *         cdef char *c_string = NULL
- *         cdef unsigned long long c_string_size = 1024             # <<<<<<<<<<<<<<
- *         cdef char *c_encoding = NULL
- *         if encoding:
- */
-  __pyx_v_c_string_size = 0x400;
-
-  /* "bytehouse_driver/bufferedreader.pyx":80
- *         cdef char *c_string = NULL
- *         cdef unsigned long long c_string_size = 1024
- *         cdef char *c_encoding = NULL             # <<<<<<<<<<<<<<
- *         if encoding:
- *             encoding = encoding.encode('utf-8')
- */
-  __pyx_v_c_encoding = NULL;
-
-  /* "bytehouse_driver/bufferedreader.pyx":81
- *         cdef unsigned long long c_string_size = 1024
- *         cdef char *c_encoding = NULL
- *         if encoding:             # <<<<<<<<<<<<<<
- *             encoding = encoding.encode('utf-8')
- *             c_encoding = encoding
- */
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_encoding); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 81, __pyx_L1_error)
-  if (__pyx_t_2) {
-
-    /* "bytehouse_driver/bufferedreader.pyx":82
- *         cdef char *c_encoding = NULL
- *         if encoding:
- *             encoding = encoding.encode('utf-8')             # <<<<<<<<<<<<<<
- *             c_encoding = encoding
- * 
- */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-      }
-    }
-    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_u_utf_8) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_u_utf_8);
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF_SET(__pyx_v_encoding, __pyx_t_1);
-    __pyx_t_1 = 0;
-
-    /* "bytehouse_driver/bufferedreader.pyx":83
- *         if encoding:
- *             encoding = encoding.encode('utf-8')
- *             c_encoding = encoding             # <<<<<<<<<<<<<<
- * 
- *         cdef object rv = object()
+  /* "bytehouse_driver/bufferedreader.pyx":240
+ *         """
+ *         offsets = PyByteArray_FromStringAndSize(NULL, (n_items + 1) * 4)
+ *         cdef int32_t* offsets_ptr = <int32_t*> PyByteArray_AsString(offsets)             # <<<<<<<<<<<<<<
+ *         large_offsets = None
+ *         cdef int64_t* large_offsets_ptr = NULL
  */
-    __pyx_t_5 = __Pyx_PyObject_AsWritableString(__pyx_v_encoding); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L1_error)
-    __pyx_v_c_encoding = __pyx_t_5;
+  __pyx_v_offsets_ptr = ((int32_t *)PyByteArray_AsString(__pyx_v_offsets));
 
-    /* "bytehouse_driver/bufferedreader.pyx":81
- *         cdef unsigned long long c_string_size = 1024
- *         cdef char *c_encoding = NULL
- *         if encoding:             # <<<<<<<<<<<<<<
- *             encoding = encoding.encode('utf-8')
- *             c_encoding = encoding
+  /* "bytehouse_driver/bufferedreader.pyx":241
+ *         offsets = PyByteArray_FromStringAndSize(NULL, (n_items + 1) * 4)
+ *         cdef int32_t* offsets_ptr = <int32_t*> PyByteArray_AsString(offsets)
+ *         large_offsets = None             # <<<<<<<<<<<<<<
+ *         cdef int64_t* large_offsets_ptr = NULL
+ *         cdef unsigned long long capacity = max(n_items * 8, <unsigned long long> 64)
  */
+  __Pyx_INCREF(Py_None);
+  __pyx_v_large_offsets = ((PyObject*)Py_None);
+
+  /* "bytehouse_driver/bufferedreader.pyx":242
+ *         cdef int32_t* offsets_ptr = <int32_t*> PyByteArray_AsString(offsets)
+ *         large_offsets = None
+ *         cdef int64_t* large_offsets_ptr = NULL             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long capacity = max(n_items * 8, <unsigned long long> 64)
+ *         data = PyByteArray_FromStringAndSize(NULL, capacity)
+ */
+  __pyx_v_large_offsets_ptr = NULL;
+
+  /* "bytehouse_driver/bufferedreader.pyx":243
+ *         large_offsets = None
+ *         cdef int64_t* large_offsets_ptr = NULL
+ *         cdef unsigned long long capacity = max(n_items * 8, <unsigned long long> 64)             # <<<<<<<<<<<<<<
+ *         data = PyByteArray_FromStringAndSize(NULL, capacity)
+ *         cdef char* data_ptr
+ */
+  __pyx_t_2 = ((unsigned PY_LONG_LONG)64);
+  __pyx_t_3 = (__pyx_v_n_items * 8);
+  if (((__pyx_t_2 > __pyx_t_3) != 0)) {
+    __pyx_t_4 = __pyx_t_2;
+  } else {
+    __pyx_t_4 = __pyx_t_3;
   }
+  __pyx_v_capacity = __pyx_t_4;
 
-  /* "bytehouse_driver/bufferedreader.pyx":85
- *             c_encoding = encoding
+  /* "bytehouse_driver/bufferedreader.pyx":244
+ *         cdef int64_t* large_offsets_ptr = NULL
+ *         cdef unsigned long long capacity = max(n_items * 8, <unsigned long long> 64)
+ *         data = PyByteArray_FromStringAndSize(NULL, capacity)             # <<<<<<<<<<<<<<
+ *         cdef char* data_ptr
  * 
- *         cdef object rv = object()             # <<<<<<<<<<<<<<
- *         # String for decode vars.
- *         if c_encoding:
  */
-  __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_builtin_object); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __pyx_t_1 = PyByteArray_FromStringAndSize(NULL, __pyx_v_capacity); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 244, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_rv = __pyx_t_1;
+  __pyx_v_data = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":87
- *         cdef object rv = object()
- *         # String for decode vars.
- *         if c_encoding:             # <<<<<<<<<<<<<<
- *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)
+  /* "bytehouse_driver/bufferedreader.pyx":248
  * 
+ *         cdef unsigned long long i, j
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long size, shift, b, copied, read_bytes
+ *         cdef unsigned long long total = 0
  */
-  __pyx_t_2 = (__pyx_v_c_encoding != 0);
-  if (__pyx_t_2) {
+  __pyx_t_1 = __pyx_v_self->buffer;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "bytehouse_driver/bufferedreader.pyx":88
- *         # String for decode vars.
- *         if c_encoding:
- *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)             # <<<<<<<<<<<<<<
+  /* "bytehouse_driver/bufferedreader.pyx":250
+ *         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
+ *         cdef unsigned long long size, shift, b, copied, read_bytes
+ *         cdef unsigned long long total = 0             # <<<<<<<<<<<<<<
  * 
- *         for i in range(n_items):
+ *         offsets_ptr[0] = 0
  */
-    __pyx_v_c_string = ((char *)PyMem_Realloc(NULL, __pyx_v_c_string_size));
+  __pyx_v_total = 0;
 
-    /* "bytehouse_driver/bufferedreader.pyx":87
- *         cdef object rv = object()
- *         # String for decode vars.
- *         if c_encoding:             # <<<<<<<<<<<<<<
- *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)
+  /* "bytehouse_driver/bufferedreader.pyx":252
+ *         cdef unsigned long long total = 0
  * 
+ *         offsets_ptr[0] = 0             # <<<<<<<<<<<<<<
+ *         for i in range(n_items):
+ *             shift = size = 0
  */
-  }
+  (__pyx_v_offsets_ptr[0]) = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":90
- *             c_string = <char *> PyMem_Realloc(NULL, c_string_size)
+  /* "bytehouse_driver/bufferedreader.pyx":253
  * 
+ *         offsets_ptr[0] = 0
  *         for i in range(n_items):             # <<<<<<<<<<<<<<
  *             shift = size = 0
  * 
  */
-  __pyx_t_6 = __pyx_v_n_items;
-  __pyx_t_7 = __pyx_t_6;
-  for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
-    __pyx_v_i = __pyx_t_8;
+  __pyx_t_4 = __pyx_v_n_items;
+  __pyx_t_2 = __pyx_t_4;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-    /* "bytehouse_driver/bufferedreader.pyx":91
- * 
+    /* "bytehouse_driver/bufferedreader.pyx":254
+ *         offsets_ptr[0] = 0
  *         for i in range(n_items):
  *             shift = size = 0             # <<<<<<<<<<<<<<
  * 
@@ -2681,7 +4234,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8
     __pyx_v_shift = 0;
     __pyx_v_size = 0;
 
-    /* "bytehouse_driver/bufferedreader.pyx":94
+    /* "bytehouse_driver/bufferedreader.pyx":257
  * 
  *             # Read string size
  *             while True:             # <<<<<<<<<<<<<<
@@ -2690,43 +4243,43 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8
  */
     while (1) {
 
-      /* "bytehouse_driver/bufferedreader.pyx":95
+      /* "bytehouse_driver/bufferedreader.pyx":258
  *             # Read string size
  *             while True:
  *                 if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
  *                     self.read_into_buffer()
  *                     # `read_into_buffer` can override buffer
  */
-      __pyx_t_2 = ((__pyx_v_self->position == __pyx_v_self->current_buffer_size) != 0);
-      if (__pyx_t_2) {
+      __pyx_t_5 = ((__pyx_v_self->position == __pyx_v_self->current_buffer_size) != 0);
+      if (__pyx_t_5) {
 
-        /* "bytehouse_driver/bufferedreader.pyx":96
+        /* "bytehouse_driver/bufferedreader.pyx":259
  *             while True:
  *                 if self.position == self.current_buffer_size:
  *                     self.read_into_buffer()             # <<<<<<<<<<<<<<
  *                     # `read_into_buffer` can override buffer
  *                     buffer_ptr = PyByteArray_AsString(self.buffer)
  */
-        __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 96, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_4 = NULL;
-        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-          if (likely(__pyx_t_4)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-            __Pyx_INCREF(__pyx_t_4);
+        __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_7 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+          __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+          if (likely(__pyx_t_7)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+            __Pyx_INCREF(__pyx_t_7);
             __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_3, function);
+            __Pyx_DECREF_SET(__pyx_t_6, function);
           }
         }
-        __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
+        __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 259, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-        /* "bytehouse_driver/bufferedreader.pyx":98
+        /* "bytehouse_driver/bufferedreader.pyx":261
  *                     self.read_into_buffer()
  *                     # `read_into_buffer` can override buffer
  *                     buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
@@ -2738,7 +4291,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8
         __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-        /* "bytehouse_driver/bufferedreader.pyx":99
+        /* "bytehouse_driver/bufferedreader.pyx":262
  *                     # `read_into_buffer` can override buffer
  *                     buffer_ptr = PyByteArray_AsString(self.buffer)
  *                     self.position = 0             # <<<<<<<<<<<<<<
@@ -2747,7 +4300,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8
  */
         __pyx_v_self->position = 0;
 
-        /* "bytehouse_driver/bufferedreader.pyx":95
+        /* "bytehouse_driver/bufferedreader.pyx":258
  *             # Read string size
  *             while True:
  *                 if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
@@ -2756,7 +4309,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8
  */
       }
 
-      /* "bytehouse_driver/bufferedreader.pyx":101
+      /* "bytehouse_driver/bufferedreader.pyx":264
  *                     self.position = 0
  * 
  *                 b = buffer_ptr[self.position]             # <<<<<<<<<<<<<<
@@ -2765,7 +4318,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8
  */
       __pyx_v_b = (__pyx_v_buffer_ptr[__pyx_v_self->position]);
 
-      /* "bytehouse_driver/bufferedreader.pyx":102
+      /* "bytehouse_driver/bufferedreader.pyx":265
  * 
  *                 b = buffer_ptr[self.position]
  *                 self.position += 1             # <<<<<<<<<<<<<<
@@ -2774,7 +4327,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8
  */
       __pyx_v_self->position = (__pyx_v_self->position + 1);
 
-      /* "bytehouse_driver/bufferedreader.pyx":104
+      /* "bytehouse_driver/bufferedreader.pyx":267
  *                 self.position += 1
  * 
  *                 size |= (b & 0x7f) << shift             # <<<<<<<<<<<<<<
@@ -2783,26 +4336,26 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8
  */
       __pyx_v_size = (__pyx_v_size | ((__pyx_v_b & 0x7f) << __pyx_v_shift));
 
-      /* "bytehouse_driver/bufferedreader.pyx":105
+      /* "bytehouse_driver/bufferedreader.pyx":268
  * 
  *                 size |= (b & 0x7f) << shift
  *                 if b < 0x80:             # <<<<<<<<<<<<<<
  *                     break
  * 
  */
-      __pyx_t_2 = ((__pyx_v_b < 0x80) != 0);
-      if (__pyx_t_2) {
+      __pyx_t_5 = ((__pyx_v_b < 0x80) != 0);
+      if (__pyx_t_5) {
 
-        /* "bytehouse_driver/bufferedreader.pyx":106
+        /* "bytehouse_driver/bufferedreader.pyx":269
  *                 size |= (b & 0x7f) << shift
  *                 if b < 0x80:
  *                     break             # <<<<<<<<<<<<<<
  * 
  *                 shift += 7
  */
-        goto __pyx_L8_break;
+        goto __pyx_L6_break;
 
-        /* "bytehouse_driver/bufferedreader.pyx":105
+        /* "bytehouse_driver/bufferedreader.pyx":268
  * 
  *                 size |= (b & 0x7f) << shift
  *                 if b < 0x80:             # <<<<<<<<<<<<<<
@@ -2811,632 +4364,422 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8
  */
       }
 
-      /* "bytehouse_driver/bufferedreader.pyx":108
+      /* "bytehouse_driver/bufferedreader.pyx":271
  *                     break
  * 
  *                 shift += 7             # <<<<<<<<<<<<<<
  * 
- *             right = self.position + size
+ *             if large_offsets_ptr == NULL and total + size > 0x7fffffff:
  */
       __pyx_v_shift = (__pyx_v_shift + 7);
     }
-    __pyx_L8_break:;
+    __pyx_L6_break:;
 
-    /* "bytehouse_driver/bufferedreader.pyx":110
+    /* "bytehouse_driver/bufferedreader.pyx":273
  *                 shift += 7
  * 
- *             right = self.position + size             # <<<<<<<<<<<<<<
- * 
- *             if c_encoding:
- */
-    __pyx_v_right = (__pyx_v_self->position + __pyx_v_size);
-
-    /* "bytehouse_driver/bufferedreader.pyx":112
- *             right = self.position + size
- * 
- *             if c_encoding:             # <<<<<<<<<<<<<<
- *                 if size + 1 > c_string_size:
- *                     c_string_size = size + 1
- */
-    __pyx_t_2 = (__pyx_v_c_encoding != 0);
-    if (__pyx_t_2) {
-
-      /* "bytehouse_driver/bufferedreader.pyx":113
- * 
- *             if c_encoding:
- *                 if size + 1 > c_string_size:             # <<<<<<<<<<<<<<
- *                     c_string_size = size + 1
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
- */
-      __pyx_t_2 = (((__pyx_v_size + 1) > __pyx_v_c_string_size) != 0);
-      if (__pyx_t_2) {
-
-        /* "bytehouse_driver/bufferedreader.pyx":114
- *             if c_encoding:
- *                 if size + 1 > c_string_size:
- *                     c_string_size = size + 1             # <<<<<<<<<<<<<<
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
- *                     if c_string is NULL:
- */
-        __pyx_v_c_string_size = (__pyx_v_size + 1);
-
-        /* "bytehouse_driver/bufferedreader.pyx":115
- *                 if size + 1 > c_string_size:
- *                     c_string_size = size + 1
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)             # <<<<<<<<<<<<<<
- *                     if c_string is NULL:
- *                         raise MemoryError()
- */
-        __pyx_v_c_string = ((char *)PyMem_Realloc(__pyx_v_c_string, __pyx_v_c_string_size));
-
-        /* "bytehouse_driver/bufferedreader.pyx":116
- *                     c_string_size = size + 1
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
- *                     if c_string is NULL:             # <<<<<<<<<<<<<<
- *                         raise MemoryError()
- *                 c_string[size] = 0
- */
-        __pyx_t_2 = ((__pyx_v_c_string == NULL) != 0);
-        if (unlikely(__pyx_t_2)) {
-
-          /* "bytehouse_driver/bufferedreader.pyx":117
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
- *                     if c_string is NULL:
- *                         raise MemoryError()             # <<<<<<<<<<<<<<
- *                 c_string[size] = 0
- *                 bytes_read = 0
- */
-          PyErr_NoMemory(); __PYX_ERR(0, 117, __pyx_L1_error)
-
-          /* "bytehouse_driver/bufferedreader.pyx":116
- *                     c_string_size = size + 1
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
- *                     if c_string is NULL:             # <<<<<<<<<<<<<<
- *                         raise MemoryError()
- *                 c_string[size] = 0
- */
-        }
-
-        /* "bytehouse_driver/bufferedreader.pyx":113
- * 
- *             if c_encoding:
- *                 if size + 1 > c_string_size:             # <<<<<<<<<<<<<<
- *                     c_string_size = size + 1
- *                     c_string = <char *> PyMem_Realloc(c_string, c_string_size)
+ *             if large_offsets_ptr == NULL and total + size > 0x7fffffff:             # <<<<<<<<<<<<<<
+ *                 # Offsets are widened for Arrow large string type.
+ *                 large_offsets = PyByteArray_FromStringAndSize(
  */
+    __pyx_t_8 = ((__pyx_v_large_offsets_ptr == NULL) != 0);
+    if (__pyx_t_8) {
+    } else {
+      __pyx_t_5 = __pyx_t_8;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_8 = (((__pyx_v_total + __pyx_v_size) > 0x7fffffff) != 0);
+    __pyx_t_5 = __pyx_t_8;
+    __pyx_L10_bool_binop_done:;
+    if (__pyx_t_5) {
+
+      /* "bytehouse_driver/bufferedreader.pyx":275
+ *             if large_offsets_ptr == NULL and total + size > 0x7fffffff:
+ *                 # Offsets are widened for Arrow large string type.
+ *                 large_offsets = PyByteArray_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *                     NULL, (n_items + 1) * 8
+ *                 )
+ */
+      __pyx_t_1 = PyByteArray_FromStringAndSize(NULL, ((__pyx_v_n_items + 1) * 8)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 275, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF_SET(__pyx_v_large_offsets, ((PyObject*)__pyx_t_1));
+      __pyx_t_1 = 0;
+
+      /* "bytehouse_driver/bufferedreader.pyx":278
+ *                     NULL, (n_items + 1) * 8
+ *                 )
+ *                 large_offsets_ptr = <int64_t*> PyByteArray_AsString(             # <<<<<<<<<<<<<<
+ *                     large_offsets
+ *                 )
+ */
+      __pyx_v_large_offsets_ptr = ((int64_t *)PyByteArray_AsString(__pyx_v_large_offsets));
+
+      /* "bytehouse_driver/bufferedreader.pyx":281
+ *                     large_offsets
+ *                 )
+ *                 for j in range(i + 1):             # <<<<<<<<<<<<<<
+ *                     large_offsets_ptr[j] = offsets_ptr[j]
+ * 
+ */
+      __pyx_t_9 = (__pyx_v_i + 1);
+      __pyx_t_10 = __pyx_t_9;
+      for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
+        __pyx_v_j = __pyx_t_11;
+
+        /* "bytehouse_driver/bufferedreader.pyx":282
+ *                 )
+ *                 for j in range(i + 1):
+ *                     large_offsets_ptr[j] = offsets_ptr[j]             # <<<<<<<<<<<<<<
+ * 
+ *             if total + size > capacity:
+ */
+        (__pyx_v_large_offsets_ptr[__pyx_v_j]) = (__pyx_v_offsets_ptr[__pyx_v_j]);
       }
 
-      /* "bytehouse_driver/bufferedreader.pyx":118
- *                     if c_string is NULL:
- *                         raise MemoryError()
- *                 c_string[size] = 0             # <<<<<<<<<<<<<<
- *                 bytes_read = 0
- * 
- */
-      (__pyx_v_c_string[__pyx_v_size]) = 0;
-
-      /* "bytehouse_driver/bufferedreader.pyx":119
- *                         raise MemoryError()
- *                 c_string[size] = 0
- *                 bytes_read = 0             # <<<<<<<<<<<<<<
- * 
- *             # Decoding pure c strings in Cython is faster than in pure Python.
- */
-      __pyx_v_bytes_read = 0;
-
-      /* "bytehouse_driver/bufferedreader.pyx":112
- *             right = self.position + size
+      /* "bytehouse_driver/bufferedreader.pyx":273
+ *                 shift += 7
  * 
- *             if c_encoding:             # <<<<<<<<<<<<<<
- *                 if size + 1 > c_string_size:
- *                     c_string_size = size + 1
+ *             if large_offsets_ptr == NULL and total + size > 0x7fffffff:             # <<<<<<<<<<<<<<
+ *                 # Offsets are widened for Arrow large string type.
+ *                 large_offsets = PyByteArray_FromStringAndSize(
  */
     }
 
-    /* "bytehouse_driver/bufferedreader.pyx":124
- *             # We need to copy it into buffer for adding null symbol at the end.
- *             # In ByteHouse block there is no null
- *             if right > self.current_buffer_size:             # <<<<<<<<<<<<<<
- *                 if c_encoding:
- *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],
- */
-    __pyx_t_2 = ((__pyx_v_right > __pyx_v_self->current_buffer_size) != 0);
-    if (__pyx_t_2) {
-
-      /* "bytehouse_driver/bufferedreader.pyx":125
- *             # In ByteHouse block there is no null
- *             if right > self.current_buffer_size:
- *                 if c_encoding:             # <<<<<<<<<<<<<<
- *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],
- *                            self.current_buffer_size - self.position)
- */
-      __pyx_t_2 = (__pyx_v_c_encoding != 0);
-      if (__pyx_t_2) {
-
-        /* "bytehouse_driver/bufferedreader.pyx":126
- *             if right > self.current_buffer_size:
- *                 if c_encoding:
- *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],             # <<<<<<<<<<<<<<
- *                            self.current_buffer_size - self.position)
- *                 else:
+    /* "bytehouse_driver/bufferedreader.pyx":284
+ *                     large_offsets_ptr[j] = offsets_ptr[j]
+ * 
+ *             if total + size > capacity:             # <<<<<<<<<<<<<<
+ *                 capacity = max(capacity * 2, total + size)
+ *                 PyByteArray_Resize(data, capacity)
  */
-        (void)(memcpy((&(__pyx_v_c_string[__pyx_v_bytes_read])), (&(__pyx_v_buffer_ptr[__pyx_v_self->position])), (__pyx_v_self->current_buffer_size - __pyx_v_self->position)));
+    __pyx_t_5 = (((__pyx_v_total + __pyx_v_size) > __pyx_v_capacity) != 0);
+    if (__pyx_t_5) {
 
-        /* "bytehouse_driver/bufferedreader.pyx":125
- *             # In ByteHouse block there is no null
- *             if right > self.current_buffer_size:
- *                 if c_encoding:             # <<<<<<<<<<<<<<
- *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],
- *                            self.current_buffer_size - self.position)
+      /* "bytehouse_driver/bufferedreader.pyx":285
+ * 
+ *             if total + size > capacity:
+ *                 capacity = max(capacity * 2, total + size)             # <<<<<<<<<<<<<<
+ *                 PyByteArray_Resize(data, capacity)
+ *             data_ptr = PyByteArray_AsString(data)
  */
-        goto __pyx_L15;
+      __pyx_t_9 = (__pyx_v_total + __pyx_v_size);
+      __pyx_t_10 = (__pyx_v_capacity * 2);
+      if (((__pyx_t_9 > __pyx_t_10) != 0)) {
+        __pyx_t_11 = __pyx_t_9;
+      } else {
+        __pyx_t_11 = __pyx_t_10;
       }
+      __pyx_v_capacity = __pyx_t_11;
 
-      /* "bytehouse_driver/bufferedreader.pyx":129
- *                            self.current_buffer_size - self.position)
- *                 else:
- *                     rv = PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
- *                         &buffer_ptr[self.position],
- *                         self.current_buffer_size - self.position
+      /* "bytehouse_driver/bufferedreader.pyx":286
+ *             if total + size > capacity:
+ *                 capacity = max(capacity * 2, total + size)
+ *                 PyByteArray_Resize(data, capacity)             # <<<<<<<<<<<<<<
+ *             data_ptr = PyByteArray_AsString(data)
+ * 
  */
-      /*else*/ {
+      (void)(PyByteArray_Resize(__pyx_v_data, __pyx_v_capacity));
 
-        /* "bytehouse_driver/bufferedreader.pyx":131
- *                     rv = PyBytes_FromStringAndSize(
- *                         &buffer_ptr[self.position],
- *                         self.current_buffer_size - self.position             # <<<<<<<<<<<<<<
- *                     )
+      /* "bytehouse_driver/bufferedreader.pyx":284
+ *                     large_offsets_ptr[j] = offsets_ptr[j]
  * 
+ *             if total + size > capacity:             # <<<<<<<<<<<<<<
+ *                 capacity = max(capacity * 2, total + size)
+ *                 PyByteArray_Resize(data, capacity)
  */
-        __pyx_t_1 = PyBytes_FromStringAndSize((&(__pyx_v_buffer_ptr[__pyx_v_self->position])), (__pyx_v_self->current_buffer_size - __pyx_v_self->position)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 129, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_1);
-        __pyx_t_1 = 0;
-      }
-      __pyx_L15:;
+    }
 
-      /* "bytehouse_driver/bufferedreader.pyx":134
- *                     )
+    /* "bytehouse_driver/bufferedreader.pyx":287
+ *                 capacity = max(capacity * 2, total + size)
+ *                 PyByteArray_Resize(data, capacity)
+ *             data_ptr = PyByteArray_AsString(data)             # <<<<<<<<<<<<<<
  * 
- *                 bytes_read = self.current_buffer_size - self.position             # <<<<<<<<<<<<<<
- *                 # Read the rest of the string.
- *                 while bytes_read != size:
+ *             copied = 0
  */
-      __pyx_v_bytes_read = (__pyx_v_self->current_buffer_size - __pyx_v_self->position);
+    __pyx_v_data_ptr = PyByteArray_AsString(__pyx_v_data);
 
-      /* "bytehouse_driver/bufferedreader.pyx":136
- *                 bytes_read = self.current_buffer_size - self.position
- *                 # Read the rest of the string.
- *                 while bytes_read != size:             # <<<<<<<<<<<<<<
- *                     self.position = size - bytes_read
+    /* "bytehouse_driver/bufferedreader.pyx":289
+ *             data_ptr = PyByteArray_AsString(data)
  * 
+ *             copied = 0             # <<<<<<<<<<<<<<
+ *             while copied < size:
+ *                 if self.position == self.current_buffer_size:
  */
-      while (1) {
-        __pyx_t_2 = ((__pyx_v_bytes_read != __pyx_v_size) != 0);
-        if (!__pyx_t_2) break;
+    __pyx_v_copied = 0;
 
-        /* "bytehouse_driver/bufferedreader.pyx":137
- *                 # Read the rest of the string.
- *                 while bytes_read != size:
- *                     self.position = size - bytes_read             # <<<<<<<<<<<<<<
+    /* "bytehouse_driver/bufferedreader.pyx":290
  * 
+ *             copied = 0
+ *             while copied < size:             # <<<<<<<<<<<<<<
+ *                 if self.position == self.current_buffer_size:
  *                     self.read_into_buffer()
  */
-        __pyx_v_self->position = (__pyx_v_size - __pyx_v_bytes_read);
+    while (1) {
+      __pyx_t_5 = ((__pyx_v_copied < __pyx_v_size) != 0);
+      if (!__pyx_t_5) break;
 
-        /* "bytehouse_driver/bufferedreader.pyx":139
- *                     self.position = size - bytes_read
- * 
+      /* "bytehouse_driver/bufferedreader.pyx":291
+ *             copied = 0
+ *             while copied < size:
+ *                 if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                     self.read_into_buffer()
+ *                     buffer_ptr = PyByteArray_AsString(self.buffer)
+ */
+      __pyx_t_5 = ((__pyx_v_self->position == __pyx_v_self->current_buffer_size) != 0);
+      if (__pyx_t_5) {
+
+        /* "bytehouse_driver/bufferedreader.pyx":292
+ *             while copied < size:
+ *                 if self.position == self.current_buffer_size:
  *                     self.read_into_buffer()             # <<<<<<<<<<<<<<
- *                     # `read_into_buffer` can override buffer
  *                     buffer_ptr = PyByteArray_AsString(self.buffer)
+ *                     self.position = 0
  */
-        __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 139, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_4 = NULL;
-        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-          if (likely(__pyx_t_4)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-            __Pyx_INCREF(__pyx_t_4);
+        __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_into_buffer); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 292, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_7 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+          __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+          if (likely(__pyx_t_7)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+            __Pyx_INCREF(__pyx_t_7);
             __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_3, function);
+            __Pyx_DECREF_SET(__pyx_t_6, function);
           }
         }
-        __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
+        __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 292, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-        /* "bytehouse_driver/bufferedreader.pyx":141
+        /* "bytehouse_driver/bufferedreader.pyx":293
+ *                 if self.position == self.current_buffer_size:
  *                     self.read_into_buffer()
- *                     # `read_into_buffer` can override buffer
  *                     buffer_ptr = PyByteArray_AsString(self.buffer)             # <<<<<<<<<<<<<<
- *                     # There can be not enough data in buffer.
- *                     self.position = min(
+ *                     self.position = 0
+ * 
  */
         __pyx_t_1 = __pyx_v_self->buffer;
         __Pyx_INCREF(__pyx_t_1);
         __pyx_v_buffer_ptr = PyByteArray_AsString(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-        /* "bytehouse_driver/bufferedreader.pyx":144
- *                     # There can be not enough data in buffer.
- *                     self.position = min(
- *                         self.position, self.current_buffer_size             # <<<<<<<<<<<<<<
- *                     )
- *                     if c_encoding:
- */
-        __pyx_t_9 = __pyx_v_self->current_buffer_size;
-        __pyx_t_10 = __pyx_v_self->position;
-        if (((__pyx_t_9 < __pyx_t_10) != 0)) {
-          __pyx_t_11 = __pyx_t_9;
-        } else {
-          __pyx_t_11 = __pyx_t_10;
-        }
-
-        /* "bytehouse_driver/bufferedreader.pyx":143
+        /* "bytehouse_driver/bufferedreader.pyx":294
+ *                     self.read_into_buffer()
  *                     buffer_ptr = PyByteArray_AsString(self.buffer)
- *                     # There can be not enough data in buffer.
- *                     self.position = min(             # <<<<<<<<<<<<<<
- *                         self.position, self.current_buffer_size
- *                     )
- */
-        __pyx_v_self->position = __pyx_t_11;
-
-        /* "bytehouse_driver/bufferedreader.pyx":146
- *                         self.position, self.current_buffer_size
- *                     )
- *                     if c_encoding:             # <<<<<<<<<<<<<<
- *                         memcpy(
- *                             &c_string[bytes_read], buffer_ptr, self.position
- */
-        __pyx_t_2 = (__pyx_v_c_encoding != 0);
-        if (__pyx_t_2) {
-
-          /* "bytehouse_driver/bufferedreader.pyx":147
- *                     )
- *                     if c_encoding:
- *                         memcpy(             # <<<<<<<<<<<<<<
- *                             &c_string[bytes_read], buffer_ptr, self.position
- *                         )
- */
-          (void)(memcpy((&(__pyx_v_c_string[__pyx_v_bytes_read])), __pyx_v_buffer_ptr, __pyx_v_self->position));
-
-          /* "bytehouse_driver/bufferedreader.pyx":146
- *                         self.position, self.current_buffer_size
- *                     )
- *                     if c_encoding:             # <<<<<<<<<<<<<<
- *                         memcpy(
- *                             &c_string[bytes_read], buffer_ptr, self.position
- */
-          goto __pyx_L18;
-        }
-
-        /* "bytehouse_driver/bufferedreader.pyx":151
- *                         )
- *                     else:
- *                         rv += PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
- *                             buffer_ptr, self.position
- *                         )
- */
-        /*else*/ {
-
-          /* "bytehouse_driver/bufferedreader.pyx":152
- *                     else:
- *                         rv += PyBytes_FromStringAndSize(
- *                             buffer_ptr, self.position             # <<<<<<<<<<<<<<
- *                         )
- *                     bytes_read += self.position
- */
-          __pyx_t_1 = PyBytes_FromStringAndSize(__pyx_v_buffer_ptr, __pyx_v_self->position); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-
-          /* "bytehouse_driver/bufferedreader.pyx":151
- *                         )
- *                     else:
- *                         rv += PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
- *                             buffer_ptr, self.position
- *                         )
- */
-          __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_v_rv, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_3);
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_3);
-          __pyx_t_3 = 0;
-        }
-        __pyx_L18:;
-
-        /* "bytehouse_driver/bufferedreader.pyx":154
- *                             buffer_ptr, self.position
- *                         )
- *                     bytes_read += self.position             # <<<<<<<<<<<<<<
- * 
- *             else:
- */
-        __pyx_v_bytes_read = (__pyx_v_bytes_read + __pyx_v_self->position);
-      }
-
-      /* "bytehouse_driver/bufferedreader.pyx":124
- *             # We need to copy it into buffer for adding null symbol at the end.
- *             # In ByteHouse block there is no null
- *             if right > self.current_buffer_size:             # <<<<<<<<<<<<<<
- *                 if c_encoding:
- *                     memcpy(&c_string[bytes_read], &buffer_ptr[self.position],
- */
-      goto __pyx_L14;
-    }
-
-    /* "bytehouse_driver/bufferedreader.pyx":157
+ *                     self.position = 0             # <<<<<<<<<<<<<<
  * 
- *             else:
- *                 if c_encoding:             # <<<<<<<<<<<<<<
- *                     memcpy(c_string, &buffer_ptr[self.position], size)
- *                 else:
- */
-    /*else*/ {
-      __pyx_t_2 = (__pyx_v_c_encoding != 0);
-      if (__pyx_t_2) {
-
-        /* "bytehouse_driver/bufferedreader.pyx":158
- *             else:
- *                 if c_encoding:
- *                     memcpy(c_string, &buffer_ptr[self.position], size)             # <<<<<<<<<<<<<<
- *                 else:
- *                     rv = PyBytes_FromStringAndSize(
+ *                 read_bytes = min(
  */
-        (void)(memcpy(__pyx_v_c_string, (&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_size));
+        __pyx_v_self->position = 0;
 
-        /* "bytehouse_driver/bufferedreader.pyx":157
- * 
- *             else:
- *                 if c_encoding:             # <<<<<<<<<<<<<<
- *                     memcpy(c_string, &buffer_ptr[self.position], size)
- *                 else:
+        /* "bytehouse_driver/bufferedreader.pyx":291
+ *             copied = 0
+ *             while copied < size:
+ *                 if self.position == self.current_buffer_size:             # <<<<<<<<<<<<<<
+ *                     self.read_into_buffer()
+ *                     buffer_ptr = PyByteArray_AsString(self.buffer)
  */
-        goto __pyx_L19;
       }
 
-      /* "bytehouse_driver/bufferedreader.pyx":160
- *                     memcpy(c_string, &buffer_ptr[self.position], size)
- *                 else:
- *                     rv = PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
- *                         &buffer_ptr[self.position], size
- *                     )
- */
-      /*else*/ {
-
-        /* "bytehouse_driver/bufferedreader.pyx":161
- *                 else:
- *                     rv = PyBytes_FromStringAndSize(
- *                         &buffer_ptr[self.position], size             # <<<<<<<<<<<<<<
- *                     )
- *                 self.position = right
+      /* "bytehouse_driver/bufferedreader.pyx":297
+ * 
+ *                 read_bytes = min(
+ *                     size - copied, self.current_buffer_size - self.position             # <<<<<<<<<<<<<<
+ *                 )
+ *                 memcpy(&data_ptr[total + copied], &buffer_ptr[self.position],
  */
-        __pyx_t_3 = PyBytes_FromStringAndSize((&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 160, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_3);
-        __pyx_t_3 = 0;
+      __pyx_t_11 = (__pyx_v_self->current_buffer_size - __pyx_v_self->position);
+      __pyx_t_9 = (__pyx_v_size - __pyx_v_copied);
+      if (((__pyx_t_11 < __pyx_t_9) != 0)) {
+        __pyx_t_10 = __pyx_t_11;
+      } else {
+        __pyx_t_10 = __pyx_t_9;
       }
-      __pyx_L19:;
+      __pyx_v_read_bytes = __pyx_t_10;
 
-      /* "bytehouse_driver/bufferedreader.pyx":163
- *                         &buffer_ptr[self.position], size
- *                     )
- *                 self.position = right             # <<<<<<<<<<<<<<
- * 
- *             if c_encoding:
+      /* "bytehouse_driver/bufferedreader.pyx":299
+ *                     size - copied, self.current_buffer_size - self.position
+ *                 )
+ *                 memcpy(&data_ptr[total + copied], &buffer_ptr[self.position],             # <<<<<<<<<<<<<<
+ *                        read_bytes)
+ *                 self.position += read_bytes
  */
-      __pyx_v_self->position = __pyx_v_right;
-    }
-    __pyx_L14:;
+      (void)(memcpy((&(__pyx_v_data_ptr[(__pyx_v_total + __pyx_v_copied)])), (&(__pyx_v_buffer_ptr[__pyx_v_self->position])), __pyx_v_read_bytes));
 
-    /* "bytehouse_driver/bufferedreader.pyx":165
- *                 self.position = right
+      /* "bytehouse_driver/bufferedreader.pyx":301
+ *                 memcpy(&data_ptr[total + copied], &buffer_ptr[self.position],
+ *                        read_bytes)
+ *                 self.position += read_bytes             # <<<<<<<<<<<<<<
+ *                 copied += read_bytes
  * 
- *             if c_encoding:             # <<<<<<<<<<<<<<
- *                 try:
- *                     rv = c_string[:size].decode(c_encoding)
  */
-    __pyx_t_2 = (__pyx_v_c_encoding != 0);
-    if (__pyx_t_2) {
+      __pyx_v_self->position = (__pyx_v_self->position + __pyx_v_read_bytes);
 
-      /* "bytehouse_driver/bufferedreader.pyx":166
+      /* "bytehouse_driver/bufferedreader.pyx":302
+ *                        read_bytes)
+ *                 self.position += read_bytes
+ *                 copied += read_bytes             # <<<<<<<<<<<<<<
  * 
- *             if c_encoding:
- *                 try:             # <<<<<<<<<<<<<<
- *                     rv = c_string[:size].decode(c_encoding)
- *                 except UnicodeDecodeError:
+ *             total += size
  */
-      {
-        __Pyx_PyThreadState_declare
-        __Pyx_PyThreadState_assign
-        __Pyx_ExceptionSave(&__pyx_t_12, &__pyx_t_13, &__pyx_t_14);
-        __Pyx_XGOTREF(__pyx_t_12);
-        __Pyx_XGOTREF(__pyx_t_13);
-        __Pyx_XGOTREF(__pyx_t_14);
-        /*try:*/ {
-
-          /* "bytehouse_driver/bufferedreader.pyx":167
- *             if c_encoding:
- *                 try:
- *                     rv = c_string[:size].decode(c_encoding)             # <<<<<<<<<<<<<<
- *                 except UnicodeDecodeError:
- *                     rv = PyBytes_FromStringAndSize(c_string, size)
- */
-          __pyx_t_3 = __Pyx_decode_c_string(__pyx_v_c_string, 0, __pyx_v_size, __pyx_v_c_encoding, NULL, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 167, __pyx_L21_error)
-          __Pyx_GOTREF(__pyx_t_3);
-          __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_3);
-          __pyx_t_3 = 0;
+      __pyx_v_copied = (__pyx_v_copied + __pyx_v_read_bytes);
+    }
 
-          /* "bytehouse_driver/bufferedreader.pyx":166
+    /* "bytehouse_driver/bufferedreader.pyx":304
+ *                 copied += read_bytes
  * 
- *             if c_encoding:
- *                 try:             # <<<<<<<<<<<<<<
- *                     rv = c_string[:size].decode(c_encoding)
- *                 except UnicodeDecodeError:
+ *             total += size             # <<<<<<<<<<<<<<
+ *             if large_offsets_ptr != NULL:
+ *                 large_offsets_ptr[i + 1] = <int64_t> total
  */
-        }
-        __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
-        __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
-        __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
-        goto __pyx_L28_try_end;
-        __pyx_L21_error:;
-        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_total = (__pyx_v_total + __pyx_v_size);
 
-        /* "bytehouse_driver/bufferedreader.pyx":168
- *                 try:
- *                     rv = c_string[:size].decode(c_encoding)
- *                 except UnicodeDecodeError:             # <<<<<<<<<<<<<<
- *                     rv = PyBytes_FromStringAndSize(c_string, size)
+    /* "bytehouse_driver/bufferedreader.pyx":305
  * 
+ *             total += size
+ *             if large_offsets_ptr != NULL:             # <<<<<<<<<<<<<<
+ *                 large_offsets_ptr[i + 1] = <int64_t> total
+ *             else:
  */
-        __pyx_t_15 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_UnicodeDecodeError);
-        if (__pyx_t_15) {
-          __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
-          if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_1, &__pyx_t_4) < 0) __PYX_ERR(0, 168, __pyx_L23_except_error)
-          __Pyx_GOTREF(__pyx_t_3);
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = ((__pyx_v_large_offsets_ptr != NULL) != 0);
+    if (__pyx_t_5) {
 
-          /* "bytehouse_driver/bufferedreader.pyx":169
- *                     rv = c_string[:size].decode(c_encoding)
- *                 except UnicodeDecodeError:
- *                     rv = PyBytes_FromStringAndSize(c_string, size)             # <<<<<<<<<<<<<<
- * 
- *             Py_INCREF(rv)
+      /* "bytehouse_driver/bufferedreader.pyx":306
+ *             total += size
+ *             if large_offsets_ptr != NULL:
+ *                 large_offsets_ptr[i + 1] = <int64_t> total             # <<<<<<<<<<<<<<
+ *             else:
+ *                 offsets_ptr[i + 1] = <int32_t> total
  */
-          __pyx_t_16 = PyBytes_FromStringAndSize(__pyx_v_c_string, __pyx_v_size); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 169, __pyx_L23_except_error)
-          __Pyx_GOTREF(__pyx_t_16);
-          __Pyx_DECREF_SET(__pyx_v_rv, __pyx_t_16);
-          __pyx_t_16 = 0;
-          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          goto __pyx_L22_exception_handled;
-        }
-        goto __pyx_L23_except_error;
-        __pyx_L23_except_error:;
-
-        /* "bytehouse_driver/bufferedreader.pyx":166
- * 
- *             if c_encoding:
- *                 try:             # <<<<<<<<<<<<<<
- *                     rv = c_string[:size].decode(c_encoding)
- *                 except UnicodeDecodeError:
- */
-        __Pyx_XGIVEREF(__pyx_t_12);
-        __Pyx_XGIVEREF(__pyx_t_13);
-        __Pyx_XGIVEREF(__pyx_t_14);
-        __Pyx_ExceptionReset(__pyx_t_12, __pyx_t_13, __pyx_t_14);
-        goto __pyx_L1_error;
-        __pyx_L22_exception_handled:;
-        __Pyx_XGIVEREF(__pyx_t_12);
-        __Pyx_XGIVEREF(__pyx_t_13);
-        __Pyx_XGIVEREF(__pyx_t_14);
-        __Pyx_ExceptionReset(__pyx_t_12, __pyx_t_13, __pyx_t_14);
-        __pyx_L28_try_end:;
-      }
+      (__pyx_v_large_offsets_ptr[(__pyx_v_i + 1)]) = ((int64_t)__pyx_v_total);
 
-      /* "bytehouse_driver/bufferedreader.pyx":165
- *                 self.position = right
+      /* "bytehouse_driver/bufferedreader.pyx":305
  * 
- *             if c_encoding:             # <<<<<<<<<<<<<<
- *                 try:
- *                     rv = c_string[:size].decode(c_encoding)
+ *             total += size
+ *             if large_offsets_ptr != NULL:             # <<<<<<<<<<<<<<
+ *                 large_offsets_ptr[i + 1] = <int64_t> total
+ *             else:
  */
+      goto __pyx_L18;
     }
 
-    /* "bytehouse_driver/bufferedreader.pyx":171
- *                     rv = PyBytes_FromStringAndSize(c_string, size)
- * 
- *             Py_INCREF(rv)             # <<<<<<<<<<<<<<
- *             PyTuple_SET_ITEM(items, i, rv)
+    /* "bytehouse_driver/bufferedreader.pyx":308
+ *                 large_offsets_ptr[i + 1] = <int64_t> total
+ *             else:
+ *                 offsets_ptr[i + 1] = <int32_t> total             # <<<<<<<<<<<<<<
  * 
+ *         PyByteArray_Resize(data, total)
  */
-    Py_INCREF(__pyx_v_rv);
+    /*else*/ {
+      (__pyx_v_offsets_ptr[(__pyx_v_i + 1)]) = ((int32_t)__pyx_v_total);
+    }
+    __pyx_L18:;
+  }
 
-    /* "bytehouse_driver/bufferedreader.pyx":172
- * 
- *             Py_INCREF(rv)
- *             PyTuple_SET_ITEM(items, i, rv)             # <<<<<<<<<<<<<<
+  /* "bytehouse_driver/bufferedreader.pyx":310
+ *                 offsets_ptr[i + 1] = <int32_t> total
  * 
- *         if c_string:
+ *         PyByteArray_Resize(data, total)             # <<<<<<<<<<<<<<
+ *         if large_offsets is not None:
+ *             return large_offsets, data, True
  */
-    PyTuple_SET_ITEM(__pyx_v_items, __pyx_v_i, __pyx_v_rv);
-  }
+  (void)(PyByteArray_Resize(__pyx_v_data, __pyx_v_total));
 
-  /* "bytehouse_driver/bufferedreader.pyx":174
- *             PyTuple_SET_ITEM(items, i, rv)
- * 
- *         if c_string:             # <<<<<<<<<<<<<<
- *             PyMem_Free(c_string)
+  /* "bytehouse_driver/bufferedreader.pyx":311
  * 
+ *         PyByteArray_Resize(data, total)
+ *         if large_offsets is not None:             # <<<<<<<<<<<<<<
+ *             return large_offsets, data, True
+ *         return offsets, data, False
  */
-  __pyx_t_2 = (__pyx_v_c_string != 0);
-  if (__pyx_t_2) {
+  __pyx_t_5 = (__pyx_v_large_offsets != ((PyObject*)Py_None));
+  __pyx_t_8 = (__pyx_t_5 != 0);
+  if (__pyx_t_8) {
 
-    /* "bytehouse_driver/bufferedreader.pyx":175
- * 
- *         if c_string:
- *             PyMem_Free(c_string)             # <<<<<<<<<<<<<<
+    /* "bytehouse_driver/bufferedreader.pyx":312
+ *         PyByteArray_Resize(data, total)
+ *         if large_offsets is not None:
+ *             return large_offsets, data, True             # <<<<<<<<<<<<<<
+ *         return offsets, data, False
  * 
- *         return items
  */
-    PyMem_Free(__pyx_v_c_string);
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 312, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v_large_offsets);
+    __Pyx_GIVEREF(__pyx_v_large_offsets);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_large_offsets);
+    __Pyx_INCREF(__pyx_v_data);
+    __Pyx_GIVEREF(__pyx_v_data);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_data);
+    __Pyx_INCREF(Py_True);
+    __Pyx_GIVEREF(Py_True);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, Py_True);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
 
-    /* "bytehouse_driver/bufferedreader.pyx":174
- *             PyTuple_SET_ITEM(items, i, rv)
- * 
- *         if c_string:             # <<<<<<<<<<<<<<
- *             PyMem_Free(c_string)
+    /* "bytehouse_driver/bufferedreader.pyx":311
  * 
+ *         PyByteArray_Resize(data, total)
+ *         if large_offsets is not None:             # <<<<<<<<<<<<<<
+ *             return large_offsets, data, True
+ *         return offsets, data, False
  */
   }
 
-  /* "bytehouse_driver/bufferedreader.pyx":177
- *             PyMem_Free(c_string)
- * 
- *         return items             # <<<<<<<<<<<<<<
+  /* "bytehouse_driver/bufferedreader.pyx":313
+ *         if large_offsets is not None:
+ *             return large_offsets, data, True
+ *         return offsets, data, False             # <<<<<<<<<<<<<<
  * 
  *     def read_fixed_strings_as_bytes(self, Py_ssize_t n_items,
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_items);
-  __pyx_r = __pyx_v_items;
+  __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 313, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_offsets);
+  __Pyx_GIVEREF(__pyx_v_offsets);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_offsets);
+  __Pyx_INCREF(__pyx_v_data);
+  __Pyx_GIVEREF(__pyx_v_data);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_data);
+  __Pyx_INCREF(Py_False);
+  __Pyx_GIVEREF(Py_False);
+  PyTuple_SET_ITEM(__pyx_t_1, 2, Py_False);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":62
- *         return rv
+  /* "bytehouse_driver/bufferedreader.pyx":230
+ *         return items
  * 
- *     def read_strings(self, unsigned long long n_items, encoding=None):             # <<<<<<<<<<<<<<
+ *     def read_string_buffers(self, unsigned long long n_items):             # <<<<<<<<<<<<<<
  *         """
- *         Python has great overhead between function calls.
+ *         Reads strings into Arrow-compatible buffers without creating string
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_16);
-  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_string_buffers", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_items);
-  __Pyx_XDECREF(__pyx_v_rv);
-  __Pyx_XDECREF(__pyx_v_encoding);
+  __Pyx_XDECREF(__pyx_v_offsets);
+  __Pyx_XDECREF(__pyx_v_large_offsets);
+  __Pyx_XDECREF(__pyx_v_data);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedreader.pyx":179
- *         return items
+/* "bytehouse_driver/bufferedreader.pyx":315
+ *         return offsets, data, False
  * 
  *     def read_fixed_strings_as_bytes(self, Py_ssize_t n_items,             # <<<<<<<<<<<<<<
  *                                     Py_ssize_t length):
@@ -3444,8 +4787,8 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_11read_fixed_strings_as_bytes(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_11read_fixed_strings_as_bytes(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_17read_fixed_strings_as_bytes(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_17read_fixed_strings_as_bytes(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   Py_ssize_t __pyx_v_n_items;
   Py_ssize_t __pyx_v_length;
   int __pyx_lineno = 0;
@@ -3477,11 +4820,11 @@ static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_1
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_length)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("read_fixed_strings_as_bytes", 1, 2, 2, 1); __PYX_ERR(0, 179, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("read_fixed_strings_as_bytes", 1, 2, 2, 1); __PYX_ERR(0, 315, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "read_fixed_strings_as_bytes") < 0)) __PYX_ERR(0, 179, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "read_fixed_strings_as_bytes") < 0)) __PYX_ERR(0, 315, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -3489,25 +4832,25 @@ static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_1
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
-    __pyx_v_n_items = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_n_items == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 179, __pyx_L3_error)
-    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 180, __pyx_L3_error)
+    __pyx_v_n_items = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_n_items == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 315, __pyx_L3_error)
+    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 316, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("read_fixed_strings_as_bytes", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 179, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("read_fixed_strings_as_bytes", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 315, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_fixed_strings_as_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_10read_fixed_strings_as_bytes(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items, __pyx_v_length);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_16read_fixed_strings_as_bytes(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items, __pyx_v_length);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_10read_fixed_strings_as_bytes(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_16read_fixed_strings_as_bytes(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length) {
   Py_ssize_t __pyx_v_i;
   PyObject *__pyx_v_data = NULL;
   char *__pyx_v_data_ptr;
@@ -3528,16 +4871,16 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("read_fixed_strings_as_bytes", 0);
 
-  /* "bytehouse_driver/bufferedreader.pyx":182
+  /* "bytehouse_driver/bufferedreader.pyx":318
  *                                     Py_ssize_t length):
  *         cdef Py_ssize_t i
  *         data = self.read(length * n_items)             # <<<<<<<<<<<<<<
  *         cdef char* data_ptr = PyBytes_AsString(data)
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 318, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyInt_FromSsize_t((__pyx_v_length * __pyx_v_n_items)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __pyx_t_3 = PyInt_FromSsize_t((__pyx_v_length * __pyx_v_n_items)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 318, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -3552,35 +4895,35 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_4, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 182, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 318, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_data = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":183
+  /* "bytehouse_driver/bufferedreader.pyx":319
  *         cdef Py_ssize_t i
  *         data = self.read(length * n_items)
  *         cdef char* data_ptr = PyBytes_AsString(data)             # <<<<<<<<<<<<<<
  * 
  *         items = PyTuple_New(n_items)
  */
-  __pyx_t_5 = PyBytes_AsString(__pyx_v_data); if (unlikely(__pyx_t_5 == ((char *)NULL))) __PYX_ERR(0, 183, __pyx_L1_error)
+  __pyx_t_5 = PyBytes_AsString(__pyx_v_data); if (unlikely(__pyx_t_5 == ((char *)NULL))) __PYX_ERR(0, 319, __pyx_L1_error)
   __pyx_v_data_ptr = __pyx_t_5;
 
-  /* "bytehouse_driver/bufferedreader.pyx":185
+  /* "bytehouse_driver/bufferedreader.pyx":321
  *         cdef char* data_ptr = PyBytes_AsString(data)
  * 
  *         items = PyTuple_New(n_items)             # <<<<<<<<<<<<<<
  *         for i in range(n_items):
  *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)
  */
-  __pyx_t_1 = PyTuple_New(__pyx_v_n_items); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_New(__pyx_v_n_items); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 321, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_items = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":186
+  /* "bytehouse_driver/bufferedreader.pyx":322
  * 
  *         items = PyTuple_New(n_items)
  *         for i in range(n_items):             # <<<<<<<<<<<<<<
@@ -3592,19 +4935,19 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
     __pyx_v_i = __pyx_t_8;
 
-    /* "bytehouse_driver/bufferedreader.pyx":187
+    /* "bytehouse_driver/bufferedreader.pyx":323
  *         items = PyTuple_New(n_items)
  *         for i in range(n_items):
  *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)             # <<<<<<<<<<<<<<
  *             Py_INCREF(item)
  *             PyTuple_SET_ITEM(items, i, item)
  */
-    __pyx_t_1 = PyBytes_FromStringAndSize((&(__pyx_v_data_ptr[(__pyx_v_i * __pyx_v_length)])), __pyx_v_length); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L1_error)
+    __pyx_t_1 = PyBytes_FromStringAndSize((&(__pyx_v_data_ptr[(__pyx_v_i * __pyx_v_length)])), __pyx_v_length); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 323, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_XDECREF_SET(__pyx_v_item, ((PyObject*)__pyx_t_1));
     __pyx_t_1 = 0;
 
-    /* "bytehouse_driver/bufferedreader.pyx":188
+    /* "bytehouse_driver/bufferedreader.pyx":324
  *         for i in range(n_items):
  *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)
  *             Py_INCREF(item)             # <<<<<<<<<<<<<<
@@ -3613,7 +4956,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  */
     Py_INCREF(__pyx_v_item);
 
-    /* "bytehouse_driver/bufferedreader.pyx":189
+    /* "bytehouse_driver/bufferedreader.pyx":325
  *             item = PyBytes_FromStringAndSize(&data_ptr[i * length], length)
  *             Py_INCREF(item)
  *             PyTuple_SET_ITEM(items, i, item)             # <<<<<<<<<<<<<<
@@ -3623,7 +4966,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
     PyTuple_SET_ITEM(__pyx_v_items, __pyx_v_i, __pyx_v_item);
   }
 
-  /* "bytehouse_driver/bufferedreader.pyx":190
+  /* "bytehouse_driver/bufferedreader.pyx":326
  *             Py_INCREF(item)
  *             PyTuple_SET_ITEM(items, i, item)
  *         return items             # <<<<<<<<<<<<<<
@@ -3635,8 +4978,8 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   __pyx_r = __pyx_v_items;
   goto __pyx_L0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":179
- *         return items
+  /* "bytehouse_driver/bufferedreader.pyx":315
+ *         return offsets, data, False
  * 
  *     def read_fixed_strings_as_bytes(self, Py_ssize_t n_items,             # <<<<<<<<<<<<<<
  *                                     Py_ssize_t length):
@@ -3660,7 +5003,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedreader.pyx":192
+/* "bytehouse_driver/bufferedreader.pyx":328
  *         return items
  * 
  *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,             # <<<<<<<<<<<<<<
@@ -3669,8 +5012,8 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_19read_fixed_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_19read_fixed_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   Py_ssize_t __pyx_v_n_items;
   Py_ssize_t __pyx_v_length;
   PyObject *__pyx_v_encoding = 0;
@@ -3684,7 +5027,7 @@ static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_1
     static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_n_items,&__pyx_n_s_length,&__pyx_n_s_encoding,0};
     PyObject* values[3] = {0,0,0};
 
-    /* "bytehouse_driver/bufferedreader.pyx":193
+    /* "bytehouse_driver/bufferedreader.pyx":329
  * 
  *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,
  *                            encoding=None):             # <<<<<<<<<<<<<<
@@ -3714,7 +5057,7 @@ static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_1
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_length)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("read_fixed_strings", 0, 2, 3, 1); __PYX_ERR(0, 192, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("read_fixed_strings", 0, 2, 3, 1); __PYX_ERR(0, 328, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
@@ -3724,7 +5067,7 @@ static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_1
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "read_fixed_strings") < 0)) __PYX_ERR(0, 192, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "read_fixed_strings") < 0)) __PYX_ERR(0, 328, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -3736,21 +5079,21 @@ static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_1
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_n_items = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_n_items == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 192, __pyx_L3_error)
-    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 192, __pyx_L3_error)
+    __pyx_v_n_items = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_n_items == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 328, __pyx_L3_error)
+    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 328, __pyx_L3_error)
     __pyx_v_encoding = values[2];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("read_fixed_strings", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 192, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("read_fixed_strings", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 328, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_fixed_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_12read_fixed_strings(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items, __pyx_v_length, __pyx_v_encoding);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_18read_fixed_strings(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), __pyx_v_n_items, __pyx_v_length, __pyx_v_encoding);
 
-  /* "bytehouse_driver/bufferedreader.pyx":192
+  /* "bytehouse_driver/bufferedreader.pyx":328
  *         return items
  * 
  *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,             # <<<<<<<<<<<<<<
@@ -3763,7 +5106,7 @@ static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_12read_fixed_strings(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length, PyObject *__pyx_v_encoding) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_18read_fixed_strings(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, Py_ssize_t __pyx_v_n_items, Py_ssize_t __pyx_v_length, PyObject *__pyx_v_encoding) {
   Py_ssize_t __pyx_v_i;
   Py_ssize_t __pyx_v_j;
   char *__pyx_v_c_encoding;
@@ -3796,7 +5139,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   __Pyx_RefNannySetupContext("read_fixed_strings", 0);
   __Pyx_INCREF(__pyx_v_encoding);
 
-  /* "bytehouse_driver/bufferedreader.pyx":194
+  /* "bytehouse_driver/bufferedreader.pyx":330
  *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,
  *                            encoding=None):
  *         if encoding is None:             # <<<<<<<<<<<<<<
@@ -3807,7 +5150,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "bytehouse_driver/bufferedreader.pyx":195
+    /* "bytehouse_driver/bufferedreader.pyx":331
  *                            encoding=None):
  *         if encoding is None:
  *             return self.read_fixed_strings_as_bytes(n_items, length)             # <<<<<<<<<<<<<<
@@ -3815,11 +5158,11 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  *         cdef Py_ssize_t i, j
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_fixed_strings_as_bytes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 195, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_fixed_strings_as_bytes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 331, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_n_items); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 195, __pyx_L1_error)
+    __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_n_items); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 331, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = PyInt_FromSsize_t(__pyx_v_length); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 195, __pyx_L1_error)
+    __pyx_t_6 = PyInt_FromSsize_t(__pyx_v_length); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 331, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __pyx_t_7 = NULL;
     __pyx_t_8 = 0;
@@ -3836,7 +5179,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_4)) {
       PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_t_5, __pyx_t_6};
-      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 195, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 331, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -3846,7 +5189,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
       PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_t_5, __pyx_t_6};
-      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 195, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 331, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -3854,7 +5197,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
     } else
     #endif
     {
-      __pyx_t_9 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 195, __pyx_L1_error)
+      __pyx_t_9 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 331, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       if (__pyx_t_7) {
         __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
@@ -3865,7 +5208,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
       PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, __pyx_t_6);
       __pyx_t_5 = 0;
       __pyx_t_6 = 0;
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 195, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 331, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     }
@@ -3874,7 +5217,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
     __pyx_t_3 = 0;
     goto __pyx_L0;
 
-    /* "bytehouse_driver/bufferedreader.pyx":194
+    /* "bytehouse_driver/bufferedreader.pyx":330
  *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,
  *                            encoding=None):
  *         if encoding is None:             # <<<<<<<<<<<<<<
@@ -3883,14 +5226,14 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  */
   }
 
-  /* "bytehouse_driver/bufferedreader.pyx":198
+  /* "bytehouse_driver/bufferedreader.pyx":334
  * 
  *         cdef Py_ssize_t i, j
  *         encoding = encoding.encode('utf-8')             # <<<<<<<<<<<<<<
  *         cdef char* c_encoding = encoding
  *         data = self.read(length * n_items)
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 334, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_9 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
@@ -3904,32 +5247,32 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   }
   __pyx_t_3 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_9, __pyx_kp_u_utf_8) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_kp_u_utf_8);
   __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 198, __pyx_L1_error)
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 334, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF_SET(__pyx_v_encoding, __pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":199
+  /* "bytehouse_driver/bufferedreader.pyx":335
  *         cdef Py_ssize_t i, j
  *         encoding = encoding.encode('utf-8')
  *         cdef char* c_encoding = encoding             # <<<<<<<<<<<<<<
  *         data = self.read(length * n_items)
  *         cdef char* data_ptr = PyBytes_AsString(data)
  */
-  __pyx_t_10 = __Pyx_PyObject_AsWritableString(__pyx_v_encoding); if (unlikely((!__pyx_t_10) && PyErr_Occurred())) __PYX_ERR(0, 199, __pyx_L1_error)
+  __pyx_t_10 = __Pyx_PyObject_AsWritableString(__pyx_v_encoding); if (unlikely((!__pyx_t_10) && PyErr_Occurred())) __PYX_ERR(0, 335, __pyx_L1_error)
   __pyx_v_c_encoding = __pyx_t_10;
 
-  /* "bytehouse_driver/bufferedreader.pyx":200
+  /* "bytehouse_driver/bufferedreader.pyx":336
  *         encoding = encoding.encode('utf-8')
  *         cdef char* c_encoding = encoding
  *         data = self.read(length * n_items)             # <<<<<<<<<<<<<<
  *         cdef char* data_ptr = PyBytes_AsString(data)
  * 
  */
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 200, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 336, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_9 = PyInt_FromSsize_t((__pyx_v_length * __pyx_v_n_items)); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 200, __pyx_L1_error)
+  __pyx_t_9 = PyInt_FromSsize_t((__pyx_v_length * __pyx_v_n_items)); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 336, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __pyx_t_6 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
@@ -3944,23 +5287,23 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_6, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_9);
   __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L1_error)
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 336, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_v_data = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":201
+  /* "bytehouse_driver/bufferedreader.pyx":337
  *         cdef char* c_encoding = encoding
  *         data = self.read(length * n_items)
  *         cdef char* data_ptr = PyBytes_AsString(data)             # <<<<<<<<<<<<<<
  * 
  *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)
  */
-  __pyx_t_10 = PyBytes_AsString(__pyx_v_data); if (unlikely(__pyx_t_10 == ((char *)NULL))) __PYX_ERR(0, 201, __pyx_L1_error)
+  __pyx_t_10 = PyBytes_AsString(__pyx_v_data); if (unlikely(__pyx_t_10 == ((char *)NULL))) __PYX_ERR(0, 337, __pyx_L1_error)
   __pyx_v_data_ptr = __pyx_t_10;
 
-  /* "bytehouse_driver/bufferedreader.pyx":203
+  /* "bytehouse_driver/bufferedreader.pyx":339
  *         cdef char* data_ptr = PyBytes_AsString(data)
  * 
  *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)             # <<<<<<<<<<<<<<
@@ -3969,7 +5312,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  */
   __pyx_v_c_string = ((char *)PyMem_Malloc((__pyx_v_length + 1)));
 
-  /* "bytehouse_driver/bufferedreader.pyx":204
+  /* "bytehouse_driver/bufferedreader.pyx":340
  * 
  *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)
  *         if not c_string:             # <<<<<<<<<<<<<<
@@ -3979,16 +5322,16 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   __pyx_t_2 = ((!(__pyx_v_c_string != 0)) != 0);
   if (unlikely(__pyx_t_2)) {
 
-    /* "bytehouse_driver/bufferedreader.pyx":205
+    /* "bytehouse_driver/bufferedreader.pyx":341
  *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)
  *         if not c_string:
  *             raise MemoryError()             # <<<<<<<<<<<<<<
  *         c_string[length] = 0
  * 
  */
-    PyErr_NoMemory(); __PYX_ERR(0, 205, __pyx_L1_error)
+    PyErr_NoMemory(); __PYX_ERR(0, 341, __pyx_L1_error)
 
-    /* "bytehouse_driver/bufferedreader.pyx":204
+    /* "bytehouse_driver/bufferedreader.pyx":340
  * 
  *         cdef char* c_string = <char *>PyMem_Malloc(length + 1)
  *         if not c_string:             # <<<<<<<<<<<<<<
@@ -3997,7 +5340,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  */
   }
 
-  /* "bytehouse_driver/bufferedreader.pyx":206
+  /* "bytehouse_driver/bufferedreader.pyx":342
  *         if not c_string:
  *             raise MemoryError()
  *         c_string[length] = 0             # <<<<<<<<<<<<<<
@@ -4006,19 +5349,19 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  */
   (__pyx_v_c_string[__pyx_v_length]) = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":208
+  /* "bytehouse_driver/bufferedreader.pyx":344
  *         c_string[length] = 0
  * 
  *         items = PyTuple_New(n_items)             # <<<<<<<<<<<<<<
  *         for i in range(n_items):
  *             memcpy(c_string, &data_ptr[i * length], length)
  */
-  __pyx_t_3 = PyTuple_New(__pyx_v_n_items); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(__pyx_v_n_items); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 344, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_v_items = ((PyObject*)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":209
+  /* "bytehouse_driver/bufferedreader.pyx":345
  * 
  *         items = PyTuple_New(n_items)
  *         for i in range(n_items):             # <<<<<<<<<<<<<<
@@ -4030,7 +5373,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
     __pyx_v_i = __pyx_t_13;
 
-    /* "bytehouse_driver/bufferedreader.pyx":210
+    /* "bytehouse_driver/bufferedreader.pyx":346
  *         items = PyTuple_New(n_items)
  *         for i in range(n_items):
  *             memcpy(c_string, &data_ptr[i * length], length)             # <<<<<<<<<<<<<<
@@ -4039,7 +5382,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  */
     (void)(memcpy(__pyx_v_c_string, (&(__pyx_v_data_ptr[(__pyx_v_i * __pyx_v_length)])), __pyx_v_length));
 
-    /* "bytehouse_driver/bufferedreader.pyx":213
+    /* "bytehouse_driver/bufferedreader.pyx":349
  * 
  *             # Get last non zero byte of string from the end.
  *             j = length - 1             # <<<<<<<<<<<<<<
@@ -4048,7 +5391,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  */
     __pyx_v_j = (__pyx_v_length - 1);
 
-    /* "bytehouse_driver/bufferedreader.pyx":214
+    /* "bytehouse_driver/bufferedreader.pyx":350
  *             # Get last non zero byte of string from the end.
  *             j = length - 1
  *             while j >= 0 and not c_string[j]:             # <<<<<<<<<<<<<<
@@ -4067,7 +5410,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
       __pyx_L9_bool_binop_done:;
       if (!__pyx_t_2) break;
 
-      /* "bytehouse_driver/bufferedreader.pyx":215
+      /* "bytehouse_driver/bufferedreader.pyx":351
  *             j = length - 1
  *             while j >= 0 and not c_string[j]:
  *                 j -= 1             # <<<<<<<<<<<<<<
@@ -4077,7 +5420,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
       __pyx_v_j = (__pyx_v_j - 1);
     }
 
-    /* "bytehouse_driver/bufferedreader.pyx":217
+    /* "bytehouse_driver/bufferedreader.pyx":353
  *                 j -= 1
  * 
  *             try:             # <<<<<<<<<<<<<<
@@ -4093,19 +5436,19 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
       __Pyx_XGOTREF(__pyx_t_16);
       /*try:*/ {
 
-        /* "bytehouse_driver/bufferedreader.pyx":218
+        /* "bytehouse_driver/bufferedreader.pyx":354
  * 
  *             try:
  *                 item = c_string[:j + 1].decode(c_encoding)             # <<<<<<<<<<<<<<
  *             except UnicodeDecodeError:
  *                 item = PyBytes_FromStringAndSize(c_string, length)
  */
-        __pyx_t_3 = __Pyx_decode_c_string(__pyx_v_c_string, 0, (__pyx_v_j + 1), __pyx_v_c_encoding, NULL, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 218, __pyx_L11_error)
+        __pyx_t_3 = __Pyx_decode_c_string(__pyx_v_c_string, 0, (__pyx_v_j + 1), __pyx_v_c_encoding, NULL, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 354, __pyx_L11_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_3);
         __pyx_t_3 = 0;
 
-        /* "bytehouse_driver/bufferedreader.pyx":217
+        /* "bytehouse_driver/bufferedreader.pyx":353
  *                 j -= 1
  * 
  *             try:             # <<<<<<<<<<<<<<
@@ -4125,7 +5468,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-      /* "bytehouse_driver/bufferedreader.pyx":219
+      /* "bytehouse_driver/bufferedreader.pyx":355
  *             try:
  *                 item = c_string[:j + 1].decode(c_encoding)
  *             except UnicodeDecodeError:             # <<<<<<<<<<<<<<
@@ -4135,19 +5478,19 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
       __pyx_t_8 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_UnicodeDecodeError);
       if (__pyx_t_8) {
         __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.read_fixed_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
-        if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_4, &__pyx_t_9) < 0) __PYX_ERR(0, 219, __pyx_L13_except_error)
+        if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_4, &__pyx_t_9) < 0) __PYX_ERR(0, 355, __pyx_L13_except_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_GOTREF(__pyx_t_9);
 
-        /* "bytehouse_driver/bufferedreader.pyx":220
+        /* "bytehouse_driver/bufferedreader.pyx":356
  *                 item = c_string[:j + 1].decode(c_encoding)
  *             except UnicodeDecodeError:
  *                 item = PyBytes_FromStringAndSize(c_string, length)             # <<<<<<<<<<<<<<
  *             Py_INCREF(item)
  *             PyTuple_SET_ITEM(items, i, item)
  */
-        __pyx_t_6 = PyBytes_FromStringAndSize(__pyx_v_c_string, __pyx_v_length); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 220, __pyx_L13_except_error)
+        __pyx_t_6 = PyBytes_FromStringAndSize(__pyx_v_c_string, __pyx_v_length); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 356, __pyx_L13_except_error)
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_6);
         __pyx_t_6 = 0;
@@ -4159,7 +5502,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
       goto __pyx_L13_except_error;
       __pyx_L13_except_error:;
 
-      /* "bytehouse_driver/bufferedreader.pyx":217
+      /* "bytehouse_driver/bufferedreader.pyx":353
  *                 j -= 1
  * 
  *             try:             # <<<<<<<<<<<<<<
@@ -4179,7 +5522,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
       __pyx_L18_try_end:;
     }
 
-    /* "bytehouse_driver/bufferedreader.pyx":221
+    /* "bytehouse_driver/bufferedreader.pyx":357
  *             except UnicodeDecodeError:
  *                 item = PyBytes_FromStringAndSize(c_string, length)
  *             Py_INCREF(item)             # <<<<<<<<<<<<<<
@@ -4188,7 +5531,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  */
     Py_INCREF(__pyx_v_item);
 
-    /* "bytehouse_driver/bufferedreader.pyx":222
+    /* "bytehouse_driver/bufferedreader.pyx":358
  *                 item = PyBytes_FromStringAndSize(c_string, length)
  *             Py_INCREF(item)
  *             PyTuple_SET_ITEM(items, i, item)             # <<<<<<<<<<<<<<
@@ -4198,7 +5541,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
     PyTuple_SET_ITEM(__pyx_v_items, __pyx_v_i, __pyx_v_item);
   }
 
-  /* "bytehouse_driver/bufferedreader.pyx":224
+  /* "bytehouse_driver/bufferedreader.pyx":360
  *             PyTuple_SET_ITEM(items, i, item)
  * 
  *         PyMem_Free(c_string)             # <<<<<<<<<<<<<<
@@ -4207,7 +5550,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  */
   PyMem_Free(__pyx_v_c_string);
 
-  /* "bytehouse_driver/bufferedreader.pyx":226
+  /* "bytehouse_driver/bufferedreader.pyx":362
  *         PyMem_Free(c_string)
  * 
  *         return items             # <<<<<<<<<<<<<<
@@ -4219,7 +5562,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   __pyx_r = __pyx_v_items;
   goto __pyx_L0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":192
+  /* "bytehouse_driver/bufferedreader.pyx":328
  *         return items
  * 
  *     def read_fixed_strings(self, Py_ssize_t n_items, Py_ssize_t length,             # <<<<<<<<<<<<<<
@@ -4247,12 +5590,12 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedreader.pyx":11
+/* "bytehouse_driver/bufferedreader.pyx":14
  * 
  * cdef class BufferedReader(object):
  *     cdef public unsigned long long position, current_buffer_size             # <<<<<<<<<<<<<<
  *     cdef public bytearray buffer
- * 
+ *     # Views returned by `read_view` are overwritten on refill.
  */
 
 /* Python wrapper */
@@ -4277,7 +5620,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->position); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->position); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -4315,7 +5658,7 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_8positi
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 14, __pyx_L1_error)
   __pyx_v_self->position = __pyx_t_1;
 
   /* function exit code */
@@ -4351,7 +5694,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->current_buffer_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->current_buffer_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -4389,7 +5732,7 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_19curre
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 14, __pyx_L1_error)
   __pyx_v_self->current_buffer_size = __pyx_t_1;
 
   /* function exit code */
@@ -4403,12 +5746,12 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_19curre
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedreader.pyx":12
+/* "bytehouse_driver/bufferedreader.pyx":15
  * cdef class BufferedReader(object):
  *     cdef public unsigned long long position, current_buffer_size
  *     cdef public bytearray buffer             # <<<<<<<<<<<<<<
- * 
- *     def __init__(self, bufsize):
+ *     # Views returned by `read_view` are overwritten on refill.
+ *     cdef public bint refills_in_place
  */
 
 /* Python wrapper */
@@ -4461,7 +5804,7 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  if (!(likely(PyByteArray_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytearray", Py_TYPE(__pyx_v_value)->tp_name), 0))) __PYX_ERR(0, 12, __pyx_L1_error)
+  if (!(likely(PyByteArray_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytearray", Py_TYPE(__pyx_v_value)->tp_name), 0))) __PYX_ERR(0, 15, __pyx_L1_error)
   __pyx_t_1 = __pyx_v_value;
   __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -4471,42 +5814,124 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer
   __pyx_t_1 = 0;
 
   /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.buffer.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer_5__del__(PyObject *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer_4__del__(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer_4__del__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->buffer);
+  __Pyx_DECREF(__pyx_v_self->buffer);
+  __pyx_v_self->buffer = ((PyObject*)Py_None);
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bytehouse_driver/bufferedreader.pyx":17
+ *     cdef public bytearray buffer
+ *     # Views returned by `read_view` are overwritten on refill.
+ *     cdef public bint refills_in_place             # <<<<<<<<<<<<<<
+ * 
+ *     def __init__(self, bufsize):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_16refills_in_place_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_16refills_in_place_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_16refills_in_place___get__(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_16refills_in_place___get__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->refills_in_place); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.buffer.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.refills_in_place.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static int __pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer_5__del__(PyObject *__pyx_v_self); /*proto*/
-static int __pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer_5__del__(PyObject *__pyx_v_self) {
+static int __pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_16refills_in_place_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_16refills_in_place_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
   int __pyx_r;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer_4__del__(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_16refills_in_place_2__set__(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), ((PyObject *)__pyx_v_value));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer_4__del__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self) {
+static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_16refills_in_place_2__set__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v_value) {
   int __pyx_r;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__del__", 0);
-  __Pyx_INCREF(Py_None);
-  __Pyx_GIVEREF(Py_None);
-  __Pyx_GOTREF(__pyx_v_self->buffer);
-  __Pyx_DECREF(__pyx_v_self->buffer);
-  __pyx_v_self->buffer = ((PyObject*)Py_None);
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 17, __pyx_L1_error)
+  __pyx_v_self->refills_in_place = __pyx_t_1;
 
   /* function exit code */
   __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.refills_in_place.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
@@ -4518,19 +5943,19 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_6buffer
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_15__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_15__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_21__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_21__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_14__reduce_cython__(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self));
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_20__reduce_cython__(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_14__reduce_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_20__reduce_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self) {
   PyObject *__pyx_v_state = 0;
   PyObject *__pyx_v__dict = 0;
   int __pyx_v_use_setstate;
@@ -4539,8 +5964,9 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
+  PyObject *__pyx_t_4 = NULL;
   int __pyx_t_5;
+  int __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -4549,7 +5975,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   /* "(tree fragment)":5
  *     cdef object _dict
  *     cdef bint use_setstate
- *     state = (self.buffer, self.current_buffer_size, self.position)             # <<<<<<<<<<<<<<
+ *     state = (self.buffer, self.current_buffer_size, self.position, self.refills_in_place)             # <<<<<<<<<<<<<<
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None:
  */
@@ -4557,42 +5983,47 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->position); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_v_self->refills_in_place); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
   __Pyx_INCREF(__pyx_v_self->buffer);
   __Pyx_GIVEREF(__pyx_v_self->buffer);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_self->buffer);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_self->buffer);
   __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 3, __pyx_t_3);
   __pyx_t_1 = 0;
   __pyx_t_2 = 0;
-  __pyx_v_state = ((PyObject*)__pyx_t_3);
   __pyx_t_3 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
 
   /* "(tree fragment)":6
  *     cdef bint use_setstate
- *     state = (self.buffer, self.current_buffer_size, self.position)
+ *     state = (self.buffer, self.current_buffer_size, self.position, self.refills_in_place)
  *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
  *     if _dict is not None:
  *         state += (_dict,)
  */
-  __pyx_t_3 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 6, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_v__dict = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_t_4 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v__dict = __pyx_t_4;
+  __pyx_t_4 = 0;
 
   /* "(tree fragment)":7
- *     state = (self.buffer, self.current_buffer_size, self.position)
+ *     state = (self.buffer, self.current_buffer_size, self.position, self.refills_in_place)
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None:             # <<<<<<<<<<<<<<
  *         state += (_dict,)
  *         use_setstate = True
  */
-  __pyx_t_4 = (__pyx_v__dict != Py_None);
-  __pyx_t_5 = (__pyx_t_4 != 0);
-  if (__pyx_t_5) {
+  __pyx_t_5 = (__pyx_v__dict != Py_None);
+  __pyx_t_6 = (__pyx_t_5 != 0);
+  if (__pyx_t_6) {
 
     /* "(tree fragment)":8
  *     _dict = getattr(self, '__dict__', None)
@@ -4601,16 +6032,16 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  *         use_setstate = True
  *     else:
  */
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(__pyx_v__dict);
     __Pyx_GIVEREF(__pyx_v__dict);
-    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v__dict);
-    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 8, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_2));
-    __pyx_t_2 = 0;
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v__dict);
+    __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_3));
+    __pyx_t_3 = 0;
 
     /* "(tree fragment)":9
  *     if _dict is not None:
@@ -4622,7 +6053,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
     __pyx_v_use_setstate = 1;
 
     /* "(tree fragment)":7
- *     state = (self.buffer, self.current_buffer_size, self.position)
+ *     state = (self.buffer, self.current_buffer_size, self.position, self.refills_in_place)
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None:             # <<<<<<<<<<<<<<
  *         state += (_dict,)
@@ -4636,11 +6067,11 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  *     else:
  *         use_setstate = self.buffer is not None             # <<<<<<<<<<<<<<
  *     if use_setstate:
- *         return __pyx_unpickle_BufferedReader, (type(self), 0x2a8a945, None), state
+ *         return __pyx_unpickle_BufferedReader, (type(self), 0x0d82568, None), state
  */
   /*else*/ {
-    __pyx_t_5 = (__pyx_v_self->buffer != ((PyObject*)Py_None));
-    __pyx_v_use_setstate = __pyx_t_5;
+    __pyx_t_6 = (__pyx_v_self->buffer != ((PyObject*)Py_None));
+    __pyx_v_use_setstate = __pyx_t_6;
   }
   __pyx_L3:;
 
@@ -4648,89 +6079,89 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
  *     else:
  *         use_setstate = self.buffer is not None
  *     if use_setstate:             # <<<<<<<<<<<<<<
- *         return __pyx_unpickle_BufferedReader, (type(self), 0x2a8a945, None), state
+ *         return __pyx_unpickle_BufferedReader, (type(self), 0x0d82568, None), state
  *     else:
  */
-  __pyx_t_5 = (__pyx_v_use_setstate != 0);
-  if (__pyx_t_5) {
+  __pyx_t_6 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_6) {
 
     /* "(tree fragment)":13
  *         use_setstate = self.buffer is not None
  *     if use_setstate:
- *         return __pyx_unpickle_BufferedReader, (type(self), 0x2a8a945, None), state             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_BufferedReader, (type(self), 0x0d82568, None), state             # <<<<<<<<<<<<<<
  *     else:
- *         return __pyx_unpickle_BufferedReader, (type(self), 0x2a8a945, state)
+ *         return __pyx_unpickle_BufferedReader, (type(self), 0x0d82568, state)
  */
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_BufferedReader); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_pyx_unpickle_BufferedReader); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
     __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    __Pyx_INCREF(__pyx_int_44607813);
-    __Pyx_GIVEREF(__pyx_int_44607813);
-    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_44607813);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_14165352);
+    __Pyx_GIVEREF(__pyx_int_14165352);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_int_14165352);
     __Pyx_INCREF(Py_None);
     __Pyx_GIVEREF(Py_None);
-    PyTuple_SET_ITEM(__pyx_t_3, 2, Py_None);
-    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_2);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_4, 2, Py_None);
+    __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
     __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_4);
     __Pyx_INCREF(__pyx_v_state);
     __Pyx_GIVEREF(__pyx_v_state);
-    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
-    __pyx_t_2 = 0;
+    PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_state);
     __pyx_t_3 = 0;
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
+    __pyx_t_4 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
     goto __pyx_L0;
 
     /* "(tree fragment)":12
  *     else:
  *         use_setstate = self.buffer is not None
  *     if use_setstate:             # <<<<<<<<<<<<<<
- *         return __pyx_unpickle_BufferedReader, (type(self), 0x2a8a945, None), state
+ *         return __pyx_unpickle_BufferedReader, (type(self), 0x0d82568, None), state
  *     else:
  */
   }
 
   /* "(tree fragment)":15
- *         return __pyx_unpickle_BufferedReader, (type(self), 0x2a8a945, None), state
+ *         return __pyx_unpickle_BufferedReader, (type(self), 0x0d82568, None), state
  *     else:
- *         return __pyx_unpickle_BufferedReader, (type(self), 0x2a8a945, state)             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_BufferedReader, (type(self), 0x0d82568, state)             # <<<<<<<<<<<<<<
  * def __setstate_cython__(self, __pyx_state):
  *     __pyx_unpickle_BufferedReader__set_state(self, __pyx_state)
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_BufferedReader); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_BufferedReader); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
     __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    __Pyx_INCREF(__pyx_int_44607813);
-    __Pyx_GIVEREF(__pyx_int_44607813);
-    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_44607813);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_14165352);
+    __Pyx_GIVEREF(__pyx_int_14165352);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_int_14165352);
     __Pyx_INCREF(__pyx_v_state);
     __Pyx_GIVEREF(__pyx_v_state);
-    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_state);
-    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_1);
-    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
-    __pyx_t_1 = 0;
-    __pyx_t_3 = 0;
-    __pyx_r = __pyx_t_2;
+    PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_state);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_4);
     __pyx_t_2 = 0;
+    __pyx_t_4 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
     goto __pyx_L0;
   }
 
@@ -4745,6 +6176,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedReader.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -4757,25 +6189,25 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
 
 /* "(tree fragment)":16
  *     else:
- *         return __pyx_unpickle_BufferedReader, (type(self), 0x2a8a945, state)
+ *         return __pyx_unpickle_BufferedReader, (type(self), 0x0d82568, state)
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_BufferedReader__set_state(self, __pyx_state)
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_17__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_17__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_23__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_23__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_16__setstate_cython__(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_22__setstate_cython__(((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_16__setstate_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_22__setstate_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4785,7 +6217,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
   /* "(tree fragment)":17
- *         return __pyx_unpickle_BufferedReader, (type(self), 0x2a8a945, state)
+ *         return __pyx_unpickle_BufferedReader, (type(self), 0x0d82568, state)
  * def __setstate_cython__(self, __pyx_state):
  *     __pyx_unpickle_BufferedReader__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
  */
@@ -4796,7 +6228,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
 
   /* "(tree fragment)":16
  *     else:
- *         return __pyx_unpickle_BufferedReader, (type(self), 0x2a8a945, state)
+ *         return __pyx_unpickle_BufferedReader, (type(self), 0x0d82568, state)
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_BufferedReader__set_state(self, __pyx_state)
  */
@@ -4814,7 +6246,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_14BufferedReader_1
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedreader.pyx":232
+/* "bytehouse_driver/bufferedreader.pyx":368
  *     cdef object sock
  * 
  *     def __init__(self, sock, bufsize):             # <<<<<<<<<<<<<<
@@ -4856,11 +6288,11 @@ static int __pyx_pw_16bytehouse_driver_14bufferedreader_20BufferedSocketReader_1
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bufsize)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 232, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 368, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 232, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 368, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -4873,7 +6305,7 @@ static int __pyx_pw_16bytehouse_driver_14bufferedreader_20BufferedSocketReader_1
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 232, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 368, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedSocketReader.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -4897,7 +6329,7 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketReader__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "bytehouse_driver/bufferedreader.pyx":233
+  /* "bytehouse_driver/bufferedreader.pyx":369
  * 
  *     def __init__(self, sock, bufsize):
  *         self.sock = sock             # <<<<<<<<<<<<<<
@@ -4910,14 +6342,14 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketReader__
   __Pyx_DECREF(__pyx_v_self->sock);
   __pyx_v_self->sock = __pyx_v_sock;
 
-  /* "bytehouse_driver/bufferedreader.pyx":234
+  /* "bytehouse_driver/bufferedreader.pyx":370
  *     def __init__(self, sock, bufsize):
  *         self.sock = sock
  *         super(BufferedSocketReader, self).__init__(bufsize)             # <<<<<<<<<<<<<<
  * 
  *     def read_into_buffer(self):
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 370, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedreader_BufferedSocketReader));
   __Pyx_GIVEREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedreader_BufferedSocketReader));
@@ -4925,10 +6357,10 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketReader__
   __Pyx_INCREF(((PyObject *)__pyx_v_self));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
   PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 370, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 370, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -4943,12 +6375,12 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketReader__
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_bufsize) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_bufsize);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 234, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 370, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":232
+  /* "bytehouse_driver/bufferedreader.pyx":368
  *     cdef object sock
  * 
  *     def __init__(self, sock, bufsize):             # <<<<<<<<<<<<<<
@@ -4970,7 +6402,7 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketReader__
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedreader.pyx":236
+/* "bytehouse_driver/bufferedreader.pyx":372
  *         super(BufferedSocketReader, self).__init__(bufsize)
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
@@ -5004,14 +6436,14 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("read_into_buffer", 0);
 
-  /* "bytehouse_driver/bufferedreader.pyx":237
+  /* "bytehouse_driver/bufferedreader.pyx":373
  * 
  *     def read_into_buffer(self):
  *         self.current_buffer_size = self.sock.recv_into(self.buffer)             # <<<<<<<<<<<<<<
  * 
  *         if self.current_buffer_size == 0:
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->sock, __pyx_n_s_recv_into); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 237, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->sock, __pyx_n_s_recv_into); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -5025,14 +6457,14 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_self->__pyx_base.buffer) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_self->__pyx_base.buffer);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 237, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_4 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_4 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 237, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_4 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_self->__pyx_base.current_buffer_size = __pyx_t_4;
 
-  /* "bytehouse_driver/bufferedreader.pyx":239
+  /* "bytehouse_driver/bufferedreader.pyx":375
  *         self.current_buffer_size = self.sock.recv_into(self.buffer)
  * 
  *         if self.current_buffer_size == 0:             # <<<<<<<<<<<<<<
@@ -5042,20 +6474,20 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
   __pyx_t_5 = ((__pyx_v_self->__pyx_base.current_buffer_size == 0) != 0);
   if (unlikely(__pyx_t_5)) {
 
-    /* "bytehouse_driver/bufferedreader.pyx":240
+    /* "bytehouse_driver/bufferedreader.pyx":376
  * 
  *         if self.current_buffer_size == 0:
  *             raise EOFError('Unexpected EOF while reading bytes')             # <<<<<<<<<<<<<<
  * 
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_EOFError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 240, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_EOFError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 376, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 240, __pyx_L1_error)
+    __PYX_ERR(0, 376, __pyx_L1_error)
 
-    /* "bytehouse_driver/bufferedreader.pyx":239
+    /* "bytehouse_driver/bufferedreader.pyx":375
  *         self.current_buffer_size = self.sock.recv_into(self.buffer)
  * 
  *         if self.current_buffer_size == 0:             # <<<<<<<<<<<<<<
@@ -5064,7 +6496,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
  */
   }
 
-  /* "bytehouse_driver/bufferedreader.pyx":236
+  /* "bytehouse_driver/bufferedreader.pyx":372
  *         super(BufferedSocketReader, self).__init__(bufsize)
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
@@ -5115,9 +6547,10 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
+  PyObject *__pyx_t_4 = NULL;
   int __pyx_t_5;
   int __pyx_t_6;
+  int __pyx_t_7;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -5126,7 +6559,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
   /* "(tree fragment)":5
  *     cdef object _dict
  *     cdef bint use_setstate
- *     state = (self.buffer, self.current_buffer_size, self.position, self.sock)             # <<<<<<<<<<<<<<
+ *     state = (self.buffer, self.current_buffer_size, self.position, self.refills_in_place, self.sock)             # <<<<<<<<<<<<<<
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None:
  */
@@ -5134,45 +6567,50 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->__pyx_base.position); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_v_self->__pyx_base.refills_in_place); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(5); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
   __Pyx_INCREF(__pyx_v_self->__pyx_base.buffer);
   __Pyx_GIVEREF(__pyx_v_self->__pyx_base.buffer);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_self->__pyx_base.buffer);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_self->__pyx_base.buffer);
   __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 3, __pyx_t_3);
   __Pyx_INCREF(__pyx_v_self->sock);
   __Pyx_GIVEREF(__pyx_v_self->sock);
-  PyTuple_SET_ITEM(__pyx_t_3, 3, __pyx_v_self->sock);
+  PyTuple_SET_ITEM(__pyx_t_4, 4, __pyx_v_self->sock);
   __pyx_t_1 = 0;
   __pyx_t_2 = 0;
-  __pyx_v_state = ((PyObject*)__pyx_t_3);
   __pyx_t_3 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
 
   /* "(tree fragment)":6
  *     cdef bint use_setstate
- *     state = (self.buffer, self.current_buffer_size, self.position, self.sock)
+ *     state = (self.buffer, self.current_buffer_size, self.position, self.refills_in_place, self.sock)
  *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
  *     if _dict is not None:
  *         state += (_dict,)
  */
-  __pyx_t_3 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 6, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_v__dict = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_t_4 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v__dict = __pyx_t_4;
+  __pyx_t_4 = 0;
 
   /* "(tree fragment)":7
- *     state = (self.buffer, self.current_buffer_size, self.position, self.sock)
+ *     state = (self.buffer, self.current_buffer_size, self.position, self.refills_in_place, self.sock)
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None:             # <<<<<<<<<<<<<<
  *         state += (_dict,)
  *         use_setstate = True
  */
-  __pyx_t_4 = (__pyx_v__dict != Py_None);
-  __pyx_t_5 = (__pyx_t_4 != 0);
-  if (__pyx_t_5) {
+  __pyx_t_5 = (__pyx_v__dict != Py_None);
+  __pyx_t_6 = (__pyx_t_5 != 0);
+  if (__pyx_t_6) {
 
     /* "(tree fragment)":8
  *     _dict = getattr(self, '__dict__', None)
@@ -5181,16 +6619,16 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
  *         use_setstate = True
  *     else:
  */
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(__pyx_v__dict);
     __Pyx_GIVEREF(__pyx_v__dict);
-    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v__dict);
-    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 8, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_2));
-    __pyx_t_2 = 0;
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v__dict);
+    __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_3));
+    __pyx_t_3 = 0;
 
     /* "(tree fragment)":9
  *     if _dict is not None:
@@ -5202,7 +6640,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
     __pyx_v_use_setstate = 1;
 
     /* "(tree fragment)":7
- *     state = (self.buffer, self.current_buffer_size, self.position, self.sock)
+ *     state = (self.buffer, self.current_buffer_size, self.position, self.refills_in_place, self.sock)
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None:             # <<<<<<<<<<<<<<
  *         state += (_dict,)
@@ -5216,21 +6654,21 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
  *     else:
  *         use_setstate = self.buffer is not None or self.sock is not None             # <<<<<<<<<<<<<<
  *     if use_setstate:
- *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0xef9caf0, None), state
+ *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0x8ae7070, None), state
  */
   /*else*/ {
-    __pyx_t_4 = (__pyx_v_self->__pyx_base.buffer != ((PyObject*)Py_None));
-    __pyx_t_6 = (__pyx_t_4 != 0);
-    if (!__pyx_t_6) {
+    __pyx_t_5 = (__pyx_v_self->__pyx_base.buffer != ((PyObject*)Py_None));
+    __pyx_t_7 = (__pyx_t_5 != 0);
+    if (!__pyx_t_7) {
     } else {
-      __pyx_t_5 = __pyx_t_6;
+      __pyx_t_6 = __pyx_t_7;
       goto __pyx_L4_bool_binop_done;
     }
-    __pyx_t_6 = (__pyx_v_self->sock != Py_None);
-    __pyx_t_4 = (__pyx_t_6 != 0);
-    __pyx_t_5 = __pyx_t_4;
+    __pyx_t_7 = (__pyx_v_self->sock != Py_None);
+    __pyx_t_5 = (__pyx_t_7 != 0);
+    __pyx_t_6 = __pyx_t_5;
     __pyx_L4_bool_binop_done:;
-    __pyx_v_use_setstate = __pyx_t_5;
+    __pyx_v_use_setstate = __pyx_t_6;
   }
   __pyx_L3:;
 
@@ -5238,89 +6676,89 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
  *     else:
  *         use_setstate = self.buffer is not None or self.sock is not None
  *     if use_setstate:             # <<<<<<<<<<<<<<
- *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0xef9caf0, None), state
+ *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0x8ae7070, None), state
  *     else:
  */
-  __pyx_t_5 = (__pyx_v_use_setstate != 0);
-  if (__pyx_t_5) {
+  __pyx_t_6 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_6) {
 
     /* "(tree fragment)":13
  *         use_setstate = self.buffer is not None or self.sock is not None
  *     if use_setstate:
- *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0xef9caf0, None), state             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0x8ae7070, None), state             # <<<<<<<<<<<<<<
  *     else:
- *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0xef9caf0, state)
+ *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0x8ae7070, state)
  */
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_BufferedSocketRea); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_pyx_unpickle_BufferedSocketRea); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
     __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    __Pyx_INCREF(__pyx_int_251251440);
-    __Pyx_GIVEREF(__pyx_int_251251440);
-    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_251251440);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_145649776);
+    __Pyx_GIVEREF(__pyx_int_145649776);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_int_145649776);
     __Pyx_INCREF(Py_None);
     __Pyx_GIVEREF(Py_None);
-    PyTuple_SET_ITEM(__pyx_t_3, 2, Py_None);
-    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_2);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_4, 2, Py_None);
+    __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
     __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_4);
     __Pyx_INCREF(__pyx_v_state);
     __Pyx_GIVEREF(__pyx_v_state);
-    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
-    __pyx_t_2 = 0;
+    PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_state);
     __pyx_t_3 = 0;
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
+    __pyx_t_4 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
     goto __pyx_L0;
 
     /* "(tree fragment)":12
  *     else:
  *         use_setstate = self.buffer is not None or self.sock is not None
  *     if use_setstate:             # <<<<<<<<<<<<<<
- *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0xef9caf0, None), state
+ *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0x8ae7070, None), state
  *     else:
  */
   }
 
   /* "(tree fragment)":15
- *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0xef9caf0, None), state
+ *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0x8ae7070, None), state
  *     else:
- *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0xef9caf0, state)             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0x8ae7070, state)             # <<<<<<<<<<<<<<
  * def __setstate_cython__(self, __pyx_state):
  *     __pyx_unpickle_BufferedSocketReader__set_state(self, __pyx_state)
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_BufferedSocketRea); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_BufferedSocketRea); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
     __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    __Pyx_INCREF(__pyx_int_251251440);
-    __Pyx_GIVEREF(__pyx_int_251251440);
-    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_251251440);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_145649776);
+    __Pyx_GIVEREF(__pyx_int_145649776);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_int_145649776);
     __Pyx_INCREF(__pyx_v_state);
     __Pyx_GIVEREF(__pyx_v_state);
-    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_state);
-    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_1);
-    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
-    __pyx_t_1 = 0;
-    __pyx_t_3 = 0;
-    __pyx_r = __pyx_t_2;
+    PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_state);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_4);
     __pyx_t_2 = 0;
+    __pyx_t_4 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
     goto __pyx_L0;
   }
 
@@ -5335,6 +6773,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_AddTraceback("bytehouse_driver.bufferedreader.BufferedSocketReader.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -5347,7 +6786,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
 
 /* "(tree fragment)":16
  *     else:
- *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0xef9caf0, state)
+ *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0x8ae7070, state)
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_BufferedSocketReader__set_state(self, __pyx_state)
  */
@@ -5375,7 +6814,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
   __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
   /* "(tree fragment)":17
- *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0xef9caf0, state)
+ *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0x8ae7070, state)
  * def __setstate_cython__(self, __pyx_state):
  *     __pyx_unpickle_BufferedSocketReader__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
  */
@@ -5386,7 +6825,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
 
   /* "(tree fragment)":16
  *     else:
- *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0xef9caf0, state)
+ *         return __pyx_unpickle_BufferedSocketReader, (type(self), 0x8ae7070, state)
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_BufferedSocketReader__set_state(self, __pyx_state)
  */
@@ -5404,7 +6843,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_20BufferedSocketRe
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedreader.pyx":246
+/* "bytehouse_driver/bufferedreader.pyx":382
  *     cdef object read_block
  * 
  *     def __init__(self, read_block, bufsize):             # <<<<<<<<<<<<<<
@@ -5446,11 +6885,11 @@ static int __pyx_pw_16bytehouse_driver_14bufferedreader_24CompressedBufferedRead
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bufsize)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 246, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 382, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 246, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 382, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -5463,7 +6902,7 @@ static int __pyx_pw_16bytehouse_driver_14bufferedreader_24CompressedBufferedRead
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 246, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 382, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bytehouse_driver.bufferedreader.CompressedBufferedReader.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -5487,12 +6926,12 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBufferedRead
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "bytehouse_driver/bufferedreader.pyx":247
+  /* "bytehouse_driver/bufferedreader.pyx":383
  * 
  *     def __init__(self, read_block, bufsize):
  *         self.read_block = read_block             # <<<<<<<<<<<<<<
  *         super(CompressedBufferedReader, self).__init__(bufsize)
- * 
+ *         # Every block becomes a new buffer.
  */
   __Pyx_INCREF(__pyx_v_read_block);
   __Pyx_GIVEREF(__pyx_v_read_block);
@@ -5500,14 +6939,14 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBufferedRead
   __Pyx_DECREF(__pyx_v_self->read_block);
   __pyx_v_self->read_block = __pyx_v_read_block;
 
-  /* "bytehouse_driver/bufferedreader.pyx":248
+  /* "bytehouse_driver/bufferedreader.pyx":384
  *     def __init__(self, read_block, bufsize):
  *         self.read_block = read_block
  *         super(CompressedBufferedReader, self).__init__(bufsize)             # <<<<<<<<<<<<<<
- * 
- *     def read_into_buffer(self):
+ *         # Every block becomes a new buffer.
+ *         self.refills_in_place = False
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 248, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 384, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedreader_CompressedBufferedReader));
   __Pyx_GIVEREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedreader_CompressedBufferedReader));
@@ -5515,10 +6954,10 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBufferedRead
   __Pyx_INCREF(((PyObject *)__pyx_v_self));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
   PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 248, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 384, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 248, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 384, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -5533,12 +6972,21 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBufferedRead
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_bufsize) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_bufsize);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 248, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 384, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":246
+  /* "bytehouse_driver/bufferedreader.pyx":386
+ *         super(CompressedBufferedReader, self).__init__(bufsize)
+ *         # Every block becomes a new buffer.
+ *         self.refills_in_place = False             # <<<<<<<<<<<<<<
+ * 
+ *     def read_into_buffer(self):
+ */
+  __pyx_v_self->__pyx_base.refills_in_place = 0;
+
+  /* "bytehouse_driver/bufferedreader.pyx":382
  *     cdef object read_block
  * 
  *     def __init__(self, read_block, bufsize):             # <<<<<<<<<<<<<<
@@ -5560,12 +7008,12 @@ static int __pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBufferedRead
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedreader.pyx":250
- *         super(CompressedBufferedReader, self).__init__(bufsize)
+/* "bytehouse_driver/bufferedreader.pyx":388
+ *         self.refills_in_place = False
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
- *         self.buffer = bytearray(self.read_block())
- *         self.current_buffer_size = len(self.buffer)
+ *         block = self.read_block()
+ *         # Decompressed bytearray becomes the buffer as is.
  */
 
 /* Python wrapper */
@@ -5582,24 +7030,26 @@ static PyObject *__pyx_pw_16bytehouse_driver_14bufferedreader_24CompressedBuffer
 }
 
 static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBufferedReader_2read_into_buffer(struct __pyx_obj_16bytehouse_driver_14bufferedreader_CompressedBufferedReader *__pyx_v_self) {
+  PyObject *__pyx_v_block = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
+  int __pyx_t_4;
   int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("read_into_buffer", 0);
 
-  /* "bytehouse_driver/bufferedreader.pyx":251
+  /* "bytehouse_driver/bufferedreader.pyx":389
  * 
  *     def read_into_buffer(self):
- *         self.buffer = bytearray(self.read_block())             # <<<<<<<<<<<<<<
- *         self.current_buffer_size = len(self.buffer)
- * 
+ *         block = self.read_block()             # <<<<<<<<<<<<<<
+ *         # Decompressed bytearray becomes the buffer as is.
+ *         if type(block) is not bytearray:
  */
   __Pyx_INCREF(__pyx_v_self->read_block);
   __pyx_t_2 = __pyx_v_self->read_block; __pyx_t_3 = NULL;
@@ -5614,36 +7064,78 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 251, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 389, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 251, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_v_block = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "bytehouse_driver/bufferedreader.pyx":391
+ *         block = self.read_block()
+ *         # Decompressed bytearray becomes the buffer as is.
+ *         if type(block) is not bytearray:             # <<<<<<<<<<<<<<
+ *             block = bytearray(block)
+ *         self.buffer = block
+ */
+  __pyx_t_4 = (((PyObject *)Py_TYPE(__pyx_v_block)) != ((PyObject *)(&PyByteArray_Type)));
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
+
+    /* "bytehouse_driver/bufferedreader.pyx":392
+ *         # Decompressed bytearray becomes the buffer as is.
+ *         if type(block) is not bytearray:
+ *             block = bytearray(block)             # <<<<<<<<<<<<<<
+ *         self.buffer = block
+ *         self.current_buffer_size = len(self.buffer)
+ */
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_v_block); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 392, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_block, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "bytehouse_driver/bufferedreader.pyx":391
+ *         block = self.read_block()
+ *         # Decompressed bytearray becomes the buffer as is.
+ *         if type(block) is not bytearray:             # <<<<<<<<<<<<<<
+ *             block = bytearray(block)
+ *         self.buffer = block
+ */
+  }
+
+  /* "bytehouse_driver/bufferedreader.pyx":393
+ *         if type(block) is not bytearray:
+ *             block = bytearray(block)
+ *         self.buffer = block             # <<<<<<<<<<<<<<
+ *         self.current_buffer_size = len(self.buffer)
+ * 
+ */
+  if (!(likely(PyByteArray_CheckExact(__pyx_v_block))||((__pyx_v_block) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytearray", Py_TYPE(__pyx_v_block)->tp_name), 0))) __PYX_ERR(0, 393, __pyx_L1_error)
+  __pyx_t_1 = __pyx_v_block;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF(__pyx_v_self->__pyx_base.buffer);
   __Pyx_DECREF(__pyx_v_self->__pyx_base.buffer);
-  __pyx_v_self->__pyx_base.buffer = ((PyObject*)__pyx_t_2);
-  __pyx_t_2 = 0;
+  __pyx_v_self->__pyx_base.buffer = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedreader.pyx":252
- *     def read_into_buffer(self):
- *         self.buffer = bytearray(self.read_block())
+  /* "bytehouse_driver/bufferedreader.pyx":394
+ *             block = bytearray(block)
+ *         self.buffer = block
  *         self.current_buffer_size = len(self.buffer)             # <<<<<<<<<<<<<<
  * 
  *         if self.current_buffer_size == 0:
  */
-  __pyx_t_2 = __pyx_v_self->__pyx_base.buffer;
-  __Pyx_INCREF(__pyx_t_2);
-  if (unlikely(__pyx_t_2 == Py_None)) {
+  __pyx_t_1 = __pyx_v_self->__pyx_base.buffer;
+  __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(__pyx_t_1 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 252, __pyx_L1_error)
+    __PYX_ERR(0, 394, __pyx_L1_error)
   }
-  __pyx_t_4 = PyByteArray_GET_SIZE(__pyx_t_2); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 252, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_self->__pyx_base.current_buffer_size = __pyx_t_4;
+  __pyx_t_6 = PyByteArray_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_self->__pyx_base.current_buffer_size = __pyx_t_6;
 
-  /* "bytehouse_driver/bufferedreader.pyx":254
+  /* "bytehouse_driver/bufferedreader.pyx":396
  *         self.current_buffer_size = len(self.buffer)
  * 
  *         if self.current_buffer_size == 0:             # <<<<<<<<<<<<<<
@@ -5652,18 +7144,18 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
   __pyx_t_5 = ((__pyx_v_self->__pyx_base.current_buffer_size == 0) != 0);
   if (unlikely(__pyx_t_5)) {
 
-    /* "bytehouse_driver/bufferedreader.pyx":255
+    /* "bytehouse_driver/bufferedreader.pyx":397
  * 
  *         if self.current_buffer_size == 0:
  *             raise EOFError('Unexpected EOF while reading bytes')             # <<<<<<<<<<<<<<
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_EOFError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 255, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 255, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_EOFError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 397, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 397, __pyx_L1_error)
 
-    /* "bytehouse_driver/bufferedreader.pyx":254
+    /* "bytehouse_driver/bufferedreader.pyx":396
  *         self.current_buffer_size = len(self.buffer)
  * 
  *         if self.current_buffer_size == 0:             # <<<<<<<<<<<<<<
@@ -5671,12 +7163,12 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
  */
   }
 
-  /* "bytehouse_driver/bufferedreader.pyx":250
- *         super(CompressedBufferedReader, self).__init__(bufsize)
+  /* "bytehouse_driver/bufferedreader.pyx":388
+ *         self.refills_in_place = False
  * 
  *     def read_into_buffer(self):             # <<<<<<<<<<<<<<
- *         self.buffer = bytearray(self.read_block())
- *         self.current_buffer_size = len(self.buffer)
+ *         block = self.read_block()
+ *         # Decompressed bytearray becomes the buffer as is.
  */
 
   /* function exit code */
@@ -5689,6 +7181,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
   __Pyx_AddTraceback("bytehouse_driver.bufferedreader.CompressedBufferedReader.read_into_buffer", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_block);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
@@ -5722,9 +7215,10 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
+  PyObject *__pyx_t_4 = NULL;
   int __pyx_t_5;
   int __pyx_t_6;
+  int __pyx_t_7;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -5733,7 +7227,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
   /* "(tree fragment)":5
  *     cdef object _dict
  *     cdef bint use_setstate
- *     state = (self.buffer, self.current_buffer_size, self.position, self.read_block)             # <<<<<<<<<<<<<<
+ *     state = (self.buffer, self.current_buffer_size, self.position, self.read_block, self.refills_in_place)             # <<<<<<<<<<<<<<
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None:
  */
@@ -5741,45 +7235,50 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->__pyx_base.position); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_v_self->__pyx_base.refills_in_place); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(5); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
   __Pyx_INCREF(__pyx_v_self->__pyx_base.buffer);
   __Pyx_GIVEREF(__pyx_v_self->__pyx_base.buffer);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_self->__pyx_base.buffer);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_self->__pyx_base.buffer);
   __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_t_2);
   __Pyx_INCREF(__pyx_v_self->read_block);
   __Pyx_GIVEREF(__pyx_v_self->read_block);
-  PyTuple_SET_ITEM(__pyx_t_3, 3, __pyx_v_self->read_block);
+  PyTuple_SET_ITEM(__pyx_t_4, 3, __pyx_v_self->read_block);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 4, __pyx_t_3);
   __pyx_t_1 = 0;
   __pyx_t_2 = 0;
-  __pyx_v_state = ((PyObject*)__pyx_t_3);
   __pyx_t_3 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
 
   /* "(tree fragment)":6
  *     cdef bint use_setstate
- *     state = (self.buffer, self.current_buffer_size, self.position, self.read_block)
+ *     state = (self.buffer, self.current_buffer_size, self.position, self.read_block, self.refills_in_place)
  *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
  *     if _dict is not None:
  *         state += (_dict,)
  */
-  __pyx_t_3 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 6, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_v__dict = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_t_4 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v__dict = __pyx_t_4;
+  __pyx_t_4 = 0;
 
   /* "(tree fragment)":7
- *     state = (self.buffer, self.current_buffer_size, self.position, self.read_block)
+ *     state = (self.buffer, self.current_buffer_size, self.position, self.read_block, self.refills_in_place)
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None:             # <<<<<<<<<<<<<<
  *         state += (_dict,)
  *         use_setstate = True
  */
-  __pyx_t_4 = (__pyx_v__dict != Py_None);
-  __pyx_t_5 = (__pyx_t_4 != 0);
-  if (__pyx_t_5) {
+  __pyx_t_5 = (__pyx_v__dict != Py_None);
+  __pyx_t_6 = (__pyx_t_5 != 0);
+  if (__pyx_t_6) {
 
     /* "(tree fragment)":8
  *     _dict = getattr(self, '__dict__', None)
@@ -5788,16 +7287,16 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
  *         use_setstate = True
  *     else:
  */
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(__pyx_v__dict);
     __Pyx_GIVEREF(__pyx_v__dict);
-    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v__dict);
-    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 8, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_2));
-    __pyx_t_2 = 0;
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v__dict);
+    __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_3));
+    __pyx_t_3 = 0;
 
     /* "(tree fragment)":9
  *     if _dict is not None:
@@ -5809,7 +7308,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
     __pyx_v_use_setstate = 1;
 
     /* "(tree fragment)":7
- *     state = (self.buffer, self.current_buffer_size, self.position, self.read_block)
+ *     state = (self.buffer, self.current_buffer_size, self.position, self.read_block, self.refills_in_place)
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None:             # <<<<<<<<<<<<<<
  *         state += (_dict,)
@@ -5823,21 +7322,21 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
  *     else:
  *         use_setstate = self.buffer is not None or self.read_block is not None             # <<<<<<<<<<<<<<
  *     if use_setstate:
- *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x183c0eb, None), state
+ *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x830c404, None), state
  */
   /*else*/ {
-    __pyx_t_4 = (__pyx_v_self->__pyx_base.buffer != ((PyObject*)Py_None));
-    __pyx_t_6 = (__pyx_t_4 != 0);
-    if (!__pyx_t_6) {
+    __pyx_t_5 = (__pyx_v_self->__pyx_base.buffer != ((PyObject*)Py_None));
+    __pyx_t_7 = (__pyx_t_5 != 0);
+    if (!__pyx_t_7) {
     } else {
-      __pyx_t_5 = __pyx_t_6;
+      __pyx_t_6 = __pyx_t_7;
       goto __pyx_L4_bool_binop_done;
     }
-    __pyx_t_6 = (__pyx_v_self->read_block != Py_None);
-    __pyx_t_4 = (__pyx_t_6 != 0);
-    __pyx_t_5 = __pyx_t_4;
+    __pyx_t_7 = (__pyx_v_self->read_block != Py_None);
+    __pyx_t_5 = (__pyx_t_7 != 0);
+    __pyx_t_6 = __pyx_t_5;
     __pyx_L4_bool_binop_done:;
-    __pyx_v_use_setstate = __pyx_t_5;
+    __pyx_v_use_setstate = __pyx_t_6;
   }
   __pyx_L3:;
 
@@ -5845,89 +7344,89 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
  *     else:
  *         use_setstate = self.buffer is not None or self.read_block is not None
  *     if use_setstate:             # <<<<<<<<<<<<<<
- *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x183c0eb, None), state
+ *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x830c404, None), state
  *     else:
  */
-  __pyx_t_5 = (__pyx_v_use_setstate != 0);
-  if (__pyx_t_5) {
+  __pyx_t_6 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_6) {
 
     /* "(tree fragment)":13
  *         use_setstate = self.buffer is not None or self.read_block is not None
  *     if use_setstate:
- *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x183c0eb, None), state             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x830c404, None), state             # <<<<<<<<<<<<<<
  *     else:
- *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x183c0eb, state)
+ *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x830c404, state)
  */
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_CompressedBuffere); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_pyx_unpickle_CompressedBuffere); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
     __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    __Pyx_INCREF(__pyx_int_25411819);
-    __Pyx_GIVEREF(__pyx_int_25411819);
-    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_25411819);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_137413636);
+    __Pyx_GIVEREF(__pyx_int_137413636);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_int_137413636);
     __Pyx_INCREF(Py_None);
     __Pyx_GIVEREF(Py_None);
-    PyTuple_SET_ITEM(__pyx_t_3, 2, Py_None);
-    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_2);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_4, 2, Py_None);
+    __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
     __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_4);
     __Pyx_INCREF(__pyx_v_state);
     __Pyx_GIVEREF(__pyx_v_state);
-    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
-    __pyx_t_2 = 0;
+    PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_state);
     __pyx_t_3 = 0;
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
+    __pyx_t_4 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
     goto __pyx_L0;
 
     /* "(tree fragment)":12
  *     else:
  *         use_setstate = self.buffer is not None or self.read_block is not None
  *     if use_setstate:             # <<<<<<<<<<<<<<
- *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x183c0eb, None), state
+ *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x830c404, None), state
  *     else:
  */
   }
 
   /* "(tree fragment)":15
- *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x183c0eb, None), state
+ *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x830c404, None), state
  *     else:
- *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x183c0eb, state)             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x830c404, state)             # <<<<<<<<<<<<<<
  * def __setstate_cython__(self, __pyx_state):
  *     __pyx_unpickle_CompressedBufferedReader__set_state(self, __pyx_state)
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_CompressedBuffere); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_CompressedBuffere); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
     __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    __Pyx_INCREF(__pyx_int_25411819);
-    __Pyx_GIVEREF(__pyx_int_25411819);
-    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_25411819);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_137413636);
+    __Pyx_GIVEREF(__pyx_int_137413636);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_int_137413636);
     __Pyx_INCREF(__pyx_v_state);
     __Pyx_GIVEREF(__pyx_v_state);
-    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_state);
-    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_1);
-    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
-    __pyx_t_1 = 0;
-    __pyx_t_3 = 0;
-    __pyx_r = __pyx_t_2;
+    PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_state);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_4);
     __pyx_t_2 = 0;
+    __pyx_t_4 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
     goto __pyx_L0;
   }
 
@@ -5942,6 +7441,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_AddTraceback("bytehouse_driver.bufferedreader.CompressedBufferedReader.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -5954,7 +7454,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
 
 /* "(tree fragment)":16
  *     else:
- *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x183c0eb, state)
+ *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x830c404, state)
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_CompressedBufferedReader__set_state(self, __pyx_state)
  */
@@ -5982,7 +7482,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
   __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
   /* "(tree fragment)":17
- *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x183c0eb, state)
+ *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x830c404, state)
  * def __setstate_cython__(self, __pyx_state):
  *     __pyx_unpickle_CompressedBufferedReader__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
  */
@@ -5993,7 +7493,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_24CompressedBuffer
 
   /* "(tree fragment)":16
  *     else:
- *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x183c0eb, state)
+ *         return __pyx_unpickle_CompressedBufferedReader, (type(self), 0x830c404, state)
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_CompressedBufferedReader__set_state(self, __pyx_state)
  */
@@ -6112,22 +7612,22 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buf
   /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x2a8a945, 0x5e0d780, 0x07c78bc):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0x0d82568, 0xe0b4e91, 0xfe80cf8):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2a8a945, 0x5e0d780, 0x07c78bc) = (buffer, current_buffer_size, position))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x0d82568, 0xe0b4e91, 0xfe80cf8) = (buffer, current_buffer_size, position, refills_in_place))" % __pyx_checksum)
  */
   __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__2, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__3, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
     /* "(tree fragment)":5
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x2a8a945, 0x5e0d780, 0x07c78bc):
+ *     if __pyx_checksum not in (0x0d82568, 0xe0b4e91, 0xfe80cf8):
  *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2a8a945, 0x5e0d780, 0x07c78bc) = (buffer, current_buffer_size, position))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x0d82568, 0xe0b4e91, 0xfe80cf8) = (buffer, current_buffer_size, position, refills_in_place))" % __pyx_checksum)
  *     __pyx_result = BufferedReader.__new__(__pyx_type)
  */
     __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
@@ -6146,9 +7646,9 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buf
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":6
- *     if __pyx_checksum not in (0x2a8a945, 0x5e0d780, 0x07c78bc):
+ *     if __pyx_checksum not in (0x0d82568, 0xe0b4e91, 0xfe80cf8):
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2a8a945, 0x5e0d780, 0x07c78bc) = (buffer, current_buffer_size, position))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x0d82568, 0xe0b4e91, 0xfe80cf8) = (buffer, current_buffer_size, position, refills_in_place))" % __pyx_checksum)             # <<<<<<<<<<<<<<
  *     __pyx_result = BufferedReader.__new__(__pyx_type)
  *     if __pyx_state is not None:
  */
@@ -6181,15 +7681,15 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buf
     /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x2a8a945, 0x5e0d780, 0x07c78bc):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0x0d82568, 0xe0b4e91, 0xfe80cf8):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2a8a945, 0x5e0d780, 0x07c78bc) = (buffer, current_buffer_size, position))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x0d82568, 0xe0b4e91, 0xfe80cf8) = (buffer, current_buffer_size, position, refills_in_place))" % __pyx_checksum)
  */
   }
 
   /* "(tree fragment)":7
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2a8a945, 0x5e0d780, 0x07c78bc) = (buffer, current_buffer_size, position))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x0d82568, 0xe0b4e91, 0xfe80cf8) = (buffer, current_buffer_size, position, refills_in_place))" % __pyx_checksum)
  *     __pyx_result = BufferedReader.__new__(__pyx_type)             # <<<<<<<<<<<<<<
  *     if __pyx_state is not None:
  *         __pyx_unpickle_BufferedReader__set_state(<BufferedReader> __pyx_result, __pyx_state)
@@ -6215,7 +7715,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buf
   __pyx_t_4 = 0;
 
   /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2a8a945, 0x5e0d780, 0x07c78bc) = (buffer, current_buffer_size, position))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x0d82568, 0xe0b4e91, 0xfe80cf8) = (buffer, current_buffer_size, position, refills_in_place))" % __pyx_checksum)
  *     __pyx_result = BufferedReader.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
  *         __pyx_unpickle_BufferedReader__set_state(<BufferedReader> __pyx_result, __pyx_state)
@@ -6238,7 +7738,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buf
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2a8a945, 0x5e0d780, 0x07c78bc) = (buffer, current_buffer_size, position))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x0d82568, 0xe0b4e91, 0xfe80cf8) = (buffer, current_buffer_size, position, refills_in_place))" % __pyx_checksum)
  *     __pyx_result = BufferedReader.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
  *         __pyx_unpickle_BufferedReader__set_state(<BufferedReader> __pyx_result, __pyx_state)
@@ -6251,7 +7751,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buf
  *         __pyx_unpickle_BufferedReader__set_state(<BufferedReader> __pyx_result, __pyx_state)
  *     return __pyx_result             # <<<<<<<<<<<<<<
  * cdef __pyx_unpickle_BufferedReader__set_state(BufferedReader __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v___pyx_result);
@@ -6284,8 +7784,8 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buf
  *         __pyx_unpickle_BufferedReader__set_state(<BufferedReader> __pyx_result, __pyx_state)
  *     return __pyx_result
  * cdef __pyx_unpickle_BufferedReader__set_state(BufferedReader __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
- *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
  */
 
 static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_BufferedReader__set_state(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
@@ -6308,9 +7808,9 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buff
   /* "(tree fragment)":12
  *     return __pyx_result
  * cdef __pyx_unpickle_BufferedReader__set_state(BufferedReader __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]             # <<<<<<<<<<<<<<
- *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
- *         __pyx_result.__dict__.update(__pyx_state[3])
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[4])
  */
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
@@ -6342,19 +7842,28 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buff
   __pyx_t_2 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_2 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v___pyx_result->position = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->refills_in_place = __pyx_t_3;
 
   /* "(tree fragment)":13
  * cdef __pyx_unpickle_BufferedReader__set_state(BufferedReader __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
- *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
- *         __pyx_result.__dict__.update(__pyx_state[3])
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[4])
  */
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
     __PYX_ERR(1, 13, __pyx_L1_error)
   }
   __pyx_t_4 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
-  __pyx_t_5 = ((__pyx_t_4 > 3) != 0);
+  __pyx_t_5 = ((__pyx_t_4 > 4) != 0);
   if (__pyx_t_5) {
   } else {
     __pyx_t_3 = __pyx_t_5;
@@ -6367,9 +7876,9 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buff
   if (__pyx_t_3) {
 
     /* "(tree fragment)":14
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
- *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
- *         __pyx_result.__dict__.update(__pyx_state[3])             # <<<<<<<<<<<<<<
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[4])             # <<<<<<<<<<<<<<
  */
     __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
@@ -6380,7 +7889,7 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buff
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
       __PYX_ERR(1, 14, __pyx_L1_error)
     }
-    __pyx_t_7 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 4, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __pyx_t_9 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
@@ -6402,9 +7911,9 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buff
 
     /* "(tree fragment)":13
  * cdef __pyx_unpickle_BufferedReader__set_state(BufferedReader __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
- *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
- *         __pyx_result.__dict__.update(__pyx_state[3])
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[4])
  */
   }
 
@@ -6412,8 +7921,8 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buff
  *         __pyx_unpickle_BufferedReader__set_state(<BufferedReader> __pyx_result, __pyx_state)
  *     return __pyx_result
  * cdef __pyx_unpickle_BufferedReader__set_state(BufferedReader __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
- *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
  */
 
   /* function exit code */
@@ -6533,22 +8042,22 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_2__pyx_unpickle_Bu
   /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0xef9caf0, 0x44eb6c8, 0xb4ff772):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0x8ae7070, 0x772103b, 0x272045f):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xef9caf0, 0x44eb6c8, 0xb4ff772) = (buffer, current_buffer_size, position, sock))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ae7070, 0x772103b, 0x272045f) = (buffer, current_buffer_size, position, refills_in_place, sock))" % __pyx_checksum)
  */
   __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__3, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__4, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
     /* "(tree fragment)":5
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0xef9caf0, 0x44eb6c8, 0xb4ff772):
+ *     if __pyx_checksum not in (0x8ae7070, 0x772103b, 0x272045f):
  *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xef9caf0, 0x44eb6c8, 0xb4ff772) = (buffer, current_buffer_size, position, sock))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ae7070, 0x772103b, 0x272045f) = (buffer, current_buffer_size, position, refills_in_place, sock))" % __pyx_checksum)
  *     __pyx_result = BufferedSocketReader.__new__(__pyx_type)
  */
     __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
@@ -6567,9 +8076,9 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_2__pyx_unpickle_Bu
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":6
- *     if __pyx_checksum not in (0xef9caf0, 0x44eb6c8, 0xb4ff772):
+ *     if __pyx_checksum not in (0x8ae7070, 0x772103b, 0x272045f):
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xef9caf0, 0x44eb6c8, 0xb4ff772) = (buffer, current_buffer_size, position, sock))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ae7070, 0x772103b, 0x272045f) = (buffer, current_buffer_size, position, refills_in_place, sock))" % __pyx_checksum)             # <<<<<<<<<<<<<<
  *     __pyx_result = BufferedSocketReader.__new__(__pyx_type)
  *     if __pyx_state is not None:
  */
@@ -6602,15 +8111,15 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_2__pyx_unpickle_Bu
     /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0xef9caf0, 0x44eb6c8, 0xb4ff772):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0x8ae7070, 0x772103b, 0x272045f):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xef9caf0, 0x44eb6c8, 0xb4ff772) = (buffer, current_buffer_size, position, sock))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ae7070, 0x772103b, 0x272045f) = (buffer, current_buffer_size, position, refills_in_place, sock))" % __pyx_checksum)
  */
   }
 
   /* "(tree fragment)":7
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xef9caf0, 0x44eb6c8, 0xb4ff772) = (buffer, current_buffer_size, position, sock))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ae7070, 0x772103b, 0x272045f) = (buffer, current_buffer_size, position, refills_in_place, sock))" % __pyx_checksum)
  *     __pyx_result = BufferedSocketReader.__new__(__pyx_type)             # <<<<<<<<<<<<<<
  *     if __pyx_state is not None:
  *         __pyx_unpickle_BufferedSocketReader__set_state(<BufferedSocketReader> __pyx_result, __pyx_state)
@@ -6636,7 +8145,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_2__pyx_unpickle_Bu
   __pyx_t_4 = 0;
 
   /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xef9caf0, 0x44eb6c8, 0xb4ff772) = (buffer, current_buffer_size, position, sock))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ae7070, 0x772103b, 0x272045f) = (buffer, current_buffer_size, position, refills_in_place, sock))" % __pyx_checksum)
  *     __pyx_result = BufferedSocketReader.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
  *         __pyx_unpickle_BufferedSocketReader__set_state(<BufferedSocketReader> __pyx_result, __pyx_state)
@@ -6659,7 +8168,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_2__pyx_unpickle_Bu
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xef9caf0, 0x44eb6c8, 0xb4ff772) = (buffer, current_buffer_size, position, sock))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x8ae7070, 0x772103b, 0x272045f) = (buffer, current_buffer_size, position, refills_in_place, sock))" % __pyx_checksum)
  *     __pyx_result = BufferedSocketReader.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
  *         __pyx_unpickle_BufferedSocketReader__set_state(<BufferedSocketReader> __pyx_result, __pyx_state)
@@ -6672,7 +8181,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_2__pyx_unpickle_Bu
  *         __pyx_unpickle_BufferedSocketReader__set_state(<BufferedSocketReader> __pyx_result, __pyx_state)
  *     return __pyx_result             # <<<<<<<<<<<<<<
  * cdef __pyx_unpickle_BufferedSocketReader__set_state(BufferedSocketReader __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]; __pyx_result.sock = __pyx_state[4]
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v___pyx_result);
@@ -6705,8 +8214,8 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_2__pyx_unpickle_Bu
  *         __pyx_unpickle_BufferedSocketReader__set_state(<BufferedSocketReader> __pyx_result, __pyx_state)
  *     return __pyx_result
  * cdef __pyx_unpickle_BufferedSocketReader__set_state(BufferedSocketReader __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
- *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]; __pyx_result.sock = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):
  */
 
 static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_BufferedSocketReader__set_state(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedSocketReader *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
@@ -6729,9 +8238,9 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buff
   /* "(tree fragment)":12
  *     return __pyx_result
  * cdef __pyx_unpickle_BufferedSocketReader__set_state(BufferedSocketReader __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]             # <<<<<<<<<<<<<<
- *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
- *         __pyx_result.__dict__.update(__pyx_state[4])
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]; __pyx_result.sock = __pyx_state[4]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[5])
  */
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
@@ -6758,16 +8267,25 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buff
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
     __PYX_ERR(1, 12, __pyx_L1_error)
   }
-  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_2 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->__pyx_base.position = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_2 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v___pyx_result->__pyx_base.position = __pyx_t_2;
+  __pyx_v___pyx_result->__pyx_base.refills_in_place = __pyx_t_3;
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
     __PYX_ERR(1, 12, __pyx_L1_error)
   }
-  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 4, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF(__pyx_v___pyx_result->sock);
@@ -6777,16 +8295,16 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buff
 
   /* "(tree fragment)":13
  * cdef __pyx_unpickle_BufferedSocketReader__set_state(BufferedSocketReader __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
- *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
- *         __pyx_result.__dict__.update(__pyx_state[4])
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]; __pyx_result.sock = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[5])
  */
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
     __PYX_ERR(1, 13, __pyx_L1_error)
   }
   __pyx_t_4 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
-  __pyx_t_5 = ((__pyx_t_4 > 4) != 0);
+  __pyx_t_5 = ((__pyx_t_4 > 5) != 0);
   if (__pyx_t_5) {
   } else {
     __pyx_t_3 = __pyx_t_5;
@@ -6799,9 +8317,9 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buff
   if (__pyx_t_3) {
 
     /* "(tree fragment)":14
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
- *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
- *         __pyx_result.__dict__.update(__pyx_state[4])             # <<<<<<<<<<<<<<
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]; __pyx_result.sock = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[5])             # <<<<<<<<<<<<<<
  */
     __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
@@ -6812,7 +8330,7 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buff
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
       __PYX_ERR(1, 14, __pyx_L1_error)
     }
-    __pyx_t_7 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 4, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 5, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __pyx_t_9 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
@@ -6834,9 +8352,9 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buff
 
     /* "(tree fragment)":13
  * cdef __pyx_unpickle_BufferedSocketReader__set_state(BufferedSocketReader __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
- *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
- *         __pyx_result.__dict__.update(__pyx_state[4])
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]; __pyx_result.sock = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[5])
  */
   }
 
@@ -6844,8 +8362,8 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Buff
  *         __pyx_unpickle_BufferedSocketReader__set_state(<BufferedSocketReader> __pyx_result, __pyx_state)
  *     return __pyx_result
  * cdef __pyx_unpickle_BufferedSocketReader__set_state(BufferedSocketReader __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
- *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]; __pyx_result.sock = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):
  */
 
   /* function exit code */
@@ -6965,22 +8483,22 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_4__pyx_unpickle_Co
   /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x183c0eb, 0x69923fe, 0xfd1be99):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0x830c404, 0x310915d, 0x217309e):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x183c0eb, 0x69923fe, 0xfd1be99) = (buffer, current_buffer_size, position, read_block))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x830c404, 0x310915d, 0x217309e) = (buffer, current_buffer_size, position, read_block, refills_in_place))" % __pyx_checksum)
  */
   __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__4, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__5, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
     /* "(tree fragment)":5
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x183c0eb, 0x69923fe, 0xfd1be99):
+ *     if __pyx_checksum not in (0x830c404, 0x310915d, 0x217309e):
  *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x183c0eb, 0x69923fe, 0xfd1be99) = (buffer, current_buffer_size, position, read_block))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x830c404, 0x310915d, 0x217309e) = (buffer, current_buffer_size, position, read_block, refills_in_place))" % __pyx_checksum)
  *     __pyx_result = CompressedBufferedReader.__new__(__pyx_type)
  */
     __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
@@ -6999,9 +8517,9 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_4__pyx_unpickle_Co
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":6
- *     if __pyx_checksum not in (0x183c0eb, 0x69923fe, 0xfd1be99):
+ *     if __pyx_checksum not in (0x830c404, 0x310915d, 0x217309e):
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x183c0eb, 0x69923fe, 0xfd1be99) = (buffer, current_buffer_size, position, read_block))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x830c404, 0x310915d, 0x217309e) = (buffer, current_buffer_size, position, read_block, refills_in_place))" % __pyx_checksum)             # <<<<<<<<<<<<<<
  *     __pyx_result = CompressedBufferedReader.__new__(__pyx_type)
  *     if __pyx_state is not None:
  */
@@ -7034,15 +8552,15 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_4__pyx_unpickle_Co
     /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x183c0eb, 0x69923fe, 0xfd1be99):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0x830c404, 0x310915d, 0x217309e):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x183c0eb, 0x69923fe, 0xfd1be99) = (buffer, current_buffer_size, position, read_block))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x830c404, 0x310915d, 0x217309e) = (buffer, current_buffer_size, position, read_block, refills_in_place))" % __pyx_checksum)
  */
   }
 
   /* "(tree fragment)":7
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x183c0eb, 0x69923fe, 0xfd1be99) = (buffer, current_buffer_size, position, read_block))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x830c404, 0x310915d, 0x217309e) = (buffer, current_buffer_size, position, read_block, refills_in_place))" % __pyx_checksum)
  *     __pyx_result = CompressedBufferedReader.__new__(__pyx_type)             # <<<<<<<<<<<<<<
  *     if __pyx_state is not None:
  *         __pyx_unpickle_CompressedBufferedReader__set_state(<CompressedBufferedReader> __pyx_result, __pyx_state)
@@ -7068,7 +8586,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_4__pyx_unpickle_Co
   __pyx_t_4 = 0;
 
   /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x183c0eb, 0x69923fe, 0xfd1be99) = (buffer, current_buffer_size, position, read_block))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x830c404, 0x310915d, 0x217309e) = (buffer, current_buffer_size, position, read_block, refills_in_place))" % __pyx_checksum)
  *     __pyx_result = CompressedBufferedReader.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
  *         __pyx_unpickle_CompressedBufferedReader__set_state(<CompressedBufferedReader> __pyx_result, __pyx_state)
@@ -7091,7 +8609,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_4__pyx_unpickle_Co
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x183c0eb, 0x69923fe, 0xfd1be99) = (buffer, current_buffer_size, position, read_block))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x830c404, 0x310915d, 0x217309e) = (buffer, current_buffer_size, position, read_block, refills_in_place))" % __pyx_checksum)
  *     __pyx_result = CompressedBufferedReader.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
  *         __pyx_unpickle_CompressedBufferedReader__set_state(<CompressedBufferedReader> __pyx_result, __pyx_state)
@@ -7104,7 +8622,7 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_4__pyx_unpickle_Co
  *         __pyx_unpickle_CompressedBufferedReader__set_state(<CompressedBufferedReader> __pyx_result, __pyx_state)
  *     return __pyx_result             # <<<<<<<<<<<<<<
  * cdef __pyx_unpickle_CompressedBufferedReader__set_state(CompressedBufferedReader __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]; __pyx_result.refills_in_place = __pyx_state[4]
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v___pyx_result);
@@ -7137,8 +8655,8 @@ static PyObject *__pyx_pf_16bytehouse_driver_14bufferedreader_4__pyx_unpickle_Co
  *         __pyx_unpickle_CompressedBufferedReader__set_state(<CompressedBufferedReader> __pyx_result, __pyx_state)
  *     return __pyx_result
  * cdef __pyx_unpickle_CompressedBufferedReader__set_state(CompressedBufferedReader __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]
- *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]; __pyx_result.refills_in_place = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):
  */
 
 static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_CompressedBufferedReader__set_state(struct __pyx_obj_16bytehouse_driver_14bufferedreader_CompressedBufferedReader *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
@@ -7161,9 +8679,9 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Comp
   /* "(tree fragment)":12
  *     return __pyx_result
  * cdef __pyx_unpickle_CompressedBufferedReader__set_state(CompressedBufferedReader __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]             # <<<<<<<<<<<<<<
- *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
- *         __pyx_result.__dict__.update(__pyx_state[4])
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]; __pyx_result.refills_in_place = __pyx_state[4]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[5])
  */
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
@@ -7206,19 +8724,28 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Comp
   __Pyx_DECREF(__pyx_v___pyx_result->read_block);
   __pyx_v___pyx_result->read_block = __pyx_t_1;
   __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 4, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->__pyx_base.refills_in_place = __pyx_t_3;
 
   /* "(tree fragment)":13
  * cdef __pyx_unpickle_CompressedBufferedReader__set_state(CompressedBufferedReader __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]
- *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
- *         __pyx_result.__dict__.update(__pyx_state[4])
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]; __pyx_result.refills_in_place = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[5])
  */
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
     __PYX_ERR(1, 13, __pyx_L1_error)
   }
   __pyx_t_4 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
-  __pyx_t_5 = ((__pyx_t_4 > 4) != 0);
+  __pyx_t_5 = ((__pyx_t_4 > 5) != 0);
   if (__pyx_t_5) {
   } else {
     __pyx_t_3 = __pyx_t_5;
@@ -7231,9 +8758,9 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Comp
   if (__pyx_t_3) {
 
     /* "(tree fragment)":14
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]
- *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
- *         __pyx_result.__dict__.update(__pyx_state[4])             # <<<<<<<<<<<<<<
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]; __pyx_result.refills_in_place = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[5])             # <<<<<<<<<<<<<<
  */
     __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
@@ -7244,7 +8771,7 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Comp
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
       __PYX_ERR(1, 14, __pyx_L1_error)
     }
-    __pyx_t_7 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 4, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 5, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __pyx_t_9 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
@@ -7266,9 +8793,9 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Comp
 
     /* "(tree fragment)":13
  * cdef __pyx_unpickle_CompressedBufferedReader__set_state(CompressedBufferedReader __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]
- *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
- *         __pyx_result.__dict__.update(__pyx_state[4])
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]; __pyx_result.refills_in_place = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[5])
  */
   }
 
@@ -7276,8 +8803,8 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Comp
  *         __pyx_unpickle_CompressedBufferedReader__set_state(<CompressedBufferedReader> __pyx_result, __pyx_state)
  *     return __pyx_result
  * cdef __pyx_unpickle_CompressedBufferedReader__set_state(CompressedBufferedReader __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]
- *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.read_block = __pyx_state[3]; __pyx_result.refills_in_place = __pyx_state[4]
+ *     if len(__pyx_state) > 5 and hasattr(__pyx_result, '__dict__'):
  */
 
   /* function exit code */
@@ -7295,6 +8822,7 @@ static PyObject *__pyx_f_16bytehouse_driver_14bufferedreader___pyx_unpickle_Comp
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedReader __pyx_vtable_16bytehouse_driver_14bufferedreader_BufferedReader;
 
 static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedreader_BufferedReader(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
   struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *p;
@@ -7306,6 +8834,7 @@ static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedreader_BufferedReader
   }
   if (unlikely(!o)) return 0;
   p = ((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *)o);
+  p->__pyx_vtab = __pyx_vtabptr_16bytehouse_driver_14bufferedreader_BufferedReader;
   p->buffer = ((PyObject*)Py_None); Py_INCREF(Py_None);
   return o;
 }
@@ -7362,15 +8891,32 @@ static int __pyx_setprop_16bytehouse_driver_14bufferedreader_14BufferedReader_bu
   }
 }
 
+static PyObject *__pyx_getprop_16bytehouse_driver_14bufferedreader_14BufferedReader_refills_in_place(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_16refills_in_place_1__get__(o);
+}
+
+static int __pyx_setprop_16bytehouse_driver_14bufferedreader_14BufferedReader_refills_in_place(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_16refills_in_place_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
 static PyMethodDef __pyx_methods_16bytehouse_driver_14bufferedreader_BufferedReader[] = {
   {"read_into_buffer", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_3read_into_buffer, METH_NOARGS, 0},
   {"read", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_5read, METH_O, 0},
-  {"read_one", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_7read_one, METH_NOARGS, 0},
-  {"read_strings", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_9read_strings, METH_VARARGS|METH_KEYWORDS, __pyx_doc_16bytehouse_driver_14bufferedreader_14BufferedReader_8read_strings},
-  {"read_fixed_strings_as_bytes", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_11read_fixed_strings_as_bytes, METH_VARARGS|METH_KEYWORDS, 0},
-  {"read_fixed_strings", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_13read_fixed_strings, METH_VARARGS|METH_KEYWORDS, 0},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_15__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_17__setstate_cython__, METH_O, 0},
+  {"read_view", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_7read_view, METH_O, __pyx_doc_16bytehouse_driver_14bufferedreader_14BufferedReader_6read_view},
+  {"read_into", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_9read_into, METH_VARARGS|METH_KEYWORDS, __pyx_doc_16bytehouse_driver_14bufferedreader_14BufferedReader_8read_into},
+  {"read_one", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_11read_one, METH_NOARGS, 0},
+  {"read_strings", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_13read_strings, METH_VARARGS|METH_KEYWORDS, __pyx_doc_16bytehouse_driver_14bufferedreader_14BufferedReader_12read_strings},
+  {"read_string_buffers", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_15read_string_buffers, METH_O, __pyx_doc_16bytehouse_driver_14bufferedreader_14BufferedReader_14read_string_buffers},
+  {"read_fixed_strings_as_bytes", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_17read_fixed_strings_as_bytes, METH_VARARGS|METH_KEYWORDS, 0},
+  {"read_fixed_strings", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_19read_fixed_strings, METH_VARARGS|METH_KEYWORDS, 0},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_21__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedreader_14BufferedReader_23__setstate_cython__, METH_O, 0},
   {0, 0, 0, 0}
 };
 
@@ -7378,6 +8924,7 @@ static struct PyGetSetDef __pyx_getsets_16bytehouse_driver_14bufferedreader_Buff
   {(char *)"position", __pyx_getprop_16bytehouse_driver_14bufferedreader_14BufferedReader_position, __pyx_setprop_16bytehouse_driver_14bufferedreader_14BufferedReader_position, (char *)0, 0},
   {(char *)"current_buffer_size", __pyx_getprop_16bytehouse_driver_14bufferedreader_14BufferedReader_current_buffer_size, __pyx_setprop_16bytehouse_driver_14bufferedreader_14BufferedReader_current_buffer_size, (char *)0, 0},
   {(char *)"buffer", __pyx_getprop_16bytehouse_driver_14bufferedreader_14BufferedReader_buffer, __pyx_setprop_16bytehouse_driver_14bufferedreader_14BufferedReader_buffer, (char *)0, 0},
+  {(char *)"refills_in_place", __pyx_getprop_16bytehouse_driver_14bufferedreader_14BufferedReader_refills_in_place, __pyx_setprop_16bytehouse_driver_14bufferedreader_14BufferedReader_refills_in_place, (char *)0, 0},
   {0, 0, 0, 0, 0}
 };
 
@@ -7452,12 +8999,14 @@ static PyTypeObject __pyx_type_16bytehouse_driver_14bufferedreader_BufferedReade
   0, /*tp_pypy_flags*/
   #endif
 };
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedSocketReader __pyx_vtable_16bytehouse_driver_14bufferedreader_BufferedSocketReader;
 
 static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedreader_BufferedSocketReader(PyTypeObject *t, PyObject *a, PyObject *k) {
   struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedSocketReader *p;
   PyObject *o = __pyx_tp_new_16bytehouse_driver_14bufferedreader_BufferedReader(t, a, k);
   if (unlikely(!o)) return 0;
   p = ((struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedSocketReader *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedReader*)__pyx_vtabptr_16bytehouse_driver_14bufferedreader_BufferedSocketReader;
   p->sock = Py_None; Py_INCREF(Py_None);
   return o;
 }
@@ -7576,12 +9125,14 @@ static PyTypeObject __pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocke
   0, /*tp_pypy_flags*/
   #endif
 };
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_CompressedBufferedReader __pyx_vtable_16bytehouse_driver_14bufferedreader_CompressedBufferedReader;
 
 static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedreader_CompressedBufferedReader(PyTypeObject *t, PyObject *a, PyObject *k) {
   struct __pyx_obj_16bytehouse_driver_14bufferedreader_CompressedBufferedReader *p;
   PyObject *o = __pyx_tp_new_16bytehouse_driver_14bufferedreader_BufferedReader(t, a, k);
   if (unlikely(!o)) return 0;
   p = ((struct __pyx_obj_16bytehouse_driver_14bufferedreader_CompressedBufferedReader *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_16bytehouse_driver_14bufferedreader_BufferedReader*)__pyx_vtabptr_16bytehouse_driver_14bufferedreader_CompressedBufferedReader;
   p->read_block = Py_None; Py_INCREF(Py_None);
   return o;
 }
@@ -7750,6 +9301,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_BufferedReader, __pyx_k_BufferedReader, sizeof(__pyx_k_BufferedReader), 0, 0, 1, 1},
   {&__pyx_n_s_BufferedSocketReader, __pyx_k_BufferedSocketReader, sizeof(__pyx_k_BufferedSocketReader), 0, 0, 1, 1},
   {&__pyx_n_s_CompressedBufferedReader, __pyx_k_CompressedBufferedReader, sizeof(__pyx_k_CompressedBufferedReader), 0, 0, 1, 1},
+  {&__pyx_kp_u_Destination_buffer_is_too_small, __pyx_k_Destination_buffer_is_too_small, sizeof(__pyx_k_Destination_buffer_is_too_small), 0, 1, 0, 0},
   {&__pyx_n_s_EOFError, __pyx_k_EOFError, sizeof(__pyx_k_EOFError), 0, 0, 1, 1},
   {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
   {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_2, __pyx_k_Incompatible_checksums_0x_x_vs_0_2, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0_2), 0, 0, 1, 0},
@@ -7759,10 +9311,12 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
   {&__pyx_kp_u_Unexpected_EOF_while_reading_byt, __pyx_k_Unexpected_EOF_while_reading_byt, sizeof(__pyx_k_Unexpected_EOF_while_reading_byt), 0, 1, 0, 0},
   {&__pyx_n_s_UnicodeDecodeError, __pyx_k_UnicodeDecodeError, sizeof(__pyx_k_UnicodeDecodeError), 0, 0, 1, 1},
+  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
   {&__pyx_n_s_bufsize, __pyx_k_bufsize, sizeof(__pyx_k_bufsize), 0, 0, 1, 1},
   {&__pyx_n_s_bytehouse_driver_bufferedreader, __pyx_k_bytehouse_driver_bufferedreader, sizeof(__pyx_k_bytehouse_driver_bufferedreader), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
   {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+  {&__pyx_n_s_dst, __pyx_k_dst, sizeof(__pyx_k_dst), 0, 0, 1, 1},
   {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
   {&__pyx_n_s_encoding, __pyx_k_encoding, sizeof(__pyx_k_encoding), 0, 0, 1, 1},
   {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
@@ -7770,10 +9324,12 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_init, __pyx_k_init, sizeof(__pyx_k_init), 0, 0, 1, 1},
   {&__pyx_n_s_length, __pyx_k_length, sizeof(__pyx_k_length), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_memoryview, __pyx_k_memoryview, sizeof(__pyx_k_memoryview), 0, 0, 1, 1},
   {&__pyx_n_s_n_items, __pyx_k_n_items, sizeof(__pyx_k_n_items), 0, 0, 1, 1},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
   {&__pyx_n_s_object, __pyx_k_object, sizeof(__pyx_k_object), 0, 0, 1, 1},
+  {&__pyx_n_s_offset, __pyx_k_offset, sizeof(__pyx_k_offset), 0, 0, 1, 1},
   {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
@@ -7783,6 +9339,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_pyx_unpickle_BufferedReader, __pyx_k_pyx_unpickle_BufferedReader, sizeof(__pyx_k_pyx_unpickle_BufferedReader), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_unpickle_BufferedSocketRea, __pyx_k_pyx_unpickle_BufferedSocketRea, sizeof(__pyx_k_pyx_unpickle_BufferedSocketRea), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_unpickle_CompressedBuffere, __pyx_k_pyx_unpickle_CompressedBuffere, sizeof(__pyx_k_pyx_unpickle_CompressedBuffere), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
   {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
   {&__pyx_n_s_read, __pyx_k_read, sizeof(__pyx_k_read), 0, 0, 1, 1},
   {&__pyx_n_s_read_block, __pyx_k_read_block, sizeof(__pyx_k_read_block), 0, 0, 1, 1},
@@ -7798,18 +9355,20 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
   {&__pyx_n_s_super, __pyx_k_super, sizeof(__pyx_k_super), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_unread, __pyx_k_unread, sizeof(__pyx_k_unread), 0, 0, 1, 1},
   {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
   {&__pyx_kp_u_utf_8, __pyx_k_utf_8, sizeof(__pyx_k_utf_8), 0, 1, 0, 0},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_super = __Pyx_GetBuiltinName(__pyx_n_s_super); if (!__pyx_builtin_super) __PYX_ERR(0, 20, __pyx_L1_error)
-  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 23, __pyx_L1_error)
-  __pyx_builtin_object = __Pyx_GetBuiltinName(__pyx_n_s_object); if (!__pyx_builtin_object) __PYX_ERR(0, 85, __pyx_L1_error)
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 90, __pyx_L1_error)
-  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 117, __pyx_L1_error)
-  __pyx_builtin_UnicodeDecodeError = __Pyx_GetBuiltinName(__pyx_n_s_UnicodeDecodeError); if (!__pyx_builtin_UnicodeDecodeError) __PYX_ERR(0, 168, __pyx_L1_error)
-  __pyx_builtin_EOFError = __Pyx_GetBuiltinName(__pyx_n_s_EOFError); if (!__pyx_builtin_EOFError) __PYX_ERR(0, 240, __pyx_L1_error)
+  __pyx_builtin_super = __Pyx_GetBuiltinName(__pyx_n_s_super); if (!__pyx_builtin_super) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 29, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 72, __pyx_L1_error)
+  __pyx_builtin_object = __Pyx_GetBuiltinName(__pyx_n_s_object); if (!__pyx_builtin_object) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 135, __pyx_L1_error)
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 164, __pyx_L1_error)
+  __pyx_builtin_UnicodeDecodeError = __Pyx_GetBuiltinName(__pyx_n_s_UnicodeDecodeError); if (!__pyx_builtin_UnicodeDecodeError) __PYX_ERR(0, 217, __pyx_L1_error)
+  __pyx_builtin_EOFError = __Pyx_GetBuiltinName(__pyx_n_s_EOFError); if (!__pyx_builtin_EOFError) __PYX_ERR(0, 376, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -7819,51 +9378,62 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "bytehouse_driver/bufferedreader.pyx":240
+  /* "bytehouse_driver/bufferedreader.pyx":72
+ *         """
+ *         if offset + unread > <unsigned long long> len(dst):
+ *             raise ValueError('Destination buffer is too small')             # <<<<<<<<<<<<<<
+ * 
+ *         cdef char* dst_ptr = PyByteArray_AsString(dst)
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_Destination_buffer_is_too_small); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 72, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "bytehouse_driver/bufferedreader.pyx":376
  * 
  *         if self.current_buffer_size == 0:
  *             raise EOFError('Unexpected EOF while reading bytes')             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_Unexpected_EOF_while_reading_byt); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 240, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple_);
-  __Pyx_GIVEREF(__pyx_tuple_);
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_Unexpected_EOF_while_reading_byt); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 376, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
 
   /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x2a8a945, 0x5e0d780, 0x07c78bc):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0x0d82568, 0xe0b4e91, 0xfe80cf8):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2a8a945, 0x5e0d780, 0x07c78bc) = (buffer, current_buffer_size, position))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x0d82568, 0xe0b4e91, 0xfe80cf8) = (buffer, current_buffer_size, position, refills_in_place))" % __pyx_checksum)
  */
-  __pyx_tuple__2 = PyTuple_Pack(3, __pyx_int_44607813, __pyx_int_98621312, __pyx_int_8157372); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__2);
-  __Pyx_GIVEREF(__pyx_tuple__2);
-  __pyx_tuple__3 = PyTuple_Pack(3, __pyx_int_251251440, __pyx_int_72267464, __pyx_int_189790066); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_tuple__3 = PyTuple_Pack(3, __pyx_int_14165352, __pyx_int_235622033, __pyx_int_266865912); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
-  __pyx_tuple__4 = PyTuple_Pack(3, __pyx_int_25411819, __pyx_int_110699518, __pyx_int_265404057); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_tuple__4 = PyTuple_Pack(3, __pyx_int_145649776, __pyx_int_124915771, __pyx_int_41026655); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__4);
   __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_tuple__5 = PyTuple_Pack(3, __pyx_int_137413636, __pyx_int_51417437, __pyx_int_35074206); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
 
   /* "(tree fragment)":1
  * def __pyx_unpickle_BufferedReader(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_tuple__5 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
-  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__5, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_BufferedReader, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __pyx_tuple__7 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
-  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_BufferedSocketRea, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __pyx_tuple__9 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
-  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_CompressedBuffere, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__6 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_BufferedReader, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__8 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_BufferedSocketRea, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__10 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_CompressedBuffere, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -7873,15 +9443,15 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
 
 static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_8157372 = PyInt_FromLong(8157372L); if (unlikely(!__pyx_int_8157372)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_25411819 = PyInt_FromLong(25411819L); if (unlikely(!__pyx_int_25411819)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_44607813 = PyInt_FromLong(44607813L); if (unlikely(!__pyx_int_44607813)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_72267464 = PyInt_FromLong(72267464L); if (unlikely(!__pyx_int_72267464)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_98621312 = PyInt_FromLong(98621312L); if (unlikely(!__pyx_int_98621312)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_110699518 = PyInt_FromLong(110699518L); if (unlikely(!__pyx_int_110699518)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_189790066 = PyInt_FromLong(189790066L); if (unlikely(!__pyx_int_189790066)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_251251440 = PyInt_FromLong(251251440L); if (unlikely(!__pyx_int_251251440)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_265404057 = PyInt_FromLong(265404057L); if (unlikely(!__pyx_int_265404057)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_14165352 = PyInt_FromLong(14165352L); if (unlikely(!__pyx_int_14165352)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_35074206 = PyInt_FromLong(35074206L); if (unlikely(!__pyx_int_35074206)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_41026655 = PyInt_FromLong(41026655L); if (unlikely(!__pyx_int_41026655)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_51417437 = PyInt_FromLong(51417437L); if (unlikely(!__pyx_int_51417437)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_124915771 = PyInt_FromLong(124915771L); if (unlikely(!__pyx_int_124915771)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_137413636 = PyInt_FromLong(137413636L); if (unlikely(!__pyx_int_137413636)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_145649776 = PyInt_FromLong(145649776L); if (unlikely(!__pyx_int_145649776)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_235622033 = PyInt_FromLong(235622033L); if (unlikely(!__pyx_int_235622033)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_266865912 = PyInt_FromLong(266865912L); if (unlikely(!__pyx_int_266865912)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -7926,37 +9496,46 @@ static int __Pyx_modinit_type_init_code(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_16bytehouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  __pyx_vtabptr_16bytehouse_driver_14bufferedreader_BufferedReader = &__pyx_vtable_16bytehouse_driver_14bufferedreader_BufferedReader;
+  __pyx_vtable_16bytehouse_driver_14bufferedreader_BufferedReader._read_into = (int (*)(struct __pyx_obj_16bytehouse_driver_14bufferedreader_BufferedReader *, char *, unsigned PY_LONG_LONG))__pyx_f_16bytehouse_driver_14bufferedreader_14BufferedReader__read_into;
+  if (PyType_Ready(&__pyx_type_16bytehouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_16bytehouse_driver_14bufferedreader_BufferedReader.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_16bytehouse_driver_14bufferedreader_BufferedReader.tp_dictoffset && __pyx_type_16bytehouse_driver_14bufferedreader_BufferedReader.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_16bytehouse_driver_14bufferedreader_BufferedReader.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BufferedReader, (PyObject *)&__pyx_type_16bytehouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_16bytehouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_16bytehouse_driver_14bufferedreader_BufferedReader.tp_dict, __pyx_vtabptr_16bytehouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BufferedReader, (PyObject *)&__pyx_type_16bytehouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_16bytehouse_driver_14bufferedreader_BufferedReader) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
   __pyx_ptype_16bytehouse_driver_14bufferedreader_BufferedReader = &__pyx_type_16bytehouse_driver_14bufferedreader_BufferedReader;
+  __pyx_vtabptr_16bytehouse_driver_14bufferedreader_BufferedSocketReader = &__pyx_vtable_16bytehouse_driver_14bufferedreader_BufferedSocketReader;
+  __pyx_vtable_16bytehouse_driver_14bufferedreader_BufferedSocketReader.__pyx_base = *__pyx_vtabptr_16bytehouse_driver_14bufferedreader_BufferedReader;
   __pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocketReader.tp_base = __pyx_ptype_16bytehouse_driver_14bufferedreader_BufferedReader;
-  if (PyType_Ready(&__pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 229, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 365, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocketReader.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocketReader.tp_dictoffset && __pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocketReader.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocketReader.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BufferedSocketReader, (PyObject *)&__pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 229, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 229, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocketReader.tp_dict, __pyx_vtabptr_16bytehouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 365, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BufferedSocketReader, (PyObject *)&__pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 365, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocketReader) < 0) __PYX_ERR(0, 365, __pyx_L1_error)
   __pyx_ptype_16bytehouse_driver_14bufferedreader_BufferedSocketReader = &__pyx_type_16bytehouse_driver_14bufferedreader_BufferedSocketReader;
+  __pyx_vtabptr_16bytehouse_driver_14bufferedreader_CompressedBufferedReader = &__pyx_vtable_16bytehouse_driver_14bufferedreader_CompressedBufferedReader;
+  __pyx_vtable_16bytehouse_driver_14bufferedreader_CompressedBufferedReader.__pyx_base = *__pyx_vtabptr_16bytehouse_driver_14bufferedreader_BufferedReader;
   __pyx_type_16bytehouse_driver_14bufferedreader_CompressedBufferedReader.tp_base = __pyx_ptype_16bytehouse_driver_14bufferedreader_BufferedReader;
-  if (PyType_Ready(&__pyx_type_16bytehouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 243, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_16bytehouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 379, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_16bytehouse_driver_14bufferedreader_CompressedBufferedReader.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_16bytehouse_driver_14bufferedreader_CompressedBufferedReader.tp_dictoffset && __pyx_type_16bytehouse_driver_14bufferedreader_CompressedBufferedReader.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_16bytehouse_driver_14bufferedreader_CompressedBufferedReader.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_CompressedBufferedReader, (PyObject *)&__pyx_type_16bytehouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 243, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_16bytehouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 243, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_16bytehouse_driver_14bufferedreader_CompressedBufferedReader.tp_dict, __pyx_vtabptr_16bytehouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 379, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_CompressedBufferedReader, (PyObject *)&__pyx_type_16bytehouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 379, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_16bytehouse_driver_14bufferedreader_CompressedBufferedReader) < 0) __PYX_ERR(0, 379, __pyx_L1_error)
   __pyx_ptype_16bytehouse_driver_14bufferedreader_CompressedBufferedReader = &__pyx_type_16bytehouse_driver_14bufferedreader_CompressedBufferedReader;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -8232,8 +9811,8 @@ if (!__Pyx_RefNanny) {
  *         __pyx_unpickle_BufferedReader__set_state(<BufferedReader> __pyx_result, __pyx_state)
  *     return __pyx_result
  * cdef __pyx_unpickle_BufferedReader__set_state(BufferedReader __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
- *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.current_buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.refills_in_place = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
  */
   __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_16bytehouse_driver_14bufferedreader_3__pyx_unpickle_BufferedSocketReader, NULL, __pyx_n_s_bytehouse_driver_bufferedreader); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
@@ -8252,8 +9831,8 @@ if (!__Pyx_RefNanny) {
 
   /* "bytehouse_driver/bufferedreader.pyx":1
  * from cpython cimport Py_INCREF, PyBytes_FromStringAndSize, PyBytes_AsString             # <<<<<<<<<<<<<<
- * from cpython.bytearray cimport PyByteArray_AsString
- * # Using python's versions of pure c memory management functions for
+ * from cpython.bytearray cimport (
+ *     PyByteArray_AsString, PyByteArray_FromStringAndSize, PyByteArray_Resize
  */
   __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
@@ -8899,6 +10478,185 @@ bad:
 }
 #endif
 
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* SliceObject */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
+        Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
+        int has_cstart, int has_cstop, CYTHON_UNUSED int wraparound) {
+#if CYTHON_USE_TYPE_SLOTS
+    PyMappingMethods* mp;
+#if PY_MAJOR_VERSION < 3
+    PySequenceMethods* ms = Py_TYPE(obj)->tp_as_sequence;
+    if (likely(ms && ms->sq_slice)) {
+        if (!has_cstart) {
+            if (_py_start && (*_py_start != Py_None)) {
+                cstart = __Pyx_PyIndex_AsSsize_t(*_py_start);
+                if ((cstart == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstart = 0;
+        }
+        if (!has_cstop) {
+            if (_py_stop && (*_py_stop != Py_None)) {
+                cstop = __Pyx_PyIndex_AsSsize_t(*_py_stop);
+                if ((cstop == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstop = PY_SSIZE_T_MAX;
+        }
+        if (wraparound && unlikely((cstart < 0) | (cstop < 0)) && likely(ms->sq_length)) {
+            Py_ssize_t l = ms->sq_length(obj);
+            if (likely(l >= 0)) {
+                if (cstop < 0) {
+                    cstop += l;
+                    if (cstop < 0) cstop = 0;
+                }
+                if (cstart < 0) {
+                    cstart += l;
+                    if (cstart < 0) cstart = 0;
+                }
+            } else {
+                if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                    goto bad;
+                PyErr_Clear();
+            }
+        }
+        return ms->sq_slice(obj, cstart, cstop);
+    }
+#endif
+    mp = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(mp && mp->mp_subscript))
+#endif
+    {
+        PyObject* result;
+        PyObject *py_slice, *py_start, *py_stop;
+        if (_py_slice) {
+            py_slice = *_py_slice;
+        } else {
+            PyObject* owned_start = NULL;
+            PyObject* owned_stop = NULL;
+            if (_py_start) {
+                py_start = *_py_start;
+            } else {
+                if (has_cstart) {
+                    owned_start = py_start = PyInt_FromSsize_t(cstart);
+                    if (unlikely(!py_start)) goto bad;
+                } else
+                    py_start = Py_None;
+            }
+            if (_py_stop) {
+                py_stop = *_py_stop;
+            } else {
+                if (has_cstop) {
+                    owned_stop = py_stop = PyInt_FromSsize_t(cstop);
+                    if (unlikely(!py_stop)) {
+                        Py_XDECREF(owned_start);
+                        goto bad;
+                    }
+                } else
+                    py_stop = Py_None;
+            }
+            py_slice = PySlice_New(py_start, py_stop, Py_None);
+            Py_XDECREF(owned_start);
+            Py_XDECREF(owned_stop);
+            if (unlikely(!py_slice)) goto bad;
+        }
+#if CYTHON_USE_TYPE_SLOTS
+        result = mp->mp_subscript(obj, py_slice);
+#else
+        result = PyObject_GetItem(obj, py_slice);
+#endif
+        if (!_py_slice) {
+            Py_DECREF(py_slice);
+        }
+        return result;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "'%.200s' object is unsliceable", Py_TYPE(obj)->tp_name);
+bad:
+    return NULL;
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
 /* GetItemIntByteArray */
 static CYTHON_INLINE int __Pyx_GetItemInt_ByteArray_Fast(PyObject* string, Py_ssize_t i,
                                                          int wraparound, int boundscheck) {
@@ -9134,6 +10892,41 @@ bad:
     return -1;
 }
 
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+    #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#endif
+
 /* GetAttr */
 static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
 #if CYTHON_USE_TYPE_SLOTS
@@ -9162,67 +10955,6 @@ static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject
     return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
 }
 
-/* PyDictVersioning */
-#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
-}
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
-    PyObject **dictptr = NULL;
-    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
-    if (offset) {
-#if CYTHON_COMPILING_IN_CPYTHON
-        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
-#else
-        dictptr = _PyObject_GetDictPtr(obj);
-#endif
-    }
-    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
-}
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
-        return 0;
-    return obj_dict_version == __Pyx_get_object_dict_version(obj);
-}
-#endif
-
-/* GetModuleGlobalName */
-#if CYTHON_USE_DICT_VERSIONS
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
-#else
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
-#endif
-{
-    PyObject *result;
-#if !CYTHON_AVOID_BORROWED_REFS
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
-    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    } else if (unlikely(PyErr_Occurred())) {
-        return NULL;
-    }
-#else
-    result = PyDict_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
-#endif
-#else
-    result = PyObject_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
-    PyErr_Clear();
-#endif
-    return __Pyx_GetBuiltinName(name);
-}
-
 /* Import */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
@@ -9480,6 +11212,24 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 }
 #endif
 
+/* SetVTable */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
 /* PyObjectGetAttrStrNoError */
 static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
     __Pyx_PyThreadState_declare
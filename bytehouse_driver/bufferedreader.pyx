@@ -1,21 +1,27 @@
 from cpython cimport Py_INCREF, PyBytes_FromStringAndSize, PyBytes_AsString
-from cpython.bytearray cimport PyByteArray_AsString
+from cpython.bytearray cimport (
+    PyByteArray_AsString, PyByteArray_FromStringAndSize, PyByteArray_Resize
+)
 # Using python's versions of pure c memory management functions for
 # proper memory statistics count.
 from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free
 from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
+from libc.stdint cimport int32_t, int64_t
 from libc.string cimport memcpy
 
 
 cdef class BufferedReader(object):
     cdef public unsigned long long position, current_buffer_size
     cdef public bytearray buffer
+    # Views returned by `read_view` are overwritten on refill.
+    cdef public bint refills_in_place
 
     def __init__(self, bufsize):
         self.buffer = bytearray(bufsize)
 
         self.position = 0
         self.current_buffer_size = 0
+        self.refills_in_place = True
 
         super(BufferedReader, self).__init__()
 
@@ -26,29 +32,67 @@ cdef class BufferedReader(object):
         # When the buffer is large enough bytes read are almost
         # always hit the buffer.
         cdef unsigned long long next_position = unread + self.position
-        if next_position < self.current_buffer_size:
+        cdef char* buffer_ptr
+        if next_position <= self.current_buffer_size:
+            buffer_ptr = PyByteArray_AsString(self.buffer)
             t = self.position
             self.position = next_position
-            return bytes(self.buffer[t:self.position])
+            return PyBytes_FromStringAndSize(&buffer_ptr[t], unread)
 
+        # Result is allocated once and filled chunk by chunk to keep
+        # reads spanning several buffers linear.
+        rv = PyBytes_FromStringAndSize(NULL, unread)
+        self._read_into(PyBytes_AsString(rv), unread)
+        return rv
+
+    def read_view(self, unsigned long long unread):
+        """
+        Reads ``unread`` bytes without copying them when possible.
+
+        If all bytes are already in the buffer returned memoryview points
+        into it and is valid only until the next read from this reader.
+        Otherwise bytes are assembled into a new buffer owned by the view.
+        """
+        cdef unsigned long long next_position = unread + self.position
+        if next_position <= self.current_buffer_size:
+            t = self.position
+            self.position = next_position
+            return memoryview(self.buffer)[t:next_position]
+
+        rv = PyByteArray_FromStringAndSize(NULL, unread)
+        self._read_into(PyByteArray_AsString(rv), unread)
+        return memoryview(rv)
+
+    def read_into(self, bytearray dst, unsigned long long offset,
+                  unsigned long long unread):
+        """
+        Reads ``unread`` bytes into ``dst`` starting at ``offset``.
+        """
+        if offset + unread > <unsigned long long> len(dst):
+            raise ValueError('Destination buffer is too small')
+
+        cdef char* dst_ptr = PyByteArray_AsString(dst)
+        self._read_into(&dst_ptr[offset], unread)
+
+    cdef int _read_into(self, char* dst,
+                        unsigned long long unread) except -1:
         cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
-        cdef unsigned long long read_bytes
-        rv = bytes()
+        cdef unsigned long long read_bytes, written = 0
 
         while unread > 0:
             if self.position == self.current_buffer_size:
                 self.read_into_buffer()
+                # `read_into_buffer` can override buffer
                 buffer_ptr = PyByteArray_AsString(self.buffer)
                 self.position = 0
 
             read_bytes = min(unread, self.current_buffer_size - self.position)
-            rv += PyBytes_FromStringAndSize(
-                &buffer_ptr[self.position], read_bytes
-            )
+            memcpy(&dst[written], &buffer_ptr[self.position], read_bytes)
             self.position += read_bytes
+            written += read_bytes
             unread -= read_bytes
 
-        return rv
+        return 0
 
     def read_one(self):
         if self.position == self.current_buffer_size:
@@ -87,6 +131,125 @@ cdef class BufferedReader(object):
         if c_encoding:
             c_string = <char *> PyMem_Realloc(NULL, c_string_size)
 
+        try:
+            for i in range(n_items):
+                shift = size = 0
+
+                # Read string size
+                while True:
+                    if self.position == self.current_buffer_size:
+                        self.read_into_buffer()
+                        # `read_into_buffer` can override buffer
+                        buffer_ptr = PyByteArray_AsString(self.buffer)
+                        self.position = 0
+
+                    b = buffer_ptr[self.position]
+                    self.position += 1
+
+                    size |= (b & 0x7f) << shift
+                    if b < 0x80:
+                        break
+
+                    shift += 7
+
+                right = self.position + size
+
+                if c_encoding:
+                    if size + 1 > c_string_size:
+                        c_string_size = size + 1
+                        c_string = <char *> PyMem_Realloc(
+                            c_string, c_string_size
+                        )
+                        if c_string is NULL:
+                            raise MemoryError()
+                    c_string[size] = 0
+                    bytes_read = 0
+
+                # Decoding pure c strings in Cython is faster than in pure
+                # Python. We need to copy it into buffer for adding null
+                # symbol at the end. In ByteHouse block there is no null
+                if right > self.current_buffer_size:
+                    if c_encoding:
+                        memcpy(&c_string[bytes_read],
+                               &buffer_ptr[self.position],
+                               self.current_buffer_size - self.position)
+                    else:
+                        rv = PyBytes_FromStringAndSize(
+                            &buffer_ptr[self.position],
+                            self.current_buffer_size - self.position
+                        )
+
+                    bytes_read = self.current_buffer_size - self.position
+                    # Read the rest of the string.
+                    while bytes_read != size:
+                        self.position = size - bytes_read
+
+                        self.read_into_buffer()
+                        # `read_into_buffer` can override buffer
+                        buffer_ptr = PyByteArray_AsString(self.buffer)
+                        # There can be not enough data in buffer.
+                        self.position = min(
+                            self.position, self.current_buffer_size
+                        )
+                        if c_encoding:
+                            memcpy(
+                                &c_string[bytes_read], buffer_ptr,
+                                self.position
+                            )
+                        else:
+                            rv += PyBytes_FromStringAndSize(
+                                buffer_ptr, self.position
+                            )
+                        bytes_read += self.position
+
+                else:
+                    if c_encoding:
+                        memcpy(c_string, &buffer_ptr[self.position], size)
+                    else:
+                        rv = PyBytes_FromStringAndSize(
+                            &buffer_ptr[self.position], size
+                        )
+                    self.position = right
+
+                if c_encoding:
+                    try:
+                        rv = c_string[:size].decode(c_encoding)
+                    except UnicodeDecodeError:
+                        rv = PyBytes_FromStringAndSize(c_string, size)
+
+                Py_INCREF(rv)
+                PyTuple_SET_ITEM(items, i, rv)
+
+        finally:
+            # Reading can be interrupted by buffer refill error.
+            if c_string:
+                PyMem_Free(c_string)
+
+        return items
+
+    def read_string_buffers(self, unsigned long long n_items):
+        """
+        Reads strings into Arrow-compatible buffers without creating string
+        objects.
+
+        :return: tuple of offsets and data bytearrays and flag whether
+                 offsets are int64. Offsets are ``n_items + 1`` int32 values
+                 or int64 values if data exceeds 2 GiB.
+        """
+        offsets = PyByteArray_FromStringAndSize(NULL, (n_items + 1) * 4)
+        cdef int32_t* offsets_ptr = <int32_t*> PyByteArray_AsString(offsets)
+        large_offsets = None
+        cdef int64_t* large_offsets_ptr = NULL
+        cdef unsigned long long capacity = max(n_items * 8, <unsigned long long> 64)
+        data = PyByteArray_FromStringAndSize(NULL, capacity)
+        cdef char* data_ptr
+
+        cdef unsigned long long i, j
+        cdef char* buffer_ptr = PyByteArray_AsString(self.buffer)
+        cdef unsigned long long size, shift, b, copied, read_bytes
+        cdef unsigned long long total = 0
+
+        offsets_ptr[0] = 0
         for i in range(n_items):
             shift = size = 0
 
@@ -107,74 +270,47 @@ cdef class BufferedReader(object):
 
                 shift += 7
 
-            right = self.position + size
-
-            if c_encoding:
-                if size + 1 > c_string_size:
-                    c_string_size = size + 1
-                    c_string = <char *> PyMem_Realloc(c_string, c_string_size)
-                    if c_string is NULL:
-                        raise MemoryError()
-                c_string[size] = 0
-                bytes_read = 0
-
-            # Decoding pure c strings in Cython is faster than in pure Python.
-            # We need to copy it into buffer for adding null symbol at the end.
-            # In ByteHouse block there is no null
-            if right > self.current_buffer_size:
-                if c_encoding:
-                    memcpy(&c_string[bytes_read], &buffer_ptr[self.position],
-                           self.current_buffer_size - self.position)
-                else:
-                    rv = PyBytes_FromStringAndSize(
-                        &buffer_ptr[self.position],
-                        self.current_buffer_size - self.position
-                    )
-
-                bytes_read = self.current_buffer_size - self.position
-                # Read the rest of the string.
-                while bytes_read != size:
-                    self.position = size - bytes_read
-
+            if large_offsets_ptr == NULL and total + size > 0x7fffffff:
+                # Offsets are widened for Arrow large string type.
+                large_offsets = PyByteArray_FromStringAndSize(
+                    NULL, (n_items + 1) * 8
+                )
+                large_offsets_ptr = <int64_t*> PyByteArray_AsString(
+                    large_offsets
+                )
+                for j in range(i + 1):
+                    large_offsets_ptr[j] = offsets_ptr[j]
+
+            if total + size > capacity:
+                capacity = max(capacity * 2, total + size)
+                PyByteArray_Resize(data, capacity)
+            data_ptr = PyByteArray_AsString(data)
+
+            copied = 0
+            while copied < size:
+                if self.position == self.current_buffer_size:
                     self.read_into_buffer()
-                    # `read_into_buffer` can override buffer
                     buffer_ptr = PyByteArray_AsString(self.buffer)
-                    # There can be not enough data in buffer.
-                    self.position = min(
-                        self.position, self.current_buffer_size
-                    )
-                    if c_encoding:
-                        memcpy(
-                            &c_string[bytes_read], buffer_ptr, self.position
-                        )
-                    else:
-                        rv += PyBytes_FromStringAndSize(
-                            buffer_ptr, self.position
-                        )
-                    bytes_read += self.position
+                    self.position = 0
 
+                read_bytes = min(
+                    size - copied, self.current_buffer_size - self.position
+                )
+                memcpy(&data_ptr[total + copied], &buffer_ptr[self.position],
+                       read_bytes)
+                self.position += read_bytes
+                copied += read_bytes
+
+            total += size
+            if large_offsets_ptr != NULL:
+                large_offsets_ptr[i + 1] = <int64_t> total
             else:
-                if c_encoding:
-                    memcpy(c_string, &buffer_ptr[self.position], size)
-                else:
-                    rv = PyBytes_FromStringAndSize(
-                        &buffer_ptr[self.position], size
-                    )
-                self.position = right
-
-            if c_encoding:
-                try:
-                    rv = c_string[:size].decode(c_encoding)
-                except UnicodeDecodeError:
-                    rv = PyBytes_FromStringAndSize(c_string, size)
+                offsets_ptr[i + 1] = <int32_t> total
 
-            Py_INCREF(rv)
-            PyTuple_SET_ITEM(items, i, rv)
-
-        if c_string:
-            PyMem_Free(c_string)
-
-        return items
+        PyByteArray_Resize(data, total)
+        if large_offsets is not None:
+            return large_offsets, data, True
+        return offsets, data, False
 
     def read_fixed_strings_as_bytes(self, Py_ssize_t n_items,
                                     Py_ssize_t length):
@@ -246,9 +382,15 @@ cdef class CompressedBufferedReader(BufferedReader):
     def __init__(self, read_block, bufsize):
         self.read_block = read_block
         super(CompressedBufferedReader, self).__init__(bufsize)
+        # Every block becomes a new buffer.
+        self.refills_in_place = False
 
     def read_into_buffer(self):
-        self.buffer = bytearray(self.read_block())
+        block = self.read_block()
+        # Decompressed bytearray becomes the buffer as is.
+        if type(block) is not bytearray:
+            block = bytearray(block)
+        self.buffer = block
         self.current_buffer_size = len(self.buffer)
 
         if self.current_buffer_size == 0:
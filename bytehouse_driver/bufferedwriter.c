@@ -757,6 +757,7 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include <string.h>
 #include <stdio.h>
 #include "pythread.h"
+#include <stdint.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -968,60 +969,74 @@ static const char *__pyx_filename;
 static const char *__pyx_f[] = {
   "bytehouse_driver/bufferedwriter.pyx",
   "stringsource",
-  "venv-new/lib/python3.8/site-packages/Cython/Includes/cpython/type.pxd",
-  "venv-new/lib/python3.8/site-packages/Cython/Includes/cpython/bool.pxd",
-  "venv-new/lib/python3.8/site-packages/Cython/Includes/cpython/complex.pxd",
+  "type.pxd",
+  "bool.pxd",
+  "complex.pxd",
 };
 
 /*--- Type declarations ---*/
-struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter;
-struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter;
-struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter;
+struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter;
+struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter;
+struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter;
+struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter;
 
-/* "bytehouse_driver/bufferedwriter.pyx":10
+/* "bytehouse_driver/bufferedwriter.pyx":13
  * 
  * 
  * cdef class BufferedWriter(object):             # <<<<<<<<<<<<<<
  *     cdef char* buffer
  *     cdef unsigned long long position, buffer_size
  */
-struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter {
+struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter {
   PyObject_HEAD
-  struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_vtab;
+  struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_vtab;
   char *buffer;
   unsigned PY_LONG_LONG position;
   unsigned PY_LONG_LONG buffer_size;
 };
 
 
-/* "bytehouse_driver/bufferedwriter.pyx":119
+/* "bytehouse_driver/bufferedwriter.pyx":198
  * 
  * 
  * cdef class BufferedSocketWriter(BufferedWriter):             # <<<<<<<<<<<<<<
  *     cdef object sock
  * 
  */
-struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter {
-  struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter __pyx_base;
+struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter {
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter __pyx_base;
   PyObject *sock;
 };
 
 
-/* "bytehouse_driver/bufferedwriter.pyx":133
+/* "bytehouse_driver/bufferedwriter.pyx":212
  * 
  * 
  * cdef class CompressedBufferedWriter(BufferedWriter):             # <<<<<<<<<<<<<<
  *     cdef object compressor
  * 
  */
-struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter {
-  struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter __pyx_base;
+struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter {
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter __pyx_base;
   PyObject *compressor;
 };
 
 
+/* "bytehouse_driver/bufferedwriter.pyx":229
+ * 
+ * 
+ * cdef class BufferedMemoryWriter(BufferedWriter):             # <<<<<<<<<<<<<<
+ *     cdef object chunks
+ * 
+ */
+struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter {
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter __pyx_base;
+  PyObject *chunks;
+};
+
 
-/* "bytehouse_driver/bufferedwriter.pyx":10
+
+/* "bytehouse_driver/bufferedwriter.pyx":13
  * 
  * 
  * cdef class BufferedWriter(object):             # <<<<<<<<<<<<<<
@@ -1029,14 +1044,16 @@ struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter {
  *     cdef unsigned long long position, buffer_size
  */
 
-struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter {
-  PyObject *(*write_into_stream)(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *, int __pyx_skip_dispatch);
-  PyObject *(*write)(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *, PyObject *, int __pyx_skip_dispatch);
+struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter {
+  PyObject *(*write_into_stream)(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *, int __pyx_skip_dispatch);
+  int (*_write)(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *, char const *, unsigned PY_LONG_LONG);
+  int (*_write_varint)(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *, unsigned PY_LONG_LONG);
+  PyObject *(*write)(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *, PyObject *, int __pyx_skip_dispatch);
 };
-static struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_vtabptr_17bytehouse_driver_14bufferedwriter_BufferedWriter;
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedWriter;
 
 
-/* "bytehouse_driver/bufferedwriter.pyx":119
+/* "bytehouse_driver/bufferedwriter.pyx":198
  * 
  * 
  * cdef class BufferedSocketWriter(BufferedWriter):             # <<<<<<<<<<<<<<
@@ -1044,13 +1061,13 @@ static struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWrite
  * 
  */
 
-struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter {
-  struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter __pyx_base;
+struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter {
+  struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter __pyx_base;
 };
-static struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_vtabptr_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter;
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter;
 
 
-/* "bytehouse_driver/bufferedwriter.pyx":133
+/* "bytehouse_driver/bufferedwriter.pyx":212
  * 
  * 
  * cdef class CompressedBufferedWriter(BufferedWriter):             # <<<<<<<<<<<<<<
@@ -1058,10 +1075,24 @@ static struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedSocke
  * 
  */
 
-struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter {
-  struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter __pyx_base;
+struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter {
+  struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter __pyx_base;
+};
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_vtabptr_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter;
+
+
+/* "bytehouse_driver/bufferedwriter.pyx":229
+ * 
+ * 
+ * cdef class BufferedMemoryWriter(BufferedWriter):             # <<<<<<<<<<<<<<
+ *     cdef object chunks
+ * 
+ */
+
+struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter {
+  struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter __pyx_base;
 };
-static struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_vtabptr_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter;
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter;
 
 /* --- Runtime support code (head) --- */
 /* Refnanny.proto */
@@ -1277,6 +1308,38 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
 /* PyObjectCall2Args.proto */
 static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
 
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
 /* GetModuleGlobalName.proto */
 #if CYTHON_USE_DICT_VERSIONS
 #define __Pyx_GetModuleGlobalName(var, name)  do {\
@@ -1298,6 +1361,13 @@ static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_ve
 static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
 #endif
 
+/* DivInt[Py_ssize_t].proto */
+static CYTHON_INLINE Py_ssize_t __Pyx_div_Py_ssize_t(Py_ssize_t, Py_ssize_t);
+
+/* UnaryNegOverflows.proto */
+#define UNARY_NEG_WOULD_OVERFLOW(x)\
+        (((x) < 0) & ((unsigned long)(x) == 0-(unsigned long)(x)))
+
 /* PyErrExceptionMatches.proto */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
@@ -1312,17 +1382,31 @@ static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
 /* GetAttr3.proto */
 static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
 
-/* PySequenceContains.proto */
-static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
-    int result = PySequence_Contains(seq, item);
-    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
 }
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
 
-/* Import.proto */
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
 
-/* ImportFrom.proto */
-static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+/* PyObjectCallMethod1.proto */
+static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg);
+
+/* append.proto */
+static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x);
 
 /* GetItemInt.proto */
 #define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
@@ -1346,6 +1430,36 @@ static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
 static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
                                                      int is_list, int wraparound, int boundscheck);
 
+/* StringJoin.proto */
+#if PY_MAJOR_VERSION < 3
+#define __Pyx_PyString_Join __Pyx_PyBytes_Join
+#define __Pyx_PyBaseString_Join(s, v) (PyUnicode_CheckExact(s) ? PyUnicode_Join(s, v) : __Pyx_PyBytes_Join(s, v))
+#else
+#define __Pyx_PyString_Join PyUnicode_Join
+#define __Pyx_PyBaseString_Join PyUnicode_Join
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+    #if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyBytes_Join _PyString_Join
+    #else
+    #define __Pyx_PyBytes_Join _PyBytes_Join
+    #endif
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyBytes_Join(PyObject* sep, PyObject* values);
+#endif
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
 /* HasAttr.proto */
 static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
 
@@ -1454,10 +1568,13 @@ static int __Pyx_check_binary_version(void);
 /* InitStrings.proto */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_14BufferedWriter_write_into_stream(CYTHON_UNUSED struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_14BufferedWriter_write(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_data, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_write_into_stream(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_write_into_stream(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter_write_into_stream(CYTHON_UNUSED struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static int __pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter__write(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, char const *__pyx_v_data, unsigned PY_LONG_LONG __pyx_v_data_len); /* proto*/
+static int __pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter__write_varint(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_number); /* proto*/
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter_write(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_data, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
 
 /* Module declarations from 'cpython.version' */
 
@@ -1542,13 +1659,17 @@ static PyTypeObject *__pyx_ptype_7cpython_7complex_complex = 0;
 
 /* Module declarations from 'cpython' */
 
+/* Module declarations from 'libc.stdint' */
+
 /* Module declarations from 'bytehouse_driver.bufferedwriter' */
-static PyTypeObject *__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter = 0;
-static PyTypeObject *__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter = 0;
-static PyTypeObject *__pyx_ptype_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter = 0;
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter__set_state(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *, PyObject *); /*proto*/
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedSocketWriter__set_state(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *, PyObject *); /*proto*/
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_CompressedBufferedWriter__set_state(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *, PyObject *); /*proto*/
+static PyTypeObject *__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter = 0;
+static PyTypeObject *__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter = 0;
+static PyTypeObject *__pyx_ptype_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter = 0;
+static PyTypeObject *__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter = 0;
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter__set_state(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *, PyObject *); /*proto*/
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedSocketWriter__set_state(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *, PyObject *); /*proto*/
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_CompressedBufferedWriter__set_state(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *, PyObject *); /*proto*/
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedMemoryWriter__set_state(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *, PyObject *); /*proto*/
 #define __Pyx_MODULE_NAME "bytehouse_driver.bufferedwriter"
 extern int __pyx_module_is_main_bytehouse_driver__bufferedwriter;
 int __pyx_module_is_main_bytehouse_driver__bufferedwriter = 0;
@@ -1558,17 +1679,22 @@ static PyObject *__pyx_builtin_MemoryError;
 static PyObject *__pyx_builtin_super;
 static PyObject *__pyx_builtin_NotImplementedError;
 static PyObject *__pyx_builtin_ValueError;
-static const char __pyx_k__5[] = "";
+static PyObject *__pyx_builtin_range;
+static const char __pyx_k__4[] = "";
 static const char __pyx_k_new[] = "__new__";
+static const char __pyx_k_data[] = "data";
 static const char __pyx_k_dict[] = "__dict__";
 static const char __pyx_k_init[] = "__init__";
+static const char __pyx_k_join[] = "join";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "__name__";
 static const char __pyx_k_sock[] = "sock";
 static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_items[] = "items";
+static const char __pyx_k_range[] = "range";
 static const char __pyx_k_super[] = "super";
 static const char __pyx_k_write[] = "write";
+static const char __pyx_k_append[] = "append";
 static const char __pyx_k_encode[] = "encode";
 static const char __pyx_k_errors[] = "errors";
 static const char __pyx_k_import[] = "__import__";
@@ -1578,6 +1704,7 @@ static const char __pyx_k_reduce[] = "__reduce__";
 static const char __pyx_k_update[] = "update";
 static const char __pyx_k_varint[] = "varint";
 static const char __pyx_k_bufsize[] = "bufsize";
+static const char __pyx_k_offsets[] = "offsets";
 static const char __pyx_k_sendall[] = "sendall";
 static const char __pyx_k_encoding[] = "encoding";
 static const char __pyx_k_getstate[] = "__getstate__";
@@ -1602,34 +1729,45 @@ static const char __pyx_k_write_into_stream[] = "write_into_stream";
 static const char __pyx_k_TooLargeStringSize[] = "TooLargeStringSize";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_NotImplementedError[] = "NotImplementedError";
+static const char __pyx_k_BufferedMemoryWriter[] = "BufferedMemoryWriter";
 static const char __pyx_k_BufferedSocketWriter[] = "BufferedSocketWriter";
 static const char __pyx_k_bytes_object_expected[] = "bytes object expected";
+static const char __pyx_k_Invalid_string_offsets[] = "Invalid string offsets";
 static const char __pyx_k_CompressedBufferedWriter[] = "CompressedBufferedWriter";
 static const char __pyx_k_pyx_unpickle_BufferedWriter[] = "__pyx_unpickle_BufferedWriter";
 static const char __pyx_k_write_fixed_strings_as_bytes[] = "write_fixed_strings_as_bytes";
+static const char __pyx_k_pyx_unpickle_BufferedMemoryWri[] = "__pyx_unpickle_BufferedMemoryWriter";
 static const char __pyx_k_pyx_unpickle_BufferedSocketWri[] = "__pyx_unpickle_BufferedSocketWriter";
 static const char __pyx_k_pyx_unpickle_CompressedBuffere[] = "__pyx_unpickle_CompressedBufferedWriter";
-static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))";
 static const char __pyx_k_bytehouse_driver_bufferedwriter[] = "bytehouse_driver.bufferedwriter";
+static const char __pyx_k_int32_or_int64_offsets_expected[] = "int32 or int64 offsets expected";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))";
 static const char __pyx_k_Incompatible_checksums_0x_x_vs_0_2[] = "Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))";
 static const char __pyx_k_Incompatible_checksums_0x_x_vs_0_3[] = "Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0_4[] = "Incompatible checksums (0x%x vs (0xf7e75c8, 0x9c0f39e, 0x730af0a) = (buffer, buffer_size, chunks, position))";
+static PyObject *__pyx_n_s_BufferedMemoryWriter;
 static PyObject *__pyx_n_s_BufferedSocketWriter;
 static PyObject *__pyx_n_s_BufferedWriter;
 static PyObject *__pyx_n_s_CompressedBufferedWriter;
 static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
 static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_2;
 static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_3;
+static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_4;
+static PyObject *__pyx_kp_u_Invalid_string_offsets;
 static PyObject *__pyx_n_s_MemoryError;
 static PyObject *__pyx_n_s_NotImplementedError;
 static PyObject *__pyx_n_s_PickleError;
 static PyObject *__pyx_n_s_TooLargeStringSize;
 static PyObject *__pyx_n_s_ValueError;
-static PyObject *__pyx_n_s__5;
+static PyObject *__pyx_n_s__4;
+static PyObject *__pyx_kp_b__4;
+static PyObject *__pyx_n_s_append;
 static PyObject *__pyx_n_s_bufsize;
-static PyObject *__pyx_kp_u_bytes_object_expected;
 static PyObject *__pyx_n_s_bytehouse_driver_bufferedwriter;
+static PyObject *__pyx_kp_u_bytes_object_expected;
 static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_n_s_compressor;
+static PyObject *__pyx_n_s_data;
 static PyObject *__pyx_n_s_dict;
 static PyObject *__pyx_n_s_encode;
 static PyObject *__pyx_n_s_encoding;
@@ -1637,22 +1775,27 @@ static PyObject *__pyx_n_s_errors;
 static PyObject *__pyx_n_s_getstate;
 static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_s_init;
+static PyObject *__pyx_kp_u_int32_or_int64_offsets_expected;
 static PyObject *__pyx_n_s_items;
+static PyObject *__pyx_n_s_join;
 static PyObject *__pyx_n_s_length;
 static PyObject *__pyx_n_s_main;
 static PyObject *__pyx_n_s_make_varint;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_new;
+static PyObject *__pyx_n_s_offsets;
 static PyObject *__pyx_n_s_pickle;
 static PyObject *__pyx_n_s_pyx_PickleError;
 static PyObject *__pyx_n_s_pyx_checksum;
 static PyObject *__pyx_n_s_pyx_result;
 static PyObject *__pyx_n_s_pyx_state;
 static PyObject *__pyx_n_s_pyx_type;
+static PyObject *__pyx_n_s_pyx_unpickle_BufferedMemoryWri;
 static PyObject *__pyx_n_s_pyx_unpickle_BufferedSocketWri;
 static PyObject *__pyx_n_s_pyx_unpickle_BufferedWriter;
 static PyObject *__pyx_n_s_pyx_unpickle_CompressedBuffere;
 static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_range;
 static PyObject *__pyx_n_s_reduce;
 static PyObject *__pyx_n_s_reduce_cython;
 static PyObject *__pyx_n_s_reduce_ex;
@@ -1668,53 +1811,69 @@ static PyObject *__pyx_n_s_varint;
 static PyObject *__pyx_n_s_write;
 static PyObject *__pyx_n_s_write_fixed_strings_as_bytes;
 static PyObject *__pyx_n_s_write_into_stream;
-static int __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter___init__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_bufsize); /* proto */
-static void __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_2__dealloc__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_4write_into_stream(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_6write(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_data); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_8flush(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_10write_strings(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_items, PyObject *__pyx_v_encoding); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_12write_fixed_strings_as_bytes(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_items, Py_ssize_t __pyx_v_length); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_14write_fixed_strings(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_items, Py_ssize_t __pyx_v_length, PyObject *__pyx_v_encoding); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_16__reduce_cython__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_18__setstate_cython__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
-static int __pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter___init__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self, PyObject *__pyx_v_sock, PyObject *__pyx_v_bufsize); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_2write_into_stream(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_4__reduce_cython__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_6__setstate_cython__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
-static int __pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter___init__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self, PyObject *__pyx_v_compressor, PyObject *__pyx_v_bufsize); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_2write_into_stream(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_4flush(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_6__reduce_cython__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_8__setstate_cython__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_2__pyx_unpickle_BufferedSocketWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_4__pyx_unpickle_CompressedBufferedWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
-static PyObject *__pyx_tp_new_17bytehouse_driver_14bufferedwriter_BufferedWriter(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static int __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter___init__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_bufsize); /* proto */
+static void __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_2__dealloc__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_4write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_6write(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_data); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_8flush(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_10write_strings(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_items, PyObject *__pyx_v_encoding); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_12write_string_buffers(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_offsets, PyObject *__pyx_v_data); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_14write_fixed_strings_as_bytes(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_items, Py_ssize_t __pyx_v_length); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_16write_fixed_strings(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_items, Py_ssize_t __pyx_v_length, PyObject *__pyx_v_encoding); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_18__reduce_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_20__setstate_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter___init__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self, PyObject *__pyx_v_sock, PyObject *__pyx_v_bufsize); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_2write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_4__reduce_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_6__setstate_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter___init__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self, PyObject *__pyx_v_compressor, PyObject *__pyx_v_bufsize); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_2write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_4flush(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_6__reduce_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_8__setstate_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter___init__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_v_self, PyObject *__pyx_v_bufsize); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_2write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_4getvalue(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_6__reduce_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_8__setstate_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_2__pyx_unpickle_BufferedSocketWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_4__pyx_unpickle_CompressedBufferedWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_6__pyx_unpickle_BufferedMemoryWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedwriter_BufferedWriter(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_int_17355272;
 static PyObject *__pyx_int_29629619;
 static PyObject *__pyx_int_39047372;
 static PyObject *__pyx_int_39656716;
 static PyObject *__pyx_int_62583983;
 static PyObject *__pyx_int_82038463;
+static PyObject *__pyx_int_120631050;
 static PyObject *__pyx_int_137744089;
 static PyObject *__pyx_int_158296731;
+static PyObject *__pyx_int_163640222;
 static PyObject *__pyx_int_211840719;
+static PyObject *__pyx_int_259945928;
 static PyObject *__pyx_tuple_;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__3;
-static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__5;
 static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__7;
 static PyObject *__pyx_tuple__8;
-static PyObject *__pyx_tuple__10;
-static PyObject *__pyx_codeobj__7;
-static PyObject *__pyx_codeobj__9;
-static PyObject *__pyx_codeobj__11;
+static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_tuple__11;
+static PyObject *__pyx_tuple__13;
+static PyObject *__pyx_tuple__15;
+static PyObject *__pyx_codeobj__10;
+static PyObject *__pyx_codeobj__12;
+static PyObject *__pyx_codeobj__14;
+static PyObject *__pyx_codeobj__16;
 /* Late includes */
 
-/* "bytehouse_driver/bufferedwriter.pyx":14
+/* "bytehouse_driver/bufferedwriter.pyx":17
  *     cdef unsigned long long position, buffer_size
  * 
  *     def __init__(self, unsigned long long bufsize):             # <<<<<<<<<<<<<<
@@ -1723,8 +1882,8 @@ static PyObject *__pyx_codeobj__11;
  */
 
 /* Python wrapper */
-static int __pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static int __pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   unsigned PY_LONG_LONG __pyx_v_bufsize;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
@@ -1751,31 +1910,31 @@ static int __pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1__init
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 14, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 17, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
     }
-    __pyx_v_bufsize = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_bufsize == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 14, __pyx_L3_error)
+    __pyx_v_bufsize = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_bufsize == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 17, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 14, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 17, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedWriter.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter___init__(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), __pyx_v_bufsize);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter___init__(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), __pyx_v_bufsize);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static int __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter___init__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_bufsize) {
+static int __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter___init__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_bufsize) {
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
@@ -1787,7 +1946,7 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter___init_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":15
+  /* "bytehouse_driver/bufferedwriter.pyx":18
  * 
  *     def __init__(self, unsigned long long bufsize):
  *         self.buffer = <char *> PyMem_Malloc(bufsize)             # <<<<<<<<<<<<<<
@@ -1796,7 +1955,7 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter___init_
  */
   __pyx_v_self->buffer = ((char *)PyMem_Malloc(__pyx_v_bufsize));
 
-  /* "bytehouse_driver/bufferedwriter.pyx":16
+  /* "bytehouse_driver/bufferedwriter.pyx":19
  *     def __init__(self, unsigned long long bufsize):
  *         self.buffer = <char *> PyMem_Malloc(bufsize)
  *         if not self.buffer:             # <<<<<<<<<<<<<<
@@ -1806,16 +1965,16 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter___init_
   __pyx_t_1 = ((!(__pyx_v_self->buffer != 0)) != 0);
   if (unlikely(__pyx_t_1)) {
 
-    /* "bytehouse_driver/bufferedwriter.pyx":17
+    /* "bytehouse_driver/bufferedwriter.pyx":20
  *         self.buffer = <char *> PyMem_Malloc(bufsize)
  *         if not self.buffer:
  *             raise MemoryError()             # <<<<<<<<<<<<<<
  * 
  *         self.position = 0
  */
-    PyErr_NoMemory(); __PYX_ERR(0, 17, __pyx_L1_error)
+    PyErr_NoMemory(); __PYX_ERR(0, 20, __pyx_L1_error)
 
-    /* "bytehouse_driver/bufferedwriter.pyx":16
+    /* "bytehouse_driver/bufferedwriter.pyx":19
  *     def __init__(self, unsigned long long bufsize):
  *         self.buffer = <char *> PyMem_Malloc(bufsize)
  *         if not self.buffer:             # <<<<<<<<<<<<<<
@@ -1824,7 +1983,7 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter___init_
  */
   }
 
-  /* "bytehouse_driver/bufferedwriter.pyx":19
+  /* "bytehouse_driver/bufferedwriter.pyx":22
  *             raise MemoryError()
  * 
  *         self.position = 0             # <<<<<<<<<<<<<<
@@ -1833,7 +1992,7 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter___init_
  */
   __pyx_v_self->position = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":20
+  /* "bytehouse_driver/bufferedwriter.pyx":23
  * 
  *         self.position = 0
  *         self.buffer_size = bufsize             # <<<<<<<<<<<<<<
@@ -1842,25 +2001,25 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter___init_
  */
   __pyx_v_self->buffer_size = __pyx_v_bufsize;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":22
+  /* "bytehouse_driver/bufferedwriter.pyx":25
  *         self.buffer_size = bufsize
  * 
  *         super(BufferedWriter, self).__init__()             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 25, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(((PyObject *)__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter));
-  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter));
-  PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter));
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter));
+  PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter));
   __Pyx_INCREF(((PyObject *)__pyx_v_self));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
   PyTuple_SET_ITEM(__pyx_t_3, 1, ((PyObject *)__pyx_v_self));
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 25, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_init); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_init); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 25, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_t_4 = NULL;
@@ -1875,12 +2034,12 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter___init_
   }
   __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 22, __pyx_L1_error)
+  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 25, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":14
+  /* "bytehouse_driver/bufferedwriter.pyx":17
  *     cdef unsigned long long position, buffer_size
  * 
  *     def __init__(self, unsigned long long bufsize):             # <<<<<<<<<<<<<<
@@ -1902,7 +2061,7 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter___init_
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedwriter.pyx":24
+/* "bytehouse_driver/bufferedwriter.pyx":27
  *         super(BufferedWriter, self).__init__()
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -1911,21 +2070,21 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter___init_
  */
 
 /* Python wrapper */
-static void __pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_3__dealloc__(PyObject *__pyx_v_self) {
+static void __pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_3__dealloc__(PyObject *__pyx_v_self) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
-  __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_2__dealloc__(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self));
+  __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_2__dealloc__(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
 }
 
-static void __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_2__dealloc__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self) {
+static void __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_2__dealloc__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":25
+  /* "bytehouse_driver/bufferedwriter.pyx":28
  * 
  *     def __dealloc__(self):
  *         PyMem_Free(self.buffer)             # <<<<<<<<<<<<<<
@@ -1934,7 +2093,7 @@ static void __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_2__dea
  */
   PyMem_Free(__pyx_v_self->buffer);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":24
+  /* "bytehouse_driver/bufferedwriter.pyx":27
  *         super(BufferedWriter, self).__init__()
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -1946,7 +2105,7 @@ static void __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_2__dea
   __Pyx_RefNannyFinishContext();
 }
 
-/* "bytehouse_driver/bufferedwriter.pyx":27
+/* "bytehouse_driver/bufferedwriter.pyx":30
  *         PyMem_Free(self.buffer)
  * 
  *     cpdef write_into_stream(self):             # <<<<<<<<<<<<<<
@@ -1954,8 +2113,8 @@ static void __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_2__dea
  * 
  */
 
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_5write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_14BufferedWriter_write_into_stream(CYTHON_UNUSED struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_5write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter_write_into_stream(CYTHON_UNUSED struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, int __pyx_skip_dispatch) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -1975,9 +2134,9 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_14BufferedWriter_wr
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write_into_stream); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 27, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write_into_stream); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 30, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_5write_into_stream)) {
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_5write_into_stream)) {
         __Pyx_XDECREF(__pyx_r);
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
@@ -1992,7 +2151,7 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_14BufferedWriter_wr
         }
         __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 27, __pyx_L1_error)
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 30, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
         __pyx_r = __pyx_t_2;
@@ -2013,17 +2172,17 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_14BufferedWriter_wr
     #endif
   }
 
-  /* "bytehouse_driver/bufferedwriter.pyx":28
+  /* "bytehouse_driver/bufferedwriter.pyx":31
  * 
  *     cpdef write_into_stream(self):
  *         raise NotImplementedError             # <<<<<<<<<<<<<<
  * 
- *     cpdef write(self, data):
+ *     cdef int _write(self, const char* data,
  */
   __Pyx_Raise(__pyx_builtin_NotImplementedError, 0, 0, 0);
-  __PYX_ERR(0, 28, __pyx_L1_error)
+  __PYX_ERR(0, 31, __pyx_L1_error)
 
-  /* "bytehouse_driver/bufferedwriter.pyx":27
+  /* "bytehouse_driver/bufferedwriter.pyx":30
  *         PyMem_Free(self.buffer)
  * 
  *     cpdef write_into_stream(self):             # <<<<<<<<<<<<<<
@@ -2046,19 +2205,19 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_14BufferedWriter_wr
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_5write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_5write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_5write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_5write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("write_into_stream (wrapper)", 0);
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_4write_into_stream(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self));
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_4write_into_stream(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_4write_into_stream(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_4write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -2067,7 +2226,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_4
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("write_into_stream", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_17bytehouse_driver_14bufferedwriter_14BufferedWriter_write_into_stream(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 27, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter_write_into_stream(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 30, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2084,176 +2243,106 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_4
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedwriter.pyx":30
+/* "bytehouse_driver/bufferedwriter.pyx":33
  *         raise NotImplementedError
  * 
- *     cpdef write(self, data):             # <<<<<<<<<<<<<<
+ *     cdef int _write(self, const char* data,             # <<<<<<<<<<<<<<
+ *                     unsigned long long data_len) except -1:
  *         cdef unsigned long long size, written = 0
- *         cdef unsigned long long data_len = PyBytes_GET_SIZE(data)
  */
 
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_7write(PyObject *__pyx_v_self, PyObject *__pyx_v_data); /*proto*/
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_14BufferedWriter_write(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_data, int __pyx_skip_dispatch) {
+static int __pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter__write(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, char const *__pyx_v_data, unsigned PY_LONG_LONG __pyx_v_data_len) {
   unsigned PY_LONG_LONG __pyx_v_size;
   unsigned PY_LONG_LONG __pyx_v_written;
-  unsigned PY_LONG_LONG __pyx_v_data_len;
-  char *__pyx_v_c_data;
-  PyObject *__pyx_r = NULL;
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  unsigned PY_LONG_LONG __pyx_t_6;
-  unsigned PY_LONG_LONG __pyx_t_7;
-  unsigned PY_LONG_LONG __pyx_t_8;
+  unsigned PY_LONG_LONG __pyx_t_3;
+  unsigned PY_LONG_LONG __pyx_t_4;
+  unsigned PY_LONG_LONG __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("write", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
-    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
-    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
-    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
-      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
-      #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 30, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_7write)) {
-        __Pyx_XDECREF(__pyx_r);
-        __Pyx_INCREF(__pyx_t_1);
-        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-          if (likely(__pyx_t_4)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-            __Pyx_INCREF(__pyx_t_4);
-            __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_3, function);
-          }
-        }
-        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_data) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_data);
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 30, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __pyx_r = __pyx_t_2;
-        __pyx_t_2 = 0;
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        goto __pyx_L0;
-      }
-      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
-      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
-      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
-      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
-        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
-      }
-      #endif
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
-    }
-    #endif
-  }
+  __Pyx_RefNannySetupContext("_write", 0);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":31
- * 
- *     cpdef write(self, data):
+  /* "bytehouse_driver/bufferedwriter.pyx":35
+ *     cdef int _write(self, const char* data,
+ *                     unsigned long long data_len) except -1:
  *         cdef unsigned long long size, written = 0             # <<<<<<<<<<<<<<
- *         cdef unsigned long long data_len = PyBytes_GET_SIZE(data)
- *         cdef char* c_data = PyBytes_AS_STRING(data)
- */
-  __pyx_v_written = 0;
-
-  /* "bytehouse_driver/bufferedwriter.pyx":32
- *     cpdef write(self, data):
- *         cdef unsigned long long size, written = 0
- *         cdef unsigned long long data_len = PyBytes_GET_SIZE(data)             # <<<<<<<<<<<<<<
- *         cdef char* c_data = PyBytes_AS_STRING(data)
- * 
- */
-  __pyx_v_data_len = PyBytes_GET_SIZE(__pyx_v_data);
-
-  /* "bytehouse_driver/bufferedwriter.pyx":33
- *         cdef unsigned long long size, written = 0
- *         cdef unsigned long long data_len = PyBytes_GET_SIZE(data)
- *         cdef char* c_data = PyBytes_AS_STRING(data)             # <<<<<<<<<<<<<<
  * 
  *         while written < data_len:
  */
-  __pyx_v_c_data = PyBytes_AS_STRING(__pyx_v_data);
+  __pyx_v_written = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":35
- *         cdef char* c_data = PyBytes_AS_STRING(data)
+  /* "bytehouse_driver/bufferedwriter.pyx":37
+ *         cdef unsigned long long size, written = 0
  * 
  *         while written < data_len:             # <<<<<<<<<<<<<<
- *             size = min(data_len - written, self.buffer_size - self.position)
- *             memcpy(&self.buffer[self.position], &c_data[written], size)
+ *             if self.position == self.buffer_size:
+ *                 self.write_into_stream()
  */
   while (1) {
-    __pyx_t_5 = ((__pyx_v_written < __pyx_v_data_len) != 0);
-    if (!__pyx_t_5) break;
+    __pyx_t_1 = ((__pyx_v_written < __pyx_v_data_len) != 0);
+    if (!__pyx_t_1) break;
 
-    /* "bytehouse_driver/bufferedwriter.pyx":36
+    /* "bytehouse_driver/bufferedwriter.pyx":38
  * 
  *         while written < data_len:
- *             size = min(data_len - written, self.buffer_size - self.position)             # <<<<<<<<<<<<<<
- *             memcpy(&self.buffer[self.position], &c_data[written], size)
+ *             if self.position == self.buffer_size:             # <<<<<<<<<<<<<<
+ *                 self.write_into_stream()
  * 
  */
-    __pyx_t_6 = (__pyx_v_self->buffer_size - __pyx_v_self->position);
-    __pyx_t_7 = (__pyx_v_data_len - __pyx_v_written);
-    if (((__pyx_t_6 < __pyx_t_7) != 0)) {
-      __pyx_t_8 = __pyx_t_6;
-    } else {
-      __pyx_t_8 = __pyx_t_7;
-    }
-    __pyx_v_size = __pyx_t_8;
+    __pyx_t_1 = ((__pyx_v_self->position == __pyx_v_self->buffer_size) != 0);
+    if (__pyx_t_1) {
 
-    /* "bytehouse_driver/bufferedwriter.pyx":37
+      /* "bytehouse_driver/bufferedwriter.pyx":39
  *         while written < data_len:
- *             size = min(data_len - written, self.buffer_size - self.position)
- *             memcpy(&self.buffer[self.position], &c_data[written], size)             # <<<<<<<<<<<<<<
- * 
  *             if self.position == self.buffer_size:
+ *                 self.write_into_stream()             # <<<<<<<<<<<<<<
+ * 
+ *             size = min(data_len - written, self.buffer_size - self.position)
  */
-    (void)(memcpy((&(__pyx_v_self->buffer[__pyx_v_self->position])), (&(__pyx_v_c_data[__pyx_v_written])), __pyx_v_size));
+      __pyx_t_2 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->write_into_stream(__pyx_v_self, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "bytehouse_driver/bufferedwriter.pyx":39
- *             memcpy(&self.buffer[self.position], &c_data[written], size)
+      /* "bytehouse_driver/bufferedwriter.pyx":38
  * 
+ *         while written < data_len:
  *             if self.position == self.buffer_size:             # <<<<<<<<<<<<<<
  *                 self.write_into_stream()
  * 
  */
-    __pyx_t_5 = ((__pyx_v_self->position == __pyx_v_self->buffer_size) != 0);
-    if (__pyx_t_5) {
+    }
 
-      /* "bytehouse_driver/bufferedwriter.pyx":40
+    /* "bytehouse_driver/bufferedwriter.pyx":41
+ *                 self.write_into_stream()
  * 
- *             if self.position == self.buffer_size:
- *                 self.write_into_stream()             # <<<<<<<<<<<<<<
+ *             size = min(data_len - written, self.buffer_size - self.position)             # <<<<<<<<<<<<<<
+ *             memcpy(&self.buffer[self.position], &data[written], size)
  * 
- *             self.position += size
  */
-      __pyx_t_1 = ((struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->write_into_stream(__pyx_v_self, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 40, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_3 = (__pyx_v_self->buffer_size - __pyx_v_self->position);
+    __pyx_t_4 = (__pyx_v_data_len - __pyx_v_written);
+    if (((__pyx_t_3 < __pyx_t_4) != 0)) {
+      __pyx_t_5 = __pyx_t_3;
+    } else {
+      __pyx_t_5 = __pyx_t_4;
+    }
+    __pyx_v_size = __pyx_t_5;
 
-      /* "bytehouse_driver/bufferedwriter.pyx":39
- *             memcpy(&self.buffer[self.position], &c_data[written], size)
+    /* "bytehouse_driver/bufferedwriter.pyx":42
  * 
- *             if self.position == self.buffer_size:             # <<<<<<<<<<<<<<
- *                 self.write_into_stream()
+ *             size = min(data_len - written, self.buffer_size - self.position)
+ *             memcpy(&self.buffer[self.position], &data[written], size)             # <<<<<<<<<<<<<<
  * 
+ *             self.position += size
  */
-    }
+    (void)(memcpy((&(__pyx_v_self->buffer[__pyx_v_self->position])), (&(__pyx_v_data[__pyx_v_written])), __pyx_v_size));
 
-    /* "bytehouse_driver/bufferedwriter.pyx":42
- *                 self.write_into_stream()
+    /* "bytehouse_driver/bufferedwriter.pyx":44
+ *             memcpy(&self.buffer[self.position], &data[written], size)
  * 
  *             self.position += size             # <<<<<<<<<<<<<<
  *             written += size
@@ -2261,101 +2350,459 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_14BufferedWriter_wr
  */
     __pyx_v_self->position = (__pyx_v_self->position + __pyx_v_size);
 
-    /* "bytehouse_driver/bufferedwriter.pyx":43
+    /* "bytehouse_driver/bufferedwriter.pyx":45
  * 
  *             self.position += size
  *             written += size             # <<<<<<<<<<<<<<
  * 
- *     def flush(self):
+ *         return 0
  */
     __pyx_v_written = (__pyx_v_written + __pyx_v_size);
   }
 
-  /* "bytehouse_driver/bufferedwriter.pyx":30
+  /* "bytehouse_driver/bufferedwriter.pyx":47
+ *             written += size
+ * 
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _write_varint(self, unsigned long long number) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "bytehouse_driver/bufferedwriter.pyx":33
  *         raise NotImplementedError
  * 
- *     cpdef write(self, data):             # <<<<<<<<<<<<<<
+ *     cdef int _write(self, const char* data,             # <<<<<<<<<<<<<<
+ *                     unsigned long long data_len) except -1:
  *         cdef unsigned long long size, written = 0
- *         cdef unsigned long long data_len = PyBytes_GET_SIZE(data)
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedWriter.write", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedWriter._write", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_7write(PyObject *__pyx_v_self, PyObject *__pyx_v_data); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_7write(PyObject *__pyx_v_self, PyObject *__pyx_v_data) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("write (wrapper)", 0);
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_6write(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), ((PyObject *)__pyx_v_data));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+/* "bytehouse_driver/bufferedwriter.pyx":49
+ *         return 0
+ * 
+ *     cdef int _write_varint(self, unsigned long long number) except -1:             # <<<<<<<<<<<<<<
+ *         cdef unsigned char num_buf[10]
+ *         cdef unsigned char i = 0
+ */
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_6write(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_data) {
-  PyObject *__pyx_r = NULL;
+static int __pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter__write_varint(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, unsigned PY_LONG_LONG __pyx_v_number) {
+  unsigned char __pyx_v_num_buf[10];
+  unsigned char __pyx_v_i;
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
+  unsigned char __pyx_t_2;
+  int __pyx_t_3;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("write", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_17bytehouse_driver_14bufferedwriter_14BufferedWriter_write(__pyx_v_self, __pyx_v_data, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 30, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __Pyx_RefNannySetupContext("_write_varint", 0);
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedWriter.write", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  /* "bytehouse_driver/bufferedwriter.pyx":51
+ *     cdef int _write_varint(self, unsigned long long number) except -1:
+ *         cdef unsigned char num_buf[10]
+ *         cdef unsigned char i = 0             # <<<<<<<<<<<<<<
+ * 
+ *         while True:
+ */
+  __pyx_v_i = 0;
 
-/* "bytehouse_driver/bufferedwriter.pyx":45
- *             written += size
+  /* "bytehouse_driver/bufferedwriter.pyx":53
+ *         cdef unsigned char i = 0
  * 
- *     def flush(self):             # <<<<<<<<<<<<<<
- *         self.write_into_stream()
+ *         while True:             # <<<<<<<<<<<<<<
+ *             num_buf[i] = number & 0x7f
+ *             number >>= 7
+ */
+  while (1) {
+
+    /* "bytehouse_driver/bufferedwriter.pyx":54
+ * 
+ *         while True:
+ *             num_buf[i] = number & 0x7f             # <<<<<<<<<<<<<<
+ *             number >>= 7
+ *             if not number:
+ */
+    (__pyx_v_num_buf[__pyx_v_i]) = (__pyx_v_number & 0x7f);
+
+    /* "bytehouse_driver/bufferedwriter.pyx":55
+ *         while True:
+ *             num_buf[i] = number & 0x7f
+ *             number >>= 7             # <<<<<<<<<<<<<<
+ *             if not number:
+ *                 break
+ */
+    __pyx_v_number = (__pyx_v_number >> 7);
+
+    /* "bytehouse_driver/bufferedwriter.pyx":56
+ *             num_buf[i] = number & 0x7f
+ *             number >>= 7
+ *             if not number:             # <<<<<<<<<<<<<<
+ *                 break
+ *             num_buf[i] |= 0x80
+ */
+    __pyx_t_1 = ((!(__pyx_v_number != 0)) != 0);
+    if (__pyx_t_1) {
+
+      /* "bytehouse_driver/bufferedwriter.pyx":57
+ *             number >>= 7
+ *             if not number:
+ *                 break             # <<<<<<<<<<<<<<
+ *             num_buf[i] |= 0x80
+ *             i += 1
+ */
+      goto __pyx_L4_break;
+
+      /* "bytehouse_driver/bufferedwriter.pyx":56
+ *             num_buf[i] = number & 0x7f
+ *             number >>= 7
+ *             if not number:             # <<<<<<<<<<<<<<
+ *                 break
+ *             num_buf[i] |= 0x80
+ */
+    }
+
+    /* "bytehouse_driver/bufferedwriter.pyx":58
+ *             if not number:
+ *                 break
+ *             num_buf[i] |= 0x80             # <<<<<<<<<<<<<<
+ *             i += 1
+ * 
+ */
+    __pyx_t_2 = __pyx_v_i;
+    (__pyx_v_num_buf[__pyx_t_2]) = ((__pyx_v_num_buf[__pyx_t_2]) | 0x80);
+
+    /* "bytehouse_driver/bufferedwriter.pyx":59
+ *                 break
+ *             num_buf[i] |= 0x80
+ *             i += 1             # <<<<<<<<<<<<<<
+ * 
+ *         return self._write(<const char*> num_buf, i + 1)
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+  }
+  __pyx_L4_break:;
+
+  /* "bytehouse_driver/bufferedwriter.pyx":61
+ *             i += 1
+ * 
+ *         return self._write(<const char*> num_buf, i + 1)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef write(self, data):
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->_write(__pyx_v_self, ((char const *)__pyx_v_num_buf), (__pyx_v_i + 1)); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 61, __pyx_L1_error)
+  __pyx_r = __pyx_t_3;
+  goto __pyx_L0;
+
+  /* "bytehouse_driver/bufferedwriter.pyx":49
+ *         return 0
+ * 
+ *     cdef int _write_varint(self, unsigned long long number) except -1:             # <<<<<<<<<<<<<<
+ *         cdef unsigned char num_buf[10]
+ *         cdef unsigned char i = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedWriter._write_varint", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bytehouse_driver/bufferedwriter.pyx":63
+ *         return self._write(<const char*> num_buf, i + 1)
+ * 
+ *     cpdef write(self, data):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes ``bytes`` or any C-contiguous object supporting buffer
+ */
+
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_7write(PyObject *__pyx_v_self, PyObject *__pyx_v_data); /*proto*/
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter_write(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_data, int __pyx_skip_dispatch) {
+  Py_buffer __pyx_v_view;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  char const *__pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_7write)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_data) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_data);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 63, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "bytehouse_driver/bufferedwriter.pyx":70
+ *         cdef Py_buffer view
+ * 
+ *         if PyBytes_Check(data):             # <<<<<<<<<<<<<<
+ *             self._write(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+ *             return
+ */
+  __pyx_t_5 = (PyBytes_Check(__pyx_v_data) != 0);
+  if (__pyx_t_5) {
+
+    /* "bytehouse_driver/bufferedwriter.pyx":71
+ * 
+ *         if PyBytes_Check(data):
+ *             self._write(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))             # <<<<<<<<<<<<<<
+ *             return
+ * 
+ */
+    __pyx_t_6 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->_write(__pyx_v_self, PyBytes_AS_STRING(__pyx_v_data), PyBytes_GET_SIZE(__pyx_v_data)); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 71, __pyx_L1_error)
+
+    /* "bytehouse_driver/bufferedwriter.pyx":72
+ *         if PyBytes_Check(data):
+ *             self._write(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         PyObject_GetBuffer(data, &view, PyBUF_C_CONTIGUOUS)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "bytehouse_driver/bufferedwriter.pyx":70
+ *         cdef Py_buffer view
+ * 
+ *         if PyBytes_Check(data):             # <<<<<<<<<<<<<<
+ *             self._write(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+ *             return
+ */
+  }
+
+  /* "bytehouse_driver/bufferedwriter.pyx":74
+ *             return
+ * 
+ *         PyObject_GetBuffer(data, &view, PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *         try:
+ *             self._write(<const char*> view.buf, view.len)
+ */
+  __pyx_t_6 = PyObject_GetBuffer(__pyx_v_data, (&__pyx_v_view), PyBUF_C_CONTIGUOUS); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 74, __pyx_L1_error)
+
+  /* "bytehouse_driver/bufferedwriter.pyx":75
+ * 
+ *         PyObject_GetBuffer(data, &view, PyBUF_C_CONTIGUOUS)
+ *         try:             # <<<<<<<<<<<<<<
+ *             self._write(<const char*> view.buf, view.len)
+ *         finally:
+ */
+  /*try:*/ {
+
+    /* "bytehouse_driver/bufferedwriter.pyx":76
+ *         PyObject_GetBuffer(data, &view, PyBUF_C_CONTIGUOUS)
+ *         try:
+ *             self._write(<const char*> view.buf, view.len)             # <<<<<<<<<<<<<<
+ *         finally:
+ *             PyBuffer_Release(&view)
+ */
+    __pyx_t_6 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->_write(__pyx_v_self, ((char const *)__pyx_v_view.buf), __pyx_v_view.len); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 76, __pyx_L5_error)
+  }
+
+  /* "bytehouse_driver/bufferedwriter.pyx":78
+ *             self._write(<const char*> view.buf, view.len)
+ *         finally:
+ *             PyBuffer_Release(&view)             # <<<<<<<<<<<<<<
+ * 
+ *     def flush(self):
+ */
+  /*finally:*/ {
+    /*normal exit:*/{
+      PyBuffer_Release((&__pyx_v_view));
+      goto __pyx_L6;
+    }
+    __pyx_L5_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_12, &__pyx_t_13, &__pyx_t_14);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11) < 0)) __Pyx_ErrFetch(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_13);
+      __Pyx_XGOTREF(__pyx_t_14);
+      __pyx_t_6 = __pyx_lineno; __pyx_t_7 = __pyx_clineno; __pyx_t_8 = __pyx_filename;
+      {
+        PyBuffer_Release((&__pyx_v_view));
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_XGIVEREF(__pyx_t_14);
+        __Pyx_ExceptionReset(__pyx_t_12, __pyx_t_13, __pyx_t_14);
+      }
+      __Pyx_XGIVEREF(__pyx_t_9);
+      __Pyx_XGIVEREF(__pyx_t_10);
+      __Pyx_XGIVEREF(__pyx_t_11);
+      __Pyx_ErrRestore(__pyx_t_9, __pyx_t_10, __pyx_t_11);
+      __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0;
+      __pyx_lineno = __pyx_t_6; __pyx_clineno = __pyx_t_7; __pyx_filename = __pyx_t_8;
+      goto __pyx_L1_error;
+    }
+    __pyx_L6:;
+  }
+
+  /* "bytehouse_driver/bufferedwriter.pyx":63
+ *         return self._write(<const char*> num_buf, i + 1)
+ * 
+ *     cpdef write(self, data):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes ``bytes`` or any C-contiguous object supporting buffer
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedWriter.write", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_7write(PyObject *__pyx_v_self, PyObject *__pyx_v_data); /*proto*/
+static char __pyx_doc_16bytehouse_driver_14bufferedwriter_14BufferedWriter_6write[] = "\n        Writes ``bytes`` or any C-contiguous object supporting buffer\n        protocol, e.g. NumPy array, without intermediate copies.\n        ";
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_7write(PyObject *__pyx_v_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("write (wrapper)", 0);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_6write(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), ((PyObject *)__pyx_v_data));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_6write(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter_write(__pyx_v_self, __pyx_v_data, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedWriter.write", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bytehouse_driver/bufferedwriter.pyx":80
+ *             PyBuffer_Release(&view)
+ * 
+ *     def flush(self):             # <<<<<<<<<<<<<<
+ *         self.write_into_stream()
  * 
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_9flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_9flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_9flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_9flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("flush (wrapper)", 0);
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_8flush(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self));
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_8flush(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_8flush(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_8flush(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -2364,19 +2811,19 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_8
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("flush", 0);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":46
+  /* "bytehouse_driver/bufferedwriter.pyx":81
  * 
  *     def flush(self):
  *         self.write_into_stream()             # <<<<<<<<<<<<<<
  * 
  *     def write_strings(self, items, encoding=None):
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->write_into_stream(__pyx_v_self, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->write_into_stream(__pyx_v_self, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 81, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":45
- *             written += size
+  /* "bytehouse_driver/bufferedwriter.pyx":80
+ *             PyBuffer_Release(&view)
  * 
  *     def flush(self):             # <<<<<<<<<<<<<<
  *         self.write_into_stream()
@@ -2396,7 +2843,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_8
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedwriter.pyx":48
+/* "bytehouse_driver/bufferedwriter.pyx":83
  *         self.write_into_stream()
  * 
  *     def write_strings(self, items, encoding=None):             # <<<<<<<<<<<<<<
@@ -2405,8 +2852,8 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_8
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_11write_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_11write_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_11write_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_11write_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_items = 0;
   PyObject *__pyx_v_encoding = 0;
   int __pyx_lineno = 0;
@@ -2443,7 +2890,7 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "write_strings") < 0)) __PYX_ERR(0, 48, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "write_strings") < 0)) __PYX_ERR(0, 83, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -2459,20 +2906,20 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("write_strings", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 48, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("write_strings", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 83, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedWriter.write_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_10write_strings(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), __pyx_v_items, __pyx_v_encoding);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_10write_strings(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), __pyx_v_items, __pyx_v_encoding);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_10write_strings(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_items, PyObject *__pyx_v_encoding) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_10write_strings(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_items, PyObject *__pyx_v_encoding) {
   int __pyx_v_do_encode;
   PyObject *__pyx_v_value = NULL;
   PyObject *__pyx_r = NULL;
@@ -2490,7 +2937,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("write_strings", 0);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":49
+  /* "bytehouse_driver/bufferedwriter.pyx":84
  * 
  *     def write_strings(self, items, encoding=None):
  *         cdef int do_encode = encoding is not None             # <<<<<<<<<<<<<<
@@ -2500,7 +2947,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
   __pyx_t_1 = (__pyx_v_encoding != Py_None);
   __pyx_v_do_encode = __pyx_t_1;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":51
+  /* "bytehouse_driver/bufferedwriter.pyx":86
  *         cdef int do_encode = encoding is not None
  * 
  *         for value in items:             # <<<<<<<<<<<<<<
@@ -2511,26 +2958,26 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     __pyx_t_2 = __pyx_v_items; __Pyx_INCREF(__pyx_t_2); __pyx_t_3 = 0;
     __pyx_t_4 = NULL;
   } else {
-    __pyx_t_3 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_items); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __pyx_t_3 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_items); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 86, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __pyx_t_4 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 86, __pyx_L1_error)
   }
   for (;;) {
     if (likely(!__pyx_t_4)) {
       if (likely(PyList_CheckExact(__pyx_t_2))) {
         if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_2)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 51, __pyx_L1_error)
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 86, __pyx_L1_error)
         #else
-        __pyx_t_5 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 51, __pyx_L1_error)
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 86, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         #endif
       } else {
         if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 51, __pyx_L1_error)
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 86, __pyx_L1_error)
         #else
-        __pyx_t_5 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 51, __pyx_L1_error)
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 86, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         #endif
       }
@@ -2540,7 +2987,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 51, __pyx_L1_error)
+          else __PYX_ERR(0, 86, __pyx_L1_error)
         }
         break;
       }
@@ -2549,7 +2996,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     __Pyx_XDECREF_SET(__pyx_v_value, __pyx_t_5);
     __pyx_t_5 = 0;
 
-    /* "bytehouse_driver/bufferedwriter.pyx":52
+    /* "bytehouse_driver/bufferedwriter.pyx":87
  * 
  *         for value in items:
  *             if not PyBytes_Check(value):             # <<<<<<<<<<<<<<
@@ -2559,7 +3006,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     __pyx_t_1 = ((!(PyBytes_Check(__pyx_v_value) != 0)) != 0);
     if (__pyx_t_1) {
 
-      /* "bytehouse_driver/bufferedwriter.pyx":53
+      /* "bytehouse_driver/bufferedwriter.pyx":88
  *         for value in items:
  *             if not PyBytes_Check(value):
  *                 if do_encode:             # <<<<<<<<<<<<<<
@@ -2569,14 +3016,14 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
       __pyx_t_1 = (__pyx_v_do_encode != 0);
       if (likely(__pyx_t_1)) {
 
-        /* "bytehouse_driver/bufferedwriter.pyx":54
+        /* "bytehouse_driver/bufferedwriter.pyx":89
  *             if not PyBytes_Check(value):
  *                 if do_encode:
  *                     value = value.encode(encoding)             # <<<<<<<<<<<<<<
  *                 else:
  *                     raise ValueError('bytes object expected')
  */
-        __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_encode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 54, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_encode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 89, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         __pyx_t_7 = NULL;
         if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
@@ -2590,13 +3037,13 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
         }
         __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_7, __pyx_v_encoding) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_encoding);
         __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 54, __pyx_L1_error)
+        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 89, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
         __Pyx_DECREF_SET(__pyx_v_value, __pyx_t_5);
         __pyx_t_5 = 0;
 
-        /* "bytehouse_driver/bufferedwriter.pyx":53
+        /* "bytehouse_driver/bufferedwriter.pyx":88
  *         for value in items:
  *             if not PyBytes_Check(value):
  *                 if do_encode:             # <<<<<<<<<<<<<<
@@ -2606,7 +3053,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
         goto __pyx_L6;
       }
 
-      /* "bytehouse_driver/bufferedwriter.pyx":56
+      /* "bytehouse_driver/bufferedwriter.pyx":91
  *                     value = value.encode(encoding)
  *                 else:
  *                     raise ValueError('bytes object expected')             # <<<<<<<<<<<<<<
@@ -2614,15 +3061,15 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  *             self.write(make_varint(PyBytes_GET_SIZE(value)))
  */
       /*else*/ {
-        __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 56, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 91, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_Raise(__pyx_t_5, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __PYX_ERR(0, 56, __pyx_L1_error)
+        __PYX_ERR(0, 91, __pyx_L1_error)
       }
       __pyx_L6:;
 
-      /* "bytehouse_driver/bufferedwriter.pyx":52
+      /* "bytehouse_driver/bufferedwriter.pyx":87
  * 
  *         for value in items:
  *             if not PyBytes_Check(value):             # <<<<<<<<<<<<<<
@@ -2631,16 +3078,16 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
     }
 
-    /* "bytehouse_driver/bufferedwriter.pyx":58
+    /* "bytehouse_driver/bufferedwriter.pyx":93
  *                     raise ValueError('bytes object expected')
  * 
  *             self.write(make_varint(PyBytes_GET_SIZE(value)))             # <<<<<<<<<<<<<<
  *             self.write(value)
  * 
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_make_varint); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 58, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_make_varint); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 93, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = PyInt_FromSsize_t(PyBytes_GET_SIZE(__pyx_v_value)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 58, __pyx_L1_error)
+    __pyx_t_7 = PyInt_FromSsize_t(PyBytes_GET_SIZE(__pyx_v_value)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 93, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __pyx_t_8 = NULL;
     if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
@@ -2655,26 +3102,26 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     __pyx_t_5 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_8, __pyx_t_7) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_7);
     __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 58, __pyx_L1_error)
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 93, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = ((struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_t_5, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 58, __pyx_L1_error)
+    __pyx_t_6 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_t_5, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 93, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-    /* "bytehouse_driver/bufferedwriter.pyx":59
+    /* "bytehouse_driver/bufferedwriter.pyx":94
  * 
  *             self.write(make_varint(PyBytes_GET_SIZE(value)))
  *             self.write(value)             # <<<<<<<<<<<<<<
  * 
- *     def write_fixed_strings_as_bytes(self, items, Py_ssize_t length):
+ *     def write_string_buffers(self, offsets, data):
  */
-    __pyx_t_6 = ((struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_v_value, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 59, __pyx_L1_error)
+    __pyx_t_6 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_v_value, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 94, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-    /* "bytehouse_driver/bufferedwriter.pyx":51
+    /* "bytehouse_driver/bufferedwriter.pyx":86
  *         cdef int do_encode = encoding is not None
  * 
  *         for value in items:             # <<<<<<<<<<<<<<
@@ -2684,7 +3131,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":48
+  /* "bytehouse_driver/bufferedwriter.pyx":83
  *         self.write_into_stream()
  * 
  *     def write_strings(self, items, encoding=None):             # <<<<<<<<<<<<<<
@@ -2710,27 +3157,28 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedwriter.pyx":61
+/* "bytehouse_driver/bufferedwriter.pyx":96
  *             self.write(value)
  * 
- *     def write_fixed_strings_as_bytes(self, items, Py_ssize_t length):             # <<<<<<<<<<<<<<
- *         cdef Py_ssize_t buf_pos = 0
- *         cdef Py_ssize_t items_buf_size = length * len(items)
+ *     def write_string_buffers(self, offsets, data):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes strings stored as offsets and data buffers, Arrow layout.
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_13write_fixed_strings_as_bytes(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_13write_fixed_strings_as_bytes(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_items = 0;
-  Py_ssize_t __pyx_v_length;
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_13write_string_buffers(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_16bytehouse_driver_14bufferedwriter_14BufferedWriter_12write_string_buffers[] = "\n        Writes strings stored as offsets and data buffers, Arrow layout.\n        ``offsets`` is C-contiguous buffer of n + 1 int32 or int64 values,\n        i-th string spans ``data[offsets[i]:offsets[i + 1]]``.\n        ";
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_13write_string_buffers(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_offsets = 0;
+  PyObject *__pyx_v_data = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("write_fixed_strings_as_bytes (wrapper)", 0);
+  __Pyx_RefNannySetupContext("write_string_buffers (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_items,&__pyx_n_s_length,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_offsets,&__pyx_n_s_data,0};
     PyObject* values[2] = {0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
@@ -2746,17 +3194,17 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_items)) != 0)) kw_args--;
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offsets)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_length)) != 0)) kw_args--;
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_data)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("write_fixed_strings_as_bytes", 1, 2, 2, 1); __PYX_ERR(0, 61, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("write_string_buffers", 1, 2, 2, 1); __PYX_ERR(0, 96, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "write_fixed_strings_as_bytes") < 0)) __PYX_ERR(0, 61, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "write_string_buffers") < 0)) __PYX_ERR(0, 96, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -2764,67 +3212,560 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
-    __pyx_v_items = values[0];
-    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 61, __pyx_L3_error)
+    __pyx_v_offsets = values[0];
+    __pyx_v_data = values[1];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("write_fixed_strings_as_bytes", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 61, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("write_string_buffers", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 96, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedWriter.write_fixed_strings_as_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedWriter.write_string_buffers", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_12write_fixed_strings_as_bytes(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), __pyx_v_items, __pyx_v_length);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_12write_string_buffers(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), __pyx_v_offsets, __pyx_v_data);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_12write_fixed_strings_as_bytes(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_items, Py_ssize_t __pyx_v_length) {
-  Py_ssize_t __pyx_v_buf_pos;
-  Py_ssize_t __pyx_v_items_buf_size;
-  char *__pyx_v_c_value;
-  char *__pyx_v_items_buf;
-  PyObject *__pyx_v_value = NULL;
-  Py_ssize_t __pyx_v_value_len;
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_12write_string_buffers(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_offsets, PyObject *__pyx_v_data) {
+  Py_buffer __pyx_v_offsets_view;
+  Py_buffer __pyx_v_data_view;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_n_items;
+  int64_t __pyx_v_start;
+  int64_t __pyx_v_end;
+  char const *__pyx_v_c_data;
+  int32_t const *__pyx_v_offsets32;
+  int64_t const *__pyx_v_offsets64;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  Py_ssize_t __pyx_t_1;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *(*__pyx_t_4)(PyObject *);
-  PyObject *__pyx_t_5 = NULL;
-  Py_ssize_t __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  char *__pyx_t_9;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  int32_t __pyx_t_7;
+  int32_t __pyx_t_8;
+  int64_t __pyx_t_9;
+  int64_t __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  char const *__pyx_t_13;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
+  char const *__pyx_t_20;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("write_fixed_strings_as_bytes", 0);
+  __Pyx_RefNannySetupContext("write_string_buffers", 0);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":62
- * 
- *     def write_fixed_strings_as_bytes(self, items, Py_ssize_t length):
- *         cdef Py_ssize_t buf_pos = 0             # <<<<<<<<<<<<<<
- *         cdef Py_ssize_t items_buf_size = length * len(items)
+  /* "bytehouse_driver/bufferedwriter.pyx":106
+ *         cdef int64_t start, end
+ *         cdef const char* c_data
+ *         cdef const int32_t* offsets32 = NULL             # <<<<<<<<<<<<<<
+ *         cdef const int64_t* offsets64 = NULL
  * 
  */
-  __pyx_v_buf_pos = 0;
+  __pyx_v_offsets32 = NULL;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":63
- *     def write_fixed_strings_as_bytes(self, items, Py_ssize_t length):
- *         cdef Py_ssize_t buf_pos = 0
- *         cdef Py_ssize_t items_buf_size = length * len(items)             # <<<<<<<<<<<<<<
+  /* "bytehouse_driver/bufferedwriter.pyx":107
+ *         cdef const char* c_data
+ *         cdef const int32_t* offsets32 = NULL
+ *         cdef const int64_t* offsets64 = NULL             # <<<<<<<<<<<<<<
  * 
- *         cdef char* c_value
+ *         PyObject_GetBuffer(offsets, &offsets_view, PyBUF_C_CONTIGUOUS)
  */
-  __pyx_t_1 = PyObject_Length(__pyx_v_items); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 63, __pyx_L1_error)
-  __pyx_v_items_buf_size = (__pyx_v_length * __pyx_t_1);
+  __pyx_v_offsets64 = NULL;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":66
+  /* "bytehouse_driver/bufferedwriter.pyx":109
+ *         cdef const int64_t* offsets64 = NULL
+ * 
+ *         PyObject_GetBuffer(offsets, &offsets_view, PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *         try:
+ *             PyObject_GetBuffer(data, &data_view, PyBUF_C_CONTIGUOUS)
+ */
+  __pyx_t_1 = PyObject_GetBuffer(__pyx_v_offsets, (&__pyx_v_offsets_view), PyBUF_C_CONTIGUOUS); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 109, __pyx_L1_error)
+
+  /* "bytehouse_driver/bufferedwriter.pyx":110
+ * 
+ *         PyObject_GetBuffer(offsets, &offsets_view, PyBUF_C_CONTIGUOUS)
+ *         try:             # <<<<<<<<<<<<<<
+ *             PyObject_GetBuffer(data, &data_view, PyBUF_C_CONTIGUOUS)
+ *             try:
+ */
+  /*try:*/ {
+
+    /* "bytehouse_driver/bufferedwriter.pyx":111
+ *         PyObject_GetBuffer(offsets, &offsets_view, PyBUF_C_CONTIGUOUS)
+ *         try:
+ *             PyObject_GetBuffer(data, &data_view, PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *             try:
+ *                 if offsets_view.itemsize == 4:
+ */
+    __pyx_t_1 = PyObject_GetBuffer(__pyx_v_data, (&__pyx_v_data_view), PyBUF_C_CONTIGUOUS); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 111, __pyx_L4_error)
+
+    /* "bytehouse_driver/bufferedwriter.pyx":112
+ *         try:
+ *             PyObject_GetBuffer(data, &data_view, PyBUF_C_CONTIGUOUS)
+ *             try:             # <<<<<<<<<<<<<<
+ *                 if offsets_view.itemsize == 4:
+ *                     offsets32 = <const int32_t*> offsets_view.buf
+ */
+    /*try:*/ {
+
+      /* "bytehouse_driver/bufferedwriter.pyx":113
+ *             PyObject_GetBuffer(data, &data_view, PyBUF_C_CONTIGUOUS)
+ *             try:
+ *                 if offsets_view.itemsize == 4:             # <<<<<<<<<<<<<<
+ *                     offsets32 = <const int32_t*> offsets_view.buf
+ *                 elif offsets_view.itemsize == 8:
+ */
+      switch (__pyx_v_offsets_view.itemsize) {
+        case 4:
+
+        /* "bytehouse_driver/bufferedwriter.pyx":114
+ *             try:
+ *                 if offsets_view.itemsize == 4:
+ *                     offsets32 = <const int32_t*> offsets_view.buf             # <<<<<<<<<<<<<<
+ *                 elif offsets_view.itemsize == 8:
+ *                     offsets64 = <const int64_t*> offsets_view.buf
+ */
+        __pyx_v_offsets32 = ((int32_t const *)__pyx_v_offsets_view.buf);
+
+        /* "bytehouse_driver/bufferedwriter.pyx":113
+ *             PyObject_GetBuffer(data, &data_view, PyBUF_C_CONTIGUOUS)
+ *             try:
+ *                 if offsets_view.itemsize == 4:             # <<<<<<<<<<<<<<
+ *                     offsets32 = <const int32_t*> offsets_view.buf
+ *                 elif offsets_view.itemsize == 8:
+ */
+        break;
+        case 8:
+
+        /* "bytehouse_driver/bufferedwriter.pyx":116
+ *                     offsets32 = <const int32_t*> offsets_view.buf
+ *                 elif offsets_view.itemsize == 8:
+ *                     offsets64 = <const int64_t*> offsets_view.buf             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     raise ValueError('int32 or int64 offsets expected')
+ */
+        __pyx_v_offsets64 = ((int64_t const *)__pyx_v_offsets_view.buf);
+
+        /* "bytehouse_driver/bufferedwriter.pyx":115
+ *                 if offsets_view.itemsize == 4:
+ *                     offsets32 = <const int32_t*> offsets_view.buf
+ *                 elif offsets_view.itemsize == 8:             # <<<<<<<<<<<<<<
+ *                     offsets64 = <const int64_t*> offsets_view.buf
+ *                 else:
+ */
+        break;
+        default:
+
+        /* "bytehouse_driver/bufferedwriter.pyx":118
+ *                     offsets64 = <const int64_t*> offsets_view.buf
+ *                 else:
+ *                     raise ValueError('int32 or int64 offsets expected')             # <<<<<<<<<<<<<<
+ * 
+ *                 n_items = offsets_view.len // offsets_view.itemsize - 1
+ */
+        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 118, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __PYX_ERR(0, 118, __pyx_L7_error)
+        break;
+      }
+
+      /* "bytehouse_driver/bufferedwriter.pyx":120
+ *                     raise ValueError('int32 or int64 offsets expected')
+ * 
+ *                 n_items = offsets_view.len // offsets_view.itemsize - 1             # <<<<<<<<<<<<<<
+ *                 c_data = <const char*> data_view.buf
+ * 
+ */
+      if (unlikely(__pyx_v_offsets_view.itemsize == 0)) {
+        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+        __PYX_ERR(0, 120, __pyx_L7_error)
+      }
+      else if (sizeof(Py_ssize_t) == sizeof(long) && (!(((Py_ssize_t)-1) > 0)) && unlikely(__pyx_v_offsets_view.itemsize == (Py_ssize_t)-1)  && unlikely(UNARY_NEG_WOULD_OVERFLOW(__pyx_v_offsets_view.len))) {
+        PyErr_SetString(PyExc_OverflowError, "value too large to perform division");
+        __PYX_ERR(0, 120, __pyx_L7_error)
+      }
+      __pyx_v_n_items = (__Pyx_div_Py_ssize_t(__pyx_v_offsets_view.len, __pyx_v_offsets_view.itemsize) - 1);
+
+      /* "bytehouse_driver/bufferedwriter.pyx":121
+ * 
+ *                 n_items = offsets_view.len // offsets_view.itemsize - 1
+ *                 c_data = <const char*> data_view.buf             # <<<<<<<<<<<<<<
+ * 
+ *                 for i in range(n_items):
+ */
+      __pyx_v_c_data = ((char const *)__pyx_v_data_view.buf);
+
+      /* "bytehouse_driver/bufferedwriter.pyx":123
+ *                 c_data = <const char*> data_view.buf
+ * 
+ *                 for i in range(n_items):             # <<<<<<<<<<<<<<
+ *                     if offsets32 != NULL:
+ *                         start, end = offsets32[i], offsets32[i + 1]
+ */
+      __pyx_t_3 = __pyx_v_n_items;
+      __pyx_t_4 = __pyx_t_3;
+      for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+        __pyx_v_i = __pyx_t_5;
+
+        /* "bytehouse_driver/bufferedwriter.pyx":124
+ * 
+ *                 for i in range(n_items):
+ *                     if offsets32 != NULL:             # <<<<<<<<<<<<<<
+ *                         start, end = offsets32[i], offsets32[i + 1]
+ *                     else:
+ */
+        __pyx_t_6 = ((__pyx_v_offsets32 != NULL) != 0);
+        if (__pyx_t_6) {
+
+          /* "bytehouse_driver/bufferedwriter.pyx":125
+ *                 for i in range(n_items):
+ *                     if offsets32 != NULL:
+ *                         start, end = offsets32[i], offsets32[i + 1]             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         start, end = offsets64[i], offsets64[i + 1]
+ */
+          __pyx_t_7 = (__pyx_v_offsets32[__pyx_v_i]);
+          __pyx_t_8 = (__pyx_v_offsets32[(__pyx_v_i + 1)]);
+          __pyx_v_start = __pyx_t_7;
+          __pyx_v_end = __pyx_t_8;
+
+          /* "bytehouse_driver/bufferedwriter.pyx":124
+ * 
+ *                 for i in range(n_items):
+ *                     if offsets32 != NULL:             # <<<<<<<<<<<<<<
+ *                         start, end = offsets32[i], offsets32[i + 1]
+ *                     else:
+ */
+          goto __pyx_L11;
+        }
+
+        /* "bytehouse_driver/bufferedwriter.pyx":127
+ *                         start, end = offsets32[i], offsets32[i + 1]
+ *                     else:
+ *                         start, end = offsets64[i], offsets64[i + 1]             # <<<<<<<<<<<<<<
+ * 
+ *                     if start < 0 or end < start or end > data_view.len:
+ */
+        /*else*/ {
+          __pyx_t_9 = (__pyx_v_offsets64[__pyx_v_i]);
+          __pyx_t_10 = (__pyx_v_offsets64[(__pyx_v_i + 1)]);
+          __pyx_v_start = __pyx_t_9;
+          __pyx_v_end = __pyx_t_10;
+        }
+        __pyx_L11:;
+
+        /* "bytehouse_driver/bufferedwriter.pyx":129
+ *                         start, end = offsets64[i], offsets64[i + 1]
+ * 
+ *                     if start < 0 or end < start or end > data_view.len:             # <<<<<<<<<<<<<<
+ *                         raise ValueError('Invalid string offsets')
+ * 
+ */
+        __pyx_t_11 = ((__pyx_v_start < 0) != 0);
+        if (!__pyx_t_11) {
+        } else {
+          __pyx_t_6 = __pyx_t_11;
+          goto __pyx_L13_bool_binop_done;
+        }
+        __pyx_t_11 = ((__pyx_v_end < __pyx_v_start) != 0);
+        if (!__pyx_t_11) {
+        } else {
+          __pyx_t_6 = __pyx_t_11;
+          goto __pyx_L13_bool_binop_done;
+        }
+        __pyx_t_11 = ((__pyx_v_end > __pyx_v_data_view.len) != 0);
+        __pyx_t_6 = __pyx_t_11;
+        __pyx_L13_bool_binop_done:;
+        if (unlikely(__pyx_t_6)) {
+
+          /* "bytehouse_driver/bufferedwriter.pyx":130
+ * 
+ *                     if start < 0 or end < start or end > data_view.len:
+ *                         raise ValueError('Invalid string offsets')             # <<<<<<<<<<<<<<
+ * 
+ *                     self._write_varint(end - start)
+ */
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 130, __pyx_L7_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+          __PYX_ERR(0, 130, __pyx_L7_error)
+
+          /* "bytehouse_driver/bufferedwriter.pyx":129
+ *                         start, end = offsets64[i], offsets64[i + 1]
+ * 
+ *                     if start < 0 or end < start or end > data_view.len:             # <<<<<<<<<<<<<<
+ *                         raise ValueError('Invalid string offsets')
+ * 
+ */
+        }
+
+        /* "bytehouse_driver/bufferedwriter.pyx":132
+ *                         raise ValueError('Invalid string offsets')
+ * 
+ *                     self._write_varint(end - start)             # <<<<<<<<<<<<<<
+ *                     self._write(&c_data[start], end - start)
+ * 
+ */
+        __pyx_t_1 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->_write_varint(__pyx_v_self, (__pyx_v_end - __pyx_v_start)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 132, __pyx_L7_error)
+
+        /* "bytehouse_driver/bufferedwriter.pyx":133
+ * 
+ *                     self._write_varint(end - start)
+ *                     self._write(&c_data[start], end - start)             # <<<<<<<<<<<<<<
+ * 
+ *             finally:
+ */
+        __pyx_t_1 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->_write(__pyx_v_self, (&(__pyx_v_c_data[__pyx_v_start])), (__pyx_v_end - __pyx_v_start)); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 133, __pyx_L7_error)
+      }
+    }
+
+    /* "bytehouse_driver/bufferedwriter.pyx":136
+ * 
+ *             finally:
+ *                 PyBuffer_Release(&data_view)             # <<<<<<<<<<<<<<
+ *         finally:
+ *             PyBuffer_Release(&offsets_view)
+ */
+    /*finally:*/ {
+      /*normal exit:*/{
+        PyBuffer_Release((&__pyx_v_data_view));
+        goto __pyx_L8;
+      }
+      __pyx_L7_error:;
+      /*exception exit:*/{
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0;
+        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+        if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_17, &__pyx_t_18, &__pyx_t_19);
+        if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_14, &__pyx_t_15, &__pyx_t_16) < 0)) __Pyx_ErrFetch(&__pyx_t_14, &__pyx_t_15, &__pyx_t_16);
+        __Pyx_XGOTREF(__pyx_t_14);
+        __Pyx_XGOTREF(__pyx_t_15);
+        __Pyx_XGOTREF(__pyx_t_16);
+        __Pyx_XGOTREF(__pyx_t_17);
+        __Pyx_XGOTREF(__pyx_t_18);
+        __Pyx_XGOTREF(__pyx_t_19);
+        __pyx_t_1 = __pyx_lineno; __pyx_t_12 = __pyx_clineno; __pyx_t_13 = __pyx_filename;
+        {
+          PyBuffer_Release((&__pyx_v_data_view));
+        }
+        if (PY_MAJOR_VERSION >= 3) {
+          __Pyx_XGIVEREF(__pyx_t_17);
+          __Pyx_XGIVEREF(__pyx_t_18);
+          __Pyx_XGIVEREF(__pyx_t_19);
+          __Pyx_ExceptionReset(__pyx_t_17, __pyx_t_18, __pyx_t_19);
+        }
+        __Pyx_XGIVEREF(__pyx_t_14);
+        __Pyx_XGIVEREF(__pyx_t_15);
+        __Pyx_XGIVEREF(__pyx_t_16);
+        __Pyx_ErrRestore(__pyx_t_14, __pyx_t_15, __pyx_t_16);
+        __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0;
+        __pyx_lineno = __pyx_t_1; __pyx_clineno = __pyx_t_12; __pyx_filename = __pyx_t_13;
+        goto __pyx_L4_error;
+      }
+      __pyx_L8:;
+    }
+  }
+
+  /* "bytehouse_driver/bufferedwriter.pyx":138
+ *                 PyBuffer_Release(&data_view)
+ *         finally:
+ *             PyBuffer_Release(&offsets_view)             # <<<<<<<<<<<<<<
+ * 
+ *     def write_fixed_strings_as_bytes(self, items, Py_ssize_t length):
+ */
+  /*finally:*/ {
+    /*normal exit:*/{
+      PyBuffer_Release((&__pyx_v_offsets_view));
+      goto __pyx_L5;
+    }
+    __pyx_L4_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_19 = 0; __pyx_t_18 = 0; __pyx_t_17 = 0; __pyx_t_16 = 0; __pyx_t_15 = 0; __pyx_t_14 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_16, &__pyx_t_15, &__pyx_t_14);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_19, &__pyx_t_18, &__pyx_t_17) < 0)) __Pyx_ErrFetch(&__pyx_t_19, &__pyx_t_18, &__pyx_t_17);
+      __Pyx_XGOTREF(__pyx_t_19);
+      __Pyx_XGOTREF(__pyx_t_18);
+      __Pyx_XGOTREF(__pyx_t_17);
+      __Pyx_XGOTREF(__pyx_t_16);
+      __Pyx_XGOTREF(__pyx_t_15);
+      __Pyx_XGOTREF(__pyx_t_14);
+      __pyx_t_12 = __pyx_lineno; __pyx_t_1 = __pyx_clineno; __pyx_t_20 = __pyx_filename;
+      {
+        PyBuffer_Release((&__pyx_v_offsets_view));
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_16);
+        __Pyx_XGIVEREF(__pyx_t_15);
+        __Pyx_XGIVEREF(__pyx_t_14);
+        __Pyx_ExceptionReset(__pyx_t_16, __pyx_t_15, __pyx_t_14);
+      }
+      __Pyx_XGIVEREF(__pyx_t_19);
+      __Pyx_XGIVEREF(__pyx_t_18);
+      __Pyx_XGIVEREF(__pyx_t_17);
+      __Pyx_ErrRestore(__pyx_t_19, __pyx_t_18, __pyx_t_17);
+      __pyx_t_19 = 0; __pyx_t_18 = 0; __pyx_t_17 = 0; __pyx_t_16 = 0; __pyx_t_15 = 0; __pyx_t_14 = 0;
+      __pyx_lineno = __pyx_t_12; __pyx_clineno = __pyx_t_1; __pyx_filename = __pyx_t_20;
+      goto __pyx_L1_error;
+    }
+    __pyx_L5:;
+  }
+
+  /* "bytehouse_driver/bufferedwriter.pyx":96
+ *             self.write(value)
+ * 
+ *     def write_string_buffers(self, offsets, data):             # <<<<<<<<<<<<<<
+ *         """
+ *         Writes strings stored as offsets and data buffers, Arrow layout.
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedWriter.write_string_buffers", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bytehouse_driver/bufferedwriter.pyx":140
+ *             PyBuffer_Release(&offsets_view)
+ * 
+ *     def write_fixed_strings_as_bytes(self, items, Py_ssize_t length):             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t buf_pos = 0
+ *         cdef Py_ssize_t items_buf_size = length * len(items)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_15write_fixed_strings_as_bytes(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_15write_fixed_strings_as_bytes(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_items = 0;
+  Py_ssize_t __pyx_v_length;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("write_fixed_strings_as_bytes (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_items,&__pyx_n_s_length,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_items)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_length)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("write_fixed_strings_as_bytes", 1, 2, 2, 1); __PYX_ERR(0, 140, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "write_fixed_strings_as_bytes") < 0)) __PYX_ERR(0, 140, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_items = values[0];
+    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 140, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("write_fixed_strings_as_bytes", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 140, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedWriter.write_fixed_strings_as_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_14write_fixed_strings_as_bytes(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), __pyx_v_items, __pyx_v_length);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_14write_fixed_strings_as_bytes(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_items, Py_ssize_t __pyx_v_length) {
+  Py_ssize_t __pyx_v_buf_pos;
+  Py_ssize_t __pyx_v_items_buf_size;
+  char *__pyx_v_c_value;
+  char *__pyx_v_items_buf;
+  PyObject *__pyx_v_value = NULL;
+  Py_ssize_t __pyx_v_value_len;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *(*__pyx_t_4)(PyObject *);
+  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  char *__pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_fixed_strings_as_bytes", 0);
+
+  /* "bytehouse_driver/bufferedwriter.pyx":141
+ * 
+ *     def write_fixed_strings_as_bytes(self, items, Py_ssize_t length):
+ *         cdef Py_ssize_t buf_pos = 0             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t items_buf_size = length * len(items)
+ * 
+ */
+  __pyx_v_buf_pos = 0;
+
+  /* "bytehouse_driver/bufferedwriter.pyx":142
+ *     def write_fixed_strings_as_bytes(self, items, Py_ssize_t length):
+ *         cdef Py_ssize_t buf_pos = 0
+ *         cdef Py_ssize_t items_buf_size = length * len(items)             # <<<<<<<<<<<<<<
+ * 
+ *         cdef char* c_value
+ */
+  __pyx_t_1 = PyObject_Length(__pyx_v_items); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_v_items_buf_size = (__pyx_v_length * __pyx_t_1);
+
+  /* "bytehouse_driver/bufferedwriter.pyx":145
  * 
  *         cdef char* c_value
  *         cdef char* items_buf = <char *>PyMem_Malloc(items_buf_size)             # <<<<<<<<<<<<<<
@@ -2833,7 +3774,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
   __pyx_v_items_buf = ((char *)PyMem_Malloc(__pyx_v_items_buf_size));
 
-  /* "bytehouse_driver/bufferedwriter.pyx":67
+  /* "bytehouse_driver/bufferedwriter.pyx":146
  *         cdef char* c_value
  *         cdef char* items_buf = <char *>PyMem_Malloc(items_buf_size)
  *         if not items_buf:             # <<<<<<<<<<<<<<
@@ -2843,16 +3784,16 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
   __pyx_t_2 = ((!(__pyx_v_items_buf != 0)) != 0);
   if (unlikely(__pyx_t_2)) {
 
-    /* "bytehouse_driver/bufferedwriter.pyx":68
+    /* "bytehouse_driver/bufferedwriter.pyx":147
  *         cdef char* items_buf = <char *>PyMem_Malloc(items_buf_size)
  *         if not items_buf:
  *             raise MemoryError()             # <<<<<<<<<<<<<<
  * 
  *         memset(items_buf, 0, items_buf_size)
  */
-    PyErr_NoMemory(); __PYX_ERR(0, 68, __pyx_L1_error)
+    PyErr_NoMemory(); __PYX_ERR(0, 147, __pyx_L1_error)
 
-    /* "bytehouse_driver/bufferedwriter.pyx":67
+    /* "bytehouse_driver/bufferedwriter.pyx":146
  *         cdef char* c_value
  *         cdef char* items_buf = <char *>PyMem_Malloc(items_buf_size)
  *         if not items_buf:             # <<<<<<<<<<<<<<
@@ -2861,7 +3802,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
   }
 
-  /* "bytehouse_driver/bufferedwriter.pyx":70
+  /* "bytehouse_driver/bufferedwriter.pyx":149
  *             raise MemoryError()
  * 
  *         memset(items_buf, 0, items_buf_size)             # <<<<<<<<<<<<<<
@@ -2870,7 +3811,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
   (void)(memset(__pyx_v_items_buf, 0, __pyx_v_items_buf_size));
 
-  /* "bytehouse_driver/bufferedwriter.pyx":72
+  /* "bytehouse_driver/bufferedwriter.pyx":151
  *         memset(items_buf, 0, items_buf_size)
  * 
  *         for value in items:             # <<<<<<<<<<<<<<
@@ -2881,26 +3822,26 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     __pyx_t_3 = __pyx_v_items; __Pyx_INCREF(__pyx_t_3); __pyx_t_1 = 0;
     __pyx_t_4 = NULL;
   } else {
-    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_items); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 72, __pyx_L1_error)
+    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_items); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 72, __pyx_L1_error)
+    __pyx_t_4 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 151, __pyx_L1_error)
   }
   for (;;) {
     if (likely(!__pyx_t_4)) {
       if (likely(PyList_CheckExact(__pyx_t_3))) {
         if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_3)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_5); __pyx_t_1++; if (unlikely(0 < 0)) __PYX_ERR(0, 72, __pyx_L1_error)
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_5); __pyx_t_1++; if (unlikely(0 < 0)) __PYX_ERR(0, 151, __pyx_L1_error)
         #else
-        __pyx_t_5 = PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 72, __pyx_L1_error)
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 151, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         #endif
       } else {
         if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_5); __pyx_t_1++; if (unlikely(0 < 0)) __PYX_ERR(0, 72, __pyx_L1_error)
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_5); __pyx_t_1++; if (unlikely(0 < 0)) __PYX_ERR(0, 151, __pyx_L1_error)
         #else
-        __pyx_t_5 = PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 72, __pyx_L1_error)
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 151, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         #endif
       }
@@ -2910,7 +3851,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 72, __pyx_L1_error)
+          else __PYX_ERR(0, 151, __pyx_L1_error)
         }
         break;
       }
@@ -2919,17 +3860,17 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     __Pyx_XDECREF_SET(__pyx_v_value, __pyx_t_5);
     __pyx_t_5 = 0;
 
-    /* "bytehouse_driver/bufferedwriter.pyx":73
+    /* "bytehouse_driver/bufferedwriter.pyx":152
  * 
  *         for value in items:
  *             value_len = len(value)             # <<<<<<<<<<<<<<
  *             if length < value_len:
  *                 raise errors.TooLargeStringSize()
  */
-    __pyx_t_6 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 73, __pyx_L1_error)
+    __pyx_t_6 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 152, __pyx_L1_error)
     __pyx_v_value_len = __pyx_t_6;
 
-    /* "bytehouse_driver/bufferedwriter.pyx":74
+    /* "bytehouse_driver/bufferedwriter.pyx":153
  *         for value in items:
  *             value_len = len(value)
  *             if length < value_len:             # <<<<<<<<<<<<<<
@@ -2939,16 +3880,16 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     __pyx_t_2 = ((__pyx_v_length < __pyx_v_value_len) != 0);
     if (unlikely(__pyx_t_2)) {
 
-      /* "bytehouse_driver/bufferedwriter.pyx":75
+      /* "bytehouse_driver/bufferedwriter.pyx":154
  *             value_len = len(value)
  *             if length < value_len:
  *                 raise errors.TooLargeStringSize()             # <<<<<<<<<<<<<<
  * 
  *             c_value = PyBytes_AsString(value)
  */
-      __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_errors); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 75, __pyx_L1_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_errors); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 154, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_TooLargeStringSize); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 75, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_TooLargeStringSize); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 154, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       __pyx_t_7 = NULL;
@@ -2963,14 +3904,14 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
       }
       __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_8);
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 75, __pyx_L1_error)
+      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 154, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       __Pyx_Raise(__pyx_t_5, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __PYX_ERR(0, 75, __pyx_L1_error)
+      __PYX_ERR(0, 154, __pyx_L1_error)
 
-      /* "bytehouse_driver/bufferedwriter.pyx":74
+      /* "bytehouse_driver/bufferedwriter.pyx":153
  *         for value in items:
  *             value_len = len(value)
  *             if length < value_len:             # <<<<<<<<<<<<<<
@@ -2979,17 +3920,17 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
     }
 
-    /* "bytehouse_driver/bufferedwriter.pyx":77
+    /* "bytehouse_driver/bufferedwriter.pyx":156
  *                 raise errors.TooLargeStringSize()
  * 
  *             c_value = PyBytes_AsString(value)             # <<<<<<<<<<<<<<
  * 
  *             memcpy(&items_buf[buf_pos], c_value, value_len)
  */
-    __pyx_t_9 = PyBytes_AsString(__pyx_v_value); if (unlikely(__pyx_t_9 == ((char *)NULL))) __PYX_ERR(0, 77, __pyx_L1_error)
+    __pyx_t_9 = PyBytes_AsString(__pyx_v_value); if (unlikely(__pyx_t_9 == ((char *)NULL))) __PYX_ERR(0, 156, __pyx_L1_error)
     __pyx_v_c_value = __pyx_t_9;
 
-    /* "bytehouse_driver/bufferedwriter.pyx":79
+    /* "bytehouse_driver/bufferedwriter.pyx":158
  *             c_value = PyBytes_AsString(value)
  * 
  *             memcpy(&items_buf[buf_pos], c_value, value_len)             # <<<<<<<<<<<<<<
@@ -2998,7 +3939,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
     (void)(memcpy((&(__pyx_v_items_buf[__pyx_v_buf_pos])), __pyx_v_c_value, __pyx_v_value_len));
 
-    /* "bytehouse_driver/bufferedwriter.pyx":80
+    /* "bytehouse_driver/bufferedwriter.pyx":159
  * 
  *             memcpy(&items_buf[buf_pos], c_value, value_len)
  *             buf_pos += length             # <<<<<<<<<<<<<<
@@ -3007,7 +3948,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
     __pyx_v_buf_pos = (__pyx_v_buf_pos + __pyx_v_length);
 
-    /* "bytehouse_driver/bufferedwriter.pyx":72
+    /* "bytehouse_driver/bufferedwriter.pyx":151
  *         memset(items_buf, 0, items_buf_size)
  * 
  *         for value in items:             # <<<<<<<<<<<<<<
@@ -3017,21 +3958,21 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":82
+  /* "bytehouse_driver/bufferedwriter.pyx":161
  *             buf_pos += length
  * 
  *         self.write(PyBytes_FromStringAndSize(items_buf, items_buf_size))             # <<<<<<<<<<<<<<
  * 
  *         PyMem_Free(items_buf)
  */
-  __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_items_buf, __pyx_v_items_buf_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 82, __pyx_L1_error)
+  __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_items_buf, __pyx_v_items_buf_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 161, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = ((struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_t_3, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 82, __pyx_L1_error)
+  __pyx_t_5 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_t_3, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 161, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":84
+  /* "bytehouse_driver/bufferedwriter.pyx":163
  *         self.write(PyBytes_FromStringAndSize(items_buf, items_buf_size))
  * 
  *         PyMem_Free(items_buf)             # <<<<<<<<<<<<<<
@@ -3040,8 +3981,8 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
   PyMem_Free(__pyx_v_items_buf);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":61
- *             self.write(value)
+  /* "bytehouse_driver/bufferedwriter.pyx":140
+ *             PyBuffer_Release(&offsets_view)
  * 
  *     def write_fixed_strings_as_bytes(self, items, Py_ssize_t length):             # <<<<<<<<<<<<<<
  *         cdef Py_ssize_t buf_pos = 0
@@ -3065,7 +4006,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedwriter.pyx":86
+/* "bytehouse_driver/bufferedwriter.pyx":165
  *         PyMem_Free(items_buf)
  * 
  *     def write_fixed_strings(self, items, Py_ssize_t length, encoding=None):             # <<<<<<<<<<<<<<
@@ -3074,8 +4015,8 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_15write_fixed_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_15write_fixed_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_17write_fixed_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_17write_fixed_strings(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_items = 0;
   Py_ssize_t __pyx_v_length;
   PyObject *__pyx_v_encoding = 0;
@@ -3111,7 +4052,7 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_length)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("write_fixed_strings", 0, 2, 3, 1); __PYX_ERR(0, 86, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("write_fixed_strings", 0, 2, 3, 1); __PYX_ERR(0, 165, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
@@ -3121,7 +4062,7 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "write_fixed_strings") < 0)) __PYX_ERR(0, 86, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "write_fixed_strings") < 0)) __PYX_ERR(0, 165, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -3134,25 +4075,25 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
       }
     }
     __pyx_v_items = values[0];
-    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L3_error)
+    __pyx_v_length = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_length == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 165, __pyx_L3_error)
     __pyx_v_encoding = values[2];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("write_fixed_strings", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 86, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("write_fixed_strings", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 165, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedWriter.write_fixed_strings", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_14write_fixed_strings(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), __pyx_v_items, __pyx_v_length, __pyx_v_encoding);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_16write_fixed_strings(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), __pyx_v_items, __pyx_v_length, __pyx_v_encoding);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_14write_fixed_strings(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_items, Py_ssize_t __pyx_v_length, PyObject *__pyx_v_encoding) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_16write_fixed_strings(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v_items, Py_ssize_t __pyx_v_length, PyObject *__pyx_v_encoding) {
   Py_ssize_t __pyx_v_buf_pos;
   Py_ssize_t __pyx_v_items_buf_size;
   char *__pyx_v_c_value;
@@ -3178,7 +4119,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("write_fixed_strings", 0);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":87
+  /* "bytehouse_driver/bufferedwriter.pyx":166
  * 
  *     def write_fixed_strings(self, items, Py_ssize_t length, encoding=None):
  *         if encoding is None:             # <<<<<<<<<<<<<<
@@ -3189,16 +4130,16 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "bytehouse_driver/bufferedwriter.pyx":88
+    /* "bytehouse_driver/bufferedwriter.pyx":167
  *     def write_fixed_strings(self, items, Py_ssize_t length, encoding=None):
  *         if encoding is None:
  *             self.write_fixed_strings_as_bytes(items, length)             # <<<<<<<<<<<<<<
  *             return
  * 
  */
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write_fixed_strings_as_bytes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 88, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write_fixed_strings_as_bytes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 167, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_length); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 88, __pyx_L1_error)
+    __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_length); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 167, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __pyx_t_6 = NULL;
     __pyx_t_7 = 0;
@@ -3215,7 +4156,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_4)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_items, __pyx_t_5};
-      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 88, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 167, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -3224,14 +4165,14 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_items, __pyx_t_5};
-      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 88, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 167, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     } else
     #endif
     {
-      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 88, __pyx_L1_error)
+      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 167, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       if (__pyx_t_6) {
         __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
@@ -3242,14 +4183,14 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
       __Pyx_GIVEREF(__pyx_t_5);
       PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_5);
       __pyx_t_5 = 0;
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 88, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 167, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     }
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "bytehouse_driver/bufferedwriter.pyx":89
+    /* "bytehouse_driver/bufferedwriter.pyx":168
  *         if encoding is None:
  *             self.write_fixed_strings_as_bytes(items, length)
  *             return             # <<<<<<<<<<<<<<
@@ -3260,7 +4201,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "bytehouse_driver/bufferedwriter.pyx":87
+    /* "bytehouse_driver/bufferedwriter.pyx":166
  * 
  *     def write_fixed_strings(self, items, Py_ssize_t length, encoding=None):
  *         if encoding is None:             # <<<<<<<<<<<<<<
@@ -3269,7 +4210,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
   }
 
-  /* "bytehouse_driver/bufferedwriter.pyx":91
+  /* "bytehouse_driver/bufferedwriter.pyx":170
  *             return
  * 
  *         cdef Py_ssize_t buf_pos = 0             # <<<<<<<<<<<<<<
@@ -3278,17 +4219,17 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
   __pyx_v_buf_pos = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":92
+  /* "bytehouse_driver/bufferedwriter.pyx":171
  * 
  *         cdef Py_ssize_t buf_pos = 0
  *         cdef Py_ssize_t items_buf_size = length * len(items)             # <<<<<<<<<<<<<<
  * 
  *         cdef char* c_value
  */
-  __pyx_t_9 = PyObject_Length(__pyx_v_items); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 92, __pyx_L1_error)
+  __pyx_t_9 = PyObject_Length(__pyx_v_items); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 171, __pyx_L1_error)
   __pyx_v_items_buf_size = (__pyx_v_length * __pyx_t_9);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":95
+  /* "bytehouse_driver/bufferedwriter.pyx":174
  * 
  *         cdef char* c_value
  *         cdef char* items_buf = <char *>PyMem_Malloc(items_buf_size)             # <<<<<<<<<<<<<<
@@ -3297,7 +4238,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
   __pyx_v_items_buf = ((char *)PyMem_Malloc(__pyx_v_items_buf_size));
 
-  /* "bytehouse_driver/bufferedwriter.pyx":96
+  /* "bytehouse_driver/bufferedwriter.pyx":175
  *         cdef char* c_value
  *         cdef char* items_buf = <char *>PyMem_Malloc(items_buf_size)
  *         if not items_buf:             # <<<<<<<<<<<<<<
@@ -3307,16 +4248,16 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
   __pyx_t_2 = ((!(__pyx_v_items_buf != 0)) != 0);
   if (unlikely(__pyx_t_2)) {
 
-    /* "bytehouse_driver/bufferedwriter.pyx":97
+    /* "bytehouse_driver/bufferedwriter.pyx":176
  *         cdef char* items_buf = <char *>PyMem_Malloc(items_buf_size)
  *         if not items_buf:
  *             raise MemoryError()             # <<<<<<<<<<<<<<
  * 
  *         memset(items_buf, 0, items_buf_size)
  */
-    PyErr_NoMemory(); __PYX_ERR(0, 97, __pyx_L1_error)
+    PyErr_NoMemory(); __PYX_ERR(0, 176, __pyx_L1_error)
 
-    /* "bytehouse_driver/bufferedwriter.pyx":96
+    /* "bytehouse_driver/bufferedwriter.pyx":175
  *         cdef char* c_value
  *         cdef char* items_buf = <char *>PyMem_Malloc(items_buf_size)
  *         if not items_buf:             # <<<<<<<<<<<<<<
@@ -3325,7 +4266,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
   }
 
-  /* "bytehouse_driver/bufferedwriter.pyx":99
+  /* "bytehouse_driver/bufferedwriter.pyx":178
  *             raise MemoryError()
  * 
  *         memset(items_buf, 0, items_buf_size)             # <<<<<<<<<<<<<<
@@ -3334,7 +4275,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
   (void)(memset(__pyx_v_items_buf, 0, __pyx_v_items_buf_size));
 
-  /* "bytehouse_driver/bufferedwriter.pyx":101
+  /* "bytehouse_driver/bufferedwriter.pyx":180
  *         memset(items_buf, 0, items_buf_size)
  * 
  *         for value in items:             # <<<<<<<<<<<<<<
@@ -3345,26 +4286,26 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     __pyx_t_3 = __pyx_v_items; __Pyx_INCREF(__pyx_t_3); __pyx_t_9 = 0;
     __pyx_t_10 = NULL;
   } else {
-    __pyx_t_9 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_items); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 101, __pyx_L1_error)
+    __pyx_t_9 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_items); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 180, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_10 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 101, __pyx_L1_error)
+    __pyx_t_10 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 180, __pyx_L1_error)
   }
   for (;;) {
     if (likely(!__pyx_t_10)) {
       if (likely(PyList_CheckExact(__pyx_t_3))) {
         if (__pyx_t_9 >= PyList_GET_SIZE(__pyx_t_3)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_9); __Pyx_INCREF(__pyx_t_4); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 101, __pyx_L1_error)
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_9); __Pyx_INCREF(__pyx_t_4); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 180, __pyx_L1_error)
         #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_3, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 101, __pyx_L1_error)
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_3, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 180, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         #endif
       } else {
         if (__pyx_t_9 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_9); __Pyx_INCREF(__pyx_t_4); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 101, __pyx_L1_error)
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_9); __Pyx_INCREF(__pyx_t_4); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 180, __pyx_L1_error)
         #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_3, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 101, __pyx_L1_error)
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_3, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 180, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         #endif
       }
@@ -3374,7 +4315,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 101, __pyx_L1_error)
+          else __PYX_ERR(0, 180, __pyx_L1_error)
         }
         break;
       }
@@ -3383,7 +4324,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     __Pyx_XDECREF_SET(__pyx_v_value, __pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "bytehouse_driver/bufferedwriter.pyx":102
+    /* "bytehouse_driver/bufferedwriter.pyx":181
  * 
  *         for value in items:
  *             if not PyBytes_Check(value):             # <<<<<<<<<<<<<<
@@ -3393,14 +4334,14 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     __pyx_t_2 = ((!(PyBytes_Check(__pyx_v_value) != 0)) != 0);
     if (__pyx_t_2) {
 
-      /* "bytehouse_driver/bufferedwriter.pyx":103
+      /* "bytehouse_driver/bufferedwriter.pyx":182
  *         for value in items:
  *             if not PyBytes_Check(value):
  *                 value = value.encode(encoding)             # <<<<<<<<<<<<<<
  * 
  *             value_len = len(value)
  */
-      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_encode); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 103, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_encode); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 182, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       __pyx_t_5 = NULL;
       if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
@@ -3414,13 +4355,13 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
       }
       __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_5, __pyx_v_encoding) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_v_encoding);
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 103, __pyx_L1_error)
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 182, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       __Pyx_DECREF_SET(__pyx_v_value, __pyx_t_4);
       __pyx_t_4 = 0;
 
-      /* "bytehouse_driver/bufferedwriter.pyx":102
+      /* "bytehouse_driver/bufferedwriter.pyx":181
  * 
  *         for value in items:
  *             if not PyBytes_Check(value):             # <<<<<<<<<<<<<<
@@ -3429,17 +4370,17 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
     }
 
-    /* "bytehouse_driver/bufferedwriter.pyx":105
+    /* "bytehouse_driver/bufferedwriter.pyx":184
  *                 value = value.encode(encoding)
  * 
  *             value_len = len(value)             # <<<<<<<<<<<<<<
  *             if length < value_len:
  *                 raise errors.TooLargeStringSize()
  */
-    __pyx_t_11 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 105, __pyx_L1_error)
+    __pyx_t_11 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 184, __pyx_L1_error)
     __pyx_v_value_len = __pyx_t_11;
 
-    /* "bytehouse_driver/bufferedwriter.pyx":106
+    /* "bytehouse_driver/bufferedwriter.pyx":185
  * 
  *             value_len = len(value)
  *             if length < value_len:             # <<<<<<<<<<<<<<
@@ -3449,16 +4390,16 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
     __pyx_t_2 = ((__pyx_v_length < __pyx_v_value_len) != 0);
     if (unlikely(__pyx_t_2)) {
 
-      /* "bytehouse_driver/bufferedwriter.pyx":107
+      /* "bytehouse_driver/bufferedwriter.pyx":186
  *             value_len = len(value)
  *             if length < value_len:
  *                 raise errors.TooLargeStringSize()             # <<<<<<<<<<<<<<
  * 
  *             c_value = PyBytes_AsString(value)
  */
-      __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_errors); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 107, __pyx_L1_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_errors); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 186, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_TooLargeStringSize); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 107, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_TooLargeStringSize); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 186, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       __pyx_t_8 = NULL;
@@ -3473,14 +4414,14 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
       }
       __pyx_t_4 = (__pyx_t_8) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_8) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
       __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 107, __pyx_L1_error)
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 186, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_Raise(__pyx_t_4, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __PYX_ERR(0, 107, __pyx_L1_error)
+      __PYX_ERR(0, 186, __pyx_L1_error)
 
-      /* "bytehouse_driver/bufferedwriter.pyx":106
+      /* "bytehouse_driver/bufferedwriter.pyx":185
  * 
  *             value_len = len(value)
  *             if length < value_len:             # <<<<<<<<<<<<<<
@@ -3489,17 +4430,17 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
     }
 
-    /* "bytehouse_driver/bufferedwriter.pyx":109
+    /* "bytehouse_driver/bufferedwriter.pyx":188
  *                 raise errors.TooLargeStringSize()
  * 
  *             c_value = PyBytes_AsString(value)             # <<<<<<<<<<<<<<
  * 
  *             memcpy(&items_buf[buf_pos], c_value, value_len)
  */
-    __pyx_t_12 = PyBytes_AsString(__pyx_v_value); if (unlikely(__pyx_t_12 == ((char *)NULL))) __PYX_ERR(0, 109, __pyx_L1_error)
+    __pyx_t_12 = PyBytes_AsString(__pyx_v_value); if (unlikely(__pyx_t_12 == ((char *)NULL))) __PYX_ERR(0, 188, __pyx_L1_error)
     __pyx_v_c_value = __pyx_t_12;
 
-    /* "bytehouse_driver/bufferedwriter.pyx":111
+    /* "bytehouse_driver/bufferedwriter.pyx":190
  *             c_value = PyBytes_AsString(value)
  * 
  *             memcpy(&items_buf[buf_pos], c_value, value_len)             # <<<<<<<<<<<<<<
@@ -3508,7 +4449,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
     (void)(memcpy((&(__pyx_v_items_buf[__pyx_v_buf_pos])), __pyx_v_c_value, __pyx_v_value_len));
 
-    /* "bytehouse_driver/bufferedwriter.pyx":112
+    /* "bytehouse_driver/bufferedwriter.pyx":191
  * 
  *             memcpy(&items_buf[buf_pos], c_value, value_len)
  *             buf_pos += length             # <<<<<<<<<<<<<<
@@ -3517,7 +4458,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
     __pyx_v_buf_pos = (__pyx_v_buf_pos + __pyx_v_length);
 
-    /* "bytehouse_driver/bufferedwriter.pyx":101
+    /* "bytehouse_driver/bufferedwriter.pyx":180
  *         memset(items_buf, 0, items_buf_size)
  * 
  *         for value in items:             # <<<<<<<<<<<<<<
@@ -3527,21 +4468,21 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":114
+  /* "bytehouse_driver/bufferedwriter.pyx":193
  *             buf_pos += length
  * 
  *         self.write(PyBytes_FromStringAndSize(items_buf, items_buf_size))             # <<<<<<<<<<<<<<
  * 
  *         PyMem_Free(items_buf)
  */
-  __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_items_buf, __pyx_v_items_buf_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_items_buf, __pyx_v_items_buf_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 193, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = ((struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_t_3, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __pyx_t_4 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, __pyx_t_3, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 193, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":116
+  /* "bytehouse_driver/bufferedwriter.pyx":195
  *         self.write(PyBytes_FromStringAndSize(items_buf, items_buf_size))
  * 
  *         PyMem_Free(items_buf)             # <<<<<<<<<<<<<<
@@ -3550,7 +4491,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
   PyMem_Free(__pyx_v_items_buf);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":86
+  /* "bytehouse_driver/bufferedwriter.pyx":165
  *         PyMem_Free(items_buf)
  * 
  *     def write_fixed_strings(self, items, Py_ssize_t length, encoding=None):             # <<<<<<<<<<<<<<
@@ -3583,19 +4524,19 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_17__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_17__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_19__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_19__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_16__reduce_cython__(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self));
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_18__reduce_cython__(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_16__reduce_cython__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_18__reduce_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self) {
   PyObject *__pyx_v_state = 0;
   PyObject *__pyx_v__dict = 0;
   int __pyx_v_use_setstate;
@@ -3831,19 +4772,19 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_19__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_19__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_21__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_21__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_18__setstate_cython__(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_20__setstate_cython__(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_18__setstate_cython__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_14BufferedWriter_20__setstate_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3858,7 +4799,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  *     __pyx_unpickle_BufferedWriter__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
  */
   if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
-  __pyx_t_1 = __pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
@@ -3882,7 +4823,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedwriter.pyx":122
+/* "bytehouse_driver/bufferedwriter.pyx":201
  *     cdef object sock
  * 
  *     def __init__(self, sock, bufsize):             # <<<<<<<<<<<<<<
@@ -3891,8 +4832,8 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1
  */
 
 /* Python wrapper */
-static int __pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static int __pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_sock = 0;
   PyObject *__pyx_v_bufsize = 0;
   int __pyx_lineno = 0;
@@ -3924,11 +4865,11 @@ static int __pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_1
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bufsize)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 122, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 201, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 122, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 201, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -3941,20 +4882,20 @@ static int __pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_1
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 122, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 201, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedSocketWriter.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter___init__(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)__pyx_v_self), __pyx_v_sock, __pyx_v_bufsize);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter___init__(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)__pyx_v_self), __pyx_v_sock, __pyx_v_bufsize);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static int __pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter___init__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self, PyObject *__pyx_v_sock, PyObject *__pyx_v_bufsize) {
+static int __pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter___init__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self, PyObject *__pyx_v_sock, PyObject *__pyx_v_bufsize) {
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3965,7 +4906,7 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":123
+  /* "bytehouse_driver/bufferedwriter.pyx":202
  * 
  *     def __init__(self, sock, bufsize):
  *         self.sock = sock             # <<<<<<<<<<<<<<
@@ -3978,25 +4919,25 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter__
   __Pyx_DECREF(__pyx_v_self->sock);
   __pyx_v_self->sock = __pyx_v_sock;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":124
+  /* "bytehouse_driver/bufferedwriter.pyx":203
  *     def __init__(self, sock, bufsize):
  *         self.sock = sock
  *         super(BufferedSocketWriter, self).__init__(bufsize)             # <<<<<<<<<<<<<<
  * 
  *     cpdef write_into_stream(self):
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 203, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(((PyObject *)__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter));
-  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter));
-  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter));
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter));
   __Pyx_INCREF(((PyObject *)__pyx_v_self));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
   PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 203, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 203, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -4011,12 +4952,12 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter__
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_bufsize) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_bufsize);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 124, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 203, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":122
+  /* "bytehouse_driver/bufferedwriter.pyx":201
  *     cdef object sock
  * 
  *     def __init__(self, sock, bufsize):             # <<<<<<<<<<<<<<
@@ -4038,7 +4979,7 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter__
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedwriter.pyx":126
+/* "bytehouse_driver/bufferedwriter.pyx":205
  *         super(BufferedSocketWriter, self).__init__(bufsize)
  * 
  *     cpdef write_into_stream(self):             # <<<<<<<<<<<<<<
@@ -4046,8 +4987,8 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter__
  *             PyBytes_FromStringAndSize(self.buffer, self.position)
  */
 
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_write_into_stream(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self, int __pyx_skip_dispatch) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4067,9 +5008,9 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_20BufferedSocketWri
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write_into_stream); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 126, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write_into_stream); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 205, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_3write_into_stream)) {
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_3write_into_stream)) {
         __Pyx_XDECREF(__pyx_r);
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
@@ -4084,7 +5025,7 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_20BufferedSocketWri
         }
         __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 126, __pyx_L1_error)
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 205, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
         __pyx_r = __pyx_t_2;
@@ -4105,24 +5046,24 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_20BufferedSocketWri
     #endif
   }
 
-  /* "bytehouse_driver/bufferedwriter.pyx":127
+  /* "bytehouse_driver/bufferedwriter.pyx":206
  * 
  *     cpdef write_into_stream(self):
  *         self.sock.sendall(             # <<<<<<<<<<<<<<
  *             PyBytes_FromStringAndSize(self.buffer, self.position)
  *         )
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->sock, __pyx_n_s_sendall); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->sock, __pyx_n_s_sendall); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 206, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":128
+  /* "bytehouse_driver/bufferedwriter.pyx":207
  *     cpdef write_into_stream(self):
  *         self.sock.sendall(
  *             PyBytes_FromStringAndSize(self.buffer, self.position)             # <<<<<<<<<<<<<<
  *         )
  *         self.position = 0
  */
-  __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_self->__pyx_base.buffer, __pyx_v_self->__pyx_base.position); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_self->__pyx_base.buffer, __pyx_v_self->__pyx_base.position); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 207, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -4137,12 +5078,12 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_20BufferedSocketWri
   __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_4, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 206, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":130
+  /* "bytehouse_driver/bufferedwriter.pyx":209
  *             PyBytes_FromStringAndSize(self.buffer, self.position)
  *         )
  *         self.position = 0             # <<<<<<<<<<<<<<
@@ -4151,7 +5092,7 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_20BufferedSocketWri
  */
   __pyx_v_self->__pyx_base.position = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":126
+  /* "bytehouse_driver/bufferedwriter.pyx":205
  *         super(BufferedSocketWriter, self).__init__(bufsize)
  * 
  *     cpdef write_into_stream(self):             # <<<<<<<<<<<<<<
@@ -4176,19 +5117,19 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_20BufferedSocketWri
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("write_into_stream (wrapper)", 0);
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_2write_into_stream(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)__pyx_v_self));
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_2write_into_stream(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_2write_into_stream(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_2write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4197,7 +5138,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWr
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("write_into_stream", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_write_into_stream(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_write_into_stream(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 205, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -4221,19 +5162,19 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWr
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_5__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_5__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_5__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_5__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_4__reduce_cython__(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)__pyx_v_self));
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_4__reduce_cython__(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_4__reduce_cython__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_4__reduce_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self) {
   PyObject *__pyx_v_state = 0;
   PyObject *__pyx_v__dict = 0;
   int __pyx_v_use_setstate;
@@ -4473,19 +5414,19 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWr
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_7__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_7__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_7__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_7__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_6__setstate_cython__(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_6__setstate_cython__(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_6__setstate_cython__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_6__setstate_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4500,7 +5441,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWr
  *     __pyx_unpickle_BufferedSocketWriter__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
  */
   if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
-  __pyx_t_1 = __pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedSocketWriter__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedSocketWriter__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
@@ -4524,7 +5465,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWr
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedwriter.pyx":136
+/* "bytehouse_driver/bufferedwriter.pyx":215
  *     cdef object compressor
  * 
  *     def __init__(self, compressor, bufsize):             # <<<<<<<<<<<<<<
@@ -4533,8 +5474,8 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_20BufferedSocketWr
  */
 
 /* Python wrapper */
-static int __pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static int __pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_compressor = 0;
   PyObject *__pyx_v_bufsize = 0;
   int __pyx_lineno = 0;
@@ -4566,11 +5507,11 @@ static int __pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWrit
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bufsize)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 136, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 215, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 136, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 215, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -4583,20 +5524,20 @@ static int __pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWrit
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 136, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 215, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.CompressedBufferedWriter.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter___init__(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v_self), __pyx_v_compressor, __pyx_v_bufsize);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter___init__(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v_self), __pyx_v_compressor, __pyx_v_bufsize);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static int __pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter___init__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self, PyObject *__pyx_v_compressor, PyObject *__pyx_v_bufsize) {
+static int __pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter___init__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self, PyObject *__pyx_v_compressor, PyObject *__pyx_v_bufsize) {
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4607,7 +5548,7 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWrit
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":137
+  /* "bytehouse_driver/bufferedwriter.pyx":216
  * 
  *     def __init__(self, compressor, bufsize):
  *         self.compressor = compressor             # <<<<<<<<<<<<<<
@@ -4620,25 +5561,25 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWrit
   __Pyx_DECREF(__pyx_v_self->compressor);
   __pyx_v_self->compressor = __pyx_v_compressor;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":138
+  /* "bytehouse_driver/bufferedwriter.pyx":217
  *     def __init__(self, compressor, bufsize):
  *         self.compressor = compressor
  *         super(CompressedBufferedWriter, self).__init__(bufsize)             # <<<<<<<<<<<<<<
  * 
  *     cpdef write_into_stream(self):
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 138, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 217, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(((PyObject *)__pyx_ptype_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter));
-  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter));
-  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter));
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter));
   __Pyx_INCREF(((PyObject *)__pyx_v_self));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
   PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 138, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 217, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 138, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 217, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -4653,12 +5594,12 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWrit
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_bufsize) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_bufsize);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 138, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 217, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":136
+  /* "bytehouse_driver/bufferedwriter.pyx":215
  *     cdef object compressor
  * 
  *     def __init__(self, compressor, bufsize):             # <<<<<<<<<<<<<<
@@ -4680,7 +5621,7 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWrit
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedwriter.pyx":140
+/* "bytehouse_driver/bufferedwriter.pyx":219
  *         super(CompressedBufferedWriter, self).__init__(bufsize)
  * 
  *     cpdef write_into_stream(self):             # <<<<<<<<<<<<<<
@@ -4688,8 +5629,8 @@ static int __pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWrit
  *             PyBytes_FromStringAndSize(self.buffer, self.position)
  */
 
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_write_into_stream(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self, int __pyx_skip_dispatch) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4709,9 +5650,9 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_24CompressedBuffere
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write_into_stream); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write_into_stream); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 219, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_3write_into_stream)) {
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_3write_into_stream)) {
         __Pyx_XDECREF(__pyx_r);
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
@@ -4726,7 +5667,7 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_24CompressedBuffere
         }
         __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 140, __pyx_L1_error)
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 219, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
         __pyx_r = __pyx_t_2;
@@ -4747,24 +5688,24 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_24CompressedBuffere
     #endif
   }
 
-  /* "bytehouse_driver/bufferedwriter.pyx":141
+  /* "bytehouse_driver/bufferedwriter.pyx":220
  * 
  *     cpdef write_into_stream(self):
  *         self.compressor.write(             # <<<<<<<<<<<<<<
  *             PyBytes_FromStringAndSize(self.buffer, self.position)
  *         )
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->compressor, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->compressor, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 220, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":142
+  /* "bytehouse_driver/bufferedwriter.pyx":221
  *     cpdef write_into_stream(self):
  *         self.compressor.write(
  *             PyBytes_FromStringAndSize(self.buffer, self.position)             # <<<<<<<<<<<<<<
  *         )
  *         self.position = 0
  */
-  __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_self->__pyx_base.buffer, __pyx_v_self->__pyx_base.position); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_self->__pyx_base.buffer, __pyx_v_self->__pyx_base.position); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 221, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -4779,12 +5720,12 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_24CompressedBuffere
   __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_4, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 220, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":144
+  /* "bytehouse_driver/bufferedwriter.pyx":223
  *             PyBytes_FromStringAndSize(self.buffer, self.position)
  *         )
  *         self.position = 0             # <<<<<<<<<<<<<<
@@ -4793,7 +5734,7 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_24CompressedBuffere
  */
   __pyx_v_self->__pyx_base.position = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":140
+  /* "bytehouse_driver/bufferedwriter.pyx":219
  *         super(CompressedBufferedWriter, self).__init__(bufsize)
  * 
  *     cpdef write_into_stream(self):             # <<<<<<<<<<<<<<
@@ -4818,19 +5759,19 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter_24CompressedBuffere
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("write_into_stream (wrapper)", 0);
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_2write_into_stream(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v_self));
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_2write_into_stream(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_2write_into_stream(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_2write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4839,7 +5780,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBuffer
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("write_into_stream", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_write_into_stream(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_write_into_stream(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 219, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -4856,27 +5797,28 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBuffer
   return __pyx_r;
 }
 
-/* "bytehouse_driver/bufferedwriter.pyx":146
+/* "bytehouse_driver/bufferedwriter.pyx":225
  *         self.position = 0
  * 
  *     def flush(self):             # <<<<<<<<<<<<<<
  *         self.write_into_stream()
+ * 
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_5flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_5flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_5flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_5flush(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("flush (wrapper)", 0);
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_4flush(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v_self));
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_4flush(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_4flush(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_4flush(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4885,20 +5827,23 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBuffer
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("flush", 0);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":147
+  /* "bytehouse_driver/bufferedwriter.pyx":226
  * 
  *     def flush(self):
  *         self.write_into_stream()             # <<<<<<<<<<<<<<
+ * 
+ * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.write_into_stream(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.write_into_stream(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 226, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":146
+  /* "bytehouse_driver/bufferedwriter.pyx":225
  *         self.position = 0
  * 
  *     def flush(self):             # <<<<<<<<<<<<<<
  *         self.write_into_stream()
+ * 
  */
 
   /* function exit code */
@@ -4921,19 +5866,19 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBuffer
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_7__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_7__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_7__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_7__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_6__reduce_cython__(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v_self));
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_6__reduce_cython__(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_6__reduce_cython__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_6__reduce_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self) {
   PyObject *__pyx_v_state = 0;
   PyObject *__pyx_v__dict = 0;
   int __pyx_v_use_setstate;
@@ -5173,19 +6118,19 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBuffer
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_9__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_9__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_9__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_9__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_8__setstate_cython__(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_8__setstate_cython__(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_8__setstate_cython__(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_8__setstate_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -5194,21 +6139,1211 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBuffer
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
-  /* "(tree fragment)":17
- *         return __pyx_unpickle_CompressedBufferedWriter, (type(self), 0x108d208, state)
- * def __setstate_cython__(self, __pyx_state):
- *     __pyx_unpickle_CompressedBufferedWriter__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_CompressedBufferedWriter, (type(self), 0x108d208, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_CompressedBufferedWriter__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_CompressedBufferedWriter__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_CompressedBufferedWriter, (type(self), 0x108d208, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_CompressedBufferedWriter__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.CompressedBufferedWriter.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bytehouse_driver/bufferedwriter.pyx":232
+ *     cdef object chunks
+ * 
+ *     def __init__(self, bufsize):             # <<<<<<<<<<<<<<
+ *         self.chunks = []
+ *         super(BufferedMemoryWriter, self).__init__(bufsize)
+ */
+
+/* Python wrapper */
+static int __pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_bufsize = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bufsize,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bufsize)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 232, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+    }
+    __pyx_v_bufsize = values[0];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 232, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedMemoryWriter.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter___init__(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *)__pyx_v_self), __pyx_v_bufsize);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter___init__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_v_self, PyObject *__pyx_v_bufsize) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "bytehouse_driver/bufferedwriter.pyx":233
+ * 
+ *     def __init__(self, bufsize):
+ *         self.chunks = []             # <<<<<<<<<<<<<<
+ *         super(BufferedMemoryWriter, self).__init__(bufsize)
+ * 
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->chunks);
+  __Pyx_DECREF(__pyx_v_self->chunks);
+  __pyx_v_self->chunks = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "bytehouse_driver/bufferedwriter.pyx":234
+ *     def __init__(self, bufsize):
+ *         self.chunks = []
+ *         super(BufferedMemoryWriter, self).__init__(bufsize)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef write_into_stream(self):
+ */
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter));
+  __Pyx_GIVEREF(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter));
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_self));
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_super, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_init); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_bufsize) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_bufsize);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "bytehouse_driver/bufferedwriter.pyx":232
+ *     cdef object chunks
+ * 
+ *     def __init__(self, bufsize):             # <<<<<<<<<<<<<<
+ *         self.chunks = []
+ *         super(BufferedMemoryWriter, self).__init__(bufsize)
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedMemoryWriter.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bytehouse_driver/bufferedwriter.pyx":236
+ *         super(BufferedMemoryWriter, self).__init__(bufsize)
+ * 
+ *     cpdef write_into_stream(self):             # <<<<<<<<<<<<<<
+ *         if self.position:
+ *             self.chunks.append(
+ */
+
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_v_self, int __pyx_skip_dispatch) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_into_stream", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write_into_stream); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_3write_into_stream)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 236, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "bytehouse_driver/bufferedwriter.pyx":237
+ * 
+ *     cpdef write_into_stream(self):
+ *         if self.position:             # <<<<<<<<<<<<<<
+ *             self.chunks.append(
+ *                 PyBytes_FromStringAndSize(self.buffer, self.position)
+ */
+  __pyx_t_5 = (__pyx_v_self->__pyx_base.position != 0);
+  if (__pyx_t_5) {
+
+    /* "bytehouse_driver/bufferedwriter.pyx":239
+ *         if self.position:
+ *             self.chunks.append(
+ *                 PyBytes_FromStringAndSize(self.buffer, self.position)             # <<<<<<<<<<<<<<
+ *             )
+ *         self.position = 0
+ */
+    __pyx_t_1 = PyBytes_FromStringAndSize(__pyx_v_self->__pyx_base.buffer, __pyx_v_self->__pyx_base.position); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 239, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+
+    /* "bytehouse_driver/bufferedwriter.pyx":238
+ *     cpdef write_into_stream(self):
+ *         if self.position:
+ *             self.chunks.append(             # <<<<<<<<<<<<<<
+ *                 PyBytes_FromStringAndSize(self.buffer, self.position)
+ *             )
+ */
+    __pyx_t_6 = __Pyx_PyObject_Append(__pyx_v_self->chunks, __pyx_t_1); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 238, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "bytehouse_driver/bufferedwriter.pyx":237
+ * 
+ *     cpdef write_into_stream(self):
+ *         if self.position:             # <<<<<<<<<<<<<<
+ *             self.chunks.append(
+ *                 PyBytes_FromStringAndSize(self.buffer, self.position)
+ */
+  }
+
+  /* "bytehouse_driver/bufferedwriter.pyx":241
+ *                 PyBytes_FromStringAndSize(self.buffer, self.position)
+ *             )
+ *         self.position = 0             # <<<<<<<<<<<<<<
+ * 
+ *     def getvalue(self):
+ */
+  __pyx_v_self->__pyx_base.position = 0;
+
+  /* "bytehouse_driver/bufferedwriter.pyx":236
+ *         super(BufferedMemoryWriter, self).__init__(bufsize)
+ * 
+ *     cpdef write_into_stream(self):             # <<<<<<<<<<<<<<
+ *         if self.position:
+ *             self.chunks.append(
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedMemoryWriter.write_into_stream", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_3write_into_stream(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("write_into_stream (wrapper)", 0);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_2write_into_stream(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_2write_into_stream(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_into_stream", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_write_into_stream(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedMemoryWriter.write_into_stream", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "bytehouse_driver/bufferedwriter.pyx":243
+ *         self.position = 0
+ * 
+ *     def getvalue(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns all written data and empties writer.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_5getvalue(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_4getvalue[] = "\n        Returns all written data and empties writer.\n        ";
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_5getvalue(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("getvalue (wrapper)", 0);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_4getvalue(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_4getvalue(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_v_self) {
+  PyObject *__pyx_v_chunks = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("getvalue", 0);
+
+  /* "bytehouse_driver/bufferedwriter.pyx":247
+ *         Returns all written data and empties writer.
+ *         """
+ *         self.write_into_stream()             # <<<<<<<<<<<<<<
+ * 
+ *         chunks = self.chunks
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.write_into_stream(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v_self), 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "bytehouse_driver/bufferedwriter.pyx":249
+ *         self.write_into_stream()
+ * 
+ *         chunks = self.chunks             # <<<<<<<<<<<<<<
+ *         self.chunks = []
+ *         if len(chunks) == 1:
+ */
+  __pyx_t_1 = __pyx_v_self->chunks;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_chunks = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "bytehouse_driver/bufferedwriter.pyx":250
+ * 
+ *         chunks = self.chunks
+ *         self.chunks = []             # <<<<<<<<<<<<<<
+ *         if len(chunks) == 1:
+ *             return chunks[0]
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->chunks);
+  __Pyx_DECREF(__pyx_v_self->chunks);
+  __pyx_v_self->chunks = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "bytehouse_driver/bufferedwriter.pyx":251
+ *         chunks = self.chunks
+ *         self.chunks = []
+ *         if len(chunks) == 1:             # <<<<<<<<<<<<<<
+ *             return chunks[0]
+ *         return b''.join(chunks)
+ */
+  __pyx_t_2 = PyObject_Length(__pyx_v_chunks); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 251, __pyx_L1_error)
+  __pyx_t_3 = ((__pyx_t_2 == 1) != 0);
+  if (__pyx_t_3) {
+
+    /* "bytehouse_driver/bufferedwriter.pyx":252
+ *         self.chunks = []
+ *         if len(chunks) == 1:
+ *             return chunks[0]             # <<<<<<<<<<<<<<
+ *         return b''.join(chunks)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_chunks, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 252, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "bytehouse_driver/bufferedwriter.pyx":251
+ *         chunks = self.chunks
+ *         self.chunks = []
+ *         if len(chunks) == 1:             # <<<<<<<<<<<<<<
+ *             return chunks[0]
+ *         return b''.join(chunks)
+ */
+  }
+
+  /* "bytehouse_driver/bufferedwriter.pyx":253
+ *         if len(chunks) == 1:
+ *             return chunks[0]
+ *         return b''.join(chunks)             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBytes_Join(__pyx_kp_b__4, __pyx_v_chunks); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "bytehouse_driver/bufferedwriter.pyx":243
+ *         self.position = 0
+ * 
+ *     def getvalue(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Returns all written data and empties writer.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedMemoryWriter.getvalue", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_chunks);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_7__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_7__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_6__reduce_cython__(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_6__reduce_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.buffer, self.buffer_size, self.chunks, self.position)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = __Pyx_PyBytes_FromString(__pyx_v_self->__pyx_base.buffer); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->__pyx_base.buffer_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->__pyx_base.position); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2);
+  __Pyx_INCREF(__pyx_v_self->chunks);
+  __Pyx_GIVEREF(__pyx_v_self->chunks);
+  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_self->chunks);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 3, __pyx_t_3);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.buffer, self.buffer_size, self.chunks, self.position)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_4 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v__dict = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.buffer, self.buffer_size, self.chunks, self.position)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_5 = (__pyx_v__dict != Py_None);
+  __pyx_t_6 = (__pyx_t_5 != 0);
+  if (__pyx_t_6) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v__dict);
+    __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_3));
+    __pyx_t_3 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = self.chunks is not None
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.buffer, self.buffer_size, self.chunks, self.position)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = self.chunks is not None             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_BufferedMemoryWriter, (type(self), 0xf7e75c8, None), state
+ */
+  /*else*/ {
+    __pyx_t_6 = (__pyx_v_self->chunks != Py_None);
+    __pyx_v_use_setstate = __pyx_t_6;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.chunks is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_BufferedMemoryWriter, (type(self), 0xf7e75c8, None), state
+ *     else:
+ */
+  __pyx_t_6 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_6) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = self.chunks is not None
+ *     if use_setstate:
+ *         return __pyx_unpickle_BufferedMemoryWriter, (type(self), 0xf7e75c8, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_BufferedMemoryWriter, (type(self), 0xf7e75c8, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_pyx_unpickle_BufferedMemoryWri); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_259945928);
+    __Pyx_GIVEREF(__pyx_int_259945928);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_int_259945928);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_4, 2, Py_None);
+    __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_4);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_state);
+    __pyx_t_3 = 0;
+    __pyx_t_4 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.chunks is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_BufferedMemoryWriter, (type(self), 0xf7e75c8, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_BufferedMemoryWriter, (type(self), 0xf7e75c8, None), state
+ *     else:
+ *         return __pyx_unpickle_BufferedMemoryWriter, (type(self), 0xf7e75c8, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_BufferedMemoryWriter__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_BufferedMemoryWri); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_259945928);
+    __Pyx_GIVEREF(__pyx_int_259945928);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_int_259945928);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_state);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_4);
+    __pyx_t_2 = 0;
+    __pyx_t_4 = 0;
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedMemoryWriter.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_BufferedMemoryWriter, (type(self), 0xf7e75c8, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_BufferedMemoryWriter__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_9__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_9__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_8__setstate_cython__(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_8__setstate_cython__(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_BufferedMemoryWriter, (type(self), 0xf7e75c8, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_BufferedMemoryWriter__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedMemoryWriter__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_BufferedMemoryWriter, (type(self), 0xf7e75c8, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_BufferedMemoryWriter__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.BufferedMemoryWriter.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_BufferedWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_1__pyx_unpickle_BufferedWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_16bytehouse_driver_14bufferedwriter_1__pyx_unpickle_BufferedWriter = {"__pyx_unpickle_BufferedWriter", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedwriter_1__pyx_unpickle_BufferedWriter, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_1__pyx_unpickle_BufferedWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedWriter (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedWriter", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedWriter", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_BufferedWriter") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedWriter", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedWriter", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x25d1d0c, 0x1c41cb3, 0x253d0cc):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__5, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x25d1d0c, 0x1c41cb3, 0x253d0cc):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
+ *     __pyx_result = BufferedWriter.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0x25d1d0c, 0x1c41cb3, 0x253d0cc):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = BufferedWriter.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x25d1d0c, 0x1c41cb3, 0x253d0cc):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
+ *     __pyx_result = BufferedWriter.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
+ *     __pyx_result = BufferedWriter.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = BufferedWriter.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter__set_state(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
+ *     __pyx_result = BufferedWriter.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_BufferedWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter__set_state(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  char *__pyx_t_2;
+  unsigned PY_LONG_LONG __pyx_t_3;
+  int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedWriter__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_AsWritableString(__pyx_t_1); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->buffer = __pyx_t_2;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_3 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->buffer_size = __pyx_t_3;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_3 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->position = __pyx_t_3;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[3])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 13, __pyx_L1_error)
+  }
+  __pyx_t_5 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_6 = ((__pyx_t_5 > 3) != 0);
+  if (__pyx_t_6) {
+  } else {
+    __pyx_t_4 = __pyx_t_6;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_6 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_7 = (__pyx_t_6 != 0);
+  __pyx_t_4 = __pyx_t_7;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_4) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[3])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_update); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_8 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_10 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_9);
+      if (likely(__pyx_t_10)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_10);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_10, __pyx_t_8) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[3])
  */
-  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
-  __pyx_t_1 = __pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_CompressedBufferedWriter__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
 
-  /* "(tree fragment)":16
- *     else:
- *         return __pyx_unpickle_CompressedBufferedWriter, (type(self), 0x108d208, state)
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_unpickle_CompressedBufferedWriter__set_state(self, __pyx_state)
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
+ *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
  */
 
   /* function exit code */
@@ -5216,8 +7351,11 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBuffer
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.CompressedBufferedWriter.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedWriter__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
@@ -5225,15 +7363,15 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_24CompressedBuffer
 }
 
 /* "(tree fragment)":1
- * def __pyx_unpickle_BufferedWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ * def __pyx_unpickle_BufferedSocketWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_1__pyx_unpickle_BufferedWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_17bytehouse_driver_14bufferedwriter_1__pyx_unpickle_BufferedWriter = {"__pyx_unpickle_BufferedWriter", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_17bytehouse_driver_14bufferedwriter_1__pyx_unpickle_BufferedWriter, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_1__pyx_unpickle_BufferedWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_3__pyx_unpickle_BufferedSocketWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_16bytehouse_driver_14bufferedwriter_3__pyx_unpickle_BufferedSocketWriter = {"__pyx_unpickle_BufferedSocketWriter", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedwriter_3__pyx_unpickle_BufferedSocketWriter, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_3__pyx_unpickle_BufferedSocketWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v___pyx_type = 0;
   long __pyx_v___pyx_checksum;
   PyObject *__pyx_v___pyx_state = 0;
@@ -5242,7 +7380,7 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_1__pyx_unpickle_Bu
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedWriter (wrapper)", 0);
+  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedSocketWriter (wrapper)", 0);
   {
     static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
     PyObject* values[3] = {0,0,0};
@@ -5268,17 +7406,17 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_1__pyx_unpickle_Bu
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedWriter", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedSocketWriter", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedWriter", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedSocketWriter", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_BufferedWriter") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_BufferedSocketWriter") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -5293,20 +7431,20 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_1__pyx_unpickle_Bu
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedWriter", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedSocketWriter", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedSocketWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_2__pyx_unpickle_BufferedSocketWriter(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_2__pyx_unpickle_BufferedSocketWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_v___pyx_PickleError = 0;
   PyObject *__pyx_v___pyx_result = 0;
   PyObject *__pyx_r = NULL;
@@ -5320,28 +7458,28 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buf
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedWriter", 0);
+  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedSocketWriter", 0);
 
   /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x25d1d0c, 0x1c41cb3, 0x253d0cc):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0x3baf4af, 0xca06ecf, 0x4e3cebf):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)
  */
   __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__2, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__6, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
     /* "(tree fragment)":5
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x25d1d0c, 0x1c41cb3, 0x253d0cc):
+ *     if __pyx_checksum not in (0x3baf4af, 0xca06ecf, 0x4e3cebf):
  *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
- *     __pyx_result = BufferedWriter.__new__(__pyx_type)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)
+ *     __pyx_result = BufferedSocketWriter.__new__(__pyx_type)
  */
     __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
@@ -5359,15 +7497,15 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buf
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":6
- *     if __pyx_checksum not in (0x25d1d0c, 0x1c41cb3, 0x253d0cc):
+ *     if __pyx_checksum not in (0x3baf4af, 0xca06ecf, 0x4e3cebf):
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)             # <<<<<<<<<<<<<<
- *     __pyx_result = BufferedWriter.__new__(__pyx_type)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = BufferedSocketWriter.__new__(__pyx_type)
  *     if __pyx_state is not None:
  */
     __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_2, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_INCREF(__pyx_v___pyx_PickleError);
@@ -5394,20 +7532,20 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buf
     /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x25d1d0c, 0x1c41cb3, 0x253d0cc):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0x3baf4af, 0xca06ecf, 0x4e3cebf):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)
  */
   }
 
   /* "(tree fragment)":7
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
- *     __pyx_result = BufferedWriter.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)
+ *     __pyx_result = BufferedSocketWriter.__new__(__pyx_type)             # <<<<<<<<<<<<<<
  *     if __pyx_state is not None:
- *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_5 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
@@ -5428,10 +7566,10 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buf
   __pyx_t_4 = 0;
 
   /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
- *     __pyx_result = BufferedWriter.__new__(__pyx_type)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)
+ *     __pyx_result = BufferedSocketWriter.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)
  *     return __pyx_result
  */
   __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
@@ -5439,32 +7577,32 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buf
   if (__pyx_t_2) {
 
     /* "(tree fragment)":9
- *     __pyx_result = BufferedWriter.__new__(__pyx_type)
+ *     __pyx_result = BufferedSocketWriter.__new__(__pyx_type)
  *     if __pyx_state is not None:
- *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
  *     return __pyx_result
- * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):
+ * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):
  */
     if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
-    __pyx_t_4 = __pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter__set_state(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedSocketWriter__set_state(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
- *     __pyx_result = BufferedWriter.__new__(__pyx_type)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)
+ *     __pyx_result = BufferedSocketWriter.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)
  *     return __pyx_result
  */
   }
 
   /* "(tree fragment)":10
  *     if __pyx_state is not None:
- *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)
  *     return __pyx_result             # <<<<<<<<<<<<<<
- * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
+ * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v___pyx_result);
@@ -5472,7 +7610,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buf
   goto __pyx_L0;
 
   /* "(tree fragment)":1
- * def __pyx_unpickle_BufferedWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ * def __pyx_unpickle_BufferedSocketWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
@@ -5483,7 +7621,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buf
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedSocketWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v___pyx_PickleError);
@@ -5494,14 +7632,14 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buf
 }
 
 /* "(tree fragment)":11
- *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)
  *     return __pyx_result
- * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
- *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
  */
 
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedWriter__set_state(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedSocketWriter__set_state(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -5517,14 +7655,14 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedWriter__set_state", 0);
+  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedSocketWriter__set_state", 0);
 
   /* "(tree fragment)":12
  *     return __pyx_result
- * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]             # <<<<<<<<<<<<<<
- *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
- *         __pyx_result.__dict__.update(__pyx_state[3])
+ * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[4])
  */
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
@@ -5533,7 +7671,7 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
   __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = __Pyx_PyObject_AsWritableString(__pyx_t_1); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
-  __pyx_v___pyx_result->buffer = __pyx_t_2;
+  __pyx_v___pyx_result->__pyx_base.buffer = __pyx_t_2;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
@@ -5543,7 +7681,7 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_3 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_3 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v___pyx_result->buffer_size = __pyx_t_3;
+  __pyx_v___pyx_result->__pyx_base.buffer_size = __pyx_t_3;
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
     __PYX_ERR(1, 12, __pyx_L1_error)
@@ -5552,20 +7690,31 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_3 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_3 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v___pyx_result->position = __pyx_t_3;
+  __pyx_v___pyx_result->__pyx_base.position = __pyx_t_3;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->sock);
+  __Pyx_DECREF(__pyx_v___pyx_result->sock);
+  __pyx_v___pyx_result->sock = __pyx_t_1;
+  __pyx_t_1 = 0;
 
   /* "(tree fragment)":13
- * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
- *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
- *         __pyx_result.__dict__.update(__pyx_state[3])
+ * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[4])
  */
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
     __PYX_ERR(1, 13, __pyx_L1_error)
   }
   __pyx_t_5 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
-  __pyx_t_6 = ((__pyx_t_5 > 3) != 0);
+  __pyx_t_6 = ((__pyx_t_5 > 4) != 0);
   if (__pyx_t_6) {
   } else {
     __pyx_t_4 = __pyx_t_6;
@@ -5578,9 +7727,9 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
   if (__pyx_t_4) {
 
     /* "(tree fragment)":14
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
- *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
- *         __pyx_result.__dict__.update(__pyx_state[3])             # <<<<<<<<<<<<<<
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[4])             # <<<<<<<<<<<<<<
  */
     __pyx_t_8 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
@@ -5591,7 +7740,7 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
       __PYX_ERR(1, 14, __pyx_L1_error)
     }
-    __pyx_t_8 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __pyx_t_8 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 4, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
     __pyx_t_10 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
@@ -5612,19 +7761,19 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
     /* "(tree fragment)":13
- * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
- *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
- *         __pyx_result.__dict__.update(__pyx_state[3])
+ * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[4])
  */
   }
 
   /* "(tree fragment)":11
- *         __pyx_unpickle_BufferedWriter__set_state(<BufferedWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)
  *     return __pyx_result
- * cdef __pyx_unpickle_BufferedWriter__set_state(BufferedWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
- *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
+ * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
  */
 
   /* function exit code */
@@ -5635,7 +7784,7 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
   __Pyx_XDECREF(__pyx_t_8);
   __Pyx_XDECREF(__pyx_t_9);
   __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedWriter__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedSocketWriter__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5644,15 +7793,15 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
 }
 
 /* "(tree fragment)":1
- * def __pyx_unpickle_BufferedSocketWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ * def __pyx_unpickle_CompressedBufferedWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_3__pyx_unpickle_BufferedSocketWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_17bytehouse_driver_14bufferedwriter_3__pyx_unpickle_BufferedSocketWriter = {"__pyx_unpickle_BufferedSocketWriter", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_17bytehouse_driver_14bufferedwriter_3__pyx_unpickle_BufferedSocketWriter, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_3__pyx_unpickle_BufferedSocketWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_5__pyx_unpickle_CompressedBufferedWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_16bytehouse_driver_14bufferedwriter_5__pyx_unpickle_CompressedBufferedWriter = {"__pyx_unpickle_CompressedBufferedWriter", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedwriter_5__pyx_unpickle_CompressedBufferedWriter, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_5__pyx_unpickle_CompressedBufferedWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v___pyx_type = 0;
   long __pyx_v___pyx_checksum;
   PyObject *__pyx_v___pyx_state = 0;
@@ -5661,7 +7810,7 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_3__pyx_unpickle_Bu
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedSocketWriter (wrapper)", 0);
+  __Pyx_RefNannySetupContext("__pyx_unpickle_CompressedBufferedWriter (wrapper)", 0);
   {
     static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
     PyObject* values[3] = {0,0,0};
@@ -5687,17 +7836,17 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_3__pyx_unpickle_Bu
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedSocketWriter", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_CompressedBufferedWriter", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedSocketWriter", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_CompressedBufferedWriter", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_BufferedSocketWriter") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_CompressedBufferedWriter") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -5712,20 +7861,20 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_3__pyx_unpickle_Bu
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedSocketWriter", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_CompressedBufferedWriter", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedSocketWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_CompressedBufferedWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_2__pyx_unpickle_BufferedSocketWriter(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_4__pyx_unpickle_CompressedBufferedWriter(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_2__pyx_unpickle_BufferedSocketWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_4__pyx_unpickle_CompressedBufferedWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_v___pyx_PickleError = 0;
   PyObject *__pyx_v___pyx_result = 0;
   PyObject *__pyx_r = NULL;
@@ -5739,28 +7888,28 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_2__pyx_unpickle_Bu
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedSocketWriter", 0);
+  __Pyx_RefNannySetupContext("__pyx_unpickle_CompressedBufferedWriter", 0);
 
   /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x3baf4af, 0xca06ecf, 0x4e3cebf):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0x108d208, 0x835ced9, 0x96f6a9b):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)
  */
   __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__3, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__7, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
     /* "(tree fragment)":5
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x3baf4af, 0xca06ecf, 0x4e3cebf):
+ *     if __pyx_checksum not in (0x108d208, 0x835ced9, 0x96f6a9b):
  *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)
- *     __pyx_result = BufferedSocketWriter.__new__(__pyx_type)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)
+ *     __pyx_result = CompressedBufferedWriter.__new__(__pyx_type)
  */
     __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
@@ -5778,15 +7927,15 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_2__pyx_unpickle_Bu
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":6
- *     if __pyx_checksum not in (0x3baf4af, 0xca06ecf, 0x4e3cebf):
+ *     if __pyx_checksum not in (0x108d208, 0x835ced9, 0x96f6a9b):
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)             # <<<<<<<<<<<<<<
- *     __pyx_result = BufferedSocketWriter.__new__(__pyx_type)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = CompressedBufferedWriter.__new__(__pyx_type)
  *     if __pyx_state is not None:
  */
     __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_2, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_3, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_INCREF(__pyx_v___pyx_PickleError);
@@ -5813,20 +7962,20 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_2__pyx_unpickle_Bu
     /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x3baf4af, 0xca06ecf, 0x4e3cebf):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0x108d208, 0x835ced9, 0x96f6a9b):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)
  */
   }
 
   /* "(tree fragment)":7
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)
- *     __pyx_result = BufferedSocketWriter.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)
+ *     __pyx_result = CompressedBufferedWriter.__new__(__pyx_type)             # <<<<<<<<<<<<<<
  *     if __pyx_state is not None:
- *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_5 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
@@ -5847,10 +7996,10 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_2__pyx_unpickle_Bu
   __pyx_t_4 = 0;
 
   /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)
- *     __pyx_result = BufferedSocketWriter.__new__(__pyx_type)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)
+ *     __pyx_result = CompressedBufferedWriter.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)
  *     return __pyx_result
  */
   __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
@@ -5858,32 +8007,32 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_2__pyx_unpickle_Bu
   if (__pyx_t_2) {
 
     /* "(tree fragment)":9
- *     __pyx_result = BufferedSocketWriter.__new__(__pyx_type)
+ *     __pyx_result = CompressedBufferedWriter.__new__(__pyx_type)
  *     if __pyx_state is not None:
- *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
  *     return __pyx_result
- * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):
+ * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):
  */
     if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
-    __pyx_t_4 = __pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedSocketWriter__set_state(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_CompressedBufferedWriter__set_state(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x3baf4af, 0xca06ecf, 0x4e3cebf) = (buffer, buffer_size, position, sock))" % __pyx_checksum)
- *     __pyx_result = BufferedSocketWriter.__new__(__pyx_type)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)
+ *     __pyx_result = CompressedBufferedWriter.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)
  *     return __pyx_result
  */
   }
 
   /* "(tree fragment)":10
  *     if __pyx_state is not None:
- *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)
  *     return __pyx_result             # <<<<<<<<<<<<<<
- * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
+ * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v___pyx_result);
@@ -5891,7 +8040,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_2__pyx_unpickle_Bu
   goto __pyx_L0;
 
   /* "(tree fragment)":1
- * def __pyx_unpickle_BufferedSocketWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ * def __pyx_unpickle_CompressedBufferedWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
@@ -5902,7 +8051,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_2__pyx_unpickle_Bu
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedSocketWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_CompressedBufferedWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v___pyx_PickleError);
@@ -5913,14 +8062,14 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_2__pyx_unpickle_Bu
 }
 
 /* "(tree fragment)":11
- *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)
  *     return __pyx_result
- * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
+ * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
  *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
  */
 
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedSocketWriter__set_state(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_CompressedBufferedWriter__set_state(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -5936,12 +8085,12 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedSocketWriter__set_state", 0);
+  __Pyx_RefNannySetupContext("__pyx_unpickle_CompressedBufferedWriter__set_state", 0);
 
   /* "(tree fragment)":12
  *     return __pyx_result
- * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]             # <<<<<<<<<<<<<<
  *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
  *         __pyx_result.__dict__.update(__pyx_state[4])
  */
@@ -5969,24 +8118,24 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
   }
   __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_3 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v___pyx_result->__pyx_base.position = __pyx_t_3;
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->compressor);
+  __Pyx_DECREF(__pyx_v___pyx_result->compressor);
+  __pyx_v___pyx_result->compressor = __pyx_t_1;
+  __pyx_t_1 = 0;
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
     __PYX_ERR(1, 12, __pyx_L1_error)
   }
   __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF(__pyx_v___pyx_result->sock);
-  __Pyx_DECREF(__pyx_v___pyx_result->sock);
-  __pyx_v___pyx_result->sock = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_3 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->__pyx_base.position = __pyx_t_3;
 
   /* "(tree fragment)":13
- * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
+ * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
  *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
  *         __pyx_result.__dict__.update(__pyx_state[4])
  */
@@ -6008,7 +8157,7 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
   if (__pyx_t_4) {
 
     /* "(tree fragment)":14
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
  *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
  *         __pyx_result.__dict__.update(__pyx_state[4])             # <<<<<<<<<<<<<<
  */
@@ -6042,18 +8191,18 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
     /* "(tree fragment)":13
- * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
+ * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
  *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
  *         __pyx_result.__dict__.update(__pyx_state[4])
  */
   }
 
   /* "(tree fragment)":11
- *         __pyx_unpickle_BufferedSocketWriter__set_state(<BufferedSocketWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)
  *     return __pyx_result
- * cdef __pyx_unpickle_BufferedSocketWriter__set_state(BufferedSocketWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]; __pyx_result.sock = __pyx_state[3]
+ * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
  *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
  */
 
@@ -6065,7 +8214,7 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
   __Pyx_XDECREF(__pyx_t_8);
   __Pyx_XDECREF(__pyx_t_9);
   __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedSocketWriter__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_CompressedBufferedWriter__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -6074,15 +8223,15 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Buff
 }
 
 /* "(tree fragment)":1
- * def __pyx_unpickle_CompressedBufferedWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ * def __pyx_unpickle_BufferedMemoryWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_5__pyx_unpickle_CompressedBufferedWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_17bytehouse_driver_14bufferedwriter_5__pyx_unpickle_CompressedBufferedWriter = {"__pyx_unpickle_CompressedBufferedWriter", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_17bytehouse_driver_14bufferedwriter_5__pyx_unpickle_CompressedBufferedWriter, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_5__pyx_unpickle_CompressedBufferedWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_7__pyx_unpickle_BufferedMemoryWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_16bytehouse_driver_14bufferedwriter_7__pyx_unpickle_BufferedMemoryWriter = {"__pyx_unpickle_BufferedMemoryWriter", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedwriter_7__pyx_unpickle_BufferedMemoryWriter, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_16bytehouse_driver_14bufferedwriter_7__pyx_unpickle_BufferedMemoryWriter(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v___pyx_type = 0;
   long __pyx_v___pyx_checksum;
   PyObject *__pyx_v___pyx_state = 0;
@@ -6091,7 +8240,7 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_5__pyx_unpickle_Co
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__pyx_unpickle_CompressedBufferedWriter (wrapper)", 0);
+  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedMemoryWriter (wrapper)", 0);
   {
     static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
     PyObject* values[3] = {0,0,0};
@@ -6117,17 +8266,17 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_5__pyx_unpickle_Co
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_CompressedBufferedWriter", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedMemoryWriter", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_CompressedBufferedWriter", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedMemoryWriter", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_CompressedBufferedWriter") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_BufferedMemoryWriter") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -6142,20 +8291,20 @@ static PyObject *__pyx_pw_17bytehouse_driver_14bufferedwriter_5__pyx_unpickle_Co
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_CompressedBufferedWriter", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_BufferedMemoryWriter", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_CompressedBufferedWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedMemoryWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_17bytehouse_driver_14bufferedwriter_4__pyx_unpickle_CompressedBufferedWriter(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+  __pyx_r = __pyx_pf_16bytehouse_driver_14bufferedwriter_6__pyx_unpickle_BufferedMemoryWriter(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_4__pyx_unpickle_CompressedBufferedWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_16bytehouse_driver_14bufferedwriter_6__pyx_unpickle_BufferedMemoryWriter(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_v___pyx_PickleError = 0;
   PyObject *__pyx_v___pyx_result = 0;
   PyObject *__pyx_r = NULL;
@@ -6169,28 +8318,28 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_4__pyx_unpickle_Co
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_CompressedBufferedWriter", 0);
+  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedMemoryWriter", 0);
 
   /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x108d208, 0x835ced9, 0x96f6a9b):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0xf7e75c8, 0x9c0f39e, 0x730af0a):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xf7e75c8, 0x9c0f39e, 0x730af0a) = (buffer, buffer_size, chunks, position))" % __pyx_checksum)
  */
   __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__4, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__8, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
     /* "(tree fragment)":5
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x108d208, 0x835ced9, 0x96f6a9b):
+ *     if __pyx_checksum not in (0xf7e75c8, 0x9c0f39e, 0x730af0a):
  *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)
- *     __pyx_result = CompressedBufferedWriter.__new__(__pyx_type)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xf7e75c8, 0x9c0f39e, 0x730af0a) = (buffer, buffer_size, chunks, position))" % __pyx_checksum)
+ *     __pyx_result = BufferedMemoryWriter.__new__(__pyx_type)
  */
     __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
@@ -6208,15 +8357,15 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_4__pyx_unpickle_Co
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":6
- *     if __pyx_checksum not in (0x108d208, 0x835ced9, 0x96f6a9b):
+ *     if __pyx_checksum not in (0xf7e75c8, 0x9c0f39e, 0x730af0a):
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)             # <<<<<<<<<<<<<<
- *     __pyx_result = CompressedBufferedWriter.__new__(__pyx_type)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xf7e75c8, 0x9c0f39e, 0x730af0a) = (buffer, buffer_size, chunks, position))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = BufferedMemoryWriter.__new__(__pyx_type)
  *     if __pyx_state is not None:
  */
     __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_3, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_4, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_INCREF(__pyx_v___pyx_PickleError);
@@ -6243,20 +8392,20 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_4__pyx_unpickle_Co
     /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x108d208, 0x835ced9, 0x96f6a9b):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0xf7e75c8, 0x9c0f39e, 0x730af0a):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xf7e75c8, 0x9c0f39e, 0x730af0a) = (buffer, buffer_size, chunks, position))" % __pyx_checksum)
  */
   }
 
   /* "(tree fragment)":7
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)
- *     __pyx_result = CompressedBufferedWriter.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xf7e75c8, 0x9c0f39e, 0x730af0a) = (buffer, buffer_size, chunks, position))" % __pyx_checksum)
+ *     __pyx_result = BufferedMemoryWriter.__new__(__pyx_type)             # <<<<<<<<<<<<<<
  *     if __pyx_state is not None:
- *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_BufferedMemoryWriter__set_state(<BufferedMemoryWriter> __pyx_result, __pyx_state)
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_5 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
@@ -6277,10 +8426,10 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_4__pyx_unpickle_Co
   __pyx_t_4 = 0;
 
   /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)
- *     __pyx_result = CompressedBufferedWriter.__new__(__pyx_type)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xf7e75c8, 0x9c0f39e, 0x730af0a) = (buffer, buffer_size, chunks, position))" % __pyx_checksum)
+ *     __pyx_result = BufferedMemoryWriter.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_BufferedMemoryWriter__set_state(<BufferedMemoryWriter> __pyx_result, __pyx_state)
  *     return __pyx_result
  */
   __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
@@ -6288,32 +8437,32 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_4__pyx_unpickle_Co
   if (__pyx_t_2) {
 
     /* "(tree fragment)":9
- *     __pyx_result = CompressedBufferedWriter.__new__(__pyx_type)
+ *     __pyx_result = BufferedMemoryWriter.__new__(__pyx_type)
  *     if __pyx_state is not None:
- *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_BufferedMemoryWriter__set_state(<BufferedMemoryWriter> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
  *     return __pyx_result
- * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):
+ * cdef __pyx_unpickle_BufferedMemoryWriter__set_state(BufferedMemoryWriter __pyx_result, tuple __pyx_state):
  */
     if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
-    __pyx_t_4 = __pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_CompressedBufferedWriter__set_state(((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedMemoryWriter__set_state(((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
     /* "(tree fragment)":8
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x108d208, 0x835ced9, 0x96f6a9b) = (buffer, buffer_size, compressor, position))" % __pyx_checksum)
- *     __pyx_result = CompressedBufferedWriter.__new__(__pyx_type)
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0xf7e75c8, 0x9c0f39e, 0x730af0a) = (buffer, buffer_size, chunks, position))" % __pyx_checksum)
+ *     __pyx_result = BufferedMemoryWriter.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_BufferedMemoryWriter__set_state(<BufferedMemoryWriter> __pyx_result, __pyx_state)
  *     return __pyx_result
  */
   }
 
   /* "(tree fragment)":10
  *     if __pyx_state is not None:
- *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_BufferedMemoryWriter__set_state(<BufferedMemoryWriter> __pyx_result, __pyx_state)
  *     return __pyx_result             # <<<<<<<<<<<<<<
- * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
+ * cdef __pyx_unpickle_BufferedMemoryWriter__set_state(BufferedMemoryWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.chunks = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v___pyx_result);
@@ -6321,7 +8470,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_4__pyx_unpickle_Co
   goto __pyx_L0;
 
   /* "(tree fragment)":1
- * def __pyx_unpickle_CompressedBufferedWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ * def __pyx_unpickle_BufferedMemoryWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
@@ -6332,7 +8481,7 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_4__pyx_unpickle_Co
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_CompressedBufferedWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedMemoryWriter", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v___pyx_PickleError);
@@ -6343,14 +8492,14 @@ static PyObject *__pyx_pf_17bytehouse_driver_14bufferedwriter_4__pyx_unpickle_Co
 }
 
 /* "(tree fragment)":11
- *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_BufferedMemoryWriter__set_state(<BufferedMemoryWriter> __pyx_result, __pyx_state)
  *     return __pyx_result
- * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
+ * cdef __pyx_unpickle_BufferedMemoryWriter__set_state(BufferedMemoryWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.chunks = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
  *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
  */
 
-static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_CompressedBufferedWriter__set_state(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_f_16bytehouse_driver_14bufferedwriter___pyx_unpickle_BufferedMemoryWriter__set_state(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -6366,12 +8515,12 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Comp
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_CompressedBufferedWriter__set_state", 0);
+  __Pyx_RefNannySetupContext("__pyx_unpickle_BufferedMemoryWriter__set_state", 0);
 
   /* "(tree fragment)":12
  *     return __pyx_result
- * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_BufferedMemoryWriter__set_state(BufferedMemoryWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.chunks = __pyx_state[2]; __pyx_result.position = __pyx_state[3]             # <<<<<<<<<<<<<<
  *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
  *         __pyx_result.__dict__.update(__pyx_state[4])
  */
@@ -6400,9 +8549,9 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Comp
   __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF(__pyx_v___pyx_result->compressor);
-  __Pyx_DECREF(__pyx_v___pyx_result->compressor);
-  __pyx_v___pyx_result->compressor = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_v___pyx_result->chunks);
+  __Pyx_DECREF(__pyx_v___pyx_result->chunks);
+  __pyx_v___pyx_result->chunks = __pyx_t_1;
   __pyx_t_1 = 0;
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
@@ -6415,8 +8564,8 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Comp
   __pyx_v___pyx_result->__pyx_base.position = __pyx_t_3;
 
   /* "(tree fragment)":13
- * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
+ * cdef __pyx_unpickle_BufferedMemoryWriter__set_state(BufferedMemoryWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.chunks = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
  *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
  *         __pyx_result.__dict__.update(__pyx_state[4])
  */
@@ -6438,7 +8587,7 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Comp
   if (__pyx_t_4) {
 
     /* "(tree fragment)":14
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.chunks = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
  *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
  *         __pyx_result.__dict__.update(__pyx_state[4])             # <<<<<<<<<<<<<<
  */
@@ -6472,18 +8621,18 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Comp
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
     /* "(tree fragment)":13
- * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
+ * cdef __pyx_unpickle_BufferedMemoryWriter__set_state(BufferedMemoryWriter __pyx_result, tuple __pyx_state):
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.chunks = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
  *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
  *         __pyx_result.__dict__.update(__pyx_state[4])
  */
   }
 
   /* "(tree fragment)":11
- *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)
+ *         __pyx_unpickle_BufferedMemoryWriter__set_state(<BufferedMemoryWriter> __pyx_result, __pyx_state)
  *     return __pyx_result
- * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
+ * cdef __pyx_unpickle_BufferedMemoryWriter__set_state(BufferedMemoryWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.chunks = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
  *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
  */
 
@@ -6495,17 +8644,17 @@ static PyObject *__pyx_f_17bytehouse_driver_14bufferedwriter___pyx_unpickle_Comp
   __Pyx_XDECREF(__pyx_t_8);
   __Pyx_XDECREF(__pyx_t_9);
   __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_CompressedBufferedWriter__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("bytehouse_driver.bufferedwriter.__pyx_unpickle_BufferedMemoryWriter__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
-static struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter __pyx_vtable_17bytehouse_driver_14bufferedwriter_BufferedWriter;
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter __pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedWriter;
 
-static PyObject *__pyx_tp_new_17bytehouse_driver_14bufferedwriter_BufferedWriter(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *p;
+static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedwriter_BufferedWriter(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *p;
   PyObject *o;
   if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
     o = (*t->tp_alloc)(t, 0);
@@ -6513,12 +8662,12 @@ static PyObject *__pyx_tp_new_17bytehouse_driver_14bufferedwriter_BufferedWriter
     o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
   }
   if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *)o);
-  p->__pyx_vtab = __pyx_vtabptr_17bytehouse_driver_14bufferedwriter_BufferedWriter;
+  p = ((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *)o);
+  p->__pyx_vtab = __pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedWriter;
   return o;
 }
 
-static void __pyx_tp_dealloc_17bytehouse_driver_14bufferedwriter_BufferedWriter(PyObject *o) {
+static void __pyx_tp_dealloc_16bytehouse_driver_14bufferedwriter_BufferedWriter(PyObject *o) {
   #if CYTHON_USE_TP_FINALIZE
   if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
@@ -6528,31 +8677,32 @@ static void __pyx_tp_dealloc_17bytehouse_driver_14bufferedwriter_BufferedWriter(
     PyObject *etype, *eval, *etb;
     PyErr_Fetch(&etype, &eval, &etb);
     __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
-    __pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_3__dealloc__(o);
+    __pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_3__dealloc__(o);
     __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
     PyErr_Restore(etype, eval, etb);
   }
   (*Py_TYPE(o)->tp_free)(o);
 }
 
-static PyMethodDef __pyx_methods_17bytehouse_driver_14bufferedwriter_BufferedWriter[] = {
-  {"write_into_stream", (PyCFunction)__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_5write_into_stream, METH_NOARGS, 0},
-  {"write", (PyCFunction)__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_7write, METH_O, 0},
-  {"flush", (PyCFunction)__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_9flush, METH_NOARGS, 0},
-  {"write_strings", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_11write_strings, METH_VARARGS|METH_KEYWORDS, 0},
-  {"write_fixed_strings_as_bytes", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_13write_fixed_strings_as_bytes, METH_VARARGS|METH_KEYWORDS, 0},
-  {"write_fixed_strings", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_15write_fixed_strings, METH_VARARGS|METH_KEYWORDS, 0},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_17__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_19__setstate_cython__, METH_O, 0},
+static PyMethodDef __pyx_methods_16bytehouse_driver_14bufferedwriter_BufferedWriter[] = {
+  {"write_into_stream", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_5write_into_stream, METH_NOARGS, 0},
+  {"write", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_7write, METH_O, __pyx_doc_16bytehouse_driver_14bufferedwriter_14BufferedWriter_6write},
+  {"flush", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_9flush, METH_NOARGS, 0},
+  {"write_strings", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_11write_strings, METH_VARARGS|METH_KEYWORDS, 0},
+  {"write_string_buffers", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_13write_string_buffers, METH_VARARGS|METH_KEYWORDS, __pyx_doc_16bytehouse_driver_14bufferedwriter_14BufferedWriter_12write_string_buffers},
+  {"write_fixed_strings_as_bytes", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_15write_fixed_strings_as_bytes, METH_VARARGS|METH_KEYWORDS, 0},
+  {"write_fixed_strings", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_17write_fixed_strings, METH_VARARGS|METH_KEYWORDS, 0},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_19__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_21__setstate_cython__, METH_O, 0},
   {0, 0, 0, 0}
 };
 
-static PyTypeObject __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedWriter = {
+static PyTypeObject __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedWriter = {
   PyVarObject_HEAD_INIT(0, 0)
   "bytehouse_driver.bufferedwriter.BufferedWriter", /*tp_name*/
-  sizeof(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter), /*tp_basicsize*/
+  sizeof(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_17bytehouse_driver_14bufferedwriter_BufferedWriter, /*tp_dealloc*/
+  __pyx_tp_dealloc_16bytehouse_driver_14bufferedwriter_BufferedWriter, /*tp_dealloc*/
   #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
   #endif
@@ -6585,7 +8735,7 @@ static PyTypeObject __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedWrite
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
   0, /*tp_iternext*/
-  __pyx_methods_17bytehouse_driver_14bufferedwriter_BufferedWriter, /*tp_methods*/
+  __pyx_methods_16bytehouse_driver_14bufferedwriter_BufferedWriter, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
@@ -6593,9 +8743,9 @@ static PyTypeObject __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedWrite
   0, /*tp_descr_get*/
   0, /*tp_descr_set*/
   0, /*tp_dictoffset*/
-  __pyx_pw_17bytehouse_driver_14bufferedwriter_14BufferedWriter_1__init__, /*tp_init*/
+  __pyx_pw_16bytehouse_driver_14bufferedwriter_14BufferedWriter_1__init__, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_17bytehouse_driver_14bufferedwriter_BufferedWriter, /*tp_new*/
+  __pyx_tp_new_16bytehouse_driver_14bufferedwriter_BufferedWriter, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -6618,20 +8768,20 @@ static PyTypeObject __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedWrite
   0, /*tp_pypy_flags*/
   #endif
 };
-static struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter __pyx_vtable_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter;
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter __pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter;
 
-static PyObject *__pyx_tp_new_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *p;
-  PyObject *o = __pyx_tp_new_17bytehouse_driver_14bufferedwriter_BufferedWriter(t, a, k);
+static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *p;
+  PyObject *o = __pyx_tp_new_16bytehouse_driver_14bufferedwriter_BufferedWriter(t, a, k);
   if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)o);
-  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter*)__pyx_vtabptr_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter;
+  p = ((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter*)__pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter;
   p->sock = Py_None; Py_INCREF(Py_None);
   return o;
 }
 
-static void __pyx_tp_dealloc_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter(PyObject *o) {
-  struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *p = (struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)o;
+static void __pyx_tp_dealloc_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter(PyObject *o) {
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *p = (struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)o;
   #if CYTHON_USE_TP_FINALIZE
   if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
@@ -6643,42 +8793,42 @@ static void __pyx_tp_dealloc_17bytehouse_driver_14bufferedwriter_BufferedSocketW
   if (PyType_IS_GC(Py_TYPE(o)->tp_base))
   #endif
   PyObject_GC_Track(o);
-  __pyx_tp_dealloc_17bytehouse_driver_14bufferedwriter_BufferedWriter(o);
+  __pyx_tp_dealloc_16bytehouse_driver_14bufferedwriter_BufferedWriter(o);
 }
 
-static int __pyx_tp_traverse_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter(PyObject *o, visitproc v, void *a) {
+static int __pyx_tp_traverse_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter(PyObject *o, visitproc v, void *a) {
   int e;
-  struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *p = (struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)o;
-  e = ((likely(__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter)) ? ((__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter->tp_traverse) ? __pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter->tp_traverse(o, v, a) : 0) : __Pyx_call_next_tp_traverse(o, v, a, __pyx_tp_traverse_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter)); if (e) return e;
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *p = (struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)o;
+  e = ((likely(__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter)) ? ((__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter->tp_traverse) ? __pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter->tp_traverse(o, v, a) : 0) : __Pyx_call_next_tp_traverse(o, v, a, __pyx_tp_traverse_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter)); if (e) return e;
   if (p->sock) {
     e = (*v)(p->sock, a); if (e) return e;
   }
   return 0;
 }
 
-static int __pyx_tp_clear_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter(PyObject *o) {
+static int __pyx_tp_clear_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter(PyObject *o) {
   PyObject* tmp;
-  struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *p = (struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)o;
-  if (likely(__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter)) { if (__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter->tp_clear) __pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter->tp_clear(o); } else __Pyx_call_next_tp_clear(o, __pyx_tp_clear_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter);
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *p = (struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter *)o;
+  if (likely(__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter)) { if (__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter->tp_clear) __pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter->tp_clear(o); } else __Pyx_call_next_tp_clear(o, __pyx_tp_clear_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter);
   tmp = ((PyObject*)p->sock);
   p->sock = Py_None; Py_INCREF(Py_None);
   Py_XDECREF(tmp);
   return 0;
 }
 
-static PyMethodDef __pyx_methods_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter[] = {
-  {"write_into_stream", (PyCFunction)__pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_3write_into_stream, METH_NOARGS, 0},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_5__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_7__setstate_cython__, METH_O, 0},
+static PyMethodDef __pyx_methods_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter[] = {
+  {"write_into_stream", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_3write_into_stream, METH_NOARGS, 0},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_5__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_7__setstate_cython__, METH_O, 0},
   {0, 0, 0, 0}
 };
 
-static PyTypeObject __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter = {
+static PyTypeObject __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter = {
   PyVarObject_HEAD_INIT(0, 0)
   "bytehouse_driver.bufferedwriter.BufferedSocketWriter", /*tp_name*/
-  sizeof(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter), /*tp_basicsize*/
+  sizeof(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter, /*tp_dealloc*/
+  __pyx_tp_dealloc_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter, /*tp_dealloc*/
   #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
   #endif
@@ -6705,13 +8855,13 @@ static PyTypeObject __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocke
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
   0, /*tp_doc*/
-  __pyx_tp_traverse_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter, /*tp_traverse*/
-  __pyx_tp_clear_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter, /*tp_clear*/
+  __pyx_tp_traverse_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter, /*tp_traverse*/
+  __pyx_tp_clear_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
   0, /*tp_iternext*/
-  __pyx_methods_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter, /*tp_methods*/
+  __pyx_methods_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
@@ -6719,9 +8869,9 @@ static PyTypeObject __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocke
   0, /*tp_descr_get*/
   0, /*tp_descr_set*/
   0, /*tp_dictoffset*/
-  __pyx_pw_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_1__init__, /*tp_init*/
+  __pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_1__init__, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter, /*tp_new*/
+  __pyx_tp_new_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -6744,20 +8894,20 @@ static PyTypeObject __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocke
   0, /*tp_pypy_flags*/
   #endif
 };
-static struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter __pyx_vtable_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter;
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter __pyx_vtable_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter;
 
-static PyObject *__pyx_tp_new_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *p;
-  PyObject *o = __pyx_tp_new_17bytehouse_driver_14bufferedwriter_BufferedWriter(t, a, k);
+static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *p;
+  PyObject *o = __pyx_tp_new_16bytehouse_driver_14bufferedwriter_BufferedWriter(t, a, k);
   if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)o);
-  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_17bytehouse_driver_14bufferedwriter_BufferedWriter*)__pyx_vtabptr_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter;
+  p = ((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter*)__pyx_vtabptr_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter;
   p->compressor = Py_None; Py_INCREF(Py_None);
   return o;
 }
 
-static void __pyx_tp_dealloc_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter(PyObject *o) {
-  struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *p = (struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)o;
+static void __pyx_tp_dealloc_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter(PyObject *o) {
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *p = (struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)o;
   #if CYTHON_USE_TP_FINALIZE
   if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
@@ -6769,43 +8919,170 @@ static void __pyx_tp_dealloc_17bytehouse_driver_14bufferedwriter_CompressedBuffe
   if (PyType_IS_GC(Py_TYPE(o)->tp_base))
   #endif
   PyObject_GC_Track(o);
-  __pyx_tp_dealloc_17bytehouse_driver_14bufferedwriter_BufferedWriter(o);
+  __pyx_tp_dealloc_16bytehouse_driver_14bufferedwriter_BufferedWriter(o);
 }
 
-static int __pyx_tp_traverse_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter(PyObject *o, visitproc v, void *a) {
+static int __pyx_tp_traverse_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter(PyObject *o, visitproc v, void *a) {
   int e;
-  struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *p = (struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)o;
-  e = ((likely(__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter)) ? ((__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter->tp_traverse) ? __pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter->tp_traverse(o, v, a) : 0) : __Pyx_call_next_tp_traverse(o, v, a, __pyx_tp_traverse_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter)); if (e) return e;
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *p = (struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)o;
+  e = ((likely(__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter)) ? ((__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter->tp_traverse) ? __pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter->tp_traverse(o, v, a) : 0) : __Pyx_call_next_tp_traverse(o, v, a, __pyx_tp_traverse_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter)); if (e) return e;
   if (p->compressor) {
     e = (*v)(p->compressor, a); if (e) return e;
   }
   return 0;
 }
 
-static int __pyx_tp_clear_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter(PyObject *o) {
+static int __pyx_tp_clear_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter(PyObject *o) {
   PyObject* tmp;
-  struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *p = (struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)o;
-  if (likely(__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter)) { if (__pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter->tp_clear) __pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter->tp_clear(o); } else __Pyx_call_next_tp_clear(o, __pyx_tp_clear_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter);
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *p = (struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter *)o;
+  if (likely(__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter)) { if (__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter->tp_clear) __pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter->tp_clear(o); } else __Pyx_call_next_tp_clear(o, __pyx_tp_clear_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter);
   tmp = ((PyObject*)p->compressor);
   p->compressor = Py_None; Py_INCREF(Py_None);
   Py_XDECREF(tmp);
   return 0;
 }
 
-static PyMethodDef __pyx_methods_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter[] = {
-  {"write_into_stream", (PyCFunction)__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_3write_into_stream, METH_NOARGS, 0},
-  {"flush", (PyCFunction)__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_5flush, METH_NOARGS, 0},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_7__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_9__setstate_cython__, METH_O, 0},
+static PyMethodDef __pyx_methods_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter[] = {
+  {"write_into_stream", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_3write_into_stream, METH_NOARGS, 0},
+  {"flush", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_5flush, METH_NOARGS, 0},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_7__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_9__setstate_cython__, METH_O, 0},
   {0, 0, 0, 0}
 };
 
-static PyTypeObject __pyx_type_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter = {
+static PyTypeObject __pyx_type_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter = {
   PyVarObject_HEAD_INIT(0, 0)
   "bytehouse_driver.bufferedwriter.CompressedBufferedWriter", /*tp_name*/
-  sizeof(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter), /*tp_basicsize*/
+  sizeof(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter, /*tp_traverse*/
+  __pyx_tp_clear_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter __pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter;
+
+static PyObject *__pyx_tp_new_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *p;
+  PyObject *o = __pyx_tp_new_16bytehouse_driver_14bufferedwriter_BufferedWriter(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_16bytehouse_driver_14bufferedwriter_BufferedWriter*)__pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter;
+  p->chunks = Py_None; Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter(PyObject *o) {
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *p = (struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->chunks);
+  #if CYTHON_USE_TYPE_SLOTS
+  if (PyType_IS_GC(Py_TYPE(o)->tp_base))
+  #endif
+  PyObject_GC_Track(o);
+  __pyx_tp_dealloc_16bytehouse_driver_14bufferedwriter_BufferedWriter(o);
+}
+
+static int __pyx_tp_traverse_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *p = (struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *)o;
+  e = ((likely(__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter)) ? ((__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter->tp_traverse) ? __pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter->tp_traverse(o, v, a) : 0) : __Pyx_call_next_tp_traverse(o, v, a, __pyx_tp_traverse_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter)); if (e) return e;
+  if (p->chunks) {
+    e = (*v)(p->chunks, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *p = (struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter *)o;
+  if (likely(__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter)) { if (__pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter->tp_clear) __pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter->tp_clear(o); } else __Pyx_call_next_tp_clear(o, __pyx_tp_clear_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter);
+  tmp = ((PyObject*)p->chunks);
+  p->chunks = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter[] = {
+  {"write_into_stream", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_3write_into_stream, METH_NOARGS, 0},
+  {"getvalue", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_5getvalue, METH_NOARGS, __pyx_doc_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_4getvalue},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_7__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_9__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "bytehouse_driver.bufferedwriter.BufferedMemoryWriter", /*tp_name*/
+  sizeof(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter, /*tp_dealloc*/
+  __pyx_tp_dealloc_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter, /*tp_dealloc*/
   #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
   #endif
@@ -6832,13 +9109,13 @@ static PyTypeObject __pyx_type_17bytehouse_driver_14bufferedwriter_CompressedBuf
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
   0, /*tp_doc*/
-  __pyx_tp_traverse_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter, /*tp_traverse*/
-  __pyx_tp_clear_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter, /*tp_clear*/
+  __pyx_tp_traverse_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter, /*tp_traverse*/
+  __pyx_tp_clear_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
   0, /*tp_iternext*/
-  __pyx_methods_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter, /*tp_methods*/
+  __pyx_methods_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
@@ -6846,9 +9123,9 @@ static PyTypeObject __pyx_type_17bytehouse_driver_14bufferedwriter_CompressedBuf
   0, /*tp_descr_get*/
   0, /*tp_descr_set*/
   0, /*tp_dictoffset*/
-  __pyx_pw_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_1__init__, /*tp_init*/
+  __pyx_pw_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_1__init__, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter, /*tp_new*/
+  __pyx_tp_new_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -6918,23 +9195,29 @@ static struct PyModuleDef __pyx_moduledef = {
 #endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_BufferedMemoryWriter, __pyx_k_BufferedMemoryWriter, sizeof(__pyx_k_BufferedMemoryWriter), 0, 0, 1, 1},
   {&__pyx_n_s_BufferedSocketWriter, __pyx_k_BufferedSocketWriter, sizeof(__pyx_k_BufferedSocketWriter), 0, 0, 1, 1},
   {&__pyx_n_s_BufferedWriter, __pyx_k_BufferedWriter, sizeof(__pyx_k_BufferedWriter), 0, 0, 1, 1},
   {&__pyx_n_s_CompressedBufferedWriter, __pyx_k_CompressedBufferedWriter, sizeof(__pyx_k_CompressedBufferedWriter), 0, 0, 1, 1},
   {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
   {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_2, __pyx_k_Incompatible_checksums_0x_x_vs_0_2, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0_2), 0, 0, 1, 0},
   {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_3, __pyx_k_Incompatible_checksums_0x_x_vs_0_3, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0_3), 0, 0, 1, 0},
+  {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0_4, __pyx_k_Incompatible_checksums_0x_x_vs_0_4, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0_4), 0, 0, 1, 0},
+  {&__pyx_kp_u_Invalid_string_offsets, __pyx_k_Invalid_string_offsets, sizeof(__pyx_k_Invalid_string_offsets), 0, 1, 0, 0},
   {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
   {&__pyx_n_s_NotImplementedError, __pyx_k_NotImplementedError, sizeof(__pyx_k_NotImplementedError), 0, 0, 1, 1},
   {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
   {&__pyx_n_s_TooLargeStringSize, __pyx_k_TooLargeStringSize, sizeof(__pyx_k_TooLargeStringSize), 0, 0, 1, 1},
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
-  {&__pyx_n_s__5, __pyx_k__5, sizeof(__pyx_k__5), 0, 0, 1, 1},
+  {&__pyx_n_s__4, __pyx_k__4, sizeof(__pyx_k__4), 0, 0, 1, 1},
+  {&__pyx_kp_b__4, __pyx_k__4, sizeof(__pyx_k__4), 0, 0, 0, 0},
+  {&__pyx_n_s_append, __pyx_k_append, sizeof(__pyx_k_append), 0, 0, 1, 1},
   {&__pyx_n_s_bufsize, __pyx_k_bufsize, sizeof(__pyx_k_bufsize), 0, 0, 1, 1},
-  {&__pyx_kp_u_bytes_object_expected, __pyx_k_bytes_object_expected, sizeof(__pyx_k_bytes_object_expected), 0, 1, 0, 0},
   {&__pyx_n_s_bytehouse_driver_bufferedwriter, __pyx_k_bytehouse_driver_bufferedwriter, sizeof(__pyx_k_bytehouse_driver_bufferedwriter), 0, 0, 1, 1},
+  {&__pyx_kp_u_bytes_object_expected, __pyx_k_bytes_object_expected, sizeof(__pyx_k_bytes_object_expected), 0, 1, 0, 0},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
   {&__pyx_n_s_compressor, __pyx_k_compressor, sizeof(__pyx_k_compressor), 0, 0, 1, 1},
+  {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
   {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
   {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
   {&__pyx_n_s_encoding, __pyx_k_encoding, sizeof(__pyx_k_encoding), 0, 0, 1, 1},
@@ -6942,22 +9225,27 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
   {&__pyx_n_s_init, __pyx_k_init, sizeof(__pyx_k_init), 0, 0, 1, 1},
+  {&__pyx_kp_u_int32_or_int64_offsets_expected, __pyx_k_int32_or_int64_offsets_expected, sizeof(__pyx_k_int32_or_int64_offsets_expected), 0, 1, 0, 0},
   {&__pyx_n_s_items, __pyx_k_items, sizeof(__pyx_k_items), 0, 0, 1, 1},
+  {&__pyx_n_s_join, __pyx_k_join, sizeof(__pyx_k_join), 0, 0, 1, 1},
   {&__pyx_n_s_length, __pyx_k_length, sizeof(__pyx_k_length), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
   {&__pyx_n_s_make_varint, __pyx_k_make_varint, sizeof(__pyx_k_make_varint), 0, 0, 1, 1},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+  {&__pyx_n_s_offsets, __pyx_k_offsets, sizeof(__pyx_k_offsets), 0, 0, 1, 1},
   {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_result, __pyx_k_pyx_result, sizeof(__pyx_k_pyx_result), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_type, __pyx_k_pyx_type, sizeof(__pyx_k_pyx_type), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_BufferedMemoryWri, __pyx_k_pyx_unpickle_BufferedMemoryWri, sizeof(__pyx_k_pyx_unpickle_BufferedMemoryWri), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_unpickle_BufferedSocketWri, __pyx_k_pyx_unpickle_BufferedSocketWri, sizeof(__pyx_k_pyx_unpickle_BufferedSocketWri), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_unpickle_BufferedWriter, __pyx_k_pyx_unpickle_BufferedWriter, sizeof(__pyx_k_pyx_unpickle_BufferedWriter), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_unpickle_CompressedBuffere, __pyx_k_pyx_unpickle_CompressedBuffere, sizeof(__pyx_k_pyx_unpickle_CompressedBuffere), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
   {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
@@ -6976,10 +9264,11 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 17, __pyx_L1_error)
-  __pyx_builtin_super = __Pyx_GetBuiltinName(__pyx_n_s_super); if (!__pyx_builtin_super) __PYX_ERR(0, 22, __pyx_L1_error)
-  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 28, __pyx_L1_error)
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 56, __pyx_L1_error)
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 20, __pyx_L1_error)
+  __pyx_builtin_super = __Pyx_GetBuiltinName(__pyx_n_s_super); if (!__pyx_builtin_super) __PYX_ERR(0, 25, __pyx_L1_error)
+  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 31, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 91, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 123, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -6989,51 +9278,80 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "bytehouse_driver/bufferedwriter.pyx":56
+  /* "bytehouse_driver/bufferedwriter.pyx":91
  *                     value = value.encode(encoding)
  *                 else:
  *                     raise ValueError('bytes object expected')             # <<<<<<<<<<<<<<
  * 
  *             self.write(make_varint(PyBytes_GET_SIZE(value)))
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_bytes_object_expected); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 56, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_u_bytes_object_expected); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 91, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
-  /* "(tree fragment)":4
- *     cdef object __pyx_PickleError
- *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x25d1d0c, 0x1c41cb3, 0x253d0cc):             # <<<<<<<<<<<<<<
- *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
+  /* "bytehouse_driver/bufferedwriter.pyx":118
+ *                     offsets64 = <const int64_t*> offsets_view.buf
+ *                 else:
+ *                     raise ValueError('int32 or int64 offsets expected')             # <<<<<<<<<<<<<<
+ * 
+ *                 n_items = offsets_view.len // offsets_view.itemsize - 1
  */
-  __pyx_tuple__2 = PyTuple_Pack(3, __pyx_int_39656716, __pyx_int_29629619, __pyx_int_39047372); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_int32_or_int64_offsets_expected); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 118, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
-  __pyx_tuple__3 = PyTuple_Pack(3, __pyx_int_62583983, __pyx_int_211840719, __pyx_int_82038463); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "bytehouse_driver/bufferedwriter.pyx":130
+ * 
+ *                     if start < 0 or end < start or end > data_view.len:
+ *                         raise ValueError('Invalid string offsets')             # <<<<<<<<<<<<<<
+ * 
+ *                     self._write_varint(end - start)
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_Invalid_string_offsets); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 130, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
-  __pyx_tuple__4 = PyTuple_Pack(3, __pyx_int_17355272, __pyx_int_137744089, __pyx_int_158296731); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
 
-  /* "(tree fragment)":1
- * def __pyx_unpickle_BufferedWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+  /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x25d1d0c, 0x1c41cb3, 0x253d0cc):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x25d1d0c, 0x1c41cb3, 0x253d0cc) = (buffer, buffer_size, position))" % __pyx_checksum)
  */
-  __pyx_tuple__6 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__5 = PyTuple_Pack(3, __pyx_int_39656716, __pyx_int_29629619, __pyx_int_39047372); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_tuple__6 = PyTuple_Pack(3, __pyx_int_62583983, __pyx_int_211840719, __pyx_int_82038463); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__6);
   __Pyx_GIVEREF(__pyx_tuple__6);
-  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_BufferedWriter, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __pyx_tuple__8 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__7 = PyTuple_Pack(3, __pyx_int_17355272, __pyx_int_137744089, __pyx_int_158296731); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_tuple__8 = PyTuple_Pack(3, __pyx_int_259945928, __pyx_int_163640222, __pyx_int_120631050); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__8);
   __Pyx_GIVEREF(__pyx_tuple__8);
-  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_BufferedSocketWri, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __pyx_tuple__10 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__10);
-  __Pyx_GIVEREF(__pyx_tuple__10);
-  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_CompressedBuffere, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(1, 1, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_BufferedWriter(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_tuple__9 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_BufferedWriter, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__11 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_BufferedSocketWri, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__13 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_CompressedBuffere, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__15 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_BufferedMemoryWri, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -7049,9 +9367,12 @@ static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
   __pyx_int_39656716 = PyInt_FromLong(39656716L); if (unlikely(!__pyx_int_39656716)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_62583983 = PyInt_FromLong(62583983L); if (unlikely(!__pyx_int_62583983)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_82038463 = PyInt_FromLong(82038463L); if (unlikely(!__pyx_int_82038463)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_120631050 = PyInt_FromLong(120631050L); if (unlikely(!__pyx_int_120631050)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_137744089 = PyInt_FromLong(137744089L); if (unlikely(!__pyx_int_137744089)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_158296731 = PyInt_FromLong(158296731L); if (unlikely(!__pyx_int_158296731)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_163640222 = PyInt_FromLong(163640222L); if (unlikely(!__pyx_int_163640222)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_211840719 = PyInt_FromLong(211840719L); if (unlikely(!__pyx_int_211840719)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_259945928 = PyInt_FromLong(259945928L); if (unlikely(!__pyx_int_259945928)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -7096,50 +9417,67 @@ static int __Pyx_modinit_type_init_code(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
-  __pyx_vtabptr_17bytehouse_driver_14bufferedwriter_BufferedWriter = &__pyx_vtable_17bytehouse_driver_14bufferedwriter_BufferedWriter;
-  __pyx_vtable_17bytehouse_driver_14bufferedwriter_BufferedWriter.write_into_stream = (PyObject *(*)(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *, int __pyx_skip_dispatch))__pyx_f_17bytehouse_driver_14bufferedwriter_14BufferedWriter_write_into_stream;
-  __pyx_vtable_17bytehouse_driver_14bufferedwriter_BufferedWriter.write = (PyObject *(*)(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *, PyObject *, int __pyx_skip_dispatch))__pyx_f_17bytehouse_driver_14bufferedwriter_14BufferedWriter_write;
-  if (PyType_Ready(&__pyx_type_17bytehouse_driver_14bufferedwriter_BufferedWriter) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  __pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedWriter = &__pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedWriter;
+  __pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedWriter.write_into_stream = (PyObject *(*)(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *, int __pyx_skip_dispatch))__pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter_write_into_stream;
+  __pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedWriter._write = (int (*)(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *, char const *, unsigned PY_LONG_LONG))__pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter__write;
+  __pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedWriter._write_varint = (int (*)(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *, unsigned PY_LONG_LONG))__pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter__write_varint;
+  __pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedWriter.write = (PyObject *(*)(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *, PyObject *, int __pyx_skip_dispatch))__pyx_f_16bytehouse_driver_14bufferedwriter_14BufferedWriter_write;
+  if (PyType_Ready(&__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedWriter) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedWriter.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedWriter.tp_dictoffset && __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedWriter.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedWriter.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedWriter.tp_dict, __pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedWriter) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BufferedWriter, (PyObject *)&__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedWriter) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedWriter) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+  __pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter = &__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedWriter;
+  __pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter = &__pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter;
+  __pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter.__pyx_base = *__pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedWriter;
+  __pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter.__pyx_base.write_into_stream = (PyObject *(*)(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *, int __pyx_skip_dispatch))__pyx_f_16bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_write_into_stream;
+  __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter.tp_base = __pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter;
+  if (PyType_Ready(&__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter) < 0) __PYX_ERR(0, 198, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
-  __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedWriter.tp_print = 0;
+  __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter.tp_print = 0;
   #endif
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_17bytehouse_driver_14bufferedwriter_BufferedWriter.tp_dictoffset && __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedWriter.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedWriter.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter.tp_dictoffset && __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (__Pyx_SetVtable(__pyx_type_17bytehouse_driver_14bufferedwriter_BufferedWriter.tp_dict, __pyx_vtabptr_17bytehouse_driver_14bufferedwriter_BufferedWriter) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BufferedWriter, (PyObject *)&__pyx_type_17bytehouse_driver_14bufferedwriter_BufferedWriter) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_17bytehouse_driver_14bufferedwriter_BufferedWriter) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
-  __pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter = &__pyx_type_17bytehouse_driver_14bufferedwriter_BufferedWriter;
-  __pyx_vtabptr_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter = &__pyx_vtable_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter;
-  __pyx_vtable_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter.__pyx_base = *__pyx_vtabptr_17bytehouse_driver_14bufferedwriter_BufferedWriter;
-  __pyx_vtable_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter.__pyx_base.write_into_stream = (PyObject *(*)(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *, int __pyx_skip_dispatch))__pyx_f_17bytehouse_driver_14bufferedwriter_20BufferedSocketWriter_write_into_stream;
-  __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter.tp_base = __pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter;
-  if (PyType_Ready(&__pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter) < 0) __PYX_ERR(0, 119, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter.tp_dict, __pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter) < 0) __PYX_ERR(0, 198, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BufferedSocketWriter, (PyObject *)&__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter) < 0) __PYX_ERR(0, 198, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter) < 0) __PYX_ERR(0, 198, __pyx_L1_error)
+  __pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter = &__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedSocketWriter;
+  __pyx_vtabptr_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter = &__pyx_vtable_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter;
+  __pyx_vtable_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.__pyx_base = *__pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedWriter;
+  __pyx_vtable_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.__pyx_base.write_into_stream = (PyObject *(*)(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *, int __pyx_skip_dispatch))__pyx_f_16bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_write_into_stream;
+  __pyx_type_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.tp_base = __pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter;
+  if (PyType_Ready(&__pyx_type_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter) < 0) __PYX_ERR(0, 212, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
-  __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter.tp_print = 0;
+  __pyx_type_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.tp_print = 0;
   #endif
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter.tp_dictoffset && __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.tp_dictoffset && __pyx_type_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (__Pyx_SetVtable(__pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter.tp_dict, __pyx_vtabptr_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter) < 0) __PYX_ERR(0, 119, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BufferedSocketWriter, (PyObject *)&__pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter) < 0) __PYX_ERR(0, 119, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter) < 0) __PYX_ERR(0, 119, __pyx_L1_error)
-  __pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter = &__pyx_type_17bytehouse_driver_14bufferedwriter_BufferedSocketWriter;
-  __pyx_vtabptr_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter = &__pyx_vtable_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter;
-  __pyx_vtable_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.__pyx_base = *__pyx_vtabptr_17bytehouse_driver_14bufferedwriter_BufferedWriter;
-  __pyx_vtable_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.__pyx_base.write_into_stream = (PyObject *(*)(struct __pyx_obj_17bytehouse_driver_14bufferedwriter_BufferedWriter *, int __pyx_skip_dispatch))__pyx_f_17bytehouse_driver_14bufferedwriter_24CompressedBufferedWriter_write_into_stream;
-  __pyx_type_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.tp_base = __pyx_ptype_17bytehouse_driver_14bufferedwriter_BufferedWriter;
-  if (PyType_Ready(&__pyx_type_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter) < 0) __PYX_ERR(0, 133, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.tp_dict, __pyx_vtabptr_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter) < 0) __PYX_ERR(0, 212, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_CompressedBufferedWriter, (PyObject *)&__pyx_type_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter) < 0) __PYX_ERR(0, 212, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter) < 0) __PYX_ERR(0, 212, __pyx_L1_error)
+  __pyx_ptype_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter = &__pyx_type_16bytehouse_driver_14bufferedwriter_CompressedBufferedWriter;
+  __pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter = &__pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter;
+  __pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter.__pyx_base = *__pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedWriter;
+  __pyx_vtable_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter.__pyx_base.write_into_stream = (PyObject *(*)(struct __pyx_obj_16bytehouse_driver_14bufferedwriter_BufferedWriter *, int __pyx_skip_dispatch))__pyx_f_16bytehouse_driver_14bufferedwriter_20BufferedMemoryWriter_write_into_stream;
+  __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter.tp_base = __pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedWriter;
+  if (PyType_Ready(&__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter) < 0) __PYX_ERR(0, 229, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
-  __pyx_type_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.tp_print = 0;
+  __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter.tp_print = 0;
   #endif
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.tp_dictoffset && __pyx_type_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter.tp_dictoffset && __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (__Pyx_SetVtable(__pyx_type_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter.tp_dict, __pyx_vtabptr_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter) < 0) __PYX_ERR(0, 133, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_CompressedBufferedWriter, (PyObject *)&__pyx_type_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter) < 0) __PYX_ERR(0, 133, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter) < 0) __PYX_ERR(0, 133, __pyx_L1_error)
-  __pyx_ptype_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter = &__pyx_type_17bytehouse_driver_14bufferedwriter_CompressedBufferedWriter;
+  if (__Pyx_SetVtable(__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter.tp_dict, __pyx_vtabptr_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter) < 0) __PYX_ERR(0, 229, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BufferedMemoryWriter, (PyObject *)&__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter) < 0) __PYX_ERR(0, 229, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter) < 0) __PYX_ERR(0, 229, __pyx_L1_error)
+  __pyx_ptype_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter = &__pyx_type_16bytehouse_driver_14bufferedwriter_BufferedMemoryWriter;
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -7401,45 +9739,45 @@ if (!__Pyx_RefNanny) {
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "bytehouse_driver/bufferedwriter.pyx":6
+  /* "bytehouse_driver/bufferedwriter.pyx":9
  * from libc.string cimport memcpy, memset
  * 
  * from . import errors             # <<<<<<<<<<<<<<
  * from .varint import make_varint
  * 
  */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_s_errors);
   __Pyx_GIVEREF(__pyx_n_s_errors);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_errors);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s__5, __pyx_t_1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s__4, __pyx_t_1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_errors); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 6, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_errors); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_errors, __pyx_t_1) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_errors, __pyx_t_1) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "bytehouse_driver/bufferedwriter.pyx":7
+  /* "bytehouse_driver/bufferedwriter.pyx":10
  * 
  * from . import errors
  * from .varint import make_varint             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 10, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_n_s_make_varint);
   __Pyx_GIVEREF(__pyx_n_s_make_varint);
   PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_make_varint);
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_varint, __pyx_t_2, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_varint, __pyx_t_2, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 10, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_make_varint); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_make_varint); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 10, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_make_varint, __pyx_t_2) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_make_varint, __pyx_t_2) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
@@ -7448,7 +9786,7 @@ if (!__Pyx_RefNanny) {
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_17bytehouse_driver_14bufferedwriter_1__pyx_unpickle_BufferedWriter, NULL, __pyx_n_s_bytehouse_driver_bufferedwriter); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_16bytehouse_driver_14bufferedwriter_1__pyx_unpickle_BufferedWriter, NULL, __pyx_n_s_bytehouse_driver_bufferedwriter); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_BufferedWriter, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -7460,7 +9798,7 @@ if (!__Pyx_RefNanny) {
  *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.position = __pyx_state[2]
  *     if len(__pyx_state) > 3 and hasattr(__pyx_result, '__dict__'):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_17bytehouse_driver_14bufferedwriter_3__pyx_unpickle_BufferedSocketWriter, NULL, __pyx_n_s_bytehouse_driver_bufferedwriter); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_16bytehouse_driver_14bufferedwriter_3__pyx_unpickle_BufferedSocketWriter, NULL, __pyx_n_s_bytehouse_driver_bufferedwriter); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_BufferedSocketWri, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -7470,9 +9808,21 @@ if (!__Pyx_RefNanny) {
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_17bytehouse_driver_14bufferedwriter_5__pyx_unpickle_CompressedBufferedWriter, NULL, __pyx_n_s_bytehouse_driver_bufferedwriter); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_16bytehouse_driver_14bufferedwriter_5__pyx_unpickle_CompressedBufferedWriter, NULL, __pyx_n_s_bytehouse_driver_bufferedwriter); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_CompressedBuffere, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_CompressedBufferedWriter__set_state(<CompressedBufferedWriter> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_CompressedBufferedWriter__set_state(CompressedBufferedWriter __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.buffer = __pyx_state[0]; __pyx_result.buffer_size = __pyx_state[1]; __pyx_result.compressor = __pyx_state[2]; __pyx_result.position = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_16bytehouse_driver_14bufferedwriter_7__pyx_unpickle_BufferedMemoryWriter, NULL, __pyx_n_s_bytehouse_driver_bufferedwriter); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_CompressedBuffere, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_BufferedMemoryWri, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "bytehouse_driver/bufferedwriter.pyx":1
@@ -8180,6 +10530,171 @@ done:
     return result;
 }
 
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+    #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#endif
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
 /* GetModuleGlobalName */
 #if CYTHON_USE_DICT_VERSIONS
 static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
@@ -8215,6 +10730,14 @@ static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
     return __Pyx_GetBuiltinName(name);
 }
 
+/* DivInt[Py_ssize_t] */
+static CYTHON_INLINE Py_ssize_t __Pyx_div_Py_ssize_t(Py_ssize_t a, Py_ssize_t b) {
+    Py_ssize_t q = a / b;
+    Py_ssize_t r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
+}
+
 /* PyErrExceptionMatches */
 #if CYTHON_FAST_THREAD_STATE
 static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
@@ -8268,83 +10791,131 @@ static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject
     return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
 }
 
-/* Import */
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    #if PY_MAJOR_VERSION < 3
-    PyObject *py_import;
-    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
-    if (!py_import)
-        goto bad;
-    #endif
-    if (from_list)
-        list = from_list;
-    else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
-            goto bad;
-        list = empty_list;
+/* PyObjectGetMethod */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
     }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
-        goto bad;
-    {
-        #if PY_MAJOR_VERSION >= 3
-        if (level == -1) {
-            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
-                module = PyImport_ImportModuleLevelObject(
-                    name, global_dict, empty_dict, list, 1);
-                if (!module) {
-                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
-                        goto bad;
-                    PyErr_Clear();
-                }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
             }
-            level = 0;
         }
-        #endif
-        if (!module) {
-            #if PY_MAJOR_VERSION < 3
-            PyObject *py_level = PyInt_FromLong(level);
-            if (!py_level)
-                goto bad;
-            module = PyObject_CallFunctionObjArgs(py_import,
-                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
-            Py_DECREF(py_level);
-            #else
-            module = PyImport_ImportModuleLevelObject(
-                name, global_dict, empty_dict, list, level);
-            #endif
+    }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
         }
+        Py_DECREF(dict);
     }
-bad:
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(py_import);
-    #endif
-    Py_XDECREF(empty_list);
-    Py_XDECREF(empty_dict);
-    return module;
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (descr != NULL) {
+        *method = descr;
+        return 0;
+    }
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(name));
+#endif
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
+    return 0;
 }
 
-/* ImportFrom */
-static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
-    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
-    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
-        PyErr_Format(PyExc_ImportError,
-        #if PY_MAJOR_VERSION < 3
-            "cannot import name %.230s", PyString_AS_STRING(name));
-        #else
-            "cannot import name %S", name);
-        #endif
+/* PyObjectCallMethod1 */
+static PyObject* __Pyx__PyObject_CallMethod1(PyObject* method, PyObject* arg) {
+    PyObject *result = __Pyx_PyObject_CallOneArg(method, arg);
+    Py_DECREF(method);
+    return result;
+}
+static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg) {
+    PyObject *method = NULL, *result;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_Call2Args(method, obj, arg);
+        Py_DECREF(method);
+        return result;
     }
-    return value;
+    if (unlikely(!method)) return NULL;
+    return __Pyx__PyObject_CallMethod1(method, arg);
+}
+
+/* append */
+static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
+    if (likely(PyList_CheckExact(L))) {
+        if (unlikely(__Pyx_PyList_Append(L, x) < 0)) return -1;
+    } else {
+        PyObject* retval = __Pyx_PyObject_CallMethod1(L, __pyx_n_s_append, x);
+        if (unlikely(!retval))
+            return -1;
+        Py_DECREF(retval);
+    }
+    return 0;
 }
 
 /* GetItemInt */
@@ -8434,6 +11005,92 @@ static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
     return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
 }
 
+/* StringJoin */
+#if !CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyBytes_Join(PyObject* sep, PyObject* values) {
+    return PyObject_CallMethodObjArgs(sep, __pyx_n_s_join, values, NULL);
+}
+#endif
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
 /* HasAttr */
 static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
     PyObject *r;
@@ -1,6 +1,9 @@
 from cpython cimport PyMem_Malloc, PyMem_Free, PyBytes_AsString, \
     PyBytes_Check, PyBytes_FromStringAndSize, PyBytes_AS_STRING, \
     PyBytes_GET_SIZE
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, \
+    PyBUF_C_CONTIGUOUS
+from libc.stdint cimport int32_t, int64_t
 from libc.string cimport memcpy, memset
 
 from . import errors
@@ -27,21 +30,53 @@ cdef class BufferedWriter(object):
     cpdef write_into_stream(self):
         raise NotImplementedError
 
-    cpdef write(self, data):
+    cdef int _write(self, const char* data,
+                    unsigned long long data_len) except -1:
         cdef unsigned long long size, written = 0
-        cdef unsigned long long data_len = PyBytes_GET_SIZE(data)
-        cdef char* c_data = PyBytes_AS_STRING(data)
 
         while written < data_len:
-            size = min(data_len - written, self.buffer_size - self.position)
-            memcpy(&self.buffer[self.position], &c_data[written], size)
-
             if self.position == self.buffer_size:
                 self.write_into_stream()
 
+            size = min(data_len - written, self.buffer_size - self.position)
+            memcpy(&self.buffer[self.position], &data[written], size)
+
             self.position += size
             written += size
 
+        return 0
+
+    cdef int _write_varint(self, unsigned long long number) except -1:
+        cdef unsigned char num_buf[10]
+        cdef unsigned char i = 0
+
+        while True:
+            num_buf[i] = number & 0x7f
+            number >>= 7
+            if not number:
+                break
+            num_buf[i] |= 0x80
+            i += 1
+
+        return self._write(<const char*> num_buf, i + 1)
+
+    cpdef write(self, data):
+        """
+        Writes ``bytes`` or any C-contiguous object supporting buffer
+        protocol, e.g. NumPy array, without intermediate copies.
+        """
+        cdef Py_buffer view
+
+        if PyBytes_Check(data):
+            self._write(PyBytes_AS_STRING(data), PyBytes_GET_SIZE(data))
+            return
+
+        PyObject_GetBuffer(data, &view, PyBUF_C_CONTIGUOUS)
+        try:
+            self._write(<const char*> view.buf, view.len)
+        finally:
+            PyBuffer_Release(&view)
+
     def flush(self):
         self.write_into_stream()
 
@@ -58,6 +93,50 @@ cdef class BufferedWriter(object):
             self.write(make_varint(PyBytes_GET_SIZE(value)))
             self.write(value)
 
+    def write_string_buffers(self, offsets, data):
+        """
+        Writes strings stored as offsets and data buffers, Arrow layout.
+        ``offsets`` is C-contiguous buffer of n + 1 int32 or int64 values,
+        i-th string spans ``data[offsets[i]:offsets[i + 1]]``.
+        """
+        cdef Py_buffer offsets_view, data_view
+        cdef Py_ssize_t i, n_items
+        cdef int64_t start, end
+        cdef const char* c_data
+        cdef const int32_t* offsets32 = NULL
+        cdef const int64_t* offsets64 = NULL
+
+        PyObject_GetBuffer(offsets, &offsets_view, PyBUF_C_CONTIGUOUS)
+        try:
+            PyObject_GetBuffer(data, &data_view, PyBUF_C_CONTIGUOUS)
+            try:
+                if offsets_view.itemsize == 4:
+                    offsets32 = <const int32_t*> offsets_view.buf
+                elif offsets_view.itemsize == 8:
+                    offsets64 = <const int64_t*> offsets_view.buf
+                else:
+                    raise ValueError('int32 or int64 offsets expected')
+
+                n_items = offsets_view.len // offsets_view.itemsize - 1
+                c_data = <const char*> data_view.buf
+
+                for i in range(n_items):
+                    if offsets32 != NULL:
+                        start, end = offsets32[i], offsets32[i + 1]
+                    else:
+                        start, end = offsets64[i], offsets64[i + 1]
+
+                    if start < 0 or end < start or end > data_view.len:
+                        raise ValueError('Invalid string offsets')
+
+                    self._write_varint(end - start)
+                    self._write(&c_data[start], end - start)
+
+            finally:
+                PyBuffer_Release(&data_view)
+        finally:
+            PyBuffer_Release(&offsets_view)
+
     def write_fixed_strings_as_bytes(self, items, Py_ssize_t length):
         cdef Py_ssize_t buf_pos = 0
         cdef Py_ssize_t items_buf_size = length * len(items)
@@ -145,3 +224,30 @@ cdef class CompressedBufferedWriter(BufferedWriter):
 
     def flush(self):
         self.write_into_stream()
+
+
+cdef class BufferedMemoryWriter(BufferedWriter):
+    cdef object chunks
+
+    def __init__(self, bufsize):
+        self.chunks = []
+        super(BufferedMemoryWriter, self).__init__(bufsize)
+
+    cpdef write_into_stream(self):
+        if self.position:
+            self.chunks.append(
+                PyBytes_FromStringAndSize(self.buffer, self.position)
+            )
+        self.position = 0
+
+    def getvalue(self):
+        """
+        Returns all written data and empties writer.
+        """
+        self.write_into_stream()
+
+        chunks = self.chunks
+        self.chunks = []
+        if len(chunks) == 1:
+            return chunks[0]
+        return b''.join(chunks)
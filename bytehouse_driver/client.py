@@ -29,6 +29,7 @@ import ssl
 import string
 from collections import deque
 from contextlib import contextmanager
+from functools import partial
 from time import time, sleep
 import types
 from urllib.parse import urlparse, parse_qs, unquote
@@ -36,13 +37,21 @@ from urllib.parse import urlparse, parse_qs, unquote
 from . import errors, defines
 from .block import ColumnOrientedBlock, RowOrientedBlock
 from .connection import Connection
+from .insertpipeline import InsertPipeline
 from .log import log_block
+from .prefetch import PacketPrefetcher
 from .protocol import ServerPacketTypes
 from .result import (
-    IterQueryResult, ProgressQueryResult, QueryResult, QueryInfo
+    BlockIterQueryResult, IterQueryResult, ProgressQueryResult, QueryResult,
+    QueryInfo
+)
+from .resultcache import (
+    ResultCollector, copy_result, is_read_only_query, normalize_query
 )
 from .util.escape import escape_params
 from .util.helpers import column_chunks, chunks, asbool
+from .util.params import extract_in_params
+from .warehouse import is_warehouse_up, resume_delays, warehouse_cache
 
 import logging
 
@@ -57,6 +66,15 @@ class Client(object):
     :param settings: Dictionary of settings that passed to every query (except
                      for the client settings, see below). Defaults to ``None``
                      (no additional settings).
+    :param result_cache: :class:`~bytehouse_driver.resultcache.ResultCache`
+                         for results of SELECT queries. Cache can be shared
+                         by several clients. Defaults to ``None``
+                         (results are not cached).
+    :param query_coalescer: :class:`~bytehouse_driver.QueryCoalescer` for
+                            identical concurrent SELECT queries. Clients
+                            sharing it wait for one execution on server.
+                            Defaults to ``None`` (queries are not
+                            coalesced).
     :param \\**kwargs: All other args are passed to the
                        :py:class:`~bytehouse_driver.connection.Connection`
                        constructor.
@@ -80,6 +98,27 @@ class Client(object):
                            nullable. Does not work for NumPy. Default: False.
         * ``round_robin`` -- If ``alt_hosts`` are provided the query will be
                            executed on host picked with round-robin algorithm.
+        * ``insert_pipeline_depth`` -- number of INSERT blocks serialized and
+                           compressed on a worker thread ahead of the block
+                           being sent. Data generator is consumed on that
+                           thread. ``0`` disables pipelining. Default: 0.
+        * ``read_prefetch_depth`` -- number of result packets received,
+                           decompressed and decoded on a worker thread ahead
+                           of the packet being processed. ``0`` disables
+                           prefetching. Default: 0.
+        * ``low_cardinality_dict_encoded`` -- read LowCardinality columns as
+                           ``DictEncodedColumn`` of index and keys without
+                           expanding them into values. Columnar results keep
+                           columns encoded. Does not affect NumPy.
+                           Default: False.
+        * ``numpy_nullable_dtypes`` -- read NumPy Nullable integer, float and
+                           boolean columns as pandas nullable arrays instead
+                           of object arrays with ``None``. Default: False.
+        * ``external_table_params_threshold`` -- list and tuple parameters
+                           of at least this many numbers or strings used
+                           as ``IN %(name)s`` are sent as external tables
+                           and replaced with subqueries on them. ``0``
+                           disables it. Default: 10000.
     """
 
     available_client_settings = (
@@ -90,9 +129,26 @@ class Client(object):
         'opentelemetry_traceparent',
         'opentelemetry_tracestate',
         'quota_key',
-        'input_format_null_as_default'
+        'input_format_null_as_default',
+        'insert_pipeline_depth',
+        'read_prefetch_depth',
+        'low_cardinality_dict_encoded',
+        'numpy_nullable_dtypes',
+        'external_table_params_threshold',
+        'use_arrow'
+    )
+
+    # Client settings that change decoded result.
+    query_key_client_settings = (
+        'strings_as_bytes',
+        'strings_encoding',
+        'use_numpy',
+        'low_cardinality_dict_encoded',
+        'numpy_nullable_dtypes'
     )
 
+    connection_cls = Connection
+
     def __init__(self, *args, **kwargs):
         self.settings = (kwargs.pop('settings', None) or {}).copy()
 
@@ -143,7 +199,25 @@ class Client(object):
             ),
             'input_format_null_as_default': self.settings.pop(
                 'input_format_null_as_default', False
-            )
+            ),
+            'insert_pipeline_depth': int(self.settings.pop(
+                'insert_pipeline_depth', 0
+            )),
+            'read_prefetch_depth': int(self.settings.pop(
+                'read_prefetch_depth', 0
+            )),
+            'low_cardinality_dict_encoded': self.settings.pop(
+                'low_cardinality_dict_encoded', False
+            ),
+            'numpy_nullable_dtypes': self.settings.pop(
+                'numpy_nullable_dtypes', False
+            ),
+            'external_table_params_threshold': int(self.settings.pop(
+                'external_table_params_threshold',
+                defines.DEFAULT_EXTERNAL_TABLE_PARAMS_THRESHOLD
+            )),
+            # Set by query_arrow and query_arrow_iter only.
+            'use_arrow': False
         }
 
         if self.client_settings['use_numpy']:
@@ -162,9 +236,12 @@ class Client(object):
             self.iter_query_result_cls = IterQueryResult
             self.progress_query_result_cls = ProgressQueryResult
 
+        self.result_cache = kwargs.pop('result_cache', None)
+        self.query_coalescer = kwargs.pop('query_coalescer', None)
+
         vw = kwargs.pop('vw', None)
         round_robin = kwargs.pop('round_robin', False)
-        self.connections = deque([Connection(*args, **kwargs)])
+        self.connections = deque([self.connection_cls(*args, **kwargs)])
 
         if round_robin and 'alt_hosts' in kwargs:
             alt_hosts = kwargs.pop('alt_hosts')
@@ -180,7 +257,9 @@ class Client(object):
                     connection_args = (url.hostname, ) + args[1:]
                     connection_kwargs['port'] = url.port
 
-                connection = Connection(*connection_args, **connection_kwargs)
+                connection = self.connection_cls(
+                    *connection_args, **connection_kwargs
+                )
                 self.connections.append(connection)
 
         self.connection = self.get_connection()
@@ -220,45 +299,92 @@ class Client(object):
         self.last_query = None
 
     def set_warehouse(self, vw):
-        if vw == None:
-            default_settings = self.execute("SHOW DEFAULT SETTINGS")
+        """
+        Sets virtual warehouse for the following queries. Warehouse is
+        resolved (and resumed if it is suspended) lazily by the first query
+        on each connection.
+
+        :param vw: warehouse name. ``None`` means default warehouse of the
+                   user.
+        """
+        if vw is not None and not isinstance(vw, str):
+            raise Exception("Name of virtual warehouse should be a string")
+
+        self.warehouse = vw
+        self.connection.warehouse = None
+        for connection in self.connections:
+            connection.warehouse = None
+
+    def ensure_warehouse(self):
+        """
+        Applies virtual warehouse to the current connection. Resolved
+        warehouses are shared between clients through
+        :data:`~bytehouse_driver.warehouse.warehouse_cache`.
+        """
+        connection = self.connection
+        if connection.warehouse is not None:
+            return
+
+        key = (connection.host, connection.port, connection.user,
+               self.warehouse)
+        vw = warehouse_cache.get(key)
+
+        if vw is None:
+            vw = self.select_warehouse()
+            if self.is_warehouse_up(vw) or self.resume_warehouse(vw):
+                warehouse_cache.set(key, vw)
+
+        elif self.warehouse is not None:
+            self.select_warehouse()
+
+        connection.warehouse = vw
+
+    def execute_service_query(self, query):
+        # Runs query on established connection before the user's query.
+        # Connection remains marked as busy by the user's query.
+        rv = self.process_ordinary_query(query)
+        self.connection.is_query_executing = True
+        return rv
+
+    def select_warehouse(self):
+        vw = self.warehouse
+        if vw is None:
+            default_settings = self.execute_service_query(
+                "SHOW DEFAULT SETTINGS"
+            )
             vw = default_settings[0][4]
             if vw is None or len(vw) < 1:
                 raise Exception("No default virtual warehouse selected")
         else:
-            if type(vw) != str:
-                raise Exception("Name of virtual warehouse should be a string")
             try:
-                self.execute("SET WAREHOUSE {}".format(vw))
+                self.execute_service_query("SET WAREHOUSE {}".format(vw))
             except Exception as e:
-                logger.warn("Failed to resume warehouse {}".format(vw))
+                logger.warning("Failed to set warehouse %s", vw)
                 raise e
 
-        if self.is_warehouse_up(vw):
-            return
+        return vw
+
+    def resume_warehouse(self, vw):
         logger.info("Resuming warehouse %s", vw)
         try:
-            self.execute("RESUME WAREHOUSE {}".format(vw))
-        except:
-            logger.warn("Error from server while resuming warehouse", vw)
+            self.execute_service_query("RESUME WAREHOUSE {}".format(vw))
+        except errors.ServerException as e:
+            logger.warning(
+                "Error from server while resuming warehouse %s: %s", vw, e
+            )
 
-        start_time = time()
-        warehouse_started = False
-        # allowing 10 seconds to resume the vw
-        while (time() - start_time) < 10:
+        for delay in resume_delays():
+            sleep(delay)
             if self.is_warehouse_up(vw):
-                warehouse_started = True
-                break
-        if not warehouse_started:
-            logger.info("Cannot turn on warehouse")
+                return True
+
+        logger.info("Cannot turn on warehouse %s", vw)
+        return False
 
     def is_warehouse_up(self, warehouse_name):
         logger.info("Checking warehouse status %s", warehouse_name)
-        warehouses = self.execute("SHOW WAREHOUSES")
-        for warehouse in warehouses:
-            if warehouse[1] == warehouse_name and warehouse[6] == "up":
-                return True
-        return False
+        warehouses = self.execute_service_query("SHOW WAREHOUSES")
+        return is_warehouse_up(warehouses, warehouse_name)
 
     def receive_result(self, with_column_types=False, progress=False,
                        columnar=False):
@@ -283,15 +409,30 @@ class Client(object):
             gen, with_column_types=with_column_types
         )
 
-        for rows in result:
-            for row in rows:
-                yield row
+        try:
+            for rows in result:
+                for row in rows:
+                    yield row
+        finally:
+            gen.close()
 
     def packet_generator(self):
-        while True:
-            try:
-                packet = self.receive_packet()
+        client_settings = self.connection.context.client_settings
+        depth = int(client_settings['read_prefetch_depth'])
+        prefetcher = None
+        if depth:
+            prefetcher = PacketPrefetcher(self.connection, depth)
+
+        finished = False
+        try:
+            while True:
+                if prefetcher is not None:
+                    packet = self.handle_packet(prefetcher.get())
+                else:
+                    packet = self.receive_packet()
+
                 if not packet:
+                    finished = True
                     break
 
                 if packet is True:
@@ -299,13 +440,24 @@ class Client(object):
 
                 yield packet
 
-            except (Exception, KeyboardInterrupt):
+        finally:
+            # Worker must exit before connection state is reset.
+            if prefetcher is not None:
+                if finished:
+                    prefetcher.stop()
+                else:
+                    prefetcher.abort()
+
+            # Unread packets left in the stream on error or when iteration
+            # is interrupted.
+            if not finished:
                 self.disconnect()
-                raise
 
     def receive_packet(self):
         packet = self.connection.receive_packet()
+        return self.handle_packet(packet)
 
+    def handle_packet(self, packet):
         if packet.type == ServerPacketTypes.EXCEPTION:
             raise packet.exception
 
@@ -364,6 +516,7 @@ class Client(object):
                 self.make_query_settings(settings)
                 self.connection.force_connect()
                 self.last_query = QueryInfo()
+                self.ensure_warehouse()
 
             except (errors.SocketTimeoutError, errors.NetworkError):
                 if i < num_connections - 1:
@@ -431,6 +584,46 @@ class Client(object):
 
         start_time = time()
 
+        query_key = None
+        if self.result_cache is not None or self.query_coalescer is not None:
+            query_key = self.make_query_key(
+                query, params=params, settings=settings,
+                external_tables=external_tables,
+                with_column_types=with_column_types, columnar=columnar
+            )
+
+        if query_key is not None and self.result_cache is not None:
+            rv = self.result_cache.get(query_key)
+            if rv is not None:
+                self.last_query = QueryInfo()
+                self.last_query.store_elapsed(time() - start_time)
+                return copy_result(rv)
+
+        run_query = partial(
+            self.run_query, query, params=params,
+            with_column_types=with_column_types,
+            external_tables=external_tables, query_id=query_id,
+            settings=settings, types_check=types_check, columnar=columnar,
+            start_time=start_time, query_key=query_key
+        )
+
+        if query_key is not None and self.query_coalescer is not None:
+            rv, executed = self.query_coalescer.run(query_key, run_query)
+            if not executed:
+                self.last_query = QueryInfo()
+                self.last_query.store_elapsed(time() - start_time)
+            return rv
+
+        return run_query()
+
+    def run_query(self, query, params=None, with_column_types=False,
+                  external_tables=None, query_id=None, settings=None,
+                  types_check=False, columnar=False, start_time=None,
+                  query_key=None):
+        """
+        Executes query on server and stores result in result cache under
+        ``query_key`` if it is given.
+        """
         with self.disconnect_on_error(query, settings):
             # INSERT queries can use list/tuple/generator of list/tuples/dicts.
             # For SELECT parameters can be passed in only in dict right now.
@@ -450,6 +643,9 @@ class Client(object):
                     columnar=columnar
                 )
             self.last_query.store_elapsed(time() - start_time)
+
+            if query_key is not None and self.result_cache is not None:
+                self.result_cache.set(query_key, copy_result(rv))
             return rv
 
     def execute_with_progress(
@@ -516,14 +712,141 @@ class Client(object):
         :param chunk_size: chunk query results.
         :return: :ref:`iter-query-result` proxy.
         """
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self.make_query_key(
+                query, params=params, settings=settings,
+                external_tables=external_tables,
+                with_column_types=with_column_types, iter=True
+            )
+
+        if cache_key is not None:
+            rows = self.result_cache.get(cache_key)
+            if rows is not None:
+                self.last_query = QueryInfo()
+                rv = (row for row in rows)
+                return chunks(rv, chunk_size) if chunk_size > 1 else rv
+
         with self.disconnect_on_error(query, settings):
             rv = self.iter_process_ordinary_query(
                 query, params=params, with_column_types=with_column_types,
                 external_tables=external_tables,
                 query_id=query_id, types_check=types_check
             )
+            if cache_key is not None:
+                rv = self.iter_and_cache_result(rv, cache_key)
             return chunks(rv, chunk_size) if chunk_size > 1 else rv
 
+    def iter_and_cache_result(self, rows, cache_key):
+        """
+        Yields rows and caches them once all rows are read. Rows are no
+        longer collected when they don't fit into cache.
+        """
+        collector = ResultCollector(self.result_cache.max_bytes)
+
+        for row in rows:
+            collector.append(row)
+            yield row
+
+        if collector.rows is not None:
+            self.result_cache.set(cache_key, collector.rows)
+
+    def extract_in_params(self, query, params, external_tables):
+        """
+        Moves large list and tuple parameters used as ``IN %(name)s`` into
+        external tables. Column-encoded tables are smaller than literals
+        and are not parsed by server.
+
+        :return: tuple of query, parameters and external tables.
+        """
+        client_settings = self.connection.context.client_settings
+        threshold = client_settings['external_table_params_threshold']
+        if not threshold or not isinstance(params, dict):
+            return query, params, external_tables
+
+        query, params, tables = extract_in_params(
+            query, params, threshold, use_numpy=client_settings['use_numpy']
+        )
+        if tables:
+            external_tables = list(external_tables or []) + tables
+
+        return query, params, external_tables
+
+    def make_query_key(self, query, params=None, settings=None,
+                       external_tables=None, **options):
+        """
+        Builds result cache and query coalescing key for read-only query.
+
+        :param options: options that change result form, such as
+                        ``columnar``.
+        :return: key or ``None`` if result should not be shared.
+        """
+        if external_tables:
+            return None
+
+        if params is not None and not isinstance(params, dict):
+            return None
+
+        query = normalize_query(query)
+        if not is_read_only_query(query):
+            return None
+
+        settings = dict(settings or {})
+        client_settings = {}
+        for key in self.available_client_settings:
+            value = settings.pop(key, self.client_settings.get(key))
+            if key in self.query_key_client_settings:
+                client_settings[key] = value
+
+        query_settings = self.settings.copy()
+        query_settings.update(settings)
+
+        return (
+            query,
+            repr(sorted(options.items())),
+            repr(sorted((params or {}).items())),
+            repr(sorted(query_settings.items())),
+            repr(sorted(client_settings.items())),
+            self.connection.database,
+            self.connection.user,
+            self.warehouse
+        )
+
+    def execute_iter_blocks(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None, types_check=False):
+        """
+
+        Executes SELECT query with results streaming by blocks. Blocks are
+        yielded as they are received from server, without unpacking them
+        into rows.
+
+        :param query: query that will be send to server.
+        :param params: substitution parameters.
+                       Defaults to ``None`` (no parameters  or data).
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ByteHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :param types_check: enables type checking of data for external
+                            tables. Defaults to ``False``.
+        :return: iterator over
+                 :class:`~bytehouse_driver.block.ColumnOrientedBlock`.
+                 Block provides ``columns_with_types``, ``num_rows`` and
+                 ``get_columns()``. Columns are NumPy arrays if ``use_numpy``
+                 is enabled.
+        """
+        with self.disconnect_on_error(query, settings):
+            query, external_tables = self.prepare_query(
+                query, params, external_tables
+            )
+            self.connection.send_query(query, query_id=query_id)
+            self.connection.send_external_tables(external_tables,
+                                                 types_check=types_check)
+            return BlockIterQueryResult(self.packet_generator())
+
     def query_dataframe(
             self, query, params=None, external_tables=None, query_id=None,
             settings=None):
@@ -540,7 +863,9 @@ class Client(object):
                          ByteHouse server will generate it.
         :param settings: dictionary of query settings.
                          Defaults to ``None`` (no additional settings).
-        :return: pandas DataFrame.
+        :return: pandas DataFrame. DataFrame is built from columns kept in
+                 result cache or received by coalesced query if they are
+                 enabled.
         """
 
         try:
@@ -559,6 +884,118 @@ class Client(object):
             {col: d for d, col in zip(data, columns)}, columns=columns
         )
 
+    def query_dataframe_iter(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None, chunk_size=None):
+        """
+
+        Queries DataFrames with specified SELECT query with results
+        streaming. Only one chunk of result is kept in memory.
+
+        :param query: query that will be send to server.
+        :param params: substitution parameters.
+                       Defaults to ``None`` (no parameters  or data).
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ByteHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :param chunk_size: number of rows per DataFrame. If not specified
+                           DataFrame is yielded per block received from
+                           server.
+        :return: iterator over pandas DataFrames.
+        """
+
+        try:
+            from .numpy.result import DataFrameIterQueryResult
+        except ImportError:
+            raise RuntimeError('Extras for NumPy must be installed')
+
+        with self.disconnect_on_error(query, settings):
+            query, external_tables = self.prepare_query(
+                query, params, external_tables
+            )
+            self.connection.send_query(query, query_id=query_id)
+            self.connection.send_external_tables(external_tables)
+
+            result = DataFrameIterQueryResult(
+                self.packet_generator(), chunk_size=chunk_size
+            )
+            return iter(result)
+
+    def query_arrow(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None):
+        """
+
+        Queries Arrow table with specified SELECT query. Columns are decoded
+        directly into Arrow buffers, without creating Python object per row
+        for the most of types.
+
+        :param query: query that will be send to server.
+        :param params: substitution parameters.
+                       Defaults to ``None`` (no parameters  or data).
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ByteHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :return: pyarrow Table. Every block received from server is a record
+                 batch of the table.
+        """
+
+        try:
+            from .arrow.result import ArrowQueryResult
+        except ImportError:
+            raise RuntimeError('Extras for Arrow must be installed')
+
+        start_time = time()
+
+        settings = dict(settings or {}, use_arrow=True)
+        with self.disconnect_on_error(query, settings):
+            self.process_arrow_query(
+                query, params=params, external_tables=external_tables,
+                query_id=query_id
+            )
+            rv = ArrowQueryResult(self.packet_generator()).get_result()
+            self.last_query.store_elapsed(time() - start_time)
+            return rv
+
+    def query_arrow_iter(
+            self, query, params=None, external_tables=None, query_id=None,
+            settings=None):
+        """
+
+        Queries Arrow record batches with specified SELECT query. One record
+        batch is yielded per block received from server.
+
+        :param query: query that will be send to server.
+        :param params: substitution parameters.
+                       Defaults to ``None`` (no parameters  or data).
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ByteHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :return: iterator over pyarrow RecordBatch.
+        """
+
+        try:
+            from .arrow.result import ArrowIterQueryResult
+        except ImportError:
+            raise RuntimeError('Extras for Arrow must be installed')
+
+        settings = dict(settings or {}, use_arrow=True)
+        with self.disconnect_on_error(query, settings):
+            self.process_arrow_query(
+                query, params=params, external_tables=external_tables,
+                query_id=query_id
+            )
+            return ArrowIterQueryResult(self.packet_generator())
+
     def insert_dataframe(
             self, query, dataframe, external_tables=None, query_id=None,
             settings=None):
@@ -605,16 +1042,82 @@ class Client(object):
             self.last_query.store_elapsed(time() - start_time)
             return rv
 
+    def insert_arrow(
+            self, query, data, external_tables=None, query_id=None,
+            settings=None):
+        """
+
+        Inserts Arrow data with specified query. Arrow buffers are
+        serialized into columns without creating Python object per row for
+        the most of types.
+
+        :param query: query that will be send to server.
+        :param data: pyarrow Table, RecordBatch or iterable of them.
+                     Columns are matched by name and cast into column types.
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ByteHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :return: number of inserted rows.
+        """
+
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise RuntimeError('Extras for Arrow must be installed')
+
+        start_time = time()
+
+        settings = dict(settings or {}, use_arrow=True)
+        with self.disconnect_on_error(query, settings):
+            self.connection.send_query(query, query_id=query_id)
+            self.connection.send_external_tables(external_tables)
+
+            sample_block = self.receive_sample_block()
+            rv = None
+            if sample_block:
+                blocks = self.iter_arrow_blocks(sample_block, data)
+                rv = self.send_blocks(blocks)
+                self.receive_end_of_query()
+
+            self.last_query.store_elapsed(time() - start_time)
+            return rv
+
+    def insert_polars(
+            self, query, dataframe, external_tables=None, query_id=None,
+            settings=None):
+        """
+
+        Inserts Polars DataFrame with specified query. DataFrame is converted
+        into Arrow table sharing its buffers and inserted with
+        :meth:`insert_arrow`.
+
+        :param query: query that will be send to server.
+        :param dataframe: polars DataFrame.
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ByteHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :return: number of inserted rows.
+        """
+
+        return self.insert_arrow(
+            query, dataframe.to_arrow(), external_tables=external_tables,
+            query_id=query_id, settings=settings
+        )
+
     def process_ordinary_query_with_progress(
             self, query, params=None, with_column_types=False,
             external_tables=None, query_id=None,
             types_check=False, columnar=False):
 
-        if params is not None:
-            query = self.substitute_params(
-                query, params, self.connection.context
-            )
-
+        query, external_tables = self.prepare_query(
+            query, params, external_tables
+        )
         self.connection.send_query(query, query_id=query_id)
         self.connection.send_external_tables(external_tables,
                                              types_check=types_check)
@@ -626,11 +1129,9 @@ class Client(object):
             external_tables=None, query_id=None,
             types_check=False, columnar=False):
 
-        if params is not None:
-            query = self.substitute_params(
-                query, params, self.connection.context
-            )
-
+        query, external_tables = self.prepare_query(
+            query, params, external_tables
+        )
         self.connection.send_query(query, query_id=query_id)
         self.connection.send_external_tables(external_tables,
                                              types_check=types_check)
@@ -642,16 +1143,23 @@ class Client(object):
             external_tables=None, query_id=None,
             types_check=False):
 
-        if params is not None:
-            query = self.substitute_params(
-                query, params, self.connection.context
-            )
-
+        query, external_tables = self.prepare_query(
+            query, params, external_tables
+        )
         self.connection.send_query(query, query_id=query_id)
         self.connection.send_external_tables(external_tables,
                                              types_check=types_check)
         return self.iter_receive_result(with_column_types=with_column_types)
 
+    def process_arrow_query(
+            self, query, params=None, external_tables=None, query_id=None):
+
+        query, external_tables = self.prepare_query(
+            query, params, external_tables
+        )
+        self.connection.send_query(query, query_id=query_id)
+        self.connection.send_external_tables(external_tables)
+
     def process_insert_query(self, query_without_data, data,
                              external_tables=None, query_id=None,
                              types_check=False, columnar=False):
@@ -669,28 +1177,56 @@ class Client(object):
     def receive_sample_block(self):
         while True:
             packet = self.connection.receive_packet()
-
-            if packet.type == ServerPacketTypes.DATA:
+            if self.handle_sample_block_packet(packet):
                 return packet.block
 
-            elif packet.type == ServerPacketTypes.EXCEPTION:
-                raise packet.exception
+    def handle_sample_block_packet(self, packet):
+        """
+        :return: ``True`` if packet contains sample block.
+        """
+        if packet.type == ServerPacketTypes.DATA:
+            return True
 
-            elif packet.type == ServerPacketTypes.LOG:
-                log_block(packet.block)
+        elif packet.type == ServerPacketTypes.EXCEPTION:
+            raise packet.exception
 
-            elif packet.type == ServerPacketTypes.TABLE_COLUMNS:
-                pass
+        elif packet.type == ServerPacketTypes.LOG:
+            log_block(packet.block)
 
-            else:
-                message = self.connection.unexpected_packet_message(
-                    'Data, Exception, Log or TableColumns', packet.type
-                )
-                raise errors.UnexpectedPacketFromServerError(message)
+        elif packet.type == ServerPacketTypes.TABLE_COLUMNS:
+            pass
+
+        else:
+            message = self.connection.unexpected_packet_message(
+                'Data, Exception, Log or TableColumns', packet.type
+            )
+            raise errors.UnexpectedPacketFromServerError(message)
+
+        return False
 
     def send_data(self, sample_block, data, types_check=False, columnar=False):
+        blocks = self.iter_data_blocks(
+            sample_block, data, types_check=types_check, columnar=columnar
+        )
+        return self.send_blocks(blocks)
+
+    def send_blocks(self, blocks):
         inserted_rows = 0
 
+        client_settings = self.connection.context.client_settings
+        depth = int(client_settings['insert_pipeline_depth'])
+        if depth:
+            pipeline = InsertPipeline(self.connection, blocks, depth)
+            return pipeline.run()
+
+        for block in blocks:
+            self.connection.send_data(block)
+            inserted_rows += block.num_rows
+
+        return inserted_rows
+
+    def iter_data_blocks(self, sample_block, data, types_check=False,
+                         columnar=False):
         client_settings = self.connection.context.client_settings
         block_cls = ColumnOrientedBlock if columnar else RowOrientedBlock
 
@@ -712,42 +1248,66 @@ class Client(object):
             slicer = column_chunks if columnar else chunks
 
         for chunk in slicer(data, client_settings['insert_block_size']):
-            block = block_cls(sample_block.columns_with_types, chunk,
-                              types_check=types_check)
-            self.connection.send_data(block)
-            inserted_rows += block.num_rows
+            yield block_cls(sample_block.columns_with_types, chunk,
+                            types_check=types_check)
 
         # Empty block means end of data.
-        self.connection.send_data(block_cls())
-        return inserted_rows
+        yield block_cls()
+
+    def iter_arrow_blocks(self, sample_block, data):
+        from .arrow.block import ArrowColumnOrientedBlock
+        from .arrow.helpers import column_chunks as arrow_column_chunks
+
+        context = self.connection.context
+        columns_with_types = sample_block.columns_with_types
+        columns = [x[0] for x in columns_with_types]
+
+        chunks = arrow_column_chunks(
+            data, columns, context.client_settings['insert_block_size']
+        )
+        for chunk in chunks:
+            yield ArrowColumnOrientedBlock(
+                columns_with_types, chunk, context=context
+            )
+
+        # Empty block means end of data.
+        yield ColumnOrientedBlock()
 
     def receive_end_of_query(self):
         while True:
             packet = self.connection.receive_packet()
-
-            if packet.type == ServerPacketTypes.END_OF_STREAM:
+            if self.handle_end_of_query_packet(packet):
                 break
 
-            elif packet.type == ServerPacketTypes.PROGRESS:
-                continue
+    def handle_end_of_query_packet(self, packet):
+        """
+        :return: ``True`` if packet is the end of stream.
+        """
+        if packet.type == ServerPacketTypes.END_OF_STREAM:
+            return True
 
-            elif packet.type == ServerPacketTypes.EXCEPTION:
-                raise packet.exception
+        elif packet.type == ServerPacketTypes.PROGRESS:
+            pass
 
-            elif packet.type == ServerPacketTypes.LOG:
-                log_block(packet.block)
+        elif packet.type == ServerPacketTypes.EXCEPTION:
+            raise packet.exception
 
-            elif packet.type == ServerPacketTypes.TABLE_COLUMNS:
-                pass
+        elif packet.type == ServerPacketTypes.LOG:
+            log_block(packet.block)
 
-            elif packet.type == ServerPacketTypes.PROFILE_EVENTS:
-                pass
+        elif packet.type == ServerPacketTypes.TABLE_COLUMNS:
+            pass
 
-            else:
-                message = self.connection.unexpected_packet_message(
-                    'Exception, EndOfStream or Log', packet.type
-                )
-                raise errors.UnexpectedPacketFromServerError(message)
+        elif packet.type == ServerPacketTypes.PROFILE_EVENTS:
+            pass
+
+        else:
+            message = self.connection.unexpected_packet_message(
+                'Exception, EndOfStream or Log', packet.type
+            )
+            raise errors.UnexpectedPacketFromServerError(message)
+
+        return False
 
     def cancel(self, with_column_types=False):
         # TODO: Add warning if already cancelled.
@@ -755,6 +1315,22 @@ class Client(object):
         # Client must still read until END_OF_STREAM packet.
         return self.receive_result(with_column_types=with_column_types)
 
+    def prepare_query(self, query, params, external_tables=None):
+        """
+        Substitutes parameters into query. Large ``IN`` list parameters are
+        moved into external tables.
+
+        :return: tuple of query and external tables to send.
+        """
+        if params is None:
+            return query, external_tables
+
+        query, params, external_tables = self.extract_in_params(
+            query, params, external_tables
+        )
+        query = self.substitute_params(query, params, self.connection.context)
+        return query, external_tables
+
     def substitute_params(self, query, params, context):
         """
         Substitutes parameters into a provided query.
@@ -847,7 +1423,7 @@ class Client(object):
             elif name == 'secure':
                 kwargs[name] = asbool(value)
 
-            elif name == 'use_numpy':
+            elif name in ('use_numpy', 'numpy_nullable_dtypes'):
                 settings[name] = asbool(value)
 
             elif name == 'round_robin':
@@ -859,7 +1435,7 @@ class Client(object):
             elif name in timeouts:
                 kwargs[name] = float(value)
 
-            elif name == 'compress_block_size':
+            elif name in ('compress_block_size', 'compress_threads'):
                 kwargs[name] = int(value)
 
             elif name == 'settings_is_important':
@@ -24,12 +24,12 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from copy import copy
 from itertools import chain
-from struct import Struct
 
 from .base import Column
 from .intcolumn import UInt64Column
-from ..util.helpers import pairwise
+from ..util.helpers import get_struct, pairwise
 
 
 class ArrayColumn(Column):
@@ -60,20 +60,23 @@ class ArrayColumn(Column):
         super(ArrayColumn, self).__init__(**kwargs)
         self.null_value = []
 
+    def _wrap(self):
+        # Column is reused for many blocks. Wrapping is done on a copy.
+        column = copy(self)
+        column.nested_column = ArrayColumn(self.nested_column)
+        column.nested_column.nullable = self.nullable
+        column.nullable = False
+        return column
+
     def write_data(self, data, buf):
         # Column of Array(T) is stored in "compact" format and passed to server
         # wrapped into another Array without size of wrapper array.
-        self.nested_column = ArrayColumn(self.nested_column)
-        self.nested_column.nullable = self.nullable
-        self.nullable = False
-        self._write_depth_0_size = False
-        self._write(data, buf)
+        column = self._wrap()
+        column._write_depth_0_size = False
+        column._write(data, buf)
 
     def read_data(self, rows, buf):
-        self.nested_column = ArrayColumn(self.nested_column)
-        self.nested_column.nullable = self.nullable
-        self.nullable = False
-        return self._read(rows, buf)[0]
+        return self._wrap()._read(rows, buf)[0]
 
     def _write_sizes(self, value, buf):
         nulls_map = []
@@ -101,7 +104,7 @@ class ArrayColumn(Column):
         if nulls_map:
             self._write_nulls_map(nulls_map, buf)
 
-        ns = Struct('<{}Q'.format(len(sizes)))
+        ns = get_struct('<{}Q'.format(len(sizes)))
         buf.write(ns.pack(*sizes))
 
     def _write_data(self, value, buf):
@@ -146,8 +149,8 @@ class ArrayColumn(Column):
         while (isinstance(nested_column, ArrayColumn)):
             if cur_level_slice is None:
                 cur_level_slice = [0]
-            ns = Struct('<{}Q'.format(cur_level_slice_size))
-            nested_sizes = ns.unpack(buf.read(ns.size))
+            ns = get_struct('<{}Q'.format(cur_level_slice_size))
+            nested_sizes = ns.unpack(buf.read_view(ns.size))
             cur_level_slice.extend(nested_sizes)
             slices_series.append(cur_level_slice)
             cur_level_slice = None
@@ -0,0 +1,70 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import numpy as np
+import pyarrow as pa
+
+from .base import (
+    ArrowColumn, combine_chunks, get_offsets, read_offsets, write_offsets
+)
+
+
+class ArrowArrayColumn(ArrowColumn):
+    """
+    Offsets of nested arrays precede their data, so every level reads its
+    offsets and then nested column.
+    """
+
+    def __init__(self, nested_column, **kwargs):
+        self.nested_column = nested_column
+        self.arrow_type = pa.list_(nested_column.arrow_type)
+        super(ArrowArrayColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        self.nested_column.read_state_prefix(buf)
+
+    def write_state_prefix(self, buf):
+        self.nested_column.write_state_prefix(buf)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        offsets = read_offsets(buf, n_items)
+        values = self.nested_column.read_data(int(offsets[-1]), buf)
+        if offsets.dtype == np.int64:
+            return pa.LargeListArray.from_arrays(pa.array(offsets), values)
+        return pa.ListArray.from_arrays(pa.array(offsets), values)
+
+    def prepare_array(self, items):
+        # Values are cast by nested column. Large lists are kept as is.
+        items = combine_chunks(items)
+        if not pa.types.is_list(items.type) and \
+                not pa.types.is_large_list(items.type):
+            items = items.cast(pa.list_(items.type.value_type))
+        return items
+
+    def _write_data(self, items, buf, nulls_map=None):
+        offsets, values = get_offsets(items)
+        write_offsets(offsets, buf)
+        self.nested_column.write_data(values, buf)
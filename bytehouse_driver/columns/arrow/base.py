@@ -0,0 +1,252 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import numpy as np
+import pyarrow as pa
+
+from ..base import Column
+
+# Largest offset of Arrow types with int32 offsets.
+INT32_MAX = 0x7fffffff
+
+
+def read_array(buf, n_items, dtype):
+    """
+    Reads ``n_items`` fixed-width values as NumPy array. Values are copied
+    only if they are still owned by reader that refills its buffer in place.
+    """
+    data = buf.read_view(n_items * dtype.itemsize)
+    items = np.frombuffer(data, dtype, n_items)
+    if data.obj is buf.buffer and buf.refills_in_place:
+        items = items.copy()
+    return items
+
+
+def read_buffer(buf, size):
+    """
+    Reads ``size`` bytes as Arrow buffer. Same copying rules as for
+    :func:`read_array` are applied.
+    """
+    data = buf.read_view(size)
+    if data.obj is buf.buffer and buf.refills_in_place:
+        data = data.tobytes()
+    return pa.py_buffer(data)
+
+
+def read_offsets(buf, n_items):
+    """
+    Reads ByteHouse UInt64 end offsets and returns Arrow offsets starting
+    with zero. Offsets are int32 unless the last one exceeds
+    :data:`INT32_MAX`, then they are int64 for Arrow large types.
+    """
+    ends = read_array(buf, n_items, np.dtype('<u8'))
+    dtype = np.int32
+    if n_items and ends[-1] > INT32_MAX:
+        dtype = np.int64
+    offsets = np.zeros(n_items + 1, dtype=dtype)
+    offsets[1:] = ends
+    return offsets
+
+
+def get_large_type(arrow_type):
+    """
+    Returns Arrow type with string, binary and list types replaced by their
+    large counterparts with int64 offsets, nested types included.
+    """
+    t = pa.types
+    if t.is_string(arrow_type):
+        return pa.large_string()
+    elif t.is_binary(arrow_type):
+        return pa.large_binary()
+    elif t.is_list(arrow_type) or t.is_large_list(arrow_type):
+        return pa.large_list(get_large_type(arrow_type.value_type))
+    elif t.is_map(arrow_type):
+        return pa.map_(get_large_type(arrow_type.key_type),
+                       get_large_type(arrow_type.item_type))
+    elif t.is_struct(arrow_type):
+        return pa.struct([
+            field.with_type(get_large_type(field.type))
+            for field in arrow_type
+        ])
+    elif t.is_dictionary(arrow_type):
+        return pa.dictionary(arrow_type.index_type,
+                             get_large_type(arrow_type.value_type))
+    return arrow_type
+
+
+def combine_chunks(items):
+    if isinstance(items, pa.ChunkedArray):
+        return items.combine_chunks()
+    return items
+
+
+def get_nulls_map(items):
+    """
+    Returns null map of Arrow array as NumPy bool array or ``None`` if array
+    has no nulls.
+    """
+    if not items.null_count:
+        return None
+    return items.is_null().to_numpy(zero_copy_only=False)
+
+
+def get_values(items, dtype):
+    """
+    Returns data buffer of fixed-width Arrow array as NumPy array without
+    copying. Slice offset of array is respected.
+    """
+    return np.frombuffer(
+        items.buffers()[1], dtype, len(items), items.offset * dtype.itemsize
+    )
+
+
+def get_offsets(items):
+    """
+    Returns list offsets of Arrow list or map array as NumPy array of
+    n + 1 values and child values spanned by them.
+    """
+    offsets = items.offsets.to_numpy()
+    first, last = int(offsets[0]), int(offsets[-1])
+    return offsets, items.values.slice(first, last - first)
+
+
+def write_offsets(offsets, buf):
+    """
+    Writes Arrow list offsets as ByteHouse UInt64 end offsets.
+    """
+    buf.write((offsets[1:] - offsets[0]).astype('<u8'))
+
+
+def make_array(arrow_type, n_items, buffers, nulls_map=None):
+    """
+    Builds Arrow array from data buffers and ByteHouse null map.
+    """
+    validity = None
+    null_count = 0
+    if nulls_map is not None:
+        null_count = int(np.count_nonzero(nulls_map))
+        if null_count:
+            validity = pa.py_buffer(
+                np.packbits(~nulls_map, bitorder='little')
+            )
+
+    return pa.Array.from_buffers(
+        arrow_type, n_items, [validity] + list(buffers), null_count
+    )
+
+
+class ArrowColumn(Column):
+    """
+    Reads column into Arrow array and writes Arrow array into column. Null
+    map is translated from and into validity bitmap.
+    """
+    arrow_type = None
+    safe_cast = True
+
+    def read_data(self, n_items, buf):
+        nulls_map = None
+        if self.nullable:
+            nulls_map = read_array(buf, n_items, np.dtype(np.bool_))
+
+        return self._read_data(n_items, buf, nulls_map=nulls_map)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        raise NotImplementedError
+
+    def prepare_array(self, items):
+        """
+        Casts written array into column's Arrow type.
+        """
+        items = combine_chunks(items)
+        if items.type != self.arrow_type:
+            items = items.cast(self.arrow_type, safe=self.safe_cast)
+        return items
+
+    def write_data(self, items, buf):
+        items = self.prepare_array(items)
+        nulls_map = get_nulls_map(items)
+
+        if self.nullable:
+            if nulls_map is None:
+                buf.write(bytes(len(items)))
+            else:
+                buf.write(nulls_map.view(np.uint8))
+
+        self._write_data(items, buf, nulls_map=nulls_map)
+
+    def _write_data(self, items, buf, nulls_map=None):
+        raise NotImplementedError
+
+
+class ArrowFormatColumn(ArrowColumn):
+    """
+    Wraps fixed-width values into Arrow array without copying.
+    """
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        size = n_items * self.arrow_type.bit_width // 8
+        data = read_buffer(buf, size)
+        return make_array(self.arrow_type, n_items, [data], nulls_map)
+
+    def _write_data(self, items, buf, nulls_map=None):
+        dtype = np.dtype('<u{}'.format(self.arrow_type.bit_width // 8))
+        values = get_values(items, dtype)
+        if nulls_map is not None:
+            # Values behind nulls are undefined in Arrow.
+            values = values.copy()
+            values[nulls_map] = 0
+        buf.write(values)
+
+
+class ArrowConvertedColumn(ArrowColumn):
+    """
+    Reads fixed-width values with ``dtype`` and casts them into the layout
+    of ``arrow_type``.
+    """
+    dtype = None
+
+    def convert(self, items):
+        raise NotImplementedError
+
+    def revert(self, items):
+        """
+        Inverse of :meth:`convert`, applied to values of written array.
+        """
+        raise NotImplementedError
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        items = self.convert(read_array(buf, n_items, self.dtype))
+        return make_array(
+            self.arrow_type, n_items, [pa.py_buffer(items)], nulls_map
+        )
+
+    def _write_data(self, items, buf, nulls_map=None):
+        dtype = np.dtype('<i{}'.format(self.arrow_type.bit_width // 8))
+        values = get_values(items, dtype)
+        if nulls_map is not None:
+            values = values.copy()
+            values[nulls_map] = 0
+        buf.write(self.revert(values).astype(self.dtype))
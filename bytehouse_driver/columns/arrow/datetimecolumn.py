@@ -0,0 +1,92 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import numpy as np
+import pyarrow as pa
+
+from .base import ArrowConvertedColumn
+from ...util.compat import get_localzone_name_compat
+
+# Arrow timestamp unit for DateTime64 precision.
+units = ((0, 's'), (3, 'ms'), (6, 'us'), (9, 'ns'))
+
+
+class ArrowDateTimeColumn(ArrowConvertedColumn):
+    dtype = np.dtype('<u4')
+    # Fractional seconds are truncated on write as with datetime objects.
+    safe_cast = False
+
+    def __init__(self, tz_name=None, **kwargs):
+        self.arrow_type = pa.timestamp('s', tz=tz_name)
+        super(ArrowDateTimeColumn, self).__init__(**kwargs)
+
+    def convert(self, items):
+        return items.astype(np.int64)
+
+    def revert(self, items):
+        return items
+
+
+class ArrowDateTime64Column(ArrowConvertedColumn):
+    dtype = np.dtype('<i8')
+    safe_cast = False
+
+    def __init__(self, scale=0, tz_name=None, **kwargs):
+        digits, unit = next(x for x in units if x[0] >= min(scale, 9))
+        self.factor = 10 ** (digits - scale)
+        self.arrow_type = pa.timestamp(unit, tz=tz_name)
+        super(ArrowDateTime64Column, self).__init__(**kwargs)
+
+    def convert(self, items):
+        return items * self.factor if self.factor != 1 else items
+
+    def revert(self, items):
+        return items // self.factor if self.factor != 1 else items
+
+
+def create_arrow_datetime_column(node, column_options):
+    """
+    Timestamps are kept in UTC and labeled with column's timezone. Columns
+    without timezone are labeled with server's or, if
+    ``use_client_time_zone`` is set, client's timezone.
+    """
+    args = list(node.args)
+    if node.name == 'DateTime64':
+        cls = ArrowDateTime64Column
+        column_options = dict(column_options, scale=args.pop(0))
+    else:
+        cls = ArrowDateTimeColumn
+
+    if args:
+        tz_name = args[0]
+    else:
+        context = column_options['context']
+        if context.settings.get('use_client_time_zone', False):
+            tz_name = get_localzone_name_compat()
+        else:
+            tz_name = context.server_info.timezone
+
+    return cls(tz_name=tz_name, **column_options)
@@ -0,0 +1,74 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pyarrow as pa
+
+from .base import ArrowColumn, combine_chunks
+
+
+class ArrowGenericColumn(ArrowColumn):
+    """
+    Reads column with generic reader and converts items into Arrow array.
+    Written arrays are converted into Python objects for generic writer.
+    Creates Python object per row, so it's used only for types without
+    native Arrow reader.
+
+    :param column: generic column.
+    :param arrow_type: type of resulting array.
+    :param convert: callable applied to every non-null item.
+    """
+
+    def __init__(self, column, arrow_type, convert=None, **kwargs):
+        self.column = column
+        self.arrow_type = arrow_type
+        self.convert = convert
+        super(ArrowGenericColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        return self.column.read_state_prefix(buf)
+
+    def write_state_prefix(self, buf):
+        self.column.write_state_prefix(buf)
+
+    def prepare_array(self, items):
+        return combine_chunks(items)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        items = self.column.read_data(n_items, buf)
+        if self.convert:
+            convert = self.convert
+            items = [None if x is None else convert(x) for x in items]
+
+        return pa.array(items, type=self.arrow_type, mask=nulls_map)
+
+    def _write_data(self, items, buf, nulls_map=None):
+        items = items.to_pylist()
+        if nulls_map is not None:
+            # Null map is already written, generic column gets placeholders.
+            null_value = self.column.null_value
+            items = [null_value if x is None else x for x in items]
+
+        self.column.write_data(items, buf)
@@ -0,0 +1,97 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import numpy as np
+import pyarrow as pa
+
+from .base import ArrowConvertedColumn, ArrowFormatColumn
+
+
+class ArrowInt8Column(ArrowFormatColumn):
+    ch_type = 'Int8'
+    arrow_type = pa.int8()
+
+
+class ArrowUInt8Column(ArrowFormatColumn):
+    ch_type = 'UInt8'
+    arrow_type = pa.uint8()
+
+
+class ArrowInt16Column(ArrowFormatColumn):
+    ch_type = 'Int16'
+    arrow_type = pa.int16()
+
+
+class ArrowUInt16Column(ArrowFormatColumn):
+    ch_type = 'UInt16'
+    arrow_type = pa.uint16()
+
+
+class ArrowInt32Column(ArrowFormatColumn):
+    ch_type = 'Int32'
+    arrow_type = pa.int32()
+
+
+class ArrowUInt32Column(ArrowFormatColumn):
+    ch_type = 'UInt32'
+    arrow_type = pa.uint32()
+
+
+class ArrowInt64Column(ArrowFormatColumn):
+    ch_type = 'Int64'
+    arrow_type = pa.int64()
+
+
+class ArrowUInt64Column(ArrowFormatColumn):
+    ch_type = 'UInt64'
+    arrow_type = pa.uint64()
+
+
+class ArrowFloat32Column(ArrowFormatColumn):
+    ch_type = 'Float32'
+    arrow_type = pa.float32()
+
+
+class ArrowFloat64Column(ArrowFormatColumn):
+    ch_type = 'Float64'
+    arrow_type = pa.float64()
+
+
+class ArrowDate32Column(ArrowFormatColumn):
+    ch_type = 'Date32'
+    arrow_type = pa.date32()
+
+
+class ArrowDateColumn(ArrowConvertedColumn):
+    ch_type = 'Date'
+    arrow_type = pa.date32()
+    dtype = np.dtype('<u2')
+
+    def convert(self, items):
+        return items.astype(np.int32)
+
+    def revert(self, items):
+        return items
@@ -0,0 +1,124 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from math import log
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .base import ArrowColumn, read_array
+from ..lowcardinalitycolumn import LowCardinalityColumn
+from ...reader import read_binary_uint64
+from ...writer import write_binary_int64
+
+
+class ArrowLowCardinalityColumn(ArrowColumn):
+    """
+    Index and keys are returned as Arrow dictionary array with int32
+    indices, so batches of one query share the same type.
+    """
+    key_dtypes = {
+        0: np.dtype('<u1'),
+        1: np.dtype('<u2'),
+        2: np.dtype('<u4'),
+        3: np.dtype('<u8')
+    }
+
+    def __init__(self, nested_column, **kwargs):
+        self.nested_column = nested_column
+        # Null is stored as index element with key 0.
+        self.nested_nullable = nested_column.nullable
+        nested_column.nullable = False
+        self.arrow_type = pa.dictionary(pa.int32(), nested_column.arrow_type)
+        super(ArrowLowCardinalityColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        return read_binary_uint64(buf)
+
+    def write_state_prefix(self, buf):
+        # KeysSerializationVersion. See ByteHouse docs.
+        write_binary_int64(1, buf)
+
+    def prepare_array(self, items):
+        items = super(ArrowLowCardinalityColumn, self).prepare_array(items)
+
+        # Index must consist of unique elements. Dictionaries built by Arrow
+        # are unique, arbitrary ones are re-encoded.
+        dictionary = items.dictionary
+        if len(pc.unique(dictionary)) != len(dictionary) or \
+                dictionary.null_count:
+            items = items.cast(dictionary.type).dictionary_encode()
+            items = items.cast(self.arrow_type)
+
+        return items
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        if not n_items:
+            return pa.array([], type=self.arrow_type)
+
+        serialization_type = read_binary_uint64(buf)
+
+        # Lowest byte contains info about key type.
+        key_dtype = self.key_dtypes[serialization_type & 0xf]
+
+        index_size = read_binary_uint64(buf)
+        index = self.nested_column.read_data(index_size, buf)
+
+        read_binary_uint64(buf)  # number of keys
+        keys = read_array(buf, n_items, key_dtype).astype(np.int32)
+
+        mask = keys == 0 if self.nested_nullable else None
+        indices = pa.array(keys, mask=mask)
+        return pa.DictionaryArray.from_arrays(indices, index)
+
+    def _write_data(self, items, buf, nulls_map=None):
+        # Do not write anything for empty column.
+        if not len(items):
+            return
+
+        index = items.dictionary
+        indices = items.indices
+        if self.nested_nullable:
+            # First element represents NULL if column is nullable.
+            index = pa.concat_arrays([pa.nulls(1, index.type), index])
+            keys = indices.fill_null(-1).to_numpy() + 1
+        else:
+            keys = indices.fill_null(0).to_numpy()
+
+        if not len(index):
+            # All values are nulls of non-nullable column.
+            index = pa.nulls(1, index.type)
+
+        int_type = int(log(len(index), 2) / 8)
+        serialization_type = LowCardinalityColumn.serialization_type | \
+            int_type
+
+        write_binary_int64(serialization_type, buf)
+        write_binary_int64(len(index), buf)
+        self.nested_column.write_data(index, buf)
+        write_binary_int64(len(items), buf)
+        buf.write(keys.astype(self.key_dtypes[int_type]))
@@ -0,0 +1,78 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import numpy as np
+import pyarrow as pa
+
+from .base import (
+    INT32_MAX, ArrowColumn, combine_chunks, get_offsets, read_offsets,
+    write_offsets
+)
+
+
+class ArrowMapColumn(ArrowColumn):
+    def __init__(self, key_column, value_column, **kwargs):
+        self.key_column = key_column
+        self.value_column = value_column
+        self.arrow_type = pa.map_(key_column.arrow_type,
+                                  value_column.arrow_type)
+        super(ArrowMapColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        self.key_column.read_state_prefix(buf)
+        self.value_column.read_state_prefix(buf)
+
+    def write_state_prefix(self, buf):
+        self.key_column.write_state_prefix(buf)
+        self.value_column.write_state_prefix(buf)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        offsets = read_offsets(buf, n_items)
+        if offsets.dtype == np.int64:
+            # Arrow has no map type with int64 offsets.
+            raise OverflowError(
+                'Map column with more than {} entries in one block can not '
+                'be read into Arrow array'.format(INT32_MAX)
+            )
+        n_values = int(offsets[-1])
+        keys = self.key_column.read_data(n_values, buf)
+        values = self.value_column.read_data(n_values, buf)
+        return pa.MapArray.from_arrays(pa.array(offsets), keys, values)
+
+    def prepare_array(self, items):
+        # Lists of key-value structs are accepted as well. Keys and values
+        # are cast by nested columns.
+        items = combine_chunks(items)
+        if pa.types.is_large_list(items.type):
+            items = items.cast(pa.list_(items.type.value_type))
+        return items
+
+    def _write_data(self, items, buf, nulls_map=None):
+        offsets, values = get_offsets(items)
+        keys, values = values.flatten()
+        write_offsets(offsets, buf)
+        self.key_column.write_data(keys, buf)
+        self.value_column.write_data(values, buf)
@@ -0,0 +1,168 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pyarrow as pa
+
+from ... import errors
+from ..nullablecolumn import create_nullable_column
+from ..service import alias_by_name, get_cached_column, get_column_by_spec
+from ..typespec import Field, parse_type_spec
+from .arraycolumn import ArrowArrayColumn
+from .datetimecolumn import create_arrow_datetime_column
+from .genericcolumn import ArrowGenericColumn
+from .intcolumn import (
+    ArrowInt8Column, ArrowInt16Column, ArrowInt32Column, ArrowInt64Column,
+    ArrowUInt8Column, ArrowUInt16Column, ArrowUInt32Column, ArrowUInt64Column,
+    ArrowFloat32Column, ArrowFloat64Column, ArrowDateColumn, ArrowDate32Column
+)
+from .lowcardinalitycolumn import ArrowLowCardinalityColumn
+from .mapcolumn import ArrowMapColumn
+from .stringcolumn import ArrowStringColumn, ArrowFixedStringColumn
+from .tuplecolumn import ArrowTupleColumn
+
+column_by_type = {c.ch_type: c for c in [
+    ArrowInt8Column, ArrowInt16Column, ArrowInt32Column, ArrowInt64Column,
+    ArrowUInt8Column, ArrowUInt16Column, ArrowUInt32Column, ArrowUInt64Column,
+    ArrowFloat32Column, ArrowFloat64Column, ArrowDateColumn, ArrowDate32Column,
+    ArrowStringColumn
+]}
+
+
+def get_generic_arrow_type(node):
+    """
+    Returns Arrow type and item converter for types read by generic columns.
+    Types without Arrow counterpart are returned as strings.
+    """
+    if node.name == 'Decimal':
+        precision, scale = node.args
+        if precision <= 38:
+            return pa.decimal128(precision, scale), None
+        return pa.decimal256(precision, scale), None
+
+    elif node.name.startswith('Interval'):
+        return pa.int64(), None
+
+    elif node.name == 'Nothing':
+        return pa.null(), None
+
+    return pa.string(), str
+
+
+def get_arrow_column_by_spec(spec, column_options):
+    def create_column_with_options(x):
+        return get_arrow_column_by_spec(x, column_options)
+
+    node = parse_type_spec(spec)
+    name = node.name
+
+    if name == 'FixedString':
+        return ArrowFixedStringColumn(node.args[0], **column_options)
+
+    elif name in ('DateTime', 'DateTime64'):
+        return create_arrow_datetime_column(node, column_options)
+
+    elif name == 'Nullable':
+        return create_nullable_column(spec, create_column_with_options)
+
+    elif name == 'LowCardinality':
+        return ArrowLowCardinalityColumn(
+            create_column_with_options(node.args[0].spec), **column_options
+        )
+
+    elif name == 'Array':
+        return ArrowArrayColumn(
+            create_column_with_options(node.args[0].spec), **column_options
+        )
+
+    elif name == 'Nested':
+        return create_column_with_options(
+            'Array(Tuple{})'.format(node.spec[len(name):])
+        )
+
+    elif name == 'Tuple':
+        columns, names = [], []
+        for i, arg in enumerate(node.args, 1):
+            if isinstance(arg, Field):
+                names.append(arg.name)
+                arg = arg.type
+            else:
+                names.append(str(i))
+            columns.append(create_column_with_options(arg.spec))
+
+        return ArrowTupleColumn(columns, names, **column_options)
+
+    elif name == 'Map':
+        key, value = node.args
+        return ArrowMapColumn(
+            create_column_with_options(key.spec),
+            create_column_with_options(value.spec),
+            **column_options
+        )
+
+    elif name == 'SimpleAggregateFunction':
+        return create_column_with_options(node.args[1].spec)
+
+    elif name in alias_by_name:
+        return create_column_with_options(
+            alias_by_name[name] + node.spec[len(name):]
+        )
+
+    elif spec in column_by_type:
+        return column_by_type[spec](**column_options)
+
+    column = get_column_by_spec(spec, column_options, use_numpy=False)
+    arrow_type, convert = get_generic_arrow_type(node)
+    return ArrowGenericColumn(column, arrow_type, convert=convert,
+                              **column_options)
+
+
+def get_arrow_column(context, spec):
+    def factory():
+        return get_arrow_column_by_spec(spec, {'context': context})
+
+    return get_cached_column(context, ('arrow', spec), factory)
+
+
+def read_arrow_column(context, column_spec, n_items, buf):
+    col = get_arrow_column(context, column_spec)
+    col.read_state_prefix(buf)
+    return col.read_data(n_items, buf)
+
+
+def write_arrow_column(context, column_name, column_spec, items, buf,
+                       types_check=False):
+    column = get_arrow_column(context, column_spec)
+
+    try:
+        column.write_state_prefix(buf)
+        column.write_data(items, buf)
+
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError,
+            pa.ArrowTypeError, OverflowError) as e:
+        raise errors.TypeMismatchError(
+            'Type mismatch in VALUES section. '
+            'Column {}: {}'.format(column_name, str(e))
+        )
@@ -0,0 +1,153 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import numpy as np
+import pyarrow as pa
+
+from .base import (
+    ArrowColumn, combine_chunks, get_large_type, make_array, read_buffer
+)
+from ...errors import TooLargeStringSize
+
+
+def get_string_buffers(items):
+    """
+    Returns offsets of string or binary Arrow array as NumPy array of n + 1
+    values and data buffer. Offsets of large types are int64.
+    """
+    large = pa.types.is_large_string(items.type) or \
+        pa.types.is_large_binary(items.type)
+    dtype = np.dtype(np.int64 if large else np.int32)
+    if not len(items):
+        return np.zeros(1, dtype=dtype), b''
+
+    _, offsets, data = items.buffers()
+    offsets = np.frombuffer(
+        offsets, dtype, len(items) + 1, items.offset * dtype.itemsize
+    )
+    return offsets, data if data is not None else b''
+
+
+class ArrowStringColumn(ArrowColumn):
+    """
+    Decodes strings straight into Arrow offsets and data buffers. Strings
+    are returned as binary if ``strings_as_bytes`` is set or encoding is not
+    UTF-8.
+    """
+    ch_type = 'String'
+
+    def __init__(self, **kwargs):
+        settings = kwargs['context'].client_settings
+        encoding = settings.get('strings_encoding', 'utf-8')
+        # Written UTF-8 strings are re-encoded only for other encodings.
+        self.encoding = None
+        if settings['strings_as_bytes']:
+            self.arrow_type = pa.binary()
+        elif encoding.lower().replace('-', '') != 'utf8':
+            self.arrow_type = pa.binary()
+            self.encoding = encoding
+        else:
+            self.arrow_type = pa.string()
+
+        super(ArrowStringColumn, self).__init__(**kwargs)
+
+    def prepare_array(self, items):
+        is_unicode = pa.types.is_unicode(items.type) or \
+            pa.types.is_large_unicode(items.type)
+        if self.encoding is not None and is_unicode:
+            encoding = self.encoding
+            items = pa.array(
+                [None if x is None else x.encode(encoding)
+                 for x in items.to_pylist()],
+                type=self.arrow_type
+            )
+
+        # Large types are kept, casting them may overflow int32 offsets.
+        items = combine_chunks(items)
+        large_type = get_large_type(self.arrow_type)
+        if pa.types.is_large_string(items.type) or \
+                pa.types.is_large_binary(items.type):
+            if items.type != large_type:
+                items = items.cast(large_type, safe=self.safe_cast)
+            return items
+
+        return super(ArrowStringColumn, self).prepare_array(items)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        offsets, data, large = buf.read_string_buffers(n_items)
+        arrow_type = self.arrow_type
+        if large:
+            arrow_type = get_large_type(arrow_type)
+        buffers = [pa.py_buffer(offsets), pa.py_buffer(data)]
+        return make_array(arrow_type, n_items, buffers, nulls_map)
+
+    def _write_data(self, items, buf, nulls_map=None):
+        buf.write_string_buffers(*get_string_buffers(items))
+
+
+class ArrowFixedStringColumn(ArrowColumn):
+    ch_type = 'FixedString'
+
+    def __init__(self, length, **kwargs):
+        self.length = length
+        self.arrow_type = pa.binary(length)
+        super(ArrowFixedStringColumn, self).__init__(**kwargs)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        data = read_buffer(buf, n_items * self.length)
+        return make_array(self.arrow_type, n_items, [data], nulls_map)
+
+    def prepare_array(self, items):
+        items = combine_chunks(items)
+        if pa.types.is_fixed_size_binary(items.type):
+            return super(ArrowFixedStringColumn, self).prepare_array(items)
+
+        # Variable length strings are padded with zero bytes.
+        items = items.cast(pa.binary())
+        offsets, data = get_string_buffers(items)
+        lengths = np.diff(offsets)
+        if len(lengths) and lengths.max() > self.length:
+            raise TooLargeStringSize()
+
+        length = self.length
+        data = np.frombuffer(data, np.uint8)[offsets[0]:offsets[-1]]
+        rows = np.repeat(np.arange(len(items)), lengths)
+        positions = np.arange(len(data)) - np.repeat(
+            offsets[:-1] - offsets[0], lengths
+        )
+        padded = np.zeros(len(items) * length, dtype=np.uint8)
+        padded[rows * length + positions] = data
+
+        return make_array(
+            self.arrow_type, len(items), [pa.py_buffer(padded)],
+            items.is_null().to_numpy(zero_copy_only=False)
+        )
+
+    def _write_data(self, items, buf, nulls_map=None):
+        length = self.length
+        data = items.buffers()[1]
+        offset = items.offset * length
+        buf.write(memoryview(data)[offset:offset + len(items) * length])
@@ -0,0 +1,66 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pyarrow as pa
+
+from .base import ArrowColumn, combine_chunks
+
+
+class ArrowTupleColumn(ArrowColumn):
+    def __init__(self, nested_columns, names, **kwargs):
+        self.nested_columns = nested_columns
+        self.arrow_type = pa.struct([
+            pa.field(name, column.arrow_type)
+            for name, column in zip(names, nested_columns)
+        ])
+        super(ArrowTupleColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        for column in self.nested_columns:
+            column.read_state_prefix(buf)
+
+    def write_state_prefix(self, buf):
+        for column in self.nested_columns:
+            column.write_state_prefix(buf)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        arrays = [x.read_data(n_items, buf) for x in self.nested_columns]
+        return pa.StructArray.from_arrays(
+            arrays, fields=list(self.arrow_type)
+        )
+
+    def prepare_array(self, items):
+        # Fields are matched by position and cast by nested columns.
+        items = combine_chunks(items)
+        if items.type.num_fields != len(self.nested_columns):
+            raise ValueError('Expected {} tuple elements, got {}'.format(
+                len(self.nested_columns), items.type.num_fields
+            ))
+        return items
+
+    def _write_data(self, items, buf, nulls_map=None):
+        for column, x in zip(self.nested_columns, items.flatten()):
+            column.write_data(x, buf)
@@ -24,9 +24,10 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from struct import Struct, error as struct_error
+from struct import error as struct_error
 
 from . import exceptions
+from ..util.helpers import get_struct
 
 
 class Column(object):
@@ -53,11 +54,11 @@ class Column(object):
         super(Column, self).__init__()
 
     def make_null_struct(self, n_items):
-        return Struct('<{}B'.format(n_items))
+        return get_struct('<{}B'.format(n_items))
 
     def _read_nulls_map(self, n_items, buf):
         s = self.make_null_struct(n_items)
-        return s.unpack(buf.read(s.size))
+        return s.unpack(buf.read_view(s.size))
 
     def _write_nulls_map(self, items, buf):
         s = self.make_null_struct(len(items))
@@ -161,7 +162,7 @@ class FormatColumn(Column):
     format = None
 
     def make_struct(self, n_items):
-        return Struct('<{}{}'.format(n_items, self.format))
+        return get_struct('<{}{}'.format(n_items, self.format))
 
     def write_items(self, items, buf):
         s = self.make_struct(len(items))
@@ -173,4 +174,4 @@ class FormatColumn(Column):
 
     def read_items(self, n_items, buf):
         s = self.make_struct(n_items)
-        return s.unpack(buf.read(s.size))
+        return s.unpack(buf.read_view(s.size))
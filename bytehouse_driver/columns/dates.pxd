@@ -0,0 +1,6 @@
+from libc.stdint cimport int64_t
+
+
+cdef int64_t days_from_civil(int64_t year, int64_t month, int64_t day)
+cdef void civil_from_days(int64_t days, int64_t* year, int64_t* month,
+                          int64_t* day)
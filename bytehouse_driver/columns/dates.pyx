@@ -0,0 +1,145 @@
+from cpython cimport Py_INCREF
+from cpython.datetime cimport (
+    date_new, import_datetime, PyDate_Check,
+    PyDateTime_GET_YEAR, PyDateTime_GET_MONTH, PyDateTime_GET_DAY
+)
+from cpython.list cimport PyList_GET_ITEM
+from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
+from libc.stdint cimport int32_t, int64_t, uint16_t, uint32_t
+
+from datetime import date
+
+import_datetime()
+
+cdef int64_t PAGE_BITS = 10
+cdef int64_t PAGE_SIZE = 1 << PAGE_BITS
+
+# Integer division and modulo below floor as in Python (no cdivision).
+
+
+cdef int64_t days_from_civil(int64_t year, int64_t month, int64_t day):
+    # Howard Hinnant's days_from_civil.
+    year -= month <= 2
+    cdef int64_t era = year // 400
+    cdef int64_t yoe = year - era * 400
+    cdef int64_t doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + \
+        day - 1
+    cdef int64_t doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+cdef void civil_from_days(int64_t days, int64_t* year, int64_t* month,
+                          int64_t* day):
+    # Howard Hinnant's civil_from_days.
+    cdef int64_t z = days + 719468
+    cdef int64_t era = z // 146097
+    cdef int64_t doe = z - era * 146097
+    cdef int64_t yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    cdef int64_t doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    cdef int64_t mp = (5 * doy + 2) // 153
+
+    day[0] = doy - (153 * mp + 2) // 5 + 1
+    month[0] = mp + 3 if mp < 10 else mp - 9
+    year[0] = yoe + era * 400 + (month[0] <= 2)
+
+
+cdef object make_date(int64_t days):
+    cdef int64_t year, month, day
+    civil_from_days(days, &year, &month, &day)
+    return date_new(year, month, day)
+
+
+cdef class DateCache:
+    """
+    Dates by number of days since epoch within ``[min_day, max_day]``.
+    Pages of dates are created on first access, so only days around actually
+    seen values are kept.
+    """
+    cdef readonly int64_t min_day, max_day
+    cdef readonly Py_ssize_t loaded_pages
+    cdef list pages
+
+    def __cinit__(self, int64_t min_day, int64_t max_day):
+        self.min_day = min_day
+        self.max_day = max_day
+        self.pages = [None] * (((max_day - min_day) >> PAGE_BITS) + 1)
+        self.loaded_pages = 0
+
+    cdef object get(self, int64_t days):
+        if days < self.min_day or days > self.max_day:
+            return make_date(days)
+
+        cdef int64_t offset = days - self.min_day
+        cdef int64_t page_number = offset >> PAGE_BITS
+        cdef object page = <object> PyList_GET_ITEM(self.pages, page_number)
+
+        if page is None:
+            first_day = self.min_day + (page_number << PAGE_BITS)
+            page = [
+                make_date(first_day + i)
+                for i in range(min(PAGE_SIZE, self.max_day - first_day + 1))
+            ]
+            self.pages[page_number] = page
+            self.loaded_pages += 1
+
+        return <object> PyList_GET_ITEM(page, offset & (PAGE_SIZE - 1))
+
+    def decode(self, const unsigned char[::1] data, bint signed, nulls_map):
+        """
+        Converts little-endian UInt16 or Int32 days into dates.
+
+        :param data: buffer with items.
+        :param signed: items are Int32 if set and UInt16 otherwise.
+        :param nulls_map: ``None`` or sequence of null flags.
+        :return: tuple of dates.
+        """
+        cdef Py_ssize_t i, n_items = data.shape[0] // (4 if signed else 2)
+        cdef const unsigned char* p = &data[0] if data.shape[0] else NULL
+        cdef int64_t days
+        cdef object value
+        cdef tuple rv = PyTuple_New(n_items)
+
+        for i in range(n_items):
+            if nulls_map is not None and nulls_map[i]:
+                value = None
+
+            else:
+                if signed:
+                    days = <int32_t> (
+                        <uint32_t> p[4 * i] | <uint32_t> p[4 * i + 1] << 8 |
+                        <uint32_t> p[4 * i + 2] << 16 |
+                        <uint32_t> p[4 * i + 3] << 24
+                    )
+                else:
+                    days = <uint16_t> (p[2 * i] | p[2 * i + 1] << 8)
+
+                value = self.get(days)
+
+            Py_INCREF(value)
+            PyTuple_SET_ITEM(rv, i, value)
+
+        return rv
+
+    def encode(self, list items, nulls_map, null_value):
+        """
+        Converts dates into number of days since epoch in place. Dates out of
+        ``[min_day, max_day]`` are written as epoch start.
+        """
+        cdef Py_ssize_t i, n_items = len(items)
+        cdef int64_t days
+        cdef object item
+
+        for i in range(n_items):
+            if nulls_map and nulls_map[i]:
+                items[i] = null_value
+                continue
+
+            item = items[i]
+            if not PyDate_Check(item):
+                item = date(item.year, item.month, item.day)
+
+            days = days_from_civil(
+                PyDateTime_GET_YEAR(item), PyDateTime_GET_MONTH(item),
+                PyDateTime_GET_DAY(item)
+            )
+            items[i] = days if self.min_day <= days <= self.max_day else 0
@@ -29,85 +29,62 @@ from datetime import datetime
 from pytz import timezone as get_timezone, utc
 from ..util.compat import get_localzone_name_compat
 from .base import FormatColumn
+from .timezones import decode_datetimes, encode_datetimes, get_timezone_table
 
 EPOCH = datetime(1970, 1, 1, tzinfo=utc)
 
 
+def get_local_timezone():
+    try:
+        return get_timezone(get_localzone_name_compat())
+    except Exception:
+        return None
+
+
 class DateTimeColumn(FormatColumn):
     ch_type = 'DateTime'
     py_types = (datetime, int)
     format = 'I'
 
+    scale = 0
+
     def __init__(self, timezone=None, offset_naive=True, **kwargs):
         self.timezone = timezone
         self.offset_naive = offset_naive
+
+        # Offset-naive datetimes without server's timezone are local.
+        timezone = timezone or get_local_timezone()
+        self.timezone_table = get_timezone_table(timezone) \
+            if timezone else None
+
         super(DateTimeColumn, self).__init__(**kwargs)
 
     def after_read_items(self, items, nulls_map=None):
+        return decode_datetimes(
+            items, nulls_map, self.timezone_table, self.offset_naive,
+            self.scale, self.from_timestamp
+        )
+
+    def from_timestamp(self, item):
         tz = self.timezone
-        fromts = datetime.fromtimestamp
-
-        # A bit ugly copy-paste. But it helps save time on items
-        # processing by avoiding lambda calls or if in loop.
-        if self.offset_naive:
-            if tz:
-                if nulls_map is None:
-                    return tuple(
-                        fromts(item, tz).replace(tzinfo=None)
-                        for item in items
-                    )
-                else:
-                    return tuple(
-                        (None if is_null else
-                         fromts(items[i], tz).replace(tzinfo=None))
-                        for i, is_null in enumerate(nulls_map)
-                    )
-            else:
-                if nulls_map is None:
-                    return tuple(fromts(item) for item in items)
-                else:
-                    return tuple(
-                        (None if is_null else fromts(items[i]))
-                        for i, is_null in enumerate(nulls_map)
-                    )
-
-        else:
-            if nulls_map is None:
-                return tuple(fromts(item, tz) for item in items)
-            else:
-                return tuple(
-                    (None if is_null else fromts(items[i], tz))
-                    for i, is_null in enumerate(nulls_map)
-                )
+        value = datetime.fromtimestamp(item / float(10 ** self.scale), tz)
+        return value.replace(tzinfo=None) if tz and self.offset_naive \
+            else value
 
     def before_write_items(self, items, nulls_map=None):
-        timezone = self.timezone
-        null_value = self.null_value
-        to_timestamp = datetime.timestamp
-
-        for i, item in enumerate(items):
-            if nulls_map and nulls_map[i]:
-                items[i] = null_value
-                continue
-
-            if isinstance(item, int):
-                # support supplying raw integers to avoid
-                # costly timezone conversions when using datetime
-                continue
-
-            if timezone:
-                # Set server's timezone for offset-naive datetime.
-                if item.tzinfo is None:
-                    item = timezone.localize(item)
+        encode_datetimes(
+            items, nulls_map, self.null_value, self.timezone_table,
+            self.scale, self.to_timestamp
+        )
 
-                item = item.astimezone(utc)
+    def to_timestamp(self, item):
+        timezone = self.timezone
 
-            else:
-                # If datetime is offset-aware use it's timezone.
-                if item.tzinfo is not None:
-                    item = item.astimezone(utc)
+        if timezone:
+            # Set server's timezone for offset-naive datetime.
+            item = timezone.localize(item).astimezone(utc)
 
-            items[i] = int(to_timestamp(item))
+        return int(item.timestamp())
 
 
 class DateTime64Column(DateTimeColumn):
@@ -120,80 +97,6 @@ class DateTime64Column(DateTimeColumn):
         self.scale = scale
         super(DateTime64Column, self).__init__(**kwargs)
 
-    def after_read_items(self, items, nulls_map=None):
-        scale = float(10 ** self.scale)
-
-        tz = self.timezone
-        fromts = datetime.fromtimestamp
-
-        # A bit ugly copy-paste. But it helps save time on items
-        # processing by avoiding lambda calls or if in loop.
-        if self.offset_naive:
-            if tz:
-                if nulls_map is None:
-                    return tuple(
-                        fromts(item / scale, tz).replace(tzinfo=None)
-                        for item in items
-                    )
-                else:
-                    return tuple(
-                        (None if is_null else
-                         fromts(items[i] / scale, tz).replace(tzinfo=None))
-                        for i, is_null in enumerate(nulls_map)
-                    )
-            else:
-                if nulls_map is None:
-                    return tuple(fromts(item / scale) for item in items)
-                else:
-                    return tuple(
-                        (None if is_null else fromts(items[i] / scale))
-                        for i, is_null in enumerate(nulls_map)
-                    )
-
-        else:
-            if nulls_map is None:
-                return tuple(fromts(item / scale, tz) for item in items)
-            else:
-                return tuple(
-                    (None if is_null else fromts(items[i] / scale, tz))
-                    for i, is_null in enumerate(nulls_map)
-                )
-
-    def before_write_items(self, items, nulls_map=None):
-        scale = 10 ** self.scale
-        frac_scale = 10 ** (self.max_scale - self.scale)
-
-        timezone = self.timezone
-        null_value = self.null_value
-        to_timestamp = datetime.timestamp
-
-        for i, item in enumerate(items):
-            if nulls_map and nulls_map[i]:
-                items[i] = null_value
-                continue
-
-            if isinstance(item, int):
-                # support supplying raw integers to avoid
-                # costly timezone conversions when using datetime
-                continue
-
-            if timezone:
-                # Set server's timezone for offset-naive datetime.
-                if item.tzinfo is None:
-                    item = timezone.localize(item)
-
-                item = item.astimezone(utc)
-
-            else:
-                # If datetime is offset-aware use it's timezone.
-                if item.tzinfo is not None:
-                    item = item.astimezone(utc)
-
-            items[i] = (
-                int(to_timestamp(item)) * scale +
-                int(item.microsecond / frac_scale)
-            )
-
 
 def create_datetime_column(spec, column_options):
     if spec.startswith('DateTime64'):
@@ -141,7 +141,7 @@ class LargeIntColumn(IntColumn):
 
     def read_items(self, n_items, buf):
         s = self.make_struct(self.factor * n_items)
-        items = s.unpack(buf.read(s.size))
+        items = s.unpack(buf.read_view(s.size))
 
         return self.from_quads(items, n_items)
 
@@ -24,20 +24,143 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from math import log
+from array import array
+from collections.abc import Sequence
+import sys
 
 from ..reader import read_binary_uint64
 from ..writer import write_binary_int64
 from .base import Column
 from .intcolumn import UInt8Column, UInt16Column, UInt32Column, UInt64Column
+from .lowcardinalityencoder import encode_items, get_key_int_type
 
 
 def create_low_cardinality_column(spec, column_by_spec_getter, column_options):
     inner = spec[15:-1]
     nested = column_by_spec_getter(inner)
+
+    client_settings = column_options['context'].client_settings
+    if client_settings.get('low_cardinality_dict_encoded'):
+        return DictEncodedLowCardinalityColumn(nested, **column_options)
+
     return LowCardinalityColumn(nested, **column_options)
 
 
+def factorize_items(items):
+    """
+    Encodes NumPy array or pandas categorical items as codes and unique values
+    in order of first occurrence. Nulls get code -1. Categorical items are
+    encoded from their codes and categories without hashing.
+
+    :return: codes and uniques or ``None`` if items are not an array.
+    """
+    if not hasattr(items, 'dtype'):
+        return None
+
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(items.dtype, pd.CategoricalDtype):
+        items = pd.Categorical(items)
+        return items.codes.astype(np.int64), items.categories
+
+    codes, uniques = pd.factorize(items)
+    return codes.astype(np.int64, copy=False), uniques
+
+
+def get_keys_typecode(index_size):
+    """
+    Returns the smallest unsigned ``array`` typecode for keys of index.
+    """
+    for typecode in ('B', 'H', 'I', 'L', 'Q'):
+        if index_size <= 1 << (8 * array(typecode).itemsize):
+            return typecode
+
+
+class DictEncodedColumn(Sequence):
+    """
+    Column of LowCardinality values stored as index (unique elements) and
+    keys. Values are looked up in index on access only.
+
+    :param index: tuple of unique values.
+    :param keys: ``array.array`` of unsigned positions in ``index``.
+    """
+
+    def __init__(self, index, keys):
+        self.index = index
+        self.keys = keys
+        super(DictEncodedColumn, self).__init__()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return DictEncodedColumn(self.index, self.keys[item])
+
+        return self.index[self.keys[item]]
+
+    def __iter__(self):
+        return map(self.index.__getitem__, self.keys)
+
+    def __eq__(self, other):
+        if isinstance(other, DictEncodedColumn) and other.index == self.index:
+            return other.keys == self.keys
+
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and \
+                all(x == y for x, y in zip(self, other))
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<DictEncodedColumn(index_size={}, n_items={})>'.format(
+            len(self.index), len(self.keys)
+        )
+
+    def copy(self):
+        return DictEncodedColumn(self.index, array(self.keys.typecode,
+                                                   self.keys))
+
+    def extend(self, other):
+        """
+        Appends values in place. Index of other column is merged into this
+        column's index and only its keys are remapped.
+        """
+        index, other_index = self.index, other.index
+        n_common = min(len(index), len(other_index))
+
+        if other_index[:n_common] == index[:n_common]:
+            # One index extends another. Keys stay valid as is.
+            if len(other_index) > len(index):
+                self.index = index = other_index
+            keys = other.keys
+
+        else:
+            key_by_value = {x: i for i, x in enumerate(index)}
+            extra = []
+            mapping = array('Q')
+            for x in other_index:
+                key = key_by_value.get(x)
+                if key is None:
+                    key = key_by_value[x] = len(index) + len(extra)
+                    extra.append(x)
+                mapping.append(key)
+
+            if extra:
+                self.index = index = index + tuple(extra)
+            keys = map(mapping.__getitem__, other.keys)
+
+        typecode = get_keys_typecode(len(index))
+        if typecode != self.keys.typecode:
+            self.keys = array(typecode, self.keys)
+        if isinstance(keys, array) and keys.typecode != typecode:
+            keys = array(typecode, keys)
+        self.keys.extend(keys)
+
+
 class LowCardinalityColumn(Column):
     """
     Stores column as index (unique elements) and keys.
@@ -62,6 +185,10 @@ class LowCardinalityColumn(Column):
 
     def __init__(self, nested_column, **kwargs):
         self.nested_column = nested_column
+        # Null map is never written or read for nested column. Flag is moved
+        # here once, so column can be reused for many blocks.
+        self.nested_nullable = nested_column.nullable
+        nested_column.nullable = False
         super(LowCardinalityColumn, self).__init__(**kwargs)
 
     def read_state_prefix(self, buf):
@@ -72,49 +199,12 @@ class LowCardinalityColumn(Column):
         write_binary_int64(1, buf)
 
     def _write_data(self, items, buf):
-        index, keys = [], []
-        key_by_index_element = {}
-
-        if self.nested_column.nullable:
-            # First element represents NULL if column is nullable.
-            index.append(self.nested_column.null_value)
-            # Prevent null map writing. Reset nested column nullable flag.
-            self.nested_column.nullable = False
-
-            for x in items:
-                if x is None:
-                    # Zero element for null.
-                    keys.append(0)
-
-                else:
-                    key = key_by_index_element.get(x)
-                    # Get key from index or add it to index.
-                    if key is None:
-                        key = len(key_by_index_element)
-                        key_by_index_element[x] = key
-                        index.append(x)
-
-                    keys.append(key + 1)
-        else:
-            for x in items:
-                key = key_by_index_element.get(x)
-
-                # Get key from index or add it to index.
-                if key is None:
-                    key = len(key_by_index_element)
-                    key_by_index_element[x] = len(key_by_index_element)
-                    index.append(x)
-
-                keys.append(key)
-
         # Do not write anything for empty column.
         # May happen while writing empty arrays.
-        if not len(index):
+        if not len(items):
             return
 
-        int_type = int(log(len(index), 2) / 8)
-        int_column = self.int_types[int_type]()
-
+        index, int_type, keys = self.encode_items(items)
         serialization_type = self.serialization_type | int_type
 
         write_binary_int64(serialization_type, buf)
@@ -122,7 +212,47 @@ class LowCardinalityColumn(Column):
 
         self.nested_column.write_data(index, buf)
         write_binary_int64(len(items), buf)
-        int_column.write_items(keys, buf)
+        buf.write(keys)
+
+    def encode_items(self, items):
+        """
+        Builds index and keys with pandas for arrays and with hash-based
+        Cython encoder for Python sequences, which is faster on them than
+        creating object array. Both produce the same index order.
+
+        :return: index, key type code and packed keys.
+        """
+        factorized = factorize_items(items)
+        if factorized is None:
+            return encode_items(
+                items, self.nested_nullable, self.nested_column.null_value
+            )
+
+        codes, uniques = factorized
+        index, keys = self.make_index(codes, uniques)
+
+        int_type = get_key_int_type(len(index))
+        keys = keys.astype('<u{}'.format(1 << int_type))
+        return index, int_type, keys
+
+    def make_index(self, codes, uniques):
+        null_value = self.nested_column.null_value
+        index = list(uniques)
+
+        if self.nested_nullable:
+            # First element represents NULL if column is nullable.
+            index.insert(0, null_value)
+            keys = codes + 1
+
+        elif len(codes) and codes.min() < 0:
+            keys = codes.copy()
+            keys[codes < 0] = len(index)
+            index.append(null_value)
+
+        else:
+            keys = codes
+
+        return index, keys
 
     def _read_data(self, n_items, buf, nulls_map=None):
         if not n_items:
@@ -134,9 +264,7 @@ class LowCardinalityColumn(Column):
         key_type = serialization_type & 0xf
         keys_column = self.int_types[key_type]()
 
-        nullable = self.nested_column.nullable
-        # Prevent null map reading. Reset nested column nullable flag.
-        self.nested_column.nullable = False
+        nullable = self.nested_nullable
 
         index_size = read_binary_uint64(buf)
         index = self.nested_column.read_data(index_size, buf)
@@ -147,3 +275,38 @@ class LowCardinalityColumn(Column):
         keys = keys_column.read_data(n_items, buf)
 
         return tuple(index[x] for x in keys)
+
+
+class DictEncodedLowCardinalityColumn(LowCardinalityColumn):
+    """
+    Reads LowCardinality column as :class:`DictEncodedColumn` without
+    expanding keys into values.
+    """
+    typecodes = {
+        0: get_keys_typecode(1 << 8),
+        1: get_keys_typecode(1 << 16),
+        2: get_keys_typecode(1 << 32),
+        3: get_keys_typecode(1 << 64)
+    }
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        if not n_items:
+            return DictEncodedColumn((), array('B'))
+
+        serialization_type = read_binary_uint64(buf)
+
+        # Lowest byte contains info about key type.
+        keys_typecode = self.typecodes[serialization_type & 0xf]
+
+        index_size = read_binary_uint64(buf)
+        index = self.nested_column.read_data(index_size, buf)
+        if self.nested_nullable:
+            index = (None, ) + index[1:]
+
+        read_binary_uint64(buf)  # number of keys
+        keys = array(keys_typecode)
+        keys.frombytes(buf.read_view(n_items * keys.itemsize))
+        if sys.byteorder == 'big':
+            keys.byteswap()
+
+        return DictEncodedColumn(index, keys)
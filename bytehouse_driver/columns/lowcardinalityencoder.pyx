@@ -0,0 +1,74 @@
+from cpython.bytearray cimport PyByteArray_AS_STRING, PyByteArray_FromStringAndSize
+from libc.stdint cimport uint64_t
+from libc.stdlib cimport free, malloc
+
+
+def get_key_int_type(Py_ssize_t index_size):
+    """
+    Returns key type code for LowCardinality index of given size:
+    0 for UInt8, 1 for UInt16, 2 for UInt32 and 3 for UInt64.
+    """
+    cdef int bits = 0
+
+    while index_size > 1:
+        index_size >>= 1
+        bits += 1
+
+    return min(bits // 8, 3)
+
+
+def encode_items(items, bint nullable, null_value):
+    """
+    Builds LowCardinality index of unique items in order of first occurrence.
+    First index element represents NULL if ``nullable``.
+
+    :return: index, key type code and keys packed as little-endian unsigned
+             ints of corresponding width.
+    """
+    cdef dict key_by_item = {}
+    cdef list index = []
+    cdef Py_ssize_t i, j, n_items = len(items)
+    cdef uint64_t key, offset = 1 if nullable else 0
+    cdef int int_type, width
+    cdef char* data
+    cdef object item, existing
+    cdef uint64_t* keys = <uint64_t*> malloc(max(n_items, 1) * sizeof(uint64_t))
+
+    if keys == NULL:
+        raise MemoryError()
+
+    try:
+        if nullable:
+            index.append(null_value)
+
+        for i, item in enumerate(items):
+            if nullable and item is None:
+                keys[i] = 0
+                continue
+
+            existing = key_by_item.get(item)
+            if existing is None:
+                key = len(key_by_item)
+                key_by_item[item] = key
+                index.append(item)
+            else:
+                key = existing
+
+            keys[i] = key + offset
+
+        int_type = get_key_int_type(len(index))
+        width = 1 << int_type
+
+        packed = PyByteArray_FromStringAndSize(NULL, n_items * width)
+        data = PyByteArray_AS_STRING(packed)
+
+        for i in range(n_items):
+            key = keys[i]
+            for j in range(width):
+                data[i * width + j] = <char> (key & 0xff)
+                key >>= 8
+
+    finally:
+        free(keys)
+
+    return index, int_type, packed
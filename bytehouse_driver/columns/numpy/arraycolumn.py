@@ -0,0 +1,101 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from itertools import chain
+
+import numpy as np
+
+from .base import NumpyColumn
+from .intcolumn import NumpyUInt64Column
+
+
+def flatten(items, column):
+    """
+    Concatenates sequences into one array of column items. NumPy arrays
+    are concatenated as is, other sequences are converted by NumPy. Items
+    of nested arrays are kept as list.
+    """
+    if isinstance(column, NumpyArrayColumn):
+        return list(chain.from_iterable(items))
+
+    elif len(items) and all(isinstance(x, np.ndarray) for x in items):
+        return np.concatenate(items)
+
+    return np.array(list(chain.from_iterable(items)))
+
+
+def split(data, offsets):
+    """
+    Splits data by end offsets into object array of slices.
+    Slices of NumPy arrays are views.
+    """
+    rv = np.empty(len(offsets), dtype=object)
+    begin = 0
+    for i, end in enumerate(offsets.tolist()):
+        rv[i] = data[begin:end]
+        begin = end
+    return rv
+
+
+class NumpyArrayColumn(NumpyColumn):
+    """
+    Reads Array(T) column as object array of views into flat array of
+    nested column values.
+    """
+    null_value = ()
+
+    def __init__(self, nested_column, **kwargs):
+        self.nested_column = nested_column
+        self.size_column = NumpyUInt64Column()
+        super(NumpyArrayColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        return self.nested_column.read_state_prefix(buf)
+
+    def write_state_prefix(self, buf):
+        self.nested_column.write_state_prefix(buf)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        # Offsets of all depths are written before nested data. Nested
+        # array column reads its offsets first as well.
+        offsets = self.size_column.read_items(n_items, buf)
+        n_nested = int(offsets[-1]) if n_items else 0
+        data = self.nested_column.read_data(n_nested, buf)
+        return split(data, offsets)
+
+    def _write_data(self, items, buf):
+        sizes = np.fromiter(
+            (len(x) for x in items), dtype=np.uint64, count=len(items)
+        )
+        self.size_column.write_items(np.cumsum(sizes, dtype=np.uint64), buf)
+
+        nested = flatten(items, self.nested_column)
+        self.nested_column.write_data(nested, buf)
+
+
+def create_array_column(spec, column_by_spec_getter, column_options):
+    inner = spec[6:-1]
+    return NumpyArrayColumn(column_by_spec_getter(inner), **column_options)
@@ -29,23 +29,46 @@ import pandas as pd
 
 from ..base import Column
 
+# Pandas nullable arrays of numbers and booleans.
+masked_array_types = (
+    pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray
+)
+
 
 class NumpyColumn(Column):
     dtype = None
 
     normalize_null_value = True
 
+    def __init__(self, **kwargs):
+        self.nullable_dtypes = False
+        if 'context' in kwargs:
+            settings = kwargs['context'].client_settings
+            self.nullable_dtypes = settings.get('numpy_nullable_dtypes', False)
+
+        super(NumpyColumn, self).__init__(**kwargs)
+
     def read_items(self, n_items, buf):
-        data = buf.read(n_items * self.dtype.itemsize)
-        return np.frombuffer(data, self.dtype.newbyteorder('<'), n_items)
+        data = buf.read_view(n_items * self.dtype.itemsize)
+        items = np.frombuffer(data, self.dtype.newbyteorder('<'), n_items)
+        # View into reader's own buffer is overwritten by subsequent reads.
+        if data.obj is buf.buffer and buf.refills_in_place:
+            items = items.copy()
+        return items
 
     def write_items(self, items, buf):
         buf.write(items.astype(self.dtype.newbyteorder('<')).tobytes())
 
+    def _read_nulls_map(self, n_items, buf):
+        data = buf.read_view(n_items)
+        return np.frombuffer(data, np.uint8, n_items).astype(bool)
+
     def _write_nulls_map(self, items, buf):
-        s = self.make_null_struct(len(items))
-        nulls_map = self._get_nulls_map(items)
-        buf.write(s.pack(*nulls_map))
+        if isinstance(items, pd.api.extensions.ExtensionArray):
+            nulls_map = items.isna()
+        else:
+            nulls_map = self._get_nulls_map(items)
+        buf.write(np.asarray(nulls_map, dtype=np.uint8).tobytes())
 
     def _get_nulls_map(self, items):
         return [bool(x) for x in pd.isnull(items)]
@@ -56,12 +79,18 @@ class NumpyColumn(Column):
         if self.after_read_items:
             return self.after_read_items(items, nulls_map)
         elif nulls_map is not None:
+            if self.nullable_dtypes:
+                return make_nullable_array(items, nulls_map)
+
             items = np.array(items, dtype=object)
             np.place(items, nulls_map, None)
 
         return items
 
     def prepare_items(self, items):
+        if isinstance(items, masked_array_types):
+            return items.to_numpy(dtype=self.dtype, na_value=self.null_value)
+
         nulls_map = pd.isnull(items)
 
         # Always replace null values to null_value for proper inserts into
@@ -71,3 +100,27 @@ class NumpyColumn(Column):
             np.place(items, nulls_map, self.null_value)
 
         return items
+
+
+def make_nullable_array(items, nulls_map):
+    """
+    Wraps items with nulls into pandas nullable array. Datetimes get ``NaT``
+    and other types fall back to object array with ``None``.
+    """
+    kind = items.dtype.kind
+    mask = np.asarray(nulls_map, dtype=bool)
+
+    if kind in 'iu':
+        return pd.arrays.IntegerArray(items, mask)
+    elif kind == 'f':
+        return pd.arrays.FloatingArray(items, mask)
+    elif kind == 'b':
+        return pd.arrays.BooleanArray(items, mask)
+    elif kind in 'mM':
+        items = items.copy()
+        items[mask] = np.datetime64('NaT')
+        return items
+
+    items = np.array(items, dtype=object)
+    np.place(items, mask, None)
+    return items
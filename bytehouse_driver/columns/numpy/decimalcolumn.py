@@ -0,0 +1,123 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from decimal import Decimal, localcontext
+
+import numpy as np
+
+from ..intcolumn import Int128Column, Int256Column
+from .base import NumpyColumn
+
+
+class NumpyDecimalColumn(NumpyColumn):
+    """
+    Reads Decimal column as array of raw scaled integers: value ``12.34``
+    of ``Decimal(9, 2)`` is read as ``1234``. Integers are written back as
+    is. Floats, decimals and strings are scaled before writing.
+    """
+    max_precision = None
+
+    def __init__(self, precision, scale, **kwargs):
+        self.precision = precision
+        self.scale = scale
+        super(NumpyDecimalColumn, self).__init__(**kwargs)
+
+    def prepare_items(self, items):
+        items = super(NumpyDecimalColumn, self).prepare_items(items)
+        items = np.asarray(items)
+
+        if items.dtype.kind in 'iu':
+            return items
+
+        multiplier = 10 ** self.scale
+        if items.dtype.kind == 'f' and self.dtype.kind == 'i':
+            return np.round(items * multiplier).astype(self.dtype)
+
+        with localcontext() as ctx:
+            ctx.prec = self.max_precision
+            return np.array([
+                x if isinstance(x, int) else int(Decimal(str(x)) * multiplier)
+                for x in items.tolist()
+            ], dtype=self.dtype)
+
+
+class NumpyDecimal32Column(NumpyDecimalColumn):
+    dtype = np.dtype(np.int32)
+    max_precision = 9
+
+
+class NumpyDecimal64Column(NumpyDecimalColumn):
+    dtype = np.dtype(np.int64)
+    max_precision = 18
+
+
+class NumpyLargeDecimalColumn(NumpyDecimalColumn):
+    """
+    Decimal128 and Decimal256 do not fit into NumPy integers. They are read
+    as object arrays of Python ints.
+    """
+    dtype = np.dtype(object)
+    int_column_cls = None
+
+    def __init__(self, precision, scale, **kwargs):
+        self.int_column = self.int_column_cls()
+        super(NumpyLargeDecimalColumn, self).__init__(
+            precision, scale, **kwargs
+        )
+
+    def read_items(self, n_items, buf):
+        items = np.empty(n_items, dtype=object)
+        items[:] = self.int_column.read_items(n_items, buf)
+        return items
+
+    def write_items(self, items, buf):
+        self.int_column.write_items(items.tolist(), buf)
+
+
+class NumpyDecimal128Column(NumpyLargeDecimalColumn):
+    max_precision = 38
+    int_column_cls = Int128Column
+
+
+class NumpyDecimal256Column(NumpyLargeDecimalColumn):
+    max_precision = 76
+    int_column_cls = Int256Column
+
+
+def create_decimal_column(spec, column_options):
+    precision, scale = spec[8:-1].split(',')
+    precision, scale = int(precision), int(scale)
+
+    if precision <= 9:
+        cls = NumpyDecimal32Column
+    elif precision <= 18:
+        cls = NumpyDecimal64Column
+    elif precision <= 38:
+        cls = NumpyDecimal128Column
+    else:
+        cls = NumpyDecimal256Column
+
+    return cls(precision, scale, **column_options)
@@ -0,0 +1,117 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from enum import Enum
+
+import numpy as np
+import pandas as pd
+
+from ... import errors
+from ..enumcolumn import _parse_options
+from .base import NumpyColumn
+
+
+class NumpyEnumColumn(NumpyColumn):
+    """
+    Reads Enum column as :class:`pandas.Categorical` of element names.
+    Categories are ordered by element values.
+    """
+    def __init__(self, enum_cls, **kwargs):
+        self.enum_cls = enum_cls
+        members = sorted(enum_cls, key=lambda x: x.value)
+        self.values = np.array([x.value for x in members], dtype=self.dtype)
+        self.names = [x.name for x in members]
+        super(NumpyEnumColumn, self).__init__(**kwargs)
+
+    def after_read_items(self, items, nulls_map=None):
+        codes = np.searchsorted(self.values, items)
+        if nulls_map is not None:
+            codes[nulls_map] = -1
+        return pd.Categorical.from_codes(codes, self.names)
+
+    def prepare_items(self, items):
+        if isinstance(items, pd.Categorical):
+            # Map every category once instead of every item.
+            values = np.array(
+                [self.to_value(x) for x in items.categories], dtype=self.dtype
+            )
+            codes = items.codes
+            return np.where(codes < 0, self.null_value, values.take(codes))
+
+        if not isinstance(items, np.ndarray):
+            values = np.empty(len(items), dtype=object)
+            values[:] = items
+            items = values
+
+        return np.array(
+            [self.to_value(x) for x in items.tolist()], dtype=self.dtype
+        )
+
+    def to_value(self, item):
+        if item is None:
+            return self.null_value
+
+        source_value = item.name if isinstance(item, Enum) else item
+
+        # Check real enum value
+        try:
+            if isinstance(source_value, str):
+                return self.enum_cls[source_value].value
+            else:
+                return self.enum_cls(source_value).value
+
+        except (ValueError, KeyError):
+            choices = ', '.join(
+                "'{}' = {}".format(x.name.replace("'", r"\'"), x.value)
+                for x in self.enum_cls
+            )
+            enum_str = '{}({})'.format(self.enum_cls.__name__, choices)
+
+            raise errors.LogicalError(
+                "Unknown element '{}' for type {}"
+                .format(source_value, enum_str)
+            )
+
+
+class NumpyEnum8Column(NumpyEnumColumn):
+    ch_type = 'Enum8'
+    dtype = np.dtype(np.int8)
+
+
+class NumpyEnum16Column(NumpyEnumColumn):
+    ch_type = 'Enum16'
+    dtype = np.dtype(np.int16)
+
+
+def create_enum_column(spec, column_options):
+    if spec.startswith('Enum8'):
+        params = spec[6:-1]
+        cls = NumpyEnum8Column
+    else:
+        params = spec[7:-1]
+        cls = NumpyEnum16Column
+
+    return cls(Enum(cls.ch_type, _parse_options(params)), **column_options)
@@ -0,0 +1,107 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from ipaddress import IPv4Address, IPv6Address, AddressValueError
+
+import numpy as np
+
+from ... import errors
+from .base import NumpyColumn
+from .intcolumn import NumpyUInt32Column
+
+
+class NumpyIPv4Column(NumpyUInt32Column):
+    """
+    Reads IPv4 column as uint32 array. Integers, strings and
+    :class:`~ipaddress.IPv4Address` objects are accepted on write.
+    """
+    ch_type = 'IPv4'
+
+    def prepare_items(self, items):
+        items = np.asarray(items)
+        if items.dtype.kind in 'iu':
+            return items
+
+        return np.array(
+            [self.to_int(x) for x in items.tolist()], dtype=self.dtype
+        )
+
+    def to_int(self, value):
+        if value is None:
+            return self.null_value
+        elif isinstance(value, int):
+            return value
+
+        try:
+            return int(IPv4Address(value))
+
+        except AddressValueError:
+            raise errors.CannotParseDomainError(
+                "Cannot parse IPv4 '{}'".format(value)
+            )
+
+
+class NumpyIPv6Column(NumpyColumn):
+    """
+    Reads IPv6 column as ``V16`` array of packed addresses. Packed bytes,
+    strings and :class:`~ipaddress.IPv6Address` objects are accepted on
+    write.
+    """
+    ch_type = 'IPv6'
+    dtype = np.dtype('V16')
+    null_value = b'\x00' * 16
+
+    def write_items(self, items, buf):
+        buf.write(items.tobytes())
+
+    def _get_nulls_map(self, items):
+        items = np.asarray(items)
+        if items.dtype.hasobject:
+            return super(NumpyIPv6Column, self)._get_nulls_map(items)
+        return np.zeros(len(items), dtype=bool)
+
+    def prepare_items(self, items):
+        items = np.asarray(items)
+        if items.dtype.kind in 'VS' and items.dtype.itemsize == 16:
+            return items.view(self.dtype)
+
+        return np.array(
+            [self.to_bytes(x) for x in items.tolist()], dtype=self.dtype
+        )
+
+    def to_bytes(self, value):
+        if value is None:
+            return self.null_value
+        elif isinstance(value, bytes) and len(value) == 16:
+            return value
+
+        try:
+            return IPv6Address(value).packed
+
+        except AddressValueError:
+            raise errors.CannotParseDomainError(
+                "Cannot parse IPv6 '{}'".format(value)
+            )
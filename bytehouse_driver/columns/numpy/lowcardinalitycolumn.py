@@ -24,14 +24,11 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from math import log
-
 import numpy as np
 import pandas as pd
 
 from ..lowcardinalitycolumn import LowCardinalityColumn
 from ...reader import read_binary_uint64
-from ...writer import write_binary_int64
 from .intcolumn import (
     NumpyUInt8Column, NumpyUInt16Column, NumpyUInt32Column, NumpyUInt64Column
 )
@@ -49,40 +46,32 @@ class NumpyLowCardinalityColumn(LowCardinalityColumn):
         super(NumpyLowCardinalityColumn, self).__init__(nested_column,
                                                         **kwargs)
 
-    def _write_data(self, items, buf):
-        # Do not write anything for empty column.
-        # May happen while writing empty arrays.
-        if not len(items):
-            return
-
-        # Replace nans with defaults if not nullabe.
-        if isinstance(items, np.ndarray) and not self.nested_column.nullable:
-            nulls = pd.isnull(items)
-            items = np.where(nulls, self.nested_column.null_value, items)
-
-        c = pd.Categorical(items)
+    def encode_items(self, items):
+        if not hasattr(items, 'dtype'):
+            values = np.empty(len(items), dtype=object)
+            values[:] = items
+            items = values
 
-        int_type = int(log(len(c.codes), 2) / 8)
-        int_column = self.int_types[int_type]()
+        return super(NumpyLowCardinalityColumn, self).encode_items(items)
 
-        serialization_type = self.serialization_type | int_type
+    def make_index(self, codes, uniques):
+        null_value = self.nested_column.null_value
+        index = np.asarray(uniques)
 
-        index = c.categories
-        keys = c.codes
-
-        if self.nested_column.nullable:
+        if self.nested_nullable:
             # First element represents NULL if column is nullable.
-            index = index.insert(0, self.nested_column.null_value)
-            keys = keys + 1
-            # Prevent null map writing. Reset nested column nullable flag.
-            self.nested_column.nullable = False
+            index = np.insert(index, 0, null_value)
+            keys = codes + 1
+
+        elif len(codes) and codes.min() < 0:
+            # Replace nans with defaults if not nullable.
+            keys = np.where(codes < 0, len(index), codes)
+            index = np.insert(index, len(index), null_value)
 
-        write_binary_int64(serialization_type, buf)
-        write_binary_int64(len(index), buf)
+        else:
+            keys = codes
 
-        self.nested_column.write_data(index.to_numpy(items.dtype), buf)
-        write_binary_int64(len(items), buf)
-        int_column.write_items(keys, buf)
+        return index, keys
 
     def _read_data(self, n_items, buf, nulls_map=None):
         if not n_items:
@@ -94,9 +83,7 @@ class NumpyLowCardinalityColumn(LowCardinalityColumn):
         key_type = serialization_type & 0xf
         keys_column = self.int_types[key_type]()
 
-        nullable = self.nested_column.nullable
-        # Prevent null map reading. Reset nested column nullable flag.
-        self.nested_column.nullable = False
+        nullable = self.nested_nullable
 
         index_size = read_binary_uint64(buf)
         index = self.nested_column.read_data(index_size, buf)
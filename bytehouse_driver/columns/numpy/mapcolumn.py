@@ -0,0 +1,87 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import numpy as np
+
+from ..mapcolumn import comma_re
+from .arraycolumn import flatten
+from .base import NumpyColumn
+from .intcolumn import NumpyUInt64Column
+
+
+class NumpyMapColumn(NumpyColumn):
+    """
+    Reads Map(K, V) column as object array of dicts.
+    """
+    null_value = {}
+
+    def __init__(self, key_column, value_column, **kwargs):
+        self.offset_column = NumpyUInt64Column()
+        self.key_column = key_column
+        self.value_column = value_column
+        super(NumpyMapColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        self.key_column.read_state_prefix(buf)
+        self.value_column.read_state_prefix(buf)
+
+    def write_state_prefix(self, buf):
+        self.key_column.write_state_prefix(buf)
+        self.value_column.write_state_prefix(buf)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        offsets = self.offset_column.read_items(n_items, buf)
+        n_nested = int(offsets[-1]) if n_items else 0
+        keys = np.asarray(self.key_column.read_data(n_nested, buf)).tolist()
+        values = self.value_column.read_data(n_nested, buf)
+        values = np.asarray(values).tolist()
+
+        rv = np.empty(n_items, dtype=object)
+        begin = 0
+        for i, end in enumerate(offsets.tolist()):
+            rv[i] = dict(zip(keys[begin:end], values[begin:end]))
+            begin = end
+        return rv
+
+    def _write_data(self, items, buf):
+        sizes = np.fromiter(
+            (len(x) for x in items), dtype=np.uint64, count=len(items)
+        )
+        self.offset_column.write_items(np.cumsum(sizes, dtype=np.uint64), buf)
+        keys = flatten([x.keys() for x in items], self.key_column)
+        values = flatten([x.values() for x in items], self.value_column)
+        self.key_column.write_data(keys, buf)
+        self.value_column.write_data(values, buf)
+
+
+def create_map_column(spec, column_by_spec_getter, column_options):
+    # Match commas outside of parentheses so we don't match the comma in
+    # Decimal types.
+    key, value = comma_re.split(spec[4:-1])
+    key_column = column_by_spec_getter(key.strip())
+    value_column = column_by_spec_getter(value.strip())
+
+    return NumpyMapColumn(key_column, value_column, **column_options)
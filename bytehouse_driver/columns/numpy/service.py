@@ -24,25 +24,36 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from ..service import aliases
+from ..service import alias_by_name
 from ... import errors
+from .arraycolumn import create_array_column
 from .datecolumn import NumpyDateColumn
 from .datetimecolumn import create_numpy_datetime_column
+from .decimalcolumn import create_decimal_column
+from .enumcolumn import create_enum_column
 from .floatcolumn import NumpyFloat32Column, NumpyFloat64Column
 from .intcolumn import (
     NumpyInt8Column, NumpyInt16Column, NumpyInt32Column, NumpyInt64Column,
     NumpyUInt8Column, NumpyUInt16Column, NumpyUInt32Column, NumpyUInt64Column
 )
+from .ipcolumn import NumpyIPv4Column, NumpyIPv6Column
 from .lowcardinalitycolumn import create_numpy_low_cardinality_column
+from .mapcolumn import create_map_column
 from .stringcolumn import create_string_column
 from .tuplecolumn import create_tuple_column
+from .uuidcolumn import NumpyUUIDColumn
 from ..nullablecolumn import create_nullable_column
+from ..simpleaggregatefunctioncolumn import (
+    create_simple_aggregate_function_column
+)
+from ..typespec import parse_type_spec
 
 column_by_type = {c.ch_type: c for c in [
     NumpyDateColumn,
     NumpyFloat32Column, NumpyFloat64Column,
     NumpyInt8Column, NumpyInt16Column, NumpyInt32Column, NumpyInt64Column,
-    NumpyUInt8Column, NumpyUInt16Column, NumpyUInt32Column, NumpyUInt64Column
+    NumpyUInt8Column, NumpyUInt16Column, NumpyUInt32Column, NumpyUInt64Column,
+    NumpyUUIDColumn, NumpyIPv4Column, NumpyIPv6Column
 ]}
 
 
@@ -50,30 +61,53 @@ def get_numpy_column_by_spec(spec, column_options):
     def create_column_with_options(x):
         return get_numpy_column_by_spec(x, column_options)
 
-    if spec == 'String' or spec.startswith('FixedString'):
+    name = parse_type_spec(spec).name
+
+    if name in ('String', 'FixedString'):
         return create_string_column(spec, column_options)
 
-    elif spec.startswith('DateTime'):
+    elif name in ('Enum8', 'Enum16'):
+        return create_enum_column(spec, column_options)
+
+    elif name in ('DateTime', 'DateTime64'):
         return create_numpy_datetime_column(spec, column_options)
 
-    elif spec.startswith('Tuple'):
+    elif name == 'Decimal':
+        return create_decimal_column(spec, column_options)
+
+    elif name == 'Array':
+        return create_array_column(
+            spec, create_column_with_options, column_options
+        )
+
+    elif name == 'Tuple':
         return create_tuple_column(
             spec, create_column_with_options, column_options
         )
 
-    elif spec.startswith('Nullable'):
+    elif name == 'Nullable':
         return create_nullable_column(spec, create_column_with_options)
 
-    elif spec.startswith('LowCardinality'):
+    elif name == 'LowCardinality':
         return create_numpy_low_cardinality_column(
             spec, create_column_with_options, column_options
         )
+
+    elif name == 'SimpleAggregateFunction':
+        return create_simple_aggregate_function_column(
+            spec, create_column_with_options
+        )
+
+    elif name == 'Map':
+        return create_map_column(
+            spec, create_column_with_options, column_options
+        )
+
     else:
-        for alias, primitive in aliases:
-            if spec.startswith(alias):
-                return create_column_with_options(
-                    primitive + spec[len(alias):]
-                )
+        if name in alias_by_name:
+            return create_column_with_options(
+                alias_by_name[name] + spec[len(name):]
+            )
 
         if spec in column_by_type:
             cls = column_by_type[spec]
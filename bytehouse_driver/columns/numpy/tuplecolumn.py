@@ -25,6 +25,7 @@ SOFTWARE.
 """
 
 import numpy as np
+import pandas as pd
 
 from .base import NumpyColumn
 from ..util import get_inner_spec, get_inner_columns
@@ -44,7 +45,14 @@ class TupleColumn(NumpyColumn):
         return self.write_data(items, buf)
 
     def read_data(self, n_items, buf):
+        # Structured arrays can't hold pandas arrays: Nullable and Enum
+        # elements become object fields.
         data = [x.read_data(n_items, buf) for x in self.nested_columns]
+        data = [
+            np.asarray(x, dtype=object)
+            if isinstance(x, pd.api.extensions.ExtensionArray) else x
+            for x in data
+        ]
         dtype = [('f{}'.format(i), x.dtype) for i, x in enumerate(data)]
         rv = np.empty(n_items, dtype=dtype)
         for i, x in enumerate(data):
@@ -0,0 +1,83 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from uuid import UUID
+
+import numpy as np
+
+from ... import errors
+from .base import NumpyColumn
+
+
+class NumpyUUIDColumn(NumpyColumn):
+    """
+    Reads UUID column as ``V16`` array of RFC 4122 bytes, the same bytes
+    as :attr:`uuid.UUID.bytes`. UUID is stored by two little-endian uint64
+    numbers so bytes of each half are reversed.
+    """
+    ch_type = 'UUID'
+    dtype = np.dtype('V16')
+    null_value = b'\x00' * 16
+
+    def read_items(self, n_items, buf):
+        data = np.frombuffer(buf.read_view(16 * n_items), np.uint8)
+        data = data.reshape(n_items, 2, 8)[:, :, ::-1].reshape(n_items, 16)
+        return np.ascontiguousarray(data).view(self.dtype).reshape(n_items)
+
+    def write_items(self, items, buf):
+        data = np.frombuffer(items.tobytes(), np.uint8)
+        buf.write(data.reshape(len(items), 2, 8)[:, :, ::-1].tobytes())
+
+    def _get_nulls_map(self, items):
+        items = np.asarray(items)
+        if items.dtype.hasobject:
+            return super(NumpyUUIDColumn, self)._get_nulls_map(items)
+        return np.zeros(len(items), dtype=bool)
+
+    def prepare_items(self, items):
+        items = np.asarray(items)
+        if items.dtype.kind in 'VS' and items.dtype.itemsize == 16:
+            return items.view(self.dtype)
+
+        return np.array(
+            [self.to_bytes(x) for x in items.tolist()], dtype=self.dtype
+        )
+
+    def to_bytes(self, value):
+        if value is None:
+            return self.null_value
+        elif isinstance(value, UUID):
+            return value.bytes
+        elif isinstance(value, bytes) and len(value) == 16:
+            return value
+
+        try:
+            return UUID(value).bytes
+
+        except (ValueError, TypeError, AttributeError):
+            raise errors.CannotParseUuidError(
+                "Cannot parse uuid '{}'".format(value)
+            )
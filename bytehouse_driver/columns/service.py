@@ -26,7 +26,7 @@ SOFTWARE.
 
 import logging
 
-from .. import errors
+from .. import defines, errors
 from .arraycolumn import create_array_column
 from .datecolumn import DateColumn, Date32Column
 from .datetimecolumn import create_datetime_column
@@ -49,6 +49,7 @@ from .simpleaggregatefunctioncolumn import (
 )
 from .stringcolumn import create_string_column
 from .tuplecolumn import create_tuple_column
+from .typespec import parse_type_spec
 from .nestedcolumn import create_nested_column
 from .uuidcolumn import UUIDColumn
 from .intervalcolumn import (
@@ -81,6 +82,7 @@ aliases = [
     ('MultiPolygon', 'Array(Polygon)')
     # End Geo types
 ]
+alias_by_name = dict(aliases)
 
 
 def get_column_by_spec(spec, column_options, use_numpy=None):
@@ -102,58 +104,59 @@ def get_column_by_spec(spec, column_options, use_numpy=None):
     def create_column_with_options(x):
         return get_column_by_spec(x, column_options, use_numpy=use_numpy)
 
-    if spec == 'String' or spec.startswith('FixedString'):
+    name = parse_type_spec(spec).name
+
+    if name in ('String', 'FixedString'):
         return create_string_column(spec, column_options)
 
-    elif spec.startswith('Enum'):
+    elif name in ('Enum8', 'Enum16'):
         return create_enum_column(spec, column_options)
 
-    elif spec.startswith('DateTime'):
+    elif name in ('DateTime', 'DateTime64'):
         return create_datetime_column(spec, column_options)
 
-    elif spec.startswith('Decimal'):
+    elif name == 'Decimal':
         return create_decimal_column(spec, column_options)
 
-    elif spec.startswith('Array'):
+    elif name == 'Array':
         return create_array_column(
             spec, create_column_with_options, column_options
         )
 
-    elif spec.startswith('Tuple'):
+    elif name == 'Tuple':
         return create_tuple_column(
             spec, create_column_with_options, column_options
         )
 
-    elif spec.startswith('Nested'):
+    elif name == 'Nested':
         return create_nested_column(
             spec, create_column_with_options, column_options
         )
 
-    elif spec.startswith('Nullable'):
+    elif name == 'Nullable':
         return create_nullable_column(spec, create_column_with_options)
 
-    elif spec.startswith('LowCardinality'):
+    elif name == 'LowCardinality':
         return create_low_cardinality_column(
             spec, create_column_with_options, column_options
         )
 
-    elif spec.startswith('SimpleAggregateFunction'):
+    elif name == 'SimpleAggregateFunction':
         return create_simple_aggregate_function_column(
             spec, create_column_with_options
         )
 
-    elif spec.startswith('Map'):
+    elif name == 'Map':
         return create_map_column(
             spec, create_column_with_options, column_options
         )
 
-    else:
-        for alias, primitive in aliases:
-            if spec.startswith(alias):
-                return create_column_with_options(
-                    primitive + spec[len(alias):]
-                )
+    elif name in alias_by_name:
+        return create_column_with_options(
+            alias_by_name[name] + spec[len(name):]
+        )
 
+    else:
         try:
             cls = column_by_type[spec]
             return cls(**column_options)
@@ -162,20 +165,54 @@ def get_column_by_spec(spec, column_options, use_numpy=None):
             raise errors.UnknownTypeError('Unknown type {}'.format(spec))
 
 
+def get_cached_column(context, key, factory):
+    """
+    Returns column from context's LRU cache. Column is built by ``factory``
+    on cache miss.
+    """
+    cache = context.column_cache
+    try:
+        column = cache[key]
+        cache.move_to_end(key)
+
+    except KeyError:
+        column = factory()
+        cache[key] = column
+        if len(cache) > defines.COLUMN_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    return column
+
+
+def get_column(context, spec, use_numpy=None, types_check=False):
+    """
+    Returns column for type spec from context's LRU cache. Columns are built
+    once per spec and settings and reused for every block.
+    """
+    if use_numpy is None:
+        use_numpy = context.client_settings['use_numpy'] if context else False
+
+    column_options = {'context': context, 'types_check': types_check}
+
+    def factory():
+        return get_column_by_spec(spec, column_options, use_numpy=use_numpy)
+
+    if context is None:
+        return factory()
+
+    key = (spec, use_numpy, types_check)
+    return get_cached_column(context, key, factory)
+
+
 def read_column(context, column_spec, n_items, buf, use_numpy=None):
-    column_options = {'context': context}
-    col = get_column_by_spec(column_spec, column_options, use_numpy=use_numpy)
+    col = get_column(context, column_spec, use_numpy=use_numpy)
     col.read_state_prefix(buf)
     return col.read_data(n_items, buf)
 
 
 def write_column(context, column_name, column_spec, items, buf,
                  types_check=False):
-    column_options = {
-        'context': context,
-        'types_check': types_check
-    }
-    column = get_column_by_spec(column_spec, column_options)
+    column = get_column(context, column_spec, types_check=types_check)
 
     try:
         column.write_state_prefix(buf)
@@ -0,0 +1,285 @@
+from cpython cimport Py_INCREF
+from cpython.datetime cimport (
+    datetime_new, import_datetime, datetime as dt_type,
+    PyDateTime_GET_YEAR, PyDateTime_GET_MONTH, PyDateTime_GET_DAY,
+    PyDateTime_DATE_GET_HOUR, PyDateTime_DATE_GET_MINUTE,
+    PyDateTime_DATE_GET_SECOND, PyDateTime_DATE_GET_MICROSECOND
+)
+from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
+from libc.stdint cimport int64_t
+from libc.stdlib cimport free, malloc
+
+from .dates cimport civil_from_days, days_from_civil
+
+from datetime import datetime, timedelta
+
+import_datetime()
+
+cdef int64_t SECONDS_IN_DAY = 86400
+cdef object EPOCH = datetime(1970, 1, 1)
+cdef object SECOND = timedelta(seconds=1)
+
+cdef dict tables = {}
+
+# Integer division and modulo below floor as in Python (no cdivision).
+
+
+cdef inline object make_datetime(int64_t seconds, int microsecond,
+                                 object tzinfo):
+    cdef int64_t days = seconds // SECONDS_IN_DAY
+    cdef int64_t rem = seconds - days * SECONDS_IN_DAY
+    cdef int64_t year, month, day
+
+    civil_from_days(days, &year, &month, &day)
+    if year < 1 or year > 9999:
+        raise ValueError('year {} is out of range'.format(year))
+
+    return datetime_new(
+        year, month, day, rem // 3600, rem % 3600 // 60, rem % 60,
+        microsecond, tzinfo
+    )
+
+
+cdef class TimezoneTable:
+    """
+    UTC offset transitions of pytz timezone as flat arrays. Converts
+    timestamps to datetimes the same way as ``tz.fromutc``.
+    """
+    cdef int64_t* transitions
+    cdef int64_t* offsets
+    cdef Py_ssize_t size, last
+    cdef readonly object timezone
+    cdef list tzinfos
+
+    def __cinit__(self, timezone):
+        self.timezone = timezone
+        self.transitions = NULL
+        self.offsets = NULL
+
+        if hasattr(timezone, '_utc_transition_times'):
+            transitions = [
+                (x - EPOCH) // SECOND for x in timezone._utc_transition_times
+            ]
+            infos = timezone._transition_info
+            offsets = [x[0] // SECOND for x in infos]
+            self.tzinfos = [timezone._tzinfos[x] for x in infos]
+
+        else:
+            # Fixed offset timezone.
+            transitions = [-(1 << 62)]
+            offsets = [timezone.utcoffset(None) // SECOND]
+            self.tzinfos = [timezone]
+
+        self.size = len(transitions)
+        self.last = 0
+        self.transitions = <int64_t*> malloc(self.size * sizeof(int64_t))
+        self.offsets = <int64_t*> malloc(self.size * sizeof(int64_t))
+        if self.transitions == NULL or self.offsets == NULL:
+            raise MemoryError()
+
+        cdef Py_ssize_t i
+        for i in range(self.size):
+            self.transitions[i] = transitions[i]
+            self.offsets[i] = offsets[i]
+
+    def __dealloc__(self):
+        free(self.transitions)
+        free(self.offsets)
+
+    cdef Py_ssize_t find(self, int64_t seconds):
+        """
+        Returns index of last transition before or at ``seconds``.
+        """
+        cdef Py_ssize_t last = self.last
+        cdef Py_ssize_t lo, hi, mid
+
+        # Values of one block are usually close to each other.
+        if self.transitions[last] <= seconds and (
+                last + 1 == self.size or
+                seconds < self.transitions[last + 1]):
+            return last
+
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if seconds < self.transitions[mid]:
+                hi = mid
+            else:
+                lo = mid + 1
+
+        last = lo - 1 if lo else 0
+        self.last = last
+        return last
+
+    cdef object to_datetime(self, int64_t seconds, int microsecond,
+                            bint naive):
+        cdef Py_ssize_t i = self.find(seconds)
+        tzinfo = None if naive else self.tzinfos[i]
+        return make_datetime(seconds + self.offsets[i], microsecond, tzinfo)
+
+    cdef int to_timestamp(self, object item, int64_t* seconds) except -1:
+        """
+        Converts offset-naive local datetime to UTC seconds. Returns 0 if
+        datetime is close to offset transition and can't be converted
+        unambiguously with table.
+        """
+        cdef int64_t local = days_from_civil(
+            PyDateTime_GET_YEAR(item), PyDateTime_GET_MONTH(item),
+            PyDateTime_GET_DAY(item)
+        ) * SECONDS_IN_DAY + PyDateTime_DATE_GET_HOUR(item) * 3600 + \
+            PyDateTime_DATE_GET_MINUTE(item) * 60 + \
+            PyDateTime_DATE_GET_SECOND(item)
+
+        cdef int64_t utc = local - self.offsets[self.find(local)]
+        cdef Py_ssize_t i = self.find(utc - SECONDS_IN_DAY)
+
+        if i != self.find(utc + SECONDS_IN_DAY):
+            return 0
+
+        utc = local - self.offsets[i]
+        # int(datetime.timestamp()) truncates towards zero.
+        if utc < 0 and PyDateTime_DATE_GET_MICROSECOND(item):
+            utc += 1
+
+        seconds[0] = utc
+        return 1
+
+
+def get_timezone_table(timezone):
+    """
+    Returns cached offset table for pytz timezone or ``None`` if timezone is
+    not supported.
+    """
+    table = tables.get(timezone)
+    if table is None:
+        if not hasattr(timezone, '_utc_transition_times') and \
+                timezone.utcoffset(None) is None:
+            return None
+
+        table = tables[timezone] = TimezoneTable(timezone)
+
+    return table
+
+
+def decode_datetimes(items, nulls_map, TimezoneTable table, bint naive,
+                     int scale, fallback):
+    """
+    Converts timestamps into datetimes. Repeated timestamps share one
+    datetime object.
+
+    :param items: sequence of ints in units of ``10 ** -scale`` seconds.
+    :param nulls_map: ``None`` or sequence of null flags.
+    :param table: offset table of column's timezone or ``None``.
+    :param naive: produce offset-naive datetimes.
+    :param scale: DateTime64 scale, 0 for DateTime.
+    :param fallback: converts single item if ``table`` is ``None``.
+    :return: tuple of datetimes.
+    """
+    cdef Py_ssize_t i, n_items = len(items)
+    cdef int64_t item, seconds, frac, half
+    cdef int64_t divisor = 1, multiplier = 1, factor = 1
+    cdef int microsecond
+    cdef dict memo = {}
+    cdef object value, key
+    cdef tuple rv = PyTuple_New(n_items)
+
+    for i in range(scale):
+        factor *= 10
+    if scale > 6:
+        for i in range(scale - 6):
+            divisor *= 10
+    else:
+        for i in range(6 - scale):
+            multiplier *= 10
+    half = divisor // 2
+
+    for i in range(n_items):
+        if nulls_map is not None and nulls_map[i]:
+            value = None
+
+        else:
+            key = items[i]
+            value = memo.get(key)
+
+            if value is None:
+                if table is None:
+                    value = fallback(key)
+
+                else:
+                    item = key
+                    seconds = item // factor
+                    frac = item - seconds * factor
+
+                    if divisor > 1:
+                        # Round half to even as datetime.fromtimestamp.
+                        microsecond = frac // divisor
+                        frac -= microsecond * divisor
+                        if frac > half or (
+                                frac == half and microsecond % 2):
+                            microsecond += 1
+                        if microsecond == 1000000:
+                            microsecond = 0
+                            seconds += 1
+                    else:
+                        microsecond = frac * multiplier
+
+                    value = table.to_datetime(seconds, microsecond, naive)
+
+                memo[key] = value
+
+        Py_INCREF(value)
+        PyTuple_SET_ITEM(rv, i, value)
+
+    return rv
+
+
+def encode_datetimes(list items, nulls_map, null_value, TimezoneTable table,
+                     int scale, fallback):
+    """
+    Converts datetimes into timestamps in place. Ints are left as is.
+
+    :param items: list of datetimes and ints.
+    :param nulls_map: ``None`` or sequence of null flags.
+    :param table: offset table for offset-naive datetimes or ``None``.
+    :param scale: DateTime64 scale, 0 for DateTime.
+    :param fallback: converts offset-naive datetime into UTC seconds if
+                     ``table`` is ``None`` or can't do it unambiguously.
+    """
+    cdef Py_ssize_t i, n_items = len(items)
+    cdef int64_t seconds, factor = 1, frac_scale = 1, frac_multiplier = 1
+    cdef object item
+
+    for i in range(scale):
+        factor *= 10
+    for i in range(6 - scale):
+        frac_scale *= 10
+    for i in range(scale - 6):
+        frac_multiplier *= 10
+
+    for i in range(n_items):
+        if nulls_map and nulls_map[i]:
+            items[i] = null_value
+            continue
+
+        item = items[i]
+        if isinstance(item, int):
+            # support supplying raw integers to avoid
+            # costly timezone conversions when using datetime
+            continue
+
+        if not isinstance(item, dt_type):
+            # Let struct packing fail on wrong types.
+            continue
+
+        if item.tzinfo is not None:
+            seconds = int(item.timestamp())
+
+        elif table is None or not table.to_timestamp(item, &seconds):
+            seconds = fallback(item)
+
+        if scale:
+            items[i] = seconds * factor + \
+                PyDateTime_DATE_GET_MICROSECOND(item) // frac_scale * \
+                frac_multiplier
+        else:
+            items[i] = seconds
@@ -0,0 +1,155 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from .. import errors
+from ..defines import TYPE_SPEC_CACHE_SIZE
+
+# Type node. ``args`` are nested nodes, fields, enum items or literals.
+# ``spec`` is source text of the node.
+TypeSpec = namedtuple('TypeSpec', 'name args spec')
+# Named element of Tuple or Nested: ``name Type``.
+Field = namedtuple('Field', 'name type')
+# Enum element: ``'label' = value``.
+EnumItem = namedtuple('EnumItem', 'label value')
+
+token_re = re.compile(r"""
+    \s*(?:
+        (?P<string>'(?:[^'\\]|\\.|'')*')
+        | (?P<number>[-+]?\d+(?:\.\d+)?)
+        | (?P<name>[A-Za-z_][A-Za-z0-9_.]*|`(?:[^`\\]|\\.)*`)
+        | (?P<punct>[(),=])
+    )
+""", re.VERBOSE)
+escape_re = re.compile(r"\\(.)|''")
+
+
+def _tokenize(spec):
+    tokens = []
+    position = 0
+    end = len(spec.rstrip())
+
+    while position < end:
+        match = token_re.match(spec, position)
+        if match is None:
+            raise errors.UnknownTypeError('Malformed type {}'.format(spec))
+
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind), match.start(kind)))
+        position = match.end()
+
+    tokens.append((None, None, end))
+    return tokens
+
+
+def _unquote(value):
+    return escape_re.sub(lambda m: m.group(1) or "'", value[1:-1])
+
+
+class _Parser(object):
+    def __init__(self, spec):
+        self.spec = spec
+        self.tokens = _tokenize(spec)
+        self.index = 0
+
+        super(_Parser, self).__init__()
+
+    def peek(self, offset=0):
+        return self.tokens[min(self.index + offset, len(self.tokens) - 1)]
+
+    def next(self):
+        token = self.peek()
+        self.index += 1
+        return token
+
+    def expect(self, kind, value=None):
+        token = self.next()
+        if token[0] != kind or (value is not None and token[1] != value):
+            raise errors.UnknownTypeError(
+                'Malformed type {}'.format(self.spec)
+            )
+        return token
+
+    def parse_type(self):
+        _, name, start = self.expect('name')
+        args = ()
+
+        if self.peek()[1] == '(':
+            self.next()
+            if self.peek()[1] != ')':
+                args = self.parse_args()
+            self.expect('punct', ')')
+
+        end = self.tokens[self.index - 1]
+        end = end[2] + len(end[1])
+        return TypeSpec(name, args, self.spec[start:end])
+
+    def parse_args(self):
+        args = [self.parse_arg()]
+        while self.peek()[1] == ',':
+            self.next()
+            args.append(self.parse_arg())
+        return tuple(args)
+
+    def parse_arg(self):
+        kind, value, _ = self.peek()
+
+        if kind == 'string':
+            self.next()
+            if self.peek()[1] != '=':
+                return _unquote(value)
+
+            self.next()
+            _, number, _ = self.expect('number')
+            return EnumItem(_unquote(value), int(number))
+
+        elif kind == 'number':
+            self.next()
+            return float(value) if '.' in value else int(value)
+
+        elif kind == 'name' and self.peek(1)[0] == 'name':
+            self.next()
+            return Field(value.strip('`'), self.parse_type())
+
+        return self.parse_type()
+
+
+@lru_cache(TYPE_SPEC_CACHE_SIZE)
+def parse_type_spec(spec):
+    """
+    Parses column type into tree of :class:`TypeSpec` nodes.
+
+    :param spec: type as sent by server, e.g.
+                 ``Array(Nullable(LowCardinality(String)))``.
+    :return: root :class:`TypeSpec`.
+    """
+    parser = _Parser(spec)
+    rv = parser.parse_type()
+    parser.expect(None)
+    return rv
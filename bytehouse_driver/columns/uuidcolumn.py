@@ -52,7 +52,7 @@ class UUIDColumn(FormatColumn):
     def read_items(self, n_items, buf):
         # TODO: cythonize
         s = self.make_struct(2 * n_items)
-        items = s.unpack(buf.read(s.size))
+        items = s.unpack(buf.read_view(s.size))
 
         uint_128_items = [None] * n_items
         for i in range(n_items):
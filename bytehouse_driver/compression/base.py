@@ -25,9 +25,10 @@ SOFTWARE.
 """
 
 from io import BytesIO
+from struct import Struct
 
 from ..reader import read_binary_uint32
-from ..writer import write_binary_uint8, write_binary_uint32
+from ..writer import write_binary_uint32
 from .. import errors
 
 try:
@@ -63,9 +64,15 @@ class BaseCompressor(object):
         raise NotImplementedError
 
     def get_compressed_data(self, extra_header_size):
+        return self.compress_frame(self.get_value(), extra_header_size)
+
+    def compress_frame(self, data, extra_header_size):
+        """
+        Compresses data without touching compressor's buffer. Can be called
+        from several threads simultaneously.
+        """
         rv = BytesIO()
 
-        data = self.get_value()
         compressed = self.compress_data(data)
 
         header_size = extra_header_size + 4 + 4  # sizes
@@ -77,9 +84,39 @@ class BaseCompressor(object):
         return rv.getvalue()
 
 
+uint32 = Struct('<I')
+
+
+class FrameBuffer(object):
+    """
+    Reusable buffer for compressed frames. Counts allocations made while
+    reading frames: buffer growth and decompressed blocks.
+    """
+
+    def __init__(self):
+        self.data = bytearray()
+        self.allocations = 0
+        self.allocated_bytes = 0
+
+        super(FrameBuffer, self).__init__()
+
+    def account(self, size):
+        self.allocations += 1
+        self.allocated_bytes += size
+
+    def reserve(self, size):
+        if len(self.data) < size:
+            self.data = bytearray(size)
+            self.account(size)
+
+        return self.data
+
+
 class BaseDecompressor(object):
     method = None
     method_byte = None
+    # Underlying library accepts only read-only bytes.
+    requires_bytes = False
 
     def __init__(self, real_stream):
         self.stream = real_stream
@@ -93,21 +130,41 @@ class BaseDecompressor(object):
             raise errors.ChecksumDoesntMatchError()
 
     def get_decompressed_data(self, method_byte, compressed_hash,
-                              extra_header_size):
+                              extra_header_size, frame=None):
+        """
+        Reads frame from the stream, checks its hash and decompresses it.
+
+        :param frame: :class:`FrameBuffer` reused for compressed data.
+        :return: decompressed bytearray.
+        """
+        if frame is None:
+            frame = FrameBuffer()
+
         size_with_header = read_binary_uint32(self.stream)
         compressed_size = size_with_header - extra_header_size - 4
 
-        compressed = BytesIO(self.stream.read(compressed_size))
+        # Checksum covers method byte, size with header and compressed data.
+        # They are laid out contiguously to hash frame in place.
+        check_size = 1 + 4 + compressed_size
+        data = frame.reserve(check_size)
+        data[0] = method_byte
+        uint32.pack_into(data, 1, size_with_header)
+        self.stream.read_into(data, 5, compressed_size)
 
-        block_check = BytesIO()
-        write_binary_uint8(method_byte, block_check)
-        write_binary_uint32(size_with_header, block_check)
-        block_check.write(compressed.getvalue())
+        view = memoryview(data)[:check_size]
+        self.check_hash(view, compressed_hash)
 
-        self.check_hash(block_check.getvalue(), compressed_hash)
+        uncompressed_size = uint32.unpack_from(data, 5)[0]
+        compressed = view[5 + 4:]
+        if self.requires_bytes:
+            compressed = compressed.tobytes()
+            frame.account(len(compressed))
 
-        uncompressed_size = read_binary_uint32(compressed)
+        rv = self.decompress_data(compressed, uncompressed_size)
+        frame.account(len(rv))
 
-        compressed = compressed.read(compressed_size - 4)
+        if type(rv) is not bytearray:
+            rv = bytearray(rv)
+            frame.account(len(rv))
 
-        return self.decompress_data(compressed, uncompressed_size)
+        return rv
@@ -44,4 +44,6 @@ class Decompressor(BaseDecompressor):
     method_byte = CompressionMethodByte.LZ4
 
     def decompress_data(self, data, uncompressed_size):
-        return block.decompress(data, uncompressed_size=uncompressed_size)
+        return block.decompress(
+            data, uncompressed_size=uncompressed_size, return_bytearray=True
+        )
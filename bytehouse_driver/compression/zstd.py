@@ -41,6 +41,7 @@ class Compressor(BaseCompressor):
 class Decompressor(BaseDecompressor):
     method = CompressionMethod.ZSTD
     method_byte = CompressionMethodByte.ZSTD
+    requires_bytes = True
 
     def decompress_data(self, data, uncompressed_size):
         return zstd.decompress(data)
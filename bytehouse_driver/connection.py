@@ -121,6 +121,9 @@ class Connection(object):
                                  Defaults to ``5`` seconds.
     :param compress_block_size: size of compressed block to send.
                                 Defaults to ``1048576``.
+    :param compress_threads: number of threads compressing blocks of
+                             outgoing data in parallel. ``1`` compresses on
+                             the calling thread. Defaults to ``1``.
     :param compression: specifies whether or not use compression.
                         Defaults to ``False``. Possible choices:
 
@@ -161,6 +164,7 @@ class Connection(object):
             send_receive_timeout=defines.DBMS_DEFAULT_TIMEOUT_SEC,
             sync_request_timeout=defines.DBMS_DEFAULT_SYNC_REQUEST_TIMEOUT_SEC,
             compress_block_size=defines.DEFAULT_COMPRESS_BLOCK_SIZE,
+            compress_threads=1,
             compression=False,
             secure=False,
             # Secure socket parameters.
@@ -222,6 +226,7 @@ class Connection(object):
             self.compression = Compression.ENABLED
             self.compressor_cls = get_compressor_cls(compression)
             self.compress_block_size = compress_block_size
+        self.compress_threads = compress_threads
 
         self.socket = None
         self.fin = None
@@ -238,6 +243,9 @@ class Connection(object):
         self.block_out = None
         self.block_in_raw = None  # log blocks are always not compressed
 
+        # Virtual warehouse applied to the current session.
+        self.warehouse = None
+
         self._lock = threading.Lock()
         self.is_query_executing = False
 
@@ -269,15 +277,7 @@ class Connection(object):
         Acts like socket.create_connection, but wraps socket with SSL
         if connection is secure.
         """
-        ssl_options = {}
-        if self.secure_socket:
-            if self.verify_cert:
-                cert_reqs = ssl.CERT_REQUIRED
-            else:
-                cert_reqs = ssl.CERT_NONE
-
-            ssl_options = self.ssl_options.copy()
-            ssl_options['cert_reqs'] = cert_reqs
+        ssl_options = self._get_ssl_options()
 
         err = None
         for res in socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM):
@@ -305,6 +305,19 @@ class Connection(object):
         else:
             raise socket.error("getaddrinfo returns an empty list")
 
+    def _get_ssl_options(self):
+        ssl_options = {}
+        if self.secure_socket:
+            if self.verify_cert:
+                cert_reqs = ssl.CERT_REQUIRED
+            else:
+                cert_reqs = ssl.CERT_NONE
+
+            ssl_options = self.ssl_options.copy()
+            ssl_options['cert_reqs'] = cert_reqs
+
+        return ssl_options
+
     def _create_ssl_context(self, ssl_options):
         purpose = ssl.Purpose.SERVER_AUTH
 
@@ -404,6 +417,7 @@ class Connection(object):
         self.block_in_raw = None
         self.block_out = None
 
+        self.warehouse = None
         self.is_query_executing = False
 
     def disconnect(self):
@@ -581,16 +595,18 @@ class Connection(object):
         else:
             return BlockInputStream(self.fin, self.context)
 
-    def get_block_out_stream(self):
+    def get_block_out_stream(self, fout=None):
+        fout = fout or self.fout
+
         if self.compression:
             from .streams.compressed import CompressedBlockOutputStream
 
             return CompressedBlockOutputStream(
                 self.compressor_cls, self.compress_block_size,
-                self.fout, self.context
+                fout, self.context, compress_threads=self.compress_threads
             )
         else:
-            return BlockOutputStream(self.fout, self.context)
+            return BlockOutputStream(fout, self.context)
 
     def receive_data(self, may_be_compressed=True, may_be_use_numpy=False):
         revision = self.server_info.revision
@@ -621,14 +637,26 @@ class Connection(object):
 
     def send_data(self, block, table_name=''):
         start = time()
-        write_varint(ClientPacketTypes.DATA, self.fout)
+        self.write_data(block, self.fout, self.block_out,
+                        table_name=table_name)
+        logger.debug('Block "%s" send time: %f', table_name, time() - start)
+
+    def write_data(self, block, fout, block_out, table_name=''):
+        write_varint(ClientPacketTypes.DATA, fout)
 
         revision = self.server_info.revision
         if revision >= defines.DBMS_MIN_REVISION_WITH_TEMPORARY_TABLES:
-            write_binary_str(table_name, self.fout)
+            write_binary_str(table_name, fout)
 
-        self.block_out.write(block)
-        logger.debug('Block "%s" send time: %f', table_name, time() - start)
+        block_out.write(block)
+
+    def send_encoded_data(self, data):
+        """
+        Sends data packet serialized by
+        :class:`~bytehouse_driver.insertpipeline.InsertPipeline`.
+        """
+        self.fout.flush()
+        self.socket.sendall(data)
 
     def send_query(self, query, query_id=None):
         if not self.connected:
@@ -24,19 +24,46 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from collections import OrderedDict
+
+
 class Context(object):
+    # Settings read by columns on construction. Other settings change with
+    # every query and must not drop cached columns. ``use_numpy`` and
+    # ``types_check`` are parts of cache key.
+    column_settings = ('use_client_time_zone', )
+    column_client_settings = (
+        'strings_as_bytes',
+        'strings_encoding',
+        'input_format_null_as_default',
+        'numpy_nullable_dtypes',
+        'low_cardinality_dict_encoded'
+    )
+
     def __init__(self):
         self._server_info = None
         self._settings = None
         self._client_settings = None
+        # Columns built for this context. Columns depend on server info and
+        # some settings, so cache is dropped when they change.
+        self.column_cache = OrderedDict()
         super(Context, self).__init__()
 
+    def _check_column_settings(self, old, new, keys):
+        if old is None:
+            return
+
+        if any(old.get(key) != new.get(key) for key in keys):
+            self.column_cache.clear()
+
     @property
     def server_info(self):
         return self._server_info
 
     @server_info.setter
     def server_info(self, value):
+        if value is not self._server_info:
+            self.column_cache.clear()
         self._server_info = value
 
     @property
@@ -45,6 +72,9 @@ class Context(object):
 
     @settings.setter
     def settings(self, value):
+        self._check_column_settings(
+            self._settings, value, self.column_settings
+        )
         self._settings = value.copy()
 
     @property
@@ -53,6 +83,9 @@ class Context(object):
 
     @client_settings.setter
     def client_settings(self, value):
+        self._check_column_settings(
+            self._client_settings, value, self.column_client_settings
+        )
         self._client_settings = value.copy()
 
     def __repr__(self):
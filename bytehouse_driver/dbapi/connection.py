@@ -24,8 +24,11 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from threading import Lock
+
 from ..client import Client
-from .. import defines
+from ..pool import ClientPool
+from .. import defines, errors
 from .cursor import Cursor
 from .errors import InterfaceError
 
@@ -37,7 +40,22 @@ class Connection(object):
     Connection is just wrapper for handling multiple cursors (clients) and
     do not initiate actual connections to the ByteHouse server.
 
-    See parameters description in
+    Cursors lease clients from the pool owned by connection. Closed cursor
+    returns its client to the pool so the next cursor reuses established
+    session. If all pooled clients are leased, cursor gets its own client
+    that is disconnected on close.
+
+    The following keyword arguments configure the pool:
+
+        * ``pool_max_size`` -- maximum number of pooled clients.
+          Defaults to ``32``.
+        * ``pool_max_idle`` -- seconds after which an unused client is closed.
+          Defaults to ``300``.
+        * ``pool_timeout`` -- seconds to wait for a free pooled client when
+          all of them are leased before creating unpooled client.
+          Defaults to ``0``.
+
+    See other parameters description in
     :data:`~bytehouse_driver.connection.Connection`.
     """
     def __init__(self, dsn=None, host=None,
@@ -52,9 +70,25 @@ class Connection(object):
         self.host = host
         self.port = port
         self.database = database
+        self.pool_kwargs = {
+            'min_size': 0,
+            'max_size': kwargs.pop(
+                'pool_max_size', defines.DEFAULT_DBAPI_POOL_MAX_SIZE
+            ),
+            'max_idle': kwargs.pop(
+                'pool_max_idle', defines.DEFAULT_DBAPI_POOL_MAX_IDLE_SEC
+            ),
+            'timeout': kwargs.pop(
+                'pool_timeout', defines.DEFAULT_DBAPI_POOL_TIMEOUT_SEC
+            )
+        }
         self.connection_kwargs = kwargs
         self.is_closed = False
         self._hosts = None
+        self._pool = None
+        self._pool_lock = Lock()
+        # Clients created for cursors when pool is exhausted.
+        self._unpooled = set()
         super(Connection, self).__init__()
 
     def __repr__(self):
@@ -74,11 +108,52 @@ class Connection(object):
         :return: a new Client instance.
         """
         if self.dsn is not None:
-            return Client.from_url(self.dsn)
+            client = Client.from_url(self.dsn)
+        else:
+            client = Client(self.host, port=self.port,
+                            user=self.user, password=self.password,
+                            database=self.database, **self.connection_kwargs)
 
-        return Client(self.host, port=self.port,
-                      user=self.user, password=self.password,
-                      database=self.database, **self.connection_kwargs)
+        if self._hosts is None:
+            self._hosts = client.connection.hosts
+        else:
+            client.connection.hosts = self._hosts
+
+        return client
+
+    def _get_pool(self):
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ClientPool(
+                    client_factory=self._make_client, **self.pool_kwargs
+                )
+
+            return self._pool
+
+    def _lease_client(self):
+        """
+        :return: client from the pool for cursor or a new unpooled client
+                 if pool is exhausted.
+        """
+        try:
+            return self._get_pool().acquire()
+
+        except errors.PoolTimeoutError:
+            # Cursors are not limited by pool size, one thread may keep
+            # any number of them open.
+            client = self._make_client()
+            self._unpooled.add(client)
+            return client
+
+    def _release_client(self, client):
+        """
+        Returns cursor's client to the pool.
+        """
+        if client in self._unpooled:
+            self._unpooled.discard(client)
+            client.disconnect()
+        else:
+            self._pool.release(client)
 
     def close(self):
         """
@@ -88,9 +163,13 @@ class Connection(object):
         connection. The same applies to all cursor objects trying to use the
         connection.
         """
-        for cursor in self.cursors:
+        for cursor in list(self.cursors):
             cursor.close()
 
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close()
+
         self.is_closed = True
 
     def commit(self):
@@ -114,12 +193,8 @@ class Connection(object):
         if self.is_closed:
             raise InterfaceError('connection already closed')
 
-        client = self._make_client()
-        if self._hosts is None:
-            self._hosts = client.connection.hosts
-        else:
-            client.connection.hosts = self._hosts
         cursor_factory = cursor_factory or Cursor
-        cursor = cursor_factory(client, self)
+        # Client is leased from the pool by the first query of cursor.
+        cursor = cursor_factory(None, self)
         self.cursors.append(cursor)
         return cursor
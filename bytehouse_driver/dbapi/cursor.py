@@ -110,7 +110,14 @@ class Cursor(object):
         exception will be raised if any operation is attempted with the
         cursor.
         """
-        self._client.disconnect()
+        if self._state == self._states.CURSOR_CLOSED:
+            return
+
+        # Client is returned to connection's pool for the next cursors.
+        if self._client is not None:
+            self._connection._release_client(self._client)
+            self._client = None
+
         self._state = self._states.CURSOR_CLOSED
 
         try:
@@ -315,6 +322,9 @@ class Cursor(object):
             for name, (structure, data) in self._external_tables.items()
         ] or None
 
+        if self._client is None:
+            self._client = self._connection._lease_client()
+
         execute = self._client.execute
 
         if self._stream_results:
@@ -57,9 +57,23 @@ DBMS_DEFAULT_TIMEOUT_SEC = 300
 
 DBMS_DEFAULT_SYNC_REQUEST_TIMEOUT_SEC = 5
 
+# Virtual warehouse
+WAREHOUSE_CACHE_TTL_SEC = 60
+WAREHOUSE_RESUME_TIMEOUT_SEC = 10
+WAREHOUSE_RESUME_INITIAL_DELAY_SEC = 0.1
+WAREHOUSE_RESUME_MAX_DELAY_SEC = 2
+
 DEFAULT_COMPRESS_BLOCK_SIZE = 1048576
 DEFAULT_INSERT_BLOCK_SIZE = 1048576
 
+# Large IN list parameters sent as external tables
+DEFAULT_EXTERNAL_TABLE_PARAMS_THRESHOLD = 10000
+EXTERNAL_TABLE_PARAM_PREFIX = '_param_'
+
+DEFAULT_DBAPI_POOL_MAX_SIZE = 32
+DEFAULT_DBAPI_POOL_MAX_IDLE_SEC = 300
+DEFAULT_DBAPI_POOL_TIMEOUT_SEC = 0
+
 DBMS_NAME = 'ByteHouse'
 CLIENT_NAME = 'python-driver'
 CLIENT_VERSION_MAJOR = 20
@@ -69,6 +83,16 @@ CLIENT_REVISION = 54453
 
 BUFFER_SIZE = 1048576
 
+# Compiled columns per connection, parsed types and Struct objects per
+# process.
+COLUMN_CACHE_SIZE = 256
+TYPE_SPEC_CACHE_SIZE = 1024
+STRUCT_CACHE_SIZE = 1024
+
+# Client-side query result cache
+RESULT_CACHE_TTL_SEC = 60
+RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 STRINGS_ENCODING = 'utf-8'
 
 HostPortByRegion = {
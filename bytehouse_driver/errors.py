@@ -475,3 +475,17 @@ class PartiallyConsumedQueryError(Error):
 
     def __str__(self):
         return 'Simultaneous queries on single connection detected'
+
+
+class PoolTimeoutError(Error):
+    code = -1
+
+    def __str__(self):
+        return 'Timed out waiting for a free client in pool'
+
+
+class PoolClosedError(Error):
+    code = -1
+
+    def __str__(self):
+        return 'Client pool is closed'
@@ -0,0 +1,117 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import logging
+import threading
+from queue import Queue
+
+from .bufferedwriter import BufferedMemoryWriter
+from .defines import BUFFER_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class InsertPipeline(object):
+    """
+    Sends INSERT data blocks while the next blocks are serialized and
+    compressed on a worker thread.
+
+    At most ``depth`` serialized blocks wait for sending, so a slow network
+    stalls the worker instead of buffering the whole data in memory.
+
+    :param connection: connection with INSERT query being executed.
+    :param blocks: iterable of blocks. Consumed on the worker thread.
+    :param depth: maximum number of serialized blocks waiting for sending.
+    """
+
+    # Marks the end of blocks in queue.
+    finished = object()
+
+    def __init__(self, connection, blocks, depth):
+        self.connection = connection
+        self.blocks = blocks
+        self.queue = Queue(maxsize=depth)
+        self.stopped = threading.Event()
+
+        super(InsertPipeline, self).__init__()
+
+    def encode(self):
+        fout = BufferedMemoryWriter(BUFFER_SIZE)
+        block_out = self.connection.get_block_out_stream(fout)
+
+        try:
+            for block in self.blocks:
+                if self.stopped.is_set():
+                    break
+
+                self.connection.write_data(block, fout, block_out)
+                self.queue.put((fout.getvalue(), block.num_rows))
+
+        except BaseException as e:
+            self.queue.put(e)
+
+        finally:
+            self.queue.put(self.finished)
+
+    def run(self):
+        """
+        Sends all blocks.
+
+        :return: number of sent rows.
+        """
+        worker = threading.Thread(
+            target=self.encode, name='bytehouse-insert-pipeline', daemon=True
+        )
+        worker.start()
+
+        inserted_rows = 0
+        try:
+            while True:
+                item = self.queue.get()
+                if item is self.finished:
+                    break
+
+                if isinstance(item, BaseException):
+                    raise item
+
+                data, num_rows = item
+                self.connection.send_encoded_data(data)
+                inserted_rows += num_rows
+
+        except BaseException:
+            self.stop()
+            raise
+
+        finally:
+            worker.join()
+
+        return inserted_rows
+
+    def stop(self):
+        # Unblock worker waiting for free place in queue.
+        self.stopped.set()
+        while self.queue.get() is not self.finished:
+            pass
@@ -28,18 +28,32 @@ import numpy as np
 import pandas as pd
 
 
+def array_split(column, n_chunks):
+    """
+    Splits column into chunks the same way as :func:`numpy.array_split`.
+    Works for pandas extension arrays which NumPy would convert.
+    """
+    size, extra = divmod(len(column), n_chunks)
+    begin = 0
+    for i in range(n_chunks):
+        end = begin + size + (i < extra)
+        yield column[begin:end]
+        begin = end
+
+
 def column_chunks(columns, n):
     for column in columns:
-        if not isinstance(column, (np.ndarray, pd.DatetimeIndex)):
+        if not isinstance(column, (np.ndarray, pd.DatetimeIndex,
+                                   pd.api.extensions.ExtensionArray)):
             raise TypeError(
                 'Unsupported column type: {}. '
-                'ndarray/DatetimeIndex is expected.'
+                'ndarray/DatetimeIndex/ExtensionArray is expected.'
                 .format(type(column))
             )
 
     # create chunk generator for every column
     chunked = [
-        iter(np.array_split(c, len(c) // n) if len(c) > n else [c])
+        iter(array_split(c, len(c) // n) if len(c) > n else [c])
         for c in columns
     ]
 
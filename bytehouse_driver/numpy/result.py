@@ -24,6 +24,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import re
 from itertools import chain
 
 import numpy as np
@@ -34,12 +35,99 @@ from ..progress import Progress
 from ..result import QueryResult
 
 
+class ColumnBuffer(object):
+    """
+    Accumulates column from blocks. One-dimensional NumPy arrays are copied
+    into a single array grown with amortized doubling, so decoded blocks
+    are released immediately instead of being concatenated at the end.
+    Other chunks are kept as is and merged by :meth:`get_value`.
+    """
+
+    def __init__(self):
+        self.array = None
+        self.size = 0
+        self.chunks = []
+
+        super(ColumnBuffer, self).__init__()
+
+    def append(self, chunk, expected_size=0):
+        """
+        :param chunk: column of the next block.
+        :param expected_size: total number of rows expected, if known.
+                              Used to preallocate capacity.
+        """
+        is_array = isinstance(chunk, np.ndarray) and chunk.ndim == 1
+
+        if self.array is None and (self.chunks or not is_array):
+            self.chunks.append(chunk)
+            return
+
+        if not is_array:
+            self.chunks = [self.array[:self.size], chunk]
+            self.array = None
+            return
+
+        if self.array is None:
+            self.array = np.empty(0, dtype=chunk.dtype)
+
+        dtype = np.result_type(self.array.dtype, chunk.dtype)
+        if dtype != self.array.dtype:
+            self.array = self.array.astype(dtype)
+
+        size = self.size + len(chunk)
+        self.reserve(size, expected_size)
+        self.array[self.size:size] = chunk
+        self.size = size
+
+    def reserve(self, size, expected_size=0):
+        capacity = len(self.array)
+        if size <= capacity:
+            return
+
+        # Expected size is a number of rows server reads, not returns.
+        # It's only used to grow a bit further than doubling.
+        grown = max(2 * capacity, size)
+        if not self.array.dtype.hasobject:
+            grown = max(grown, min(expected_size, grown + size - self.size))
+
+        # resize() would fill new memory with zeros.
+        array = np.empty(grown, dtype=self.array.dtype)
+        array[:self.size] = self.array[:self.size]
+        self.array = array
+
+    def get_value(self):
+        if self.array is not None:
+            self.array.resize(self.size, refcheck=False)
+            return self.array
+
+        first = self.chunks[0]
+        if isinstance(first, np.ndarray):
+            return np.concatenate(self.chunks)
+        elif isinstance(first, pd.Categorical):
+            return union_categoricals(self.chunks)
+        elif isinstance(first, pd.api.extensions.ExtensionArray):
+            return type(first)._concat_same_type(self.chunks)
+        else:
+            return tuple(chain.from_iterable(self.chunks))
+
+
 class NumpyQueryResult(QueryResult):
     """
     Stores query result from multiple blocks as numpy arrays.
     """
 
+    def __init__(self, *args, **kwargs):
+        # Sum of total rows to read reported by progress packets.
+        self.expected_rows = 0
+
+        super(NumpyQueryResult, self).__init__(*args, **kwargs)
+
     def store(self, packet):
+        progress = getattr(packet, 'progress', None)
+        if progress:
+            self.expected_rows += progress.total_rows
+            return
+
         block = getattr(packet, 'block', None)
         if block is None:
             return
@@ -47,7 +135,12 @@ class NumpyQueryResult(QueryResult):
         # Header block contains no rows. Pick columns from it.
         if block.num_rows:
             if self.columnar:
-                self.data.append(block.get_columns())
+                columns = block.get_columns()
+                if not self.data:
+                    self.data = [ColumnBuffer() for _ in columns]
+
+                for buffer, column in zip(self.data, columns):
+                    buffer.append(column, expected_size=self.expected_rows)
             else:
                 self.data.extend(block.get_rows())
 
@@ -63,17 +156,7 @@ class NumpyQueryResult(QueryResult):
             self.store(packet)
 
         if self.columnar:
-            data = []
-            # Transpose to a list of columns, each column is list of chunks
-            for column_chunks in zip(*self.data):
-                # Concatenate chunks for each column
-                if isinstance(column_chunks[0], np.ndarray):
-                    column = np.concatenate(column_chunks)
-                elif isinstance(column_chunks[0], pd.Categorical):
-                    column = union_categoricals(column_chunks)
-                else:
-                    column = tuple(chain.from_iterable(column_chunks))
-                data.append(column)
+            data = [buffer.get_value() for buffer in self.data]
         else:
             data = self.data
 
@@ -103,6 +186,7 @@ class NumpyProgressQueryResult(NumpyQueryResult):
             progress_packet = getattr(packet, 'progress', None)
             if progress_packet:
                 self.progress_totals.increment(progress_packet)
+                self.expected_rows = self.progress_totals.total_rows
                 return (
                     self.progress_totals.rows, self.progress_totals.total_rows
                 )
@@ -147,3 +231,97 @@ class NumpyIterQueryResult(object):
             return rv
         else:
             return block.get_rows()
+
+
+class DataFrameIterQueryResult(object):
+    """
+    Provides iteration over returned data by DataFrames. Every block is
+    turned into DataFrame at once, so at most ``chunk_size`` rows and one
+    block are kept in memory. Index is continuous across DataFrames.
+
+    :param chunk_size: number of rows per DataFrame. DataFrame is yielded
+                       per block if not set. The last DataFrame may be
+                       shorter.
+    """
+
+    def __init__(self, packet_generator, chunk_size=None):
+        self.packet_generator = packet_generator
+        self.chunk_size = chunk_size
+
+        self.columns = None
+        self.start = 0
+        self.pending = []
+        self.n_pending = 0
+        super(DataFrameIterQueryResult, self).__init__()
+
+    def __iter__(self):
+        for packet in self.packet_generator:
+            for frame in self.store(packet):
+                yield frame
+
+        for frame in self.finish():
+            yield frame
+
+    def make_frame(self, block):
+        return pd.DataFrame(
+            {col: d for d, col in zip(block.get_columns(), self.columns)},
+            columns=self.columns
+        )
+
+    def emit(self, frame):
+        stop = self.start + len(frame)
+        frame = frame.set_axis(pd.RangeIndex(self.start, stop))
+        self.start = stop
+        return frame
+
+    def store(self, packet):
+        """
+        :return: list of DataFrames completed by packet.
+        """
+        block = getattr(packet, 'block', None)
+        if block is None:
+            return []
+
+        # Header block contains no rows. Pick columns from it.
+        if self.columns is None:
+            self.columns = [
+                re.sub(r'\W', '_', name)
+                for name, type_ in block.columns_with_types
+            ]
+
+        if not block.num_rows:
+            return []
+
+        frame = self.make_frame(block)
+        chunk_size = self.chunk_size
+        if not chunk_size:
+            return [self.emit(frame)]
+
+        self.pending.append(frame)
+        self.n_pending += len(frame)
+        if self.n_pending < chunk_size:
+            return []
+
+        if len(self.pending) > 1:
+            frame = pd.concat(self.pending, ignore_index=True)
+
+        n_full = self.n_pending - self.n_pending % chunk_size
+        rv = [
+            self.emit(frame.iloc[i:i + chunk_size])
+            for i in range(0, n_full, chunk_size)
+        ]
+
+        self.pending = [frame.iloc[n_full:]] if n_full < len(frame) else []
+        self.n_pending -= n_full
+        return rv
+
+    def finish(self):
+        """
+        :return: list with the last incomplete DataFrame, if any.
+        """
+        if not self.pending:
+            return []
+
+        frame = pd.concat(self.pending, ignore_index=True)
+        self.pending, self.n_pending = [], 0
+        return [self.emit(frame)]
@@ -0,0 +1,435 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import logging
+import threading
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from time import monotonic
+
+from . import errors
+from .client import Client
+
+logger = logging.getLogger(__name__)
+
+
+class _Waiter(object):
+    def __init__(self):
+        self.event = threading.Event()
+        # Idle client handed over by releasing thread.
+        self.entry = None
+
+
+class ClientPool(object):
+    """
+    Thread-safe pool of connected :class:`~bytehouse_driver.Client`
+    instances.
+
+    Each client is used by one thread at a time: take it with
+    :meth:`acquire` (or the :meth:`client` context manager) and give it back
+    with :meth:`release`. Clients that have been idle for longer than
+    ``ping_interval`` are checked with a ping before being handed out and
+    reconnected if the socket is dead. A background thread closes clients
+    that exceeded ``max_idle`` or ``max_lifetime`` and tops the pool up to
+    ``min_size``.
+
+    :param min_size: number of clients kept open even if they are idle.
+                     Defaults to ``1``.
+    :param max_size: maximum number of simultaneously open clients.
+                     Defaults to ``10``.
+    :param max_idle: seconds after which an idle client above ``min_size`` is
+                     closed. ``None`` disables idle eviction.
+                     Defaults to ``300``.
+    :param max_lifetime: seconds after which a client is closed regardless of
+                         its usage. ``None`` disables it. Defaults to ``3600``.
+    :param ping_interval: idle seconds after which a client is pinged before
+                          being handed out. Defaults to ``30``.
+    :param timeout: default seconds :meth:`acquire` waits for a free client
+                    when ``max_size`` clients are in use. ``None`` waits
+                    forever. Defaults to ``None``.
+    :param eviction_interval: seconds between background eviction runs.
+                              Defaults to ``10``.
+    :param client_factory: callable without arguments that returns new
+                           client. If specified client's ``args`` and
+                           ``kwargs`` are ignored.
+    :param \\*args: positional arguments for the client constructor.
+    :param \\**kwargs: all other args are passed to the
+                       :py:class:`~bytehouse_driver.Client` constructor.
+    """
+
+    client_cls = Client
+
+    def __init__(self, *args, min_size=1, max_size=10, max_idle=300,
+                 max_lifetime=3600, ping_interval=30, timeout=None,
+                 eviction_interval=10, client_factory=None, **kwargs):
+        if max_size < 1:
+            raise ValueError('max_size must be positive')
+        if not 0 <= min_size <= max_size:
+            raise ValueError('min_size must be between 0 and max_size')
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.ping_interval = ping_interval
+        self.timeout = timeout
+        self.eviction_interval = eviction_interval
+
+        self.client_factory = client_factory
+        self.client_args = args
+        self.client_kwargs = kwargs
+
+        self._lock = threading.Lock()
+        # Threads waiting for a client, served in FIFO order.
+        self._waiters = deque()
+        # Idle clients as (client, released_at) pairs, most recent at right.
+        self._idle = deque()
+        # All clients owned by pool mapped to their creation time.
+        self._created = {}
+        # Number of open clients including ones being created right now.
+        self._size = 0
+        self.closed = False
+
+        self._closing = threading.Event()
+        self._evictor = None
+
+        try:
+            self._fill()
+        except Exception:
+            self.close()
+            raise
+
+        # Thread references pool weakly, so unreferenced pool and its
+        # clients can be collected without close().
+        self._evictor = threading.Thread(
+            target=_run_evictor, name='bytehouse-pool-evictor',
+            args=(weakref.ref(self), self._closing, self.eviction_interval),
+            daemon=True
+        )
+        self._evictor.start()
+        weakref.finalize(self, self._closing.set)
+
+        super(ClientPool, self).__init__()
+
+    def __repr__(self):
+        return '<ClientPool(size={}, idle={}, closed={})>'.format(
+            self.size, self.idle, self.closed
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def size(self):
+        """
+        Number of open clients, both idle and in use.
+        """
+        return self._size
+
+    @property
+    def idle(self):
+        """
+        Number of clients waiting in the pool.
+        """
+        return len(self._idle)
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        """
+        Return a pool of clients configured from the given URL.
+
+        See :meth:`~bytehouse_driver.Client.from_url` for the URL format.
+
+        :param url: client URL.
+        :param \\**kwargs: pool parameters.
+        :return: :class:`ClientPool` instance.
+        """
+        return cls(url=url, **kwargs)
+
+    def _create_client(self):
+        url = self.client_kwargs.get('url')
+        if self.client_factory is not None:
+            client = self.client_factory()
+        elif url is not None:
+            client = self.client_cls.from_url(url)
+        else:
+            client = self.client_cls(*self.client_args, **self.client_kwargs)
+
+        if not client.connection.connected:
+            client.connection.connect()
+
+        return client
+
+    def _open(self):
+        # Slot must be reserved by caller.
+        try:
+            client = self._create_client()
+        except Exception:
+            with self._lock:
+                self._free_slot()
+            raise
+
+        with self._lock:
+            self._created[client] = monotonic()
+
+        return client
+
+    def _free_slot(self):
+        # Lock must be held. Slot is passed to the first waiter if any.
+        if self._waiters and not self.closed:
+            self._waiters.popleft().event.set()
+        else:
+            self._size -= 1
+
+    def _put_idle(self, entry):
+        # Lock must be held. Waiters are served in FIFO order so released
+        # clients can't be grabbed again by the thread that released them.
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.entry = entry
+            waiter.event.set()
+        else:
+            self._idle.append(entry)
+
+    def _discard(self, client):
+        with self._lock:
+            if self._created.pop(client, None) is not None:
+                self._free_slot()
+
+        client.disconnect()
+
+    def _is_expired(self, client, now):
+        if self.max_lifetime is None:
+            return False
+
+        return now - self._created[client] >= self.max_lifetime
+
+    def _check_alive(self, client):
+        connection = client.connection
+        try:
+            if connection.connected and connection.ping():
+                return
+        except errors.Error as e:
+            logger.warning(
+                'Error on %s ping: %s', connection.get_description(), e
+            )
+
+        logger.warning('Pooled connection was closed, reconnecting.')
+        connection.disconnect()
+        connection.connect()
+
+    def _wait(self, waiter, deadline):
+        remaining = None
+        if deadline is not None:
+            remaining = max(deadline - monotonic(), 0)
+
+        if not waiter.event.wait(remaining):
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise errors.PoolTimeoutError()
+
+        if self.closed:
+            if waiter.entry is not None:
+                self._discard(waiter.entry[0])
+            raise errors.PoolClosedError()
+
+        return waiter.entry
+
+    def acquire(self, timeout=None):
+        """
+        Takes client from the pool. Opens new one if there are no idle
+        clients and pool is not full, otherwise waits for a released client.
+
+        :param timeout: seconds to wait for a free client. Defaults to pool's
+                        ``timeout``.
+        :return: connected :class:`~bytehouse_driver.Client`.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        deadline = monotonic() + timeout if timeout is not None else None
+
+        while True:
+            entry = waiter = None
+
+            with self._lock:
+                if self.closed:
+                    raise errors.PoolClosedError()
+
+                if self._waiters:
+                    waiter = _Waiter()
+                    self._waiters.append(waiter)
+                elif self._idle:
+                    entry = self._idle.pop()
+                elif self._size < self.max_size:
+                    self._size += 1
+                else:
+                    waiter = _Waiter()
+                    self._waiters.append(waiter)
+
+            if waiter is not None:
+                entry = self._wait(waiter, deadline)
+
+            # No entry means that free slot was reserved for us.
+            if entry is None:
+                return self._open()
+
+            client, released_at = entry
+            now = monotonic()
+            if self._is_expired(client, now):
+                self._discard(client)
+                continue
+
+            if now - released_at >= self.ping_interval:
+                try:
+                    self._check_alive(client)
+                except Exception:
+                    self._discard(client)
+                    raise
+
+            return client
+
+    def release(self, client):
+        """
+        Returns client to the pool. Client with unfinished query or closed
+        connection is disconnected and dropped from the pool.
+
+        :param client: client previously taken with :meth:`acquire`.
+        """
+        with self._lock:
+            if client not in self._created:
+                raise ValueError('Client does not belong to this pool')
+
+            now = monotonic()
+            connection = client.connection
+            reusable = (
+                not self.closed and
+                connection.connected and
+                not connection.is_query_executing and
+                not self._is_expired(client, now)
+            )
+
+            if reusable:
+                self._put_idle((client, now))
+                return
+
+        self._discard(client)
+
+    @contextmanager
+    def client(self, timeout=None):
+        """
+        Context manager that acquires client and releases it on exit.
+
+        :param timeout: see :meth:`acquire`.
+        """
+        client = self.acquire(timeout=timeout)
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def _fill(self):
+        while True:
+            with self._lock:
+                if self.closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+
+            client = self._open()
+            with self._lock:
+                self._put_idle((client, monotonic()))
+
+    def evict(self):
+        """
+        Closes idle clients that exceeded ``max_idle`` or ``max_lifetime``.
+        Called periodically by the background thread.
+        """
+        stale = []
+
+        with self._lock:
+            now = monotonic()
+            keep = deque()
+            open_count = self._size
+
+            # Oldest clients are at the left side.
+            for client, released_at in self._idle:
+                idle_too_long = (
+                    self.max_idle is not None and
+                    now - released_at >= self.max_idle and
+                    open_count > self.min_size
+                )
+                if idle_too_long or self._is_expired(client, now):
+                    stale.append(client)
+                    open_count -= 1
+                else:
+                    keep.append((client, released_at))
+
+            self._idle = keep
+
+        for client in stale:
+            self._discard(client)
+
+    def close(self):
+        """
+        Closes all idle clients. Clients in use are closed when released.
+        The pool will be unusable from this point forward.
+        """
+        with self._lock:
+            self.closed = True
+            idle = [client for client, _ in self._idle]
+            self._idle.clear()
+
+            while self._waiters:
+                self._waiters.popleft().event.set()
+
+        self._closing.set()
+
+        for client in idle:
+            self._discard(client)
+
+        if self._evictor is not None and \
+                self._evictor is not threading.current_thread():
+            self._evictor.join()
+
+
+def _run_evictor(pool_ref, closing, interval):
+    while not closing.wait(interval):
+        pool = pool_ref()
+        if pool is None:
+            return
+
+        try:
+            pool.evict()
+            pool._fill()
+        except Exception as e:
+            logger.warning('Error on pool maintenance: %s', e)
+
+        # Reference must not be held while waiting.
+        del pool
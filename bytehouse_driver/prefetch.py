@@ -0,0 +1,132 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import logging
+import socket
+import threading
+from queue import Queue, Empty, Full
+
+from .protocol import ServerPacketTypes
+
+logger = logging.getLogger(__name__)
+
+
+class PacketPrefetcher(object):
+    """
+    Receives packets of query result on a worker thread.
+
+    Reading from socket, checksum verification, decompression and decoding
+    of the next blocks overlap with processing of the received ones. At most
+    ``depth`` packets wait in queue, so worker stalls if they are not
+    consumed.
+
+    Packets are prefetched as a whole: compressed frames carry no end of
+    block mark, so reading frames beyond the block being decoded could
+    consume the next packet.
+
+    :param connection: connection with query being executed.
+    :param depth: maximum number of received packets waiting in queue.
+    """
+
+    # Packets after which server sends nothing for the query.
+    last_packet_types = (
+        ServerPacketTypes.END_OF_STREAM, ServerPacketTypes.EXCEPTION
+    )
+    put_timeout = 0.1
+
+    def __init__(self, connection, depth):
+        self.connection = connection
+        self.queue = Queue(maxsize=depth)
+        self.stopped = threading.Event()
+
+        self.worker = threading.Thread(
+            target=self.receive, name='bytehouse-packet-prefetch',
+            daemon=True
+        )
+        self.worker.start()
+
+        super(PacketPrefetcher, self).__init__()
+
+    def receive(self):
+        try:
+            while not self.stopped.is_set():
+                packet = self.connection.receive_packet()
+                self.put(packet)
+
+                if packet.type in self.last_packet_types:
+                    break
+
+        except BaseException as e:
+            self.put(e)
+
+    def put(self, item):
+        while not self.stopped.is_set():
+            try:
+                self.queue.put(item, timeout=self.put_timeout)
+                return
+            except Full:
+                pass
+
+    def get(self):
+        """
+        :return: next received packet. Re-raises worker errors.
+        """
+        item = self.queue.get()
+        if isinstance(item, BaseException):
+            raise item
+
+        return item
+
+    def abort(self):
+        """
+        Stops receiving of unfinished result. Socket is shut down to wake up
+        worker waiting for server. Connection state is left intact while
+        worker runs, connection must be disconnected after that.
+        """
+        sock = self.connection.socket
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except socket.error as e:
+                logger.warning('Error on socket shutdown: %s', e)
+
+        self.stop()
+
+    def stop(self):
+        """
+        Stops receiving and waits for worker to exit after the packet being
+        received. Use :meth:`abort` if query result is not read to the end,
+        otherwise worker can wait for server forever.
+        """
+        self.stopped.set()
+
+        while True:
+            try:
+                self.queue.get_nowait()
+            except Empty:
+                break
+
+        self.worker.join()
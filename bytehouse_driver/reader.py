@@ -24,8 +24,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from struct import Struct
-
+from .util.helpers import get_struct
 from .varint import read_varint
 
 
@@ -52,7 +51,7 @@ def read_binary_int(buf, fmt):
     Reads int from buffer with provided format.
     """
     # Little endian.
-    s = Struct('<' + fmt)
+    s = get_struct('<' + fmt)
     return s.unpack(buf.read(s.size))[0]
 
 
@@ -25,6 +25,7 @@ SOFTWARE.
 """
 
 from .blockstreamprofileinfo import BlockStreamProfileInfo
+from .columns.lowcardinalitycolumn import DictEncodedColumn
 from .progress import Progress
 
 
@@ -61,7 +62,11 @@ class QueryResult(object):
                 else:
                     # Cast tuples to lists for further extending.
                     # Concatenating tuples produce new tuple. It's slow.
-                    self.data = [list(c) for c in columns]
+                    # Dictionary encoded columns are extended in place.
+                    self.data = [
+                        c.copy() if isinstance(c, DictEncodedColumn)
+                        else list(c) for c in columns
+                    ]
             else:
                 self.data.extend(block.get_rows())
 
@@ -78,7 +83,10 @@ class QueryResult(object):
 
         data = self.data
         if self.columnar:
-            data = [tuple(c) for c in self.data]
+            data = [
+                c if isinstance(c, DictEncodedColumn) else tuple(c)
+                for c in self.data
+            ]
 
         if self.with_column_types:
             return data, self.columns_with_types
@@ -151,6 +159,27 @@ class IterQueryResult(object):
             return block.get_rows()
 
 
+class BlockIterQueryResult(object):
+    """
+    Provides iteration over returned data by decoded blocks. Blocks without
+    rows are skipped.
+    """
+
+    def __init__(self, packet_generator):
+        self.packet_generator = packet_generator
+        super(BlockIterQueryResult, self).__init__()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            packet = next(self.packet_generator)
+            block = getattr(packet, 'block', None)
+            if block is not None and block.num_rows:
+                return block
+
+
 class QueryInfo(object):
     def __init__(self):
         self.profile_info = BlockStreamProfileInfo()
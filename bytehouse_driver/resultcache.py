@@ -0,0 +1,224 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import re
+import sys
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+from . import defines
+from .columns.lowcardinalitycolumn import DictEncodedColumn
+
+# Quoted literals and identifiers are kept as is, whitespace runs outside
+# of them are collapsed.
+normalize_re = re.compile(
+    r"('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`(?:[^`\\]|\\.)*`)|\s+"
+)
+read_only_query_re = re.compile(r'^\(*\s*(SELECT|WITH)\b', re.IGNORECASE)
+
+
+def normalize_query(query):
+    """
+    Collapses whitespace outside of quotes and strips trailing semicolons.
+    """
+    query = normalize_re.sub(lambda m: m.group(1) or ' ', query)
+    return query.strip().rstrip(';').rstrip()
+
+
+def is_read_only_query(query):
+    return read_only_query_re.match(query) is not None
+
+
+def estimate_size(value):
+    """
+    Estimates memory taken by query result in bytes. NumPy arrays and
+    pandas objects report their buffers, containers are summed up
+    recursively.
+    """
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(x) for x in value)
+
+    elif isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+
+    elif isinstance(value, DictEncodedColumn):
+        return estimate_size(value.index) + sys.getsizeof(value.keys)
+
+    memory_usage = getattr(value, 'memory_usage', None)
+    if memory_usage is not None:
+        # pandas DataFrame or Series.
+        usage = memory_usage(index=True, deep=True)
+        return int(usage.sum() if hasattr(usage, 'sum') else usage)
+
+    nbytes = getattr(value, 'nbytes', None)
+    if nbytes is not None:
+        dtype = getattr(value, 'dtype', None)
+        if getattr(dtype, 'hasobject', False):
+            return nbytes + sum(estimate_size(x) for x in value)
+        return nbytes
+
+    return sys.getsizeof(value)
+
+
+def copy_result(value):
+    """
+    Copies lists of result so caller's modifications don't reach cache.
+    Rows, columns and arrays are shared.
+    """
+    if isinstance(value, list):
+        return list(value)
+    elif isinstance(value, tuple):
+        return tuple(copy_result(x) for x in value)
+    return value
+
+
+class ResultCollector(object):
+    """
+    Collects streamed rows for result cache. Rows are no longer collected
+    once they are estimated not to fit into ``max_bytes``.
+
+    :param max_bytes: memory budget of cache.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.rows = []
+        self.row_size = None
+        super(ResultCollector, self).__init__()
+
+    def append(self, row):
+        if self.rows is None:
+            return
+
+        self.rows.append(row)
+        if self.row_size is None:
+            self.row_size = estimate_size(row)
+        elif len(self.rows) * self.row_size > self.max_bytes:
+            self.rows = None
+
+
+class ResultCache(object):
+    """
+    Thread-safe LRU cache of SELECT query results.
+
+    Entries expire after ``ttl`` seconds. Least recently used entries are
+    evicted when estimated size of all results exceeds ``max_bytes``.
+    Results larger than ``max_bytes`` are not cached.
+
+    Keys are tuples that start with normalized query text. They are built
+    by :class:`~bytehouse_driver.Client` from query, parameters, settings,
+    database and warehouse.
+
+    :param max_bytes: memory budget for all results.
+    :param ttl: default entry lifetime in seconds.
+    """
+
+    def __init__(self, max_bytes=defines.RESULT_CACHE_MAX_BYTES,
+                 ttl=defines.RESULT_CACHE_TTL_SEC):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        super(ResultCache, self).__init__()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        :return: cached result or ``default`` if entry is absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= monotonic():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value, ttl=None):
+        """
+        Stores result. Least recently used results are evicted to fit it
+        into ``max_bytes``.
+
+        :param ttl: entry lifetime in seconds. Defaults to cache ``ttl``.
+        """
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        expires_at = monotonic() + (self.ttl if ttl is None else ttl)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, size, expires_at)
+            self.size += size
+
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, pattern=None):
+        """
+        Removes results of queries matching regular expression.
+
+        :param pattern: regular expression searched in normalized query
+                        text. All entries are removed if not specified.
+        :return: number of removed entries.
+        """
+        with self._lock:
+            if pattern is None:
+                keys = list(self._entries)
+            else:
+                regex = re.compile(pattern)
+                keys = [x for x in self._entries if regex.search(x[0])]
+
+            for key in keys:
+                self._remove(key)
+
+            return len(keys)
+
+    def clear(self):
+        self.invalidate()
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.size -= size
@@ -0,0 +1,113 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import threading
+
+from .resultcache import copy_result
+
+
+class InFlightQuery(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.completed = False
+        super(InFlightQuery, self).__init__()
+
+
+class QueryCoalescer(object):
+    """
+    Thread-safe coalescer of identical concurrent queries.
+
+    The first caller of :meth:`run` with some key executes the query. Callers
+    with the same key arriving before it finishes wait for it and get its
+    result or its exception instead of executing the query again. If the
+    first caller is interrupted by an exception other than
+    :class:`Exception`, waiters retry.
+
+    Keys are built by :class:`~bytehouse_driver.Client` from query,
+    parameters, settings, database and warehouse.
+    """
+
+    def __init__(self):
+        self.executed = 0
+        self.coalesced = 0
+
+        self._calls = {}
+        self._lock = threading.Lock()
+        super(QueryCoalescer, self).__init__()
+
+    def __len__(self):
+        return len(self._calls)
+
+    def run(self, key, func):
+        """
+        Calls ``func`` unless call with the same ``key`` is in flight.
+
+        :param key: query key.
+        :param func: callable without arguments executing the query.
+        :return: tuple of result and flag whether ``func`` was called by
+                 this caller. Waiters get their own copies of result lists.
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = InFlightQuery()
+                    self.executed += 1
+                else:
+                    self.coalesced += 1
+
+            if leader:
+                break
+
+            call.done.wait()
+            # Leader interrupted by KeyboardInterrupt or similar: its
+            # exception is not shared, waiters run query again.
+            if not call.completed:
+                continue
+
+            if call.error is not None:
+                raise call.error
+            return copy_result(call.result), False
+
+        try:
+            rv = func()
+            # Snapshot is taken before caller can modify returned lists.
+            call.result = copy_result(rv)
+            call.completed = True
+            return rv, True
+
+        except Exception as e:
+            call.error = e
+            call.completed = True
+            raise
+
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -24,7 +24,9 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from threading import Lock
 
 try:
     from clickhouse_cityhash.cityhash import CityHash128
@@ -37,17 +39,43 @@ from .native import BlockOutputStream, BlockInputStream
 from ..bufferedreader import CompressedBufferedReader
 from ..bufferedwriter import CompressedBufferedWriter
 from ..compression import get_decompressor_cls
+from ..compression.base import FrameBuffer
 from ..defines import BUFFER_SIZE
 from ..reader import read_binary_uint8, read_binary_uint128
 from ..writer import write_binary_uint8, write_binary_uint128
 
+compress_executors = {}
+compress_executors_lock = Lock()
+
+
+def get_compress_executor(threads):
+    """
+    Returns process-wide thread pool with given number of threads. Pools are
+    shared by all connections.
+    """
+    with compress_executors_lock:
+        executor = compress_executors.get(threads)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=threads, thread_name_prefix='bytehouse-compress'
+            )
+            compress_executors[threads] = executor
+
+        return executor
+
 
 class CompressedBlockOutputStream(BlockOutputStream):
-    def __init__(self, compressor_cls, compress_block_size, fout, context):
+    def __init__(self, compressor_cls, compress_block_size, fout, context,
+                 compress_threads=1):
         self.compressor_cls = compressor_cls
         self.compress_block_size = compress_block_size
         self.raw_fout = fout
 
+        if compress_threads > 1:
+            self.executor = get_compress_executor(compress_threads)
+        else:
+            self.executor = None
+
         self.compressor = self.compressor_cls()
         self.fout = CompressedBufferedWriter(self.compressor, BUFFER_SIZE)
         super(CompressedBlockOutputStream, self).__init__(self.fout, context)
@@ -58,22 +86,26 @@ class CompressedBlockOutputStream(BlockOutputStream):
     def finalize(self):
         self.fout.flush()
 
-        compressed = self.get_compressed()
-        compressed_size = len(compressed)
-
-        compressed_hash = self.get_compressed_hash(compressed)
-        write_binary_uint128(compressed_hash, self.raw_fout)
-
+        data = self.compressor.get_value()
         block_size = self.compress_block_size
+        frames = [
+            data[i:i + block_size] for i in range(0, len(data), block_size)
+        ]
+
+        # Compressors release GIL, so frames are compressed in parallel.
+        if self.executor is not None and len(frames) > 1:
+            compressed_frames = self.executor.map(self.get_compressed, frames)
+        else:
+            compressed_frames = map(self.get_compressed, frames)
 
-        i = 0
-        while i < compressed_size:
-            self.raw_fout.write(compressed[i:i + block_size])
-            i += block_size
+        for compressed in compressed_frames:
+            compressed_hash = self.get_compressed_hash(compressed)
+            write_binary_uint128(compressed_hash, self.raw_fout)
+            self.raw_fout.write(compressed)
 
         self.raw_fout.flush()
 
-    def get_compressed(self):
+    def get_compressed(self, data):
         compressed = BytesIO()
 
         if self.compressor.method_byte is not None:
@@ -82,8 +114,8 @@ class CompressedBlockOutputStream(BlockOutputStream):
         else:
             extra_header_size = 0
 
-        data = self.compressor.get_compressed_data(extra_header_size)
-        compressed.write(data)
+        frame = self.compressor.compress_frame(data, extra_header_size)
+        compressed.write(frame)
 
         return compressed.getvalue()
 
@@ -91,6 +123,8 @@ class CompressedBlockOutputStream(BlockOutputStream):
 class CompressedBlockInputStream(BlockInputStream):
     def __init__(self, fin, context):
         self.raw_fin = fin
+        # Shared by all frames. Holds allocation counters.
+        self.frame_buffer = FrameBuffer()
         fin = CompressedBufferedReader(self.read_block, BUFFER_SIZE)
         super(CompressedBlockInputStream, self).__init__(fin, context)
 
@@ -110,5 +144,6 @@ class CompressedBlockInputStream(BlockInputStream):
             extra_header_size = 0
 
         return decompressor.get_decompressed_data(
-            method_byte, compressed_hash, extra_header_size
+            method_byte, compressed_hash, extra_header_size,
+            frame=self.frame_buffer
         )
@@ -48,6 +48,9 @@ class BlockOutputStream(object):
         n_columns = block.num_columns
         n_rows = block.num_rows
 
+        # Blocks of Arrow arrays are written by Arrow columns.
+        write = getattr(block, 'column_writer', None) or write_column
+
         write_varint(n_columns, self.fout)
         write_varint(n_rows, self.fout)
 
@@ -61,8 +64,8 @@ class BlockOutputStream(object):
                 except IndexError:
                     raise ValueError('Different rows length')
 
-                write_column(self.context, col_name, col_type, items,
-                             self.fout, types_check=block.types_check)
+                write(self.context, col_name, col_type, items,
+                      self.fout, types_check=block.types_check)
 
         self.finalize()
 
@@ -87,6 +90,11 @@ class BlockInputStream(object):
         n_columns = read_varint(self.fin)
         n_rows = read_varint(self.fin)
 
+        client_settings = self.context.client_settings
+        use_arrow = use_numpy is None and client_settings.get('use_arrow')
+        if use_arrow:
+            from ..columns.arrow.service import read_arrow_column
+
         data, names, types = [], [], []
 
         for i in range(n_columns):
@@ -102,18 +110,33 @@ class BlockInputStream(object):
             types.append(column_type)
 
             if n_rows:
-                column = read_column(self.context, column_type, n_rows,
-                                     self.fin, use_numpy=use_numpy)
+                if use_arrow:
+                    column = read_arrow_column(self.context, column_type,
+                                               n_rows, self.fin)
+                else:
+                    column = read_column(self.context, column_type, n_rows,
+                                         self.fin, use_numpy=use_numpy)
                 data.append(column)
 
-        if self.context.client_settings['use_numpy']:
+        columns_with_types = list(zip(names, types))
+
+        if use_arrow:
+            from ..arrow.block import ArrowColumnOrientedBlock
+            return ArrowColumnOrientedBlock(
+                columns_with_types=columns_with_types,
+                data=data,
+                info=info,
+                context=self.context
+            )
+
+        if client_settings['use_numpy']:
             from ..numpy.block import NumpyColumnOrientedBlock
             block_cls = NumpyColumnOrientedBlock
         else:
             block_cls = ColumnOrientedBlock
 
         block = block_cls(
-            columns_with_types=list(zip(names, types)),
+            columns_with_types=columns_with_types,
             data=data,
             info=info,
         )
@@ -0,0 +1,152 @@
+from cpython.ref cimport PyObject
+from libc.stdlib cimport free, malloc
+
+
+cdef extern from "Python.h":
+    # Raw pointers keep references under manual control: list items are
+    # set without Cython's reference counting on every cell.
+    PyObject* PyList_New(Py_ssize_t size)
+    void PyList_SET_ITEM(PyObject* lst, Py_ssize_t i, PyObject* item)
+    Py_ssize_t PyList_GET_SIZE(PyObject* lst)
+    PyObject* PyList_GET_ITEM(PyObject* lst, Py_ssize_t i)
+    Py_ssize_t PyTuple_GET_SIZE(PyObject* tpl)
+    PyObject* PyTuple_GET_ITEM(PyObject* tpl, Py_ssize_t i)
+    PyObject* PyDict_GetItemWithError(PyObject* d, PyObject* key) except? NULL
+    void Py_INCREF(PyObject* obj)
+    void Py_DECREF(PyObject* obj)
+
+
+cdef list new_columns(Py_ssize_t n_columns, Py_ssize_t n_rows,
+                      PyObject** columns):
+    """
+    Allocates ``n_columns`` lists of ``n_rows`` items and stores borrowed
+    pointers to them into ``columns``. Items must be set before lists are
+    exposed.
+    """
+    cdef list rv = []
+    cdef PyObject* column
+    cdef Py_ssize_t j
+
+    for j in range(n_columns):
+        column = PyList_New(n_rows)
+        if column == NULL:
+            raise MemoryError()
+
+        rv.append(<object> column)
+        # Appended list holds the only reference we need.
+        Py_DECREF(column)
+        columns[j] = column
+
+    return rv
+
+
+def rows_to_columns(rows, Py_ssize_t n_columns):
+    """
+    Transposes sequence of tuple or list rows into ``n_columns`` lists in
+    a single pass over rows.
+
+    :raises ValueError: if any row is shorter than ``n_columns``.
+    """
+    cdef Py_ssize_t i, j, n_rows = len(rows)
+    cdef PyObject** columns = <PyObject**> malloc(
+        max(n_columns, 1) * sizeof(PyObject*)
+    )
+    cdef PyObject* row_ptr
+    cdef PyObject* item
+    cdef object row, value
+    cdef list rv
+
+    if columns == NULL:
+        raise MemoryError()
+
+    try:
+        rv = new_columns(n_columns, n_rows, columns)
+
+        for i in range(n_rows):
+            row = rows[i]
+            row_ptr = <PyObject*> row
+
+            if type(row) is tuple:
+                if PyTuple_GET_SIZE(row_ptr) < n_columns:
+                    raise ValueError('Different rows length')
+
+                for j in range(n_columns):
+                    item = PyTuple_GET_ITEM(row_ptr, j)
+                    Py_INCREF(item)
+                    PyList_SET_ITEM(columns[j], i, item)
+
+            elif type(row) is list:
+                if PyList_GET_SIZE(row_ptr) < n_columns:
+                    raise ValueError('Different rows length')
+
+                for j in range(n_columns):
+                    item = PyList_GET_ITEM(row_ptr, j)
+                    Py_INCREF(item)
+                    PyList_SET_ITEM(columns[j], i, item)
+
+            else:
+                if len(row) < n_columns:
+                    raise ValueError('Different rows length')
+
+                for j in range(n_columns):
+                    value = row[j]
+                    Py_INCREF(<PyObject*> value)
+                    PyList_SET_ITEM(columns[j], i, <PyObject*> value)
+
+    finally:
+        # Lists with unset (NULL) items are never exposed on error and are
+        # safe to release.
+        free(columns)
+
+    return rv
+
+
+def dicts_to_columns(rows, keys):
+    """
+    Transposes sequence of dict rows into a list per key in a single pass
+    over rows. Exact dicts are looked up directly, other mappings by
+    ``row[key]``.
+
+    :raises KeyError: if row has no key.
+    """
+    cdef list key_list = list(keys)
+    cdef Py_ssize_t i, j, n_rows = len(rows), n_columns = len(key_list)
+    cdef PyObject** columns = <PyObject**> malloc(
+        max(n_columns, 1) * sizeof(PyObject*)
+    )
+    cdef PyObject* row_ptr
+    cdef PyObject* item
+    cdef object row, key, value
+    cdef list rv
+
+    if columns == NULL:
+        raise MemoryError()
+
+    try:
+        rv = new_columns(n_columns, n_rows, columns)
+
+        for i in range(n_rows):
+            row = rows[i]
+            row_ptr = <PyObject*> row
+
+            if type(row) is dict:
+                for j in range(n_columns):
+                    key = key_list[j]
+                    item = PyDict_GetItemWithError(row_ptr, <PyObject*> key)
+                    if item == NULL:
+                        raise KeyError(key)
+
+                    Py_INCREF(item)
+                    PyList_SET_ITEM(columns[j], i, item)
+
+            else:
+                for j in range(n_columns):
+                    value = row[key_list[j]]
+                    Py_INCREF(<PyObject*> value)
+                    PyList_SET_ITEM(columns[j], i, <PyObject*> value)
+
+    finally:
+        free(columns)
+
+    return rv
+
@@ -43,6 +43,10 @@ escape_chars_map = {
     "\\": "\\\\",
     "'": "\\'"
 }
+escape_chars_table = str.maketrans(escape_chars_map)
+
+# Values written as is.
+number_types = frozenset([int, float])
 
 
 def escape_datetime(item, context):
@@ -54,8 +58,28 @@ def escape_datetime(item, context):
     return "'%s'" % item.strftime('%Y-%m-%d %H:%M:%S')
 
 
+def escape_str(item):
+    return "'%s'" % item.translate(escape_chars_table)
+
+
+def escape_items(items, context):
+    item_types = set(map(type, items))
+
+    # Homogeneous lists, such as huge IN lists, skip per item dispatch.
+    if number_types.issuperset(item_types):
+        return ', '.join(map(str, items))
+
+    elif item_types == {str}:
+        return ', '.join([escape_str(x) for x in items])
+
+    return ', '.join([str(escape_param(x, context)) for x in items])
+
+
 def escape_param(item, context):
-    if item is None:
+    if type(item) in number_types:
+        return item
+
+    elif item is None:
         return 'NULL'
 
     elif isinstance(item, datetime):
@@ -65,13 +89,13 @@ def escape_param(item, context):
         return "'%s'" % item.strftime('%Y-%m-%d')
 
     elif isinstance(item, str):
-        return "'%s'" % ''.join(escape_chars_map.get(c, c) for c in item)
+        return escape_str(item)
 
     elif isinstance(item, list):
-        return "[%s]" % ', '.join(str(escape_param(x, context)) for x in item)
+        return "[%s]" % escape_items(item, context)
 
     elif isinstance(item, tuple):
-        return "(%s)" % ', '.join(str(escape_param(x, context)) for x in item)
+        return "(%s)" % escape_items(item, context)
 
     elif isinstance(item, Enum):
         return escape_param(item.value, context)
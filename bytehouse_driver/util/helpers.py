@@ -24,7 +24,11 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from functools import lru_cache
 from itertools import islice, tee
+from struct import Struct
+
+from ..defines import STRUCT_CACHE_SIZE
 
 
 def chunks(seq, n):
@@ -45,6 +49,15 @@ def chunks(seq, n):
             item = list(islice(it, n))
 
 
+@lru_cache(STRUCT_CACHE_SIZE)
+def get_struct(fmt):
+    """
+    Returns compiled Struct for format. Struct objects are immutable and
+    shared by all callers.
+    """
+    return Struct(fmt)
+
+
 def pairwise(iterable):
     a, b = tee(iterable)
     next(b, None)
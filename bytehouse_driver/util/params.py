@@ -0,0 +1,129 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import re
+
+from .. import defines
+
+in_param_re_tpl = r'\bIN\s*%\({}\)s'
+name_re = re.compile(r'\w+', re.ASCII)
+
+# Narrowest integer type is picked to keep external table small.
+uint_types = [('UInt' + str(x), (1 << x) - 1) for x in (8, 16, 32, 64)]
+int_types = [('Int' + str(x), 1 << (x - 1)) for x in (8, 16, 32, 64)]
+# Integers exactly representable as Float64.
+max_float_int = 1 << 53
+
+
+def infer_values_type(values):
+    """
+    :return: ByteHouse type of homogeneous values or ``None`` if values
+             can't be sent as external table column.
+    """
+    types = set(map(type, values))
+
+    if types == {int}:
+        low, high = min(values), max(values)
+        if low >= 0:
+            for type_name, type_max in uint_types:
+                if high <= type_max:
+                    return type_name
+        else:
+            for type_name, bound in int_types:
+                if low >= -bound and high < bound:
+                    return type_name
+
+    elif types == {float}:
+        return 'Float64'
+
+    elif types == {int, float}:
+        exact = all(
+            -max_float_int <= x <= max_float_int
+            for x in values if type(x) is int
+        )
+        if exact:
+            return 'Float64'
+
+    elif types == {str}:
+        return 'String'
+
+    return None
+
+
+def extract_in_params(query, params, threshold, use_numpy=False):
+    """
+    Moves list and tuple parameters of at least ``threshold`` items used
+    as ``IN %(name)s`` into external tables. Placeholders are replaced with
+    subqueries on these tables.
+
+    :return: tuple of query, remaining parameters and external tables.
+    """
+    tables = []
+    moved = []
+
+    for name, value in params.items():
+        if not isinstance(value, (list, tuple)) or len(value) < threshold:
+            continue
+
+        # Parameter name becomes a part of table name.
+        if not name_re.fullmatch(name):
+            continue
+
+        in_param_re = re.compile(
+            in_param_re_tpl.format(re.escape(name)), re.IGNORECASE
+        )
+        if not in_param_re.search(query):
+            continue
+
+        type_name = infer_values_type(value)
+        if type_name is None:
+            continue
+
+        table_name = defines.EXTERNAL_TABLE_PARAM_PREFIX + name
+        query = in_param_re.sub(
+            'IN (SELECT value FROM {})'.format(table_name), query
+        )
+
+        if use_numpy:
+            import pandas as pd
+
+            data = pd.DataFrame({'value': value})
+        else:
+            data = [(x, ) for x in value]
+
+        moved.append(name)
+        tables.append({
+            'name': table_name,
+            'structure': [('value', type_name)],
+            'data': data
+        })
+
+    # Parameters can still be used outside of IN.
+    unused = [x for x in moved if '%({})s'.format(x) not in query]
+    if unused:
+        params = {k: v for k, v in params.items() if k not in unused}
+
+    return query, params, tables
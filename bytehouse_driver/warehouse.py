@@ -0,0 +1,103 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import threading
+from time import monotonic
+
+from . import defines
+
+
+class WarehouseCache(object):
+    """
+    Thread-safe cache of resolved virtual warehouses.
+
+    Keys are ``(host, port, user, warehouse)`` tuples where ``warehouse`` is
+    the requested name or ``None`` for the default one. Values are names of
+    warehouses that were running when they were stored. Entries expire after
+    ``ttl`` seconds.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        super(WarehouseCache, self).__init__()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            name, expires_at = entry
+            if expires_at <= monotonic():
+                del self._entries[key]
+                return None
+
+            return name
+
+    def set(self, key, name):
+        with self._lock:
+            self._entries[key] = (name, monotonic() + self.ttl)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by all clients of the process.
+warehouse_cache = WarehouseCache(defines.WAREHOUSE_CACHE_TTL_SEC)
+
+
+def resume_delays(timeout=defines.WAREHOUSE_RESUME_TIMEOUT_SEC,
+                  initial=defines.WAREHOUSE_RESUME_INITIAL_DELAY_SEC,
+                  maximum=defines.WAREHOUSE_RESUME_MAX_DELAY_SEC):
+    """
+    Yields exponentially growing delays between warehouse status checks
+    until ``timeout`` seconds pass.
+    """
+    deadline = monotonic() + timeout
+    delay = initial
+
+    while True:
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            return
+
+        yield min(delay, remaining)
+        delay = min(delay * 2, maximum)
+
+
+def is_warehouse_up(warehouses, name):
+    """
+    :param warehouses: rows of ``SHOW WAREHOUSES`` query.
+    :param name: warehouse name.
+    :return: ``True`` if warehouse is running.
+    """
+    for warehouse in warehouses:
+        if warehouse[1] == name and warehouse[6] == "up":
+            return True
+    return False
@@ -75,6 +75,22 @@ extensions = [
         'bytehouse_driver.columns.largeint',
         ['bytehouse_driver/columns/largeint' + ext]
     ),
+    Extension(
+        'bytehouse_driver.columns.dates',
+        ['bytehouse_driver/columns/dates' + ext]
+    ),
+    Extension(
+        'bytehouse_driver.columns.lowcardinalityencoder',
+        ['bytehouse_driver/columns/lowcardinalityencoder' + ext]
+    ),
+    Extension(
+        'bytehouse_driver.columns.timezones',
+        ['bytehouse_driver/columns/timezones' + ext]
+    ),
+    Extension(
+        'bytehouse_driver.transpose',
+        ['bytehouse_driver/transpose' + ext]
+    ),
     Extension(
         'bytehouse_driver.varint',
         ['bytehouse_driver/varint' + ext]
@@ -160,7 +176,8 @@ setup(
             'clickhouse-cityhash>=1.0.2.1'
         ],
         'zstd': ['zstd', 'clickhouse-cityhash>=1.0.2.1'],
-        'numpy': ['numpy>=1.12.0', 'pandas>=0.24.0']
+        'numpy': ['numpy>=1.12.0', 'pandas>=0.24.0'],
+        'arrow': ['numpy>=1.17.0', 'pyarrow>=7.0.0']
     },
     test_suite='pytest'
 )
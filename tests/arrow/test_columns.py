@@ -0,0 +1,383 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import socket
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from threading import Thread
+from unittest import TestCase, SkipTest
+from unittest.mock import Mock
+
+try:
+    import numpy as np
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from bytehouse_driver import defines, errors
+from bytehouse_driver.bufferedreader import (
+    BufferedSocketReader, CompressedBufferedReader
+)
+from bytehouse_driver.bufferedwriter import BufferedMemoryWriter
+from bytehouse_driver.columns.service import read_column, write_column
+from bytehouse_driver.connection import ServerInfo
+from bytehouse_driver.context import Context
+
+
+class BaseArrowTestCase(TestCase):
+    def setUp(self):
+        if pa is None:
+            raise SkipTest('pyarrow package is not installed')
+
+        self.context = Context()
+        self.context.server_info = ServerInfo(
+            'test', 21, 8, 0, defines.CLIENT_REVISION, 'UTC', 'test'
+        )
+        self.context.settings = {}
+        self.context.client_settings = {
+            'strings_as_bytes': False,
+            'strings_encoding': defines.STRINGS_ENCODING,
+            'use_numpy': False,
+            'use_arrow': True,
+            'input_format_null_as_default': False
+        }
+
+    def write(self, columns):
+        buf = BufferedMemoryWriter(defines.BUFFER_SIZE)
+        for spec, data in columns:
+            write_column(self.context, 'x', spec, list(data), buf)
+        buf.flush()
+        return buf.getvalue()
+
+
+class ArrowColumnsTestCase(BaseArrowTestCase):
+    def read(self, buf, columns):
+        from bytehouse_driver.columns.arrow.service import read_arrow_column
+
+        rv = []
+        for spec, data in columns:
+            column = read_arrow_column(self.context, spec, len(data), buf)
+            column.validate(full=True)
+            rv.append(column)
+        return rv
+
+    def assertRead(self, spec, data, expected_type, expected=None):
+        chunks = iter([self.write([(spec, data)])])
+        buf = CompressedBufferedReader(lambda: next(chunks), 1024)
+        column, = self.read(buf, [(spec, data)])
+
+        self.assertEqual(column.type, expected_type)
+        self.assertEqual(
+            column.to_pylist(), data if expected is None else expected
+        )
+
+    def test_fixed_width(self):
+        self.assertRead('Int8', [1, -2, 3], pa.int8())
+        self.assertRead('UInt64', [1, 2 ** 63], pa.uint64())
+        self.assertRead('Float64', [1.5, 2.0], pa.float64())
+        self.assertRead('Date', [date(2020, 1, 2)], pa.date32())
+
+    def test_nullable(self):
+        self.assertRead('Nullable(Int64)', [1, None, 3], pa.int64())
+        self.assertRead('Nullable(String)', ['a', None, ''], pa.string())
+
+    def test_string(self):
+        self.assertRead('String', ['a', '', 'яю'], pa.string())
+        self.assertRead(
+            'FixedString(3)', ['abc', 'de'], pa.binary(3),
+            expected=[b'abc', b'de\x00']
+        )
+
+    def test_strings_as_bytes(self):
+        client_settings = self.context.client_settings
+        client_settings['strings_as_bytes'] = True
+        self.context.client_settings = client_settings
+        self.assertRead('String', [b'a', b'\xff'], pa.binary())
+
+    def test_datetime(self):
+        utc = pa.timestamp('s', tz='UTC')
+        self.assertRead(
+            "DateTime('UTC')", [datetime(2020, 1, 2, 3, 4, 5)], utc,
+            expected=[pa.scalar(1577934245, utc).as_py()]
+        )
+
+        utc = pa.timestamp('ms', tz='UTC')
+        value = datetime(2020, 1, 2, 3, 4, 5, 123000)
+        self.assertRead(
+            "DateTime64(3, 'UTC')", [value], utc,
+            expected=[pa.scalar(1577934245123, utc).as_py()]
+        )
+
+    def test_array(self):
+        self.assertRead(
+            'Array(Array(Int32))', [[[1, 2], [3]], [], [[4]]],
+            pa.list_(pa.list_(pa.int32()))
+        )
+        self.assertRead(
+            'Array(Nullable(Int8))', [[1, None], [None]], pa.list_(pa.int8())
+        )
+
+    def test_tuple(self):
+        self.assertRead(
+            'Tuple(a Int8, b String)', [(1, 'x'), (2, 'y')],
+            pa.struct([('a', pa.int8()), ('b', pa.string())]),
+            expected=[{'a': 1, 'b': 'x'}, {'a': 2, 'b': 'y'}]
+        )
+        self.assertRead(
+            'Tuple(Int8, String)', [(1, 'x')],
+            pa.struct([('1', pa.int8()), ('2', pa.string())]),
+            expected=[{'1': 1, '2': 'x'}]
+        )
+
+    def test_map(self):
+        self.assertRead(
+            'Map(String, UInt64)', [{'a': 1}, {}, {'b': 2, 'c': 3}],
+            pa.map_(pa.string(), pa.uint64()),
+            expected=[[('a', 1)], [], [('b', 2), ('c', 3)]]
+        )
+
+    def test_low_cardinality(self):
+        self.assertRead(
+            'LowCardinality(Nullable(String))', ['a', None, 'b', 'a'],
+            pa.dictionary(pa.int32(), pa.string())
+        )
+
+    def test_generic(self):
+        self.assertRead(
+            'Decimal(9, 2)', [Decimal('1.50')], pa.decimal128(9, 2)
+        )
+        self.assertRead(
+            "Enum8('a' = 1, 'b' = 2)", ['b', 'a'], pa.string()
+        )
+
+    def test_socket_reader_buffers_are_copied(self):
+        # Socket reader refills its buffer in place. Arrays must stay valid
+        # after buffer is overwritten by subsequent reads.
+        columns = [
+            ('String', ['abc' * i for i in range(200)]),
+            ('Int32', list(range(1000))),
+            ('Nullable(Float64)', [None if i % 3 else i * 1.5
+                                   for i in range(500)]),
+            ('Array(String)', [['x' * j for j in range(i % 5)]
+                               for i in range(300)])
+        ]
+        data = self.write(columns)
+
+        rsock, wsock = socket.socketpair()
+        writer = Thread(target=wsock.sendall, args=(data, ))
+        writer.start()
+        try:
+            buf = BufferedSocketReader(rsock, 64)
+            rv = self.read(buf, columns)
+        finally:
+            writer.join()
+            rsock.close()
+            wsock.close()
+
+        for (spec, expected), column in zip(columns, rv):
+            self.assertEqual(column.to_pylist(), expected, spec)
+
+    def test_query_result(self):
+        from bytehouse_driver.arrow.block import ArrowColumnOrientedBlock
+        from bytehouse_driver.arrow.result import ArrowQueryResult
+        from bytehouse_driver.connection import Packet
+        from bytehouse_driver.protocol import ServerPacketTypes
+
+        columns_with_types = [('a', 'UInt8'), ('b', 'Nullable(String)')]
+
+        def packet(data):
+            rv = Packet()
+            rv.type = ServerPacketTypes.DATA
+            rv.block = ArrowColumnOrientedBlock(
+                columns_with_types=columns_with_types,
+                data=[pa.array(x) for x in data],
+                context=self.context
+            )
+            return rv
+
+        packets = [
+            packet([]),
+            packet([pa.array([1, 2], pa.uint8()), ['x', None]]),
+            packet([pa.array([3], pa.uint8()), ['y']])
+        ]
+        table = ArrowQueryResult(iter(packets)).get_result()
+
+        self.assertEqual(table.schema, pa.schema([
+            ('a', pa.uint8()), ('b', pa.string())
+        ]))
+        self.assertEqual(len(table.to_batches()), 2)
+        self.assertEqual(table.to_pydict(), {
+            'a': [1, 2, 3], 'b': ['x', None, 'y']
+        })
+
+    def test_large_offsets(self):
+        from bytehouse_driver.columns.arrow.base import read_offsets
+
+        def read(ends):
+            chunks = iter([np.array(ends, dtype='<u8').tobytes()])
+            buf = CompressedBufferedReader(lambda: next(chunks), 1024)
+            return read_offsets(buf, len(ends))
+
+        offsets = read([1, 2 ** 31 - 1])
+        self.assertEqual(offsets.dtype, np.int32)
+        self.assertEqual(offsets.tolist(), [0, 1, 2 ** 31 - 1])
+
+        offsets = read([1, 2 ** 31, 2 ** 32 + 1])
+        self.assertEqual(offsets.dtype, np.int64)
+        self.assertEqual(offsets.tolist(), [0, 1, 2 ** 31, 2 ** 32 + 1])
+
+    def test_large_string_buffers(self):
+        from bytehouse_driver.columns.arrow.service import get_arrow_column
+
+        # Reader switches to int64 offsets once data exceeds 2 GiB.
+        offsets = np.array([0, 1, 3], dtype=np.int64).tobytes()
+        buf = Mock(read_string_buffers=Mock(
+            return_value=(bytearray(offsets), bytearray(b'abc'), True)
+        ))
+        column = get_arrow_column(self.context, 'String')
+        rv = column._read_data(2, buf)
+        self.assertEqual(rv.type, pa.large_string())
+        self.assertEqual(rv.to_pylist(), ['a', 'bc'])
+
+    def test_query_result_large_types(self):
+        from bytehouse_driver.arrow.block import ArrowColumnOrientedBlock
+        from bytehouse_driver.arrow.result import ArrowQueryResult
+        from bytehouse_driver.connection import Packet
+        from bytehouse_driver.protocol import ServerPacketTypes
+
+        columns_with_types = [('a', 'Array(String)'), ('b', 'String')]
+
+        def packet(data):
+            rv = Packet()
+            rv.type = ServerPacketTypes.DATA
+            rv.block = ArrowColumnOrientedBlock(
+                columns_with_types=columns_with_types,
+                data=data, context=self.context
+            )
+            return rv
+
+        packets = [
+            packet([pa.array([['x']]), pa.array(['y'])]),
+            packet([
+                pa.array([['z', 'w']], pa.large_list(pa.string())),
+                pa.array(['v'], pa.large_string())
+            ])
+        ]
+        table = ArrowQueryResult(iter(packets)).get_result()
+
+        self.assertEqual(table.schema, pa.schema([
+            ('a', pa.large_list(pa.large_string())),
+            ('b', pa.large_string())
+        ]))
+        self.assertEqual(table.to_pydict(), {
+            'a': [['x'], ['z', 'w']], 'b': ['y', 'v']
+        })
+
+
+class ArrowWriteColumnsTestCase(BaseArrowTestCase):
+    def assertWritten(self, spec, items, expected):
+        from bytehouse_driver.columns.arrow.service import write_arrow_column
+
+        buf = BufferedMemoryWriter(defines.BUFFER_SIZE)
+        write_arrow_column(self.context, 'x', spec, items, buf)
+        chunks = iter([buf.getvalue()])
+        buf = CompressedBufferedReader(lambda: next(chunks), 1024)
+
+        # Written data is read by generic columns.
+        rv = read_column(self.context, spec, len(items), buf, use_numpy=False)
+        self.assertEqual(list(rv), expected)
+        self.assertEqual(buf.position, buf.current_buffer_size)
+
+    def test_cast(self):
+        self.assertWritten('Int8', pa.array([1, -2], pa.int64()), [1, -2])
+        with self.assertRaises(errors.TypeMismatchError):
+            self.assertWritten('UInt8', pa.array([300]), [])
+
+    def test_nullable(self):
+        self.assertWritten('Nullable(Int32)', pa.array([1, None]), [1, None])
+        self.assertWritten('Int32', pa.array([1, None]), [1, 0])
+        self.assertWritten(
+            'Nullable(String)', pa.array(['a', None]), ['a', None]
+        )
+
+    def test_string(self):
+        items = pa.array(['x', 'a', '', 'яю'])[1:]
+        self.assertWritten('String', items, ['a', '', 'яю'])
+        self.assertWritten(
+            'String', pa.array(['x', 'a'], pa.large_string())[1:], ['a']
+        )
+        self.assertWritten(
+            'FixedString(3)', pa.array(['abc', 'de']), ['abc', 'de']
+        )
+        with self.assertRaises(errors.TooLargeStringSize):
+            self.assertWritten('FixedString(1)', pa.array(['ab']), [])
+
+    def test_datetime(self):
+        self.assertWritten('Date', pa.array([date(2020, 1, 2)]),
+                           [date(2020, 1, 2)])
+
+        value = datetime(2020, 1, 2, 3, 4, 5, 123456)
+        items = pa.array([value], pa.timestamp('us', tz='UTC'))
+        rv = [value.replace(microsecond=0, tzinfo=timezone.utc)]
+        self.assertWritten("DateTime('UTC')", items, rv)
+
+    def test_array(self):
+        self.assertWritten(
+            'Array(Int32)', pa.array([[9], [1, 2], None, [3]])[1:],
+            [[1, 2], [], [3]]
+        )
+        self.assertWritten(
+            'Array(Array(Nullable(String)))', pa.array([[['a', None], []]]),
+            [[['a', None], []]]
+        )
+        self.assertWritten(
+            'Array(String)',
+            pa.array([['x'], ['a', 'b']], pa.large_list(pa.large_string())),
+            [['x'], ['a', 'b']]
+        )
+
+    def test_tuple_map(self):
+        self.assertWritten(
+            'Tuple(Int8, String)', pa.array([{'x': 1, 'y': 'a'}]),
+            [(1, 'a')]
+        )
+        items = pa.array([[('a', 1)], []], pa.map_(pa.string(), pa.int64()))
+        self.assertWritten('Map(String, UInt64)', items, [{'a': 1}, {}])
+
+    def test_low_cardinality(self):
+        self.assertWritten(
+            'LowCardinality(Nullable(String))',
+            pa.array(['a', None, 'b', 'a']).dictionary_encode(),
+            ['a', None, 'b', 'a']
+        )
+        values = [str(i % 300) for i in range(1000)]
+        self.assertWritten('LowCardinality(String)', pa.array(values), values)
+
+    def test_generic(self):
+        self.assertWritten(
+            'Nullable(Decimal(9, 2))', pa.array([Decimal('1.50'), None]),
+            [Decimal('1.50'), None]
+        )
@@ -25,11 +25,16 @@ SOFTWARE.
 """
 
 import os
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from struct import pack
+from unittest import TestCase
 from unittest.mock import patch
 
 from freezegun import freeze_time
 
+from bytehouse_driver.bufferedreader import CompressedBufferedReader
+from bytehouse_driver.columns.datecolumn import DateColumn, Date32Column
+from bytehouse_driver.columns.dates import DateCache
 from tests.testcase import BaseTestCase
 
 
@@ -86,3 +91,41 @@ class DateTestCase(BaseTestCase):
             query = 'SELECT * FROM test'
             inserted = self.client.execute(query)
             self.assertEqual(inserted, data)
+
+
+class DateConversionTestCase(TestCase):
+    def read(self, column, data, nulls_map=None):
+        chunks = iter([data])
+        buf = CompressedBufferedReader(lambda: next(chunks), 1024)
+        n_items = len(data) // column.make_struct(1).size
+        return column._read_data(n_items, buf, nulls_map=nulls_map)
+
+    def test_read(self):
+        epoch = date(1970, 1, 1)
+        days = [0, 1, 1, 18000, 65535]
+        rv = self.read(DateColumn(), pack('<5H', *days))
+        self.assertEqual(rv, tuple(epoch + timedelta(x) for x in days))
+        self.assertIs(rv[1], rv[2])
+
+        days = [-16436, -1, 0, 114635]
+        rv = self.read(Date32Column(), pack('<4i', *days), (0, 1, 0, 0))
+        self.assertEqual(rv, (date(1925, 1, 1), None, epoch,
+                              date(2283, 11, 11)))
+
+    def test_write(self):
+        items = [
+            date(1970, 1, 2), datetime(2020, 5, 5, 3), date(1969, 12, 31),
+            date(2149, 6, 6), None
+        ]
+        DateColumn().before_write_items(items, nulls_map=[0, 0, 0, 0, 1])
+        self.assertEqual(items, [1, 18387, 0, 65535, 0])
+
+        items = [date(1925, 1, 1), date(1969, 12, 31), date(1900, 1, 1)]
+        Date32Column().before_write_items(items)
+        self.assertEqual(items, [-16436, -1, 0])
+
+    def test_cache_pages(self):
+        cache = DateCache(0, 65535)
+        rv = cache.decode(pack('<2H', 3000, 3001), False, None)
+        self.assertEqual(rv, (date(1978, 3, 20), date(1978, 3, 21)))
+        self.assertEqual(cache.loaded_pages, 1)
@@ -24,12 +24,16 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from unittest import TestCase
 from unittest.mock import patch
 
-from pytz import UnknownTimeZoneError
+from pytz import UnknownTimeZoneError, timezone, utc
 import tzlocal
 
+from bytehouse_driver.columns.datetimecolumn import (
+    DateTimeColumn, DateTime64Column
+)
 from tests.testcase import BaseTestCase
 
 
@@ -107,3 +111,83 @@ class DateTimeTestCase(BaseTestCase):
             query = 'SELECT toUInt32(a) FROM test ORDER BY a'
             inserted = self.client.execute(query)
             self.assertEqual(inserted, [(0,), (1,), (1500000000,), (2 ** 32 - 1,)])
+
+
+class DateTimeConversionTestCase(TestCase):
+    timezones = ('UTC', 'Europe/Moscow', 'America/New_York', 'Etc/GMT+3')
+
+    def timestamps(self, tz):
+        rv = [0, 1530211034, 2 ** 32 - 1]
+        # Seconds around offset transitions.
+        for x in getattr(tz, '_utc_transition_times', [])[-150:-140]:
+            ts = int((x - datetime(1970, 1, 1)).total_seconds())
+            rv.extend(range(ts - 3600, ts + 3600, 599))
+        return rv
+
+    def test_read(self):
+        for name in self.timezones:
+            tz = timezone(name)
+            items = tuple(self.timestamps(tz))
+
+            column = DateTimeColumn(timezone=tz, offset_naive=False)
+            expected = [datetime.fromtimestamp(x, tz) for x in items]
+            rv = column.after_read_items(items)
+            self.assertEqual(rv, tuple(expected))
+            self.assertEqual(
+                [x.tzinfo for x in rv], [x.tzinfo for x in expected]
+            )
+
+            column = DateTimeColumn(timezone=tz)
+            self.assertEqual(
+                column.after_read_items(items),
+                tuple(x.replace(tzinfo=None) for x in expected)
+            )
+
+    def test_read_nulls_and_repeated(self):
+        column = DateTimeColumn(timezone=timezone('Europe/Moscow'))
+        rv = column.after_read_items((0, 1, 1), nulls_map=(1, 0, 0))
+        value = datetime(1970, 1, 1, 3, 0, 1)
+        self.assertEqual(rv, (None, value, value))
+        self.assertIs(rv[1], rv[2])
+
+    def test_read_datetime64(self):
+        tz = timezone('America/New_York')
+        column = DateTime64Column(scale=9, timezone=tz, offset_naive=False)
+        rv = column.after_read_items((-1, 1530211034123456789))
+        self.assertEqual(rv, (
+            # Rounded to microseconds.
+            datetime(1970, 1, 1, tzinfo=utc).astimezone(tz),
+            tz.localize(datetime(2018, 6, 28, 14, 37, 14, 123457))
+        ))
+
+        column = DateTime64Column(scale=3, timezone=tz)
+        rv = column.after_read_items((-1500, 1530211034123))
+        self.assertEqual(rv, (
+            datetime(1969, 12, 31, 18, 59, 58, 500000),
+            datetime(2018, 6, 28, 14, 37, 14, 123000)
+        ))
+
+    def test_write(self):
+        for name in self.timezones:
+            tz = timezone(name)
+            column = DateTimeColumn(timezone=tz)
+
+            start = datetime(2021, 3, 13)
+            items = [start + timedelta(minutes=17 * x) for x in range(1000)]
+            expected = [
+                int(tz.localize(x).timestamp()) for x in items
+            ]
+            column.before_write_items(items)
+            self.assertEqual(items, expected)
+
+    def test_write_datetime64(self):
+        tz = timezone('Europe/Moscow')
+        column = DateTime64Column(scale=3, timezone=tz)
+        items = [
+            datetime(2018, 6, 28, 14, 37, 14, 123456), 5,
+            utc.localize(datetime(2018, 6, 28, 14, 37, 14, 123456)), None
+        ]
+        column.before_write_items(items, nulls_map=[0, 0, 0, 1])
+        self.assertEqual(
+            items, [1530185834123, 5, 1530196634123, 0]
+        )
@@ -24,9 +24,26 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from array import array
 from datetime import date, timedelta
 from decimal import Decimal
-
+from unittest import TestCase, SkipTest
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    np = pd = None
+
+from bytehouse_driver import defines
+from bytehouse_driver.bufferedreader import CompressedBufferedReader
+from bytehouse_driver.bufferedwriter import BufferedMemoryWriter
+from bytehouse_driver.columns.lowcardinalitycolumn import DictEncodedColumn
+from bytehouse_driver.columns.lowcardinalityencoder import (
+    encode_items, get_key_int_type
+)
+from bytehouse_driver.columns.service import read_column, write_column
+from bytehouse_driver.context import Context
 from tests.testcase import BaseTestCase
 
 
@@ -146,3 +163,153 @@ class LowCardinalityTestCase(BaseTestCase):
 
             inserted = self.client.execute(query)
             self.assertEqual(inserted, data)
+
+    def test_dict_encoded(self):
+        with self.create_table('a LowCardinality(Nullable(String))'):
+            data = [('test', ), (None, ), ('low', ), ('test', )]
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            settings = {'low_cardinality_dict_encoded': True}
+
+            inserted = self.client.execute(query, settings=settings)
+            self.assertEqual(inserted, data)
+
+            inserted = self.client.execute(
+                query, columnar=True, settings=settings
+            )
+            self.assertIsInstance(inserted[0], DictEncodedColumn)
+            self.assertEqual(list(inserted[0]), [x[0] for x in data])
+
+
+class LowCardinalityEncodingTestCase(TestCase):
+    def setUp(self):
+        self.context = Context()
+        self.context.settings = {}
+        self.context.client_settings = {
+            'strings_as_bytes': False,
+            'strings_encoding': defines.STRINGS_ENCODING,
+            'use_numpy': False
+        }
+
+    def write(self, spec, items):
+        buf = BufferedMemoryWriter(defines.BUFFER_SIZE)
+        write_column(self.context, 'a', spec, items, buf)
+        buf.flush()
+        return buf.getvalue()
+
+    def test_key_int_type(self):
+        self.assertEqual(get_key_int_type(1), 0)
+        self.assertEqual(get_key_int_type(255), 0)
+        self.assertEqual(get_key_int_type(256), 1)
+        self.assertEqual(get_key_int_type(2 ** 16), 2)
+        self.assertEqual(get_key_int_type(2 ** 32), 3)
+        self.assertEqual(get_key_int_type(2 ** 62), 3)
+
+    def test_encode_items(self):
+        index, int_type, keys = encode_items(['b', 'a', 'b', 'c'], False, '')
+        self.assertEqual(index, ['b', 'a', 'c'])
+        self.assertEqual(int_type, 0)
+        self.assertEqual(bytes(keys), b'\x00\x01\x00\x02')
+
+    def test_encode_items_nullable(self):
+        items = [None] + [str(x) for x in range(300)]
+        index, int_type, keys = encode_items(items, True, '')
+        self.assertEqual(index, [''] + items[1:])
+        self.assertEqual(int_type, 1)
+        self.assertEqual(bytes(keys[:6]), b'\x00\x00\x01\x00\x02\x00')
+        self.assertEqual(bytes(keys[-2:]), b'\x2c\x01')
+
+    def test_layout(self):
+        data = self.write('LowCardinality(Nullable(String))', ['x', None, 'x'])
+        self.assertEqual(
+            data,
+            b'\x01\x00\x00\x00\x00\x00\x00\x00'  # keys version
+            b'\x00\x06\x00\x00\x00\x00\x00\x00'  # serialization type
+            b'\x02\x00\x00\x00\x00\x00\x00\x00'  # index size
+            b'\x00\x01x'  # index
+            b'\x03\x00\x00\x00\x00\x00\x00\x00'  # number of keys
+            b'\x01\x00\x01'  # keys
+        )
+
+    def test_arrays_and_categorical_match_sequences(self):
+        if pd is None:
+            raise SkipTest('pandas package is not installed')
+
+        for spec, items in [
+            ('LowCardinality(String)', ['b', 'a', 'b'] * 100),
+            ('LowCardinality(String)', [str(x) for x in range(1000)]),
+            ('LowCardinality(Nullable(String))', ['b', None, 'a', None]),
+            ('LowCardinality(UInt16)', [x % 7 for x in range(1000)])
+        ]:
+            expected = self.write(spec, items)
+            array = np.empty(len(items), dtype=object)
+            array[:] = items
+            self.assertEqual(self.write(spec, array), expected)
+
+            categories = list(dict.fromkeys(x for x in items if x is not None))
+            categorical = pd.Categorical(items, categories=categories)
+            self.assertEqual(self.write(spec, categorical), expected)
+            self.assertEqual(
+                self.write(spec, pd.Series(categorical)), expected
+            )
+
+
+class DictEncodedColumnTestCase(TestCase):
+    def setUp(self):
+        self.context = Context()
+        self.context.settings = {}
+        self.context.client_settings = {
+            'strings_as_bytes': False,
+            'strings_encoding': defines.STRINGS_ENCODING,
+            'use_numpy': False,
+            'low_cardinality_dict_encoded': True
+        }
+
+    def read(self, spec, items):
+        buf = BufferedMemoryWriter(defines.BUFFER_SIZE)
+        write_column(self.context, 'a', spec, items, buf)
+        buf.flush()
+
+        chunks = iter([buf.getvalue()])
+        reader = CompressedBufferedReader(lambda: next(chunks), 1024)
+        return read_column(self.context, spec, len(items), reader)
+
+    def test_read(self):
+        column = self.read(
+            'LowCardinality(Nullable(String))', ['a', None, 'b', 'a']
+        )
+        self.assertIsInstance(column, DictEncodedColumn)
+        self.assertEqual(column.index, (None, 'a', 'b'))
+        self.assertEqual(column.keys, array('B', [1, 0, 2, 1]))
+        self.assertEqual(column, ['a', None, 'b', 'a'])
+        self.assertEqual(column[2], 'b')
+        self.assertEqual(list(column[1:3]), [None, 'b'])
+
+    def test_wide_keys(self):
+        items = [str(x) for x in range(300)]
+        column = self.read('LowCardinality(String)', items)
+        self.assertEqual(column.keys.typecode, 'H')
+        self.assertEqual(list(column), items)
+
+    def test_nested(self):
+        data = [['a', 'b'], ['b']]
+        column = self.read('Array(LowCardinality(String))', data)
+        self.assertEqual(column, data)
+
+    def test_extend(self):
+        column = DictEncodedColumn(('x', 'y'), array('B', [0, 1]))
+        column.extend(DictEncodedColumn(('x', 'y', 'z'), array('B', [2, 0])))
+        self.assertEqual(column.index, ('x', 'y', 'z'))
+        self.assertEqual(list(column), ['x', 'y', 'z', 'x'])
+
+        column.extend(DictEncodedColumn(('q', 'y'), array('B', [1, 0])))
+        self.assertEqual(column.index, ('x', 'y', 'z', 'q'))
+        self.assertEqual(list(column), ['x', 'y', 'z', 'x', 'y', 'q'])
+
+    def test_extend_widens_keys(self):
+        column = DictEncodedColumn(('x', ), array('B', [0]))
+        index = tuple(str(x) for x in range(300))
+        column.extend(DictEncodedColumn(index, array('H', [299, 0])))
+        self.assertEqual(column.keys.typecode, 'H')
+        self.assertEqual(list(column), ['x', '299', '0'])
@@ -0,0 +1,123 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from unittest import TestCase
+
+from bytehouse_driver import errors
+from bytehouse_driver.columns.service import get_column
+from bytehouse_driver.columns.typespec import (
+    EnumItem, Field, TypeSpec, parse_type_spec
+)
+from bytehouse_driver.context import Context
+
+
+class TypeSpecTestCase(TestCase):
+    def test_simple(self):
+        self.assertEqual(
+            parse_type_spec('String'), TypeSpec('String', (), 'String')
+        )
+
+    def test_nested(self):
+        spec = 'Array(Nullable(LowCardinality(String)))'
+        node = parse_type_spec(spec)
+
+        self.assertEqual(node.name, 'Array')
+        self.assertEqual(node.spec, spec)
+        nullable = node.args[0]
+        self.assertEqual(nullable.spec, 'Nullable(LowCardinality(String))')
+        self.assertEqual(nullable.args[0].args[0].name, 'String')
+
+    def test_literals(self):
+        node = parse_type_spec("DateTime64(3, 'Europe/Moscow')")
+        self.assertEqual(node.args, (3, 'Europe/Moscow'))
+
+        node = parse_type_spec('Decimal(9, 2)')
+        self.assertEqual(node.args, (9, 2))
+
+    def test_enum(self):
+        node = parse_type_spec("Enum8('a' = 1, 'b\\'c' = -2, 'd''e' = 3)")
+        self.assertEqual(node.args, (
+            EnumItem('a', 1), EnumItem("b'c", -2), EnumItem("d'e", 3)
+        ))
+
+    def test_named_fields(self):
+        node = parse_type_spec('Tuple(a Int8, `b c` Array(String))')
+        self.assertEqual(node.args, (
+            Field('a', TypeSpec('Int8', (), 'Int8')),
+            Field('b c', parse_type_spec('Array(String)'))
+        ))
+
+    def test_malformed(self):
+        for spec in ('', 'Array(', 'Int8)', 'Tuple(Int8 Int8 Int8)'):
+            with self.assertRaises(errors.UnknownTypeError):
+                parse_type_spec(spec)
+
+
+class ColumnCacheTestCase(TestCase):
+    def make_context(self):
+        context = Context()
+        context.settings = {}
+        context.client_settings = {
+            'strings_as_bytes': False,
+            'use_numpy': False
+        }
+        return context
+
+    def test_reused(self):
+        context = self.make_context()
+        column = get_column(context, 'Array(Nullable(String))')
+
+        self.assertIs(get_column(context, 'Array(Nullable(String))'), column)
+        self.assertIsNot(
+            get_column(context, 'Array(Nullable(String))', types_check=True),
+            column
+        )
+
+    def test_invalidated_by_settings(self):
+        context = self.make_context()
+        column = get_column(context, 'String')
+
+        context.settings = {}
+        self.assertIs(get_column(context, 'String'), column)
+
+        # Per query settings that columns don't depend on.
+        context.settings = {'max_threads': 1}
+        context.client_settings = {
+            'strings_as_bytes': False,
+            'use_numpy': False,
+            'insert_block_size': 10
+        }
+        self.assertIs(get_column(context, 'String'), column)
+
+        context.settings = {'use_client_time_zone': True}
+        self.assertIsNot(get_column(context, 'String'), column)
+        column = get_column(context, 'String')
+
+        context.client_settings = {
+            'strings_as_bytes': True,
+            'use_numpy': False
+        }
+        self.assertIsNot(get_column(context, 'String'), column)
@@ -0,0 +1,73 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tests.numpy.testcase import NumpyBaseTestCase
+
+
+class ArrayTestCase(NumpyBaseTestCase):
+    def test_simple(self):
+        with self.create_table('a Array(Int32)'):
+            data = [np.array([[1, 2], [], [3]], dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertArraysListEqual(inserted[0], [[1, 2], [], [3]])
+            self.assertEqual(inserted[0][0].dtype, np.int32)
+
+    def test_nested(self):
+        with self.create_table('a Array(Array(String))'):
+            data = [[[['a', 'b'], []], [], [['c']]]]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(
+                [[list(y) for y in x] for x in inserted[0]], data[0]
+            )
+
+    def test_nullable(self):
+        with self.create_table('a Array(Nullable(Float64))'):
+            data = [[[1.5, None], [None]]]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual([list(x) for x in inserted[0]], data[0])
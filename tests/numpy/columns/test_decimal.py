@@ -0,0 +1,70 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from decimal import Decimal
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tests.numpy.testcase import NumpyBaseTestCase
+
+
+class DecimalTestCase(NumpyBaseTestCase):
+    def test_scaled_ints(self):
+        with self.create_table('a Decimal(9, 2), b Decimal(18, 4)'):
+            data = [np.array([123, -450]), np.array([1.5, 2.25])]
+            self.client.execute(
+                'INSERT INTO test (a, b) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertArraysEqual(inserted[0], np.array([123, -450]))
+            self.assertEqual(inserted[0].dtype, np.int32)
+            self.assertArraysEqual(inserted[1], np.array([15000, 22500]))
+            self.assertEqual(inserted[1].dtype, np.int64)
+
+            inserted = self.client.execute('SELECT toString(a) FROM test')
+            self.assertEqual(inserted, [('1.23', ), ('-4.5', )])
+
+    def test_large(self):
+        with self.create_table('a Decimal(38, 3), b Decimal(76, 3)'):
+            data = [
+                np.array([Decimal('12345678901234567890.123')], dtype=object),
+                np.array([-12345678901234567890123], dtype=object)
+            ]
+            self.client.execute(
+                'INSERT INTO test (a, b) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(list(inserted[0]), [12345678901234567890123])
+            self.assertEqual(list(inserted[1]), [-12345678901234567890123])
@@ -0,0 +1,81 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+from tests.numpy.testcase import NumpyBaseTestCase
+
+from bytehouse_driver import errors
+
+
+class EnumTestCase(NumpyBaseTestCase):
+    def test_simple(self):
+        columns = "a Enum8('hello' = -1, 'world' = 2)"
+        with self.create_table(columns):
+            data = [pd.Categorical(['world', 'hello', 'world'])]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertIsInstance(inserted[0], pd.Categorical)
+            self.assertEqual(list(inserted[0]), ['world', 'hello', 'world'])
+            self.assertEqual(list(inserted[0].categories), ['hello', 'world'])
+
+    def test_nullable(self):
+        columns = "a Nullable(Enum16('hello' = 1000, 'world' = 2))"
+        with self.create_table(columns):
+            data = [np.array(['hello', None, 2], dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(
+                list(inserted[0].isna()), [False, True, False]
+            )
+            self.assertEqual(inserted[0][0], 'hello')
+            self.assertEqual(inserted[0][2], 'world')
+
+    def test_unknown_element(self):
+        data = [np.array(['foo'], dtype=object)]
+        with self.create_table("a Enum8('hello' = 1)"):
+            with self.assertRaises(errors.LogicalError):
+                self.client.execute(
+                    'INSERT INTO test (a) VALUES', data, columnar=True
+                )
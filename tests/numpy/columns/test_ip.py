@@ -0,0 +1,77 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from ipaddress import IPv6Address
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tests.numpy.testcase import NumpyBaseTestCase
+
+from bytehouse_driver import errors
+
+
+class IPTestCase(NumpyBaseTestCase):
+    def test_ipv4(self):
+        with self.create_table('a IPv4'):
+            data = [np.array(['10.0.0.1', 3232235777], dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertArraysEqual(
+                inserted[0], np.array([167772161, 3232235777])
+            )
+            self.assertEqual(inserted[0].dtype, np.uint32)
+
+    def test_ipv6(self):
+        with self.create_table('a IPv6'):
+            addresses = [IPv6Address('::1'), IPv6Address('fe80::1')]
+            data = [np.array(['::1', addresses[1]], dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(inserted[0].dtype, np.dtype('V16'))
+            self.assertEqual(
+                [IPv6Address(x.tobytes()) for x in inserted[0]], addresses
+            )
+
+    def test_bad_ipv4(self):
+        data = [np.array(['a'], dtype=object)]
+        with self.create_table('a IPv4'):
+            with self.assertRaises(errors.CannotParseDomainError):
+                self.client.execute(
+                    'INSERT INTO test (a) VALUES', data, columnar=True
+                )
@@ -163,3 +163,20 @@ class LowCardinalityTestCase(NumpyBaseTestCase):
                 inserted[0].astype(str), pd.Categorical(data[0]).astype(str)
             )
             self.assertIsInstance(inserted[0], pd.Categorical)
+
+    def test_categorical(self):
+        with self.create_table('a LowCardinality(Nullable(String))'):
+            data = [
+                pd.Categorical(['test', None, 'low', 'test'],
+                               categories=['low', 'test', 'unused'])
+            ]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertArraysEqual(
+                inserted[0].astype(str), data[0].astype(str)
+            )
@@ -82,3 +82,23 @@ class NullableTestCase(NumpyBaseTestCase):
             self.assertEqual(rv, 3)
             df2 = self.client.query_dataframe('SELECT * FROM test ORDER BY a')
             self.assertTrue(expected.equals(df2))
+
+    def test_nullable_dtypes(self):
+        columns = 'a Nullable(Int32), b Nullable(Float64), c Nullable(UInt8)'
+
+        data = [
+            pd.array([3, None, 2], dtype='Int32'),
+            pd.array([1.5, None, 2.5], dtype='Float64'),
+            pd.array([1, None, 0], dtype='UInt8')
+        ]
+        self.additional_settings['settings']['numpy_nullable_dtypes'] = True
+
+        with self.create_table(columns), self.created_client() as client:
+            client.execute(
+                'INSERT INTO test (a, b, c) VALUES', data, columnar=True
+            )
+
+            inserted = client.execute('SELECT * FROM test', columnar=True)
+            for column, expected in zip(inserted, data):
+                self.assertIsInstance(column, type(expected))
+                self.assertTrue(column.equals(expected))
@@ -24,10 +24,24 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from decimal import Decimal
+from unittest import TestCase, SkipTest
+from uuid import UUID
+
 from parameterized import parameterized
 
-from bytehouse_driver import errors
-from bytehouse_driver.columns.service import get_column_by_spec
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    np = None
+
+from bytehouse_driver import defines, errors
+from bytehouse_driver.bufferedreader import CompressedBufferedReader
+from bytehouse_driver.bufferedwriter import BufferedMemoryWriter
+from bytehouse_driver.columns.service import (
+    get_column_by_spec, read_column, write_column
+)
 from bytehouse_driver.context import Context
 
 from tests.numpy.testcase import NumpyBaseTestCase
@@ -57,3 +71,154 @@ class OtherColumnsTestCase(NumpyBaseTestCase):
             self.get_column('Unicorn')
 
         self.assertIn('Unicorn', str(e.exception))
+
+
+class NumpyColumnsEncodingTestCase(TestCase):
+    def setUp(self):
+        if np is None:
+            raise SkipTest('Numpy package is not installed')
+
+        self.context = self.make_context(use_numpy=False)
+        self.numpy_context = self.make_context(use_numpy=True)
+
+    def make_context(self, **client_settings):
+        context = Context()
+        context.settings = {}
+        client_settings.update({
+            'strings_as_bytes': False,
+            'strings_encoding': defines.STRINGS_ENCODING
+        })
+        context.client_settings = client_settings
+        return context
+
+    def write(self, context, spec, items):
+        buf = BufferedMemoryWriter(defines.BUFFER_SIZE)
+        write_column(context, 'a', spec, items, buf)
+        buf.flush()
+        return buf.getvalue()
+
+    def read(self, context, spec, data, n_items):
+        chunks = iter([data])
+        reader = CompressedBufferedReader(lambda: next(chunks), 1024)
+        return read_column(context, spec, n_items, reader)
+
+    def assertSameEncoding(self, spec, items, numpy_items):
+        """
+        Checks NumPy column writes the same bytes as generic column and
+        returns what NumPy column reads back.
+        """
+        data = self.write(self.context, spec, list(items))
+        self.assertEqual(self.write(self.numpy_context, spec, numpy_items),
+                         data)
+        return self.read(self.numpy_context, spec, data, len(items))
+
+    def test_nullable(self):
+        rv = self.assertSameEncoding(
+            'Nullable(Int32)', [1, None, 3],
+            np.array([1, None, 3], dtype=object)
+        )
+        self.assertEqual(list(rv), [1, None, 3])
+
+        self.numpy_context = self.make_context(
+            use_numpy=True, numpy_nullable_dtypes=True
+        )
+        rv = self.assertSameEncoding(
+            'Nullable(Int32)', [1, None, 3],
+            pd.array([1, None, 3], dtype='Int32')
+        )
+        self.assertIsInstance(rv, pd.arrays.IntegerArray)
+        self.assertTrue(rv.equals(pd.array([1, None, 3], dtype='Int32')))
+
+        rv = self.assertSameEncoding(
+            'Nullable(Float64)', [1.5, None],
+            pd.array([1.5, None], dtype='Float64')
+        )
+        self.assertIsInstance(rv, pd.arrays.FloatingArray)
+
+    def test_array(self):
+        rv = self.assertSameEncoding(
+            'Array(Int32)', [[1, 2], [], [3]],
+            [np.array([1, 2]), np.array([], dtype=int), np.array([3])]
+        )
+        self.assertEqual([x.tolist() for x in rv], [[1, 2], [], [3]])
+        # Rows are views into a single array.
+        self.assertIs(rv[0].base, rv[2].base)
+
+        items = [[['a'], []], [], [['b', 'c']]]
+        rv = self.assertSameEncoding('Array(Array(String))', items, items)
+        self.assertEqual([[list(y) for y in x] for x in rv], items)
+
+        items = [[1, None], [None]]
+        rv = self.assertSameEncoding('Array(Nullable(Int8))', items, items)
+        self.assertEqual([list(x) for x in rv], items)
+
+    def test_map(self):
+        items = [{'a': 1, 'b': 2}, {}]
+        rv = self.assertSameEncoding('Map(String, UInt16)', items, items)
+        self.assertEqual(list(rv), items)
+
+    def test_decimal(self):
+        items = [Decimal('1.23'), Decimal('-4.5')]
+        rv = self.assertSameEncoding(
+            'Decimal(9, 2)', items, np.array([123, -450])
+        )
+        self.assertEqual(rv.dtype, np.int32)
+        self.assertEqual(rv.tolist(), [123, -450])
+
+        self.assertSameEncoding('Decimal(9, 2)', items, np.array([1.23, -4.5]))
+        self.assertSameEncoding(
+            'Decimal(18, 2)', items, np.array(items, dtype=object)
+        )
+
+        items = [Decimal('-12345678901234567890.123')]
+        rv = self.assertSameEncoding(
+            'Decimal(38, 3)', items, np.array(items, dtype=object)
+        )
+        self.assertEqual(rv.tolist(), [-12345678901234567890123])
+        self.assertSameEncoding(
+            'Decimal(76, 3)', items, np.array(rv.tolist(), dtype=object)
+        )
+
+    def test_uuid(self):
+        uuid = UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d')
+        rv = self.assertSameEncoding(
+            'UUID', [uuid, str(uuid)], np.array([uuid, str(uuid)])
+        )
+        self.assertEqual(rv.dtype, np.dtype('V16'))
+        self.assertEqual(rv[0].tobytes(), uuid.bytes)
+        self.assertSameEncoding('UUID', [uuid, uuid], rv)
+
+        with self.assertRaises(errors.CannotParseUuidError):
+            self.write(self.numpy_context, 'UUID', np.array(['a']))
+
+    def test_ip(self):
+        rv = self.assertSameEncoding(
+            'IPv4', ['10.0.0.1', 3232235777],
+            np.array(['10.0.0.1', 3232235777], dtype=object)
+        )
+        self.assertEqual(rv.dtype, np.uint32)
+        self.assertEqual(rv.tolist(), [167772161, 3232235777])
+
+        rv = self.assertSameEncoding('IPv6', ['::1'], np.array(['::1']))
+        self.assertEqual(rv.dtype, np.dtype('V16'))
+        self.assertEqual(rv[0].tobytes(), b'\x00' * 15 + b'\x01')
+
+        with self.assertRaises(errors.CannotParseDomainError):
+            self.write(self.numpy_context, 'IPv4', np.array(['a']))
+
+    def test_enum(self):
+        spec = "Enum8('b' = 2, 'a' = -1, 'c' = 5)"
+        items = ['a', 'b', 'c', 'a']
+        rv = self.assertSameEncoding(spec, items, pd.Categorical(items))
+        self.assertIsInstance(rv, pd.Categorical)
+        self.assertEqual(list(rv), items)
+        self.assertEqual(list(rv.categories), ['a', 'b', 'c'])
+
+        rv = self.assertSameEncoding(
+            'Nullable({})'.format(spec), ['a', None],
+            np.array(['a', None], dtype=object)
+        )
+        self.assertEqual(list(rv.codes), [0, -1])
+
+        with self.assertRaises(errors.LogicalError):
+            self.write(self.numpy_context, spec, np.array(['d']))
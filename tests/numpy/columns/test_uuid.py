@@ -0,0 +1,67 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from uuid import UUID
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tests.numpy.testcase import NumpyBaseTestCase
+
+from bytehouse_driver import errors
+
+
+class UUIDTestCase(NumpyBaseTestCase):
+    def test_simple(self):
+        with self.create_table('a UUID'):
+            uuids = [
+                UUID('c0fcbba9-0752-44ed-a5d6-4dfb4342b89d'),
+                UUID('2efcead4-ff55-4db5-bdb4-6b36a308d8e0')
+            ]
+            data = [np.array([uuids[0], str(uuids[1])], dtype=object)]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(inserted[0].dtype, np.dtype('V16'))
+            self.assertEqual([UUID(bytes=x.tobytes()) for x in inserted[0]],
+                             uuids)
+
+            inserted = self.client.execute('SELECT toString(a) FROM test')
+            self.assertEqual(inserted, [(str(x), ) for x in uuids])
+
+    def test_bad_uuid(self):
+        data = [np.array(['a'], dtype=object)]
+        with self.create_table('a UUID'):
+            with self.assertRaises(errors.CannotParseUuidError):
+                self.client.execute(
+                    'INSERT INTO test (a) VALUES', data, columnar=True
+                )
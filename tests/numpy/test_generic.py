@@ -117,6 +117,22 @@ class NumpyIteratorTestCase(NumpyBaseTestCase):
         )
         self.assertEqual(list(result), [])
 
+    def test_select_with_iter_blocks(self):
+        result = self.client.execute_iter_blocks(
+            'SELECT CAST(number AS UInt32) AS number '
+            'FROM system.numbers LIMIT 10',
+            settings={'max_block_size': 4}
+        )
+
+        blocks = list(result)
+        self.assertEqual([x.num_rows for x in blocks], [4, 4, 2])
+        self.assertEqual(blocks[0].columns_with_types, [('number', 'UInt32')])
+        self.assertEqual(blocks[0].get_columns()[0].dtype, np.uint32)
+        self.assertArraysEqual(
+            np.concatenate([x.get_columns()[0] for x in blocks]),
+            np.arange(10)
+        )
+
 
 class DataFrameTestCase(NumpyBaseTestCase):
     def test_query_simple(self):
@@ -0,0 +1,172 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from unittest import TestCase, SkipTest
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    np = None
+
+from bytehouse_driver.connection import Packet
+from bytehouse_driver.progress import Progress
+
+
+class ColumnBufferTestCase(TestCase):
+    def setUp(self):
+        if np is None:
+            raise SkipTest('Numpy package is not installed')
+
+        from bytehouse_driver.numpy.result import ColumnBuffer
+        self.buffer = ColumnBuffer()
+
+    def test_doubling(self):
+        for i in range(10):
+            self.buffer.append(np.arange(i * 3, i * 3 + 3))
+            self.assertGreaterEqual(len(self.buffer.array), self.buffer.size)
+
+        self.assertEqual(len(self.buffer.array), 48)
+        value = self.buffer.get_value()
+        self.assertTrue((value == np.arange(30)).all())
+        self.assertEqual(len(value), 30)
+
+    def test_expected_size_capped(self):
+        # Rows to read reported by server can be far more than returned.
+        self.buffer.append(np.arange(3), expected_size=500000000)
+        self.assertEqual(len(self.buffer.array), 6)
+        self.buffer.append(np.arange(4), expected_size=500000000)
+        self.assertEqual(len(self.buffer.array), 16)
+        self.assertEqual(list(self.buffer.get_value()),
+                         [0, 1, 2, 0, 1, 2, 3])
+
+    def test_objects_ignore_expected_size(self):
+        self.buffer.append(np.array(['a', 'b'], dtype=object), 1000)
+        self.buffer.append(np.array(['c'], dtype=object), 1000)
+        self.assertEqual(len(self.buffer.array), 4)
+        self.assertEqual(list(self.buffer.get_value()), ['a', 'b', 'c'])
+
+    def test_dtype_promotion(self):
+        self.buffer.append(np.array([1, 2], dtype='int8'))
+        self.buffer.append(np.array([300], dtype='int16'))
+        value = self.buffer.get_value()
+        self.assertEqual(value.dtype, np.int16)
+        self.assertEqual(list(value), [1, 2, 300])
+
+    def test_categorical(self):
+        self.buffer.append(pd.Categorical(['a', 'b']))
+        self.buffer.append(pd.Categorical(['b', 'c']))
+        value = self.buffer.get_value()
+        self.assertIsInstance(value, pd.Categorical)
+        self.assertEqual(list(value), ['a', 'b', 'b', 'c'])
+
+    def test_tuples(self):
+        self.buffer.append((1, None))
+        self.buffer.append((2, ))
+        self.assertEqual(self.buffer.get_value(), (1, None, 2))
+
+
+class NumpyQueryResultTestCase(TestCase):
+    class Block(object):
+        def __init__(self, columns):
+            self.columns = columns
+            self.num_rows = len(columns[0])
+
+        def get_columns(self):
+            return self.columns
+
+    def setUp(self):
+        if np is None:
+            raise SkipTest('Numpy package is not installed')
+
+    def make_packets(self):
+        progress = Packet()
+        progress.progress = Progress()
+        progress.progress.total_rows = 100
+        yield progress
+
+        for i in range(3):
+            packet = Packet()
+            packet.block = self.Block([np.arange(i * 2, i * 2 + 2)])
+            yield packet
+
+    def test_preallocated_from_progress(self):
+        from bytehouse_driver.numpy.result import NumpyQueryResult
+
+        result = NumpyQueryResult(self.make_packets(), columnar=True)
+        data = result.get_result()
+
+        self.assertEqual(result.expected_rows, 100)
+        self.assertEqual(len(data), 1)
+        self.assertTrue((data[0] == np.arange(6)).all())
+
+
+class DataFrameIterQueryResultTestCase(TestCase):
+    class Block(object):
+        columns_with_types = [('a', 'Int64'), ('b c', 'String')]
+
+        def __init__(self, start, stop):
+            self.columns = [np.arange(start, stop), ['x'] * (stop - start)]
+            self.num_rows = stop - start
+
+        def get_columns(self):
+            return self.columns
+
+    def setUp(self):
+        if np is None:
+            raise SkipTest('Numpy package is not installed')
+
+    def make_packets(self):
+        # Header block and blocks of 3, 4 and 5 rows.
+        for start, stop in [(0, 0), (0, 3), (3, 7), (7, 12)]:
+            packet = Packet()
+            packet.block = self.Block(start, stop)
+            yield packet
+
+    def iter_frames(self, chunk_size):
+        from bytehouse_driver.numpy.result import DataFrameIterQueryResult
+
+        result = DataFrameIterQueryResult(
+            self.make_packets(), chunk_size=chunk_size
+        )
+        return list(result)
+
+    def test_per_block(self):
+        frames = self.iter_frames(None)
+        self.assertEqual([len(x) for x in frames], [3, 4, 5])
+        self.assertEqual(list(frames[1].columns), ['a', 'b_c'])
+        self.assertEqual(list(frames[1].index), [3, 4, 5, 6])
+
+    def test_chunk_size(self):
+        frames = self.iter_frames(2)
+        self.assertEqual([len(x) for x in frames], [2] * 6)
+
+        frames = self.iter_frames(5)
+        self.assertEqual([len(x) for x in frames], [5, 5, 2])
+
+        df = pd.concat(frames)
+        self.assertEqual(list(df['a']), list(range(12)))
+        self.assertEqual(list(df.index), list(range(12)))
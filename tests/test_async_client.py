@@ -0,0 +1,216 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+from unittest import TestCase
+from unittest.mock import patch
+
+from bytehouse_driver import QueryCoalescer, ResultCache, errors
+from bytehouse_driver.aio import AsyncClient
+from bytehouse_driver.aio.connection import NeedMoreData, StreamSocket
+from tests.testcase import BaseTestCase
+
+
+class AsyncClientTestCase(BaseTestCase):
+    def setUp(self):
+        super(AsyncClientTestCase, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        self.async_client = AsyncClient(
+            self.host, port=self.port, database=self.database,
+            account=self.account, user=self.user, password=self.password,
+            secure=True
+        )
+
+    def tearDown(self):
+        self.async_client.disconnect()
+        self.loop.close()
+        super(AsyncClientTestCase, self).tearDown()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_execute(self):
+        rv = self.run_async(self.async_client.execute('SELECT 1'))
+        self.assertEqual(rv, [(1, )])
+
+    def test_with_column_types(self):
+        rv = self.run_async(self.async_client.execute(
+            'SELECT CAST(1 AS Int32) AS x', with_column_types=True
+        ))
+        self.assertEqual(rv, ([(1, )], [('x', 'Int32')]))
+
+    def test_execute_iter(self):
+        async def collect():
+            return [
+                row async for row in self.async_client.execute_iter(
+                    'SELECT number FROM system.numbers LIMIT 10',
+                    settings={'max_block_size': 3}
+                )
+            ]
+
+        rv = self.run_async(collect())
+        self.assertEqual(rv, [(x, ) for x in range(10)])
+
+    def test_execute_iter_blocks(self):
+        async def collect():
+            return [
+                block.get_columns()
+                async for block in self.async_client.execute_iter_blocks(
+                    'SELECT number FROM system.numbers LIMIT 10',
+                    settings={'max_block_size': 3}
+                )
+            ]
+
+        rv = self.run_async(collect())
+        self.assertEqual(
+            [list(x) for columns in rv for x in columns[0]], list(range(10))
+        )
+
+    def test_insert(self):
+        with self.create_table('a Int32, b String'):
+            data = [(x, str(x)) for x in range(100)]
+
+            inserted = self.run_async(self.async_client.execute(
+                'INSERT INTO test (a, b) VALUES', data
+            ))
+            self.assertEqual(inserted, 100)
+
+            rv = self.run_async(self.async_client.execute(
+                'SELECT * FROM test ORDER BY a'
+            ))
+            self.assertEqual(rv, data)
+
+    def test_concurrent_queries(self):
+        async def run():
+            return await asyncio.gather(*[
+                self.async_client.execute('SELECT {}'.format(x))
+                for x in range(5)
+            ])
+
+        rv = self.run_async(run())
+        self.assertEqual(rv, [[(x, )] for x in range(5)])
+
+    def test_interrupted_iteration(self):
+        async def run():
+            rows = self.async_client.execute_iter(
+                'SELECT number FROM system.numbers LIMIT 100000',
+                settings={'max_block_size': 10}
+            )
+            async for _ in rows:
+                break
+            await rows.aclose()
+
+            return await self.async_client.execute('SELECT 1')
+
+        self.assertEqual(self.run_async(run()), [(1, )])
+
+    def test_unfinished_iteration(self):
+        async def run():
+            rows = self.async_client.execute_iter(
+                'SELECT number FROM system.numbers LIMIT 100000',
+                settings={'max_block_size': 10}
+            )
+            await rows.__anext__()
+
+            # Query does not wait for the rest of result.
+            with self.assertRaises(errors.PartiallyConsumedQueryError):
+                await self.async_client.execute('SELECT 1')
+
+            # Abandoned generator is closed by event loop.
+            del rows
+            await asyncio.sleep(0)
+
+            return await self.async_client.execute('SELECT 1')
+
+        self.assertEqual(self.run_async(run()), [(1, )])
+
+    def test_execute_with_progress(self):
+        async def run():
+            progress = self.async_client.execute_with_progress(
+                'SELECT max(number) FROM numbers(100000)',
+                settings={'max_block_size': 1000}
+            )
+            totals = [x async for x in progress]
+            return totals, await progress.get_result()
+
+        totals, rv = self.run_async(run())
+        self.assertEqual(rv, [(99999, )])
+        if totals:
+            self.assertEqual(totals[-1], (100000, 100000))
+
+    def test_result_cache(self):
+        cache = ResultCache()
+        self.async_client.result_cache = cache
+        query = 'SELECT number FROM system.numbers LIMIT 3'
+
+        async def run():
+            rv = await self.async_client.execute(query)
+            rv.append('modified')
+            return await self.async_client.execute(query + ';')
+
+        self.assertEqual(self.run_async(run()), [(0, ), (1, ), (2, )])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_query_coalescer_rejected(self):
+        with self.assertRaises(ValueError):
+            AsyncClient(self.host, query_coalescer=QueryCoalescer())
+
+    def test_in_params_threshold(self):
+        query = 'SELECT count() FROM system.one WHERE dummy IN %(ids)s'
+        settings = {'external_table_params_threshold': 3}
+
+        client = self.async_client
+        with patch.object(client.connection, 'send_query',
+                          wraps=client.connection.send_query) as m:
+            rv = self.run_async(client.execute(
+                query, {'ids': [0, 1, 2]}, settings=settings
+            ))
+            self.assertEqual(rv, [(1, )])
+            self.assertIn('_param_ids', m.call_args[0][0])
+
+
+class StreamSocketTestCase(TestCase):
+    def test_recv_into(self):
+        stream = StreamSocket(None, None)
+        stream.data += b'abcdef'
+
+        buf = bytearray(4)
+        self.assertEqual(stream.recv_into(buf), 4)
+        self.assertEqual(buf, b'abcd')
+        self.assertEqual(stream.recv_into(buf), 2)
+        self.assertEqual(buf[:2], b'ef')
+
+        with self.assertRaises(NeedMoreData):
+            stream.recv_into(buf)
+
+    def test_discard(self):
+        stream = StreamSocket(None, None)
+        stream.data += b'abcdef'
+        stream.recv_into(bytearray(4))
+
+        stream.discard(3)
+        self.assertEqual(stream.data, b'def')
+        self.assertEqual(stream.position, 1)
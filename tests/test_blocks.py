@@ -24,11 +24,16 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import socket
+import threading
 import types
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
+from bytehouse_driver.connection import Packet
 from bytehouse_driver.errors import ServerException
+from bytehouse_driver.prefetch import PacketPrefetcher
+from bytehouse_driver.protocol import ServerPacketTypes
 from bytehouse_driver.util.helpers import chunks
 from tests.testcase import BaseTestCase, file_config
 from tests.util import capture_logging
@@ -231,6 +236,133 @@ class IteratorTestCase(BaseTestCase):
         self.assertFalse(self.client.connection.connected)
 
 
+class BlockIteratorTestCase(BaseTestCase):
+    def test_select(self):
+        result = self.client.execute_iter_blocks(
+            'SELECT CAST(number AS UInt32) AS number, toString(number) AS s '
+            'FROM system.numbers LIMIT 10',
+            settings={'max_block_size': 3}
+        )
+
+        blocks = list(result)
+        self.assertEqual([x.num_rows for x in blocks], [3, 3, 3, 1])
+        self.assertEqual(
+            blocks[0].columns_with_types,
+            [('number', 'UInt32'), ('s', 'String')]
+        )
+        self.assertEqual(blocks[0].get_columns(), [(0, 1, 2), ('0', '1', '2')])
+        self.assertEqual(list(result), [])
+
+        rv = self.client.execute('SELECT 1')
+        self.assertEqual(rv, [(1, )])
+
+    def test_select_empty(self):
+        result = self.client.execute_iter_blocks('SELECT 1 WHERE 0')
+        self.assertEqual(list(result), [])
+
+    def test_select_error(self):
+        with self.assertRaises(ServerException):
+            list(self.client.execute_iter_blocks('SELECT error'))
+
+        self.assertFalse(self.client.connection.connected)
+
+
+class PrefetchTestCase(BaseTestCase):
+    client_kwargs = {'settings': {'read_prefetch_depth': 2}}
+
+    def test_select(self):
+        rv = self.client.execute(
+            'SELECT number FROM system.numbers LIMIT 10000',
+            settings={'max_block_size': 100}
+        )
+        self.assertEqual(rv, list(zip(range(10000))))
+
+    def test_select_with_iter(self):
+        result = self.client.execute_iter(
+            'SELECT number FROM system.numbers LIMIT 10000',
+            settings={'max_block_size': 100}
+        )
+        self.assertEqual(list(result), list(zip(range(10000))))
+
+        rv = self.client.execute('SELECT 1')
+        self.assertEqual(rv, [(1, )])
+
+    def test_select_with_iter_interrupted(self):
+        connection = self.client.connection
+        reset_state = connection.reset_state
+        workers = []
+
+        def check_reset_state():
+            workers.extend(
+                x for x in threading.enumerate()
+                if x.name == 'bytehouse-packet-prefetch'
+            )
+            reset_state()
+
+        result = self.client.execute_iter(
+            'SELECT number FROM system.numbers LIMIT 100000',
+            settings={'max_block_size': 100}
+        )
+        with patch.object(connection, 'reset_state',
+                          side_effect=check_reset_state):
+            for i, row in enumerate(result):
+                if i == 150:
+                    break
+            result.close()
+
+        # Worker exits before connection state is reset.
+        self.assertEqual(workers, [])
+
+        # Worker is stopped and unread result is dropped with connection.
+        self.assertFalse(self.client.connection.connected)
+        rv = self.client.execute('SELECT 1')
+        self.assertEqual(rv, [(1, )])
+
+    def test_compressed_select(self):
+        with self.created_client(compression='lz4',
+                                 **self.client_kwargs) as client:
+            rv = client.execute(
+                'SELECT number, toString(number) '
+                'FROM system.numbers LIMIT 10000',
+                settings={'max_block_size': 100}
+            )
+            self.assertEqual(rv, [(i, str(i)) for i in range(10000)])
+
+    def test_select_error(self):
+        with self.assertRaises(ServerException):
+            self.client.execute('SELECT error')
+
+        self.assertFalse(self.client.connection.connected)
+
+        rv = self.client.execute('SELECT 1')
+        self.assertEqual(rv, [(1, )])
+
+
+class PacketPrefetcherTestCase(unittest.TestCase):
+    def test_abort(self):
+        sock, peer = socket.socketpair()
+        self.addCleanup(sock.close)
+        self.addCleanup(peer.close)
+
+        def receive_packet():
+            if not sock.recv(1):
+                raise EOFError('Unexpected EOF while reading bytes')
+
+            packet = Packet()
+            packet.type = ServerPacketTypes.DATA
+            return packet
+
+        connection = Mock(socket=sock, receive_packet=receive_packet)
+        peer.sendall(b'ab')
+
+        prefetcher = PacketPrefetcher(connection, 1)
+        self.assertEqual(prefetcher.get().type, ServerPacketTypes.DATA)
+
+        # Worker waits for server after the queued packet.
+        prefetcher.abort()
+        self.assertFalse(prefetcher.worker.is_alive())
+
+
 class LogTestCase(BaseTestCase):
     required_server_version = (18, 12, 13)
 
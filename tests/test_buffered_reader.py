@@ -27,7 +27,9 @@ SOFTWARE.
 import socket
 from unittest import TestCase, mock
 
-from bytehouse_driver.bufferedreader import BufferedSocketReader
+from bytehouse_driver.bufferedreader import (
+    BufferedSocketReader, CompressedBufferedReader
+)
 
 
 class BufferedReaderTestCase(TestCase):
@@ -46,3 +48,29 @@ class BufferedReaderTestCase(TestCase):
             # Trying to allocate huge amount of memory.
             with self.assertRaises(MemoryError):
                 reader.read_strings(5, encoding='utf-8')
+
+
+class ReadViewTestCase(TestCase):
+    def make_reader(self, *chunks):
+        chunks = iter(chunks)
+        return CompressedBufferedReader(lambda: next(chunks), 1024)
+
+    def test_read_within_buffer(self):
+        reader = self.make_reader(b'abcdef')
+        self.assertEqual(reader.read(2), b'ab')
+        view = reader.read_view(4)
+        self.assertIs(view.obj, reader.buffer)
+        self.assertEqual(view.tobytes(), b'cdef')
+
+    def test_read_across_buffers(self):
+        reader = self.make_reader(b'ab', b'cd', b'ef', b'gh')
+        self.assertEqual(reader.read(3), b'abc')
+        view = reader.read_view(4)
+        self.assertIsNot(view.obj, reader.buffer)
+        self.assertEqual(view.tobytes(), b'defg')
+        self.assertEqual(reader.read(1), b'h')
+
+    def test_read_empty(self):
+        reader = self.make_reader(b'ab')
+        self.assertEqual(reader.read(0), b'')
+        self.assertEqual(len(reader.read_view(0)), 0)
@@ -26,12 +26,21 @@ SOFTWARE.
 
 import unittest
 from datetime import date, datetime
+from io import BytesIO
 from unittest import TestCase
 
-from bytehouse_driver import errors
+from bytehouse_driver import defines, errors
+from bytehouse_driver.block import RowOrientedBlock
+from bytehouse_driver.bufferedreader import BufferedSocketReader
+from bytehouse_driver.bufferedwriter import BufferedMemoryWriter
 from bytehouse_driver.client import Client
 from bytehouse_driver.compression import get_compressor_cls
 from bytehouse_driver.compression.lz4 import Compressor
+from bytehouse_driver.connection import ServerInfo
+from bytehouse_driver.context import Context
+from bytehouse_driver.streams.compressed import (
+    CompressedBlockInputStream, CompressedBlockOutputStream
+)
 from .testcase import BaseTestCase, file_config
 
 
@@ -112,6 +121,82 @@ class MiscCompressionTestCase(TestCase):
         )
 
 
+class CompressedStreamTestCase(TestCase):
+    columns = [('a', 'UInt32'), ('b', 'String')]
+    rows = [(i, 'value {}'.format(i)) for i in range(10000)]
+
+    class FakeSocket(object):
+        def __init__(self, data):
+            self.data = BytesIO(data)
+
+        def recv_into(self, buf):
+            return self.data.readinto(buf)
+
+    def make_context(self):
+        context = Context()
+        context.server_info = ServerInfo(
+            'test', 21, 8, 0, defines.CLIENT_REVISION, 'UTC', 'test'
+        )
+        context.settings = {}
+        context.client_settings = {
+            'strings_as_bytes': False,
+            'strings_encoding': defines.STRINGS_ENCODING,
+            'use_numpy': False,
+            'input_format_null_as_default': False
+        }
+        return context
+
+    def write(self, alg, compress_threads):
+        fout = BufferedMemoryWriter(defines.BUFFER_SIZE)
+        stream = CompressedBlockOutputStream(
+            get_compressor_cls(alg), 4096, fout, self.make_context(),
+            compress_threads=compress_threads
+        )
+        stream.write(RowOrientedBlock(self.columns, self.rows))
+        return fout.getvalue()
+
+    def read(self, data):
+        fin = BufferedSocketReader(self.FakeSocket(data), defines.BUFFER_SIZE)
+        stream = CompressedBlockInputStream(fin, self.make_context())
+        return stream.read().get_rows()
+
+    def test_frames(self):
+        for alg in ('lz4', 'zstd'):
+            data = self.write(alg, 1)
+            self.assertEqual(self.read(data), self.rows)
+
+    def test_parallel_compression(self):
+        for alg in ('lz4', 'zstd'):
+            data = self.write(alg, 4)
+            self.assertEqual(data, self.write(alg, 1))
+            self.assertEqual(self.read(data), self.rows)
+
+    def test_frame_buffer_reused(self):
+        for alg in ('lz4', 'zstd'):
+            data = self.write(alg, 1)
+            fin = BufferedSocketReader(
+                self.FakeSocket(data * 2), defines.BUFFER_SIZE
+            )
+            stream = CompressedBlockInputStream(fin, self.make_context())
+            self.assertEqual(stream.read().get_rows(), self.rows)
+
+            frame_buffer = stream.frame_buffer
+            buffer = frame_buffer.data
+            allocations = frame_buffer.allocations
+
+            self.assertEqual(stream.read().get_rows(), self.rows)
+            # Only decompressed blocks are allocated for the same frames.
+            self.assertIs(frame_buffer.data, buffer)
+            self.assertLess(frame_buffer.allocations, 2 * allocations)
+
+    def test_checksum_mismatch(self):
+        data = bytearray(self.write('lz4', 1))
+        data[30] ^= 0xFF
+
+        with self.assertRaises(errors.ChecksumDoesntMatchError):
+            self.read(bytes(data))
+
+
 @unittest.skip("EOFError: Unexpected EOF while reading bytes")
 class ReadByBlocksTestCase(BaseCompressionTestCase):
     compression = 'lz4'
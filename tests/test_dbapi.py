@@ -24,8 +24,10 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import gc
 import types
 import unittest
+import weakref
 from collections import namedtuple
 from contextlib import contextmanager
 import socket
@@ -427,6 +429,74 @@ class InterfaceTestCase(DBAPITestCaseBase):
             self.assertEqual(str(e.exception), 'no results to fetch')
 
 
+class ClientPoolTestCase(DBAPITestCaseBase):
+    def test_cursor_does_not_connect(self):
+        with self.created_connection() as connection:
+            connection.cursor()
+            self.assertIsNone(connection._pool)
+
+    def test_client_reused_by_next_cursor(self):
+        with self.created_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                client = cursor._client
+
+            self.assertIsNone(cursor._client)
+            self.assertTrue(client.connection.connected)
+
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                self.assertIs(cursor._client, client)
+                self.assertEqual(cursor.fetchall(), [(1, )])
+
+    def test_simultaneous_cursors(self):
+        with self.created_connection() as connection:
+            first = connection.cursor()
+            second = connection.cursor()
+            first.execute('SELECT 1')
+            second.execute('SELECT 2')
+
+            self.assertIsNot(first._client, second._client)
+            self.assertEqual(first.fetchall(), [(1, )])
+            self.assertEqual(second.fetchall(), [(2, )])
+            self.assertEqual(connection._pool.size, 2)
+
+    def test_exhausted_pool(self):
+        with self.created_connection(pool_max_size=1,
+                                     pool_timeout=0.1) as connection:
+            first = connection.cursor()
+            first.execute('SELECT 1')
+
+            second = connection.cursor()
+            second.execute('SELECT 2')
+            client = second._client
+            self.assertEqual(second.fetchall(), [(2, )])
+            self.assertEqual(connection._pool.size, 1)
+
+            second.close()
+            self.assertFalse(client.connection.connected)
+
+    def test_unclosed_connection_collected(self):
+        connection = self.create_connection()
+        cursor = connection.cursor()
+        cursor.execute('SELECT 1')
+        pool = weakref.ref(connection._pool)
+
+        del connection, cursor
+        gc.collect()
+        self.assertIsNone(pool())
+
+    def test_close_connection_closes_pool(self):
+        connection = self.create_connection()
+        cursor = connection.cursor()
+        cursor.execute('SELECT 1')
+        client = cursor._client
+        connection.close()
+
+        self.assertFalse(client.connection.connected)
+        self.assertEqual(connection._pool.size, 0)
+
+
 class DictCursorFactoryTestCase(DBAPITestCaseBase):
     @unittest.skip("unittest failed")
     def test_execute_fetchone(self):
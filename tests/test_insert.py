@@ -246,3 +246,51 @@ class InsertColumnarTestCase(BaseTestCase):
                 )
 
             self.assertIn('list or tuple is expected', str(e.exception))
+
+
+class InsertPipelineTestCase(BaseTestCase):
+    client_kwargs = {
+        'settings': {'insert_pipeline_depth': 2, 'insert_block_size': 1000}
+    }
+
+    def test_insert(self):
+        with self.create_table('a Int32, b String'):
+            data = [(i, str(i)) for i in range(10500)]
+            inserted = self.client.execute(
+                'INSERT INTO test (a, b) VALUES', data
+            )
+            self.assertEqual(inserted, 10500)
+
+            rv = self.client.execute('SELECT * FROM test ORDER BY a')
+            self.assertEqual(rv, data)
+
+    def test_insert_generator(self):
+        with self.create_table('a Int32'):
+            data = ((i, ) for i in range(5000))
+            inserted = self.client.execute(
+                'INSERT INTO test (a) VALUES', data
+            )
+            self.assertEqual(inserted, 5000)
+
+            rv = self.client.execute('SELECT count() FROM test')
+            self.assertEqual(rv, [(5000, )])
+
+    def test_error_in_worker(self):
+        with self.create_table('a Int32'):
+            data = [(i, ) for i in range(3000)] + [('a', )]
+            with self.assertRaises(errors.TypeMismatchError):
+                self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            rv = self.client.execute('SELECT 1')
+            self.assertEqual(rv, [(1, )])
+
+    def test_compressed_insert(self):
+        with self.created_client(compression='lz4',
+                                 **self.client_kwargs) as client:
+            with self.create_table('a Int32'):
+                data = [(i, ) for i in range(10500)]
+                inserted = client.execute('INSERT INTO test (a) VALUES', data)
+                self.assertEqual(inserted, 10500)
+
+                rv = client.execute('SELECT sum(a) FROM test')
+                self.assertEqual(rv, [(sum(range(10500)), )])
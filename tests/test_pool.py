@@ -0,0 +1,136 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from threading import Thread
+from time import sleep
+
+from bytehouse_driver import ClientPool, errors
+from tests.testcase import BaseTestCase
+
+
+class ClientPoolTestCase(BaseTestCase):
+    def create_pool(self, **kwargs):
+        pool_kwargs = {
+            'port': self.port,
+            'database': self.database,
+            'account': self.account,
+            'user': self.user,
+            'password': self.password,
+            'secure': True
+        }
+        pool_kwargs.update(kwargs)
+        return ClientPool(self.host, **pool_kwargs)
+
+    def test_min_size(self):
+        with self.create_pool(min_size=2, max_size=3) as pool:
+            self.assertEqual(pool.size, 2)
+            self.assertEqual(pool.idle, 2)
+
+    def test_client_reused(self):
+        with self.create_pool(min_size=1, max_size=1) as pool:
+            with pool.client() as client:
+                self.assertEqual(client.execute('SELECT 1'), [(1, )])
+
+            with pool.client() as other:
+                self.assertIs(client, other)
+                self.assertEqual(other.execute('SELECT 1'), [(1, )])
+
+    def test_concurrent_clients(self):
+        rv = []
+
+        with self.create_pool(min_size=0, max_size=2) as pool:
+            def run():
+                for i in range(5):
+                    with pool.client() as client:
+                        rv.append(client.execute('SELECT {}'.format(i)))
+
+            threads = [Thread(target=run) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertLessEqual(pool.size, 2)
+
+        self.assertEqual(len(rv), 20)
+
+    def test_acquire_timeout(self):
+        with self.create_pool(min_size=1, max_size=1) as pool:
+            client = pool.acquire()
+            with self.assertRaises(errors.PoolTimeoutError):
+                pool.acquire(timeout=0.1)
+
+            pool.release(client)
+            pool.release(pool.acquire(timeout=0.1))
+
+    def test_max_idle_eviction(self):
+        with self.create_pool(min_size=1, max_size=3, max_idle=0.2,
+                              eviction_interval=0.1) as pool:
+            clients = [pool.acquire() for _ in range(3)]
+            for client in clients:
+                pool.release(client)
+            self.assertEqual(pool.size, 3)
+
+            sleep(1)
+            self.assertEqual(pool.size, 1)
+
+    def test_max_lifetime(self):
+        with self.create_pool(min_size=0, max_size=1,
+                              max_lifetime=0.1) as pool:
+            with pool.client() as client:
+                pass
+
+            sleep(0.2)
+            with pool.client() as other:
+                self.assertIsNot(client, other)
+
+    def test_reconnect_after_idle(self):
+        with self.create_pool(min_size=1, max_size=1,
+                              ping_interval=0) as pool:
+            with pool.client() as client:
+                client.connection.socket.close()
+
+            with pool.client() as client:
+                self.assertEqual(client.execute('SELECT 1'), [(1, )])
+
+    def test_partially_consumed_query(self):
+        with self.create_pool(min_size=0, max_size=1) as pool:
+            with pool.client() as client:
+                rows = client.execute_iter(
+                    'SELECT number FROM system.numbers LIMIT 100000',
+                    settings={'max_block_size': 10}
+                )
+                next(rows)
+
+            self.assertEqual(pool.size, 0)
+
+    def test_closed(self):
+        pool = self.create_pool(min_size=1)
+        pool.close()
+
+        self.assertEqual(pool.size, 0)
+        with self.assertRaises(errors.PoolClosedError):
+            pool.acquire()
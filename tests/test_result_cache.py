@@ -0,0 +1,157 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from unittest import TestCase, mock
+
+from bytehouse_driver import ResultCache
+from bytehouse_driver.resultcache import (
+    estimate_size, is_read_only_query, normalize_query
+)
+from tests.testcase import BaseTestCase
+
+
+class NormalizeQueryTestCase(TestCase):
+    def test_whitespace(self):
+        self.assertEqual(
+            normalize_query('  SELECT\n  a,\tb FROM t ;\n'),
+            'SELECT a, b FROM t'
+        )
+
+    def test_quotes_kept(self):
+        self.assertEqual(
+            normalize_query("SELECT 'a  b',  \"c  d\", `e  f`, 'g\\'  h'"),
+            "SELECT 'a  b', \"c  d\", `e  f`, 'g\\'  h'"
+        )
+
+    def test_read_only(self):
+        self.assertTrue(is_read_only_query('SELECT 1'))
+        self.assertTrue(is_read_only_query('with x AS (SELECT 1) SELECT x'))
+        self.assertTrue(is_read_only_query('(SELECT 1) UNION ALL (SELECT 2)'))
+        self.assertFalse(is_read_only_query('INSERT INTO t SELECT 1'))
+        self.assertFalse(is_read_only_query('SELECTED'))
+
+
+class ResultCacheTestCase(TestCase):
+    def test_get_set(self):
+        cache = ResultCache()
+        self.assertIsNone(cache.get('a'))
+        cache.set('a', [(1, )])
+        self.assertEqual(cache.get('a'), [(1, )])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_ttl(self):
+        cache = ResultCache(ttl=10)
+        with mock.patch('bytehouse_driver.resultcache.monotonic') as time:
+            time.return_value = 100
+            cache.set('a', [1])
+            cache.set('b', [2], ttl=20)
+
+            time.return_value = 115
+            self.assertIsNone(cache.get('a'))
+            self.assertEqual(cache.get('b'), [2])
+            self.assertEqual(len(cache), 1)
+
+    def test_lru_eviction(self):
+        size = estimate_size([1])
+        cache = ResultCache(max_bytes=2 * size)
+        cache.set('a', [1])
+        cache.set('b', [2])
+        cache.get('a')
+        cache.set('c', [3])
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), [1])
+        self.assertEqual(cache.get('c'), [3])
+        self.assertEqual(cache.size, 2 * size)
+
+    def test_too_large(self):
+        cache = ResultCache(max_bytes=10)
+        cache.set('a', [1])
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+
+    def test_invalidate(self):
+        cache = ResultCache()
+        cache.set(('SELECT * FROM a', 1), [1])
+        cache.set(('SELECT * FROM b', 1), [2])
+
+        self.assertEqual(cache.invalidate(r'FROM a\b'), 1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.invalidate(), 1)
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+    def test_estimate_size(self):
+        small = estimate_size([(1, 'a')])
+        self.assertGreater(estimate_size([(1, 'a')] * 10), 5 * small)
+
+
+class ClientResultCacheTestCase(BaseTestCase):
+    def setUp(self):
+        super(ClientResultCacheTestCase, self).setUp()
+        self.cache = ResultCache()
+        self.client.result_cache = self.cache
+
+    def test_execute(self):
+        query = 'SELECT number FROM system.numbers LIMIT 3'
+        with mock.patch.object(self.client, 'process_ordinary_query',
+                               wraps=self.client.process_ordinary_query) as m:
+            rv = self.client.execute(query)
+            rv.append('modified')
+            self.assertEqual(self.client.execute(query + ';'),
+                             [(0, ), (1, ), (2, )])
+            self.assertEqual(m.call_count, 1)
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_key_includes_params_and_settings(self):
+        query = 'SELECT %(x)s'
+        self.assertEqual(self.client.execute(query, {'x': 1}), [(1, )])
+        self.assertEqual(self.client.execute(query, {'x': 2}), [(2, )])
+        self.client.execute(query, {'x': 2}, settings={'max_threads': 1})
+        self.client.execute(query, {'x': 2}, columnar=True)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 4))
+
+    def test_execute_iter(self):
+        query = 'SELECT number FROM system.numbers LIMIT 10'
+        self.assertEqual(list(self.client.execute_iter(query)),
+                         list(zip(range(10))))
+        self.assertEqual(list(self.client.execute_iter(query, chunk_size=4)),
+                         [[(0, ), (1, ), (2, ), (3, )],
+                          [(4, ), (5, ), (6, ), (7, )],
+                          [(8, ), (9, )]])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_writes_not_cached(self):
+        with self.create_table('a Int32'):
+            self.client.execute('INSERT INTO test (a) VALUES', [(1, )])
+            self.assertEqual(self.client.execute('SELECT * FROM test'),
+                             [(1, )])
+            self.client.execute('INSERT INTO test (a) VALUES', [(2, )])
+            self.cache.invalidate('FROM test')
+            self.assertEqual(
+                self.client.execute('SELECT * FROM test ORDER BY a'),
+                [(1, ), (2, )]
+            )
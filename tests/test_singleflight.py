@@ -0,0 +1,175 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import threading
+from unittest import TestCase
+
+from bytehouse_driver import QueryCoalescer
+from tests.testcase import BaseTestCase
+
+
+class QueryCoalescerTestCase(TestCase):
+    n_waiters = 4
+
+    def run_concurrently(self, coalescer, func, waiter_func=None):
+        started = threading.Event()
+        results = []
+
+        def leader_func():
+            started.set()
+            return func()
+
+        def run(f):
+            try:
+                results.append(coalescer.run('key', f))
+            except BaseException as e:
+                results.append(e)
+
+        leader = threading.Thread(target=run, args=(leader_func, ))
+        leader.start()
+        started.wait()
+
+        waiters = [
+            threading.Thread(target=run, args=(waiter_func or self.fail, ))
+            for _ in range(self.n_waiters)
+        ]
+        for thread in waiters:
+            thread.start()
+
+        # Waiters are counted before they wait for leader.
+        while coalescer.coalesced < self.n_waiters:
+            threading.Event().wait(0.001)
+
+        return leader, waiters, results
+
+    def test_result_shared(self):
+        coalescer = QueryCoalescer()
+        release = threading.Event()
+
+        def func():
+            release.wait()
+            return [(1, )]
+
+        leader, waiters, results = self.run_concurrently(coalescer, func)
+        release.set()
+        for thread in [leader] + waiters:
+            thread.join()
+
+        self.assertEqual(len(results), self.n_waiters + 1)
+        self.assertEqual(sorted(x[1] for x in results),
+                         [False] * self.n_waiters + [True])
+        self.assertEqual([x[0] for x in results],
+                         [[(1, )]] * (self.n_waiters + 1))
+        self.assertEqual(len({id(x[0]) for x in results}), len(results))
+        self.assertEqual((coalescer.executed, coalescer.coalesced),
+                         (1, self.n_waiters))
+        self.assertEqual(len(coalescer), 0)
+
+    def test_error_propagated(self):
+        coalescer = QueryCoalescer()
+        release = threading.Event()
+        error = ValueError('query failed')
+
+        def func():
+            release.wait()
+            raise error
+
+        leader, waiters, results = self.run_concurrently(coalescer, func)
+        release.set()
+        for thread in [leader] + waiters:
+            thread.join()
+
+        self.assertEqual(results, [error] * (self.n_waiters + 1))
+        self.assertEqual(len(coalescer), 0)
+
+        # Failed call is not remembered.
+        self.assertEqual(coalescer.run('key', lambda: 1), (1, True))
+
+    def test_interrupted_leader_not_shared(self):
+        coalescer = QueryCoalescer()
+        release = threading.Event()
+        interrupt = KeyboardInterrupt()
+
+        def func():
+            release.wait()
+            raise interrupt
+
+        leader, waiters, results = self.run_concurrently(
+            coalescer, func, waiter_func=lambda: [(2, )]
+        )
+        release.set()
+        for thread in [leader] + waiters:
+            thread.join()
+
+        self.assertIn(interrupt, results)
+        results.remove(interrupt)
+        self.assertEqual([x[0] for x in results], [[(2, )]] * self.n_waiters)
+        self.assertGreaterEqual(coalescer.executed, 2)
+        self.assertEqual(len(coalescer), 0)
+
+    def test_sequential_calls_executed(self):
+        coalescer = QueryCoalescer()
+        self.assertEqual(coalescer.run('key', lambda: 1), (1, True))
+        self.assertEqual(coalescer.run('key', lambda: 2), (2, True))
+        self.assertEqual((coalescer.executed, coalescer.coalesced), (2, 0))
+
+
+class ClientQueryCoalescerTestCase(BaseTestCase):
+    def test_concurrent_queries(self):
+        coalescer = QueryCoalescer()
+        query = 'SELECT sleep(1), number FROM system.numbers LIMIT 1'
+        clients = [
+            self._create_client(query_coalescer=coalescer) for _ in range(3)
+        ]
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda c: results.append(c.execute(query)),
+                             args=(client, ))
+            for client in clients
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for client in clients:
+            client.disconnect()
+
+        self.assertEqual(results, [[(0, 0)]] * 3)
+        self.assertEqual(coalescer.executed + coalescer.coalesced, 3)
+        self.assertGreater(coalescer.coalesced, 0)
+
+    def test_writes_not_coalesced(self):
+        coalescer = QueryCoalescer()
+        self.client.query_coalescer = coalescer
+
+        with self.create_table('a Int32'):
+            self.client.execute('INSERT INTO test (a) VALUES', [(1, )])
+            self.assertEqual(self.client.execute('SELECT * FROM test'),
+                             [(1, )])
+
+        self.assertEqual(coalescer.executed, 1)
@@ -30,12 +30,14 @@ from __future__ import unicode_literals
 import unittest
 from datetime import date, datetime
 from decimal import Decimal
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from uuid import UUID
 
 from enum import IntEnum, Enum
 from pytz import timezone
 
+from bytehouse_driver.util.escape import escape_param
+from bytehouse_driver.util.params import extract_in_params, infer_values_type
 from tests.testcase import BaseTestCase
 from tests.util import patch_env_tz
 
@@ -260,3 +262,125 @@ class ParametersSubstitutionTestCase(BaseTestCase):
 
         self.assertEqual(e.exception.args[0],
                          'Parameters are expected in dict form')
+
+
+class EscapeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.ctx = Mock()
+        self.ctx.server_info.timezone = 'UTC'
+
+    def test_homogeneous_lists(self):
+        self.assertEqual(escape_param([1, 2.5, -3], self.ctx), '[1, 2.5, -3]')
+        self.assertEqual(escape_param(("a'b", 'c\n'), self.ctx),
+                         "('a\\'b', 'c\\n')")
+        self.assertEqual(escape_param([None, 'x', [1], True], self.ctx),
+                         "[NULL, 'x', [1], True]")
+        self.assertEqual(escape_param([], self.ctx), '[]')
+
+
+class InParamsExtractionTestCase(unittest.TestCase):
+    def test_values_type(self):
+        self.assertEqual(infer_values_type([0, 255]), 'UInt8')
+        self.assertEqual(infer_values_type([0, 2 ** 32]), 'UInt64')
+        self.assertEqual(infer_values_type([-129, 1]), 'Int16')
+        self.assertEqual(infer_values_type([1, 2.5]), 'Float64')
+        self.assertIsNone(infer_values_type([2 ** 53 + 1, 2.5]))
+        self.assertEqual(infer_values_type(['a']), 'String')
+        self.assertIsNone(infer_values_type([-1, 2 ** 63]))
+        self.assertIsNone(infer_values_type([1, 'a']))
+        self.assertIsNone(infer_values_type([None]))
+
+    def test_extract(self):
+        query, params, tables = extract_in_params(
+            'SELECT 1 WHERE a IN %(a)s AND b not in%(b)s AND c = %(c)s',
+            {'a': (1, 2, 3), 'b': ['x', 'y', 'z'], 'c': [1, 2, 3]}, 3
+        )
+
+        self.assertEqual(
+            query,
+            'SELECT 1 WHERE a IN (SELECT value FROM _param_a) '
+            'AND b not IN (SELECT value FROM _param_b) AND c = %(c)s'
+        )
+        self.assertEqual(params, {'c': [1, 2, 3]})
+        self.assertEqual(tables, [
+            {
+                'name': '_param_a',
+                'structure': [('value', 'UInt8')],
+                'data': [(1, ), (2, ), (3, )]
+            },
+            {
+                'name': '_param_b',
+                'structure': [('value', 'String')],
+                'data': [('x', ), ('y', ), ('z', )]
+            }
+        ])
+
+    def test_kept(self):
+        query = 'SELECT 1 WHERE a IN %(a)s OR has(%(a)s, b) OR c IN %(c)s'
+        params = {'a': [1, 2], 'c': [1]}
+
+        rv_query, rv_params, tables = extract_in_params(query, params, 2)
+        self.assertEqual(
+            rv_query,
+            'SELECT 1 WHERE a IN (SELECT value FROM _param_a) '
+            'OR has(%(a)s, b) OR c IN %(c)s'
+        )
+        self.assertEqual(rv_params, params)
+        self.assertEqual(len(tables), 1)
+
+
+class InParamsExternalTablesTestCase(BaseTestCase):
+    client_kwargs = {'settings': {'external_table_params_threshold': 100}}
+
+    def test_in_list(self):
+        query = (
+            'SELECT number FROM system.numbers '
+            'WHERE number IN %(ids)s LIMIT 3'
+        )
+        params = {'ids': list(range(10, 1000, 10))}
+
+        rv = self.client.execute(query, params)
+        self.assertEqual(rv, [(10, ), (20, ), (30, )])
+
+        query = query.replace('IN', 'NOT IN')
+        rv = self.client.execute(query, params)
+        self.assertEqual(rv, [(0, ), (1, ), (2, )])
+
+    def test_strings(self):
+        params = {'s': [str(x) for x in range(200)]}
+        rv = self.client.execute(
+            'SELECT toString(number) AS x FROM system.numbers '
+            'WHERE x IN %(s)s LIMIT 200', params
+        )
+        self.assertEqual(rv, [(x, ) for x in params['s']])
+
+    def test_per_query_threshold(self):
+        query = 'SELECT count() FROM system.one WHERE dummy IN %(ids)s'
+        params = {'ids': [0, 1, 2]}
+        settings = {'external_table_params_threshold': 3}
+
+        connection = self.client.connection
+        with patch.object(connection, 'send_query',
+                          wraps=connection.send_query) as m:
+            rv = self.client.execute(query, params, settings=settings)
+            self.assertEqual(rv, [(1, )])
+            self.assertIn('_param_ids', m.call_args[0][0])
+
+            rv = self.client.execute(query, params)
+            self.assertEqual(rv, [(1, )])
+            self.assertNotIn('_param_ids', m.call_args[0][0])
+
+    def test_execute_iter(self):
+        query = 'SELECT count() FROM system.one WHERE dummy IN %(ids)s'
+        params = {'ids': list(range(100))}
+
+        connection = self.client.connection
+        with patch.object(connection, 'send_query',
+                          wraps=connection.send_query) as m:
+            self.assertEqual(list(self.client.execute_iter(query, params)),
+                             [(1, )])
+            self.assertIn('_param_ids', m.call_args[0][0])
+
+            progress = self.client.execute_with_progress(query, params)
+            self.assertEqual(progress.get_result(), [(1, )])
+            self.assertIn('_param_ids', m.call_args[0][0])
@@ -0,0 +1,90 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from collections import OrderedDict, defaultdict
+from unittest import TestCase
+
+from bytehouse_driver.block import RowOrientedBlock
+from bytehouse_driver.transpose import dicts_to_columns, rows_to_columns
+
+
+class TransposeTestCase(TestCase):
+    def test_rows_to_columns(self):
+        rows = [(1, 'a'), [2, 'b'], range(3, 5)]
+        self.assertEqual(
+            rows_to_columns(rows, 2), [[1, 2, 3], ['a', 'b', 4]]
+        )
+        self.assertEqual(rows_to_columns([], 2), [[], []])
+
+    def test_rows_different_length(self):
+        with self.assertRaises(ValueError) as e:
+            rows_to_columns([(1, 2), (3, )], 2)
+
+        self.assertEqual(str(e.exception), 'Different rows length')
+
+    def test_dicts_to_columns(self):
+        rows = [
+            {'a': 1, 'b': 2},
+            OrderedDict([('b', 4), ('a', 3)]),
+            defaultdict(int, a=5)
+        ]
+        self.assertEqual(
+            dicts_to_columns(rows, ['a', 'b']), [[1, 3, 5], [2, 4, 0]]
+        )
+
+    def test_dicts_missing_key(self):
+        with self.assertRaises(KeyError):
+            dicts_to_columns([{'a': 1, 'b': 2}, {'a': 3}], ['a', 'b'])
+
+
+class RowOrientedBlockTestCase(TestCase):
+    columns_with_types = [
+        ('a', 'Int32'), ('n', 'Nested(x Int8, y String)')
+    ]
+
+    def test_columns_from_tuples(self):
+        block = RowOrientedBlock(
+            self.columns_with_types, [(1, [(2, 'b')]), (3, [])]
+        )
+        self.assertEqual(block.get_column_by_index(0), [1, 3])
+        self.assertEqual(block.get_column_by_index(1), [[(2, 'b')], []])
+
+    def test_columns_from_dicts(self):
+        data = [{'a': 1, 'n': [{'x': 2, 'y': 'b'}]}, {'a': 3, 'n': []}]
+        block = RowOrientedBlock(self.columns_with_types, data)
+
+        self.assertEqual(block.get_rows(), [[1, [[2, 'b']]], [3, []]])
+        self.assertEqual(block.get_column_by_index(1), [[[2, 'b']], []])
+        # Source rows are left intact.
+        self.assertEqual(data[0]['n'], [{'x': 2, 'y': 'b'}])
+
+    def test_column_is_handed_out_once(self):
+        block = RowOrientedBlock(self.columns_with_types, [(1, [])])
+
+        # Writers replace items in place.
+        column = block.get_column_by_index(0)
+        column[0] = None
+        self.assertEqual(block.get_column_by_index(0), [1])
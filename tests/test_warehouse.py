@@ -0,0 +1,99 @@
+"""
+This is the MIT license: http://www.opensource.org/licenses/mit-license.php
+
+Copyright (c) 2017 by Konstantin Lebedev.
+
+Copyright 2022- 2023 Bytedance Ltd. and/or its affiliates
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from itertools import islice
+from time import sleep
+from unittest import TestCase
+
+from bytehouse_driver.warehouse import (
+    WarehouseCache, is_warehouse_up, resume_delays
+)
+from tests.testcase import BaseTestCase
+
+
+class WarehouseCacheTestCase(TestCase):
+    def test_get_set(self):
+        cache = WarehouseCache(60)
+        key = ('host', 19000, 'user', None)
+
+        self.assertIsNone(cache.get(key))
+        cache.set(key, 'vw')
+        self.assertEqual(cache.get(key), 'vw')
+        self.assertIsNone(cache.get(('host', 19000, 'other', None)))
+
+        cache.clear()
+        self.assertIsNone(cache.get(key))
+
+    def test_expiration(self):
+        cache = WarehouseCache(0.05)
+        key = ('host', 19000, 'user', 'vw')
+        cache.set(key, 'vw')
+
+        sleep(0.1)
+        self.assertIsNone(cache.get(key))
+
+
+class ResumeDelaysTestCase(TestCase):
+    def test_exponential(self):
+        delays = resume_delays(timeout=60, initial=0.5, maximum=4)
+        self.assertEqual(list(islice(delays, 5)), [0.5, 1, 2, 4, 4])
+
+    def test_timeout(self):
+        delays = []
+        for delay in resume_delays(timeout=0.2, initial=0.05, maximum=1):
+            delays.append(delay)
+            sleep(delay)
+
+        self.assertLessEqual(len(delays), 3)
+        self.assertAlmostEqual(sum(delays), 0.2, delta=0.05)
+
+
+class IsWarehouseUpTestCase(TestCase):
+    def test_status(self):
+        rows = [
+            ('1', 'a', '', '', '', '', 'suspended'),
+            ('2', 'b', '', '', '', '', 'up')
+        ]
+        self.assertFalse(is_warehouse_up(rows, 'a'))
+        self.assertTrue(is_warehouse_up(rows, 'b'))
+        self.assertFalse(is_warehouse_up(rows, 'c'))
+
+
+class LazyWarehouseTestCase(BaseTestCase):
+    def test_client_construction_does_not_connect(self):
+        client = self._create_client()
+        self.assertFalse(client.connection.connected)
+        self.assertEqual(client.execute('SELECT 1'), [(1, )])
+        self.assertIsNotNone(client.connection.warehouse)
+        client.disconnect()
+
+    def test_warehouse_reapplied_after_reconnect(self):
+        self.client.execute('SELECT 1')
+        self.client.disconnect()
+        self.assertIsNone(self.client.connection.warehouse)
+
+        self.assertEqual(self.client.execute('SELECT 1'), [(1, )])
+        self.assertIsNotNone(self.client.connection.warehouse)
@@ -43,7 +43,7 @@ else:
     tests_require.append('lz4')
 
 if USE_NUMPY:
-    tests_require.extend(['numpy', 'pandas'])
+    tests_require.extend(['numpy', 'pandas', 'pyarrow'])
 
 try:
     from pip import main as pipmain